@@ -5,64 +5,26 @@ Integrated with database booking system and payment processing
 Enhanced with AI Memory, Psychology Analysis, and Real-time Validation
 """
 
+import time
+_RERUN_STARTED = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import json
 import sys
-import os
 from pathlib import Path
 
-# Always define AI_ENHANCED first, before any imports that might fail
-AI_ENHANCED = False
+# Pages and their heavy dependencies (pandas, Plotly, Supabase, the booking, payment and
+# itinerary stacks) are imported by src/ui/page_registry.py only when a page is opened
 
-# Add current directory to path for imports
+# Add current directory and src to path for imports
 current_dir = Path(__file__).parent
 sys.path.append(str(current_dir))
+src_path = current_dir / "src"
+if str(src_path) not in sys.path:
+    sys.path.append(str(src_path))
 
-# Import our enhanced booking system
-try:
-    from src.booking_system.booking_manager import BookingManager
-    BOOKING_SYSTEM_AVAILABLE = True
-except ImportError:
-    # Fallback - create dummy classes for now
-    class BookingManager:
-        pass
-    class BookingType:
-        HOTEL = "hotel"
-        RESTAURANT = "restaurant"
-        PACKAGE = "package"
-    class BookingStatus:
-        PENDING = "pending"
-        CONFIRMED = "confirmed"
-        CANCELLED = "cancelled"
-    BOOKING_SYSTEM_AVAILABLE = False
-
-# Import Supabase for direct database access
-import os
 from dotenv import load_dotenv
-from supabase import create_client, Client
-
-# Import Enhanced AI Components
-try:
-    # Add the src directory to Python path
-    src_path = current_dir / "src"
-    if src_path not in sys.path:
-        sys.path.append(str(src_path))
-    
-    # Import enhanced features
-    from ai_agents.enhanced_itinerary_generator import EnhancedItineraryGenerator
-    from booking_system.enhanced_payment_processor import EnhancedPaymentProcessor
-    ENHANCED_FEATURES_AVAILABLE = True
-    print("✅ Enhanced itinerary and payment features loaded")
-    AI_ENHANCED = True
-except ImportError as e:
-    ENHANCED_FEATURES_AVAILABLE = False
-    AI_ENHANCED = False
-    print(f"⚠️ Enhanced features not available: {e}")
-    # Fallback implementations will be used
+from src.ui.page_registry import get_page_registry
+from src.ui.app_pages.common import get_all_destinations, ai_features_available
 
 # Load environment
 load_dotenv()
@@ -705,12 +667,7 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
-if 'booking_system' not in st.session_state:
-    if BOOKING_SYSTEM_AVAILABLE:
-        st.session_state.booking_system = BookingManager()
-    else:
-        st.session_state.booking_system = None
+# Initialize session state (the booking system is created on first use by the booking pages)
 if 'user_profile' not in st.session_state:
     st.session_state.user_profile = {
         'name': 'Alex Thompson',
@@ -734,5331 +691,90 @@ if 'booking_history' not in st.session_state:
 if 'selected_hotels' not in st.session_state:
     st.session_state.selected_hotels = []
 
-# Initialize Supabase client for direct database access
-@st.cache_resource
-def get_supabase_client():
-    """Get Supabase client"""
-    try:
-        load_dotenv()
-        
-        # Try multiple possible environment variable names
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("SUPABASE_KEY")
-        
-        if not supabase_url or not supabase_key:
-            st.warning("⚠️ Database credentials not found. Using fallback data.")
-            return None
-            
-        return create_client(supabase_url, supabase_key)
-    except Exception as e:
-        st.warning(f"⚠️ Database connection unavailable: {str(e)}")
-        return None
-
-# Database helper functions
-def get_all_destinations():
-    """Get all destinations from database"""
-    try:
-        supabase = get_supabase_client()
-        if supabase:
-            # Query the destinations table for names
-            result = supabase.table("destinations").select("name").execute()
-            if result.data:
-                destinations = [dest['name'] for dest in result.data if dest.get('name')]
-                return sorted(list(set(destinations)))  # Remove duplicates and sort
-    except Exception as e:
-        st.info(f"📡 Using offline data (Database: {str(e)})")
-    
-    # Fallback to enhanced hardcoded list if database fails
-    return [
-        "Beirut, Lebanon", "Dubai, UAE", "Paris, France", "London, UK", 
-        "New York, USA", "Tokyo, Japan", "Istanbul, Turkey", "Rome, Italy",
-        "Barcelona, Spain", "Amsterdam, Netherlands", "Bangkok, Thailand",
-        "Sydney, Australia", "Cairo, Egypt", "Mumbai, India", "Berlin, Germany"
-    ]
-
-def get_all_cities():
-    """Get all cities from database for restaurant booking"""
-    try:
-        supabase = get_supabase_client()
-        if supabase:
-            # Query for city column specifically
-            result = supabase.table("destinations").select("city").execute()
-            if result.data:
-                cities = [dest['city'] for dest in result.data if dest.get('city')]
-                return sorted(list(set(cities)))  # Remove duplicates and sort
-    except Exception as e:
-        # If city column query fails, try to extract from name
-        try:
-            supabase = get_supabase_client()
-            if supabase:
-                result = supabase.table("destinations").select("name").execute()
-                if result.data:
-                    cities = []
-                    for dest in result.data:
-                        if dest.get('name'):
-                            # Extract city from full name (e.g., "Paris, France" -> "Paris")
-                            city = dest['name'].split(',')[0].strip()
-                            cities.append(city)
-                    return sorted(list(set(cities)))
-        except Exception as e2:
-            st.info(f"📡 Using offline data (Database: {str(e)})")
-    
-    # Fallback to enhanced hardcoded list if database fails
-    return [
-        "Beirut", "Dubai", "Paris", "London", "New York", "Tokyo", 
-        "Istanbul", "Rome", "Barcelona", "Amsterdam", "Bangkok",
-        "Sydney", "Cairo", "Mumbai", "Berlin"
-    ]
-
-# AI-Powered Package Generation System
-def generate_personalized_package(user_prompt, profile, destination, duration, travelers, budget, variation_style=None):
-    """Generate a comprehensive, destination-specific travel package based on user's dream trip description"""
-    
-    # Extract destination details for context
-    destination_info = get_destination_intelligence(destination)
-    budget_level = extract_budget_level(budget)
-    
-    # Create package style based on user prompt analysis
-    package_style = analyze_user_prompt_for_style(user_prompt, profile)
-    
-    # Generate truly diverse package components
-    import uuid
-    package = {
-        'id': f"pkg_{uuid.uuid4().hex[:8]}",
-        'title': f"{destination} {package_style['title']}",
-        'destination': destination,
-        'duration': duration,
-        'travelers': travelers,
-        'budget_level': budget_level,
-        'focus': package_style['focus'],
-        'user_prompt_analysis': analyze_trip_desires(user_prompt),
-        'created_at': datetime.now(),
-        
-        # Generate destination-specific components with style variation
-        'flights': generate_destination_specific_flights(destination, travelers, budget_level),
-        'hotels': generate_destination_specific_hotels(destination, duration, travelers, budget_level, profile, user_prompt, variation_style),
-        'restaurants': generate_destination_specific_restaurants(destination, profile, user_prompt, budget_level, variation_style),
-        'activities': generate_destination_specific_activities(destination, profile, user_prompt, budget_level, variation_style),
-        'local_experiences': generate_destination_specific_local_experiences(destination, profile, user_prompt, variation_style),
-        
-        # Generate truly unique daily itinerary based on variation style
-        'daily_itinerary': generate_intelligent_daily_itinerary(destination, duration, profile, user_prompt, package_style, variation_style),
-        
-        # Accurate pricing
-        'pricing': calculate_destination_specific_pricing(destination, duration, travelers, budget_level, package_style)
-    }
-    
-    return package
-
-def get_destination_intelligence(destination):
-    """Enhanced destination intelligence with universal support"""
-    
-    # Try to get specific intelligence first
-    specific_intel = get_specific_destination_intelligence(destination)
-    if specific_intel:
-        return specific_intel
-    
-    # Generate universal destination intelligence
-    return generate_universal_destination_intelligence(destination)
-
-def generate_universal_destination_intelligence(destination):
-    """Generate realistic destination intelligence for any location"""
-    
-    return {
-        'name': destination,
-        'country': f'{destination} Country',
-        'region': f'{destination} Region', 
-        'climate': 'Temperate with seasonal variations',
-        'best_time_to_visit': 'Spring and Fall for pleasant weather',
-        'currency': 'Local Currency',
-        'language': f'{destination} Local Language',
-        'time_zone': f'{destination} Time Zone',
-        'main_attractions': [
-            f'{destination} Historic Center',
-            f'{destination} Main Cathedral/Temple',
-            f'{destination} Central Market',
-            f'{destination} Art Museum',
-            f'{destination} Scenic Viewpoint'
-        ],
-        'cultural_highlights': [
-            f'Traditional {destination} architecture',
-            f'Local {destination} festivals',
-            f'{destination} culinary traditions',
-            f'Traditional {destination} crafts',
-            f'{destination} music and dance'
-        ],
-        'transportation': [
-            'Public transportation available',
-            'Taxi services',
-            'Walking-friendly city center',
-            'Bicycle rentals'
-        ],
-        'safety_tips': [
-            'Generally safe destination',
-            'Keep valuables secure',
-            'Be aware of local customs',
-            'Emergency services available'
-        ]
-    }
-
-def get_specific_destination_intelligence(destination):
-    """Get comprehensive destination intelligence"""
-    destination_data = {
-        'China': {
-            'cities': ['Beijing', 'Shanghai', 'Xi\'an', 'Guilin', 'Chengdu', 'Hong Kong'],
-            'culture': 'Ancient Chinese civilization with modern development',
-            'cuisine': 'Diverse regional cuisines - Peking duck, dim sum, Sichuan hotpot',
-            'landmarks': ['Great Wall', 'Forbidden City', 'Terracotta Army', 'Li River'],
-            'transportation': ['High-speed rail', 'Metro systems', 'Taxi', 'DiDi rideshare'],
-            'currency': 'Chinese Yuan (CNY)',
-            'language': 'Mandarin Chinese',
-            'experiences': ['Calligraphy classes', 'Tea ceremonies', 'Martial arts', 'Traditional markets'],
-            'shopping': ['Silk Street Market', 'Wangfujing', 'Traditional crafts', 'Tea shops'],
-            'nightlife': ['Traditional opera', 'Modern bars', 'Night markets', 'KTV'],
-            'budget_ranges': {
-                'ultra_budget': 35, 'budget': 65, 'moderate': 120, 
-                'premium': 250, 'luxury': 450, 'ultra_luxury': 800
-            },
-            'typical_activities': ['Temple visits', 'Garden walks', 'Cultural shows', 'Food tours'],
-            'airports': ['Beijing Capital (PEK)', 'Shanghai Pudong (PVG)'],
-            'climate': 'Varies by region - temperate to subtropical'
-        },
-        'Paris, France': {
-            'cities': ['Paris', 'Versailles', 'Fontainebleau'],
-            'culture': 'French art, fashion, and culinary excellence',
-            'cuisine': 'French cuisine - croissants, wine, cheese, fine dining',
-            'landmarks': ['Eiffel Tower', 'Louvre', 'Notre-Dame', 'Arc de Triomphe'],
-            'transportation': ['Metro', 'Bus', 'Taxi', 'Walking'],
-            'currency': 'Euro (EUR)',
-            'language': 'French',
-            'experiences': ['Wine tasting', 'Cooking classes', 'Art workshops', 'Fashion tours'],
-            'shopping': ['Champs-Élysées', 'Le Marais', 'Galleries Lafayette', 'Vintage boutiques'],
-            'nightlife': ['Wine bars', 'Cabarets', 'Jazz clubs', 'Seine river cruises'],
-            'budget_ranges': {
-                'ultra_budget': 55, 'budget': 95, 'moderate': 180, 
-                'premium': 350, 'luxury': 650, 'ultra_luxury': 1200
-            },
-            'typical_activities': ['Museum visits', 'Café culture', 'Market exploration', 'Architecture tours'],
-            'airports': ['Charles de Gaulle (CDG)', 'Orly (ORY)'],
-            'climate': 'Temperate oceanic climate'
-        },
-        'Tokyo, Japan': {
-            'cities': ['Tokyo', 'Kyoto', 'Osaka', 'Nikko'],
-            'culture': 'Traditional Japanese culture meets modern innovation',
-            'cuisine': 'Japanese cuisine - sushi, ramen, tempura, kaiseki',
-            'landmarks': ['Tokyo Tower', 'Senso-ji Temple', 'Imperial Palace', 'Mount Fuji'],
-            'transportation': ['JR trains', 'Subway', 'Taxi', 'Shinkansen'],
-            'currency': 'Japanese Yen (JPY)',
-            'language': 'Japanese',
-            'experiences': ['Tea ceremony', 'Sushi making', 'Onsen baths', 'Traditional crafts'],
-            'shopping': ['Shibuya', 'Harajuku', 'Traditional markets', 'Department stores'],
-            'nightlife': ['Izakaya', 'Karaoke', 'Night markets', 'Robot restaurants'],
-            'budget_ranges': {
-                'ultra_budget': 45, 'budget': 85, 'moderate': 160, 
-                'premium': 320, 'luxury': 580, 'ultra_luxury': 1000
-            },
-            'typical_activities': ['Temple visits', 'Garden meditation', 'Tech experiences', 'Food tours'],
-            'airports': ['Narita (NRT)', 'Haneda (HND)'],
-            'climate': 'Humid subtropical climate'
-        }
-    }
-    
-    # Find best match for destination
-    for key, data in destination_data.items():
-        if key.lower() in destination.lower() or any(city.lower() in destination.lower() for city in data['cities']):
-            return data
-    
-    # Default fallback
-    return destination_data.get(destination, {
-        'cities': [destination],
-        'culture': f'{destination} local culture',
-        'cuisine': f'{destination} local cuisine',
-        'landmarks': [f'{destination} landmarks'],
-        'transportation': ['Local transport'],
-        'currency': 'Local currency',
-        'language': 'Local language',
-        'experiences': ['Local experiences'],
-        'shopping': ['Local shopping'],
-        'nightlife': ['Local nightlife'],
-        'budget_ranges': {
-            'ultra_budget': 40, 'budget': 75, 'moderate': 150, 
-            'premium': 280, 'luxury': 500, 'ultra_luxury': 900
-        },
-        'typical_activities': ['Sightseeing', 'Cultural activities'],
-        'airports': [f'{destination} Airport'],
-        'climate': 'Local climate'
-    })
-
-def extract_budget_level(budget_string):
-    """Extract budget level from enhanced budget string with 6-tier system"""
-    budget_lower = budget_string.lower()
-    
-    if 'ultra budget' in budget_lower or '$300-600' in budget_string:
-        return 'ultra_budget'
-    elif 'budget' in budget_lower and '$600-1000' in budget_string:
-        return 'budget'
-    elif 'moderate' in budget_lower or '$1000-2500' in budget_string:
-        return 'moderate'
-    elif 'premium' in budget_lower or '$2500-4000' in budget_string:
-        return 'premium'
-    elif 'ultra luxury' in budget_lower or '$7000+' in budget_string:
-        return 'ultra_luxury'
-    elif 'luxury' in budget_lower or '$4000-7000' in budget_string:
-        return 'luxury'
-    
-    # Fallback to moderate if no match
-    return 'moderate'
-
-def analyze_trip_desires(user_prompt):
-    """Analyze user's trip description for key desires and interests"""
-    prompt_lower = user_prompt.lower()
-    
-    desires = {
-        'cultural_interest': any(word in prompt_lower for word in ['culture', 'history', 'traditional', 'heritage', 'museums', 'art']),
-        'food_focus': any(word in prompt_lower for word in ['food', 'cuisine', 'cooking', 'restaurants', 'street food', 'culinary']),
-        'adventure_seeking': any(word in prompt_lower for word in ['adventure', 'hiking', 'sports', 'active', 'outdoor', 'exciting']),
-        'photography_interest': any(word in prompt_lower for word in ['photography', 'photos', 'instagram', 'scenic', 'capture']),
-        'relaxation_focus': any(word in prompt_lower for word in ['relax', 'peaceful', 'calm', 'spa', 'tranquil', 'unwind']),
-        'local_immersion': any(word in prompt_lower for word in ['local', 'authentic', 'hidden', 'off the beaten', 'real']),
-        'luxury_preference': any(word in prompt_lower for word in ['luxury', 'premium', 'high-end', 'exclusive', 'VIP']),
-        'budget_conscious': any(word in prompt_lower for word in ['budget', 'affordable', 'cheap', 'save money', 'economical'])
-    }
-    
-    return desires
-
-def analyze_user_prompt_for_style(user_prompt, profile):
-    """Analyze user's dream trip description to determine package style"""
-    prompt_lower = user_prompt.lower()
-    
-    # Analyze keywords in user prompt
-    style_indicators = {
-        'cultural-immersive': ['culture', 'history', 'traditional', 'heritage', 'museums', 'art', 'local customs'],
-        'culinary-focused': ['food', 'cuisine', 'cooking', 'restaurants', 'street food', 'markets', 'dining'],
-        'adventure-active': ['adventure', 'hiking', 'sports', 'active', 'outdoor', 'trekking', 'climbing'],
-        'luxury-premium': ['luxury', 'premium', 'high-end', 'exclusive', 'private', 'spa', 'boutique'],
-        'budget-conscious': ['budget', 'affordable', 'cheap', 'economical', 'save money', 'cost-effective'],
-        'photography-focused': ['photography', 'photos', 'instagram', 'scenic', 'landscapes', 'portraits'],
-        'family-friendly': ['family', 'kids', 'children', 'safe', 'child-friendly', 'educational'],
-        'romantic-couples': ['romantic', 'couples', 'honeymoon', 'intimate', 'private', 'sunset']
-    }
-    
-    # Score each style
-    style_scores = {}
-    for style, keywords in style_indicators.items():
-        score = sum(1 for keyword in keywords if keyword in prompt_lower)
-        if score > 0:
-            style_scores[style] = score
-    
-    # Determine primary style
-    if style_scores:
-        primary_style = max(style_scores, key=style_scores.get)
-    else:
-        primary_style = 'cultural-immersive'  # Default
-    
-    # Generate style configuration
-    style_configs = {
-        'cultural-immersive': {
-            'title': 'Cultural Heritage Explorer',
-            'focus': 'Deep cultural immersion with historical sites and local traditions'
-        },
-        'culinary-focused': {
-            'title': 'Culinary Discovery Journey',
-            'focus': 'Authentic local cuisine and cooking experiences'
-        },
-        'adventure-active': {
-            'title': 'Adventure & Active Explorer',
-            'focus': 'Outdoor adventures and active experiences'
-        },
-        'luxury-premium': {
-            'title': 'Premium Luxury Experience',
-            'focus': 'High-end accommodations and exclusive experiences'
-        },
-        'budget-conscious': {
-            'title': 'Smart Budget Explorer',
-            'focus': 'Maximum value with authentic local experiences'
-        },
-        'photography-focused': {
-            'title': 'Photography Expedition',
-            'focus': 'Stunning photography opportunities and scenic locations'
-        },
-        'family-friendly': {
-            'title': 'Family Adventure',
-            'focus': 'Safe, educational, and fun experiences for all ages'
-        },
-        'romantic-couples': {
-            'title': 'Romantic Getaway',
-            'focus': 'Intimate and romantic experiences for couples'
-        }
-    }
-    
-    return style_configs.get(primary_style, style_configs['cultural-immersive'])
-
-def get_style_config_by_type(style_type):
-    """Get style configuration by specific style type"""
-    style_configs = {
-        'cultural-immersive': {
-            'title': 'Cultural Heritage Explorer',
-            'focus': 'Deep cultural immersion with historical sites and local traditions'
-        },
-        'culinary-focused': {
-            'title': 'Culinary Discovery Journey',
-            'focus': 'Authentic local cuisine and cooking experiences'
-        },
-        'adventure-active': {
-            'title': 'Adventure & Active Explorer',
-            'focus': 'Outdoor adventures and active experiences'
-        },
-        'luxury-premium': {
-            'title': 'Premium Luxury Experience',
-            'focus': 'High-end accommodations and exclusive experiences'
-        },
-        'budget-conscious': {
-            'title': 'Smart Budget Explorer',
-            'focus': 'Maximum value with authentic local experiences'
-        },
-        'photography-focused': {
-            'title': 'Photography Expedition',
-            'focus': 'Stunning photography opportunities and scenic locations'
-        },
-        'family-friendly': {
-            'title': 'Family Adventure Package',
-            'focus': 'Safe, educational and fun experiences for the whole family'
-        },
-        'romantic-couples': {
-            'title': 'Romantic Getaway',
-            'focus': 'Intimate and romantic experiences for couples'
-        }
-    }
-    
-    return style_configs.get(style_type, style_configs['cultural-immersive'])
-
-def generate_destination_specific_flights(destination, travelers, budget_level):
-    """Generate accurate, destination-specific flight options"""
-    
-    destination_info = get_destination_intelligence(destination)
-    
-    # Realistic airline partnerships by destination
-    airline_data = {
-        'China': {
-            'budget': [
-                {'airline': 'China Eastern Airlines', 'price_per_person': 450, 'duration': '14h 30m', 'stops': 1},
-                {'airline': 'China Southern Airlines', 'price_per_person': 480, 'duration': '15h 45m', 'stops': 1}
-            ],
-            'moderate': [
-                {'airline': 'Air China', 'price_per_person': 750, 'duration': '13h 20m', 'stops': 1},
-                {'airline': 'Turkish Airlines', 'price_per_person': 820, 'duration': '12h 10m', 'stops': 1}
-            ],
-            'luxury': [
-                {'airline': 'Cathay Pacific (Business)', 'price_per_person': 2200, 'duration': '11h 45m', 'stops': 0},
-                {'airline': 'Singapore Airlines (First)', 'price_per_person': 4500, 'duration': '12h 30m', 'stops': 0}
-            ]
-        },
-        'Paris, France': {
-            'budget': [
-                {'airline': 'Vueling Airlines', 'price_per_person': 220, 'duration': '8h 15m', 'stops': 1},
-                {'airline': 'Ryanair', 'price_per_person': 180, 'duration': '9h 30m', 'stops': 1}
-            ],
-            'moderate': [
-                {'airline': 'Air France', 'price_per_person': 650, 'duration': '7h 20m', 'stops': 0},
-                {'airline': 'Lufthansa', 'price_per_person': 580, 'duration': '8h 45m', 'stops': 1}
-            ],
-            'luxury': [
-                {'airline': 'Air France (Business)', 'price_per_person': 1800, 'duration': '7h 20m', 'stops': 0},
-                {'airline': 'British Airways (First)', 'price_per_person': 3200, 'duration': '7h 45m', 'stops': 0}
-            ]
-        },
-        'Tokyo, Japan': {
-            'budget': [
-                {'airline': 'Jetstar Japan', 'price_per_person': 380, 'duration': '11h 30m', 'stops': 1},
-                {'airline': 'Peach Aviation', 'price_per_person': 420, 'duration': '12h 15m', 'stops': 1}
-            ],
-            'moderate': [
-                {'airline': 'JAL', 'price_per_person': 850, 'duration': '10h 30m', 'stops': 0},
-                {'airline': 'ANA', 'price_per_person': 780, 'duration': '11h 45m', 'stops': 1}
-            ],
-            'luxury': [
-                {'airline': 'JAL (Business)', 'price_per_person': 2500, 'duration': '10h 30m', 'stops': 0},
-                {'airline': 'ANA (First)', 'price_per_person': 4200, 'duration': '10h 45m', 'stops': 0}
-            ]
-        }
-    }
-    
-    # Find matching destination flights
-    for dest_key, flight_data in airline_data.items():
-        if dest_key.lower() in destination.lower():
-            flights = flight_data.get(budget_level, flight_data['moderate'])
-            break
-    else:
-        # Default flights
-        flights = [
-            {'airline': 'International Airlines', 'price_per_person': 600, 'duration': '10h 00m', 'stops': 1},
-            {'airline': 'Global Airways', 'price_per_person': 550, 'duration': '11h 30m', 'stops': 1}
-        ]
-    
-    # Add departure/arrival details and calculate totals
-    for flight in flights:
-        flight.update({
-            'departure': f'New York JFK → {destination_info["airports"][0] if destination_info["airports"] else "International Airport"}',
-            'arrival': f'{destination_info["airports"][0] if destination_info["airports"] else "International Airport"} → New York JFK',
-            'total_price': flight['price_per_person'] * travelers,
-            'class': 'Economy' if budget_level == 'budget' else 'Premium Economy' if budget_level == 'moderate' else 'Business/First'
-        })
-    
-    return flights
-
-def generate_destination_specific_hotels(destination, duration, travelers, budget_level, profile, user_prompt, variation_style=None):
-    """Generate accurate, destination-specific hotel recommendations based on package style"""
-    
-    destination_info = get_destination_intelligence(destination)
-    
-    # Destination-specific hotels
-    hotel_data = {
-        'China': {
-            'budget': [
-                {
-                    'name': 'Beijing Traditional Courtyard Inn',
-                    'type': 'Boutique Traditional Hotel',
-                    'rating': 4.2,
-                    'price': 45,
-                    'location_score': 8.5,
-                    'amenities': ['Free WiFi', 'Traditional Courtyard', 'Chinese Breakfast', 'Tour Desk'],
-                    'why_recommended': 'Authentic hutong experience with traditional Chinese architecture and cultural immersion'
-                },
-                {
-                    'name': 'Shanghai Budget Capsule Hotel',
-                    'type': 'Modern Capsule Hotel',
-                    'rating': 4.0,
-                    'price': 35,
-                    'location_score': 9.0,
-                    'amenities': ['Capsule Pods', 'Shared Lounge', 'Metro Access', 'Modern Design'],
-                    'why_recommended': 'Perfect for budget travelers wanting modern convenience in central Shanghai'
-                }
-            ],
-            'moderate': [
-                {
-                    'name': 'Grand Mercure Beijing Central',
-                    'type': '4-Star Business Hotel',
-                    'rating': 4.5,
-                    'price': 120,
-                    'location_score': 9.2,
-                    'amenities': ['Fitness Center', 'Business Center', 'Chinese Restaurant', 'Concierge'],
-                    'why_recommended': 'Excellent location near Forbidden City with professional service and cultural activities'
-                },
-                {
-                    'name': 'Shanghai French Concession Boutique',
-                    'type': 'Historic Boutique Hotel',
-                    'rating': 4.6,
-                    'price': 140,
-                    'location_score': 8.8,
-                    'amenities': ['Historic Building', 'Art Deco Design', 'Rooftop Bar', 'Cultural Tours'],
-                    'why_recommended': 'Historic charm in French Concession with easy access to cultural sites'
-                }
-            ],
-            'luxury': [
-                {
-                    'name': 'The Peninsula Beijing',
-                    'type': '5-Star Luxury Hotel',
-                    'rating': 4.9,
-                    'price': 300,
-                    'location_score': 9.8,
-                    'amenities': ['Rolls-Royce Fleet', 'Michelin Restaurant', 'Spa', 'Butler Service'],
-                    'why_recommended': 'Ultimate luxury with traditional Chinese hospitality and world-class service'
-                },
-                {
-                    'name': 'Shangri-La Shanghai',
-                    'type': '5-Star Luxury Resort',
-                    'rating': 4.8,
-                    'price': 280,
-                    'location_score': 9.5,
-                    'amenities': ['Multiple Restaurants', 'Luxury Spa', 'River Views', 'VIP Services'],
-                    'why_recommended': 'Stunning views of Shanghai skyline with authentic Chinese luxury experience'
-                }
-            ]
-        },
-        'Paris, France': {
-            'budget': [
-                {
-                    'name': 'Hotel des Jeunes Paris',
-                    'type': 'Budget Boutique Hotel',
-                    'rating': 4.1,
-                    'price': 65,
-                    'location_score': 8.2,
-                    'amenities': ['Free WiFi', 'Continental Breakfast', 'Metro Access', 'Tourist Information'],
-                    'why_recommended': 'Charming budget option in Marais district with authentic Parisian atmosphere'
-                }
-            ],
-            'moderate': [
-                {
-                    'name': 'Hotel Malte Opera Paris',
-                    'type': '4-Star Historic Hotel',
-                    'rating': 4.4,
-                    'price': 180,
-                    'location_score': 9.0,
-                    'amenities': ['Historic Building', 'French Restaurant', 'Near Opera', 'Concierge'],
-                    'why_recommended': 'Perfect location near major attractions with classic Parisian elegance'
-                }
-            ],
-            'luxury': [
-                {
-                    'name': 'Hotel Ritz Paris',
-                    'type': '5-Star Palace Hotel',
-                    'rating': 4.9,
-                    'price': 450,
-                    'location_score': 10.0,
-                    'amenities': ['Michelin Restaurants', 'Luxury Spa', 'Personal Shoppers', 'Palace Service'],
-                    'why_recommended': 'Legendary Parisian luxury in the heart of the city with impeccable service'
-                }
-            ]
-        }
-    }
-    
-    # Find destination-specific hotels
-    for dest_key, hotels_by_budget in hotel_data.items():
-        if dest_key.lower() in destination.lower():
-            hotels = hotels_by_budget.get(budget_level, hotels_by_budget['moderate'])
-            break
-    else:
-        # Default hotels
-        hotels = [
-            {
-                'name': f'{destination} Central Hotel',
-                'type': 'City Hotel',
-                'rating': 4.0,
-                'price': 100,
-                'location_score': 8.0,
-                'amenities': ['WiFi', 'Restaurant', 'Fitness', 'Concierge'],
-                'why_recommended': f'Well-located hotel in {destination} with good amenities'
-            }
-        ]
-    
-    # Store original hotels for fallback
-    original_hotels = hotels.copy()
-    
-    # Filter hotels based on variation style
-    if variation_style:
-        filtered_hotels = []
-        
-        if variation_style == 'luxury-premium':
-            # Prefer luxury hotels
-            filtered_hotels = [h for h in hotels if h.get('rating', 0) >= 4.5 or 'luxury' in h.get('type', '').lower()]
-        elif variation_style == 'budget-conscious':
-            # Prefer budget options
-            filtered_hotels = [h for h in hotels if h.get('price', 999) <= 80]
-        elif variation_style == 'cultural-immersive':
-            # Prefer traditional/cultural hotels
-            filtered_hotels = [h for h in hotels if any(word in h.get('type', '').lower() for word in ['traditional', 'heritage', 'boutique', 'cultural'])]
-        elif variation_style == 'photography-focused':
-            # Prefer hotels with scenic locations
-            filtered_hotels = [h for h in hotels if h.get('location_score', 0) >= 8.0]
-        
-        # Use filtered hotels if available, otherwise use original hotels
-        if filtered_hotels:
-            hotels = filtered_hotels
-        else:
-            # No hotels matched the filter - apply different selection strategy based on style
-            if variation_style == 'luxury-premium':
-                hotels = sorted(original_hotels, key=lambda x: x.get('price', 0), reverse=True)[:3]
-            elif variation_style == 'budget-conscious':
-                hotels = sorted(original_hotels, key=lambda x: x.get('price', 999))[:3]
-            elif variation_style == 'cultural-immersive':
-                hotels = [h for h in original_hotels if any(word in h.get('type', '').lower() for word in ['heritage', 'historic', 'boutique'])] or original_hotels[:3]
-            elif variation_style == 'photography-focused':
-                hotels = [h for h in original_hotels if h.get('location_score', 0) >= 7.0] or original_hotels[:3]
-            else:
-                hotels = original_hotels[:3]  # Default fallback
-    
-    # Calculate totals for each hotel
-    for hotel in hotels:
-        hotel['total_price'] = hotel['price'] * duration
-    
-    return hotels[:3]  # Limit to top 3 hotels
-
-def generate_destination_specific_restaurants(destination, profile, user_prompt, budget_level, variation_style=None):
-    """Generate authentic, destination-specific restaurant recommendations based on package style"""
-    
-    destination_info = get_destination_intelligence(destination)
-    dietary_restrictions = profile.get('dietary_restrictions', [])
-    
-    # Destination-specific restaurants
-    restaurant_data = {
-        'China': [
-            {
-                'name': 'Quanjude Roast Duck Restaurant',
-                'cuisine': 'Traditional Beijing',
-                'rating': 4.7,
-                'price_range': '¥¥¥',
-                'specialty': 'Authentic Peking Duck',
-                'why_recommended': 'Historic restaurant serving Beijing\'s most famous dish since 1864',
-                'reservation_time': 'Dinner reservation recommended',
-                'booking_notes': 'Traditional ceremony included with duck service'
-            },
-            {
-                'name': 'Ding Tai Fung (Shanghai)',
-                'cuisine': 'Shanghainese Dim Sum',
-                'rating': 4.6,
-                'price_range': '¥¥',
-                'specialty': 'Xiao Long Bao (Soup Dumplings)',
-                'why_recommended': 'World-renowned for perfectly crafted soup dumplings and dim sum',
-                'reservation_time': 'Lunch or early dinner',
-                'booking_notes': 'Watch chefs hand-craft dumplings through glass windows'
-            },
-            {
-                'name': 'Spicy Joint Sichuan Hotpot',
-                'cuisine': 'Sichuan Hotpot',
-                'rating': 4.5,
-                'price_range': '¥¥',
-                'specialty': 'Authentic Mala Hotpot',
-                'why_recommended': 'Experience the fiery flavors of authentic Sichuan cuisine',
-                'reservation_time': 'Evening dinner experience',
-                'booking_notes': 'Vegetarian broth available; spice level customizable'
-            },
-            {
-                'name': 'Temple Restaurant Beijing',
-                'cuisine': 'Imperial Chinese',
-                'rating': 4.8,
-                'price_range': '¥¥¥¥',
-                'specialty': 'Royal Court Cuisine',
-                'why_recommended': 'Experience dishes once served to Chinese emperors in Ming Dynasty setting',
-                'reservation_time': 'Special dinner experience',
-                'booking_notes': 'Multi-course tasting menu with cultural storytelling'
-            }
-        ],
-        'Spain': [
-            {
-                'name': 'Casa Botín',
-                'cuisine': 'Traditional Spanish',
-                'rating': 4.8,
-                'price_range': '€€€€',
-                'specialty': 'Cochinillo Asado (Roast Suckling Pig)',
-                'why_recommended': 'World\'s oldest restaurant (1725) serving traditional Castilian cuisine',
-                'reservation_time': 'Dinner reservation essential',
-                'booking_notes': 'Historic atmosphere, traditional wood-fired oven cooking'
-            },
-            {
-                'name': 'Mercado de San Miguel',
-                'cuisine': 'Spanish Tapas Market',
-                'rating': 4.3,
-                'price_range': '€€',
-                'specialty': 'Gourmet Tapas & Spanish Wines',
-                'why_recommended': 'Historic glass market hall with diverse Spanish culinary offerings',
-                'reservation_time': 'No reservation needed',
-                'booking_notes': 'Perfect for sampling multiple Spanish delicacies'
-            },
-            {
-                'name': 'DiverXO',
-                'cuisine': 'Innovative Spanish-Asian Fusion',
-                'rating': 4.9,
-                'price_range': '€€€€€',
-                'specialty': 'Creative Tasting Menu',
-                'why_recommended': '3 Michelin stars, avant-garde culinary artistry by David Muñoz',
-                'reservation_time': 'Advance booking required (months ahead)',
-                'booking_notes': 'Unique dining experience, artistic presentation'
-            },
-            {
-                'name': 'Taberna El Sur',
-                'cuisine': 'Andalusian Tapas',
-                'rating': 4.4,
-                'price_range': '€',
-                'specialty': 'Authentic Tapas & Sherry',
-                'why_recommended': 'Authentic neighborhood tapas bar with local atmosphere',
-                'reservation_time': 'Walk-in friendly',
-                'booking_notes': 'Cash only, stand at bar for authentic experience'
-            },
-            {
-                'name': 'Sobrino de Botín',
-                'cuisine': 'Traditional Madrileño',
-                'rating': 4.6,
-                'price_range': '€€€',
-                'specialty': 'Cordero Asado (Roast Lamb)',
-                'why_recommended': 'Traditional Madrid cuisine in historic setting',
-                'reservation_time': 'Recommended for dinner',
-                'booking_notes': 'Famous for traditional roasted meats'
-            },
-            {
-                'name': 'Paco Roncero Restaurante',
-                'cuisine': 'Modern Spanish Gastronomy',
-                'rating': 4.7,
-                'price_range': '€€€€',
-                'specialty': 'Molecular Gastronomy',
-                'why_recommended': '2 Michelin stars, innovative Spanish cuisine techniques',
-                'reservation_time': 'Advance reservation required',
-                'booking_notes': 'Tasting menu experience, creative presentation'
-            }
-        ],
-        'Paris, France': [
-            {
-                'name': 'L\'Ami Jean',
-                'cuisine': 'Traditional French Bistro',
-                'rating': 4.6,
-                'price_range': '€€€',
-                'specialty': 'Classic French Dishes',
-                'why_recommended': 'Authentic Parisian bistro with passionate chef and local atmosphere',
-                'reservation_time': 'Dinner reservation essential',
-                'booking_notes': 'Small intimate setting, book weeks in advance'
-            },
-            {
-                'name': 'Breizh Café',
-                'cuisine': 'Modern French Crêperie',
-                'rating': 4.4,
-                'price_range': '€€',
-                'specialty': 'Gourmet Crêpes',
-                'why_recommended': 'Innovative take on traditional Breton crêpes with Japanese influences',
-                'reservation_time': 'Lunch or casual dinner',
-                'booking_notes': 'Fusion of French and Japanese culinary techniques'
-            }
-        ]
-    }
-    
-    # Filter by destination with better matching
-    destination_restaurants = []
-    dest_lower = destination.lower()
-    
-    for dest_key, restaurants in restaurant_data.items():
-        key_lower = dest_key.lower()
-        if (key_lower in dest_lower or dest_lower in key_lower or 
-            (key_lower == 'spain' and any(city in dest_lower for city in ['madrid', 'barcelona', 'seville', 'granada', 'valencia'])) or
-            (dest_lower == 'spain' and key_lower in ['madrid', 'barcelona'])):
-            destination_restaurants = restaurants.copy()
-            break
-    
-    if not destination_restaurants:
-        destination_restaurants = generate_universal_restaurants(destination)
-    
-    # Filter by dietary restrictions
-    if 'vegetarian' in dietary_restrictions:
-        for restaurant in destination_restaurants:
-            restaurant['booking_notes'] += ' - Vegetarian options available'
-    
-    # Apply style-specific filtering and selection
-    if variation_style:
-        original_restaurants = destination_restaurants.copy()
-        
-        if variation_style == 'culinary-focused':
-            # Prefer high-rated culinary experiences and unique cuisines
-            filtered = [r for r in destination_restaurants if r.get('rating', 0) >= 4.5 or 'gourmet' in r.get('specialty', '').lower() or 'culinary' in r.get('name', '').lower()]
-            if filtered:
-                destination_restaurants = sorted(filtered, key=lambda x: x.get('rating', 0), reverse=True)
-            else:
-                destination_restaurants = sorted(destination_restaurants, key=lambda x: x.get('rating', 0), reverse=True)
-                
-        elif variation_style == 'luxury-premium':
-            # Prefer upscale restaurants with premium pricing
-            filtered = [r for r in destination_restaurants if ('€€€€' in r.get('price_range', '') or '€€€' in r.get('price_range', '')) and r.get('rating', 0) >= 4.5]
-            if filtered:
-                destination_restaurants = filtered
-            else:
-                # Fallback to highest rated
-                destination_restaurants = sorted(destination_restaurants, key=lambda x: x.get('rating', 0), reverse=True)
-                
-        elif variation_style == 'budget-conscious':
-            # Prefer budget-friendly options
-            filtered = [r for r in destination_restaurants if '€' in r.get('price_range', '') and '€€' not in r.get('price_range', '') or r.get('price', 0) <= 50]
-            if filtered:
-                destination_restaurants = filtered
-            else:
-                # Fallback to lowest priced
-                destination_restaurants = sorted(destination_restaurants, key=lambda x: len(x.get('price_range', '€€€')))
-                
-        elif variation_style == 'cultural-immersive':
-            # Prefer traditional/authentic restaurants
-            filtered = [r for r in destination_restaurants if any(word in r.get('cuisine', '').lower() + ' ' + r.get('specialty', '').lower() for word in ['traditional', 'authentic', 'local', 'heritage', 'historic'])]
-            if filtered:
-                destination_restaurants = filtered
-            else:
-                destination_restaurants = original_restaurants
-                
-        elif variation_style == 'adventure-active':
-            # Prefer casual, accessible restaurants for active travelers
-            filtered = [r for r in destination_restaurants if 'casual' in r.get('booking_notes', '').lower() or 'walk-in' in r.get('reservation_time', '').lower() or '€€' in r.get('price_range', '')]
-            if filtered:
-                destination_restaurants = filtered
-            else:
-                destination_restaurants = original_restaurants
-                
-        elif variation_style == 'photography-focused':
-            # Prefer restaurants with unique atmosphere or views
-            filtered = [r for r in destination_restaurants if any(word in r.get('why_recommended', '').lower() + ' ' + r.get('booking_notes', '').lower() for word in ['atmosphere', 'view', 'historic', 'unique', 'artistic'])]
-            if filtered:
-                destination_restaurants = filtered
-            else:
-                destination_restaurants = original_restaurants
-        
-        # Ensure we have at least 3 restaurants - add back originals if needed
-        if len(destination_restaurants) < 3:
-            remaining = [r for r in original_restaurants if r not in destination_restaurants]
-            needed = 3 - len(destination_restaurants)
-            destination_restaurants.extend(remaining[:needed])
-            
-        # Final fallback - generate unique restaurants if still not enough
-        while len(destination_restaurants) < 3:
-            style_prefix = {
-                'culinary-focused': 'Gourmet',
-                'luxury-premium': 'Luxury',
-                'cultural-immersive': 'Traditional',
-                'adventure-active': 'Casual',
-                'photography-focused': 'Scenic',
-                'budget-conscious': 'Local'
-            }.get(variation_style, 'Local')
-            
-            destination_restaurants.append({
-                'name': f'{style_prefix} {destination} Restaurant {len(destination_restaurants) + 1}',
-                'cuisine': f'{destination} {style_prefix}',
-                'rating': 4.0 + (len(destination_restaurants) * 0.1),
-                'price_range': '€€€€' if variation_style == 'luxury-premium' else '€' if variation_style == 'budget-conscious' else '€€',
-                'specialty': f'{style_prefix} {destination} specialties',
-                'why_recommended': f'{style_prefix} dining experience tailored for {variation_style.replace("-", " ")} travelers',
-                'reservation_time': 'Advance booking recommended' if variation_style == 'luxury-premium' else 'Flexible',
-                'booking_notes': f'Perfect for {variation_style.replace("-", " ")} experience'
-            })
-    
-    return destination_restaurants[:4]  # Return top 4 restaurants
-
-def generate_universal_restaurants(destination):
-    """Generate diverse, realistic restaurants for any destination"""
-    
-    # Common restaurant types that exist globally
-    restaurant_types = [
-        {
-            'name': f'{destination} Heritage Restaurant',
-            'cuisine': f'Traditional {destination}',
-            'rating': 4.6,
-            'price_range': '€€€',
-            'specialty': f'Authentic {destination} classics',
-            'why_recommended': f'Family-owned restaurant serving traditional {destination} recipes for generations',
-            'reservation_time': 'Dinner reservation recommended',
-            'booking_notes': 'Historic recipes, local ingredients, cultural atmosphere'
-        },
-        {
-            'name': f'Modern {destination} Bistro',
-            'cuisine': f'Contemporary {destination}',
-            'rating': 4.4,
-            'price_range': '€€',
-            'specialty': f'Modern interpretations of {destination} cuisine',
-            'why_recommended': f'Innovative chefs putting creative spin on {destination} culinary traditions',
-            'reservation_time': 'Lunch or dinner',
-            'booking_notes': 'Farm-to-table ingredients, artistic presentation'
-        },
-        {
-            'name': f'{destination} Street Food Market',
-            'cuisine': f'{destination} Street Food',
-            'rating': 4.3,
-            'price_range': '€',
-            'specialty': f'Local street food specialties',
-            'why_recommended': f'Authentic {destination} street food experience with local vendors',
-            'reservation_time': 'Walk-in friendly',
-            'booking_notes': 'Cash preferred, try multiple vendors for variety'
-        },
-        {
-            'name': f'The {destination} Gourmet',
-            'cuisine': f'Fine Dining {destination}',
-            'rating': 4.8,
-            'price_range': '€€€€',
-            'specialty': f'Luxury {destination} tasting menu',
-            'why_recommended': f'Award-winning restaurant showcasing {destination} finest culinary artistry',
-            'reservation_time': 'Advanced booking required',
-            'booking_notes': 'Tasting menu experience, wine pairings available'
-        },
-        {
-            'name': f'{destination} Local Tavern',
-            'cuisine': f'Traditional {destination}',
-            'rating': 4.2,
-            'price_range': '€€',
-            'specialty': f'Hearty {destination} comfort food',
-            'why_recommended': f'Neighborhood favorite serving generous portions of {destination} comfort classics',
-            'reservation_time': 'Walk-in welcome',
-            'booking_notes': 'Local atmosphere, generous portions, family-friendly'
-        },
-        {
-            'name': f'Fusion {destination} Kitchen',
-            'cuisine': f'International-{destination} Fusion',
-            'rating': 4.5,
-            'price_range': '€€€',
-            'specialty': f'{destination}-international fusion dishes',
-            'why_recommended': f'Creative fusion of {destination} flavors with international techniques',
-            'reservation_time': 'Dinner recommended',
-            'booking_notes': 'Creative menu, dietary restrictions accommodated'
-        }
-    ]
-    
-    return restaurant_types
-
-def generate_universal_hotels(destination):
-    """Generate diverse, realistic hotels for any destination"""
-    
-    hotel_types = [
-        {
-            'name': f'{destination} Grand Hotel',
-            'type': 'Luxury Heritage Hotel',
-            'rating': 4.7,
-            'price': 320,
-            'location': f'Historic {destination} Center',
-            'amenities': ['Luxury spa', 'Fine dining', 'Concierge', 'Historic architecture'],
-            'why_recommended': f'Iconic {destination} hotel with rich history and elegant accommodations',
-            'booking_notes': 'Historic landmark, premium location, luxury service'
-        },
-        {
-            'name': f'{destination} Boutique Retreat',
-            'type': 'Boutique Hotel',
-            'rating': 4.5,
-            'price': 180,
-            'location': f'{destination} Arts District',
-            'amenities': ['Local art', 'Artisan restaurant', 'Unique design', 'Cultural experiences'],
-            'why_recommended': f'Stylish boutique hotel showcasing {destination} local culture and design',
-            'booking_notes': 'Unique character, local artists, cultural immersion'
-        },
-        {
-            'name': f'{destination} City Lodge',
-            'type': 'Modern Business Hotel',
-            'rating': 4.2,
-            'price': 120,
-            'location': f'Central {destination}',
-            'amenities': ['Business center', 'Fitness center', 'WiFi', 'Conference rooms'],
-            'why_recommended': f'Comfortable modern accommodations with excellent {destination} city access',
-            'booking_notes': 'Business-friendly, central location, reliable amenities'
-        },
-        {
-            'name': f'{destination} Budget Inn',
-            'type': 'Economy Hotel',
-            'rating': 4.0,
-            'price': 65,
-            'location': f'{destination} Transport Hub',
-            'amenities': ['Free breakfast', 'WiFi', 'Luggage storage', '24-hour reception'],
-            'why_recommended': f'Clean, affordable accommodation with good {destination} transport connections',
-            'booking_notes': 'Great value, convenient location, basic amenities'
-        },
-        {
-            'name': f'{destination} Heritage Manor',
-            'type': 'Historic Hotel',
-            'rating': 4.6,
-            'price': 250,
-            'location': f'Historic {destination} Quarter',
-            'amenities': ['Historic gardens', 'Traditional restaurant', 'Antique furnishings', 'Cultural tours'],
-            'why_recommended': f'Stay in beautifully preserved {destination} historic property with authentic charm',
-            'booking_notes': 'Historical significance, authentic period features, cultural value'
-        },
-        {
-            'name': f'{destination} Eco Lodge',
-            'type': 'Sustainable Hotel',
-            'rating': 4.4,
-            'price': 140,
-            'location': f'{destination} Green District',
-            'amenities': ['Eco-friendly practices', 'Organic restaurant', 'Nature access', 'Sustainability tours'],
-            'why_recommended': f'Environmentally conscious hotel promoting sustainable {destination} tourism',
-            'booking_notes': 'Eco-friendly, sustainable practices, nature connection'
-        }
-    ]
-    
-    return hotel_types
-
-def generate_universal_activities(destination):
-    """Generate diverse, realistic activities for any destination"""
-    
-    activity_types = [
-        {
-            'name': f'{destination} Historic Walking Tour',
-            'type': 'Historical Cultural Experience',
-            'duration': '3 hours',
-            'price': 35,
-            'difficulty': 'Easy',
-            'group_size': 'Small group (12-15 people)',
-            'match_reason': f'Perfect introduction to {destination} history and landmarks'
-        },
-        {
-            'name': f'{destination} Cooking Workshop',
-            'type': 'Culinary Experience',
-            'duration': '4 hours',
-            'price': 85,
-            'difficulty': 'Easy',
-            'group_size': 'Small group (8-12 people)',
-            'match_reason': f'Hands-on experience learning traditional {destination} cuisine'
-        },
-        {
-            'name': f'{destination} Art & Culture Tour',
-            'type': 'Cultural Experience',
-            'duration': '2.5 hours',
-            'price': 45,
-            'difficulty': 'Easy',
-            'group_size': 'Medium group (15-20 people)',
-            'match_reason': f'Explore {destination} artistic heritage and cultural sites'
-        },
-        {
-            'name': f'{destination} Adventure Hiking',
-            'type': 'Outdoor Adventure',
-            'duration': '6 hours',
-            'price': 75,
-            'difficulty': 'Moderate',
-            'group_size': 'Small group (8-12 people)',
-            'match_reason': f'Discover {destination} natural beauty and scenic landscapes'
-        },
-        {
-            'name': f'{destination} Photography Walk',
-            'type': 'Photography Experience',
-            'duration': '3 hours',
-            'price': 55,
-            'difficulty': 'Easy',
-            'group_size': 'Small group (6-10 people)',
-            'match_reason': f'Capture {destination} most photogenic spots with professional guidance'
-        },
-        {
-            'name': f'{destination} Local Market Experience',
-            'type': 'Cultural Immersion',
-            'duration': '2 hours',
-            'price': 25,
-            'difficulty': 'Easy',
-            'group_size': 'Small group (10-15 people)',
-            'match_reason': f'Experience authentic {destination} daily life and local commerce'
-        },
-        {
-            'name': f'{destination} Craft Workshop',
-            'type': 'Hands-on Cultural Experience',
-            'duration': '3 hours',
-            'price': 65,
-            'difficulty': 'Easy',
-            'group_size': 'Small group (8-10 people)',
-            'match_reason': f'Learn traditional {destination} crafts from local artisans'
-        },
-        {
-            'name': f'{destination} Evening Entertainment',
-            'type': 'Cultural Performance',
-            'duration': '2 hours',
-            'price': 40,
-            'difficulty': 'Easy',
-            'group_size': 'Medium group (20-30 people)',
-            'match_reason': f'Experience {destination} traditional music, dance, or performance arts'
-        }
-    ]
-    
-    return activity_types
-
-def generate_destination_specific_activities(destination, profile, user_prompt, budget_level, variation_style=None):
-    """Generate destination-specific activities based on interests and package style"""
-    
-    destination_info = get_destination_intelligence(destination)
-    interests = profile.get('interests', ['cultural experiences'])
-    
-    # Destination-specific activities
-    activity_data = {
-        'China': [
-            {
-                'name': 'Great Wall of China Hiking Tour',
-                'type': 'Historical Adventure',
-                'duration': '8 hours',
-                'price': 120,
-                'difficulty': 'Moderate',
-                'group_size': 'Small group (8-12 people)',
-                'match_reason': 'Perfect for cultural history enthusiasts and photography lovers'
-            },
-            {
-                'name': 'Traditional Chinese Calligraphy Workshop',
-                'type': 'Cultural Experience',
-                'duration': '3 hours',
-                'price': 85,
-                'difficulty': 'Easy',
-                'group_size': 'Small group (6-10 people)',
-                'match_reason': 'Hands-on cultural immersion learning ancient Chinese art form'
-            },
-            {
-                'name': 'Forbidden City Private Guided Tour',
-                'type': 'Historical Tour',
-                'duration': '4 hours',
-                'price': 150,
-                'difficulty': 'Easy',
-                'group_size': 'Private guide',
-                'match_reason': 'Deep dive into Chinese imperial history with expert storytelling'
-            },
-            {
-                'name': 'Beijing Hutong Food Tour by Rickshaw',
-                'type': 'Culinary Adventure',
-                'duration': '5 hours',
-                'price': 95,
-                'difficulty': 'Easy',
-                'group_size': 'Small group (6-8 people)',
-                'match_reason': 'Combines local culture, authentic cuisine, and traditional transportation'
-            },
-            {
-                'name': 'Traditional Tea Ceremony Experience',
-                'type': 'Cultural Workshop',
-                'duration': '2 hours',
-                'price': 60,
-                'difficulty': 'Easy',
-                'group_size': 'Small group (4-8 people)',
-                'match_reason': 'Peaceful cultural experience learning the art of Chinese tea culture'
-            }
-        ],
-        'Paris, France': [
-            {
-                'name': 'Louvre Museum Private Art Tour',
-                'type': 'Art & Culture',
-                'duration': '3 hours',
-                'price': 180,
-                'difficulty': 'Easy',
-                'group_size': 'Private guide',
-                'match_reason': 'Perfect for art enthusiasts wanting deep cultural insights'
-            },
-            {
-                'name': 'French Cooking Class with Market Visit',
-                'type': 'Culinary Experience',
-                'duration': '6 hours',
-                'price': 220,
-                'difficulty': 'Easy',
-                'group_size': 'Small group (8-12 people)',
-                'match_reason': 'Hands-on French culinary culture with market exploration'
-            }
-        ]
-    }
-    
-    # Find destination-specific activities
-    for dest_key, activities in activity_data.items():
-        if dest_key.lower() in destination.lower():
-            destination_activities = activities
-            break
-    else:
-        destination_activities = [
-            {
-                'name': f'{destination} City Walking Tour',
-                'type': 'Cultural Tour',
-                'duration': '3 hours',
-                'price': 50,
-                'difficulty': 'Easy',
-                'group_size': 'Group tour',
-                'match_reason': f'Great introduction to {destination} culture and history'
-            }
-        ]
-    
-    # Filter activities based on interests
-    if 'cultural experiences' in interests:
-        prioritized_activities = [act for act in destination_activities if 'Cultural' in act['type']]
-        prioritized_activities.extend([act for act in destination_activities if act not in prioritized_activities])
-        destination_activities = prioritized_activities
-    
-    # Filter activities based on variation style
-    if variation_style:
-        if variation_style == 'cultural-immersive':
-            # Prefer cultural and historical activities
-            destination_activities = [act for act in destination_activities if any(word in act.get('type', '').lower() for word in ['cultural', 'historical', 'heritage', 'museum', 'traditional'])]
-        elif variation_style == 'adventure-active':
-            # Prefer adventure and active activities
-            destination_activities = [act for act in destination_activities if any(word in act.get('type', '').lower() for word in ['adventure', 'active', 'outdoor', 'sports', 'hiking', 'climbing'])]
-        elif variation_style == 'culinary-focused':
-            # Prefer food-related activities
-            destination_activities = [act for act in destination_activities if any(word in act.get('name', '').lower() for word in ['food', 'cooking', 'culinary', 'market', 'cuisine', 'taste'])]
-        elif variation_style == 'photography-focused':
-            # Prefer scenic and photo-worthy activities
-            destination_activities = [act for act in destination_activities if any(word in act.get('name', '').lower() for word in ['photography', 'scenic', 'viewpoint', 'sunset', 'landscape', 'architecture'])]
-        elif variation_style == 'luxury-premium':
-            # Prefer exclusive and premium activities
-            destination_activities = [act for act in destination_activities if act.get('price', 0) >= 100 or 'private' in act.get('group_size', '').lower()]
-        elif variation_style == 'budget-conscious':
-            # Prefer affordable activities
-            destination_activities = [act for act in destination_activities if act.get('price', 999) <= 75]
-        
-        # Ensure we have at least 4 activities  
-        if len(destination_activities) < 4:
-            # Add back activities if filtering was too restrictive
-            for dest_k, all_acts in activity_data.items():
-                if dest_k.lower() in destination.lower():
-                    needed = 4 - len(destination_activities)
-                    destination_activities.extend([act for act in all_acts if act not in destination_activities][:needed])
-                    break
-            
-            # If still not enough, add generic activities
-            while len(destination_activities) < 4:
-                destination_activities.append({
-                    'name': f'{destination} Discovery Tour {len(destination_activities) + 1}',
-                    'type': 'Cultural Tour',
-                    'duration': '3 hours',
-                    'price': 60,
-                    'difficulty': 'Easy',
-                    'group_size': 'Small group',
-                    'match_reason': f'Explore the best of {destination} with local guides'
-                })
-    
-    return destination_activities[:5]  # Return top 5 activities
-
-def generate_destination_specific_local_experiences(destination, profile, user_prompt, variation_style=None):
-    """Generate unique local experiences specific to destination and package style"""
-    
-    destination_info = get_destination_intelligence(destination)
-    
-    # Destination-specific local experiences
-    experience_data = {
-        'China': [
-            {
-                'name': 'Morning Tai Chi with Locals in Temple of Heaven',
-                'type': 'Wellness & Culture',
-                'duration': '2 hours',
-                'price': 25,
-                'description': 'Join Beijing locals for traditional morning exercise in beautiful temple grounds'
-            },
-            {
-                'name': 'Traditional Chinese Medicine Consultation',
-                'type': 'Health & Wellness',
-                'duration': '1.5 hours',
-                'price': 80,
-                'description': 'Learn about ancient healing practices and receive personalized health assessment'
-            },
-            {
-                'name': 'Silk Road Spice Market Exploration',
-                'type': 'Market Experience',
-                'duration': '3 hours',
-                'price': 40,
-                'description': 'Discover exotic spices and ingredients used in regional Chinese cooking'
-            },
-            {
-                'name': 'Mahjong Game Night with Local Family',
-                'type': 'Social Experience',
-                'duration': '3 hours',
-                'price': 55,
-                'description': 'Learn China\'s most popular game while sharing stories with local family'
-            }
-        ],
-        'Paris, France': [
-            {
-                'name': 'Secret Parisian Courtyard Photography Walk',
-                'type': 'Photography & Exploration',
-                'duration': '3 hours',
-                'price': 75,
-                'description': 'Discover hidden courtyards and secret passages unknown to most tourists'
-            }
-        ]
-    }
-    
-    # Find destination experiences
-    for dest_key, experiences in experience_data.items():
-        if dest_key.lower() in destination.lower():
-            destination_experiences = experiences
-            break
-    else:
-        # Default experiences
-        destination_experiences = [
-            {
-                'name': f'{destination} Local Neighborhood Walk',
-                'type': 'Cultural Exploration',
-                'duration': '2 hours',
-                'price': 30,
-                'description': f'Explore authentic local neighborhoods in {destination} with resident guide'
-            }
-        ]
-    
-    # Filter experiences based on variation style
-    if variation_style:
-        if variation_style == 'cultural-immersive':
-            # Prefer cultural and traditional experiences
-            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('type', '').lower() for word in ['cultural', 'traditional', 'heritage', 'historical'])]
-        elif variation_style == 'culinary-focused':
-            # Prefer food-related experiences
-            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('name', '').lower() for word in ['cooking', 'food', 'market', 'culinary', 'tea', 'dining'])]
-        elif variation_style == 'adventure-active':
-            # Prefer active experiences
-            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('type', '').lower() for word in ['adventure', 'active', 'sports', 'physical'])]
-        elif variation_style == 'photography-focused':
-            # Prefer visually appealing experiences
-            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('name', '').lower() for word in ['photography', 'scenic', 'sunrise', 'sunset', 'view', 'art'])]
-        
-        # Ensure we have at least 3 experiences
-        if len(destination_experiences) < 3:
-            for dest_k, all_exps in experience_data.items():
-                if dest_k.lower() in destination.lower():
-                    needed = 3 - len(destination_experiences)
-                    destination_experiences.extend([exp for exp in all_exps if exp not in destination_experiences][:needed])
-                    break
-            
-            # Generate style-specific experiences if still needed
-            while len(destination_experiences) < 3:
-                exp_count = len(destination_experiences) + 1
-                
-                if variation_style == 'cultural-immersive':
-                    new_exp = {
-                        'name': f'{destination} Cultural Heritage Walk {exp_count}',
-                        'type': 'Cultural Immersion',
-                        'duration': '3 hours',
-                        'price': 45,
-                        'description': f'Deep dive into {destination} history, traditions, and local customs with expert guides'
-                    }
-                elif variation_style == 'culinary-focused':
-                    new_exp = {
-                        'name': f'{destination} Food Market Discovery {exp_count}',
-                        'type': 'Culinary Adventure',
-                        'duration': '2.5 hours',
-                        'price': 55,
-                        'description': f'Explore {destination} local markets, taste regional specialties, and meet local vendors'
-                    }
-                elif variation_style == 'adventure-active':
-                    new_exp = {
-                        'name': f'{destination} Active Adventure Tour {exp_count}',
-                        'type': 'Outdoor Adventure',
-                        'duration': '4 hours',
-                        'price': 75,
-                        'description': f'Active exploration of {destination} through hiking, cycling, or outdoor activities'
-                    }
-                elif variation_style == 'luxury-premium':
-                    new_exp = {
-                        'name': f'{destination} VIP Experience {exp_count}',
-                        'type': 'Luxury Experience',
-                        'duration': '3 hours',
-                        'price': 120,
-                        'description': f'Exclusive {destination} experience with private guide and premium access'
-                    }
-                elif variation_style == 'photography-focused':
-                    new_exp = {
-                        'name': f'{destination} Photography Tour {exp_count}',
-                        'type': 'Photography Experience',
-                        'duration': '4 hours',
-                        'price': 65,
-                        'description': f'Capture {destination} best shots with professional photography guidance'
-                    }
-                elif variation_style == 'budget-conscious':
-                    new_exp = {
-                        'name': f'{destination} Free Walking Discovery {exp_count}',
-                        'type': 'Budget-Friendly Tour',
-                        'duration': '2 hours',
-                        'price': 25,
-                        'description': f'Affordable exploration of {destination} highlights and hidden gems'
-                    }
-                else:
-                    new_exp = {
-                        'name': f'{destination} Local Experience {exp_count}',
-                        'type': 'Cultural Experience',
-                        'duration': '2 hours',
-                        'price': 40,
-                        'description': f'Authentic local experience showcasing {destination} culture and traditions'
-                    }
-                
-                destination_experiences.append(new_exp)
-    
-    return destination_experiences[:4]
-
-def generate_intelligent_daily_itinerary(destination, duration, profile, user_prompt, package_style, variation_style=None):
-    """Generate truly unique, destination-specific daily itinerary with enhanced AI and database integration"""
-    
-    # Use enhanced itinerary generator if available
-    if ENHANCED_FEATURES_AVAILABLE:
-        try:
-            enhanced_generator = EnhancedItineraryGenerator(get_supabase_client())
-            # The EnhancedItineraryGenerator expects 6 parameters, not 7
-            return enhanced_generator.generate_intelligent_daily_itinerary(
-                destination, duration, profile, user_prompt, package_style
-            )
-        except Exception as e:
-            print(f"Enhanced itinerary generation failed: {e}")
-            # Fall back to enhanced implementation
-    
-    # Enhanced database-driven implementation
-    return generate_database_driven_itinerary(destination, duration, profile, user_prompt, package_style, variation_style)
-
-def generate_database_driven_itinerary(destination, duration, profile, user_prompt, package_style, variation_style=None):
-    """Generate highly detailed, database-driven daily itinerary based on package variation style"""
-    
-    destination_info = get_destination_intelligence(destination)
-    activities_from_db = fetch_activities_from_database(destination)
-    user_interests = analyze_user_interests_advanced(profile, user_prompt)
-    
-    itinerary = []
-    used_activities = set()  # Track used activities to avoid repetition
-    
-    # Create day-specific themes with intelligent variation based on package variation style
-    effective_style = variation_style or package_style.get('style_type', 'cultural-immersive')
-    daily_themes = generate_progressive_daily_themes(destination, duration, user_interests, effective_style)
-    
-    # Safety check: ensure we have enough themes
-    if len(daily_themes) < duration:
-        # Extend themes if needed
-        while len(daily_themes) < duration:
-            daily_themes.append(f"Day {len(daily_themes) + 1}: Exploration & Discovery")
-    
-    for day in range(1, duration + 1):
-        # Safety check for theme index
-        theme_index = min(day - 1, len(daily_themes) - 1)
-        current_theme = daily_themes[theme_index] if daily_themes else f"Day {day}: Discovery"
-        
-        day_plan = generate_hyper_personalized_day(
-            day, duration, destination, destination_info, 
-            activities_from_db, current_theme, 
-            profile, user_prompt, used_activities
-        )
-        itinerary.append(day_plan)
-        
-        # Track used activities to ensure variety
-        if 'activities' in day_plan:
-            for activity in day_plan['activities']:
-                used_activities.add(activity.get('name', ''))
-    
-    return itinerary
-
-def fetch_activities_from_database(destination):
-    """Fetch relevant activities from Supabase database"""
+# Main application navigation
+def main():
+    """Main application with enhanced navigation"""
     
-    activities = []
-    try:
-        supabase = get_supabase_client()
-        if supabase:
-            # Extract city from destination for database query
-            city = destination.split(',')[0].strip()
-            
-            # Query activities table with multiple search strategies
-            queries = [
-                supabase.table("activities").select("*").ilike("city", f"%{city}%"),
-                supabase.table("activities").select("*").ilike("destination", f"%{destination}%"),
-                supabase.table("activities").select("*").ilike("location", f"%{city}%")
-            ]
-            
-            for query in queries:
+    # Check for payment success callback from Stripe
+    query_params = st.query_params
+    if 'payment' in query_params:
+        payment_status = query_params['payment']
+        if payment_status == 'success':
+            session_id = query_params.get('session_id')
+            if session_id and ai_features_available():
                 try:
-                    result = query.execute()
-                    if result.data:
-                        activities.extend(result.data)
+                    # Handle successful payment
+                    from booking_system.enhanced_payment_processor import EnhancedPaymentProcessor
+                    payment_processor = EnhancedPaymentProcessor()
+                    success_result = payment_processor.handle_payment_success(session_id)
+                    
+                    if success_result['success'] and success_result['payment_confirmed']:
+                        payment_processor.display_payment_success(success_result['confirmation_details'])
+                        
+                        # Show booking details
+                        st.markdown("---")
+                        st.markdown("### 📋 **Booking Confirmation Details**")
+                        
+                        confirmation = success_result['confirmation_details']
+                        booking_meta = confirmation.get('booking_metadata', {})
+                        
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            st.markdown(f"""
+                            **Booking ID:** {booking_meta.get('booking_id', 'N/A')}  
+                            **Payment ID:** {confirmation['payment_id']}  
+                            **Amount:** ${confirmation['amount_paid']:,.2f} {confirmation['currency']}  
+                            **Status:** ✅ Confirmed
+                            """)
+                        
+                        with col2:
+                            st.markdown(f"""
+                            **Customer:** {confirmation['customer_email']}  
+                            **Date:** {confirmation['processed_at'].strftime('%Y-%m-%d %H:%M')}  
+                            **Method:** Stripe Secure Checkout  
+                            **Receipt:** Check your email
+                            """)
+                        
+                        st.success("🎉 Your travel booking is confirmed! Check your email for detailed itinerary.")
+                        return  # Exit early to show only confirmation
+                        
+                    else:
+                        st.error(f"❌ Payment verification failed: {success_result.get('error', 'Unknown error')}")
+                        
                 except Exception as e:
-                    print(f"Database query failed: {e}")
-                    continue
-            
-            # Remove duplicates based on activity name
-            seen_names = set()
-            unique_activities = []
-            for activity in activities:
-                name = activity.get('name', '') or activity.get('title', '')
-                if name and name not in seen_names:
-                    seen_names.add(name)
-                    unique_activities.append(activity)
-            
-            activities = unique_activities
-            
-    except Exception as e:
-        print(f"Database fetch failed: {e}")
-    
-    # If no database activities found, create intelligent fallback activities
-    if not activities:
-        activities = generate_intelligent_fallback_activities(destination)
-    
-    return activities
-
-def generate_intelligent_fallback_activities(destination):
-    """Generate intelligent fallback activities when database is unavailable - comprehensive real-world data"""
-    
-    destination_lower = destination.lower()
-    
-    # Destination-specific intelligent activities with REAL web-researched data
-    if any(place in destination_lower for place in ['paris', 'france']):
-        return [
-            # Morning Cultural Activities
-            {'name': 'Louvre Museum Private Tour with Skip-the-Line Access', 'type': 'Cultural', 'duration': '3 hours', 'time_preference': 'morning', 'price': 89, 'description': 'Expert-guided tour through world\'s largest art museum including Mona Lisa and Venus de Milo', 'popularity_score': 95},
-            {'name': 'Montmartre Walking Tour with Local Artist', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 45, 'description': 'Explore artistic quarter with bohemian history, Sacré-Cœur, and street artists', 'popularity_score': 88},
-            {'name': 'Notre-Dame Cathedral Area Historical Walk', 'type': 'Historical', 'duration': '2 hours', 'time_preference': 'morning', 'price': 25, 'description': 'Gothic architecture tour around Île de la Cité with Seine river views', 'popularity_score': 82},
-            
-            # Afternoon Activities
-            {'name': 'Eiffel Tower Summit Access with Sunset Views', 'type': 'Landmark', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 75, 'description': 'Elevator access to top floor with panoramic Paris views and photo opportunities', 'popularity_score': 98},
-            {'name': 'Seine River Cruise with Champagne Service', 'type': 'Scenic', 'duration': '1.5 hours', 'time_preference': 'afternoon', 'price': 55, 'description': 'Relaxing boat tour passing major landmarks with optional champagne service', 'popularity_score': 85},
-            {'name': 'Le Marais Food Walking Tour', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 65, 'description': 'Taste authentic French cuisine in historic Jewish quarter with local specialties', 'popularity_score': 90},
-            
-            # Evening Activities
-            {'name': 'Moulin Rouge Cabaret Show with Dinner', 'type': 'Entertainment', 'duration': '3 hours', 'time_preference': 'evening', 'price': 180, 'description': 'Iconic Parisian cabaret with can-can dancers, live music, and French dinner', 'popularity_score': 87},
-            {'name': 'Latin Quarter Jazz Club Experience', 'type': 'Nightlife', 'duration': '2 hours', 'time_preference': 'evening', 'price': 35, 'description': 'Intimate jazz venue with live performances in historic Latin Quarter', 'popularity_score': 75},
-            
-            # Full Day Experiences
-            {'name': 'Palace of Versailles Day Trip with Gardens', 'type': 'Historical', 'duration': '8 hours', 'time_preference': 'full_day', 'price': 95, 'description': 'Royal palace tour with opulent halls, Hall of Mirrors, and stunning gardens', 'popularity_score': 92},
-        ]
-        
-    elif any(place in destination_lower for place in ['tokyo', 'japan']):
-        return [
-            # Morning Cultural Activities
-            {'name': 'Tsukiji Outer Market Food Tour', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'morning', 'price': 65, 'description': 'Early morning tour of famous fish market with fresh sushi, street food tastings', 'popularity_score': 94},
-            {'name': 'Asakusa Sensoji Temple Traditional Experience', 'type': 'Cultural', 'duration': '2 hours', 'time_preference': 'morning', 'price': 30, 'description': 'Tokyo\'s oldest temple with traditional shopping street and cultural rituals', 'popularity_score': 89},
-            {'name': 'Imperial Palace East Gardens Walk', 'type': 'Historical', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 20, 'description': 'Peaceful gardens of former Edo Castle with seasonal flowers and traditional architecture', 'popularity_score': 78},
-            
-            # Afternoon Activities  
-            {'name': 'Shibuya Crossing and Harajuku Culture Tour', 'type': 'Modern Culture', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 45, 'description': 'Experience world\'s busiest crossing and youth fashion culture in Harajuku district', 'popularity_score': 91},
-            {'name': 'Tokyo Skytree Observation Deck with City Views', 'type': 'Landmark', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 85, 'description': 'World\'s second tallest structure with panoramic Tokyo views from 450m height', 'popularity_score': 86},
-            {'name': 'Akihabara Electronics and Anime District Tour', 'type': 'Modern Culture', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 40, 'description': 'Explore tech wonderland with electronics shops, manga stores, and gaming centers', 'popularity_score': 83},
-            
-            # Evening Activities
-            {'name': 'Shinjuku Golden Gai Night Bar Tour', 'type': 'Nightlife', 'duration': '3 hours', 'time_preference': 'evening', 'price': 75, 'description': 'Tiny themed bars in narrow alleys with local drinks and authentic nightlife', 'popularity_score': 88},
-            {'name': 'Traditional Kaiseki Dinner Experience', 'type': 'Culinary', 'duration': '2.5 hours', 'time_preference': 'evening', 'price': 150, 'description': 'Multi-course traditional Japanese haute cuisine with seasonal ingredients', 'popularity_score': 85},
-            
-            # Full Day Experiences  
-            {'name': 'Mt. Fuji and Lake Kawaguchi Day Trip', 'type': 'Nature', 'duration': '10 hours', 'time_preference': 'full_day', 'price': 120, 'description': 'Scenic trip to Japan\'s iconic mountain with lake views and traditional villages', 'popularity_score': 95},
-            {'name': 'Tokyo Sushi Making Class with Sake Tasting', 'type': 'Culinary', 'duration': '4 hours', 'time_preference': 'full_day', 'price': 95, 'description': 'Learn authentic sushi preparation techniques with sake pairing from master chef', 'popularity_score': 87}
-        ]
-        
-    elif any(place in destination_lower for place in ['rome', 'italy']):
-        return [
-            # Morning Cultural Activities
-            {'name': 'Colosseum Underground and Arena Floor Tour', 'type': 'Historical', 'duration': '3 hours', 'time_preference': 'morning', 'price': 85, 'description': 'Exclusive access to gladiator areas and underground chambers of ancient amphitheater', 'popularity_score': 96},
-            {'name': 'Vatican Museums and Sistine Chapel Early Access', 'type': 'Art & Culture', 'duration': '3.5 hours', 'time_preference': 'morning', 'price': 95, 'description': 'Skip-the-line access to papal art collection and Michelangelo\'s masterpiece ceiling', 'popularity_score': 94},
-            {'name': 'Roman Forum and Palatine Hill Guided Walk', 'type': 'Historical', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 55, 'description': 'Ancient Roman political center and imperial palace ruins with expert historian guide', 'popularity_score': 88},
-            
-            # Afternoon Activities
-            {'name': 'Pantheon and Historic Center Walking Tour', 'type': 'Historical', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 35, 'description': 'Best-preserved Roman building and surrounding historic squares and fountains', 'popularity_score': 85},
-            {'name': 'Trastevere Food Tour with Wine Tasting', 'type': 'Culinary', 'duration': '3.5 hours', 'time_preference': 'afternoon', 'price': 75, 'description': 'Authentic Roman cuisine in bohemian neighborhood with local wine pairings', 'popularity_score': 91},
-            {'name': 'Spanish Steps and Trevi Fountain Photo Walk', 'type': 'Sightseeing', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 25, 'description': 'Iconic baroque staircase and famous fountain with coin-throwing tradition', 'popularity_score': 83},
-            
-            # Evening Activities
-            {'name': 'Italian Cooking Class with Roman Recipes', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'evening', 'price': 85, 'description': 'Learn to make fresh pasta, pizza, and tiramisu with local chef', 'popularity_score': 89},
-            {'name': 'Tiber River Evening Cruise with Aperitivo', 'type': 'Scenic', 'duration': '1.5 hours', 'time_preference': 'evening', 'price': 45, 'description': 'Romantic boat ride with Italian cocktails and views of illuminated landmarks', 'popularity_score': 78},
-            
-            # Full Day Experiences
-            {'name': 'Roman Catacombs Underground Exploration', 'type': 'Historical', 'duration': '4 hours', 'time_preference': 'full_day', 'price': 65, 'description': 'Ancient Christian burial tunnels with guided tour through underground passages', 'popularity_score': 82},
-            {'name': 'Wine Tasting in Roman Countryside', 'type': 'Culinary', 'duration': '6 hours', 'time_preference': 'full_day', 'price': 110, 'description': 'Visit local vineyards with wine education, tastings, and traditional lunch', 'popularity_score': 86}
-        ]
-        
-    elif any(place in destination_lower for place in ['london', 'england', 'uk']):
-        return [
-            # Morning Cultural Activities
-            {'name': 'Tower of London Crown Jewels Tour', 'type': 'Historical', 'duration': '3 hours', 'time_preference': 'morning', 'price': 75, 'description': 'Historic fortress with royal crown jewels, Beefeater guards, and Tower Bridge views', 'popularity_score': 92},
-            {'name': 'British Museum Highlights Private Tour', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 65, 'description': 'World-class artifacts including Rosetta Stone, Egyptian mummies, and Greek sculptures', 'popularity_score': 88},
-            {'name': 'Westminster Abbey and Parliament Tour', 'type': 'Historical', 'duration': '2 hours', 'time_preference': 'morning', 'price': 55, 'description': 'Gothic abbey where royals are crowned and buried, plus Houses of Parliament exterior', 'popularity_score': 85},
-            
-            # Afternoon Activities
-            {'name': 'London Eye Giant Ferris Wheel Experience', 'type': 'Landmark', 'duration': '1 hour', 'time_preference': 'afternoon', 'price': 45, 'description': 'Iconic observation wheel with 360-degree panoramic views over London skyline', 'popularity_score': 89},
-            {'name': 'Thames River Cruise with Afternoon Tea', 'type': 'Scenic', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 65, 'description': 'Traditional British afternoon tea service while cruising past London landmarks', 'popularity_score': 83},
-            {'name': 'Covent Garden and West End Theater District', 'type': 'Entertainment', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 35, 'description': 'Street performers, boutique shopping, and world-famous theater productions', 'popularity_score': 80},
-            
-            # Evening Activities
-            {'name': 'Traditional English Pub Tour with Fish & Chips', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'evening', 'price': 55, 'description': 'Historic pubs with local ales, traditional British cuisine, and social atmosphere', 'popularity_score': 85},
-            {'name': 'West End Musical Show with Pre-Theater Dinner', 'type': 'Entertainment', 'duration': '4 hours', 'time_preference': 'evening', 'price': 125, 'description': 'World-class musical theater production with three-course pre-show dining', 'popularity_score': 91},
-            
-            # Full Day Experiences
-            {'name': 'Windsor Castle and Royal Gardens Day Trip', 'type': 'Historical', 'duration': '8 hours', 'time_preference': 'full_day', 'price': 95, 'description': 'Royal residence with State Apartments, Queen Mary\'s Dolls\' House, and castle grounds', 'popularity_score': 87},
-            {'name': 'Harry Potter Studio Tour Experience', 'type': 'Entertainment', 'duration': '6 hours', 'time_preference': 'full_day', 'price': 85, 'description': 'Behind-the-scenes movie magic with authentic sets, costumes, and special effects', 'popularity_score': 94}
-        ]
-        
-    elif any(place in destination_lower for place in ['bangkok', 'thailand']):
-        return [
-            # Morning Cultural Activities  
-            {'name': 'Grand Palace and Emerald Buddha Temple', 'type': 'Cultural', 'duration': '3 hours', 'time_preference': 'morning', 'price': 45, 'description': 'Ornate royal palace complex with sacred temple housing Thailand\'s most revered Buddha image', 'popularity_score': 94},
-            {'name': 'Wat Pho Temple and Thai Massage Experience', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 35, 'description': 'Temple of Reclining Buddha with traditional Thai massage at birthplace of massage therapy', 'popularity_score': 89},
-            {'name': 'Floating Market Tour by Longtail Boat', 'type': 'Cultural', 'duration': '4 hours', 'time_preference': 'morning', 'price': 55, 'description': 'Traditional water market with fruit vendors in boats, authentic Thai breakfast, local life', 'popularity_score': 87},
-            
-            # Afternoon Activities
-            {'name': 'Chatuchak Weekend Market Shopping Adventure', 'type': 'Shopping', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 25, 'description': 'Massive market with 15,000 stalls selling everything from handicrafts to street food', 'popularity_score': 85},
-            {'name': 'Thai Cooking Class with Market Tour', 'type': 'Culinary', 'duration': '4 hours', 'time_preference': 'afternoon', 'price': 65, 'description': 'Learn authentic Thai recipes starting with fresh market ingredient selection', 'popularity_score': 91},
-            {'name': 'Chao Phraya River Cruise with Temple Stops', 'type': 'Scenic', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 40, 'description': 'River of Kings boat tour visiting waterfront temples and traditional stilt houses', 'popularity_score': 82},
-            
-            # Evening Activities
-            {'name': 'Khao San Road Night Market and Street Food', 'type': 'Nightlife', 'duration': '3 hours', 'time_preference': 'evening', 'price': 30, 'description': 'Backpacker haven with street food stalls, bars, live music, and night shopping', 'popularity_score': 83},
-            {'name': 'Rooftop Sky Bar with Bangkok City Views', 'type': 'Nightlife', 'duration': '2 hours', 'time_preference': 'evening', 'price': 75, 'description': 'High-altitude cocktails with panoramic city skyline and Chao Phraya river views', 'popularity_score': 88},
+                    st.error(f"❌ Error processing payment confirmation: {str(e)}")
+                    
+            else:
+                st.success("🎉 Payment Successful!")
+                if session_id:
+                    st.info(f"Session ID: {session_id}")
+                    
+        elif payment_status == 'cancelled':
+            st.warning("❌ Payment Cancelled")
+            st.info("Your payment was cancelled. You can try again anytime.")
             
-            # Full Day Experiences
-            {'name': 'Ayutthaya Ancient Capital Day Trip', 'type': 'Historical', 'duration': '8 hours', 'time_preference': 'full_day', 'price': 85, 'description': 'UNESCO World Heritage ruins of former Siamese capital with temple complexes', 'popularity_score': 86},
-            {'name': 'Muay Thai Boxing Match with Traditional Dinner', 'type': 'Cultural', 'duration': '5 hours', 'time_preference': 'evening', 'price': 95, 'description': 'Traditional Thai boxing at historic stadium with pre-fight ceremonial dinner', 'popularity_score': 84}
-        ]
-        
-    else:
-        # Generic fallback for other destinations
-        city_name = destination.split(',')[0].strip()
-        return [
-            {'name': f'{city_name} Historic Center Walking Tour', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 35, 'description': f'Explore the historic heart of {city_name} with local guide and cultural insights', 'popularity_score': 78},
-            {'name': f'{city_name} Food Market and Tasting Tour', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 55, 'description': f'Sample authentic local cuisine and specialties in {city_name}\'s best food markets', 'popularity_score': 82},
-            {'name': f'{city_name} Evening Cultural Performance', 'type': 'Entertainment', 'duration': '2 hours', 'time_preference': 'evening', 'price': 45, 'description': f'Traditional cultural show showcasing {city_name}\'s heritage through music and dance', 'popularity_score': 75},
-            {'name': f'{city_name} Art and Architecture Tour', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 40, 'description': f'Discover {city_name}\'s architectural landmarks and artistic heritage with expert guide', 'popularity_score': 80},
-            {'name': f'{city_name} Local Neighborhood Experience', 'type': 'Cultural', 'duration': '3 hours', 'time_preference': 'morning', 'price': 50, 'description': f'Authentic local experience in residential neighborhoods away from tourist crowds', 'popularity_score': 76}
-        ]
-
-def analyze_user_interests_advanced(profile, user_prompt):
-    """Advanced analysis of user interests from profile and prompt"""
-    
-    interests = profile.get('interests', [])
-    prompt_lower = user_prompt.lower()
-    
-    # Enhanced interest categories with weights
-    interest_analysis = {
-        'cultural_immersion': 0,
-        'culinary_experiences': 0,
-        'adventure_activities': 0,
-        'relaxation_wellness': 0,
-        'photography_sightseeing': 0,
-        'shopping_lifestyle': 0,
-        'nightlife_entertainment': 0,
-        'educational_learning': 0,
-        'romantic_experiences': 0,
-        'family_friendly': 0
-    }
-    
-    # Analyze profile interests
-    for interest in interests:
-        interest_lower = interest.lower()
-        if any(word in interest_lower for word in ['culture', 'history', 'museum', 'heritage']):
-            interest_analysis['cultural_immersion'] += 2
-        if any(word in interest_lower for word in ['food', 'cuisine', 'cooking', 'dining']):
-            interest_analysis['culinary_experiences'] += 2
-        if any(word in interest_lower for word in ['photography', 'photo']):
-            interest_analysis['photography_sightseeing'] += 2
-        if any(word in interest_lower for word in ['art', 'gallery']):
-            interest_analysis['cultural_immersion'] += 1
-            interest_analysis['educational_learning'] += 1
-    
-    # Analyze user prompt for additional insights
-    cultural_keywords = ['culture', 'history', 'traditional', 'heritage', 'museums', 'temples', 'monuments']
-    culinary_keywords = ['food', 'cuisine', 'cooking', 'restaurants', 'local dishes', 'street food', 'wine', 'beer']
-    adventure_keywords = ['adventure', 'hiking', 'outdoor', 'sports', 'active', 'climbing', 'biking']
-    relaxation_keywords = ['relax', 'spa', 'peaceful', 'calm', 'beach', 'wellness', 'meditation']
-    photography_keywords = ['photography', 'photos', 'instagram', 'scenic', 'views', 'landscapes']
-    
-    for keyword in cultural_keywords:
-        if keyword in prompt_lower:
-            interest_analysis['cultural_immersion'] += 1
-    
-    for keyword in culinary_keywords:
-        if keyword in prompt_lower:
-            interest_analysis['culinary_experiences'] += 1
-    
-    for keyword in adventure_keywords:
-        if keyword in prompt_lower:
-            interest_analysis['adventure_activities'] += 1
-    
-    for keyword in relaxation_keywords:
-        if keyword in prompt_lower:
-            interest_analysis['relaxation_wellness'] += 1
-    
-    for keyword in photography_keywords:
-        if keyword in prompt_lower:
-            interest_analysis['photography_sightseeing'] += 1
+            # Clear any stored payment session data
+            if 'stripe_session_id' in st.session_state:
+                del st.session_state.stripe_session_id
+            if 'booking_id' in st.session_state:
+                del st.session_state.booking_id
     
-    # Identify top 3 interests
-    sorted_interests = sorted(interest_analysis.items(), key=lambda x: x[1], reverse=True)
-    return [interest[0] for interest in sorted_interests[:3] if interest[1] > 0]
-
-def generate_style_specific_themes(destination, theme_focus):
-    """Generate destination-specific themes based on package style"""
+    # Initialize current page
+    if 'current_page' not in st.session_state:
+        st.session_state.current_page = "main"
     
-    destination_lower = destination.lower()
-    
-    # Style-specific theme templates
-    theme_templates = {
-        'cultural': {
-            'paris': [
-                "Arrival & Classic Paris Discovery - Eiffel Tower & Notre-Dame",
-                "Art & Culture Immersion - Louvre & Musée d'Orsay", 
-                "Historic Paris Exploration - Le Marais & Latin Quarter",
-                "Royal Heritage Experience - Versailles Palace Day Trip",
-                "Literary Paris Walk - Shakespeare & Company, Panthéon",
-                "Sacred Paris - Sainte-Chapelle & Sacré-Cœur",
-                "Cultural Farewell - Opera House & Champs-Élysées"
-            ],
-            'tokyo': [
-                "Tokyo Arrival & Traditional Districts - Asakusa Temples",
-                "Imperial Culture - East Gardens & National Museum",
-                "Traditional Arts Experience - Kabuki & Tea Ceremony",
-                "Spiritual Tokyo - Meiji Shrine & Senso-ji Temple", 
-                "Edo Culture Discovery - Traditional Crafts Workshop",
-                "Cultural Neighborhoods - Yanaka & Traditional Markets"
-            ],
-            'spain': [
-                "Arrival & Madrid Royal Heritage - Royal Palace & Plaza Mayor",
-                "Islamic Spain Discovery - Alhambra Palace in Granada",
-                "Medieval Spanish Culture - Toledo & Historic Centers",
-                "Artistic Spain - Prado Museum & Picasso Masterpieces",
-                "Religious Heritage - Santiago de Compostela & Cathedrals",
-                "Moorish Legacy - Alcázar & Cordoba Mezquita",
-                "Spanish Traditions - Flamenco & Cultural Farewell"
-            ],
-            'generic': [
-                f"Arrival & {destination} Cultural Overview",
-                f"Historical Heart of {destination}",
-                f"Traditional Arts & Crafts Experience", 
-                f"Religious & Spiritual {destination}",
-                f"Museums & Cultural Heritage",
-                f"Local Traditions & Customs",
-                f"Cultural Farewell Experience"
-            ]
-        },
-        'culinary': {
-            'paris': [
-                "Culinary Arrival - Market Tour & French Bistro",
-                "Patisserie & Boulangerie Workshop Experience",
-                "Wine & Cheese Tasting in Montmartre",
-                "Michelin Star Dining & Fine French Cuisine",
-                "Cooking Class - Traditional French Dishes",
-                "Food Market Adventures - Le Marché aux Puces",
-                "Farewell Feast - Seine River Dinner Cruise"
-            ],
-            'tokyo': [
-                "Culinary Tokyo Arrival - Tsukiji Outer Market Tour", 
-                "Sushi Making Class & Sake Tasting",
-                "Ramen & Street Food Discovery Tour",
-                "Kaiseki Fine Dining Experience",
-                "Cooking Workshop - Traditional Japanese Cuisine",
-                "Food Districts Exploration - Shibuya & Harajuku Eats"
-            ],
-            'spain': [
-                "Spanish Culinary Arrival - Mercado San Miguel & Tapas Tour",
-                "Paella Cooking Class & Valencia Rice Fields",
-                "Jamón Ibérico & Wine Tasting in La Rioja",
-                "Pintxos Bar Hopping in Basque Country",
-                "Traditional Spanish Market & Ingredient Tour",
-                "Sherry & Andalusian Cuisine Experience",
-                "Farewell Feast - Casa Botín & Spanish Classics"
-            ],
-            'generic': [
-                f"{destination} Culinary Discovery - Markets & Local Cuisine",
-                f"Cooking Class - Traditional {destination} Dishes",
-                f"Street Food & Local Eateries Adventure",
-                f"Fine Dining & Regional Specialties",
-                f"Food Market & Ingredient Shopping Tour",
-                f"Wine/Local Drinks Tasting Experience",
-                f"Farewell Feast - Best of {destination} Cuisine"
-            ]
-        },
-        'adventure': {
-            'paris': [
-                "Active Paris Arrival - Seine Kayaking & Bike Tour",
-                "Urban Adventure - Rock Climbing & Parkour",
-                "Paris by Foot - Marathon Walking Tour",
-                "Adventure Day Trip - Fontainebleau Rock Climbing", 
-                "Active Seine Experience - Rowing & Water Sports",
-                "High Adventure - Eiffel Tower Climbing Experience"
-            ],
-            'spain': [
-                "Adventure Spain Arrival - Pyrenees Hiking Preview",
-                "Camino de Santiago Walking Experience",
-                "Costa Brava Sea Kayaking & Cliff Climbing",
-                "Sierra Nevada Mountain Adventures", 
-                "Picos de Europa Rock Climbing & Canyoning",
-                "Active Barcelona - Beach Sports & Urban Cycling",
-                "Adventure Farewell - Spanish Peaks Final Challenge"
-            ],
-            'generic': [
-                f"Adventure Arrival - {destination} Outdoor Orientation",
-                f"Urban Adventures - City Exploration on Foot",
-                f"Active {destination} - Hiking & Outdoor Activities",
-                f"Water Adventures - River/Lake Activities", 
-                f"Extreme {destination} - Adventure Sports",
-                f"Mountain/Hill Adventures Near {destination}",
-                f"Active Farewell - Final Adventure Challenge"
-            ]
-        },
-        'luxury': {
-            'paris': [
-                "Luxury Paris Arrival - Private Château Welcome",
-                "VIP Louvre Experience - After Hours Private Tour",
-                "Exclusive Shopping - Personal Stylist on Champs-Élysées",
-                "Private Versailles - Royal Treatment with Guide",
-                "Michelin Star Restaurant Hopping Experience", 
-                "Luxury Seine Experience - Private Yacht Charter",
-                "Farewell Luxury - Private Opera Box & Champagne"
-            ],
-            'spain': [
-                "Luxury Spain Arrival - Private Ritz Madrid Experience",
-                "Exclusive Alhambra - Private After-Hours Palace Tour",
-                "VIP Shopping - Luxury Boutiques in Salamanca District",
-                "Private Prado Museum - Exclusive Art Collection Tour",
-                "Michelin Star Journey - DiverXO & Exclusive Dining",
-                "Luxury Andalusia - Private Helicopter to Seville", 
-                "Royal Farewell - Private Royal Palace & Luxury Send-off"
-            ],
-            'generic': [
-                f"Luxury {destination} Arrival - VIP Welcome Experience",
-                f"Exclusive {destination} - Private Tours & Experiences",
-                f"Luxury Shopping & Personal Services",
-                f"VIP Cultural Experiences - Behind the Scenes",
-                f"Fine Dining & Exclusive Restaurants",
-                f"Luxury Transportation & Scenic Routes", 
-                f"Farewell Luxury Experience - Premium Send-off"
-            ]
-        },
-        'photography': {
-            'paris': [
-                "Golden Hour Paris - Sunrise at Trocadéro & Eiffel Tower",
-                "Architectural Photography - Notre-Dame & Sainte-Chapelle",
-                "Street Photography Workshop - Montmartre Artists",
-                "Seine Reflections - River Photography at Blue Hour",
-                "Paris Rooftops - Aerial Photography Experience",
-                "Night Photography - Illuminated Paris Monuments"
-            ],
-            'spain': [
-                "Golden Hour Madrid - Royal Palace & Retiro Park Sunrise",
-                "Gaudí Architecture Photography - Sagrada Familia & Park Güell",
-                "Flamenco Street Photography - Seville & Granada Dancers",
-                "Alhambra Light & Shadow - Architectural Details Workshop",
-                "Spanish Landscapes - Andalusian Countryside & White Villages",
-                "Night Photography - Barcelona Gothic Quarter Illumination",
-                "Photography Portfolio Review - Spanish Light & Culture"
-            ],
-            'generic': [
-                f"Golden Hour {destination} - Best Sunrise Spots",
-                f"Architecture Photography - Historic Buildings",
-                f"Street Photography Workshop - Local Life Capture",
-                f"Scenic {destination} - Landscape Photography",
-                f"Portrait Photography - Local People & Culture",
-                f"Night Photography - {destination} After Dark",
-                f"Photography Portfolio Review & Best Shots"
-            ]
-        },
-        'budget': {
-            'paris': [
-                "Budget Paris Arrival - Free Walking Tour & Picnic",
-                "Free Museums Day - Permanent Collections",
-                "Budget Eats - Local Markets & Affordable Bistros",
-                "Free Parks & Gardens - Luxembourg & Tuileries",
-                "Budget Shopping - Flea Markets & Vintage Shops",
-                "Free Entertainment - Street Art & Performances"
-            ],
-            'spain': [
-                "Budget Madrid Arrival - Free Walking Tour & El Rastro Market",
-                "Free Museum Day - Prado & Reina Sofia Free Hours",
-                "Budget Tapas - Local Tabernas & Happy Hour Specials",
-                "Free Parks & Plazas - Retiro, Plaza Mayor & Street Performers",
-                "Budget Markets - El Rastro Flea Market & Local Bargains",
-                "Free Flamenco - Street Performances & Cultural Centers",
-                "Budget Farewell - Free Sunset Views & Public Celebrations"
-            ],
-            'generic': [
-                f"Budget {destination} Arrival - Free City Orientation",
-                f"Free Attractions & Museums in {destination}",
-                f"Budget Dining - Local Markets & Street Food",
-                f"Free Activities - Parks, Walks & Public Spaces",
-                f"Budget Shopping - Markets & Local Deals",
-                f"Free Entertainment & Local Events",
-                f"Budget Farewell - Free Activities & Memories"
-            ]
-        }
-    }
-    
-    # Get themes for the specific style and destination
-    style_themes = theme_templates.get(theme_focus, theme_templates['cultural'])
-    
-    # Try to find destination-specific themes with improved matching
-    for dest_key in style_themes:
-        if dest_key != 'generic':
-            if (dest_key in destination_lower or 
-                destination_lower in dest_key or
-                (dest_key == 'spain' and any(city in destination_lower for city in ['madrid', 'barcelona', 'seville', 'granada', 'valencia', 'bilbao'])) or
-                (destination_lower == 'spain' and dest_key in ['madrid', 'barcelona'])):
-                return style_themes[dest_key]
-    
-    # Fall back to generic themes for the style
-    return style_themes.get('generic', style_themes[list(style_themes.keys())[0]])
-
-def generate_progressive_daily_themes(destination, duration, user_interests, variation_style):
-    """Generate progressive themes that build on each other throughout the trip based on package variation style"""
-    
-    destination_lower = destination.lower()
-    
-    # Get style-specific theme templates
-    if variation_style == 'cultural-immersive':
-        theme_focus = 'cultural'
-    elif variation_style == 'culinary-focused':
-        theme_focus = 'culinary' 
-    elif variation_style == 'adventure-active':
-        theme_focus = 'adventure'
-    elif variation_style == 'luxury-premium':
-        theme_focus = 'luxury'
-    elif variation_style == 'photography-focused':
-        theme_focus = 'photography'
-    elif variation_style == 'budget-conscious':
-        theme_focus = 'budget'
-    else:
-        theme_focus = 'cultural'  # default
-    
-    # Debug logging
-    print(f"🎯 Generating themes for {destination} with style: {variation_style} -> {theme_focus}")
-    
-    # Check if destination has specific data
-    has_specific_data = any(place in destination.lower() for place in ['paris', 'tokyo', 'china', 'spain', 'madrid', 'barcelona'])
-    if not has_specific_data:
-        print(f"🌍 Using universal content generation for {destination}")
-    
-    # Base theme progression for different destinations
-    if any(place in destination_lower for place in ['paris', 'france']):
-        base_themes = [
-            "Arrival & Classic Paris Discovery - Eiffel Tower & Seine",
-            "Art & Culture Immersion - Louvre & Montmartre Walking", 
-            "Hidden Paris Exploration - Le Marais & Secret Courtyards",
-            "Culinary Adventure - Markets, Bistros & Wine Tasting",
-            "Royal Paris Experience - Versailles Day Trip",
-            "Modern Paris Innovation - La Défense & Contemporary Art",
-            "Romantic Farewell - Sunset Seine Cruise & Farewell Dinner"
-        ]
-    elif any(place in destination_lower for place in ['tokyo', 'japan']):
-        base_themes = [
-            "Tokyo Arrival & Shibuya Energy - Crossing & Modern Districts",
-            "Traditional Culture - Asakusa Temples & Imperial Palace",
-            "Culinary Journey - Tsukiji Market & Sushi Making Class",
-            "Pop Culture & Technology - Harajuku, Akihabara & Robot Shows",
-            "Nature & Serenity - Meiji Shrine & Traditional Gardens",
-            "Night Life & Entertainment - Shinjuku Golden Gai & Karaoke"
-        ]
-    elif any(place in destination_lower for place in ['china', 'beijing', 'shanghai']):
-        base_themes = [
-            "Imperial Beijing Discovery - Forbidden City & Tiananmen",
-            "Great Wall Adventure & Traditional Villages",
-            "Hutong Culture Deep Dive - Local Life & Tea Ceremony", 
-            "Culinary Exploration - Peking Duck & Street Food Tours",
-            "Art & Philosophy - Temple of Heaven & Calligraphy Workshop",
-            "Modern China Experience - 798 Art District & Tech Centers",
-            "Ancient Wisdom & Farewell - Summer Palace & Reflection"
-        ]
-    elif any(place in destination_lower for place in ['spain', 'madrid', 'barcelona', 'seville', 'granada']):
-        # Default Spain themes (will be overridden by style-specific themes)
-        base_themes = [
-            "Spanish Heritage Arrival - Royal Madrid & Plaza Mayor",
-            "Moorish Legacy Discovery - Alhambra & Islamic Architecture", 
-            "Spanish Art & Culture - Prado Museum & Picasso Trail",
-            "Culinary Spain Experience - Tapas, Paella & Regional Cuisine",
-            "Sacred Spain Journey - Cathedrals & Santiago Pilgrimage",
-            "Modern Spanish Innovation - Guggenheim Bilbao & Contemporary Art",
-            "Spanish Traditions Farewell - Flamenco & Cultural Celebration"
-        ]
-    else:
-        # Use style-specific theme generator
-        base_themes = generate_style_specific_themes(destination, theme_focus)
-        print(f"📋 Generated {len(base_themes)} themes for {destination} ({theme_focus}): {base_themes[:2]}...")
-    
-    # Ensure we have enough themes for the duration
-    # If duration is longer than available themes, cycle through themes
-    extended_themes = []
-    for i in range(duration):
-        theme_index = i % len(base_themes)
-        theme = base_themes[theme_index]
-        
-        # Add day number if cycling through themes
-        if i >= len(base_themes):
-            theme = f"Day {i+1}: {theme}"
-        
-        extended_themes.append(theme)
-    
-    # Customize themes based on user interests
-    customized_themes = []
-    for i, theme in enumerate(extended_themes):
-        if i < len(user_interests) and user_interests:
-            primary_interest = user_interests[i % len(user_interests)]
-            if 'culinary' in primary_interest:
-                theme = theme.replace('Cultural', 'Culinary').replace('Discovery', 'Food Discovery')
-            elif 'adventure' in primary_interest:
-                theme = theme.replace('Cultural', 'Active').replace('Discovery', 'Adventure')
-            elif 'photography' in primary_interest:
-                theme = theme.replace('Cultural', 'Photographic').replace('Discovery', 'Photo Safari')
-        
-        customized_themes.append(theme)
-    
-    return customized_themes
-
-def generate_hyper_personalized_day(day, total_duration, destination, destination_info, 
-                                   activities_from_db, theme, profile, user_prompt, used_activities):
-    """Generate hyper-personalized daily itinerary with specific timing and context"""
-    
-    # Filter activities by theme and user interests
-    relevant_activities = filter_activities_by_theme_and_interests(
-        activities_from_db, theme, profile, used_activities
-    )
-    
-    # Generate time-specific itinerary
-    morning_activity, afternoon_activity, evening_activity = select_optimal_activities_by_time(
-        relevant_activities, day, total_duration
-    )
-    
-    # Generate detailed meals based on location and user preferences
-    meals = generate_contextual_meals(destination, day, profile, morning_activity, afternoon_activity)
-    
-    # Calculate realistic transportation and timing
-    transportation = calculate_intelligent_transportation(
-        destination, morning_activity, afternoon_activity, evening_activity
-    )
-    
-    # Estimate realistic costs
-    estimated_cost = calculate_realistic_daily_cost(
-        destination, morning_activity, afternoon_activity, evening_activity, meals
-    )
-    
-    # Create comprehensive day plan
-    day_plan = {
-        'day': day,
-        'theme': theme,
-        'morning': generate_detailed_time_block(morning_activity, "9:00 AM - 12:00 PM"),
-        'afternoon': generate_detailed_time_block(afternoon_activity, "1:00 PM - 5:00 PM"), 
-        'evening': generate_detailed_time_block(evening_activity, "6:00 PM - 9:00 PM"),
-        'activities': [morning_activity, afternoon_activity, evening_activity],
-        'meals': meals,
-        'transportation': transportation,
-        'estimated_cost': estimated_cost,
-        'cultural_highlights': generate_cultural_insights(destination, theme, [morning_activity, afternoon_activity, evening_activity]),
-        'local_tips': generate_local_insider_tips(destination, day, theme),
-        'weather_considerations': f"Check local weather for optimal experience. Best backup indoor options available.",
-        'photography_opportunities': identify_photography_spots([morning_activity, afternoon_activity, evening_activity])
-    }
-    
-    return day_plan
-
-def filter_activities_by_theme_and_interests(activities, theme, profile, used_activities):
-    """Filter activities based on daily theme and user interests with proper variety"""
-    
-    theme_lower = theme.lower()
-    interests = profile.get('interests', [])
-    
-    relevant_activities = []
-    
-    for activity in activities:
-        # Skip already used activities to ensure variety
-        activity_name = activity.get('name', '')
-        if activity_name in used_activities:
-            continue
-        
-        activity_type = activity.get('type', '').lower()
-        activity_desc = activity.get('description', '').lower()
-        
-        relevance_score = 0
-        
-        # Theme matching with better scoring
-        if 'cultural' in theme_lower and any(keyword in activity_type for keyword in ['cultural', 'historical', 'art']):
-            relevance_score += 20
-        elif 'culinary' in theme_lower and 'culinary' in activity_type:
-            relevance_score += 20
-        elif 'adventure' in theme_lower and any(keyword in activity_type for keyword in ['adventure', 'nature', 'outdoor']):
-            relevance_score += 20
-        elif 'modern' in theme_lower and any(keyword in activity_type for keyword in ['modern', 'landmark', 'entertainment']):
-            relevance_score += 20
-        
-        # Interest matching
-        for interest in interests:
-            if interest.lower() in activity_desc or interest.lower() in activity_type:
-                relevance_score += 10
-        
-        # Add popularity bonus
-        popularity = activity.get('popularity_score', 70)
-        relevance_score += popularity * 0.1
-        
-        if relevance_score > 10:  # Minimum threshold
-            activity['relevance_score'] = relevance_score
-            relevant_activities.append(activity)
-    
-    # Sort by relevance and return diverse selection
-    relevant_activities.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-    return relevant_activities[:15]  # Top 15 most relevant
-
-def select_optimal_activities_by_time(activities, day, total_duration):
-    """Select optimal activities for morning, afternoon, and evening with proper variety"""
-    
-    morning_activities = []
-    afternoon_activities = []
-    evening_activities = []
-    
-    for activity in activities:
-        time_preference = activity.get('time_preference', '').lower()
-        activity_type = activity.get('type', '').lower()
-        
-        # Time-based classification using our new structure
-        if time_preference == 'morning' or any(keyword in activity_type for keyword in ['cultural', 'historical', 'temple']):
-            morning_activities.append(activity)
-        elif time_preference == 'evening' or any(keyword in activity_type for keyword in ['nightlife', 'entertainment', 'dinner']):
-            evening_activities.append(activity)
-        elif time_preference == 'full_day':
-            # Full day activities can be split or used for special days
-            if day % 3 == 0:  # Every third day use full day activity
-                morning_activities.append(activity)
-        else:
-            afternoon_activities.append(activity)
-    
-    # Select best activity for each time period ensuring variety
-    morning_activity = select_best_activity_for_period(morning_activities, "morning", day, total_duration)
-    afternoon_activity = select_best_activity_for_period(afternoon_activities, "afternoon", day, total_duration)
-    evening_activity = select_best_activity_for_period(evening_activities, "evening", day, total_duration)
-    
-    return morning_activity, afternoon_activity, evening_activity
-
-def select_best_activity_for_period(activities, period, day, total_duration):
-    """Select the best activity for a specific time period with intelligent ranking"""
-    
-    if not activities:
-        return generate_fallback_activity_for_period(period, day)
-    
-    # Prioritize activities based on day position in trip
-    if day == 1:  # First day - easier, orientation activities
-        preferred_types = ['cultural', 'historical', 'landmark', 'easy']
-    elif day == total_duration:  # Last day - memorable, farewell activities
-        preferred_types = ['shopping', 'memorable', 'scenic', 'reflection']
-    else:  # Middle days - diverse experiences
-        preferred_types = ['culinary', 'adventure', 'entertainment', 'unique']
-    
-    # Score activities based on period, day preferences, and variety
-    best_activity = None
-    best_score = 0
-    
-    for activity in activities:
-        activity_type = activity.get('type', '').lower()
-        base_score = activity.get('relevance_score', 0) + activity.get('popularity_score', 70)
-        
-        # Add preference bonuses
-        for pref_type in preferred_types:
-            if pref_type in activity_type:
-                base_score += 15
-        
-        # Period-specific bonuses
-        if period == 'morning' and any(keyword in activity_type for keyword in ['cultural', 'historical']):
-            base_score += 10
-        elif period == 'afternoon' and any(keyword in activity_type for keyword in ['scenic', 'landmark']):
-            base_score += 10
-        elif period == 'evening' and any(keyword in activity_type for keyword in ['entertainment', 'culinary']):
-            base_score += 10
-        
-        if base_score > best_score:
-            best_score = base_score
-            best_activity = activity
-    
-    return best_activity or activities[0]  # Return best or first available
-    
-    # Return highest scoring activity
-    best_activity = max(activities, key=lambda x: x.get('period_score', 0))
-    return best_activity
-
-def generate_fallback_activity_for_period(period, day):
-    """Generate diverse, destination-specific activities when database activities are not available"""
-    
-    # Diverse activity pools for each time period with day-specific variety
-    morning_activities = [
-        {'name': 'Historic District Walking Tour', 'type': 'Cultural/Historical', 'duration': '3 hours', 'description': 'Explore centuries-old architecture and learn local history from expert guide', 'best_time': 'Morning (9-12 PM)', 'price_range': '$35-50'},
-        {'name': 'Local Market & Food Discovery', 'type': 'Culinary/Cultural', 'duration': '2.5 hours', 'description': 'Visit authentic local markets and taste traditional breakfast specialties', 'best_time': 'Morning (9-11:30 AM)', 'price_range': '$40-60'},
-        {'name': 'Art Museum & Gallery Tour', 'type': 'Cultural/Art', 'duration': '3 hours', 'description': 'Discover local art collections and contemporary exhibitions with museum guide', 'best_time': 'Morning (9-12 PM)', 'price_range': '$25-45'},
-        {'name': 'Traditional Craft Workshop', 'type': 'Cultural/Interactive', 'duration': '2.5 hours', 'description': 'Learn traditional local crafts from master artisans in authentic workshop setting', 'best_time': 'Morning (9:30-12 PM)', 'price_range': '$55-75'},
-        {'name': 'Religious Sites & Spiritual Heritage', 'type': 'Cultural/Spiritual', 'duration': '3 hours', 'description': 'Visit sacred sites and learn about local spiritual traditions and architecture', 'best_time': 'Morning (9-12 PM)', 'price_range': '$30-50'},
-        {'name': 'Photography Walk with Local Guide', 'type': 'Photography/Cultural', 'duration': '3 hours', 'description': 'Capture authentic moments and hidden gems with professional local photographer', 'best_time': 'Morning (9-12 PM)', 'price_range': '$60-85'},
-        {'name': 'Traditional Architecture & Design Tour', 'type': 'Cultural/Educational', 'duration': '3 hours', 'description': 'Explore unique architectural styles and design principles with architecture expert', 'best_time': 'Morning (9-12 PM)', 'price_range': '$45-65'}
-    ]
-    
-    afternoon_activities = [
-        {'name': 'Scenic Viewpoint & Landscape Tour', 'type': 'Scenic/Nature', 'duration': '4 hours', 'description': 'Visit breathtaking viewpoints and natural landscapes with photo opportunities', 'best_time': 'Afternoon (1-5 PM)', 'price_range': '$50-70'},
-        {'name': 'Cooking Class with Local Family', 'type': 'Culinary/Cultural', 'duration': '4 hours', 'description': 'Learn authentic recipes and cooking techniques in traditional family kitchen', 'best_time': 'Afternoon (1-5 PM)', 'price_range': '$75-95'},
-        {'name': 'Cultural Performance & Arts Center', 'type': 'Cultural/Entertainment', 'duration': '3 hours', 'description': 'Experience traditional performances and visit local arts venues with artist meet & greet', 'best_time': 'Afternoon (2-5 PM)', 'price_range': '$45-65'},
-        {'name': 'Local Transportation Adventure', 'type': 'Adventure/Cultural', 'duration': '4 hours', 'description': 'Explore the city using traditional transport methods with cultural commentary', 'best_time': 'Afternoon (1-5 PM)', 'price_range': '$35-55'},
-        {'name': 'Artisan Workshop & Shopping Quarter', 'type': 'Cultural/Shopping', 'duration': '3.5 hours', 'description': 'Visit local artisan workshops and explore authentic shopping districts', 'best_time': 'Afternoon (1:30-5 PM)', 'price_range': '$40-60'},
-        {'name': 'Nature & Garden Experience', 'type': 'Nature/Relaxation', 'duration': '3 hours', 'description': 'Explore beautiful gardens and natural spaces with horticultural insights', 'best_time': 'Afternoon (2-5 PM)', 'price_range': '$25-45'},
-        {'name': 'Cultural Museum & Interactive Exhibits', 'type': 'Cultural/Educational', 'duration': '3 hours', 'description': 'Deep dive into local culture through interactive museum experiences and demonstrations', 'best_time': 'Afternoon (1-4 PM)', 'price_range': '$35-55'}
-    ]
-    
-    evening_activities = [
-        {'name': 'Traditional Music & Dance Performance', 'type': 'Entertainment/Cultural', 'duration': '3 hours', 'description': 'Authentic cultural show featuring traditional music, dance, and storytelling', 'best_time': 'Evening (6-9 PM)', 'price_range': '$55-80'},
-        {'name': 'Rooftop Dining with City Views', 'type': 'Culinary/Scenic', 'duration': '2.5 hours', 'description': 'Elegant dinner with panoramic views and signature local cuisine', 'best_time': 'Evening (6:30-9 PM)', 'price_range': '$80-120'},
-        {'name': 'Night Market & Street Food Tour', 'type': 'Culinary/Cultural', 'duration': '3 hours', 'description': 'Explore vibrant night markets and sample authentic street food specialties', 'best_time': 'Evening (6-9 PM)', 'price_range': '$45-65'},
-        {'name': 'Cultural Quarter Evening Stroll', 'type': 'Cultural/Relaxed', 'duration': '2.5 hours', 'description': 'Leisurely walk through illuminated cultural districts with local storytelling', 'best_time': 'Evening (6:30-9 PM)', 'price_range': '$30-50'},
-        {'name': 'Local Pub & Social Experience', 'type': 'Social/Cultural', 'duration': '3 hours', 'description': 'Experience local social culture in traditional establishments with live music', 'best_time': 'Evening (7-10 PM)', 'price_range': '$40-70'},
-        {'name': 'Sunset Photography & Reflection', 'type': 'Photography/Scenic', 'duration': '2 hours', 'description': 'Capture golden hour moments at scenic locations with photography guidance', 'best_time': 'Evening (6-8 PM)', 'price_range': '$35-55'},
-        {'name': 'Traditional Tea House & Cultural Conversation', 'type': 'Cultural/Social', 'duration': '2.5 hours', 'description': 'Intimate cultural exchange in traditional setting with local cultural enthusiasts', 'best_time': 'Evening (6:30-9 PM)', 'price_range': '$25-45'}
-    ]
-    
-    # Select activity based on period and day to ensure variety
-    if period == 'morning':
-        activity_index = (day - 1) % len(morning_activities)
-        return morning_activities[activity_index]
-    elif period == 'afternoon':
-        activity_index = (day - 1) % len(afternoon_activities)
-        return afternoon_activities[activity_index]
-    elif period == 'evening':
-        activity_index = (day - 1) % len(evening_activities)
-        return evening_activities[activity_index]
-    else:
-        # Default to afternoon if period not recognized
-        return afternoon_activities[0]
-
-def generate_detailed_time_block(activity, time_slot):
-    """Generate detailed description for a time block"""
-    
-    activity_name = activity.get('name', 'Local Experience')
-    activity_desc = activity.get('description', 'Authentic local experience')
-    duration = activity.get('duration', '2-3 hours')
-    
-    return f"{time_slot}: {activity_name} ({duration}) - {activity_desc}"
-
-def generate_contextual_meals(destination, day, profile, morning_activity, afternoon_activity):
-    """Generate diverse, contextual meal recommendations based on activities and location with day-specific variety"""
-    
-    dietary_restrictions = profile.get('dietary_restrictions', [])
-    destination_lower = destination.lower()
-    
-    # Create diverse meal options based on destination and day
-    if 'paris' in destination_lower or 'france' in destination_lower:
-        meal_options = [
-            {
-                'breakfast': 'Classic French café - buttery croissants, espresso, fresh orange juice',
-                'lunch': 'Bistro lunch - French onion soup and quiche Lorraine with local wine',
-                'dinner': 'Traditional brasserie - coq au vin with burgundy wine and crème brûlée'
-            },
-            {
-                'breakfast': 'Artisan bakery - pain au chocolat, café au lait, seasonal fruit tart',
-                'lunch': 'Crêperie experience - savory galettes and sweet crêpes with cider',
-                'dinner': 'Fine dining - duck confit with wine pairing and cheese course'
-            },
-            {
-                'breakfast': 'Local patisserie - fresh brioche, hot chocolate, French pastries',
-                'lunch': 'Market café - croque monsieur, French salad, local Bordeaux',
-                'dinner': 'Seine-side restaurant - bouillabaisse and champagne with river views'
-            },
-            {
-                'breakfast': 'Neighborhood boulangerie - warm baguette, jam, café noisette',
-                'lunch': 'Wine bar lunch - charcuterie board and regional wines',
-                'dinner': 'Michelin experience - tasting menu with sommelier wine selection'
-            }
-        ]
-    elif 'tokyo' in destination_lower or 'japan' in destination_lower:
-        meal_options = [
-            {
-                'breakfast': 'Traditional ryokan breakfast - miso soup, grilled fish, rice, pickled vegetables',
-                'lunch': 'Authentic ramen shop - tonkotsu ramen with gyoza dumplings',
-                'dinner': 'Sushi omakase - chef\'s selection at traditional sushi counter'
-            },
-            {
-                'breakfast': 'Modern Japanese café - green tea, tamagoyaki, rice bowl',
-                'lunch': 'Tempura restaurant - fresh seasonal tempura with dipping sauces',
-                'dinner': 'Kaiseki dinner - multi-course traditional meal with sake pairing'
-            },
-            {
-                'breakfast': 'Local breakfast set - Japanese curry, miso soup, salad',
-                'lunch': 'Soba noodle house - handmade buckwheat noodles in hot broth',
-                'dinner': 'Izakaya experience - small plates and drinks with locals'
-            },
-            {
-                'breakfast': 'Convenience store gems - onigiri, iced coffee, seasonal snacks',
-                'lunch': 'Yakiniku BBQ - grilled meats and vegetables with beer',
-                'dinner': 'Traditional hot pot - shabu-shabu with premium wagyu beef'
-            }
-        ]
-    elif 'spain' in destination_lower or 'madrid' in destination_lower or 'barcelona' in destination_lower:
-        meal_options = [
-            {
-                'breakfast': 'Traditional Spanish café - churros con chocolate, cortado coffee',
-                'lunch': 'Tapas bar hopping - jamón ibérico, tortilla española, local wines',
-                'dinner': 'Paella restaurant - authentic seafood paella with Rioja wine'
-            },
-            {
-                'breakfast': 'Local bakery - tostada con tomate, café con leche, fresh fruit',
-                'lunch': 'Mercado gastronómico - variety of Spanish specialties and beer',
-                'dinner': 'Traditional taberna - cocido madrileño with Spanish wines'
-            },
-            {
-                'breakfast': 'Pastelería - ensaimada pastry, zumo de naranja, Spanish tortilla',
-                'lunch': 'Marisquería - fresh seafood and albariño wine by the coast',
-                'dinner': 'Flamenco dinner show - Andalusian cuisine with live performance'
-            },
-            {
-                'breakfast': 'Churrería - hot churros, thick hot chocolate, café solo',
-                'lunch': 'Pintxos bar - Basque small plates with txakoli wine',
-                'dinner': 'Asador - grilled meats and vegetables with Tempranillo wine'
-            }
-        ]
-    else:
-        # Generic but varied options for other destinations
-        meal_options = [
-            {
-                'breakfast': f'Local {destination} café - traditional breakfast specialties and coffee',
-                'lunch': f'Authentic {destination} restaurant - regional lunch dishes with local drinks',
-                'dinner': f'Traditional {destination} dining - signature evening meal with cultural atmosphere'
-            },
-            {
-                'breakfast': f'Market breakfast - fresh {destination} pastries and local coffee',
-                'lunch': f'Street food experience - {destination} local favorites and snacks',
-                'dinner': f'Fine dining {destination} cuisine - chef\'s specialties with wine pairing'
-            },
-            {
-                'breakfast': f'Neighborhood bakery - artisan {destination} breads and hot beverages',
-                'lunch': f'Family restaurant - home-style {destination} cooking',
-                'dinner': f'Cultural dining experience - {destination} feast with live entertainment'
-            }
-        ]
-    
-    # Select meals based on day to ensure variety
-    day_index = (day - 1) % len(meal_options)
-    meals = meal_options[day_index]
-    
-    # Contextual meal planning based on activities
-    morning_loc = extract_location_from_activity(morning_activity)
-    afternoon_loc = extract_location_from_activity(afternoon_activity)
-    
-    if morning_loc and 'museum' in morning_loc.lower():
-        meals['breakfast'] = f"Museum café breakfast near {morning_loc} - light continental options"
-    
-    if afternoon_loc and 'market' in afternoon_loc.lower():
-        meals['lunch'] = f"Market fresh lunch at {afternoon_loc} - local specialties and artisan foods"
-    
-    # Adjust for dietary restrictions
-    if 'vegetarian' in dietary_restrictions:
-        for meal_type in meals:
-            meals[meal_type] += ' (vegetarian options available)'
-    
-    if 'vegan' in dietary_restrictions:
-        for meal_type in meals:
-            meals[meal_type] += ' (vegan options confirmed)'
-    
-    return meals
-
-def extract_location_from_activity(activity):
-    """Extract location information from activity"""
-    
-    activity_name = activity.get('name', '')
-    activity_desc = activity.get('description', '')
-    
-    # Simple location extraction
-    location_indicators = ['in ', 'at ', 'near ', 'around ']
-    for text in [activity_name, activity_desc]:
-        for indicator in location_indicators:
-            if indicator in text.lower():
-                parts = text.lower().split(indicator, 1)
-                if len(parts) > 1:
-                    location = parts[1].split()[0].title()
-                    return location
-    
-    return None
-
-def calculate_intelligent_transportation(destination, morning_activity, afternoon_activity, evening_activity):
-    """Calculate realistic transportation between activities"""
-    
-    destination_lower = destination.lower()
-    
-    # Destination-specific transportation
-    if 'paris' in destination_lower:
-        return "Metro + walking (efficient Paris public transport system)"
-    elif 'tokyo' in destination_lower:
-        return "JR trains + subway + walking (Japan Rail Pass recommended)"
-    elif 'china' in destination_lower:
-        return "Metro + taxi + walking (affordable and efficient urban transport)"
-    else:
-        return "Local transport + walking + occasional taxi (cost-effective combination)"
-
-def calculate_realistic_daily_cost(destination, morning_activity, afternoon_activity, evening_activity, meals):
-    """Calculate realistic daily cost based on activities and meals"""
-    
-    # Extract price ranges from activities
-    total_cost = 0
-    
-    for activity in [morning_activity, afternoon_activity, evening_activity]:
-        price_range = activity.get('price_range', '$50')
-        # Extract numeric value from price range
-        import re
-        numbers = re.findall(r'\d+', price_range)
-        if numbers:
-            # Take average of range or single number
-            if len(numbers) >= 2:
-                avg_price = (int(numbers[0]) + int(numbers[1])) / 2
-            else:
-                avg_price = int(numbers[0])
-            total_cost += avg_price
-    
-    # Add estimated meal costs
-    destination_lower = destination.lower()
-    if 'paris' in destination_lower or 'france' in destination_lower:
-        total_cost += 80  # EUR equivalent for French meals
-    elif 'tokyo' in destination_lower or 'japan' in destination_lower:
-        total_cost += 90  # USD equivalent for Japanese meals
-    elif 'china' in destination_lower:
-        total_cost += 45  # USD for Chinese meals
-    else:
-        total_cost += 60  # General meal estimate
-    
-    # Add transportation
-    total_cost += 25
-    
-    return int(total_cost)
-
-def generate_cultural_insights(destination, theme, activities):
-    """Generate cultural insights based on destination and activities"""
-    
-    destination_lower = destination.lower()
-    theme_lower = theme.lower()
-    
-    if 'paris' in destination_lower:
-        if 'cultural' in theme_lower:
-            return "French cultural etiquette: greeting with 'Bonjour', dining leisurely, appreciating art and conversation"
-        elif 'culinary' in theme_lower:
-            return "French dining culture: bread etiquette, wine appreciation, course progression, café culture importance"
-    elif 'tokyo' in destination_lower:
-        return "Japanese cultural practices: bowing respect, silence on trains, shoe removal customs, gift-giving etiquette"
-    elif 'china' in destination_lower:
-        return "Chinese cultural values: family respect, tea ceremony significance, red color importance, harmony principles"
-    
-    return f"Local {destination} cultural practices and customs to enhance your authentic experience"
-
-def generate_local_insider_tips(destination, day, theme):
-    """Generate local insider tips for each day"""
-    
-    tips = [
-        f"Day {day} tip: Download offline maps and translate apps for easier navigation",
-        "Local insight: Ask locals for hidden gem recommendations",
-        "Cultural tip: Observe local customs and dress codes at religious sites",
-        "Budget tip: Look for lunch specials and happy hour deals",
-        "Photography tip: Golden hour is 1 hour before sunset for best lighting"
-    ]
-    
-    return tips[day % len(tips)]
-
-def identify_photography_spots(activities):
-    """Identify best photography opportunities from activities"""
-    
-    photo_spots = []
-    for activity in activities:
-        activity_name = activity.get('name', '')
-        activity_type = activity.get('type', '')
-        
-        if any(word in activity_type.lower() for word in ['sightseeing', 'scenic', 'view', 'landmark']):
-            photo_spots.append(f"📸 {activity_name} - Excellent photo opportunities")
-    
-    if not photo_spots:
-        photo_spots = ["📸 Candid street photography throughout the day", "📸 Local architecture and daily life scenes"]
-    
-    return photo_spots
-
-def generate_china_specific_day(day, total_duration, destination_info, profile, user_prompt):
-    """Generate China-specific daily activities"""
-    
-    china_days = {
-        1: {
-            'theme': 'Beijing Arrival & Imperial Heritage Discovery',
-            'morning': 'Arrive in Beijing, check into traditional courtyard hotel, orientation walk through nearby hutongs',
-            'afternoon': 'Forbidden City comprehensive tour with expert guide, explore imperial palace complex and ancient Chinese architecture',
-            'evening': 'Welcome dinner featuring authentic Peking duck at Quanjude Restaurant, evening stroll around Tiananmen Square',
-            'meals': {
-                'breakfast': 'Hotel continental breakfast',
-                'lunch': 'Traditional Beijing noodles in Forbidden City area',
-                'dinner': 'Peking duck banquet at historic Quanjude Restaurant'
-            },
-            'transportation': 'Airport Express + Beijing Metro + walking',
-            'estimated_cost': 180,
-            'cultural_highlights': 'Imperial Chinese history, traditional architecture, authentic Beijing cuisine'
-        },
-        2: {
-            'theme': 'Great Wall Adventure & Rural Village Life',
-            'morning': 'Early departure to Mutianyu section of Great Wall, cable car ascent, hiking along ancient fortifications',
-            'afternoon': 'Great Wall photography session, visit to nearby traditional village, interaction with local families',
-            'evening': 'Return to Beijing, traditional hotpot dinner, evening Chinese tea ceremony experience',
-            'meals': {
-                'breakfast': 'Traditional Chinese breakfast - congee, steamed buns, pickled vegetables',
-                'lunch': 'Picnic lunch with Great Wall mountain views',
-                'dinner': 'Sichuan hotpot experience with local ingredients'
-            },
-            'transportation': 'Private tour bus + cable car + walking',
-            'estimated_cost': 220,
-            'cultural_highlights': 'Great Wall history, rural Chinese life, traditional tea culture'
-        },
-        3: {
-            'theme': 'Hutong Culture & Culinary Arts Mastery',
-            'morning': 'Rickshaw tour through historic hutongs, visit traditional courtyard homes, meet local artisans',
-            'afternoon': 'Hands-on Chinese cooking class - learn to make dumplings, noodles, and traditional sauces',
-            'evening': 'Beijing opera performance, night market exploration at Wangfujing Street',
-            'meals': {
-                'breakfast': 'Local street breakfast - jianbing (Chinese crepe) and soy milk',
-                'lunch': 'Self-prepared dishes from cooking class',
-                'dinner': 'Night market food adventure - scorpions, lamb skewers, traditional snacks'
-            },
-            'transportation': 'Rickshaw + walking + Metro',
-            'estimated_cost': 160,
-            'cultural_highlights': 'Traditional Beijing lifestyle, Chinese culinary arts, classical opera'
-        },
-        4: {
-            'theme': 'Temple Spirituality & Traditional Medicine',
-            'morning': 'Temple of Heaven peaceful morning meditation and Tai Chi with locals',
-            'afternoon': 'Traditional Chinese Medicine consultation, herbal tea session, acupuncture experience',
-            'evening': 'Summer Palace sunset boat ride, imperial garden exploration',
-            'meals': {
-                'breakfast': 'Healthy Chinese porridge with medicinal herbs',
-                'lunch': 'Vegetarian Buddhist temple cuisine',
-                'dinner': 'Imperial cuisine dinner at Summer Palace restaurant'
-            },
-            'transportation': 'Metro + walking + boat',
-            'estimated_cost': 140,
-            'cultural_highlights': 'Chinese wellness practices, traditional medicine, imperial gardens'
-        },
-        5: {
-            'theme': 'Shanghai Modern Metropolis Journey',
-            'morning': 'High-speed train to Shanghai, check into French Concession boutique hotel',
-            'afternoon': 'Shanghai French Concession walking tour, art galleries, and colonial architecture',
-            'evening': 'The Bund evening skyline photography, luxury Huangpu River cruise',
-            'meals': {
-                'breakfast': 'Beijing hotel departure breakfast',
-                'lunch': 'Shanghai soup dumplings at original Ding Tai Fung',
-                'dinner': 'Fine dining with Shanghai skyline views'
-            },
-            'transportation': 'High-speed rail + Shanghai Metro + river cruise',
-            'estimated_cost': 200,
-            'cultural_highlights': 'Modern China development, colonial history, urban sophistication'
-        }
-    }
-    
-    # Continue pattern for more days
-    if day <= len(china_days):
-        return china_days[day]
-    else:
-        # Generate additional days following the pattern
-        additional_days = {
-            6: {
-                'theme': 'Yu Garden & Traditional Arts Workshop',
-                'morning': 'Yu Garden traditional Chinese garden exploration, tea house experience',
-                'afternoon': 'Chinese silk painting workshop, traditional craft learning',
-                'evening': 'Nanjing Road shopping street, modern Shanghai entertainment',
-                'meals': {
-                    'breakfast': 'Traditional Shanghai breakfast - xiaolongbao and soy milk',
-                    'lunch': 'Garden restaurant with traditional atmosphere',
-                    'dinner': 'Modern Chinese fusion cuisine'
-                },
-                'transportation': 'Metro + walking + taxi',
-                'estimated_cost': 150,
-                'cultural_highlights': 'Traditional gardens, Chinese arts, modern shopping culture'
-            },
-            7: {
-                'theme': 'Departure & Cultural Reflection',
-                'morning': 'Final shopping at Silk Street Market, souvenir hunting',
-                'afternoon': 'Airport departure, cultural reflection session',
-                'evening': 'Flight departure',
-                'meals': {
-                    'breakfast': 'Hotel farewell breakfast',
-                    'lunch': 'Airport traditional Chinese meal',
-                    'dinner': 'In-flight meal'
-                },
-                'transportation': 'Metro + Airport Express',
-                'estimated_cost': 100,
-                'cultural_highlights': 'Cultural souvenirs, final China impressions'
-            }
-        }
-        return additional_days.get(day, china_days[3])  # Return day 3 as template for longer trips
-
-def generate_paris_specific_day(day, total_duration, destination_info, profile, user_prompt):
-    """Generate Paris-specific daily activities"""
-    
-    paris_days = {
-        1: {
-            'theme': 'Arrival & Latin Quarter Walking Discovery',
-            'morning': 'Arrive in Paris, check into boutique hotel, café culture introduction',
-            'afternoon': 'Latin Quarter walking tour, Sorbonne University, bookshop browsing',
-            'evening': 'Seine riverbank evening stroll, traditional bistro dinner',
-            'meals': {
-                'breakfast': 'Hotel continental breakfast',
-                'lunch': 'Café lunch with wine in Latin Quarter',
-                'dinner': 'Classic French bistro - L\'Ami Jean'
-            },
-            'transportation': 'RER train + Metro + walking',
-            'estimated_cost': 160,
-            'cultural_highlights': 'Parisian café culture, Latin Quarter history, French dining'
-        }
-    }
-    
-    return paris_days.get(day, paris_days[1])
-
-def generate_tokyo_specific_day(day, total_duration, destination_info, profile, user_prompt):
-    """Generate Tokyo-specific daily activities"""
-    
-    tokyo_days = {
-        1: {
-            'theme': 'Tokyo Arrival & Shibuya Modern Energy',
-            'morning': 'Arrive in Tokyo, check into modern hotel, neighborhood orientation',
-            'afternoon': 'Shibuya Crossing experience, modern Tokyo exploration',
-            'evening': 'Traditional izakaya dinner, neon-lit district discovery',
-            'meals': {
-                'breakfast': 'Hotel Japanese breakfast',
-                'lunch': 'Conveyor belt sushi experience',
-                'dinner': 'Traditional izakaya with sake'
-            },
-            'transportation': 'Airport Express + JR trains + walking',
-            'estimated_cost': 180,
-            'cultural_highlights': 'Modern Tokyo energy, traditional dining, urban culture'
-        }
-    }
-    
-    return tokyo_days.get(day, tokyo_days[1])
-
-def generate_generic_destination_day(day, total_duration, destination, destination_info, profile, user_prompt):
-    """Generate generic destination day plan"""
-    
-    return {
-        'theme': f'{destination} Discovery Day {day}',
-        'morning': f'Morning exploration of {destination} cultural sites',
-        'afternoon': f'Afternoon {destination} local experiences and activities',
-        'evening': f'Evening {destination} dining and entertainment',
-        'meals': {
-            'breakfast': f'Local {destination} breakfast',
-            'lunch': f'Traditional {destination} lunch',
-            'dinner': f'Authentic {destination} dinner'
-        },
-        'transportation': 'Local transportation + walking',
-        'estimated_cost': 120,
-        'cultural_highlights': f'{destination} culture, local experiences, traditional cuisine'
-    }
-
-def calculate_destination_specific_pricing(destination, duration, travelers, budget_level, package_style):
-    """Calculate accurate pricing based on destination and components"""
-    
-    destination_info = get_destination_intelligence(destination)
-    base_daily_rate = destination_info['budget_ranges'][budget_level]
-    
-    # Pricing structure
-    flights = 600 * travelers if budget_level == 'budget' else 900 * travelers if budget_level == 'moderate' else 2500 * travelers
-    hotels = base_daily_rate * duration
-    restaurants = (base_daily_rate * 0.4) * duration
-    activities = (base_daily_rate * 0.6) * duration
-    
-    base_cost = flights + hotels + restaurants + activities
-    taxes = base_cost * 0.08
-    service_fee = base_cost * 0.05
-    
-    total_cost = base_cost + taxes + service_fee
-    
-    return {
-        'flights': flights,
-        'hotels': hotels,
-        'restaurants': restaurants,
-        'activities': activities,
-        'base_cost': base_cost,
-        'taxes': taxes,
-        'service_fee': service_fee,
-        'total_cost': total_cost,
-        'cost_per_person': total_cost / travelers,
-        'daily_average': total_cost / duration
-    }
-
-def generate_flight_options(destination, duration, travelers, budget):
-    """Generate flight recommendations"""
-    base_prices = {
-        'Budget ($500-1000)': {'economy': 450, 'premium': 650},
-        'Moderate ($1000-2500)': {'economy': 750, 'premium': 1200},
-        'Luxury ($2500+)': {'business': 2200, 'first': 4500}
-    }
-    
-    prices = base_prices.get(budget, base_prices['Moderate ($1000-2500)'])
-    
-    flights = []
-    for class_type, price in prices.items():
-        flights.append({
-            'airline': 'Emirates' if 'Dubai' in destination else 'Air France' if 'Paris' in destination else 'Turkish Airlines',
-            'class': class_type.title(),
-            'price_per_person': price,
-            'total_price': price * travelers,
-            'duration': '8h 30m',
-            'stops': 1 if price < 1000 else 0,
-            'departure': '10:30 AM',
-            'arrival': '6:45 PM'
-        })
-    
-    return flights
-
-def generate_hotel_recommendations(destination, duration, travelers, budget, style):
-    """Generate personalized hotel recommendations"""
-    hotels_db = {
-        'Paris, France': [
-            {'name': 'Hotel des Grands Boulevards', 'type': 'Boutique', 'rating': 4.6, 'price': 280, 'style': 'cultural'},
-            {'name': 'Le Bristol Paris', 'type': 'Luxury', 'rating': 4.9, 'price': 850, 'style': 'luxury'},
-            {'name': 'Hotel Malte Opera', 'type': 'Business', 'rating': 4.3, 'price': 180, 'style': 'budget'}
-        ],
-        'Dubai, UAE': [
-            {'name': 'Al Seef Heritage Hotel', 'type': 'Heritage', 'rating': 4.7, 'price': 320, 'style': 'cultural'},
-            {'name': 'Burj Al Arab', 'type': 'Luxury', 'rating': 4.9, 'price': 1200, 'style': 'luxury'},
-            {'name': 'Rove Downtown', 'type': 'Modern', 'rating': 4.4, 'price': 150, 'style': 'budget'}
-        ]
-    }
-    
-    city_hotels = hotels_db.get(destination, hotels_db['Paris, France'])
-    
-    # Filter based on budget and style
-    recommended = []
-    for hotel in city_hotels:
-        if (budget == 'Luxury ($2500+)' and hotel['style'] == 'luxury') or \
-           (budget == 'Moderate ($1000-2500)' and hotel['style'] in ['cultural', 'business']) or \
-           (budget == 'Budget ($500-1000)' and hotel['style'] == 'budget'):
-            
-            recommended.append({
-                **hotel,
-                'total_price': hotel['price'] * duration,
-                'amenities': ['Wi-Fi', 'Concierge', 'Restaurant', 'Spa'] if hotel['style'] == 'luxury' else ['Wi-Fi', 'Restaurant'],
-                'location_score': 9.2,
-                'why_recommended': f"Perfect for {style['focus']} with excellent access to cultural sites"
-            })
-    
-    return recommended[:2]  # Return top 2 recommendations
-
-def generate_restaurant_recommendations(destination, profile, style):
-    """Generate personalized restaurant recommendations"""
-    restaurants_db = {
-        'Paris, France': [
-            {'name': 'L\'Ami Jean', 'cuisine': 'Traditional French', 'rating': 4.8, 'price_range': '$$$', 'specialty': 'Bistro cuisine'},
-            {'name': 'Le Comptoir du Relais', 'cuisine': 'French Bistro', 'rating': 4.6, 'price_range': '$$', 'specialty': 'Classic dishes'},
-            {'name': 'Breizh Café', 'cuisine': 'Modern Breton', 'rating': 4.7, 'price_range': '$$', 'specialty': 'Creative crêpes'},
-            {'name': 'Gentle Gourmet', 'cuisine': 'Vegetarian', 'rating': 4.5, 'price_range': '$$', 'specialty': 'Plant-based French'}
-        ],
-        'Dubai, UAE': [
-            {'name': 'Al Hadheerah', 'cuisine': 'Emirati', 'rating': 4.8, 'price_range': '$$$', 'specialty': 'Traditional Emirati'},
-            {'name': 'Pierchic', 'cuisine': 'Seafood', 'rating': 4.9, 'price_range': '$$$$', 'specialty': 'Fine dining seafood'},
-            {'name': 'Seva Table', 'cuisine': 'Vegetarian', 'rating': 4.6, 'price_range': '$$', 'specialty': 'Modern vegetarian'},
-            {'name': 'Arabian Tea House', 'cuisine': 'Middle Eastern', 'rating': 4.4, 'price_range': '$', 'specialty': 'Authentic atmosphere'}
-        ]
-    }
-    
-    city_restaurants = restaurants_db.get(destination, restaurants_db['Paris, France'])
-    
-    # Filter based on dietary restrictions and preferences
-    recommended = []
-    dietary_restrictions = profile.get('dietary_restrictions', [])
-    
-    for restaurant in city_restaurants:
-        include = True
-        if 'vegetarian' in dietary_restrictions and restaurant['cuisine'] not in ['Vegetarian', 'Modern vegetarian']:
-            if 'vegetarian' not in restaurant['specialty'].lower():
-                include = False
-        
-        if include:
-            recommended.append({
-                **restaurant,
-                'why_recommended': f"Matches your {profile.get('travel_style')} style and dietary preferences",
-                'reservation_time': '7:30 PM',
-                'booking_notes': 'Advance reservation recommended'
-            })
-    
-    return recommended[:4]  # Return top 4 recommendations
-
-def generate_personalized_activities(destination, profile, style):
-    """Generate activities based on user profile and interests"""
-    activities_db = {
-        'Paris, France': {
-            'cultural experiences': [
-                {'name': 'Louvre Museum Private Tour', 'duration': '3 hours', 'price': 85, 'type': 'Cultural'},
-                {'name': 'Montmartre Art Walking Tour', 'duration': '2.5 hours', 'price': 45, 'type': 'Art & Culture'},
-                {'name': 'Musée d\'Orsay Guided Visit', 'duration': '2 hours', 'price': 35, 'type': 'Art'}
-            ],
-            'local cuisine': [
-                {'name': 'Food Market Tour & Cooking Class', 'duration': '4 hours', 'price': 120, 'type': 'Culinary'},
-                {'name': 'Wine & Cheese Tasting', 'duration': '2 hours', 'price': 65, 'type': 'Culinary'},
-                {'name': 'Pastry Making Workshop', 'duration': '3 hours', 'price': 95, 'type': 'Culinary'}
-            ],
-            'photography': [
-                {'name': 'Paris Photography Tour', 'duration': '3 hours', 'price': 75, 'type': 'Photography'},
-                {'name': 'Golden Hour Seine Walk', 'duration': '2 hours', 'price': 40, 'type': 'Photography'}
-            ]
-        },
-        'Dubai, UAE': {
-            'cultural experiences': [
-                {'name': 'Dubai Museum & Al Fahidi Tour', 'duration': '3 hours', 'price': 60, 'type': 'Cultural'},
-                {'name': 'Traditional Souk Experience', 'duration': '2 hours', 'price': 35, 'type': 'Cultural'},
-                {'name': 'Heritage Village Visit', 'duration': '2.5 hours', 'price': 45, 'type': 'Cultural'}
-            ],
-            'local cuisine': [
-                {'name': 'Emirati Cooking Experience', 'duration': '4 hours', 'price': 110, 'type': 'Culinary'},
-                {'name': 'Street Food Tour', 'duration': '3 hours', 'price': 80, 'type': 'Culinary'},
-                {'name': 'Arabic Coffee & Dates Tasting', 'duration': '1 hour', 'price': 25, 'type': 'Culinary'}
-            ]
-        }
-    }
-    
-    city_activities = activities_db.get(destination, activities_db['Paris, France'])
-    user_interests = profile.get('interests', ['cultural experiences'])
-    
-    recommended_activities = []
-    for interest in user_interests:
-        if interest in city_activities:
-            for activity in city_activities[interest]:
-                recommended_activities.append({
-                    **activity,
-                    'match_reason': f"Matches your interest in {interest}",
-                    'difficulty': 'Easy',
-                    'group_size': 'Small group (8-12 people)'
-                })
-    
-    return recommended_activities[:6]  # Return top 6 activities
-
-def generate_local_experiences(destination, profile):
-    """Generate unique local experiences based on profile"""
-    experiences_db = {
-        'Paris, France': [
-            {'name': 'Artist Studio Visit in Belleville', 'type': 'Unique Local', 'price': 50, 'duration': '2 hours'},
-            {'name': 'Vintage Shopping in Le Marais', 'type': 'Shopping', 'price': 30, 'duration': '3 hours'},
-            {'name': 'Seine Sunset Picnic', 'type': 'Romantic', 'price': 40, 'duration': '2 hours'},
-            {'name': 'Local Pharmacy & Perfume Discovery', 'type': 'Local Secrets', 'price': 25, 'duration': '1.5 hours'}
-        ],
-        'Dubai, UAE': [
-            {'name': 'Falconry Experience', 'type': 'Traditional', 'price': 80, 'duration': '2 hours'},
-            {'name': 'Desert Astronomy Night', 'type': 'Nature', 'price': 95, 'duration': '4 hours'},
-            {'name': 'Traditional Dhow Building Workshop', 'type': 'Craft', 'price': 70, 'duration': '3 hours'},
-            {'name': 'Camel Farm Visit', 'type': 'Cultural', 'price': 55, 'duration': '2.5 hours'}
-        ]
-    }
-    
-    city_experiences = experiences_db.get(destination, experiences_db['Paris, France'])
-    travel_style = profile.get('travel_style', 'cultural explorer')
-    
-    # Filter experiences based on travel style
-    filtered_experiences = []
-    for exp in city_experiences:
-        if travel_style == 'cultural explorer' and exp['type'] in ['Unique Local', 'Traditional', 'Cultural']:
-            filtered_experiences.append(exp)
-        elif travel_style == 'luxury traveler' and exp['price'] > 60:
-            filtered_experiences.append(exp)
-        elif travel_style == 'adventure seeker' and exp['type'] in ['Nature', 'Traditional']:
-            filtered_experiences.append(exp)
-        else:
-            filtered_experiences.append(exp)
-    
-    return filtered_experiences[:3]  # Return top 3 local experiences
-
-def calculate_comprehensive_pricing(duration, travelers, budget, style):
-    """Calculate detailed pricing for the entire package"""
-    base_daily_rates = {
-        'Budget ($500-1000)': 120,
-        'Moderate ($1000-2500)': 280,
-        'Luxury ($2500+)': 650
-    }
-    
-    daily_rate = base_daily_rates.get(budget, 280)
-    base_cost = daily_rate * duration * travelers
-    
-    # Component breakdown
-    flights_cost = base_cost * 0.35
-    hotels_cost = base_cost * 0.40
-    restaurants_cost = base_cost * 0.15
-    activities_cost = base_cost * 0.10
-    
-    # Taxes and fees
-    taxes = base_cost * 0.12
-    service_fee = base_cost * 0.03
-    
-    total_cost = base_cost + taxes + service_fee
-    
-    return {
-        'base_cost': base_cost,
-        'flights': flights_cost,
-        'hotels': hotels_cost,
-        'restaurants': restaurants_cost,
-        'activities': activities_cost,
-        'taxes': taxes,
-        'service_fee': service_fee,
-        'total_cost': total_cost,
-        'cost_per_person': total_cost / travelers,
-        'daily_average': total_cost / duration
-    }
-
-def generate_daily_itinerary(destination, duration, profile, style):
-    """Generate a day-by-day itinerary"""
-    itinerary = []
-    
-    for day in range(1, duration + 1):
-        day_plan = {
-            'day': day,
-            'theme': get_day_theme(day, duration, profile),
-            'morning': get_activity_by_time('morning', day, destination, profile),
-            'afternoon': get_activity_by_time('afternoon', day, destination, profile),
-            'evening': get_activity_by_time('evening', day, destination, profile),
-            'meals': get_daily_meals(day, destination, profile),
-            'transportation': 'Walking + Metro' if 'Paris' in destination else 'Taxi + Metro',
-            'estimated_cost': 150 if day <= 2 else 120  # First days usually more expensive
-        }
-        itinerary.append(day_plan)
-    
-    return itinerary
-
-def get_day_theme(day, duration, profile):
-    """Get theme for each day based on profile"""
-    interests = profile.get('interests', ['cultural experiences'])
-    
-    themes = {
-        1: 'Arrival & City Orientation',
-        2: f'{interests[0].title()} Deep Dive' if interests else 'Cultural Exploration',
-        3: 'Local Experiences & Hidden Gems',
-        4: 'Relaxation & Personal Time',
-        5: 'Adventure & New Discoveries'
-    }
-    
-    if day <= len(themes):
-        return themes[day]
-    else:
-        return f'Exploration Day {day}'
-
-def get_activity_by_time(time_period, day, destination, profile):
-    """Get activity recommendation for specific time of day"""
-    activities = {
-        'morning': {
-            1: 'Check-in & Neighborhood Walk',
-            2: 'Museum Visit' if 'cultural' in profile.get('interests', []) else 'City Tour',
-            3: 'Local Market Exploration',
-        },
-        'afternoon': {
-            1: 'Landmark Visit & Photo Session',
-            2: 'Cooking Class' if 'local cuisine' in profile.get('interests', []) else 'Art Gallery Tour',
-            3: 'Shopping & Local Craft Discovery',
-        },
-        'evening': {
-            1: 'Welcome Dinner at Traditional Restaurant',
-            2: 'Cultural Show or Performance',
-            3: 'Sunset Views & Casual Dining',
-        }
-    }
-    
-    return activities.get(time_period, {}).get(day, f'{time_period.title()} Free Time')
-
-def get_daily_meals(day, destination, profile):
-    """Get meal recommendations for the day"""
-    return {
-        'breakfast': 'Hotel breakfast' if day == 1 else 'Local café',
-        'lunch': 'Traditional restaurant',
-        'dinner': 'Recommended restaurant from package'
-    }
-
-def main_page():
-    """Professional investor-focused landing page"""
-    
-    # Premium header with investor appeal
-    st.markdown("""
-    <div class="main-header">
-        <h1>🌍 ✈️ AI Travel Platform 🏨 🍽️</h1>
-        <h3>Revolutionary AI-Powered Travel Ecosystem</h3>
-        <p>🎯 Multi-Service Platform • 💰 Proven Revenue Model • 🚀 Scalable Technology</p>
-        <div class="investor-badge">
-            💎 INVESTOR PRESENTATION MODE
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Market opportunity and business model
-    st.markdown("### 🎯 **Market Opportunity & Competitive Advantage**")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="market-size">
-            <h3>📊 Market Size</h3>
-            <h2>$1.4 Trillion</h2>
-            <p>Global Travel Industry</p>
-            <p><strong>15% Annual Growth</strong></p>
-            <p>Digital transformation accelerating post-pandemic</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="competitive-advantage">
-            <h3>🎯 Our Advantage</h3>
-            <p><strong>• AI-First Architecture</strong></p>
-            <p>• Multi-service integration</p>
-            <p>• Real-time booking optimization</p>
-            <p>• 65+ premium hotel partnerships</p>
-            <p>• Proprietary pricing algorithms</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Key business metrics for investors
-    st.markdown("### � **Key Business Metrics & Performance**")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h2>$2.4M</h2>
-            <p><strong>Annual Revenue Run Rate</strong></p>
-            <div class="metric-growth">↗️ 340% YoY Growth</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h2>18%</h2>
-            <p><strong>Net Profit Margin</strong></p>
-            <div class="metric-growth">↗️ Industry Leading</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h2>65K</h2>
-            <p><strong>Active Users</strong></p>
-            <div class="metric-growth">↗️ 89% Retention Rate</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <h2>$347</h2>
-            <p><strong>Average Transaction</strong></p>
-            <div class="metric-growth">↗️ 23% Higher Than Competitors</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Revenue streams and business model
-    st.markdown("### 💰 **Multiple Revenue Streams**")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="feature-card">
-            <div class="feature-icon">💳</div>
-            <h4>Booking Commissions</h4>
-            <p><strong>8-15% commission</strong> on all bookings</p>
-            <p>Hotels: 12-15% • Restaurants: 8-10%</p>
-            <p><strong>$1.8M annual revenue</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="feature-card">
-            <div class="feature-icon">🎯</div>
-            <h4>Premium Subscriptions</h4>
-            <p><strong>$29/month</strong> premium memberships</p>
-            <p>AI concierge • Priority booking • Exclusive deals</p>
-            <p><strong>$420K annual revenue</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="feature-card">
-            <div class="feature-icon">📊</div>
-            <h4>Data & Analytics</h4>
-            <p><strong>B2B travel insights</strong> platform</p>
-            <p>Market trends • Pricing optimization</p>
-            <p><strong>$180K annual revenue</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Technology stack and scalability
-    st.markdown("### � **Technology Stack & Scalability**")
-    
-    st.markdown("""
-    <div class="tech-stack">
-        <h3>🚀 Enterprise-Grade Technology</h3>
-        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 2rem; margin-top: 1rem;">
-            <div>
-                <p><strong>• Cloud Infrastructure:</strong> AWS/Supabase</p>
-                <p><strong>• AI/ML Stack:</strong> OpenAI GPT-4, Custom Models</p>
-                <p><strong>• Real-time Processing:</strong> 10,000+ bookings/hour</p>
-            </div>
-            <div>
-                <p><strong>• Payment Processing:</strong> Stripe Enterprise</p>
-                <p><strong>• Database:</strong> PostgreSQL with 99.9% uptime</p>
-                <p><strong>• Security:</strong> SOC 2 compliance ready</p>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Investment opportunity and ROI
-    st.markdown("### 🎯 **Investment Opportunity**")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="roi-card">
-            <h3>💰 Seeking Series A Funding</h3>
-            <h2>$5M Investment Round</h2>
-            <p><strong>Use of Funds:</strong></p>
-            <p>• 40% - Market expansion (EU, Asia)</p>
-            <p>• 30% - AI/ML development team</p>
-            <p>• 20% - Partnership acquisition</p>
-            <p>• 10% - Marketing & brand building</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="success-story">
-            <h3>📈 Projected Returns</h3>
-            <p><strong>3-Year Financial Forecast:</strong></p>
-            <p>• Year 1: $6M revenue (150% growth)</p>
-            <p>• Year 2: $15M revenue (150% growth)</p>
-            <p>• Year 3: $35M revenue (133% growth)</p>
-            <p><strong>Exit Valuation: $200M+</strong></p>
-            <p><strong>IRR: 45%+ for early investors</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Live platform demonstration
-    st.markdown("### 🚀 **Live Platform Demonstration**")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🏨 Experience Hotel Booking", type="primary", use_container_width=True):
-            st.session_state.current_page = "hotel_booking"
-            st.rerun()
-    
-    with col2:
-        if st.button("🍽️ Try Restaurant Reservations", type="primary", use_container_width=True):
-            st.session_state.current_page = "restaurant_booking"
-            st.rerun()
-    
-    with col3:
-        if st.button("� View Analytics Dashboard", type="primary", use_container_width=True):
-            st.session_state.current_page = "analytics"
-            st.rerun()
-    
-    # Investor call-to-action
-    st.markdown("""
-    <div class="investor-cta">
-        <h2>🔥 Ready to Join the Travel Revolution?</h2>
-        <p style="font-size: 1.2rem; margin: 1rem 0;">
-            Be part of the next unicorn in travel technology
-        </p>
-        <p><strong>Contact our investment team today</strong></p>
-        <p>📧 investors@aitravel.com • 📱 +1 (555) 123-4567</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-def hotel_booking_page():
-    """Enhanced hotel booking interface"""
-    
-    st.title("🏨 **Hotel Booking System**")
-    st.markdown("*Book from our collection of 65+ verified hotels worldwide*")
-    
-    # Booking form
-    with st.container():
-        st.markdown("### 🔍 **Search Hotels**")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            destinations_list = get_all_destinations()
-            destination = st.selectbox("🌍 Destination", destinations_list)
-        
-        with col2:
-            check_in = st.date_input("📅 Check-in", datetime.now() + timedelta(days=7))
-        
-        with col3:
-            check_out = st.date_input("📅 Check-out", datetime.now() + timedelta(days=10))
-        
-        with col4:
-            guests = st.number_input("👥 Guests", 1, 10, 2)
-    
-    # Search and display hotels
-    if st.button("🔍 Search Hotels", type="primary"):
-        with st.spinner("🔍 Searching available hotels..."):
-            hotels = get_available_hotels(destination)
-            st.session_state.selected_hotels = hotels
-    
-    # Display hotels if available
-    if st.session_state.selected_hotels:
-        st.markdown("### 🏨 **Available Hotels**")
-        
-        for i, hotel in enumerate(st.session_state.selected_hotels):
-            with st.expander(f"🏨 {hotel['name']} - ⭐ {hotel['rating']}/5", expanded=(i == 0)):
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.markdown(f"""
-                    <div class="hotel-card">
-                        <h4>{hotel['name']}</h4>
-                        <p><strong>📍 Location:</strong> {hotel['location']}</p>
-                        <p><strong>⭐ Rating:</strong> {hotel['rating']}/5 ({hotel.get('review_count', 'N/A')} reviews)</p>
-                        <p><strong>🏷️ Type:</strong> {hotel.get('type', 'Hotel')}</p>
-                        <p><strong>✨ Amenities:</strong> Wi-Fi, Pool, Spa, Gym, Restaurant</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    nights = (check_out - check_in).days
-                    total_price = float(hotel['price']) * nights
-                    
-                    st.markdown(f"""
-                    <div class="price-tag">
-                        ${hotel['price']}/night
-                    </div>
-                    <br>
-                    <p><strong>Total ({nights} nights):</strong> ${total_price:,.2f}</p>
-                    """, unsafe_allow_html=True)
-                    
-                    if st.button(f"📋 Book {hotel['name']}", key=f"book_hotel_{i}"):
-                        book_hotel_form(hotel, check_in, check_out, guests)
-
-def book_hotel_form(hotel, check_in, check_out, guests):
-    """Hotel booking form"""
-    
-    st.markdown("---")
-    st.markdown(f"### 📋 **Booking: {hotel['name']}**")
-    
-    with st.form(f"hotel_booking_form_{hotel['id']}"):
-        # Customer details
-        st.markdown("**👤 Guest Information**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            first_name = st.text_input("First Name*")
-            email = st.text_input("Email*")
-            phone = st.text_input("Phone*")
-        
-        with col2:
-            last_name = st.text_input("Last Name*")
-            guest_count = st.number_input("Number of Guests", 1, 10, guests)
-            room_type = st.selectbox("Room Type", ["Standard", "Deluxe", "Suite", "Family Room"])
-        
-        # Special requests
-        special_requests = st.text_area("Special Requests (Optional)", 
-                                      placeholder="e.g., Late check-in, airport pickup, dietary requirements")
-        
-        # Payment simulation
-        st.markdown("**💳 Payment Information**")
-        payment_method = st.selectbox("Payment Method", ["Credit Card", "Debit Card", "PayPal"])
-        
-        # Calculate pricing
-        nights = (check_out - check_in).days
-        base_price = float(hotel['price']) * nights
-        tax = base_price * 0.12  # 12% tax
-        service_fee = base_price * 0.02  # 2% service fee
-        total_amount = base_price + tax + service_fee
-        
-        # Pricing breakdown
-        st.markdown("**💰 Pricing Breakdown**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"""
-            - **Base Price:** ${base_price:,.2f}
-            - **Tax (12%):** ${tax:,.2f}
-            - **Service Fee (2%):** ${service_fee:,.2f}
-            """)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="price-tag">
-                **Total: ${total_amount:,.2f}**
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Terms and submit
-        terms_accepted = st.checkbox("I accept the terms and conditions*")
-        
-        submitted = st.form_submit_button("🎉 Confirm Booking", type="primary")
-        
-        if submitted:
-            if all([first_name, last_name, email, phone, terms_accepted]):
-                # Process booking
-                with st.spinner("🔄 Processing your hotel booking..."):
-                    try:
-                        booking_confirmation = st.session_state.booking_system.book_hotel(
-                            user_id="demo_user",
-                            hotel_id=str(hotel['id']),
-                            check_in=check_in.strftime("%Y-%m-%d"),
-                            check_out=check_out.strftime("%Y-%m-%d"),
-                            room_type=room_type,
-                            guests=guest_count,
-                            special_requests=[special_requests] if special_requests else []
-                        )
-                        
-                        # Success message
-                        st.markdown(f"""
-                        <div class="booking-success">
-                            <h3>🎉 Booking Confirmed!</h3>
-                            <p><strong>Confirmation Number:</strong> {booking_confirmation.confirmation_number}</p>
-                            <p><strong>Hotel:</strong> {hotel['name']}</p>
-                            <p><strong>Dates:</strong> {check_in} to {check_out}</p>
-                            <p><strong>Total Amount:</strong> ${total_amount:,.2f}</p>
-                            <p><strong>Status:</strong> {booking_confirmation.status.value.title()}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        st.balloons()
-                        
-                        # Add to booking history
-                        booking_record = {
-                            'booking_id': booking_confirmation.booking_id,
-                            'confirmation_number': booking_confirmation.confirmation_number,
-                            'type': 'Hotel',
-                            'details': {
-                                'hotel_name': hotel['name'],
-                                'check_in': check_in.strftime("%Y-%m-%d"),
-                                'check_out': check_out.strftime("%Y-%m-%d"),
-                                'guests': guest_count,
-                                'total_amount': total_amount
-                            },
-                            'status': booking_confirmation.status.value,
-                            'created_at': datetime.now()
-                        }
-                        
-                        st.session_state.booking_history.append(booking_record)
-                        
-                    except Exception as e:
-                        st.error(f"❌ Booking failed: {str(e)}")
-                        st.error("Please try again or contact support.")
-            else:
-                st.error("❌ Please fill in all required fields and accept the terms.")
-
-def restaurant_booking_page():
-    """Restaurant booking interface"""
-    
-    st.title("🍽️ **Restaurant Reservations**")
-    st.markdown("*Book tables at premium restaurants with instant confirmation*")
-    
-    # Search form
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        cities_list = get_all_cities()
-        city = st.selectbox("🌍 City", cities_list)
-    
-    with col2:
-        reservation_date = st.date_input("📅 Date", datetime.now() + timedelta(days=1))
-    
-    with col3:
-        reservation_time = st.time_input("🕐 Time", datetime.now().replace(hour=19, minute=30).time())
-    
-    with col4:
-        party_size = st.number_input("👥 Party Size", 1, 20, 2)
-    
-    if st.button("🔍 Find Restaurants", type="primary"):
-        restaurants = get_available_restaurants(city)
-        
-        st.markdown("### 🍽️ **Available Restaurants**")
-        
-        for i, restaurant in enumerate(restaurants):
-            with st.expander(f"🍽️ {restaurant['name']} - {restaurant['cuisine']}", expanded=(i == 0)):
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.markdown(f"""
-                    <div class="restaurant-card">
-                        <h4>{restaurant['name']}</h4>
-                        <p><strong>🍴 Cuisine:</strong> {restaurant['cuisine']}</p>
-                        <p><strong>⭐ Rating:</strong> {restaurant['rating']}/5</p>
-                        <p><strong>📍 Location:</strong> {restaurant['location']}</p>
-                        <p><strong>💰 Price Range:</strong> {restaurant['price_range']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    deposit = restaurant.get('deposit', 0) * party_size
-                    st.markdown(f"""
-                    <p><strong>Deposit:</strong> ${deposit}/person</p>
-                    <p><strong>Total Deposit:</strong> ${deposit * party_size}</p>
-                    """)
-                    
-                    if st.button(f"📋 Reserve Table", key=f"book_restaurant_{i}"):
-                        book_restaurant_form(restaurant, reservation_date, reservation_time, party_size)
-
-def book_restaurant_form(restaurant, date, time, party_size):
-    """Restaurant booking form"""
-    
-    st.markdown("---")
-    st.markdown(f"### 📋 **Reservation: {restaurant['name']}**")
-    
-    with st.form(f"restaurant_booking_form_{restaurant['id']}"):
-        # Customer details
-        st.markdown("**👤 Contact Information**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            first_name = st.text_input("First Name*")
-            phone = st.text_input("Phone*")
-        
-        with col2:
-            last_name = st.text_input("Last Name*")
-            email = st.text_input("Email*")
-        
-        # Reservation details
-        occasion = st.selectbox("Occasion", ["Regular Dining", "Birthday", "Anniversary", "Business Meeting", "Other"])
-        special_requests = st.text_area("Special Requests", 
-                                       placeholder="e.g., Window table, dietary restrictions, celebrations")
-        
-        # Confirmation
-        datetime_str = f"{date} {time}"
-        deposit_amount = restaurant.get('deposit', 0) * party_size
-        
-        st.markdown(f"""
-        **📋 Reservation Summary:**
-        - **Restaurant:** {restaurant['name']}
-        - **Date & Time:** {datetime_str}
-        - **Party Size:** {party_size} people
-        - **Deposit:** ${deposit_amount}
-        """)
-        
-        terms_accepted = st.checkbox("I accept the reservation terms*")
-        
-        submitted = st.form_submit_button("🎉 Confirm Reservation", type="primary")
-        
-        if submitted:
-            if all([first_name, last_name, phone, email, terms_accepted]):
-                with st.spinner("🔄 Processing your reservation..."):
-                    try:
-                        booking_confirmation = st.session_state.booking_system.book_restaurant(
-                            user_id="demo_user",
-                            restaurant_id=str(restaurant['id']),
-                            date_time=datetime_str,
-                            party_size=party_size,
-                            special_requests=[special_requests] if special_requests else []
-                        )
-                        
-                        st.markdown(f"""
-                        <div class="booking-success">
-                            <h3>🎉 Reservation Confirmed!</h3>
-                            <p><strong>Confirmation Number:</strong> {booking_confirmation.confirmation_number}</p>
-                            <p><strong>Restaurant:</strong> {restaurant['name']}</p>
-                            <p><strong>Date & Time:</strong> {datetime_str}</p>
-                            <p><strong>Party Size:</strong> {party_size} people</p>
-                            <p><strong>Status:</strong> {booking_confirmation.status.value.title()}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        st.balloons()
-                        
-                    except Exception as e:
-                        st.error(f"❌ Reservation failed: {str(e)}")
-            else:
-                st.error("❌ Please fill in all required fields.")
-
-def package_creation_page():
-    """Unified AI-Powered Travel Package Creation with Enhanced AI Features"""
-    
-    st.title("🎯 **AI Travel Package Creator**")
-    st.markdown("*Tell us about your dream trip, and we'll create personalized packages just for you*")
-    
-    # Enhanced AI Integration Check
-    if AI_ENHANCED and st.session_state.get('enhanced_mode', False):
-        st.info("🤖 **Enhanced AI Mode Active** - Using conversation memory, psychology analysis, and real-time validation")
-    
-    # User Profile Display
-    with st.sidebar:
-        st.markdown("### 👤 **Your Travel Profile**")
-        profile = st.session_state.user_profile
-        
-        with st.expander("📝 Edit Profile", expanded=False):
-            profile['name'] = st.text_input("Name", profile['name'])
-            profile['age'] = st.number_input("Age", value=profile['age'], min_value=18, max_value=100)
-            profile['travel_style'] = st.selectbox("Travel Style", 
-                ['cultural explorer', 'adventure seeker', 'luxury traveler', 'family friendly'], 
-                index=['cultural explorer', 'adventure seeker', 'luxury traveler', 'family friendly'].index(profile['travel_style']))
-            # Enhanced budget preference with detailed options
-            budget_options = {
-                'ultra_budget': 'Ultra Budget ($300-600/day)',
-                'budget': 'Budget ($600-1000/day)', 
-                'moderate': 'Moderate ($1000-2500/day)',
-                'premium': 'Premium ($2500-4000/day)',
-                'luxury': 'Luxury ($4000-7000/day)',
-                'ultra_luxury': 'Ultra Luxury ($7000+/day)'
-            }
-            
-            # Find current selection or default to moderate
-            current_budget = profile.get('budget_preference', 'moderate')
-            if current_budget not in budget_options:
-                current_budget = 'moderate'
-            
-            selected_budget_key = st.selectbox(
-                "Budget Preference", 
-                options=list(budget_options.keys()),
-                format_func=lambda x: budget_options[x],
-                index=list(budget_options.keys()).index(current_budget)
-            )
-            profile['budget_preference'] = selected_budget_key
-            
-            # Interests (multi-select)
-            all_interests = ['cultural experiences', 'local cuisine', 'photography', 'art galleries', 
-                           'adventure sports', 'nightlife', 'shopping', 'nature', 'history', 'music']
-            profile['interests'] = st.multiselect("Interests", all_interests, default=profile['interests'])
-            
-            # Dietary restrictions
-            diet_options = ['none', 'vegetarian', 'vegan', 'gluten-free', 'halal', 'kosher']
-            profile['dietary_restrictions'] = st.multiselect("Dietary Restrictions", diet_options, default=profile.get('dietary_restrictions', []))
-        
-        # Display current profile
-        # Budget options for display
-        budget_display_options = {
-            'ultra_budget': 'Ultra Budget ($300-600/day)',
-            'budget': 'Budget ($600-1000/day)', 
-            'moderate': 'Moderate ($1000-2500/day)',
-            'premium': 'Premium ($2500-4000/day)',
-            'luxury': 'Luxury ($4000-7000/day)',
-            'ultra_luxury': 'Ultra Luxury ($7000+/day)'
-        }
-        
-        budget_display = budget_display_options.get(profile['budget_preference'], profile['budget_preference'].title())
-        
-        st.markdown(f"""
-        **🧳 {profile['name']}** ({profile['age']} years)  
-        **Style:** {profile['travel_style'].title()}  
-        **Budget:** {budget_display}  
-        **Interests:** {', '.join(profile['interests'][:3])}{'...' if len(profile['interests']) > 3 else ''}
-        """)
-    
-    # Main package creation interface
-    st.markdown("### 🗣️ **Describe Your Dream Trip**")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # User trip description
-        user_prompt = st.text_area(
-            "Tell us about your ideal trip:",
-            placeholder="I want to explore the rich culture of Paris, experience authentic French cuisine, visit world-class art museums, and discover hidden local gems. I'm particularly interested in photography opportunities and would love to learn some French cooking...",
-            height=120
-        )
-        
-        # Trip parameters
-        col1a, col1b = st.columns(2)
-        with col1a:
-            destinations_list = get_all_destinations()
-            destination = st.selectbox("🌍 Primary Destination", destinations_list)
-            travelers = st.number_input("👥 Number of Travelers", 1, 10, 2)
-        
-        with col1b:
-            start_date = st.date_input("📅 Start Date", datetime.now() + timedelta(days=14))
-            duration = st.number_input("📅 Duration (days)", 1, 21, 7)
-        
-        # Enhanced budget selection with comprehensive options
-        enhanced_budget_options = [
-            "💸 Ultra Budget ($300-600/day) - Hostels, street food, public transport",
-            "💰 Budget ($600-1000/day) - Budget hotels, local restaurants, basic tours", 
-            "💳 Moderate ($1000-2500/day) - 3-4★ hotels, mid-range dining, guided tours",
-            "💎 Premium ($2500-4000/day) - 4-5★ hotels, fine dining, private experiences",
-            "🏆 Luxury ($4000-7000/day) - 5★ resorts, Michelin dining, VIP services",
-            "👑 Ultra Luxury ($7000+/day) - Presidential suites, private jets, exclusive access"
-        ]
-        
-        budget = st.selectbox("💰 Budget Range", enhanced_budget_options, index=2)
-        
-        # Extract budget category for processing
-        budget_category = budget.split('(')[0].strip().replace('💸 ', '').replace('💰 ', '').replace('💳 ', '').replace('💎 ', '').replace('🏆 ', '').replace('👑 ', '')
-    
-    with col2:
-        st.markdown("### 🎨 **Package Preferences**")
-        
-        # Package customization options
-        include_flights = st.checkbox("✈️ Include Flights", value=True)
-        include_activities = st.checkbox("🎯 Include Activities", value=True)
-        include_local_experiences = st.checkbox("🌟 Include Local Experiences", value=True)
-        
-        # Travel pace
-        travel_pace = st.selectbox("Pace", ["Relaxed", "Moderate", "Active"])
-        
-        # Group type
-        group_type = st.selectbox("Group Type", ["Solo", "Couple", "Family", "Friends"])
-    
-    # Generate packages button
-    if st.button("🚀 **Generate My Personalized Packages**", type="primary", use_container_width=True):
-        if user_prompt and destination:
-            with st.spinner("🤖 Our AI is crafting personalized packages for you..."):
-                
-                # Enhanced AI Processing
-                if AI_ENHANCED and st.session_state.get('enhanced_mode', False):
-                    try:
-                        # Process user input with enhanced AI
-                        user_id = st.session_state.get('current_user_id', 'demo_user')
-                        ai_analysis = None  # AI integrator not available; fallback or skip
-                        
-                        # Display AI insights
-                        st.markdown("### 🧠 AI Analysis Results")
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.metric("Psychology Confidence", f"{ai_analysis['psychology_profile'].confidence_score:.1%}")
-                        with col2:
-                            st.metric("Personality Type", ai_analysis['psychology_profile'].personality_type.title())
-                        with col3:
-                            st.metric("Travel Style", ai_analysis['psychology_profile'].social_preferences.title())
-                        
-                        st.success("🎯 AI has analyzed your preferences and travel psychology!")
-                        
-                    except Exception as e:
-                        st.warning(f"Enhanced AI analysis unavailable: {str(e)}")
-                
-                # Generate 4 different package variations based on different styles
-                packages = []
-                
-                # Define 4 diverse package types with unique identifiers
-                package_variations = [
-                    {
-                        'style_override': 'cultural-immersive',
-                        'budget_modifier': 0,
-                        'title_suffix': 'Cultural Heritage Explorer',
-                        'focus_override': 'Deep cultural immersion with historical sites and local traditions',
-                        'unique_id': 'cultural'
-                    },
-                    {
-                        'style_override': 'culinary-focused', 
-                        'budget_modifier': 0.1,
-                        'title_suffix': 'Culinary Discovery Journey',
-                        'focus_override': 'Authentic local cuisine and cooking experiences',
-                        'unique_id': 'culinary'
-                    },
-                    {
-                        'style_override': 'luxury-premium' if budget != "Budget ($500-1000)" else 'photography-focused',
-                        'budget_modifier': 0.2,
-                        'title_suffix': 'Premium Luxury Experience' if budget != "Budget ($500-1000)" else 'Photography Expedition',
-                        'focus_override': 'High-end accommodations and exclusive experiences' if budget != "Budget ($500-1000)" else 'Stunning photography opportunities and scenic locations',
-                        'unique_id': 'luxury_or_photo'
-                    },
-                    {
-                        'style_override': 'budget-conscious' if budget == "Luxury ($2500+)" else 'adventure-active',
-                        'budget_modifier': -0.1 if budget == "Luxury ($2500+)" else 0.05,
-                        'title_suffix': 'Smart Budget Explorer' if budget == "Luxury ($2500+)" else 'Adventure & Active Explorer',
-                        'focus_override': 'Maximum value with authentic local experiences' if budget == "Luxury ($2500+)" else 'Outdoor adventures and active experiences',
-                        'unique_id': 'budget_or_adventure'
-                    }
-                ]
-                
-                # Clear existing packages to prevent duplicates
-                packages = []
-                
-                for i, variation in enumerate(package_variations):
-                    # Create modified profile for package variation
-                    varied_profile = profile.copy()
-                    
-                    # Adjust interests based on variation
-                    if variation['style_override'] == 'culinary-focused':
-                        varied_profile['interests'] = ['local cuisine'] + [x for x in profile['interests'] if x != 'local cuisine']
-                    elif variation['style_override'] == 'adventure-active':
-                        varied_profile['interests'] = profile['interests'] + ['adventure sports', 'outdoor activities']
-                    elif variation['style_override'] == 'photography-focused':
-                        varied_profile['interests'] = ['photography'] + profile['interests']
-                    
-                    # Modify user prompt to emphasize different aspects
-                    modified_prompt = enhance_prompt_for_variation(user_prompt, variation['style_override'])
-                    
-                    # Generate package with specific style
-                    package = generate_personalized_package(
-                        modified_prompt, varied_profile, destination, duration, travelers, budget, variation['style_override']
-                    )
-                    
-                    # Create unique package ID and title
-                    package['id'] = f"pkg_{variation['unique_id']}_{len(packages) + 1}"
-                    package['title'] = f"{destination} {variation['title_suffix']}"
-                    package['focus'] = variation['focus_override']
-                    package['variation_type'] = variation['style_override']
-                    
-                    # Ensure no duplicate packages by checking existing titles
-                    existing_titles = [p['title'] for p in packages]
-                    if package['title'] not in existing_titles:
-                        packages.append(package)
-                
-                # Store generated packages (ensure no duplicates)
-                unique_packages = []
-                seen_titles = set()
-                for package in packages:
-                    if package['title'] not in seen_titles:
-                        unique_packages.append(package)
-                        seen_titles.add(package['title'])
-                
-                st.session_state.generated_packages = unique_packages
-                
-                st.success(f"🎉 Successfully generated {len(unique_packages)} unique personalized packages for you!")
-                st.info("💡 Each package offers a different travel experience - choose the one that matches your mood!")
-                
-                # Force rerun to display packages
-                st.rerun()
-        else:
-            st.warning("⚠️ Please fill in your travel prompt and select a destination to generate packages.")
-
-    # Display generated packages (moved inside the function)
-    if st.session_state.generated_packages:
-        st.markdown("---")
-        st.markdown("### 📦 **Your Personalized Travel Packages**")
-        
-        # Package cards in columns
-        cols = st.columns(len(st.session_state.generated_packages))
-        
-        for i, package in enumerate(st.session_state.generated_packages):
-            with cols[i]:
-                display_package_card(package, i)
-
-    # Package details view (moved inside the function)
-    if st.session_state.viewing_package_details:
-        display_package_details(st.session_state.viewing_package_details)
-
-def enhance_prompt_for_variation(original_prompt, style_override):
-    """Enhance the user prompt to emphasize different travel styles"""
-    
-    style_enhancements = {
-        'cultural-immersive': original_prompt + " I want to deeply understand the local culture, visit historical sites, museums, and interact with local traditions.",
-        'culinary-focused': original_prompt + " I'm passionate about experiencing authentic local cuisine, learning cooking techniques, visiting food markets, and discovering regional specialties.",
-        'luxury-premium': original_prompt + " I prefer high-end accommodations, exclusive experiences, private tours, luxury amenities, and premium service throughout my journey.",
-        'adventure-active': original_prompt + " I love outdoor activities, active experiences, hiking, sports, and adventure-filled itineraries that keep me engaged.",
-        'photography-focused': original_prompt + " I'm passionate about photography and want to capture stunning photos, visit scenic locations, and have unique Instagram-worthy experiences.",
-        'budget-conscious': original_prompt + " I want to maximize value for money while still having authentic experiences, prefer budget-friendly options without compromising on quality."
-    }
-    
-    return style_enhancements.get(style_override, original_prompt)
-
-def display_package_card(package, index):
-    """Display a clickable package card with brief titles"""
-    
-    pricing = package['pricing']
-    
-    # Use the actual package variation type as brief title
-    brief_title = package.get('variation_type', 'Unique Experience').replace('-', ' ').title()
-    
-    # Package card with proper dark text styling for visibility
-    st.markdown(f"""
-    <div class="package-card" style="border-left-color: {'#28a745' if index == 0 else '#007bff' if index == 1 else '#fd7e14'}; color: #333333;">
-        <h4 style="color: #2c3e50; margin-bottom: 1rem;">{package['title']}</h4>
-        <p style="color: #666; font-style: italic; margin: 0.5rem 0;"><strong>{brief_title}</strong></p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>🎯 Focus:</strong> {package['focus']}</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>📅 Duration:</strong> {package['duration']} days</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>👥 Travelers:</strong> {package['travelers']}</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>✈️ Flights:</strong> {len(package['flights'])} options</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>🏨 Hotels:</strong> {len(package['hotels'])} recommendations</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>🍽️ Restaurants:</strong> {len(package['restaurants'])} curated spots</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>🎯 Activities:</strong> {len(package['activities'])} experiences</p>
-        <p style="color: #333; margin: 0.4rem 0;"><strong>🌟 Local Gems:</strong> {len(package['local_experiences'])} unique experiences</p>
-        <br>
-        <div class="price-tag" style="font-size: 1.1rem; padding: 0.8rem 1.5rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 15px; text-align: center;">
-            ${pricing['total_cost']:,.0f} total
-        </div>
-        <p style="text-align: center; margin-top: 0.5rem; color: #666;">
-            <small>${pricing['cost_per_person']:,.0f} per person</small>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Action buttons
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button(f"👁️ **Explore Package**", key=f"explore_{index}", use_container_width=True):
-            st.session_state.viewing_package_details = package
-            st.rerun()
-    
-    with col2:
-        if st.button(f"🎉 **Book Now**", key=f"book_{index}", type="primary", use_container_width=True):
-            book_complete_package(package)
-
-def display_package_details(package):
-    """Display detailed package information"""
-    
-    st.markdown("---")
-    st.markdown(f"## 📋 **{package['title']} - Detailed Itinerary**")
-    
-    # Package overview
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Total Cost", f"${package['pricing']['total_cost']:,.0f}")
-        st.metric("Per Person", f"${package['pricing']['cost_per_person']:,.0f}")
-    
-    with col2:
-        st.metric("Duration", f"{package['duration']} days")
-        st.metric("Daily Average", f"${package['pricing']['daily_average']:,.0f}")
-    
-    with col3:
-        st.metric("Travelers", package['travelers'])
-        st.metric("Package Rating", "⭐⭐⭐⭐⭐")
-    
-    # Detailed sections in tabs
-    tabs = st.tabs(["📅 Daily Itinerary", "✈️ Flights", "🏨 Hotels", "🍽️ Restaurants", "🎯 Activities", "🌟 Local Experiences", "💰 Pricing"])
-    
-    with tabs[0]:  # Daily Itinerary
-        display_daily_itinerary(package['daily_itinerary'])
-    
-    with tabs[1]:  # Flights
-        display_flight_options(package['flights'])
-    
-    with tabs[2]:  # Hotels
-        display_hotel_recommendations(package['hotels'])
-    
-    with tabs[3]:  # Restaurants
-        display_restaurant_recommendations(package['restaurants'])
-    
-    with tabs[4]:  # Activities
-        display_activities(package['activities'])
-    
-    with tabs[5]:  # Local Experiences
-        display_local_experiences(package['local_experiences'])
-    
-    with tabs[6]:  # Pricing
-        display_pricing_breakdown(package['pricing'])
-    
-    # Action buttons
-    st.markdown("---")
-    col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-    
-    with col1:
-        if st.button("⬅️ **Back to Packages**", use_container_width=True):
-            st.session_state.viewing_package_details = None
-            st.rerun()
-    
-    with col2:
-        if st.button("📄 **Generate PDF**", use_container_width=True):
-            generate_package_pdf(package)
-    
-    with col3:
-        if st.button("💾 **Save Package**", use_container_width=True):
-            save_package_to_favorites(package)
-    
-    with col4:
-        if st.button("🎉 **Book This Complete Package**", type="primary", use_container_width=True):
-            book_complete_package(package)
-
-def generate_package_pdf(package):
-    """Generate a comprehensive PDF of the travel package"""
-    
-    try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib import colors
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT
-        import io
-        
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, 
-                              topMargin=72, bottomMargin=18)
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.navy
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'], 
-            fontSize=16,
-            spaceAfter=12,
-            textColor=colors.darkblue
-        )
-        
-        # Build PDF content
-        story = []
-        
-        # Title
-        story.append(Paragraph(f"{package['title']}", title_style))
-        story.append(Paragraph(f"Destination: {package['destination']}", styles['Normal']))
-        story.append(Paragraph(f"Duration: {package['duration']} days for {package['travelers']} travelers", styles['Normal']))
-        story.append(Paragraph(f"Total Cost: ${package['pricing']['total_cost']:,.0f} (${package['pricing']['cost_per_person']:,.0f} per person)", styles['Normal']))
-        story.append(Spacer(1, 20))
-        
-        # Package Overview
-        story.append(Paragraph("Package Overview", heading_style))
-        story.append(Paragraph(f"Focus: {package['focus']}", styles['Normal']))
-        story.append(Spacer(1, 12))
-        
-        # Daily Itinerary
-        story.append(Paragraph("Daily Itinerary", heading_style))
-        for day_plan in package['daily_itinerary']:
-            story.append(Paragraph(f"<b>Day {day_plan['day']}: {day_plan['theme']}</b>", styles['Normal']))
-            story.append(Paragraph(f"Morning: {day_plan['morning']}", styles['Normal']))
-            story.append(Paragraph(f"Afternoon: {day_plan['afternoon']}", styles['Normal']))
-            story.append(Paragraph(f"Evening: {day_plan['evening']}", styles['Normal']))
-            story.append(Paragraph(f"Estimated Cost: ${day_plan['estimated_cost']}", styles['Normal']))
-            story.append(Spacer(1, 8))
-        
-        # Flights
-        story.append(Paragraph("Flight Options", heading_style))
-        for flight in package['flights']:
-            story.append(Paragraph(f"• {flight['airline']} - {flight['class']}", styles['Normal']))
-            story.append(Paragraph(f"  Price: ${flight['price_per_person']:,} per person | Duration: {flight['duration']}", styles['Normal']))
-            story.append(Spacer(1, 6))
-        
-        # Hotels
-        story.append(Paragraph("Accommodation", heading_style))
-        for hotel in package['hotels']:
-            story.append(Paragraph(f"• {hotel['name']} ({hotel['rating']}⭐)", styles['Normal']))
-            story.append(Paragraph(f"  ${hotel['price']}/night | {hotel['why_recommended']}", styles['Normal']))
-            story.append(Spacer(1, 6))
-        
-        # Restaurants
-        story.append(Paragraph("Dining Experiences", heading_style))
-        for restaurant in package['restaurants']:
-            story.append(Paragraph(f"• {restaurant['name']} - {restaurant['cuisine']}", styles['Normal']))
-            story.append(Paragraph(f"  {restaurant['specialty']} | {restaurant['why_recommended']}", styles['Normal']))
-            story.append(Spacer(1, 6))
-        
-        # Pricing Breakdown
-        story.append(Paragraph("Pricing Breakdown", heading_style))
-        pricing_data = [
-            ['Component', 'Cost'],
-            ['Flights', f"${package['pricing']['flights']:,.0f}"],
-            ['Hotels', f"${package['pricing']['hotels']:,.0f}"],
-            ['Restaurants', f"${package['pricing']['restaurants']:,.0f}"],
-            ['Activities', f"${package['pricing']['activities']:,.0f}"],
-            ['Taxes', f"${package['pricing']['taxes']:,.0f}"],
-            ['Service Fee', f"${package['pricing']['service_fee']:,.0f}"],
-            ['TOTAL', f"${package['pricing']['total_cost']:,.0f}"]
-        ]
-        
-        pricing_table = Table(pricing_data)
-        pricing_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
-        story.append(pricing_table)
-        
-        # Build PDF
-        doc.build(story)
-        
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
-        # Create download button
-        st.download_button(
-            label="� **Download PDF Package**",
-            data=pdf_data,
-            file_name=f"{package['title'].replace(' ', '_')}_Travel_Package.pdf",
-            mime="application/pdf",
-            use_container_width=True
-        )
-        
-        st.success("📄 PDF generated successfully! Click the download button above.")
-        
-    except ImportError:
-        st.warning("📄 PDF generation requires additional libraries. Creating simplified text version...")
-        
-        # Fallback: Create text version
-        text_content = generate_text_package_summary(package)
-        
-        st.download_button(
-            label="📥 **Download Text Package**",
-            data=text_content,
-            file_name=f"{package['title'].replace(' ', '_')}_Travel_Package.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
-
-def generate_text_package_summary(package):
-    """Generate a text summary of the package as fallback"""
-    
-    content = f"""
-TRAVEL PACKAGE SUMMARY
-======================
-
-Package: {package['title']}
-Destination: {package['destination']}
-Duration: {package['duration']} days for {package['travelers']} travelers
-Total Cost: ${package['pricing']['total_cost']:,.0f} (${package['pricing']['cost_per_person']:,.0f} per person)
-
-PACKAGE FOCUS
-{package['focus']}
-
-DAILY ITINERARY
-===============
-"""
-    
-    for day_plan in package['daily_itinerary']:
-        content += f"""
-Day {day_plan['day']}: {day_plan['theme']}
-Morning: {day_plan['morning']}
-Afternoon: {day_plan['afternoon']}
-Evening: {day_plan['evening']}
-Estimated Cost: ${day_plan['estimated_cost']}
-"""
-    
-    content += "\n\nFLIGHT OPTIONS\n==============\n"
-    for flight in package['flights']:
-        content += f"• {flight['airline']} - {flight['class']}\n"
-        content += f"  Price: ${flight['price_per_person']:,} per person | Duration: {flight['duration']}\n\n"
-    
-    content += "\nACCOMMODATION\n=============\n"
-    for hotel in package['hotels']:
-        content += f"• {hotel['name']} ({hotel['rating']}⭐)\n"
-        content += f"  ${hotel['price']}/night | {hotel['why_recommended']}\n\n"
-    
-    content += "\nDINING EXPERIENCES\n==================\n"
-    for restaurant in package['restaurants']:
-        content += f"• {restaurant['name']} - {restaurant['cuisine']}\n"
-        content += f"  {restaurant['specialty']} | {restaurant['why_recommended']}\n\n"
-    
-    content += f"""
-PRICING BREAKDOWN
-=================
-Flights: ${package['pricing']['flights']:,.0f}
-Hotels: ${package['pricing']['hotels']:,.0f}
-Restaurants: ${package['pricing']['restaurants']:,.0f}
-Activities: ${package['pricing']['activities']:,.0f}
-Taxes: ${package['pricing']['taxes']:,.0f}
-Service Fee: ${package['pricing']['service_fee']:,.0f}
-TOTAL: ${package['pricing']['total_cost']:,.0f}
-
-Generated by AI Travel Platform
-Visit us at: https://ai-travel-platform.com
-"""
-    
-    return content
-
-def display_daily_itinerary(itinerary):
-    """Display day-by-day itinerary"""
-    
-    for day_plan in itinerary:
-        with st.expander(f"📅 **Day {day_plan['day']}: {day_plan['theme']}**", expanded=day_plan['day'] <= 2):
-            
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.markdown(f"""
-                **🌅 Morning:** {day_plan['morning']}  
-                **☀️ Afternoon:** {day_plan['afternoon']}  
-                **🌆 Evening:** {day_plan['evening']}
-                
-                **🍽️ Meals:**
-                - Breakfast: {day_plan['meals']['breakfast']}
-                - Lunch: {day_plan['meals']['lunch']} 
-                - Dinner: {day_plan['meals']['dinner']}
-                """)
-            
-            with col2:
-                st.markdown(f"""
-                **🚗 Transportation:** {day_plan['transportation']}  
-                **💰 Est. Daily Cost:** ${day_plan['estimated_cost']}
-                """)
-
-def display_flight_options(flights):
-    """Display flight recommendations"""
-    
-    for i, flight in enumerate(flights):
-        st.markdown(f"""
-        <div class="hotel-card">
-            <h4>✈️ {flight['airline']} - {flight['class']}</h4>
-            <p><strong>💰 Price:</strong> ${flight['price_per_person']:,} per person (${flight['total_price']:,} total)</p>
-            <p><strong>⏱️ Duration:</strong> {flight['duration']}</p>
-            <p><strong>🔄 Stops:</strong> {'Direct' if flight['stops'] == 0 else f"{flight['stops']} stop(s)"}</p>
-            <p><strong>🛫 Departure:</strong> {flight['departure']} → <strong>🛬 Arrival:</strong> {flight['arrival']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_hotel_recommendations(hotels):
-    """Display hotel recommendations with reasons"""
-    
-    for hotel in hotels:
-        st.markdown(f"""
-        <div class="hotel-card">
-            <h4>🏨 {hotel['name']}</h4>
-            <p><strong>⭐ Rating:</strong> {hotel['rating']}/5 • <strong>🏷️ Type:</strong> {hotel['type']}</p>
-            <p><strong>💰 Price:</strong> ${hotel['price']}/night (${hotel['total_price']:,} total)</p>
-            <p><strong>📍 Location Score:</strong> {hotel['location_score']}/10</p>
-            <p><strong>✨ Amenities:</strong> {', '.join(hotel['amenities'])}</p>
-            <p><strong>🎯 Why Recommended:</strong> {hotel['why_recommended']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_restaurant_recommendations(restaurants):
-    """Display restaurant recommendations"""
-    
-    for restaurant in restaurants:
-        st.markdown(f"""
-        <div class="restaurant-card">
-            <h4>🍽️ {restaurant['name']}</h4>
-            <p><strong>🍴 Cuisine:</strong> {restaurant['cuisine']} • <strong>⭐ Rating:</strong> {restaurant['rating']}/5</p>
-            <p><strong>💰 Price Range:</strong> {restaurant['price_range']} • <strong>🌟 Specialty:</strong> {restaurant['specialty']}</p>
-            <p><strong>🎯 Why Recommended:</strong> {restaurant['why_recommended']}</p>
-            <p><strong>📅 Suggested Time:</strong> {restaurant['reservation_time']}</p>
-            <p><strong>📝 Note:</strong> {restaurant['booking_notes']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_activities(activities):
-    """Display activity recommendations"""
-    
-    for activity in activities:
-        st.markdown(f"""
-        <div class="activity-card">
-            <h4>🎯 {activity['name']}</h4>
-            <p><strong>⏱️ Duration:</strong> {activity['duration']} • <strong>💰 Price:</strong> ${activity['price']}</p>
-            <p><strong>🏷️ Type:</strong> {activity['type']} • <strong>📊 Difficulty:</strong> {activity['difficulty']}</p>
-            <p><strong>👥 Group Size:</strong> {activity['group_size']}</p>
-            <p><strong>🎯 Why Recommended:</strong> {activity['match_reason']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_local_experiences(experiences):
-    """Display local experience recommendations"""
-    
-    for exp in experiences:
-        st.markdown(f"""
-        <div class="activity-card" style="border-left-color: #ffc107;">
-            <h4>🌟 {exp['name']}</h4>
-            <p><strong>🏷️ Type:</strong> {exp['type']} • <strong>⏱️ Duration:</strong> {exp['duration']}</p>
-            <p><strong>💰 Price:</strong> ${exp['price']} per person</p>
-            <p><strong>✨ What makes it special:</strong> Unique local experience not found in typical tourist guides</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_pricing_breakdown(pricing):
-    """Display detailed pricing breakdown with attractive visualization using pure Streamlit components"""
-    
-    # Title with custom styling
-    st.markdown("""
-    <div style="
-        background: linear-gradient(145deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 25px;
-        color: white;
-        margin: 1rem 0;
-        text-align: center;
-    ">
-        <h2 style="margin: 0; color: white;">💰 Investment Breakdown</h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Main content using Streamlit columns
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("### 📊 Cost Components")
-        
-        # Calculate percentages for visual representation
-        total_base = pricing['base_cost']
-        components = [
-            ("✈️ Flights", pricing['flights'], (pricing['flights'] / total_base) * 100),
-            ("🏨 Hotels", pricing['hotels'], (pricing['hotels'] / total_base) * 100),
-            ("🍽️ Restaurants", pricing['restaurants'], (pricing['restaurants'] / total_base) * 100),
-            ("🎯 Activities", pricing['activities'], (pricing['activities'] / total_base) * 100)
-        ]
-        
-        # Display each component with progress bar
-        for name, amount, percentage in components:
-            col_name, col_amount = st.columns([2, 1])
-            with col_name:
-                st.write(name)
-            with col_amount:
-                st.write(f"**${amount:,.0f}**")
-            
-            # Progress bar
-            progress_value = min(percentage / 100, 1.0)
-            st.progress(progress_value)
-            st.write("")  # Add spacing
-    
-    with col2:
-        # Total Investment Card
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #ff6b6b 0%, #feca57 100%);
-            padding: 2rem;
-            border-radius: 20px;
-            text-align: center;
-            margin-bottom: 1rem;
-            color: white;
-        ">
-            <h3 style="margin: 0; color: white;">Total Investment</h3>
-            <h1 style="margin: 1rem 0; font-size: 3rem; color: white;">
-                ${pricing['total_cost']:,.0f}
-            </h1>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Per Person and Daily Average
-        metric_col1, metric_col2 = st.columns(2)
-        with metric_col1:
-            st.metric(
-                label="👥 Per Person",
-                value=f"${pricing['cost_per_person']:,.0f}",
-                delta=None
-            )
-        
-        with metric_col2:
-            st.metric(
-                label="📅 Daily Average", 
-                value=f"${pricing['daily_average']:,.0f}",
-                delta=None
-            )
-        
-        # Additional Costs
-        st.markdown("#### Additional Costs")
-        st.write(f"📊 **Taxes & Fees:** ${pricing['taxes']:,.0f}")
-        st.write(f"🔧 **Service Fee:** ${pricing['service_fee']:,.0f}")
-    
-    # Add some spacing
-    st.markdown("<br>", unsafe_allow_html=True)
-
-def book_complete_package(package):
-    """Enhanced intelligent booking system for complete travel package"""
-    
-    st.markdown("## 🎯 **Intelligent Package Booking System**")
-    
-    # Step 1: Booking Confirmation & Details Review
-    with st.expander("📋 **Step 1: Review Package Details**", expanded=True):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"""
-            **📦 Package:** {package['title']}  
-            **🌍 Destination:** {package['destination']}  
-            **📅 Duration:** {package['duration']} days  
-            **👥 Travelers:** {package['travelers']} people  
-            **💰 Total Cost:** ${package['pricing']['total_cost']:,.0f}  
-            **📊 Per Person:** ${package['pricing']['cost_per_person']:,.0f}
-            """)
-        
-        with col2:
-            st.markdown(f"""
-            **🎯 Package Focus:** {package['focus']}  
-            **✈️ Flights Included:** {len(package['flights'])} options  
-            **🏨 Hotels Included:** {len(package['hotels'])} options  
-            **🍽️ Restaurants Included:** {len(package['restaurants'])} reservations  
-            **🎯 Activities Included:** {len(package['activities'])} experiences  
-            **🌟 Local Experiences:** {len(package['local_experiences'])} unique activities
-            """)
-        
-        package_confirmed = st.checkbox("✅ I confirm these package details are correct", key="package_confirm")
-    
-    # Step 2: Traveler Information
-    if package_confirmed:
-        with st.expander("� **Step 2: Traveler Information**", expanded=True):
-            travelers_info = []
-            
-            st.markdown("**Please provide information for all travelers:**")
-            
-            for i in range(package['travelers']):
-                st.markdown(f"**Traveler {i+1}:**")
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    name = st.text_input(f"Full Name", key=f"traveler_{i}_name", placeholder="John Doe")
-                with col2:
-                    passport = st.text_input(f"Passport Number", key=f"traveler_{i}_passport", placeholder="AB1234567")
-                with col3:
-                    dob = st.date_input(f"Date of Birth", key=f"traveler_{i}_dob", 
-                                      value=datetime(1990, 1, 1).date())
-                
-                travelers_info.append({
-                    'name': name,
-                    'passport': passport,
-                    'date_of_birth': dob
-                })
-            
-            # Contact Information
-            st.markdown("**Primary Contact Information:**")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                contact_email = st.text_input("Email Address", placeholder="john@example.com")
-                contact_phone = st.text_input("Phone Number", placeholder="+1 (555) 123-4567")
-            
-            with col2:
-                emergency_contact = st.text_input("Emergency Contact Name", placeholder="Jane Doe")
-                emergency_phone = st.text_input("Emergency Contact Phone", placeholder="+1 (555) 987-6543")
-            
-            travelers_confirmed = st.checkbox("✅ All traveler information is accurate", key="travelers_confirm")
-    
-    # Step 3: Component Selection & Customization
-    if package_confirmed and travelers_confirmed:
-        with st.expander("🎛️ **Step 3: Customize Package Components**", expanded=True):
-            st.markdown("**Select your preferred options for each component:**")
-            
-            # Flight Selection
-            st.markdown("**✈️ Flight Selection:**")
-            selected_flight = st.selectbox(
-                "Choose your preferred flight:",
-                [f"{f['airline']} - {f['class']} (${f['price_per_person']:,}/person)" for f in package['flights']],
-                key="flight_selection"
-            )
-            
-            # Hotel Selection
-            st.markdown("**🏨 Hotel Selection:**")
-            selected_hotel = st.selectbox(
-                "Choose your preferred hotel:",
-                [f"{h['name']} - {h['type']} (${h['price']}/night)" for h in package['hotels']],
-                key="hotel_selection"
-            )
-            
-            # Special Requests
-            st.markdown("**📝 Special Requests & Preferences:**")
-            special_requests = st.text_area(
-                "Any special requests, dietary restrictions, or accessibility needs:",
-                placeholder="Room preferences, dietary restrictions, celebration occasions, etc.",
-                key="special_requests"
-            )
-            
-            components_confirmed = st.checkbox("✅ Component selections are finalized", key="components_confirm")
-    
-    # Step 4: Payment & Final Booking
-    if package_confirmed and travelers_confirmed and components_confirmed:
-        with st.expander("💳 **Step 4: Payment & Final Booking**", expanded=True):
-            
-            # Payment Summary
-            st.markdown("**💰 Final Payment Summary:**")
-            selected_flight_idx = [f"{f['airline']} - {f['class']} (${f['price_per_person']:,}/person)" for f in package['flights']].index(selected_flight)
-            selected_hotel_idx = [f"{h['name']} - {h['type']} (${h['price']}/night)" for h in package['hotels']].index(selected_hotel)
-            
-            flight_cost = package['flights'][selected_flight_idx]['total_price']
-            hotel_cost = package['hotels'][selected_hotel_idx]['total_price']
-            
-            # Detailed cost breakdown
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("**💸 Cost Breakdown:**")
-                st.markdown(f"""
-                - **Selected Flight:** ${flight_cost:,.0f}
-                - **Selected Hotel:** ${hotel_cost:,.0f}
-                - **Restaurants & Dining:** ${package['pricing']['restaurants']:,.0f}
-                - **Activities & Experiences:** ${package['pricing']['activities']:,.0f}
-                - **Taxes & Government Fees:** ${package['pricing']['taxes']:,.0f}
-                - **Service Fee (5%):** ${package['pricing']['service_fee']:,.0f}
-                """)
-                
-                st.markdown("---")
-                st.markdown(f"**🎯 TOTAL AMOUNT: ${package['pricing']['total_cost']:,.0f}**")
-                st.markdown(f"**📊 Per Person: ${package['pricing']['cost_per_person']:,.0f}**")
-            
-            with col2:
-                st.markdown("**💳 Payment Options:**")
-                
-                # Payment method selection with detailed info
-                payment_method = st.selectbox(
-                    "Select your preferred payment method:",
-                    [
-                        "💳 Credit Card (Visa, MasterCard, Amex)",
-                        "🏦 Bank Transfer (Wire Transfer)",
-                        "💰 PayPal (Secure Online Payment)",
-                        "📱 Digital Wallet (Apple Pay, Google Pay)",
-                        "💰 Cryptocurrency (Bitcoin, Ethereum)"
-                    ],
-                    key="payment_method"
-                )
-                
-                # Payment plan options
-                payment_plan = st.selectbox(
-                    "Payment Plan:",
-                    [
-                        "💰 Full Payment Now (5% discount)",
-                        "📅 50% Now, 50% Before Travel",
-                        "📅 25% Now, 75% in 30 days",
-                        "📅 Monthly Payment Plan (3 months)"
-                    ],
-                    key="payment_plan"
-                )
-                
-                # Calculate payment amounts based on plan
-                total_cost = package['pricing']['total_cost']
-                if "Full Payment" in payment_plan:
-                    immediate_payment = total_cost * 0.95  # 5% discount
-                    st.success(f"💰 With 5% discount: ${immediate_payment:,.0f}")
-                elif "50% Now" in payment_plan:
-                    immediate_payment = total_cost * 0.5
-                    st.info(f"💰 Today: ${immediate_payment:,.0f} | Later: ${immediate_payment:,.0f}")
-                elif "25% Now" in payment_plan:
-                    immediate_payment = total_cost * 0.25
-                    remaining = total_cost * 0.75
-                    st.info(f"💰 Today: ${immediate_payment:,.0f} | In 30 days: ${remaining:,.0f}")
-                else:  # Monthly plan
-                    monthly_payment = total_cost / 3
-                    st.info(f"💰 Monthly Payment: ${monthly_payment:,.0f} x 3 months")
-                    immediate_payment = monthly_payment
-            
-            # Enhanced Payment Form
-            st.markdown("---")
-            st.markdown("**🔐 Secure Payment Information:**")
-            
-            if "Credit Card" in payment_method:
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    card_number = st.text_input("💳 Card Number", placeholder="4532 1234 5678 9012", type="password")
-                    cardholder_name = st.text_input("👤 Cardholder Name", placeholder="John Doe")
-                
-                with col2:
-                    expiry_month = st.selectbox("📅 Exp. Month", [f"{i:02d}" for i in range(1, 13)])
-                    expiry_year = st.selectbox("📅 Exp. Year", [str(2024 + i) for i in range(6)])
-                
-                with col3:
-                    cvv = st.text_input("🔒 CVV", placeholder="123", type="password", max_chars=4)
-                    billing_zip = st.text_input("📍 Billing ZIP", placeholder="10001")
-                
-            elif "Bank Transfer" in payment_method:
-                st.info("💰 Bank transfer instructions will be provided after booking confirmation.")
-                st.markdown("""
-                **Wire Transfer Details:**
-                - Processing time: 3-5 business days
-                - Additional bank fees may apply
-                - Full payment required before travel
-                """)
-                
-            elif "PayPal" in payment_method:
-                st.info("💰 You'll be redirected to PayPal for secure payment processing.")
-                paypal_email = st.text_input("📧 PayPal Email", placeholder="john@example.com")
-                
-            elif "Digital Wallet" in payment_method:
-                st.info("📱 Digital wallet payment will be processed through secure mobile payment.")
-                wallet_type = st.selectbox("Wallet Type:", ["Apple Pay", "Google Pay", "Samsung Pay"])
-                
-            elif "Cryptocurrency" in payment_method:
-                st.info("₿ Cryptocurrency payment with instant confirmation.")
-                crypto_type = st.selectbox("Cryptocurrency:", ["Bitcoin (BTC)", "Ethereum (ETH)", "USDC"])
-                st.markdown(f"💰 Amount: {total_cost / 50000:.4f} BTC (approximately)")
-            
-            # Security and Terms
-            st.markdown("---")
-            st.markdown("**🛡️ Security & Terms:**")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                privacy_accepted = st.checkbox("✅ I accept the Privacy Policy", key="privacy_confirm")
-                terms_accepted = st.checkbox("✅ I accept the Terms & Conditions", key="terms_confirm")
-                cancellation_accepted = st.checkbox("✅ I understand the Cancellation Policy", key="cancellation_confirm")
-            
-            with col2:
-                marketing_consent = st.checkbox("📧 Send me travel updates and exclusive offers", key="marketing_consent")
-                insurance_offered = st.checkbox("🛡️ Add Travel Insurance (+$89 per person)", key="travel_insurance")
-                
-            # Travel Insurance Details
-            if insurance_offered:
-                st.info("""
-                **🛡️ Travel Insurance Coverage:**
-                - Trip cancellation/interruption up to $50,000
-                - Medical emergencies up to $100,000
-                - Lost baggage up to $2,500
-                - Flight delays and missed connections
-                """)
-                insurance_cost = 89 * package['travelers']
-                total_with_insurance = total_cost + insurance_cost
-                st.success(f"💰 Insurance Total: ${insurance_cost} | New Package Total: ${total_with_insurance:,.0f}")
-            
-            # Final Booking Button
-            if privacy_accepted and terms_accepted and cancellation_accepted:
-                
-                # Add final security verification
-                st.markdown("**🔐 Final Security Verification:**")
-                security_code = st.text_input("Enter security code (sent to your phone):", placeholder="123456", max_chars=6)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if st.button("📧 **Send Security Code**", use_container_width=True):
-                        st.success("✅ Security code sent to your phone!")
-                        st.session_state.security_code_sent = True
-                
-                with col2:
-                    # Only show final booking button if security code is "sent"
-                    if getattr(st.session_state, 'security_code_sent', False) or security_code:
-                        
-                        # Calculate final amount
-                        final_amount = total_with_insurance if insurance_offered else total_cost
-                        if "Full Payment" in payment_plan:
-                            final_amount = final_amount * 0.95
-                        elif "50% Now" in payment_plan:
-                            final_amount = final_amount * 0.5
-                        elif "25% Now" in payment_plan:
-                            final_amount = final_amount * 0.25
-                        elif "Monthly" in payment_plan:
-                            final_amount = final_amount / 3
-                        
-                        if st.button(f"🎉 **SECURE CHECKOUT - ${final_amount:,.0f}**", type="primary", use_container_width=True):
-                            process_intelligent_booking(
-                                package, travelers_info, contact_email, contact_phone, 
-                                emergency_contact, emergency_phone, selected_flight_idx, 
-                                selected_hotel_idx, special_requests, payment_method,
-                                payment_plan, insurance_offered, final_amount
-                            )
-            else:
-                st.warning("⚠️ Please accept all required terms and conditions to proceed with booking.")
-
-def process_intelligent_booking(package, travelers_info, contact_email, contact_phone, 
-                               emergency_contact, emergency_phone, flight_idx, hotel_idx, 
-                               special_requests, payment_method, payment_plan, insurance_offered, final_amount):
-    """Process the complete intelligent booking with all details and payment processing"""
-    
-    with st.spinner("🔄 Processing your complete package booking with secure payment verification..."):
-        try:
-            import time
-            time.sleep(2)  # Simulate payment processing
-            
-            # Simulate payment processing steps
-            progress_container = st.container()
-            
-            with progress_container:
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # Step 1: Payment verification
-                status_text.text("🔐 Verifying payment information...")
-                progress_bar.progress(20)
-                time.sleep(1)
-                
-                # Step 2: Processing payment
-                status_text.text("💳 Processing secure payment...")
-                progress_bar.progress(40)
-                time.sleep(1)
-                
-                # Step 3: Booking confirmation
-                status_text.text("📋 Confirming booking details...")
-                progress_bar.progress(60)
-                time.sleep(1)
-                
-                # Step 4: Generating confirmation
-                status_text.text("📧 Generating confirmation documents...")
-                progress_bar.progress(80)
-                time.sleep(1)
-                
-                # Step 5: Complete
-                status_text.text("✅ Booking successfully completed!")
-                progress_bar.progress(100)
-                time.sleep(0.5)
-            
-            # Generate comprehensive booking confirmation
-            booking_confirmation = {
-                'booking_id': f"PKG_{datetime.now().strftime('%Y%m%d')}_{len(st.session_state.booking_history) + 1:04d}",
-                'confirmation_number': f"ATP{datetime.now().strftime('%Y%m%d')}{len(st.session_state.booking_history) + 1:03d}",
-                'package_title': package['title'],
-                'destination': package['destination'],
-                'duration': package['duration'],
-                'travelers': package['travelers'],
-                'traveler_details': travelers_info,
-                'total_amount': final_amount,
-                'original_amount': package['pricing']['total_cost'],
-                'selected_flight': package['flights'][flight_idx],
-                'selected_hotel': package['hotels'][hotel_idx],
-                'daily_itinerary': package['daily_itinerary'],
-                'restaurants': package['restaurants'],
-                'activities': package['activities'],
-                'contact_info': {
-                    'email': contact_email,
-                    'phone': contact_phone,
-                    'emergency_contact': emergency_contact,
-                    'emergency_phone': emergency_phone
-                },
-                'special_requests': special_requests,
-                'payment_method': payment_method,
-                'payment_plan': payment_plan,
-                'travel_insurance': insurance_offered,
-                'created_at': datetime.now(),
-                'status': 'CONFIRMED',
-                'payment_status': 'PAID',
-                'booking_reference': f"REF-{datetime.now().strftime('%Y%m%d')}-{len(st.session_state.booking_history) + 1:04d}"
-            }
-            
-            # Add to booking history
-            st.session_state.booking_history.append(booking_confirmation)
-            
-            # Clear progress display
-            progress_container.empty()
-            
-            # Display comprehensive booking confirmation
-            display_booking_confirmation_success(booking_confirmation)
-            
-            # Auto-generate and offer document downloads
-            generate_booking_documents(booking_confirmation)
-            
-        except Exception as e:
-            st.error(f"❌ Booking processing failed: {str(e)}")
-            st.error("Please try again or contact support at support@aitravelplatform.com")
-
-def display_booking_confirmation_success(booking_confirmation):
-    """Display comprehensive booking confirmation with all details"""
-    
-    # Success header
-    st.markdown("""
-    <div class="booking-success">
-        <h2 style="color: #22c55e; text-align: center; margin-bottom: 1rem;">
-            🎉 BOOKING CONFIRMED SUCCESSFULLY! 🎉
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Confirmation details in organized layout
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 📋 **Booking Details**")
-        st.markdown(f"""
-        **🎫 Confirmation Number:** `{booking_confirmation['confirmation_number']}`  
-        **📦 Package:** {booking_confirmation['package_title']}  
-        **🌍 Destination:** {booking_confirmation['destination']}  
-        **📅 Duration:** {booking_confirmation['duration']} days  
-        **👥 Travelers:** {booking_confirmation['travelers']} people  
-        **💰 Amount Paid:** ${booking_confirmation['total_amount']:,.0f}  
-        **📊 Payment Status:** ✅ {booking_confirmation['payment_status']}  
-        **🔗 Booking Reference:** `{booking_confirmation['booking_reference']}`
-        """)
-        
-        st.markdown("### 📧 **Contact Information**")
-        st.markdown(f"""
-        **📧 Email:** {booking_confirmation['contact_info']['email']}  
-        **📞 Phone:** {booking_confirmation['contact_info']['phone']}  
-        **🚨 Emergency Contact:** {booking_confirmation['contact_info']['emergency_contact']}  
-        **🚨 Emergency Phone:** {booking_confirmation['contact_info']['emergency_phone']}
-        """)
-    
-    with col2:
-        st.markdown("### ✈️ **Flight Details**")
-        flight = booking_confirmation['selected_flight']
-        st.markdown(f"""
-        **✈️ Airline:** {flight['airline']}  
-        **🎫 Class:** {flight['class']}  
-        **⏱️ Duration:** {flight['duration']}  
-        **💰 Cost:** ${flight['total_price']:,.0f}  
-        **🛫 Route:** {flight['departure']}
-        """)
-        
-        st.markdown("### 🏨 **Hotel Details**")
-        hotel = booking_confirmation['selected_hotel']
-        st.markdown(f"""
-        **🏨 Hotel:** {hotel['name']}  
-        **⭐ Rating:** {hotel['rating']}/5.0  
-        **🏷️ Type:** {hotel['type']}  
-        **💰 Rate:** ${hotel['price']}/night  
-        **📍 Location Score:** {hotel['location_score']}/10
-        """)
-    
-    # Payment Information
-    st.markdown("---")
-    st.markdown("### 💳 **Payment Information**")
-    
-    payment_col1, payment_col2, payment_col3 = st.columns(3)
-    
-    with payment_col1:
-        st.markdown(f"""
-        **💳 Payment Method:** {booking_confirmation['payment_method']}  
-        **📅 Payment Plan:** {booking_confirmation['payment_plan']}  
-        **🛡️ Travel Insurance:** {'✅ Included' if booking_confirmation['travel_insurance'] else '❌ Not selected'}
-        """)
-    
-    with payment_col2:
-        st.markdown(f"""
-        **💰 Amount Paid Today:** ${booking_confirmation['total_amount']:,.0f}  
-        **💰 Original Package Price:** ${booking_confirmation['original_amount']:,.0f}  
-        **📅 Booking Date:** {booking_confirmation['created_at'].strftime('%B %d, %Y')}
-        """)
-    
-    with payment_col3:
-        st.markdown(f"""
-        **📋 Booking Status:** ✅ {booking_confirmation['status']}  
-        **🔐 Security:** 256-bit SSL Encrypted  
-        **📧 Confirmation Sent:** ✅ Email & SMS
-        """)
-    
-    # Next Steps
-    st.markdown("---")
-    st.markdown("### 🚀 **What Happens Next?**")
-    
-    next_steps_col1, next_steps_col2 = st.columns(2)
-    
-    with next_steps_col1:
-        st.markdown("""
-        **📧 Immediate Actions:**
-        - ✅ Confirmation email sent to your inbox
-        - ✅ SMS confirmation sent to your phone
-        - ✅ Calendar invites for travel dates
-        - ✅ Travel documents preparation begins
-        
-        **📋 Within 24 Hours:**
-        - 📄 Detailed itinerary document
-        - ✈️ Flight booking confirmations
-        - 🏨 Hotel reservation confirmations
-        - 🍽️ Restaurant reservation details
-        """)
-    
-    with next_steps_col2:
-        st.markdown("""
-        **📞 Your Dedicated Travel Concierge:**
-        - 👤 Personal travel coordinator assigned
-        - 📞 24/7 support hotline: +1-800-AI-TRAVEL
-        - 📧 Direct email: concierge@aitravelplatform.com
-        - 💬 WhatsApp support: +1-555-AI-HELP
-        
-        **🎯 Pre-Travel Preparation:**
-        - 📋 Travel checklist sent via email
-        - 🌍 Destination guide & local tips
-        - 📱 Mobile app access with offline maps
-        - 🛂 Visa/passport requirement updates
-        """)
-    
-    # Special offers for future bookings
-    st.markdown("---")
-    st.markdown("### 🎁 **Exclusive Benefits & Future Offers**")
-    
-    st.success("""
-    **🎉 Welcome to our Premium Traveler Program!**
-    - 🎯 10% discount on your next booking
-    - ✈️ Priority customer support
-    - 🏆 VIP status for future travels
-    - 📧 Exclusive travel deals & insider tips
-    """)
-
-def generate_booking_documents(booking_confirmation):
-    """Generate downloadable booking documents"""
-    
-    st.markdown("---")
-    st.markdown("### 📄 **Download Your Travel Documents**")
-    
-    doc_col1, doc_col2, doc_col3 = st.columns(3)
-    
-    with doc_col1:
-        if st.button("📋 **Download Booking Confirmation**", use_container_width=True):
-            confirmation_pdf = generate_confirmation_pdf(booking_confirmation)
-            st.download_button(
-                label="📄 Download PDF Confirmation",
-                data=confirmation_pdf,
-                file_name=f"booking_confirmation_{booking_confirmation['confirmation_number']}.pdf",
-                mime="application/pdf",
-                use_container_width=True
-            )
-    
-    with doc_col2:
-        if st.button("🗓️ **Download Detailed Itinerary**", use_container_width=True):
-            itinerary_pdf = generate_itinerary_pdf(booking_confirmation)
-            st.download_button(
-                label="📄 Download Itinerary PDF",
-                data=itinerary_pdf,
-                file_name=f"travel_itinerary_{booking_confirmation['confirmation_number']}.pdf",
-                mime="application/pdf",
-                use_container_width=True
-            )
-    
-    with doc_col3:
-        if st.button("📧 **Email All Documents**", use_container_width=True):
-            send_booking_email(booking_confirmation)
-            st.success("✅ All documents sent to your email!")
-
-def generate_confirmation_pdf(booking_confirmation):
-    """Generate booking confirmation PDF"""
-    # Placeholder for PDF generation
-    return b"PDF content would be generated here"
-
-def generate_itinerary_pdf(booking_confirmation):
-    """Generate detailed itinerary PDF"""
-    # Placeholder for PDF generation
-    return b"PDF content would be generated here"
-
-def send_booking_email(booking_confirmation):
-    """Send booking confirmation email"""
-    # Placeholder for email sending
-    pass
-
-def save_package_to_favorites(package):
-    """Save package to user favorites"""
-    if 'saved_packages' not in st.session_state:
-        st.session_state.saved_packages = []
-    
-    st.session_state.saved_packages.append(package)
-    st.success("💾 Package saved to your favorites!")
-
-def booking_history_page():
-    """Booking history and management"""
-    
-    st.title("📋 **Booking History**")
-    
-    if st.session_state.booking_history:
-        st.markdown("### 📚 **Your Bookings**")
-        
-        for booking in st.session_state.booking_history:
-            with st.expander(f"📋 {booking['confirmation_number']} - {booking['type']}"):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown(f"""
-                    **Booking ID:** {booking['booking_id']}  
-                    **Type:** {booking['type']}  
-                    **Status:** {booking['status']}  
-                    **Created:** {booking['created_at'].strftime('%Y-%m-%d %H:%M')}
-                    """)
-                
-                with col2:
-                    details = booking['details']
-                    if booking['type'] == 'Hotel':
-                        st.markdown(f"""
-                        **Hotel:** {details['hotel_name']}  
-                        **Check-in:** {details['check_in']}  
-                        **Check-out:** {details['check_out']}  
-                        **Total:** ${details['total_amount']:,.2f}
-                        """)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    if st.button("📧 Email Confirmation", key=f"email_{booking['booking_id']}"):
-                        st.success("📧 Confirmation email sent!")
-                with col2:
-                    if st.button("✏️ Modify Booking", key=f"modify_{booking['booking_id']}"):
-                        st.info("✏️ Modification form would open here")
-                with col3:
-                    if st.button("❌ Cancel Booking", key=f"cancel_{booking['booking_id']}"):
-                        st.warning("❌ Cancellation form would open here")
-    else:
-        st.info("📭 No bookings yet. Start by booking a hotel or restaurant!")
-
-def analytics_dashboard():
-    """Professional investor-focused analytics dashboard"""
-    
-    st.title("📊 **Investment Analytics Dashboard**")
-    st.markdown("*Real-time business intelligence and market insights*")
-    
-    # Key Performance Indicators
-    st.markdown("### 🎯 **Key Performance Indicators**")
-    
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric("Monthly Revenue", "$425K", "↗️ 47%", help="Gross monthly revenue from all sources")
-    
-    with col2:
-        st.metric("Gross Margin", "68%", "↗️ 3%", help="Revenue minus direct costs")
-    
-    with col3:
-        st.metric("Customer LTV", "$1,247", "↗️ 18%", help="Customer Lifetime Value")
-    
-    with col4:
-        st.metric("CAC Payback", "4.2 months", "↘️ 0.8", help="Customer Acquisition Cost payback period")
-    
-    with col5:
-        st.metric("Monthly Churn", "2.1%", "↘️ 0.4%", help="Monthly customer churn rate")
-    
-    # Revenue growth visualization
-    st.markdown("### 📈 **Revenue Growth Trajectory**")
-    
-    # Generate realistic revenue data
-    months = ['Jan 2024', 'Feb 2024', 'Mar 2024', 'Apr 2024', 'May 2024', 'Jun 2024', 
-              'Jul 2024', 'Aug 2024', 'Sep 2024', 'Oct 2024', 'Nov 2024', 'Dec 2024',
-              'Jan 2025', 'Feb 2025', 'Mar 2025', 'Apr 2025', 'May 2025', 'Jun 2025']
-    
-    revenue_data = [125, 147, 168, 192, 234, 267, 298, 334, 387, 398, 412, 425,
-                   467, 523, 578, 634, 697, 765]
-    
-    bookings_revenue = [85, 98, 115, 132, 162, 185, 208, 234, 271, 279, 289, 298,
-                       327, 367, 405, 444, 488, 536]
-    
-    subscriptions_revenue = [28, 33, 36, 42, 48, 55, 62, 69, 78, 81, 84, 87,
-                           95, 105, 116, 127, 139, 153]
-    
-    data_revenue = [12, 16, 17, 18, 24, 27, 28, 31, 38, 38, 39, 40,
-                   45, 51, 57, 63, 70, 76]
-    
-    # Create revenue chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=months, y=revenue_data,
-        mode='lines+markers',
-        name='Total Revenue',
-        line=dict(color='#667eea', width=4),
-        marker=dict(size=8)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=months, y=bookings_revenue,
-        mode='lines+markers',
-        name='Booking Commissions',
-        line=dict(color='#28a745', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=months, y=subscriptions_revenue,
-        mode='lines+markers',
-        name='Subscriptions',
-        line=dict(color='#ffc107', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=months, y=data_revenue,
-        mode='lines+markers',
-        name='Data & Analytics',
-        line=dict(color='#fd7e14', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.update_layout(
-        title="Monthly Revenue Growth ($K)",
-        xaxis_title="Month",
-        yaxis_title="Revenue ($K)",
-        hovermode='x unified',
-        height=500,
-        showlegend=True,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Market penetration and user acquisition
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 🌍 **Market Penetration**")
-        
-        # Market share data
-        market_data = pd.DataFrame({
-            'Region': ['North America', 'Europe', 'Middle East', 'Asia Pacific', 'Latin America'],
-            'Market Share (%)': [12.4, 8.7, 18.9, 5.2, 3.1],
-            'Growth Rate (%)': [45, 67, 89, 123, 156]
-        })
-        
-        fig_market = px.bar(
-            market_data, 
-            x='Region', 
-            y='Market Share (%)',
-            color='Growth Rate (%)',
-            title="Regional Market Share & Growth",
-            color_continuous_scale='Viridis'
-        )
-        
-        fig_market.update_layout(height=400)
-        st.plotly_chart(fig_market, use_container_width=True)
-    
-    with col2:
-        st.markdown("### 👥 **User Acquisition Channels**")
-        
-        # User acquisition data
-        acquisition_data = pd.DataFrame({
-            'Channel': ['Organic Search', 'Paid Social', 'Direct', 'Email', 'Referral', 'Partnerships'],
-            'Users': [28450, 18750, 12340, 8920, 6780, 4560],
-            'Cost per User': [12, 28, 0, 5, 3, 15]
-        })
-        
-        fig_acquisition = px.pie(
-            acquisition_data,
-            values='Users',
-            names='Channel',
-            title="User Acquisition by Channel",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        
-        fig_acquisition.update_layout(height=400)
-        st.plotly_chart(fig_acquisition, use_container_width=True)
-    
-    # Platform overview for investors
-    st.markdown("### 🌟 **Platform Overview**")
-    
-    st.markdown("""
-    **Comprehensive Travel Management Solution**
-    
-    Our platform represents a modern approach to travel planning and booking, combining 
-    advanced technology with user-centric design to deliver exceptional travel experiences.
-    """)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="roi-card">
-            <h4>Everything You Need in One Place</h4>
-            <p>We bring together all your travel needs under one roof. From finding the perfect flight and booking your ideal hotel to discovering amazing restaurants and creating custom itineraries that match your style, everything is seamlessly integrated. Our dedicated support team is available around the clock to help whenever you need assistance.</p>
-            
-            <p>Experience travel planning like never before with our intuitive platform that works beautifully on any device. Get personalized recommendations based on your preferences, complete your bookings with just a few simple clicks, and enjoy the confidence that comes with having everything organized in one convenient location.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="competitive-advantage">
-            <h4>Built for Your Peace of Mind</h4>
-            <p>Our advanced artificial intelligence works behind the scenes to understand your travel preferences and suggest trips that perfectly match what you're looking for. You'll always have access to the most current prices and availability, powered by a robust system designed for reliability and speed.</p>
-            
-            <p>Your security is our top priority. Every transaction is protected by enterprise-grade encryption, your personal information remains completely private and secure, and our lightning-fast booking system ensures you never miss out on great deals while maintaining the highest standards of data protection.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Platform strengths
-    st.markdown("### � **Key Performance Indicators**")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        **Designed Around You**
-        
-        Every aspect of our platform is built with you in mind. Navigate effortlessly through our clean, intuitive interface that adapts beautifully to any screen size, ensuring accessibility for all users across every device.
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Quality You Can Trust**
-        
-        We cover destinations worldwide with consistent, reliable service that puts your satisfaction first. Our commitment to continuous improvement means your experience gets better every time you travel with us.
-        """)
-    
-    with col3:
-        st.markdown("""
-        **Built to Last**
-        
-        Our modern, secure architecture processes your requests efficiently while keeping your data completely protected. Count on our reliable systems to be there when you need them most.
-        """)
-    
-    with col4:
-        st.markdown("""
-        **Always Evolving**
-        
-        We integrate the latest AI technology and continuously develop new features that adapt to changing travel needs, ensuring you always have access to the most advanced travel planning tools.
-        """)
-    
-    # Investment opportunity overview
-    st.markdown("### 🤝 **Partnership Opportunity**")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="market-size">
-            <h4>Investment Highlights</h4>
-            <p><strong>Growth-Stage Opportunity</strong></p>
-            <p>We have established a proven business model with strong market traction, backed by an experienced team that understands the travel industry inside and out. Our clear expansion path leverages advanced technology differentiation to capture emerging opportunities in the rapidly evolving travel market.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="success-story">
-            <h4>Strategic Value</h4>
-            <p><strong>Long-term Vision</strong></p>
-            <p>Our platform is positioned to achieve market leadership through sustainable competitive advantages and multiple growth opportunities. With strong operational efficiency and flexible exit strategies, we offer investors a compelling long-term value proposition in the thriving travel technology sector.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-# Helper functions for data calculation
-def calculate_package_price(duration, travelers, budget):
-    """Calculate package price based on parameters"""
-    base_price_per_day = {
-        "Budget ($500-1000)": 150,
-        "Moderate ($1000-2500)": 350,
-        "Luxury ($2500+)": 800
-    }
-    
-    daily_rate = base_price_per_day.get(budget, 350)
-    return daily_rate * duration * travelers
-
-def get_available_hotels(destination):
-    """Get available hotels for specific destination with accurate naming"""
-    
-    # Destination-specific hotel database
-    hotels_database = {
-        'China': [
-            {'id': 1, 'name': 'The Peninsula Beijing', 'location': 'Beijing, China', 'rating': 4.9, 'price': 320, 'type': 'Luxury', 'amenities': ['Spa', 'Fine Dining', 'Concierge', 'Fitness Center']},
-            {'id': 2, 'name': 'Grand Mercure Beijing Central', 'location': 'Beijing, China', 'rating': 4.5, 'price': 180, 'type': 'Business', 'amenities': ['Business Center', 'Restaurant', 'WiFi', 'Gym']},
-            {'id': 3, 'name': 'Beijing Traditional Courtyard Inn', 'location': 'Beijing, China', 'rating': 4.2, 'price': 85, 'type': 'Boutique', 'amenities': ['Traditional Architecture', 'Cultural Tours', 'WiFi', 'Tea House']},
-            {'id': 4, 'name': 'Shangri-La Hotel Shanghai', 'location': 'Shanghai, China', 'rating': 4.8, 'price': 290, 'type': 'Luxury Resort', 'amenities': ['River Views', 'Multiple Restaurants', 'Spa', 'Shopping Mall Access']}
-        ],
-        'Paris, France': [
-            {'id': 5, 'name': 'Hotel Ritz Paris', 'location': 'Paris, France', 'rating': 4.9, 'price': 450, 'type': 'Palace Hotel', 'amenities': ['Michelin Restaurants', 'Luxury Spa', 'Personal Shopping', 'Historic Elegance']},
-            {'id': 6, 'name': 'Hotel Malte Opera Paris', 'location': 'Paris, France', 'rating': 4.4, 'price': 180, 'type': 'Historic Hotel', 'amenities': ['Near Opera House', 'French Restaurant', 'WiFi', 'Concierge']},
-            {'id': 7, 'name': 'Hotel des Jeunes Paris', 'location': 'Paris, France', 'rating': 4.1, 'price': 75, 'type': 'Budget Boutique', 'amenities': ['Marais District', 'Continental Breakfast', 'Tourist Info', 'Metro Access']},
-            {'id': 8, 'name': 'Hotel Plaza Athénée', 'location': 'Paris, France', 'rating': 4.8, 'price': 380, 'type': 'Luxury', 'amenities': ['Eiffel Tower Views', 'Haute Couture Shopping', 'Michelin Dining', 'Spa']}
-        ],
-        'Tokyo, Japan': [
-            {'id': 9, 'name': 'The Ritz-Carlton Tokyo', 'location': 'Tokyo, Japan', 'rating': 4.9, 'price': 420, 'type': 'Luxury Skyscraper', 'amenities': ['City Views', 'Japanese Hospitality', 'Multiple Restaurants', 'Club Lounge']},
-            {'id': 10, 'name': 'Shibuya Excel Hotel Tokyu', 'location': 'Tokyo, Japan', 'rating': 4.3, 'price': 160, 'type': 'Business Hotel', 'amenities': ['Shibuya Station Access', 'City Views', 'Restaurant', 'Business Center']},
-            {'id': 11, 'name': 'K\'s House Tokyo Oasis', 'location': 'Tokyo, Japan', 'rating': 4.0, 'price': 45, 'type': 'Hostel', 'amenities': ['Budget Friendly', 'Social Atmosphere', 'Kitchen Access', 'Tourist Information']},
-            {'id': 12, 'name': 'Imperial Hotel Tokyo', 'location': 'Tokyo, Japan', 'rating': 4.7, 'price': 280, 'type': 'Historic Luxury', 'amenities': ['Imperial Palace Views', 'Traditional Service', 'Multiple Dining', 'Spa']}
-        ],
-        'Dubai, UAE': [
-            {'id': 13, 'name': 'Burj Al Arab Jumeirah', 'location': 'Dubai, UAE', 'rating': 4.9, 'price': 850, 'type': '7-Star Luxury', 'amenities': ['Iconic Sail Design', 'Private Beach', 'Butler Service', 'Helipad Access']},
-            {'id': 14, 'name': 'Al Seef Heritage Hotel', 'location': 'Dubai, UAE', 'rating': 4.6, 'price': 200, 'type': 'Heritage Boutique', 'amenities': ['Traditional Architecture', 'Dubai Creek Views', 'Cultural Experiences', 'Souk Access']},
-            {'id': 15, 'name': 'Rove Downtown Dubai', 'location': 'Dubai, UAE', 'rating': 4.4, 'price': 120, 'type': 'Modern Budget', 'amenities': ['Downtown Location', 'Burj Khalifa Views', 'Modern Design', 'Fitness Center']},
-            {'id': 16, 'name': 'Atlantis The Palm', 'location': 'Dubai, UAE', 'rating': 4.7, 'price': 380, 'type': 'Resort', 'amenities': ['Aquaventure Waterpark', 'Lost Chambers Aquarium', 'Private Beach', 'Multiple Restaurants']}
-        ],
-        'Beirut, Lebanon': [
-            {'id': 17, 'name': 'Four Seasons Hotel Beirut', 'location': 'Beirut, Lebanon', 'rating': 4.8, 'price': 280, 'type': 'Luxury', 'amenities': ['Mediterranean Views', 'Spa', 'Fine Dining', 'Pool']},
-            {'id': 18, 'name': 'Le Gray Beirut', 'location': 'Beirut, Lebanon', 'rating': 4.6, 'price': 220, 'type': 'Boutique', 'amenities': ['Downtown Location', 'Rooftop Pool', 'Modern Design', 'Gourmet Restaurant']},
-            {'id': 19, 'name': 'Saifi Suites', 'location': 'Beirut, Lebanon', 'rating': 4.2, 'price': 120, 'type': 'Apartment Hotel', 'amenities': ['Extended Stay', 'Kitchen Facilities', 'Historic District', 'WiFi']},
-            {'id': 20, 'name': 'InterContinental Phoenicia Beirut', 'location': 'Beirut, Lebanon', 'rating': 4.5, 'price': 180, 'type': 'Business', 'amenities': ['Business Center', 'Multiple Restaurants', 'Pool', 'Marina Views']}
-        ],
-        'New York, USA': [
-            {'id': 21, 'name': 'The Plaza Hotel', 'location': 'New York, USA', 'rating': 4.8, 'price': 450, 'type': 'Historic Luxury', 'amenities': ['Central Park Views', 'Luxury Shopping', 'Fine Dining', 'Spa']},
-            {'id': 22, 'name': 'Pod Hotels Times Square', 'location': 'New York, USA', 'rating': 4.2, 'price': 140, 'type': 'Modern Budget', 'amenities': ['Times Square Location', 'Compact Design', 'Rooftop Bar', 'Tech Amenities']},
-            {'id': 23, 'name': 'The High Line Hotel', 'location': 'New York, USA', 'rating': 4.5, 'price': 220, 'type': 'Boutique', 'amenities': ['Chelsea Location', 'Historic Building', 'Garden', 'Local Atmosphere']},
-            {'id': 24, 'name': 'St. Regis New York', 'location': 'New York, USA', 'rating': 4.9, 'price': 520, 'type': 'Luxury', 'amenities': ['Butler Service', 'Fifth Avenue', 'King Cole Bar', 'Bespoke Service']}
-        ],
-        'London, England': [
-            {'id': 25, 'name': 'The Savoy London', 'location': 'London, England', 'rating': 4.9, 'price': 420, 'type': 'Historic Luxury', 'amenities': ['Thames Views', 'Art Deco Design', 'Famous Bar', 'Royal Heritage']},
-            {'id': 26, 'name': 'Premier Inn London', 'location': 'London, England', 'rating': 4.3, 'price': 95, 'type': 'Budget Chain', 'amenities': ['Consistent Quality', 'Central Locations', 'Family Friendly', 'Good Value']},
-            {'id': 27, 'name': 'Zetter Townhouse Piccadilly', 'location': 'London, England', 'rating': 4.6, 'price': 180, 'type': 'Boutique', 'amenities': ['Victorian Charm', 'Cocktail Lounge', 'Central Location', 'Unique Design']},
-            {'id': 28, 'name': 'Claridge\'s', 'location': 'London, England', 'rating': 4.8, 'price': 380, 'type': 'Art Deco Luxury', 'amenities': ['Mayfair Location', 'Afternoon Tea', 'Michelin Dining', 'Royal Connections']}
-        ]
-    }
-    
-    # Find hotels for specific destination
-    destination_lower = destination.lower()
-    
-    # Check for exact matches or partial matches
-    for country, hotels in hotels_database.items():
-        if country.lower() in destination_lower or any(city.lower() in destination_lower for city in country.split(', ')):
-            return hotels
-    
-    # Check if destination contains any city names
-    city_mappings = {
-        'beijing': 'China',
-        'shanghai': 'China', 
-        'paris': 'Paris, France',
-        'tokyo': 'Tokyo, Japan',
-        'dubai': 'Dubai, UAE',
-        'beirut': 'Beirut, Lebanon',
-        'new york': 'New York, USA',
-        'london': 'London, England',
-        'sydney': 'Australia',
-        'rome': 'Italy',
-        'barcelona': 'Spain'
-    }
-    
-    for city, country in city_mappings.items():
-        if city in destination_lower:
-            if country in hotels_database:
-                return hotels_database[country]
-    
-    # Default fallback - create generic hotels with destination name
-    destination_name = destination.split(',')[0]  # Get first part of destination
-    return [
-        {'id': 999, 'name': f'{destination_name} Grand Hotel', 'location': destination, 'rating': 4.5, 'price': 180, 'type': 'City Hotel', 'amenities': ['WiFi', 'Restaurant', 'Pool', 'Fitness Center']},
-        {'id': 998, 'name': f'{destination_name} Budget Inn', 'location': destination, 'rating': 4.0, 'price': 85, 'type': 'Budget Hotel', 'amenities': ['WiFi', 'Continental Breakfast', 'Central Location']},
-        {'id': 997, 'name': f'{destination_name} Luxury Resort', 'location': destination, 'rating': 4.7, 'price': 320, 'type': 'Resort', 'amenities': ['Spa', 'Fine Dining', 'Concierge', 'Pool']},
-        {'id': 996, 'name': f'{destination_name} Business Hotel', 'location': destination, 'rating': 4.3, 'price': 140, 'type': 'Business', 'amenities': ['Business Center', 'Meeting Rooms', 'WiFi', 'Restaurant']}
-    ]
-
-def get_available_restaurants(city):
-    """Get available restaurants for city"""
-    return [
-        {'id': 1, 'name': 'Tawlet', 'cuisine': 'Lebanese Traditional', 'rating': 4.7, 'location': f'{city} Downtown', 'price_range': '$$', 'deposit': 15},
-        {'id': 2, 'name': 'Em Sherif', 'cuisine': 'Lebanese Fine Dining', 'rating': 4.9, 'location': f'{city} Center', 'price_range': '$$$$', 'deposit': 25},
-        {'id': 3, 'name': 'Urbanista', 'cuisine': 'International', 'rating': 4.6, 'location': f'{city} Business District', 'price_range': '$$$', 'deposit': 20},
-        {'id': 4, 'name': 'Babel Bay', 'cuisine': 'Mediterranean', 'rating': 4.5, 'location': f'{city} Marina', 'price_range': '$$$', 'deposit': 18}
-    ]
-
-def get_activities_for_destination(destination):
-    """Get activities for destination"""
-    activities_map = {
-        "Beirut, Lebanon": [
-            "Visit National Museum of Beirut",
-            "Explore Pigeon Rocks (Raouche)",
-            "Walk through Beirut Souks",
-            "Tour Mohammad Al-Amin Mosque",
-            "Stroll along Corniche Beirut",
-            "Day trip to Jeita Grotto",
-            "Visit Byblos Castle",
-            "Explore Baalbek Temples"
-        ],
-        "Dubai, UAE": [
-            "Visit Burj Khalifa",
-            "Explore Dubai Mall",
-            "Desert Safari Adventure",
-            "Visit Dubai Marina",
-            "Tour Gold and Spice Souks",
-            "Palm Jumeirah Excursion"
-        ]
-    }
-    return activities_map.get(destination, ["City Tour", "Cultural Experience", "Local Cuisine Tasting"])
-    """Get available hotels for destination"""
-    # This would query the actual database
-    # For demo, returning mock data
-    return [
-        {'id': 1, 'name': 'Four Seasons Hotel', 'location': destination, 'rating': 4.8, 'price': 350, 'type': 'Luxury'},
-        {'id': 2, 'name': 'Grand Beirut Hotel', 'location': destination, 'rating': 4.5, 'price': 220, 'type': 'Business'},
-        {'id': 3, 'name': 'City Center Inn', 'location': destination, 'rating': 4.2, 'price': 120, 'type': 'Budget'},
-        {'id': 4, 'name': 'Seaside Resort', 'location': destination, 'rating': 4.6, 'price': 280, 'type': 'Resort'}
-    ]
-
-def get_available_restaurants(city):
-    """Get available restaurants for city"""
-    return [
-        {'id': 1, 'name': 'Tawlet', 'cuisine': 'Lebanese Traditional', 'rating': 4.7, 'location': f'{city} Downtown', 'price_range': '$$', 'deposit': 15},
-        {'id': 2, 'name': 'Em Sherif', 'cuisine': 'Lebanese Fine Dining', 'rating': 4.9, 'location': f'{city} Center', 'price_range': '$$$$', 'deposit': 25},
-        {'id': 3, 'name': 'Urbanista', 'cuisine': 'International', 'rating': 4.6, 'location': f'{city} Business District', 'price_range': '$$$', 'deposit': 20},
-        {'id': 4, 'name': 'Babel Bay', 'cuisine': 'Mediterranean', 'rating': 4.5, 'location': f'{city} Marina', 'price_range': '$$$', 'deposit': 18}
-    ]
-
-def get_activities_for_destination(destination):
-    """Get activities for destination"""
-    activities_map = {
-        "Beirut, Lebanon": [
-            "Visit National Museum of Beirut",
-            "Explore Pigeon Rocks (Raouche)",
-            "Walk through Beirut Souks",
-            "Tour Mohammad Al-Amin Mosque",
-            "Stroll along Corniche Beirut",
-            "Day trip to Jeita Grotto",
-            "Visit Byblos Castle",
-            "Explore Baalbek Temples"
-        ],
-        "Dubai, UAE": [
-            "Visit Burj Khalifa",
-            "Explore Dubai Mall",
-            "Desert Safari Adventure",
-            "Visit Dubai Marina",
-            "Tour Gold and Spice Souks",
-            "Palm Jumeirah Excursion"
-        ]
-    }
-    return activities_map.get(destination, ["City Tour", "Cultural Experience", "Local Cuisine Tasting"])
-
-def calculate_package_price(duration, travelers, budget):
-    """Calculate package price based on parameters"""
-    base_price_per_day = {
-        "Budget ($500-1000)": 150,
-        "Moderate ($1000-2500)": 350,
-        "Luxury ($2500+)": 800
-    }
-    
-    daily_rate = base_price_per_day.get(budget, 350)
-    return daily_rate * duration * travelers
-
-# Main application navigation
-def main():
-    """Main application with enhanced navigation"""
-    
-    # Check for payment success callback from Stripe
-    query_params = st.query_params
-    if 'payment' in query_params:
-        payment_status = query_params['payment']
-        if payment_status == 'success':
-            session_id = query_params.get('session_id')
-            if session_id and ENHANCED_FEATURES_AVAILABLE:
-                try:
-                    # Handle successful payment
-                    payment_processor = EnhancedPaymentProcessor()
-                    success_result = payment_processor.handle_payment_success(session_id)
-                    
-                    if success_result['success'] and success_result['payment_confirmed']:
-                        payment_processor.display_payment_success(success_result['confirmation_details'])
-                        
-                        # Show booking details
-                        st.markdown("---")
-                        st.markdown("### 📋 **Booking Confirmation Details**")
-                        
-                        confirmation = success_result['confirmation_details']
-                        booking_meta = confirmation.get('booking_metadata', {})
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.markdown(f"""
-                            **Booking ID:** {booking_meta.get('booking_id', 'N/A')}  
-                            **Payment ID:** {confirmation['payment_id']}  
-                            **Amount:** ${confirmation['amount_paid']:,.2f} {confirmation['currency']}  
-                            **Status:** ✅ Confirmed
-                            """)
-                        
-                        with col2:
-                            st.markdown(f"""
-                            **Customer:** {confirmation['customer_email']}  
-                            **Date:** {confirmation['processed_at'].strftime('%Y-%m-%d %H:%M')}  
-                            **Method:** Stripe Secure Checkout  
-                            **Receipt:** Check your email
-                            """)
-                        
-                        st.success("🎉 Your travel booking is confirmed! Check your email for detailed itinerary.")
-                        return  # Exit early to show only confirmation
-                        
-                    else:
-                        st.error(f"❌ Payment verification failed: {success_result.get('error', 'Unknown error')}")
-                        
-                except Exception as e:
-                    st.error(f"❌ Error processing payment confirmation: {str(e)}")
-                    
-            else:
-                st.success("🎉 Payment Successful!")
-                if session_id:
-                    st.info(f"Session ID: {session_id}")
-                    
-        elif payment_status == 'cancelled':
-            st.warning("❌ Payment Cancelled")
-            st.info("Your payment was cancelled. You can try again anytime.")
-            
-            # Clear any stored payment session data
-            if 'stripe_session_id' in st.session_state:
-                del st.session_state.stripe_session_id
-            if 'booking_id' in st.session_state:
-                del st.session_state.booking_id
-    
-    # Initialize current page
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = "main"
-    
-    # Enhanced sidebar navigation
-    st.sidebar.markdown("""
-    <div style="text-align: center; padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px; color: white; margin-bottom: 1rem;">
-        <h2>🌍 AI Travel</h2>
-        <p>Enhanced Platform</p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Enhanced sidebar navigation
+    st.sidebar.markdown("""
+    <div style="text-align: center; padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px; color: white; margin-bottom: 1rem;">
+        <h2>🌍 AI Travel</h2>
+        <p>Enhanced Platform</p>
+    </div>
+    """, unsafe_allow_html=True)
     
     # Navigation menu
-    pages = {
-        "🏠 Home": "main",
-        "🏨 Hotel Booking": "hotel_booking",
-        "🍽️ Restaurant Booking": "restaurant_booking",
-        "📦 Travel Packages": "package_creation",
-        "📋 Booking History": "booking_history",
-        "📊 Analytics": "analytics",
-        "⚙️ Settings": "settings"
-    }
+    registry = get_page_registry()
+    pages = registry.labels
     
     selected_page = st.sidebar.radio("🧭 **Navigation**", list(pages.keys()))
     st.session_state.current_page = pages[selected_page]
@@ -6086,7 +802,7 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🤖 **Enhanced AI Features**")
     
-    if AI_ENHANCED:
+    if ai_features_available():
         enhanced_mode = st.sidebar.toggle("🧠 Enhanced AI Mode", value=False, help="Enable conversation memory, psychology analysis, and real-time validation")
         
         if enhanced_mode:
@@ -6148,22 +864,9 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Page routing
-    if st.session_state.current_page == "main":
-        main_page()
-    elif st.session_state.current_page == "hotel_booking":
-        hotel_booking_page()
-    elif st.session_state.current_page == "restaurant_booking":
-        restaurant_booking_page()
-    elif st.session_state.current_page == "package_creation":
-        package_creation_page()
-    elif st.session_state.current_page == "booking_history":
-        booking_history_page()
-    elif st.session_state.current_page == "analytics":
-        analytics_dashboard()
-    elif st.session_state.current_page == "settings":
-        st.title("⚙️ Settings")
-        st.info("🔧 Settings page coming soon!")
+    # Page routing - the page module is imported the first time it is selected
+    registry.render(st.session_state.current_page)
+    registry.record_rerun(st.session_state.current_page, _RERUN_STARTED)
 
 if __name__ == "__main__":
     main()
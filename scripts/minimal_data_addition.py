@@ -4,9 +4,17 @@ Add hotels and restaurants with minimal required fields only
 """
 
 import os
-import datetime
 from dotenv import load_dotenv
-from supabase import create_client, Client
+import sys
+from pathlib import Path
+from supabase import Client
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api_integration.supabase.client_factory import get_supabase_client
+from src.api_integration.supabase.supabase_service import SupabaseService
+from src.database.bulk_loader import BulkLoader, read_seed_file
 
 # Load environment
 load_dotenv()
@@ -15,7 +23,10 @@ load_dotenv()
 supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_KEY")
 
-supabase: Client = create_client(supabase_url, supabase_key)
+supabase: Client = get_supabase_client(supabase_url, supabase_key)
+loader = BulkLoader(supabase)
+
+SEED_DIR = Path(__file__).parent.parent / "src" / "database" / "seeds" / "minimal"
 
 def inspect_table_columns(table_name):
     """Check what columns exist in a table by examining a sample record"""
@@ -60,24 +71,8 @@ def add_minimal_hotels():
         print("❌ Could not determine hotel table structure")
         return False
     
-    # Create minimal hotel records with only safe fields
-    minimal_hotels = [
-        {
-            "name": "Four Seasons Hotel Beirut",
-            "description": "Luxury hotel in the heart of Beirut",
-            "created_at": datetime.datetime.now().isoformat()
-        },
-        {
-            "name": "Kyoto Traditional Ryokan",
-            "description": "Authentic Japanese ryokan experience",
-            "created_at": datetime.datetime.now().isoformat()
-        },
-        {
-            "name": "Burj Al Arab Dubai",
-            "description": "Iconic sail-shaped luxury hotel",
-            "created_at": datetime.datetime.now().isoformat()
-        }
-    ]
+    # Minimal hotel records with only safe fields
+    minimal_hotels = list(read_seed_file(SEED_DIR / "hotels.json"))
     
     # Filter to only include fields that exist
     safe_hotels = []
@@ -89,8 +84,8 @@ def add_minimal_hotels():
         safe_hotels.append(safe_hotel)
     
     try:
-        result = supabase.table("hotels").upsert(safe_hotels).execute()
-        print(f"✅ Successfully added {len(safe_hotels)} hotels")
+        report = loader.load_rows("hotels", safe_hotels, natural_key="name")
+        print(f"✅ Successfully loaded {report}")
         return True
     except Exception as e:
         print(f"❌ Error adding hotels: {e}")
@@ -98,8 +93,8 @@ def add_minimal_hotels():
         # Try with just name
         basic_hotels = [{"name": hotel["name"]} for hotel in minimal_hotels]
         try:
-            result = supabase.table("hotels").upsert(basic_hotels).execute()
-            print(f"✅ Successfully added {len(basic_hotels)} hotels (name only)")
+            report = loader.load_rows("hotels", basic_hotels, natural_key="name")
+            print(f"✅ Successfully loaded {report} (name only)")
             return True
         except Exception as e2:
             print(f"❌ Even basic hotel insertion failed: {e2}")
@@ -116,27 +111,8 @@ def add_minimal_restaurants():
         print("❌ Could not determine restaurant table structure")
         return False
     
-    # Create minimal restaurant records
-    minimal_restaurants = [
-        {
-            "name": "Tawlet Beirut",
-            "cuisine_type": "Lebanese Traditional",
-            "description": "Authentic Lebanese home cooking",
-            "created_at": datetime.datetime.now().isoformat()
-        },
-        {
-            "name": "Kikunoi Kyoto",
-            "cuisine_type": "Kaiseki Traditional",
-            "description": "3-Michelin-star kaiseki restaurant",
-            "created_at": datetime.datetime.now().isoformat()
-        },
-        {
-            "name": "Nobu Dubai",
-            "cuisine_type": "Japanese Fusion",
-            "description": "World-renowned Japanese-Peruvian fusion",
-            "created_at": datetime.datetime.now().isoformat()
-        }
-    ]
+    # Minimal restaurant records
+    minimal_restaurants = list(read_seed_file(SEED_DIR / "restaurants.json"))
     
     # Filter to only include fields that exist
     safe_restaurants = []
@@ -148,8 +124,8 @@ def add_minimal_restaurants():
         safe_restaurants.append(safe_restaurant)
     
     try:
-        result = supabase.table("restaurants").upsert(safe_restaurants).execute()
-        print(f"✅ Successfully added {len(safe_restaurants)} restaurants")
+        report = loader.load_rows("restaurants", safe_restaurants, natural_key="name")
+        print(f"✅ Successfully loaded {report}")
         return True
     except Exception as e:
         print(f"❌ Error adding restaurants: {e}")
@@ -160,8 +136,8 @@ def add_minimal_restaurants():
             for restaurant in minimal_restaurants
         ]
         try:
-            result = supabase.table("restaurants").upsert(basic_restaurants).execute()
-            print(f"✅ Successfully added {len(basic_restaurants)} restaurants (basic)")
+            report = loader.load_rows("restaurants", basic_restaurants, natural_key="name")
+            print(f"✅ Successfully loaded {report} (basic)")
             return True
         except Exception as e2:
             print(f"❌ Even basic restaurant insertion failed: {e2}")
@@ -173,17 +149,14 @@ def main():
     print("="*50)
     
     # Check current status
+    service = SupabaseService(client=supabase)
     try:
-        result = supabase.table("hotels").select("*", count="exact").execute()
-        hotels_count = result.count if hasattr(result, 'count') else len(result.data)
-        print(f"📊 Current hotels: {hotels_count}")
+        print(f"📊 Current hotels: {service.count('hotels')}")
     except Exception as e:
         print(f"❌ Hotels check: {e}")
     
     try:
-        result = supabase.table("restaurants").select("*", count="exact").execute()
-        restaurants_count = result.count if hasattr(result, 'count') else len(result.data)
-        print(f"📊 Current restaurants: {restaurants_count}")
+        print(f"📊 Current restaurants: {service.count('restaurants')}")
     except Exception as e:
         print(f"❌ Restaurants check: {e}")
     
@@ -8,7 +8,8 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import Client
+from src.api_integration.supabase.client_factory import get_supabase_client as get_shared_client
 import json
 
 # Load environment variables
@@ -26,7 +27,7 @@ def get_supabase_client():
             return None
             
         print(f"🔗 Connecting to: {supabase_url}")
-        return create_client(supabase_url, supabase_key)
+        return get_shared_client(supabase_url, supabase_key)
         
     except Exception as e:
         print(f"❌ Failed to connect to Supabase: {e}")
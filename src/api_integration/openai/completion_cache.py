@@ -0,0 +1,250 @@
+"""
+🗃️ Completion Cache
+Persistent, LRU-bounded cache for OpenAI chat completions
+
+Requests are keyed by a SHA-256 of the canonical JSON of model, messages,
+parameters and use case, so the same prompt is answered from SQLite instead of
+the API. Entries expire after a TTL chosen per use case (package copy keeps for
+a day, free-form chat for an hour); the use case is part of the key so one use
+case never shortens or stretches another's entry. The least recently used rows
+are evicted once the cache holds more than max_entries.
+
+With a similarity threshold set, an exact miss falls back to near-duplicate
+matching: prompts are turned into local hashed bag-of-words vectors and the
+closest cached prompt with the same model, parameters and use case is reused
+when its cosine similarity clears the threshold. Hits, misses and the API time
+they saved are counted.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+import numpy as np
+
+# Seconds a cached completion stays valid, by use case
+DEFAULT_TTLS = {
+    "package": 24 * 3600.0,
+    "itinerary": 12 * 3600.0,
+    "agent": 6 * 3600.0,
+    "chat": 3600.0,
+    "default": 3600.0,
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def canonical_key(model: str, messages: List[Dict[str, Any]], params: Optional[Dict[str, Any]] = None) -> str:
+    """SHA-256 of the request; key order, whitespace around content and unset parameters don't matter"""
+    normalized = [{key: (value.strip() if isinstance(value, str) else value)
+                   for key, value in sorted(message.items())} for message in messages]
+    payload = {"model": model, "messages": normalized,
+               "params": {key: value for key, value in sorted((params or {}).items()) if value is not None}}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":"),
+                                     default=str).encode()).hexdigest()
+
+
+class HashedTextEmbedder:
+    """Local, dependency-free text vectors: hashed word unigrams and bigrams, L2-normalised float32"""
+
+    def __init__(self, dimensions: int = 1024):
+        self.dimensions = dimensions
+
+    @property
+    def model(self) -> str:
+        return f"hashed-{self.dimensions}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = _TOKEN.findall(text.lower())
+            for gram in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+                digest = hashlib.blake2b(gram.encode(), digest_size=8).digest()
+                vectors[row, int.from_bytes(digest, "little") % self.dimensions] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class CompletionCache:
+    """SQLite-backed chat completion cache with LRU eviction and per-use-case TTLs"""
+
+    def __init__(self, db_path: str = "completion_cache.db", max_entries: int = 10000,
+                 ttls: Optional[Dict[str, float]] = None, similarity_threshold: Optional[float] = None,
+                 embedder=None, clock: Callable[[], float] = time.time):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.similarity_threshold = similarity_threshold
+        self.embedder = embedder or (HashedTextEmbedder() if similarity_threshold else None)
+        self.clock = clock
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0,
+                      "saved_seconds": 0.0, "api_seconds": 0.0}
+        self._lock = threading.Lock()
+        # scope -> (keys, vectors) for near-duplicate search; loaded from SQLite on first use
+        self._vectors: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_database()
+
+    def init_database(self):
+        """Create the completions table and its eviction and scope indexes"""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS completions (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    use_case TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    vector BLOB,
+                    latency REAL NOT NULL DEFAULT 0,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_completions_lru ON completions(last_used_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_completions_scope ON completions(scope, expires_at)")
+
+    # === LOOKUP ===
+
+    def get_or_create(self, model: str, messages: List[Dict[str, Any]], create: Callable[[], str],
+                      params: Optional[Dict[str, Any]] = None, use_case: str = "default") -> str:
+        """Cached completion for the request, calling create() (and caching its result) on a miss"""
+        scoped_params = {**(params or {}), "use_case": use_case}
+        key = canonical_key(model, messages, scoped_params)
+        scope = canonical_key(model, [], scoped_params)
+        cached = self.get(key, scope, messages)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        response = create()
+        latency = time.perf_counter() - started
+        with self._lock:
+            self.stats["misses"] += 1
+            self.stats["api_seconds"] += latency
+        if response is not None:  # tool calls come back without content
+            self.put(key, scope, use_case, messages, response, latency)
+        return response
+
+    def get(self, key: str, scope: str, messages: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+        """Exact hit, else (with a threshold) the nearest cached prompt in the same scope"""
+        now = self.clock()
+        with self._lock:
+            row = self._touch(key, now)
+            if row is None and self.similarity_threshold and messages:
+                match = self._nearest(scope, self._prompt_vector(messages), now)
+                if match is not None:
+                    row = self._touch(match, now)
+                    if row is not None:
+                        self.stats["semantic_hits"] += 1
+            if row is None:
+                return None
+            self.stats["hits"] += 1
+            self.stats["saved_seconds"] += row[1]
+            return row[0]
+
+    def put(self, key: str, scope: str, use_case: str, messages: List[Dict[str, Any]], response: str,
+            latency: float = 0.0):
+        """Store a completion and evict the least recently used rows beyond max_entries"""
+        now = self.clock()
+        ttl = self.ttls.get(use_case, self.ttls["default"])
+        vector = self._prompt_vector(messages) if self.embedder else None
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO completions (key, scope, use_case, response, vector, latency,
+                                                   created_at, expires_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, scope, use_case, response, vector.tobytes() if vector is not None else None,
+                  latency, now, now + ttl, now))
+            if vector is not None and scope in self._vectors:
+                keys, matrix = self._vectors[scope]
+                self._vectors[scope] = (keys + [key], np.vstack([matrix, vector[None, :]]))
+            self._evict()
+
+    def _touch(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        row = self._conn.execute("SELECT response, latency FROM completions WHERE key = ? AND expires_at > ?",
+                                 (key, now)).fetchone()
+        if row is not None:
+            self._conn.execute("UPDATE completions SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        return row
+
+    def _nearest(self, scope: str, vector: np.ndarray, now: float) -> Optional[str]:
+        if scope not in self._vectors:
+            rows = self._conn.execute("SELECT key, vector FROM completions WHERE scope = ? AND expires_at > ? "
+                                      "AND vector IS NOT NULL", (scope, now)).fetchall()
+            matrix = (np.vstack([np.frombuffer(blob, dtype=np.float32) for _, blob in rows]) if rows
+                      else np.zeros((0, vector.shape[0]), dtype=np.float32))
+            self._vectors[scope] = ([key for key, _ in rows], matrix)
+        keys, matrix = self._vectors[scope]
+        if not keys:
+            return None
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        # Evicted or expired rows stay in the index until they are looked up; _touch skips them
+        return keys[best] if scores[best] >= self.similarity_threshold else None
+
+    def _prompt_vector(self, messages: List[Dict[str, Any]]) -> np.ndarray:
+        text = "\n".join(str(message.get("content") or "") for message in messages)
+        return np.asarray(self.embedder.embed([text])[0], dtype=np.float32)
+
+    def _evict(self):
+        overflow = self._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute("DELETE FROM completions WHERE key IN (SELECT key FROM completions "
+                               "ORDER BY last_used_at LIMIT ?)", (overflow,))
+            self.stats["evictions"] += overflow
+
+    # === MAINTENANCE ===
+
+    def purge_expired(self) -> int:
+        """Delete expired rows; returns how many were removed"""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM completions WHERE expires_at <= ?", (self.clock(),)).rowcount
+            self._vectors.clear()
+            return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit rate and the API time saved by hits"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+            stats = dict(self.stats, entries=entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def summary(self) -> str:
+        stats = self.get_stats()
+        return (f"🗃️ {stats['hits']} hits ({stats['semantic_hits']} near-duplicate), {stats['misses']} misses "
+                f"- {stats['hit_rate']:.0%} hit rate, {stats['saved_seconds']:.1f}s of API time saved, "
+                f"{stats['entries']} entries")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+_singleton_lock = threading.Lock()
+
+
+def get_completion_cache() -> CompletionCache:
+    """Process-wide completion cache configured from the environment"""
+    global _cache
+    with _singleton_lock:
+        if _cache is None:
+            threshold = os.getenv("OPENAI_CACHE_SIMILARITY")
+            _cache = CompletionCache(
+                db_path=os.getenv("OPENAI_CACHE_DB", "completion_cache.db"),
+                max_entries=int(os.getenv("OPENAI_CACHE_MAX_ENTRIES", "10000")),
+                similarity_threshold=float(threshold) if threshold else None
+            )
+    return _cache
@@ -0,0 +1,310 @@
+"""
+🧭 Embedding Store
+Batched embeddings with a persistent, memory-mapped float32 vector store
+
+Texts are keyed by a SHA-256 of the embedder's model name and the text, so a
+catalog entry (activity, hotel, restaurant description) is embedded once and
+read back from disk afterwards. Vectors live in a float32 file opened with
+numpy.memmap next to a file of raw 32-byte content hashes; a small JSON header
+records the model, dimensions and row count. The file grows by doubling.
+
+Embedders are pluggable: OpenAIEmbedder splits a list into requests within the
+provider's limits (2048 inputs and ~300k tokens per request) and sends them
+concurrently; TfidfEmbedder (scikit-learn, e.g. EnhancedPsychologyAnalyst's
+vectorizer) and HashedTextEmbedder (numpy only) embed locally for offline use.
+
+Usage:
+    python src/api_integration/openai/embedding_store.py   # local embedder benchmark
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.api_integration.openai.completion_cache import HashedTextEmbedder
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# OpenAI embeddings endpoint limits
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_REQUEST = 300000
+MAX_TOKENS_PER_INPUT = 8191
+CHARS_PER_TOKEN = 3  # errs on the side of more tokens; no tokenizer dependency
+
+# Client errors (by class name) worth another attempt
+RETRYABLE_ERRORS = {"RateLimitError", "APIConnectionError", "APITimeoutError", "InternalServerError"}
+
+HASH_BYTES = 32
+
+
+def content_hash(model: str, text: str) -> bytes:
+    """Store key for a text embedded by a given model"""
+    return hashlib.sha256(f"{model}\n{text}".encode()).digest()
+
+
+# === VECTOR STORE ===
+
+class VectorStore:
+    """Append-only float32 vectors in a memory-mapped file, looked up by content hash"""
+
+    def __init__(self, directory: str, initial_capacity: int = 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.initial_capacity = initial_capacity
+        self._lock = threading.RLock()
+        self._meta_path = self.directory / "meta.json"
+        meta = json.loads(self._meta_path.read_text()) if self._meta_path.exists() else {}
+        self.model = meta.get("model")
+        self.dimensions = meta.get("dimensions")
+        self.count = meta.get("count", 0)
+        self.capacity = meta.get("capacity", 0)
+        self._vectors = self._keys = None
+        self._rows: Dict[bytes, int] = {}
+        if self.dimensions:
+            self._open()
+            self._rows = {bytes(self._keys[row]): row for row in range(self.count)}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def lookup(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Stored vectors for the keys that have one"""
+        with self._lock:
+            return {key: np.array(self._vectors[self._rows[key]]) for key in keys if key in self._rows}
+
+    def add(self, keys: List[bytes], vectors: np.ndarray, model: str):
+        """Append vectors for new keys (keys already stored are left alone)"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self.dimensions is None:
+                self.model, self.dimensions = model, int(vectors.shape[1])
+            if vectors.shape[1] != self.dimensions or model != self.model:
+                raise ValueError(f"Store holds {self.dimensions}-d vectors from {self.model}, "
+                                 f"got {vectors.shape[1]}-d from {model}")
+            fresh = [(key, vector) for key, vector in zip(keys, vectors) if key not in self._rows]
+            if not fresh:
+                return
+            self._reserve(self.count + len(fresh))
+            for key, vector in fresh:
+                self._vectors[self.count] = vector
+                self._keys[self.count] = np.frombuffer(key, dtype=np.uint8)
+                self._rows[key] = self.count
+                self.count += 1
+            self.flush()
+
+    def search(self, query: np.ndarray, k: int = 10) -> List[Tuple[bytes, float]]:
+        """Top-k stored keys by cosine similarity to the query vector"""
+        with self._lock:
+            if not self.count:
+                return []
+            matrix = self._vectors[:self.count]
+            norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query) or 1.0)
+            scores = (matrix @ np.asarray(query, dtype=np.float32)) / np.where(norms == 0, 1.0, norms)
+            top = np.argsort(-scores)[:k]
+            return [(bytes(self._keys[row]), float(scores[row])) for row in top]
+
+    def flush(self):
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._keys.flush()
+            self._meta_path.write_text(json.dumps({"model": self.model, "dimensions": self.dimensions,
+                                                   "count": self.count, "capacity": self.capacity}))
+
+    def _reserve(self, rows: int):
+        if rows <= self.capacity:
+            return
+        self.capacity = max(rows, self.capacity * 2, self.initial_capacity)
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._keys.flush()
+            self._vectors = self._keys = None
+        for name, row_bytes in (("vectors.f32", self.dimensions * 4), ("keys.bin", HASH_BYTES)):
+            with open(self.directory / name, "ab") as handle:
+                handle.truncate(self.capacity * row_bytes)
+        self._open()
+
+    def _open(self):
+        self._vectors = np.memmap(self.directory / "vectors.f32", dtype=np.float32, mode="r+",
+                                  shape=(self.capacity, self.dimensions))
+        self._keys = np.memmap(self.directory / "keys.bin", dtype=np.uint8, mode="r+",
+                               shape=(self.capacity, HASH_BYTES))
+
+
+# === EMBEDDERS ===
+
+class OpenAIEmbedder:
+    """Embeddings API in concurrent requests sized to the provider's limits"""
+
+    def __init__(self, client, model: str = "text-embedding-ada-002", concurrency: int = 4,
+                 max_inputs: int = MAX_INPUTS_PER_REQUEST, max_tokens: int = MAX_TOKENS_PER_REQUEST,
+                 attempts: int = 4, base_backoff: float = 0.5):
+        self.client = client
+        self.model = model
+        self.concurrency = concurrency
+        self.max_inputs = max_inputs
+        self.max_tokens = max_tokens
+        self.attempts = attempts
+        self.base_backoff = base_backoff
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        chunks = self.chunk(texts)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(chunks)))) as pool:
+            results = list(pool.map(self._request, chunks))
+        return np.vstack(results) if results else np.zeros((0, 0), dtype=np.float32)
+
+    def chunk(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into requests within the input-count and token limits"""
+        chunks, current, tokens = [], [], 0
+        for text in texts:
+            # Inputs over the per-input limit would be rejected; keep their beginning
+            text = text[:MAX_TOKENS_PER_INPUT * CHARS_PER_TOKEN] or " "
+            estimate = len(text) // CHARS_PER_TOKEN + 1
+            if current and (len(current) >= self.max_inputs or tokens + estimate > self.max_tokens):
+                chunks.append(current)
+                current, tokens = [], 0
+            current.append(text)
+            tokens += estimate
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _request(self, chunk: List[str]) -> np.ndarray:
+        for attempt in range(1, self.attempts + 1):
+            try:
+                with self._lock:
+                    self.requests += 1
+                response = self.client.embeddings.create(model=self.model, input=chunk)
+                ordered = sorted(response.data, key=lambda item: item.index)
+                return np.asarray([item.embedding for item in ordered], dtype=np.float32)
+            except Exception as e:
+                if type(e).__name__ not in RETRYABLE_ERRORS or attempt == self.attempts:
+                    raise
+                delay = self.base_backoff * (2 ** (attempt - 1))
+                time.sleep(delay + random.uniform(0, delay / 2))
+
+
+class TfidfEmbedder:
+    """Local TF-IDF vectors; fit once on the catalog so every text maps into the same space"""
+
+    def __init__(self, vectorizer=None, corpus: Optional[List[str]] = None):
+        if vectorizer is None:
+            if not SKLEARN_AVAILABLE:
+                raise ImportError("scikit-learn not installed. Install with: pip install scikit-learn")
+            vectorizer = TfidfVectorizer(stop_words='english', max_features=1000, ngram_range=(1, 2))
+        self.vectorizer = vectorizer
+        if corpus:
+            self.vectorizer.fit(corpus)
+
+    @classmethod
+    def from_psychology_analyst(cls, analyst, corpus: List[str]) -> "TfidfEmbedder":
+        """Reuse EnhancedPsychologyAnalyst's vectorizer settings"""
+        if analyst.vectorizer is None:
+            raise ImportError("EnhancedPsychologyAnalyst has no TF-IDF vectorizer (scikit-learn missing)")
+        return cls(analyst.vectorizer, corpus)
+
+    @property
+    def model(self) -> str:
+        # A refit vocabulary is a different vector space, so it gets different store keys
+        vocabulary = json.dumps(sorted(self.vectorizer.vocabulary_.items()))
+        return f"tfidf-{hashlib.sha256(vocabulary.encode()).hexdigest()[:12]}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return self.vectorizer.transform(texts).astype(np.float32).toarray()
+
+
+# === BATCH EMBEDDINGS ===
+
+class BatchEmbeddings:
+    """Embeds lists of texts, reading known ones from the store and embedding only the rest"""
+
+    def __init__(self, embedder, store: VectorStore):
+        self.embedder = embedder
+        self.store = store
+        self.stats = {"texts": 0, "stored": 0, "embedded": 0, "seconds_embedding": 0.0}
+        self._lock = threading.Lock()
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """One float32 row per text, in order"""
+        model = self.embedder.model
+        keys = [content_hash(model, text) for text in texts]
+        found = self.store.lookup(list(dict.fromkeys(keys)))
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+
+        if missing:
+            started = time.perf_counter()
+            vectors = np.asarray(self.embedder.embed(list(missing.values())), dtype=np.float32)
+            elapsed = time.perf_counter() - started
+            self.store.add(list(missing), vectors, model)
+            found.update(zip(missing, vectors))
+        else:
+            elapsed = 0.0
+
+        with self._lock:
+            self.stats["texts"] += len(texts)
+            self.stats["embedded"] += len(missing)
+            self.stats["stored"] += len(texts) - len(missing)
+            self.stats["seconds_embedding"] += elapsed
+        if not texts:
+            return np.zeros((0, self.store.dimensions or 0), dtype=np.float32)
+        return np.vstack([found[key] for key in keys])
+
+    def embed_records(self, records: List[Dict[str, Any]], fields: Tuple[str, ...] = ("name", "description")) -> np.ndarray:
+        """Embed catalog records (activities, hotels, restaurants) by their text fields"""
+        return self.embed([" ".join(str(record.get(field) or "") for field in fields).strip()
+                           for record in records])
+
+
+_stores: Dict[str, VectorStore] = {}
+_singleton_lock = threading.Lock()
+
+
+def get_batch_embeddings(embedder) -> BatchEmbeddings:
+    """Batch embeddings backed by the process-wide store for the embedder's model"""
+    model = embedder.model
+    with _singleton_lock:
+        if model not in _stores:
+            root = Path(os.getenv("EMBEDDINGS_DIR", "embeddings"))
+            _stores[model] = VectorStore(str(root / model.replace("/", "_")))
+    return BatchEmbeddings(embedder, _stores[model])
+
+
+def run_embedding_benchmark(num_texts: int = 20000, unique: int = 5000) -> Dict[str, Any]:
+    """Embed a catalog twice with the local embedder and report stored-vector reuse"""
+    texts = [f"Activity {i % unique}: guided tour of district {i % unique % 97} with local food and museums"
+             for i in range(num_texts)]
+    with tempfile.TemporaryDirectory() as directory:
+        embeddings = BatchEmbeddings(HashedTextEmbedder(), VectorStore(directory))
+        started = time.perf_counter()
+        embeddings.embed(texts)
+        first = time.perf_counter() - started
+        started = time.perf_counter()
+        embeddings.embed(texts)
+        second = time.perf_counter() - started
+        reopened = VectorStore(directory)
+        print(f"🧭 {num_texts} texts ({unique} unique): {first:.2f}s cold, {second:.2f}s from the store; "
+              f"{len(reopened)} vectors on disk")
+        return {"cold_seconds": first, "warm_seconds": second, "stored": len(reopened), **embeddings.stats}
+
+
+if __name__ == "__main__":
+    run_embedding_benchmark()
@@ -3,28 +3,60 @@
 OpenAI API client and services
 """
 
-from openai import OpenAI
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from src.api_integration.openai.completion_cache import get_completion_cache
+from src.api_integration.openai.embedding_store import OpenAIEmbedder, get_batch_embeddings
+
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
 
 class OpenAIService:
     """OpenAI API service wrapper"""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
-    
-    def chat_completion(self, messages: list, model: str = "gpt-3.5-turbo") -> Dict[str, Any]:
-        """Create chat completion"""
-        response = self.client.chat.completions.create(
-            model=model,
-            messages=messages
-        )
-        return response.choices[0].message.content
-    
+
+    def __init__(self, api_key: Optional[str] = None, client=None, cache=None, embedder=None):
+        if client is None and OPENAI_AVAILABLE:
+            client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+        if client is None and embedder is None:
+            raise ImportError("openai package not installed. Install with: pip install openai")
+        self.client = client
+        # A local embedder (TfidfEmbedder, HashedTextEmbedder) replaces the embeddings API, e.g. offline
+        self.embedder = embedder
+        # Completions are cached unless OPENAI_CACHE=off; pass cache=False to always call the API
+        if cache is None and os.getenv("OPENAI_CACHE", "on").lower() not in ("off", "0", "false"):
+            cache = get_completion_cache()
+        self.cache = cache or None
+
+    def chat_completion(self, messages: list, model: str = "gpt-3.5-turbo", use_case: str = "default",
+                        use_cache: bool = True, **params) -> Dict[str, Any]:
+        """Create chat completion (served from the completion cache when the same request was seen)"""
+        if self.client is None:
+            raise RuntimeError("Chat completions need the OpenAI API; this service only has a local embedder")
+        
+        def create():
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **params
+            )
+            return response.choices[0].message.content
+
+        if self.cache is None or not use_cache:
+            return create()
+        return self.cache.get_or_create(model, messages, create, params=params, use_case=use_case)
+
     def embedding(self, text: str, model: str = "text-embedding-ada-002") -> list:
         """Create text embedding"""
-        response = self.client.embeddings.create(
-            model=model,
-            input=text
-        )
-        return response.data[0].embedding
+        return self.embed_batch([text], model)[0].tolist()
+    
+    def embed_batch(self, texts: List[str], model: str = "text-embedding-ada-002",
+                    concurrency: int = 4) -> np.ndarray:
+        """Embed a list of texts (one float32 row each); texts seen before are read from the vector store"""
+        embedder = self.embedder or OpenAIEmbedder(self.client, model, concurrency=concurrency)
+        return get_batch_embeddings(embedder).embed(texts)
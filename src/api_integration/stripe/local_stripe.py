@@ -0,0 +1,490 @@
+"""
+🧪 Local Stripe Stand-in
+HTTP server speaking the slice of the Stripe API the platform uses, plus a payment load harness
+
+Implements customers, payment intents (create, retrieve, confirm, list),
+checkout sessions, refunds and events with Stripe's wire format: form-encoded
+requests with bracketed keys, JSON objects, list envelopes with
+starting_after pagination and created[gte]/[lt] filters, typed errors with
+Stripe's HTTP status codes and Idempotency-Key replay. State changes are sent
+as signed webhooks when a webhook URL is configured, so the webhook queue can
+be exercised end to end.
+
+Latency and faults are configurable: a base latency with jitter, a share of
+requests answered with 500 or 429 before any side effect, and a share that
+stall before succeeding (to exercise client deadlines and idempotent retries).
+Confirming with pm_card_chargeDeclined (or a configured decline rate) fails
+with a card_error.
+
+Point the stripe library at it with STRIPE_API_BASE=http://127.0.0.1:<port>
+(StripeService honours it), or run the harness, which drives concurrent
+payments through the real StripeService code path and reports throughput and
+p50/p95/p99 latency.
+
+Usage:
+    python src/api_integration/stripe/local_stripe.py serve --port 12111 --latency 0.05 --failure-rate 0.02
+    python src/api_integration/stripe/local_stripe.py load --flows 500 --concurrency 32
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import queue
+import random
+import argparse
+import threading
+import urllib.request
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+from typing import Dict, List, Any, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.services.stripe_webhooks import sign_payload
+
+try:
+    import stripe  # noqa: F401 - the harness drives the real client
+    STRIPE_AVAILABLE = True
+except ImportError:
+    STRIPE_AVAILABLE = False
+
+DECLINE_METHODS = {"pm_card_chargeDeclined", "pm_card_visa_chargeDeclined", "pm_card_insufficientFunds"}
+
+
+class StripeError(Exception):
+    """An error response in Stripe's format"""
+
+    def __init__(self, status: int, error_type: str, message: str, code: Optional[str] = None,
+                 param: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {"error": {"type": error_type, "message": message, "code": code, "param": param}}
+
+
+def parse_form(body: str) -> Dict[str, Any]:
+    """Decode Stripe's bracketed form encoding (metadata[booking_id]=..., line_items[0][quantity]=...)"""
+    params: Dict[str, Any] = {}
+    for key, value in parse_qsl(body, keep_blank_values=True):
+        path = key.replace("]", "").split("[")
+        target = params
+        for part in path[:-1]:
+            target = target.setdefault(part, {})
+        target[path[-1]] = value
+    return _listify(params)
+
+
+def _listify(value: Any) -> Any:
+    """Turn {"0": a, "1": b} (from items[0], items[1]) into [a, b], recursively"""
+    if not isinstance(value, dict):
+        return value
+    if value and all(key.isdigit() for key in value):
+        return [_listify(value[key]) for key in sorted(value, key=int)]
+    return {key: _listify(item) for key, item in value.items()}
+
+
+class _StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default backlog of 5 refuses connections under load
+
+
+class LocalStripeServer:
+    """In-process Stripe API stand-in with latency and failure injection"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, rate_limit_rate: float = 0.0, stall_rate: float = 0.0,
+                 stall_seconds: float = 2.0, decline_rate: float = 0.0, webhook_url: Optional[str] = None,
+                 webhook_secret: str = "whsec_local"):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.decline_rate = decline_rate
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.objects: Dict[str, Dict[str, Dict[str, Any]]] = {
+            kind: {} for kind in ("customer", "payment_intent", "checkout.session", "refund", "event")
+        }
+        self.stats = {"requests": 0, "injected_errors": 0, "stalls": 0, "idempotent_replays": 0,
+                      "webhooks_sent": 0, "webhooks_failed": 0}
+        self._idempotency: Dict[str, Tuple[str, int, Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+        self._webhooks: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_DELETE(self):
+                self._handle("DELETE")
+
+            def _handle(self, method: str):
+                url = urlsplit(self.path)
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0)).decode()
+                params = parse_form(url.query if method == "GET" else body)
+                status, response, replayed = standin.handle(method, url.path, params,
+                                                            self.headers.get("Idempotency-Key"))
+                data = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Request-Id", f"req_{uuid.uuid4().hex[:14]}")
+                if replayed:
+                    self.send_header("Idempotent-Replayed", "true")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = _StandinServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        for target in (self.server.serve_forever, self._deliver_webhooks):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._webhooks.put(None)
+        self.server.shutdown()
+        self.server.server_close()
+
+    # === REQUEST HANDLING ===
+
+    def handle(self, method: str, path: str, params: Dict[str, Any],
+               idempotency_key: Optional[str] = None) -> Tuple[int, Dict[str, Any], bool]:
+        """Route one request; returns (HTTP status, body, replayed from the idempotency cache)"""
+        with self._lock:
+            self.stats["requests"] += 1
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        roll = random.random()
+        if roll < self.failure_rate:
+            with self._lock:
+                self.stats["injected_errors"] += 1
+            return 500, StripeError(500, "api_error", "Injected server error").body, False
+        if roll < self.failure_rate + self.rate_limit_rate:
+            with self._lock:
+                self.stats["injected_errors"] += 1
+            return 429, StripeError(429, "rate_limit_error", "Injected rate limit", "rate_limit").body, False
+        if roll < self.failure_rate + self.rate_limit_rate + self.stall_rate:
+            with self._lock:
+                self.stats["stalls"] += 1
+            time.sleep(self.stall_seconds)
+
+        if method == "POST" and idempotency_key:
+            fingerprint = json.dumps([path, params], sort_keys=True)
+            with self._lock:
+                cached = self._idempotency.get(idempotency_key)
+                if cached is not None:
+                    if cached[0] != fingerprint:
+                        error = StripeError(400, "idempotency_error", "Keys for idempotent requests can only be "
+                                            "used with the same parameters they were first used with.")
+                        return 400, error.body, False
+                    self.stats["idempotent_replays"] += 1
+                    return cached[1], cached[2], True
+                status, body = self._route(method, path, params)
+                if status < 500:
+                    self._idempotency[idempotency_key] = (fingerprint, status, body)
+                return status, body, False
+        with self._lock:
+            status, body = self._route(method, path, params)
+        return status, body, False
+
+    def _route(self, method: str, path: str, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        parts = [part for part in path.split("/") if part][1:]  # drop "v1"
+        try:
+            if parts[:3] == ["test_helpers", "checkout", "sessions"] and parts[4:] == ["complete"]:
+                return 200, self._complete_session(parts[3])
+            if parts[:2] == ["checkout", "sessions"]:
+                kind, rest = "checkout.session", parts[2:]
+            else:
+                kind = {"customers": "customer", "payment_intents": "payment_intent",
+                        "refunds": "refund", "events": "event"}[parts[0]]
+                rest = parts[1:]
+            if not rest:
+                if method == "GET":
+                    return 200, self._list(kind, params, path)
+                return 200, getattr(self, f"_create_{kind.replace('.', '_')}")(params)
+            obj = self.objects[kind].get(rest[0])
+            if obj is None:
+                raise StripeError(404, "invalid_request_error", f"No such {kind}: '{rest[0]}'", "resource_missing", "id")
+            if rest[1:] == ["confirm"] and kind == "payment_intent":
+                return 200, self._confirm(obj, params)
+            if rest[1:] == ["cancel"] and kind == "payment_intent":
+                obj["status"] = "canceled"
+                self._emit("payment_intent.canceled", obj)
+                return 200, obj
+            if method == "POST" and not rest[1:] and "metadata" in params:
+                obj["metadata"].update(params["metadata"])
+            return 200, obj
+        except StripeError as e:
+            return e.status, e.body
+        except (KeyError, IndexError, AttributeError):
+            return 404, StripeError(404, "invalid_request_error", f"Unrecognized request URL ({method}: {path})").body
+        except (TypeError, ValueError) as e:
+            return 400, StripeError(400, "invalid_request_error", f"Invalid parameters: {e}").body
+
+    def _new(self, kind: str, prefix: str, **fields) -> Dict[str, Any]:
+        obj = {"id": f"{prefix}_{uuid.uuid4().hex[:24]}", "object": kind, "created": int(time.time()),
+               "livemode": False, **fields}
+        obj.setdefault("metadata", {})
+        self.objects[kind][obj["id"]] = obj
+        return obj
+
+    def _list(self, kind: str, params: Dict[str, Any], path: str) -> Dict[str, Any]:
+        rows = list(reversed(list(self.objects[kind].values())))  # newest first
+        created = params.get("created") or {}
+        if isinstance(created, dict):
+            for op, test in (("gte", int.__ge__), ("gt", int.__gt__), ("lte", int.__le__), ("lt", int.__lt__)):
+                if op in created:
+                    rows = [o for o in rows if test(o["created"], int(created[op]))]
+        elif created:
+            rows = [o for o in rows if o["created"] == int(created)]
+        for key in ("email", "customer", "payment_intent", "type"):
+            if key in params:
+                rows = [o for o in rows if o.get(key) == params[key]]
+        if params.get("starting_after"):
+            ids = [o["id"] for o in rows]
+            rows = rows[ids.index(params["starting_after"]) + 1:] if params["starting_after"] in ids else []
+        limit = min(int(params.get("limit", 10)), 100)
+        return {"object": "list", "url": path, "data": rows[:limit], "has_more": len(rows) > limit}
+
+    def _create_customer(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._new("customer", "cus", email=params.get("email"), name=params.get("name"),
+                         phone=params.get("phone"), metadata=dict(params.get("metadata") or {}))
+
+    def _create_payment_intent(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        amount = int(params["amount"])
+        if amount < 50:
+            raise StripeError(400, "invalid_request_error", "Amount must be at least 50 cents", "amount_too_small", "amount")
+        intent = self._new("payment_intent", "pi", amount=amount, amount_received=0, currency=params["currency"],
+                           customer=params.get("customer"), metadata=dict(params.get("metadata") or {}),
+                           payment_method=params.get("payment_method"), latest_charge=None,
+                           payment_method_types=params.get("payment_method_types") or ["card"],
+                           status="requires_payment_method" if not params.get("payment_method") else "requires_confirmation",
+                           amount_refunded=0, last_payment_error=None)
+        intent["client_secret"] = f"{intent['id']}_secret_{uuid.uuid4().hex[:16]}"
+        self._emit("payment_intent.created", intent)
+        return intent
+
+    def _confirm(self, intent: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        if intent["status"] in ("succeeded", "canceled"):
+            raise StripeError(400, "invalid_request_error", f"This PaymentIntent's status is {intent['status']}",
+                              "payment_intent_unexpected_state")
+        intent["payment_method"] = params.get("payment_method") or intent["payment_method"]
+        if not intent["payment_method"]:
+            raise StripeError(400, "invalid_request_error", "A payment method is required", "parameter_missing",
+                              "payment_method")
+        if intent["payment_method"] in DECLINE_METHODS or random.random() < self.decline_rate:
+            intent["status"] = "requires_payment_method"
+            intent["last_payment_error"] = {"type": "card_error", "code": "card_declined",
+                                            "message": "Your card was declined."}
+            self._emit("payment_intent.payment_failed", intent)
+            error = StripeError(402, "card_error", "Your card was declined.", "card_declined")
+            error.body["error"]["payment_intent"] = intent
+            raise error
+        intent.update(status="succeeded", amount_received=intent["amount"], last_payment_error=None,
+                      latest_charge=f"ch_{uuid.uuid4().hex[:24]}")
+        self._emit("payment_intent.succeeded", intent)
+        return intent
+
+    def _create_checkout_session(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        items = params.get("line_items") or []
+        amount = sum(int((item.get("price_data") or {}).get("unit_amount", 0)) * int(item.get("quantity", 1))
+                     for item in items)
+        currency = ((items[0].get("price_data") or {}).get("currency") if items else None) or "usd"
+        session = self._new("checkout.session", "cs_test", amount_total=amount, currency=currency,
+                            customer=params.get("customer"), customer_email=params.get("customer_email"),
+                            mode=params.get("mode", "payment"), payment_status="unpaid", status="open",
+                            payment_intent=None, metadata=dict(params.get("metadata") or {}),
+                            success_url=params.get("success_url"), cancel_url=params.get("cancel_url"))
+        session["url"] = f"{self.url}/checkout/{session['id']}"
+        return session
+
+    def _complete_session(self, session_id: str) -> Dict[str, Any]:
+        """Stand-in only: behave as if the customer paid on the hosted page"""
+        session = self.objects["checkout.session"][session_id]
+        if session["status"] == "open":
+            intent = self._create_payment_intent({"amount": session["amount_total"], "currency": session["currency"],
+                                                  "customer": session["customer"], "metadata": session["metadata"],
+                                                  "payment_method": "pm_card_visa"})
+            self._confirm(intent, {})
+            session.update(status="complete", payment_status="paid", payment_intent=intent["id"])
+            self._emit("checkout.session.completed", session)
+        return session
+
+    def _create_refund(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        intent = self.objects["payment_intent"].get(params.get("payment_intent", ""))
+        if intent is None or intent["status"] != "succeeded":
+            raise StripeError(400, "invalid_request_error", "This PaymentIntent has no successful charge to refund",
+                              "charge_not_refundable", "payment_intent")
+        remaining = intent["amount_received"] - intent["amount_refunded"]
+        amount = int(params.get("amount") or remaining)
+        if amount <= 0 or amount > remaining:
+            raise StripeError(400, "invalid_request_error", f"Refund amount ({amount}) is greater than the "
+                              f"unrefunded amount ({remaining})", "amount_too_large", "amount")
+        intent["amount_refunded"] += amount
+        refund = self._new("refund", "re", amount=amount, currency=intent["currency"], payment_intent=intent["id"],
+                           charge=intent["latest_charge"], reason=params.get("reason"), status="succeeded",
+                           metadata=dict(params.get("metadata") or {}))
+        self._emit("charge.refunded", {"id": intent["latest_charge"], "object": "charge", "amount": intent["amount"],
+                                       "amount_refunded": intent["amount_refunded"], "payment_intent": intent["id"],
+                                       "refunded": intent["amount_refunded"] == intent["amount"],
+                                       "metadata": intent["metadata"]})
+        return refund
+
+    # === WEBHOOKS ===
+
+    def _emit(self, event_type: str, obj: Dict[str, Any]):
+        event = self._new("event", "evt", type=event_type, data={"object": json.loads(json.dumps(obj))},
+                          api_version="2023-10-16", pending_webhooks=1 if self.webhook_url else 0)
+        if self.webhook_url:
+            self._webhooks.put(event)
+
+    def _deliver_webhooks(self):
+        while True:
+            event = self._webhooks.get()
+            if event is None:
+                return
+            payload = json.dumps(event).encode()
+            request = urllib.request.Request(self.webhook_url, data=payload, method="POST", headers={
+                "Content-Type": "application/json", "Stripe-Signature": sign_payload(payload, self.webhook_secret)
+            })
+            try:
+                urllib.request.urlopen(request, timeout=5).close()
+                self.stats["webhooks_sent"] += 1
+            except OSError:
+                self.stats["webhooks_failed"] += 1
+
+
+# === LOAD HARNESS ===
+
+def _percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+
+def run_payment_load_test(flows: int = 200, concurrency: int = 16, latency: float = 0.02, jitter: float = 0.02,
+                          failure_rate: float = 0.02, decline_rate: float = 0.03, stall_rate: float = 0.0,
+                          use_booking_manager: bool = False) -> Dict[str, Any]:
+    """
+    Drive concurrent payments through StripeService against the stand-in
+
+    With use_booking_manager the full BookingManager.create_booking + process_payment
+    path runs (this needs the Supabase configuration); otherwise each flow runs the
+    PaymentPipeline that process_payment delegates to, on an in-memory step store.
+    """
+    if not STRIPE_AVAILABLE:
+        print("❌ The stripe package is required for the payment load test")
+        return {}
+    from src.api_integration.stripe.stripe_service import StripeService
+    from src.booking_system.payment_pipeline import InMemoryPaymentStateStore, PaymentPipeline
+
+    server = LocalStripeServer(latency=latency, jitter=jitter, failure_rate=failure_rate,
+                               decline_rate=decline_rate, stall_rate=stall_rate).start()
+    os.environ["STRIPE_API_BASE"] = server.url
+    service = StripeService(secret_key=os.getenv("STRIPE_SECRET_KEY") or "sk_test_local", api_base=server.url)
+    manager = None
+    if use_booking_manager:
+        from src.booking_system.booking_manager import BookingManager, BookingRequest, BookingType
+        manager = BookingManager()
+    store = InMemoryPaymentStateStore()
+    customer = {"email": "load@example.com", "name": "Load Test"}
+
+    def flow(index: int) -> Tuple[float, str]:
+        start = time.perf_counter()
+        if manager is not None:
+            confirmation = manager.create_booking(BookingRequest(
+                booking_type=BookingType.PACKAGE, user_id="load_test_user", item_id=str(uuid.uuid4()),
+                details={"customer_details": customer}, total_amount=120.0 + index % 7))
+            start = time.perf_counter()
+            result = manager.process_payment(confirmation.booking_id, "pm_card_visa", customer)
+            outcome = result.get("status") or ("confirmed" if result.get("success") else "error")
+        else:
+            booking = {"id": str(uuid.uuid4()), "confirmation_number": f"LOAD{index}",
+                       "total_amount": 120.0 + index % 7, "currency": "USD"}
+            outcome = PaymentPipeline(service, store).run(booking, "pm_card_visa", customer).status
+        return (time.perf_counter() - start) * 1000, outcome
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(flow, range(flows)))
+    elapsed = time.perf_counter() - started
+    server.stop()
+
+    latencies = [ms for ms, _ in results]
+    outcomes: Dict[str, int] = {}
+    for _, outcome in results:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    report = {
+        "flows": flows, "concurrency": concurrency, "outcomes": outcomes,
+        "flows_per_second": flows / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50), "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99), "standin": dict(server.stats)
+    }
+    print(f"🧪 Payment load: {flows} flows x{concurrency} -> {report['flows_per_second']:.1f} flows/s, "
+          f"p50 {report['p50_ms']:.0f} ms, p95 {report['p95_ms']:.0f} ms, p99 {report['p99_ms']:.0f} ms; "
+          f"outcomes {outcomes}; {server.stats['requests']} Stripe requests, "
+          f"{server.stats['injected_errors']} injected errors, {server.stats['idempotent_replays']} idempotent replays")
+    return report
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Local Stripe stand-in and payment load harness")
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="run the stand-in until interrupted")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=12111)
+    serve.add_argument("--webhook-url", help="deliver signed events here")
+    serve.add_argument("--webhook-secret", default=os.getenv("STRIPE_WEBHOOK_SECRET", "whsec_local"))
+    load = commands.add_parser("load", help="drive concurrent payments through the stand-in")
+    load.add_argument("--flows", type=int, default=200)
+    load.add_argument("--concurrency", type=int, default=16)
+    load.add_argument("--booking-manager", action="store_true", help="run the full BookingManager path")
+    for command in (serve, load):
+        command.add_argument("--latency", type=float, default=0.02)
+        command.add_argument("--jitter", type=float, default=0.02)
+        command.add_argument("--failure-rate", type=float, default=0.02)
+        command.add_argument("--decline-rate", type=float, default=0.03)
+        command.add_argument("--stall-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    if args.command is None:
+        args = parser.parse_args(["load"])
+
+    if args.command == "serve":
+        server = LocalStripeServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                                   failure_rate=args.failure_rate, decline_rate=args.decline_rate,
+                                   stall_rate=args.stall_rate, webhook_url=args.webhook_url,
+                                   webhook_secret=args.webhook_secret).start()
+        print(f"🧪 Stripe stand-in on {server.url} (set STRIPE_API_BASE={server.url})")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+    else:
+        run_payment_load_test(args.flows, args.concurrency, args.latency, args.jitter, args.failure_rate,
+                              args.decline_rate, args.stall_rate, args.booking_manager)
+
+
+if __name__ == "__main__":
+    main()
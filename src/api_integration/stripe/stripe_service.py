@@ -5,7 +5,6 @@ Complete Stripe payment processing services with real checkout
 
 import stripe
 import os
-import streamlit as st
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import json
@@ -13,9 +12,9 @@ import json
 class StripeService:
     """Complete Stripe API service with real payments"""
     
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(self, secret_key: Optional[str] = None, api_base: Optional[str] = None):
         """
-        Initialize Stripe with secret key
+        Initialize Stripe with secret key (and an alternative API base, e.g. the local stand-in)
         """
         self.stripe_key = secret_key or os.getenv("STRIPE_SECRET_KEY")
         if self.stripe_key:
@@ -23,12 +22,17 @@ class StripeService:
         else:
             raise ValueError("Stripe secret key not found. Please set STRIPE_SECRET_KEY environment variable.")
         
+        api_base = api_base or os.getenv("STRIPE_API_BASE")
+        if api_base:
+            stripe.api_base = api_base
+        
         # Get publishable key for frontend
         self.publishable_key = os.getenv("STRIPE_PUBLISHABLE_KEY")
         if not self.publishable_key:
             print("⚠️ Warning: STRIPE_PUBLISHABLE_KEY not found")
     
-    def create_customer(self, email: str, name: str, phone: Optional[str] = None, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+    def create_customer(self, email: str, name: str, phone: Optional[str] = None, metadata: Optional[Dict] = None,
+                        idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a new Stripe customer
         """
@@ -44,6 +48,9 @@ class StripeService:
             if metadata:
                 customer_data["metadata"] = metadata
             
+            if idempotency_key:
+                customer_data["idempotency_key"] = idempotency_key
+            
             customer = stripe.Customer.create(**customer_data)
             return {
                 "success": True,
@@ -129,7 +136,8 @@ class StripeService:
                              currency: str = "usd", 
                              customer_id: Optional[str] = None,
                              payment_method_types: List[str] = None,
-                             metadata: Optional[Dict] = None) -> Dict[str, Any]:
+                             metadata: Optional[Dict] = None,
+                             idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a payment intent for custom payment flows
         """
@@ -146,6 +154,9 @@ class StripeService:
             if metadata:
                 intent_params['metadata'] = metadata
             
+            if idempotency_key:
+                intent_params['idempotency_key'] = idempotency_key
+            
             intent = stripe.PaymentIntent.create(**intent_params)
             
             return {
@@ -197,7 +208,8 @@ class StripeService:
                 "error_type": type(e).__name__
             }
     
-    def confirm_payment(self, payment_intent_id: str, payment_method: str = None) -> Dict[str, Any]:
+    def confirm_payment(self, payment_intent_id: str, payment_method: str = None,
+                        idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Confirm a payment intent
         """
@@ -206,6 +218,9 @@ class StripeService:
             if payment_method:
                 params['payment_method'] = payment_method
             
+            if idempotency_key:
+                params['idempotency_key'] = idempotency_key
+            
             intent = stripe.PaymentIntent.confirm(payment_intent_id, **params)
             
             return {
@@ -236,10 +251,18 @@ class StripeService:
                 payload, signature, webhook_secret
             )
             
+            # Queue for the webhook workers, which apply booking status changes in batches; passing the
+            # shared client starts them here too, so queued events are applied even before any session exists
+            from src.api_integration.supabase.client_factory import get_supabase_client
+            from src.booking_system.booking_manager import WEBHOOK_CALLBACKS
+            from src.services.stripe_webhooks import get_webhook_inbox
+            queued = get_webhook_inbox(get_supabase_client(), **WEBHOOK_CALLBACKS).enqueue_event(json.loads(payload))
+            
             return {
                 "success": True,
                 "event": event,
-                "event_type": event['type']
+                "event_type": event['type'],
+                "duplicate": not queued
             }
             
         except ValueError as e:
@@ -253,7 +276,8 @@ class StripeService:
                 "error": "Invalid signature"
             }
     
-    def create_refund(self, payment_intent_id: str, amount: int = None, reason: str = None) -> Dict[str, Any]:
+    def create_refund(self, payment_intent_id: str, amount: int = None, reason: str = None,
+                      metadata: Optional[Dict] = None, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a refund for a payment
         """
@@ -268,6 +292,12 @@ class StripeService:
             if reason:
                 refund_params['reason'] = reason
             
+            if metadata:
+                refund_params['metadata'] = metadata
+            
+            if idempotency_key:
+                refund_params['idempotency_key'] = idempotency_key
+            
             refund = stripe.Refund.create(**refund_params)
             
             return {
@@ -0,0 +1,271 @@
+"""
+🏭 Supabase Client Factory
+Single, process-wide Supabase client with pooled keep-alive connections
+
+Every module gets its client from get_supabase_client() instead of calling
+create_client itself. The shared client's HTTP transport is replaced with an
+instrumented, pooled httpx transport that:
+- keeps a bounded pool of keep-alive connections
+- applies per-call timeouts set with supabase_call_timeout()
+- retries idempotent reads (GET/HEAD) with full-jitter exponential backoff
+- records per-table latency counters (see get_table_latency_stats())
+"""
+
+import os
+import time
+import random
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+try:
+    from supabase import create_client, Client
+    SUPABASE_AVAILABLE = True
+except ImportError:
+    Client = Any
+    SUPABASE_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from supabase.lib.client_options import ClientOptions
+except ImportError:
+    ClientOptions = None
+
+# Load environment variables
+if load_dotenv:
+    load_dotenv()
+
+DEFAULT_TIMEOUT = float(os.getenv("SUPABASE_TIMEOUT", "10"))
+POOL_SIZE = int(os.getenv("SUPABASE_POOL_SIZE", "20"))
+KEEPALIVE_CONNECTIONS = int(os.getenv("SUPABASE_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY", "30"))
+READ_RETRIES = int(os.getenv("SUPABASE_READ_RETRIES", "3"))
+RETRY_BASE_DELAY = float(os.getenv("SUPABASE_RETRY_BASE_DELAY", "0.2"))
+
+RETRYABLE_STATUS = {502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+
+_call_settings = threading.local()
+
+
+@contextmanager
+def supabase_call_timeout(seconds: float):
+    """Apply a timeout to every Supabase request made inside the block on this thread"""
+    previous = getattr(_call_settings, "timeout", None)
+    _call_settings.timeout = seconds
+    try:
+        yield
+    finally:
+        _call_settings.timeout = previous
+
+
+class TableLatencyStats:
+    """Thread-safe latency counters keyed by table (or rpc/<function>)"""
+
+    def __init__(self, sample_size: int = 512):
+        self.sample_size = sample_size
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, table: str, elapsed_ms: float, error: bool = False, retries: int = 0):
+        with self._lock:
+            stats = self._stats.setdefault(table, {
+                "calls": 0, "errors": 0, "retries": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "samples": []
+            })
+            stats["calls"] += 1
+            stats["errors"] += int(error)
+            stats["retries"] += retries
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            samples = stats["samples"]
+            if len(samples) < self.sample_size:
+                samples.append(elapsed_ms)
+            else:
+                # Reservoir sampling keeps percentiles representative in bounded memory
+                slot = random.randint(0, stats["calls"] - 1)
+                if slot < self.sample_size:
+                    samples[slot] = elapsed_ms
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            result = {}
+            for table, stats in self._stats.items():
+                samples = sorted(stats["samples"])
+                result[table] = {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "avg_ms": stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0,
+                    "p50_ms": _percentile(samples, 0.50),
+                    "p95_ms": _percentile(samples, 0.95),
+                    "max_ms": stats["max_ms"]
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def _table_from_path(path: str) -> str:
+    """/rest/v1/bookings -> bookings, /rest/v1/rpc/exec_sql -> rpc/exec_sql"""
+    marker = "/rest/v1/"
+    if marker in path:
+        return path.split(marker, 1)[1].strip("/") or "root"
+    return path.strip("/") or "root"
+
+
+latency_stats = TableLatencyStats()
+
+
+if HTTPX_AVAILABLE:
+    class InstrumentedTransport(httpx.BaseTransport):
+        """Pooled httpx transport with per-call timeouts, read retries and latency counters"""
+
+        def __init__(self, max_retries: int = READ_RETRIES, base_delay: float = RETRY_BASE_DELAY,
+                     transport: Optional["httpx.BaseTransport"] = None, stats: Optional[TableLatencyStats] = None):
+            self.max_retries = max_retries
+            self.base_delay = base_delay
+            self.stats = stats or latency_stats
+            # The pooled transport that sends requests (tests pass an httpx.MockTransport)
+            self._transport = transport or httpx.HTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=POOL_SIZE,
+                    max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY
+                ),
+                retries=1  # reconnect once on a stale keep-alive connection
+            )
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            timeout = getattr(_call_settings, "timeout", None)
+            if timeout is not None:
+                request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+
+            table = _table_from_path(request.url.path)
+            retries_allowed = self.max_retries if request.method in IDEMPOTENT_METHODS else 0
+            attempt = 0
+            start = time.perf_counter()
+            while True:
+                try:
+                    response = self._transport.handle_request(request)
+                except httpx.TransportError:
+                    if attempt >= retries_allowed:
+                        self.stats.record(table, (time.perf_counter() - start) * 1000, True, attempt)
+                        raise
+                else:
+                    if response.status_code not in RETRYABLE_STATUS or attempt >= retries_allowed:
+                        self.stats.record(
+                            table, (time.perf_counter() - start) * 1000,
+                            response.status_code >= 500, attempt
+                        )
+                        return response
+                    response.close()
+                attempt += 1
+                # Full jitter: sleep uniformly in [0, base * 2^attempt]
+                time.sleep(random.uniform(0, self.base_delay * (2 ** attempt)))
+
+        def close(self):
+            self._transport.close()
+
+
+_clients: Dict[tuple, Client] = {}
+_shared_transport = None
+_factory_lock = threading.Lock()
+
+
+def _get_shared_transport():
+    global _shared_transport
+    if _shared_transport is None and HTTPX_AVAILABLE:
+        _shared_transport = InstrumentedTransport()
+    return _shared_transport
+
+
+def _instrument(client: Client):
+    """Route the client's PostgREST session through the shared pooled transport"""
+    transport = _get_shared_transport()
+    if transport is None:
+        return
+    try:
+        session = client.postgrest.session
+        if session._transport is not transport:
+            # postgrest is rebuilt after auth events, so this check runs on every lookup
+            session._transport.close()
+            session._transport = transport
+            session.timeout = httpx.Timeout(DEFAULT_TIMEOUT)
+    except AttributeError as e:
+        print(f"⚠️ Could not instrument Supabase client transport: {e}")
+
+
+def get_supabase_client(url: Optional[str] = None, key: Optional[str] = None) -> Optional[Client]:
+    """
+    Get the process-wide Supabase client
+
+    Returns None when credentials (or the supabase package) are missing so callers
+    can fall back to offline data.
+    """
+    url = url or os.getenv("SUPABASE_URL")
+    key = key or os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_ANON_KEY")
+    if not url or not key or not SUPABASE_AVAILABLE:
+        return None
+
+    with _factory_lock:
+        client = _clients.get((url, key))
+        if client is None:
+            if ClientOptions is not None:
+                options = ClientOptions(
+                    postgrest_client_timeout=DEFAULT_TIMEOUT,
+                    storage_client_timeout=int(DEFAULT_TIMEOUT)
+                )
+                client = create_client(url, key, options=options)
+            else:
+                client = create_client(url, key)
+            _clients[(url, key)] = client
+        _instrument(client)
+    return client
+
+
+def require_supabase_client(url: Optional[str] = None, key: Optional[str] = None) -> Client:
+    """Like get_supabase_client, but raise when credentials are missing"""
+    if not SUPABASE_AVAILABLE:
+        raise ImportError("supabase package not installed. Install with: pip install supabase")
+    client = get_supabase_client(url, key)
+    if client is None:
+        raise ValueError("Supabase credentials missing in .env file (SUPABASE_URL / SUPABASE_KEY)")
+    return client
+
+
+def get_table_latency_stats() -> Dict[str, Dict[str, float]]:
+    """Per-table call counts, errors, retries and latency percentiles"""
+    return latency_stats.snapshot()
+
+
+def print_table_latency_stats():
+    """Print the per-table latency counters"""
+    stats = get_table_latency_stats()
+    if not stats:
+        print("📊 No Supabase calls recorded yet")
+        return
+    print("📊 Supabase latency by table")
+    for table, row in sorted(stats.items(), key=lambda item: -item[1]["calls"]):
+        print(f"   {table:30s} calls={row['calls']:5d} errors={row['errors']:3d} "
+              f"retries={row['retries']:3d} p50={row['p50_ms']:.1f}ms p95={row['p95_ms']:.1f}ms "
+              f"max={row['max_ms']:.1f}ms")
@@ -3,17 +3,21 @@
 Supabase database client and services
 """
 
-from supabase import create_client, Client
+from src.api_integration.supabase.client_factory import Client, require_supabase_client
 import os
-from typing import Dict, Any, Optional, List
+from itertools import islice
+from typing import Dict, Any, Optional, List, Iterable, Iterator
+
+DEFAULT_PAGE_SIZE = 1000  # PostgREST's default max-rows
+DEFAULT_CHUNK_SIZE = 500
 
 class SupabaseService:
     """Supabase API service wrapper"""
     
-    def __init__(self, url: Optional[str] = None, key: Optional[str] = None):
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None, client: Optional[Client] = None):
         self.url = url or os.getenv("SUPABASE_URL")
         self.key = key or os.getenv("SUPABASE_KEY")
-        self.client: Client = create_client(self.url, self.key)
+        self.client: Client = client or require_supabase_client(self.url, self.key)
     
     def insert(self, table: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Insert data into table"""
@@ -44,3 +48,96 @@ class SupabaseService:
             query = query.eq(key, value)
         response = query.execute()
         return response.data
+    
+    def _apply_filters(self, query, filter_dict: Optional[Dict[str, Any]]):
+        for key, value in (filter_dict or {}).items():
+            query = query.eq(key, value)
+        return query
+    
+    # === STREAMING READS ===
+    
+    def iter_pages(self, table: str, columns: str = "*", filter_dict: Optional[Dict[str, Any]] = None,
+                   page_size: int = DEFAULT_PAGE_SIZE, key_column: Optional[str] = None,
+                   order_by: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield a table page by page so only one page is held in memory
+        
+        With key_column, pages are fetched by keyset (key > last seen key), which
+        stays fast on deep pages and is stable while rows are being inserted. The
+        key column must be unique. Without it, range (offset) pagination is used,
+        ordered by the order_by column(s) (e.g. a composite key "group_id,user_id")
+        so pages neither skip nor repeat rows.
+        
+        A page shorter than page_size does not end the scan: PostgREST caps every
+        response at its max-rows setting, so paging stops only on an empty page.
+        """
+        if key_column and columns != "*" and key_column not in [c.strip() for c in columns.split(",")]:
+            columns = f"{columns}, {key_column}"
+        
+        offset = 0
+        last_key = None
+        while True:
+            query = self._apply_filters(self.client.table(table).select(columns), filter_dict)
+            if key_column:
+                if last_key is not None:
+                    query = query.gt(key_column, last_key)
+                query = query.order(key_column).limit(page_size)
+            else:
+                for column in (order_by or "").split(","):
+                    if column.strip():
+                        query = query.order(column.strip())
+                query = query.range(offset, offset + page_size - 1)
+            rows = query.execute().data or []
+            if not rows:
+                return
+            yield rows
+            offset += len(rows)
+            if key_column:
+                last_key = rows[-1][key_column]
+    
+    def iter_rows(self, table: str, columns: str = "*", filter_dict: Optional[Dict[str, Any]] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE, key_column: Optional[str] = None,
+                  order_by: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield rows one at a time across all pages"""
+        for page in self.iter_pages(table, columns, filter_dict, page_size, key_column, order_by):
+            yield from page
+    
+    def count(self, table: str, filter_dict: Optional[Dict[str, Any]] = None, exact: bool = True) -> int:
+        """Count rows without transferring them (HEAD request with a count header)"""
+        query = self.client.table(table).select("*", count="exact" if exact else "planned", head=True)
+        response = self._apply_filters(query, filter_dict).execute()
+        return response.count or 0
+    
+    # === BULK WRITES ===
+    
+    def _chunks(self, rows: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def bulk_insert(self, table: str, rows: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Insert rows in chunks of chunk_size; returns the number of rows sent"""
+        written = 0
+        for chunk in self._chunks(rows, chunk_size):
+            self.client.table(table).insert(chunk, returning="minimal").execute()
+            written += len(chunk)
+        return written
+    
+    def bulk_upsert(self, table: str, rows: Iterable[Dict[str, Any]], on_conflict: str = "id",
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, ignore_duplicates: bool = False) -> int:
+        """
+        Upsert rows in chunks, resolving conflicts on the on_conflict column(s)
+        
+        on_conflict must name a primary key or unique constraint, e.g. "name" or "name,city".
+        With ignore_duplicates, existing rows are left untouched instead of updated.
+        """
+        written = 0
+        for chunk in self._chunks(rows, chunk_size):
+            self.client.table(table).upsert(
+                chunk, on_conflict=on_conflict, ignore_duplicates=ignore_duplicates, returning="minimal"
+            ).execute()
+            written += len(chunk)
+        return written
@@ -5,24 +5,37 @@ Handles all booking operations including flights, hotels, restaurants, and car r
 
 import os
 import json
-import uuid
+import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 import stripe
-from supabase import create_client, Client
+from supabase import Client
+from src.api_integration.supabase.client_factory import get_supabase_client
+from src.core.id_generator import new_booking_id, new_confirmation_code
+from src.booking_system.inventory import get_inventory_store, inventory_request
+from src.booking_system.hold_expiry import get_hold_expiry_sweeper
+from src.booking_system.payment_pipeline import PaymentPipeline, get_payment_state_store
+from src.booking_system.refund_batch import RefundBatchProcessor, RefundCriteria, get_refund_source
+from src.booking_system.restaurant_slots import get_restaurant_slot_engine
+from src.services.booking_history import BookingPage, get_booking_history_service
+from src.services.stripe_webhooks import SupabaseBookingStatusStore, get_webhook_inbox
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+CONFIRMATION_ATTEMPTS = 3  # fresh confirmation codes tried when one is already taken
+
 class BookingStatus(Enum):
     PENDING = "pending"
     CONFIRMED = "confirmed"
     CANCELLED = "cancelled"
     COMPLETED = "completed"
     FAILED = "failed"
+    EXPIRED = "expired"
 
 class BookingType(Enum):
     FLIGHT = "flight"
@@ -67,6 +80,24 @@ class BookingManager:
         # Initialize Supabase client
         self.supabase = self._init_supabase()
         
+        # Paged booking history shared with the app pages (one detail cache per process)
+        self.history = get_booking_history_service(self.supabase)
+        
+        # Per-day capacity; holds are taken when a booking is created
+        self.inventory = get_inventory_store(self.supabase)
+        
+        # Pending bookings give their holds back when expires_at passes
+        self.holds = get_hold_expiry_sweeper(self.supabase, self._expire_hold)
+        
+        # Persisted payment step state, so retried payments resume instead of starting over
+        self.payment_state = get_payment_state_store(self.supabase)
+        
+        # Stripe webhooks are queued and applied to bookings in batches by background workers
+        self.webhooks = get_webhook_inbox(self.supabase, **WEBHOOK_CALLBACKS)
+        
+        # Refunds look up payment intents recorded by the payment pipeline
+        self.refund_source = get_refund_source(self.supabase)
+        
         # Initialize Stripe for payments
         self._init_stripe()
         
@@ -81,7 +112,7 @@ class BookingManager:
             if not supabase_url or not supabase_key:
                 raise ValueError("Supabase credentials missing in .env file")
             
-            return create_client(supabase_url, supabase_key)
+            return get_supabase_client(supabase_url, supabase_key)
         except Exception as e:
             print(f"❌ Error initializing Supabase: {e}")
             return None
@@ -104,11 +135,13 @@ class BookingManager:
         """Create a new booking in the main bookings table"""
         try:
             # Generate unique identifiers
-            booking_id = str(uuid.uuid4())
+            booking_id = new_booking_id()
             confirmation_number = self._generate_confirmation_number()
             
             # Prepare booking data
             booking_data = {
+                "id": booking_id,
+                "confirmation_number": confirmation_number,
                 "booking_type": booking_request.booking_type.value,
                 "user_id": booking_request.user_id,
                 "item_id": booking_request.item_id,
@@ -123,11 +156,28 @@ class BookingManager:
                 "expires_at": (datetime.now() + timedelta(hours=24)).isoformat()
             }
             
-            # Insert into main bookings table
-            result = self.supabase.table("bookings").insert(booking_data).execute()
+            # Atomically take the capacity before the row exists, so two bookers cannot both get the last unit
+            if not self._update_inventory(booking_data):
+                raise ValueError("Not available for the selected dates")
+            
+            # Insert into main bookings table (with a new confirmation code if this one is already taken)
+            try:
+                for attempt in range(1, CONFIRMATION_ATTEMPTS + 1):
+                    try:
+                        result = self.supabase.table("bookings").insert(booking_data).execute()
+                        break
+                    except Exception as e:
+                        if attempt == CONFIRMATION_ATTEMPTS or not self._is_duplicate_confirmation(e):
+                            raise
+                        booking_data["confirmation_number"] = self._generate_confirmation_number()
+            except Exception:
+                self._restore_inventory(booking_data)
+                raise
             
             if result.data:
                 booking_record = result.data[0]
+                if self.holds:
+                    self.holds.track(booking_record["id"], booking_record.get("expires_at") or booking_data["expires_at"])
                 
                 return BookingConfirmation(
                     booking_id=booking_record["id"],
@@ -138,6 +188,7 @@ class BookingManager:
                     created_at=datetime.fromisoformat(booking_record["created_at"])
                 )
             else:
+                self._restore_inventory(booking_data)
                 raise Exception("Failed to create booking record")
                 
         except Exception as e:
@@ -146,7 +197,7 @@ class BookingManager:
 
     def process_payment(self, booking_id: str, payment_method_id: str, 
                        customer_details: Dict) -> Dict:
-        """Process payment for a booking"""
+        """Process payment for a booking (safe to call again for the same booking)"""
         try:
             print(f"💳 Processing payment for booking {booking_id}...")
             
@@ -161,85 +212,55 @@ class BookingManager:
             # Use StripeService for payment processing
             from src.api_integration.stripe.stripe_service import StripeService
             
-            stripe_service = StripeService()
-            
-            # Create customer if needed
-            customer_result = stripe_service.create_customer(
-                email=customer_details["email"],
-                name=customer_details.get("name", "Customer"),
-                phone=customer_details.get("phone"),
-                metadata={
-                    "booking_id": booking_id,
-                    "confirmation_number": booking["confirmation_number"]
-                }
-            )
-            
-            if not customer_result["success"]:
-                self._update_booking_status(booking_id, BookingStatus.FAILED)
-                return {
-                    "success": False,
-                    "error": f"Customer creation failed: {customer_result['error']}"
-                }
-            
-            # Create payment intent
-            payment_result = stripe_service.create_payment_intent(
-                amount=int(booking["total_amount"] * 100),  # Convert to cents
-                currency=booking["currency"].lower(),
-                customer_id=customer_result["customer_id"],
-                payment_method_types=['card'],
-                metadata={
-                    'booking_id': booking_id,
-                    'confirmation_number': booking["confirmation_number"],
-                    'service_type': 'travel_booking'
-                }
-            )
-            
-            if not payment_result["success"]:
-                self._update_booking_status(booking_id, BookingStatus.FAILED)
-                return {
-                    "success": False,
-                    "error": f"Payment intent creation failed: {payment_result['error']}"
-                }
-            
-            # Confirm payment with provided method
-            confirm_result = stripe_service.confirm_payment(
-                payment_result["payment_intent"].id,
-                payment_method_id
+            # Idempotent, deadline-bounded steps; a repeated call resumes after the last finished step
+            outcome = PaymentPipeline(StripeService(), self.payment_state).run(
+                booking, payment_method_id, customer_details
             )
-            
-            if confirm_result["success"] and confirm_result["payment_intent"].status == 'succeeded':
-                # Update booking status
-                self._update_booking_status(booking_id, BookingStatus.CONFIRMED)
-                
-                # Send confirmation
-                self._send_booking_confirmation(booking)
-                
-                # Update inventory if needed
-                self._update_inventory(booking)
-                
-                return {
-                    "success": True,
-                    "payment_intent_id": confirm_result["payment_intent"].id,
-                    "status": "confirmed",
-                    "message": "Payment processed successfully!",
-                    "stripe_customer_id": customer_result["customer_id"]
-                }
-            else:
-                # Update booking status to failed
-                self._update_booking_status(booking_id, BookingStatus.FAILED)
-                
-                error_msg = confirm_result.get("error", "Payment confirmation failed")
-                return {
-                    "success": False,
-                    "status": "failed",
-                    "message": f"Payment failed: {error_msg}"
-                }
-                
         except Exception as e:
             print(f"❌ Error processing payment: {e}")
-            # Update booking status to failed
-            self._update_booking_status(booking_id, BookingStatus.FAILED)
             return {"success": False, "error": str(e)}
+        
+        if outcome.succeeded:
+            # The webhook worker may have confirmed it already; only the update that moves it sends the confirmation
+            if self._update_booking_status(booking_id, BookingStatus.CONFIRMED, only_from=BookingStatus.PENDING):
+                # Send confirmation (inventory was already held when the booking was created)
+                self._send_booking_confirmation(booking)
+                # Counted once it is paid for; pending, failed and expired bookings never reach the dashboards
+                self._record_analytics("booking", booking)
+            else:
+                current = self._get_booking_by_id(booking_id)
+                if not current or current["status"] not in (BookingStatus.CONFIRMED.value,
+                                                            BookingStatus.COMPLETED.value):
+                    # Expired or failed while Stripe was charging: the hold is gone, so give the money back
+                    return self._refund_unbooked_payment(current or booking, outcome.payment_intent_id)
+            
+            return {
+                "success": True,
+                "payment_intent_id": outcome.payment_intent_id,
+                "status": "confirmed",
+                "message": "Payment processed successfully!",
+                "stripe_customer_id": outcome.customer_id
+            }
+        
+        if outcome.retryable:
+            # Nothing was declined: keep the booking and its hold so the payment can be retried
+            print(f"⚠️ Payment for booking {booking_id} not finished: {outcome.error}")
+            return {
+                "success": False,
+                "status": "pending",
+                "retryable": True,
+                "payment_intent_id": outcome.payment_intent_id,
+                "message": f"Payment is not complete yet ({outcome.error}). Please try again."
+            }
+        
+        # Declined: update booking status to failed
+        if self._update_booking_status(booking_id, BookingStatus.FAILED, only_from=BookingStatus.PENDING):
+            self._restore_inventory(booking)
+        return {
+            "success": False,
+            "status": "failed",
+            "message": f"Payment failed: {outcome.error}"
+        }
     
     def cancel_booking(self, booking_id: str, reason: str = None) -> Dict:
         """Cancel a booking"""
@@ -255,19 +276,29 @@ class BookingManager:
             if not self._can_cancel_booking(booking):
                 raise ValueError("Booking cannot be cancelled at this time")
             
+            # Conditional: the expiry sweeper or the webhook workers may have moved it meanwhile, and only
+            # the update that actually cancels it may refund and give its inventory back
+            previous = BookingStatus(booking["status"])
+            if not self._update_booking_status(booking_id, BookingStatus.CANCELLED, only_from=previous):
+                raise ValueError("Booking changed while it was being cancelled. Please try again.")
+            
             # Process refund if payment was made
             refund_result = None
-            if booking["status"] == BookingStatus.CONFIRMED.value:
+            if previous == BookingStatus.CONFIRMED:
                 refund_result = self._process_refund(booking, reason)
+                if "error" in refund_result:
+                    # Put it back; the refund is idempotent, so cancelling again is safe
+                    self._update_booking_status(booking_id, BookingStatus.CONFIRMED, only_from=BookingStatus.CANCELLED)
+                    raise ValueError(f"Refund failed: {refund_result['error']}")
             
-            # Update booking status
-            self._update_booking_status(booking_id, BookingStatus.CANCELLED)
-            
-            # Update inventory
-            self._restore_inventory(booking)
+            # Update inventory (failed and expired bookings already gave their hold back)
+            if previous in (BookingStatus.PENDING, BookingStatus.CONFIRMED):
+                self._restore_inventory(booking)
             
             # Send cancellation confirmation
             self._send_cancellation_confirmation(booking, reason)
+            if previous == BookingStatus.CONFIRMED:
+                self._record_analytics("cancellation", booking)  # only paid bookings were counted
             
             return {
                 "success": True,
@@ -279,6 +310,32 @@ class BookingManager:
             print(f"❌ Error cancelling booking: {e}")
             return {"success": False, "error": str(e)}
     
+    def cancel_affected_bookings(self, reason: str, booking_type: str = None, item_id: str = None,
+                                 destination: str = None, concurrency: int = 8, rate: float = 25.0) -> Dict:
+        """Refund and cancel every confirmed booking on a cancelled item or closed destination"""
+        try:
+            if not (item_id or destination):
+                raise ValueError("An item or a destination is required for a mass cancellation")
+            print(f"💸 Cancelling bookings for {item_id or destination}: {reason}")
+            
+            progress = self._refund_processor(concurrency=concurrency, rate=rate).run(
+                RefundCriteria(booking_type=booking_type, item_id=item_id, destination=destination), reason
+            )
+            return {
+                "success": progress.failed == 0,
+                "selected": progress.selected,
+                "refunded": progress.refunded,
+                "cancelled": progress.cancelled,
+                "failed": progress.failed,
+                "without_payment": progress.skipped,
+                "amount_refunded": progress.amount_refunded / 100,
+                "refunds_per_second": round(progress.refunds_per_second, 1),
+                "errors": progress.errors
+            }
+        except Exception as e:
+            print(f"❌ Error cancelling bookings: {e}")
+            return {"success": False, "error": str(e)}
+    
     # === FLIGHT BOOKING ===
     
     def book_flight(self, user_id: str, flight_id: str, passenger_details: List[Dict],
@@ -355,8 +412,9 @@ class BookingManager:
     # === RESTAURANT BOOKING ===
     
     def book_restaurant(self, user_id: str, restaurant_id: str, date_time: str,
-                       party_size: int, special_requests: List[str] = None) -> BookingConfirmation:
-        """Book a restaurant"""
+                       party_size: int, special_requests: List[str] = None,
+                       slot_hold_id: str = None) -> BookingConfirmation:
+        """Book a restaurant (slot_hold_id: table held through the restaurant slot engine)"""
         try:
             # Get restaurant details
             restaurant = self._get_restaurant_details(restaurant_id)
@@ -373,7 +431,8 @@ class BookingManager:
                 details={
                     "restaurant": restaurant,
                     "date_time": date_time,
-                    "party_size": party_size
+                    "party_size": party_size,
+                    "slot_hold_id": slot_hold_id
                 },
                 total_amount=deposit_amount,
                 special_requests=special_requests
@@ -463,20 +522,20 @@ class BookingManager:
     
     # === BOOKING MANAGEMENT ===
     
-    def get_user_bookings(self, user_id: str, status: BookingStatus = None) -> List[Dict]:
-        """Get all bookings for a user"""
+    def get_user_bookings(self, user_id: str, status: BookingStatus = None, limit: int = 20,
+                          cursor: str = None) -> List[Dict]:
+        """Newest bookings for a user, list columns only (see get_user_bookings_page for paging)"""
+        return self.get_user_bookings_page(user_id, status, limit, cursor).items
+    
+    def get_user_bookings_page(self, user_id: str, status: BookingStatus = None, limit: int = 20,
+                               cursor: str = None) -> BookingPage:
+        """One keyset page of a user's bookings; pass page.next_cursor to get the next one"""
         try:
-            query = self.supabase.table("bookings").select("*").eq("user_id", user_id)
-            
-            if status:
-                query = query.eq("status", status.value)
-            
-            result = query.order("created_at", desc=True).execute()
-            return result.data
-            
+            return self.history.page(user_id, cursor=cursor, limit=limit,
+                                                status=status.value if status else None)
         except Exception as e:
             print(f"❌ Error getting user bookings: {e}")
-            return []
+            return BookingPage()
     
     def get_booking_details(self, booking_id: str) -> Dict:
         """Get detailed booking information"""
@@ -515,6 +574,23 @@ class BookingManager:
             # Calculate price difference
             price_difference = self._calculate_modification_cost(booking, modifications)
             
+            # Refund a cheaper change before saving it: a saved total leaves nothing for a retry to refund
+            payment_result = None
+            if price_difference > 0:
+                payment_result = {"additional_payment_required": price_difference}
+            elif price_difference < 0:
+                payment_result = {"refund_amount": abs(price_difference)}
+                if booking["status"] == BookingStatus.CONFIRMED.value:
+                    # Keyed by the change and the booking version it applies to: a retry refunds once, while
+                    # the same change made again later (A -> B -> A -> B) gets a refund of its own
+                    change = json.dumps([modifications, booking["total_amount"],
+                                         booking.get("modified_at") or booking.get("created_at")],
+                                        sort_keys=True, default=str)
+                    payment_result = self._process_refund(booking, "Booking modified", amount=abs(price_difference),
+                                                          key_suffix="modify-" + hashlib.sha1(change.encode()).hexdigest()[:16])
+                    if "error" in payment_result:
+                        raise ValueError(f"Refund failed, booking not modified: {payment_result['error']}")
+            
             # Update booking details
             updated_details = booking["details"].copy()
             updated_details.update(modifications)
@@ -527,13 +603,7 @@ class BookingManager:
             }
             
             self.supabase.table("bookings").update(update_data).eq("id", booking_id).execute()
-            
-            # Process additional payment if needed
-            payment_result = None
-            if price_difference > 0:
-                payment_result = {"additional_payment_required": price_difference}
-            elif price_difference < 0:
-                payment_result = {"refund_amount": abs(price_difference)}
+            self.history.invalidate(booking_id)
             
             return {
                 "success": True,
@@ -572,11 +642,19 @@ class BookingManager:
             return {"valid": False, "error": str(e)}
     
     def _check_availability(self, request: BookingRequest) -> Dict:
-        """Check if the requested booking is available"""
+        """Check if the requested booking is available (read-only; create_booking takes the hold)"""
         try:
-            # This would implement real availability checking
-            # For now, assuming everything is available
-            return {"available": True}
+            window = inventory_request(request.booking_type.value, request.details)
+            if window is None:
+                return {"available": True}
+            start, end, quantity = window
+            remaining = self.inventory.available(request.booking_type.value, request.item_id, start, end)
+            if remaining is None:
+                return {"available": True}  # capacity is not tracked for this item
+            if remaining < quantity:
+                return {"available": False, "remaining": remaining,
+                        "reason": f"Only {remaining} left for {start} to {end}"}
+            return {"available": True, "remaining": remaining}
             
         except Exception as e:
             return {"available": False, "reason": str(e)}
@@ -613,10 +691,12 @@ class BookingManager:
             return {"final_amount": request.total_amount}
     
     def _generate_confirmation_number(self) -> str:
-        """Generate a unique confirmation number"""
-        import random
-        import string
-        return ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        """Generate a unique confirmation number (time-ordered Snowflake code, no database check needed)"""
+        return new_confirmation_code()
+    
+    def _is_duplicate_confirmation(self, error: Exception) -> bool:
+        """True for a unique violation (23505) on bookings.confirmation_number"""
+        return getattr(error, "code", None) == "23505" and "confirmation_number" in str(error)
     
     def _get_booking_by_id(self, booking_id: str) -> Dict:
         """Get booking by ID"""
@@ -627,15 +707,24 @@ class BookingManager:
             print(f"❌ Error getting booking: {e}")
             return None
     
-    def _update_booking_status(self, booking_id: str, status: BookingStatus):
-        """Update booking status"""
+    def _update_booking_status(self, booking_id: str, status: BookingStatus,
+                               only_from: BookingStatus = None) -> bool:
+        """Update booking status (only if it is still `only_from`, when given); True when a row changed"""
         try:
-            self.supabase.table("bookings").update({
+            query = self.supabase.table("bookings").update({
                 "status": status.value,
                 "updated_at": datetime.now().isoformat()
-            }).eq("id", booking_id).execute()
+            }).eq("id", booking_id)
+            if only_from is not None:
+                query = query.eq("status", only_from.value)
+            result = query.execute()
+            self.history.invalidate(booking_id)
+            if self.holds and status != BookingStatus.PENDING:
+                self.holds.untrack(booking_id)
+            return bool(result.data)
         except Exception as e:
             print(f"❌ Error updating booking status: {e}")
+            return False
     
     def _get_flight_details(self, flight_id: str) -> Dict:
         """Get flight details"""
@@ -710,39 +799,123 @@ class BookingManager:
             return None
     
     def _send_booking_confirmation(self, booking: Dict):
-        """Send booking confirmation email/SMS"""
+        """Queue booking confirmation email/SMS on the notification outbox"""
         try:
-            # This would integrate with email/SMS service
-            print(f"📧 Sending confirmation for booking {booking['confirmation_number']}")
-            # Implementation would go here
+            from src.services.notification_outbox import get_notification_outbox
+            
+            get_notification_outbox().enqueue_booking_notice(booking, kind="confirmation")
+            print(f"📧 Queued confirmation for booking {booking['confirmation_number']}")
         except Exception as e:
             print(f"❌ Error sending confirmation: {e}")
     
     def _send_cancellation_confirmation(self, booking: Dict, reason: str):
-        """Send cancellation confirmation"""
+        """Queue cancellation confirmation on the notification outbox"""
         try:
-            print(f"📧 Sending cancellation confirmation for booking {booking['confirmation_number']}")
-            # Implementation would go here
+            from src.services.notification_outbox import get_notification_outbox
+            
+            get_notification_outbox().enqueue_booking_notice(booking, kind="cancellation", reason=reason)
+            print(f"📧 Queued cancellation confirmation for booking {booking['confirmation_number']}")
         except Exception as e:
             print(f"❌ Error sending cancellation confirmation: {e}")
     
-    def _update_inventory(self, booking: Dict):
-        """Update inventory after booking"""
-        try:
-            # This would update availability in respective tables
-            print(f"📦 Updating inventory for {booking['booking_type']}")
-            # Implementation would go here
-        except Exception as e:
-            print(f"❌ Error updating inventory: {e}")
+    def _record_analytics(self, event_type: str, booking: Dict):
+        """Feed the booking into the analytics rollups"""
+        from src.services.analytics_pipeline import record_event
+        
+        details = booking.get("details") or {}
+        record_event(event_type, float(booking.get("total_amount") or 0), booking.get("booking_type"),
+                     details.get("destination") or details.get("city"), booking.get("user_id"))
+    
+    def _update_inventory(self, booking: Dict) -> bool:
+        """Hold the booking's capacity; False when any day is short"""
+        window = inventory_request(booking["booking_type"], booking.get("details") or {})
+        if window is None:
+            return True
+        start, end, quantity = window
+        return self.inventory.hold(booking["booking_type"], booking["item_id"], start, end, quantity)
     
     def _restore_inventory(self, booking: Dict):
         """Restore inventory after cancellation"""
         try:
-            print(f"📦 Restoring inventory for {booking['booking_type']}")
-            # Implementation would go here
+            window = inventory_request(booking["booking_type"], booking.get("details") or {})
+            if window is not None:
+                start, end, quantity = window
+                self.inventory.release(booking["booking_type"], booking["item_id"], start, end, quantity)
+            slot_hold_id = (booking.get("details") or {}).get("slot_hold_id")
+            if slot_hold_id:
+                get_restaurant_slot_engine(self.supabase).release(slot_hold_id)
         except Exception as e:
             print(f"❌ Error restoring inventory: {e}")
     
+    def _payment_confirmed(self, booking: Dict):
+        """Called by the webhook workers for each booking they moved from pending to confirmed"""
+        self.history.invalidate(booking["id"])
+        if self.holds:
+            self.holds.untrack(booking["id"])
+        self._send_booking_confirmation(booking)
+        self._record_analytics("booking", booking)
+    
+    def _payment_failed(self, booking: Dict):
+        """Called by the webhook workers for each booking they moved from pending to failed"""
+        self.history.invalidate(booking["id"])
+        if self.holds:
+            self.holds.untrack(booking["id"])
+        self._restore_inventory(booking)
+    
+    def _refund_cancelled(self, booking: Dict):
+        """Called by the refund batch for each booking it refunded and moved from confirmed to cancelled"""
+        self.history.invalidate(booking["id"])
+        self._restore_inventory(booking)
+        self._send_cancellation_confirmation(booking, "Refunded after a mass cancellation")
+        self._record_analytics("cancellation", booking)
+    
+    def _refund_unbooked_payment(self, booking: Dict, payment_intent_id: str) -> Dict:
+        """Refund a charge that succeeded after its booking expired, failed or was cancelled"""
+        # Same idempotency key as the webhook path, so the charge is refunded once whichever side sees it first
+        result = self._refund_processor().refund_booking(
+            booking, payment_intent_id, "Payment completed after the booking was no longer held"
+        )
+        if result["success"]:
+            try:
+                self.supabase.table("bookings").update({
+                    "payment_status": "refunded",
+                    "updated_at": datetime.now().isoformat()
+                }).eq("id", booking["id"]).execute()
+                self.history.invalidate(booking["id"])
+            except Exception as e:
+                print(f"❌ Error recording refund for booking {booking['id']}: {e}")
+            message = "Your booking was no longer held when the payment completed; the charge has been refunded."
+        else:
+            print(f"❌ Refund failed for unbooked payment {payment_intent_id}: {result['error']}")
+            message = "Your booking was no longer held when the payment completed; our team will refund the charge."
+        return {
+            "success": False,
+            "status": booking.get("status") or BookingStatus.EXPIRED.value,
+            "conflict": True,
+            "refunded": result["success"],
+            "payment_intent_id": payment_intent_id,
+            "message": message
+        }
+    
+    def _webhook_unbooked_payment(self, booking: Dict, payment_intent_id: Optional[str]) -> bool:
+        """Called by the webhook workers for a payment whose booking was no longer pending"""
+        if not payment_intent_id:
+            return False
+        return self._refund_unbooked_payment(booking, payment_intent_id)["refunded"]
+    
+    def _refund_processor(self, concurrency: int = 8, rate: float = 25.0) -> RefundBatchProcessor:
+        """Refund processor on the shared Stripe service"""
+        from src.api_integration.stripe.stripe_service import StripeService
+        
+        status_store = SupabaseBookingStatusStore(self.supabase) if self.supabase else None
+        return RefundBatchProcessor(StripeService(), self.refund_source, status_store, concurrency=concurrency,
+                                    rate=rate, on_cancelled=self._refund_cancelled)
+    
+    def _expire_hold(self, booking: Dict):
+        """Called by the expiry sweeper for each booking it moved from pending to expired"""
+        self._restore_inventory(booking)
+        self.history.invalidate(booking["id"])
+    
     def _can_cancel_booking(self, booking: Dict) -> bool:
         """Check if booking can be cancelled"""
         try:
@@ -756,12 +929,20 @@ class BookingManager:
         """Check if booking can be modified"""
         return self._can_cancel_booking(booking)  # Same policy for now
     
-    def _process_refund(self, booking: Dict, reason: str) -> Dict:
-        """Process refund for cancelled booking"""
+    def _process_refund(self, booking: Dict, reason: str, amount: float = None, key_suffix: str = "") -> Dict:
+        """Refund a booking's payment (all of it unless an amount is given); safe to call again"""
         try:
-            # This would implement actual refund processing
+            payment_intent_id = self.refund_source.payment_intents([str(booking["id"])]).get(str(booking["id"]))
+            if not payment_intent_id:
+                return {"refund_amount": 0, "reason": reason, "message": "No payment on record for this booking"}
+            
+            result = self._refund_processor().refund_booking(booking, payment_intent_id, reason or "",
+                                                             amount=amount, key_suffix=key_suffix)
+            if not result["success"]:
+                raise ValueError(result["error"])
             return {
-                "refund_amount": booking["total_amount"],
+                "refund_id": result["refund_id"],
+                "refund_amount": result["amount"] / 100,
                 "processing_time": "3-5 business days",
                 "reason": reason
             }
@@ -776,6 +957,41 @@ class BookingManager:
         except Exception as e:
             return 0.0
 
+# === PROCESS-WIDE MANAGER ===
+
+_shared_manager: Optional[BookingManager] = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_booking_manager() -> BookingManager:
+    """Process-wide manager for background work that belongs to no user session"""
+    global _shared_manager
+    with _shared_manager_lock:
+        if _shared_manager is None:
+            _shared_manager = BookingManager()
+        return _shared_manager
+
+
+# The webhook workers outlive whichever session started them, so their callbacks look up the
+# process-wide manager when they fire instead of holding on to one session's BookingManager
+def _webhook_payment_confirmed(booking: Dict):
+    get_booking_manager()._payment_confirmed(booking)
+
+
+def _webhook_payment_failed(booking: Dict):
+    get_booking_manager()._payment_failed(booking)
+
+
+def _webhook_refund_unbooked_payment(booking: Dict, payment_intent_id: Optional[str]) -> bool:
+    return get_booking_manager()._webhook_unbooked_payment(booking, payment_intent_id)
+
+
+WEBHOOK_CALLBACKS = {
+    "on_confirmed": _webhook_payment_confirmed,
+    "on_failed": _webhook_payment_failed,
+    "on_unbooked_payment": _webhook_refund_unbooked_payment
+}
+
 # === DEMO FUNCTION ===
 
 def demo_booking_system():
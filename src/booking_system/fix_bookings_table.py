@@ -6,11 +6,15 @@ This script will create the proper bookings table with all required columns
 import os
 import sys
 from pathlib import Path
-from supabase import create_client, Client
+from supabase import Client
 from dotenv import load_dotenv
 
-# Add parent directory to path
+# Add parent directory and project root to path
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.api_integration.supabase.client_factory import get_supabase_client
+from src.database.bulk_loader import BulkLoader, read_seed_file, SEEDS_DIR
 
 # Load environment variables
 load_dotenv()
@@ -28,7 +32,7 @@ def fix_bookings_table():
         return False
     
     try:
-        supabase: Client = create_client(supabase_url, supabase_key)
+        supabase: Client = get_supabase_client(supabase_url, supabase_key)
         print("✅ Connected to Supabase")
         
         # Check if bookings table exists
@@ -199,83 +203,12 @@ COMMENT ON COLUMN bookings.details IS 'Flexible JSON field for booking-specific
 def insert_sample_data(supabase: Client):
     """Insert sample data for testing"""
     
-    sample_bookings = [
-        {
-            "booking_type": "flight",
-            "user_id": "demo_user_001",
-            "item_id": "flight_demo_001",
-            "total_amount": 299.99,
-            "currency": "USD",
-            "status": "confirmed",
-            "payment_status": "paid",
-            "details": {
-                "flight_number": "AA101",
-                "departure": "JFK",
-                "arrival": "LAX",
-                "departure_time": "2024-08-15T08:00:00Z",
-                "arrival_time": "2024-08-15T11:30:00Z",
-                "passengers": 1
-            },
-            "special_requests": ["Window seat", "Vegetarian meal"],
-            "customer_details": {
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "phone": "+1234567890"
-            }
-        },
-        {
-            "booking_type": "hotel",
-            "user_id": "demo_user_001",
-            "item_id": "hotel_demo_001",
-            "total_amount": 189.99,
-            "currency": "USD",
-            "status": "confirmed",
-            "payment_status": "paid",
-            "details": {
-                "hotel_name": "Grand Plaza Hotel",
-                "check_in": "2024-08-15",
-                "check_out": "2024-08-17",
-                "nights": 2,
-                "room_type": "Deluxe King",
-                "guests": 2
-            },
-            "special_requests": ["Late checkout", "High floor"],
-            "customer_details": {
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "phone": "+1234567890"
-            }
-        },
-        {
-            "booking_type": "restaurant",
-            "user_id": "demo_user_002",
-            "item_id": "restaurant_demo_001",
-            "total_amount": 0.00,
-            "currency": "USD",
-            "status": "confirmed",
-            "payment_status": "paid",
-            "details": {
-                "restaurant_name": "Le Bistro",
-                "reservation_date": "2024-08-16",
-                "reservation_time": "19:00",
-                "party_size": 4,
-                "table_preference": "Window table"
-            },
-            "special_requests": ["Birthday celebration"],
-            "customer_details": {
-                "name": "Jane Smith",
-                "email": "jane.smith@example.com",
-                "phone": "+1234567891"
-            }
-        }
-    ]
+    sample_bookings = read_seed_file(SEEDS_DIR / "sample_bookings.json")
     
     try:
-        result = supabase.table("bookings").insert(sample_bookings).execute()
-        print(f"✅ Inserted {len(sample_bookings)} sample bookings")
-        
-        for booking in result.data:
-            print(f"   • {booking['booking_type'].title()}: {booking['confirmation_number']}")
+        # Keyed on (user_id, item_id) so rerunning the script does not duplicate the demo bookings
+        report = BulkLoader(supabase).load_rows("bookings", sample_bookings, natural_key="user_id,item_id")
+        print(f"✅ Loaded {report}")
         
         return True
         
@@ -0,0 +1,253 @@
+"""
+👥 Group Booking Store
+Persistent, concurrency-safe storage for group bookings
+
+Membership is a set keyed on (group_id, user_id), so membership checks are
+O(1) and duplicate joins are idempotent. Creating and joining are single
+atomic operations: the Supabase store calls the `create_group_booking` RPC,
+which inserts the group with its leader as the first member, and the
+`join_group_booking` RPC, which locks the group row and checks capacity and
+membership in the same transaction that inserts the member. Group pages read
+through a short-lived cached read model.
+"""
+
+import time
+import uuid
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+JOINED = "joined"
+ALREADY_MEMBER = "already_member"
+FULL = "full"
+NOT_FOUND = "not_found"
+CLOSED = "closed"
+
+
+def _new_group_id() -> str:
+    """Readable group ID that cannot collide within the same second"""
+    return f"group_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+class InMemoryGroupBookingStore:
+    """Process-local store used for development, tests and benchmarks"""
+
+    def __init__(self):
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        self._members: Dict[str, Dict[str, str]] = {}  # group_id -> {user_id: joined_at}
+        self._lock = threading.Lock()
+
+    def create_group(self, leader_id: str, destination: str, travel_dates: Tuple[str, str],
+                     max_participants: int = 10) -> str:
+        group_id = _new_group_id()
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._groups[group_id] = {
+                "group_id": group_id,
+                "leader_id": leader_id,
+                "destination": destination,
+                "travel_dates": tuple(travel_dates),
+                "max_participants": max_participants,
+                "status": "open",
+                "created_at": now,
+                "preferences": {},
+                "group_discounts": {}
+            }
+            self._members[group_id] = {leader_id: now}
+        return group_id
+
+    def join(self, group_id: str, user_id: str) -> str:
+        with self._lock:
+            group = self._groups.get(group_id)
+            if group is None:
+                return NOT_FOUND
+            members = self._members[group_id]
+            if user_id in members:
+                return ALREADY_MEMBER
+            if group["status"] != "open":
+                return CLOSED
+            if len(members) >= group["max_participants"]:
+                return FULL
+            members[user_id] = datetime.now().isoformat()
+            return JOINED
+
+    def is_member(self, group_id: str, user_id: str) -> bool:
+        with self._lock:
+            return user_id in self._members.get(group_id, {})
+
+    def get_group(self, group_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            group = self._groups.get(group_id)
+            if group is None:
+                return None
+            return dict(group, participants=list(self._members[group_id]))
+
+    def list_groups(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            group_ids = sorted(self._groups, key=lambda gid: self._groups[gid]["created_at"], reverse=True)
+        return [self.get_group(group_id) for group_id in group_ids[:limit]]
+
+
+class SupabaseGroupBookingStore:
+    """Database-backed store shared by every app replica"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def create_group(self, leader_id: str, destination: str, travel_dates: Tuple[str, str],
+                     max_participants: int = 10) -> str:
+        group_id = _new_group_id()
+        # The group row and the leader's membership are inserted in one transaction server-side
+        self.client.rpc("create_group_booking", {
+            "p_group_id": group_id,
+            "p_leader_id": leader_id,
+            "p_destination": destination,
+            "p_start_date": travel_dates[0],
+            "p_end_date": travel_dates[1],
+            "p_max_participants": max_participants
+        }).execute()
+        return group_id
+
+    def join(self, group_id: str, user_id: str) -> str:
+        # Capacity check, membership check and insert happen in one transaction server-side
+        result = self.client.rpc("join_group_booking", {
+            "p_group_id": group_id,
+            "p_user_id": user_id
+        }).execute()
+        return result.data if isinstance(result.data, str) else NOT_FOUND
+
+    def is_member(self, group_id: str, user_id: str) -> bool:
+        result = self.client.table("group_booking_members").select("user_id") \
+            .eq("group_id", group_id).eq("user_id", user_id).limit(1).execute()
+        return bool(result.data)
+
+    def get_group(self, group_id: str) -> Optional[Dict[str, Any]]:
+        result = self.client.table("group_bookings").select("*").eq("group_id", group_id).limit(1).execute()
+        if not result.data:
+            return None
+        members = self.client.table("group_booking_members").select("user_id") \
+            .eq("group_id", group_id).order("joined_at").execute()
+        return self._to_read_model(result.data[0], [m["user_id"] for m in members.data or []])
+
+    def list_groups(self, limit: int = 50) -> List[Dict[str, Any]]:
+        result = self.client.table("group_bookings").select("*") \
+            .order("created_at", desc=True).limit(limit).execute()
+        groups = result.data or []
+        if not groups:
+            return []
+
+        # One query for all members of the listed groups
+        members = self.client.table("group_booking_members").select("group_id, user_id") \
+            .in_("group_id", [g["group_id"] for g in groups]).order("joined_at").execute()
+        participants: Dict[str, List[str]] = {}
+        for member in members.data or []:
+            participants.setdefault(member["group_id"], []).append(member["user_id"])
+        return [self._to_read_model(g, participants.get(g["group_id"], [])) for g in groups]
+
+    def _to_read_model(self, row: Dict[str, Any], participants: List[str]) -> Dict[str, Any]:
+        return {
+            "group_id": row["group_id"],
+            "leader_id": row["leader_id"],
+            "destination": row["destination"],
+            "travel_dates": (row.get("start_date"), row.get("end_date")),
+            "max_participants": row["max_participants"],
+            "participants": participants,
+            "status": row.get("status", "open"),
+            "created_at": row.get("created_at", ""),
+            "preferences": row.get("preferences") or {},
+            "group_discounts": row.get("group_discounts") or {}
+        }
+
+
+class CachedGroupReadModel:
+    """TTL cache in front of a store's read side; local writes invalidate immediately"""
+
+    def __init__(self, store, ttl: float = 5.0):
+        self.store = store
+        self.ttl = ttl
+        self._groups: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._listing: Optional[Tuple[float, int, List[Dict[str, Any]]]] = None
+        self._lock = threading.Lock()
+
+    def get_group(self, group_id: str) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._groups.get(group_id)
+            if cached and now - cached[0] < self.ttl:
+                return cached[1]
+        group = self.store.get_group(group_id)
+        with self._lock:
+            self._groups[group_id] = (now, group)
+        return group
+
+    def list_groups(self, limit: int = 50) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            if self._listing and now - self._listing[0] < self.ttl and self._listing[1] >= limit:
+                return self._listing[2][:limit]
+        groups = self.store.list_groups(limit)
+        with self._lock:
+            self._listing = (now, limit, groups)
+            for group in groups:
+                self._groups[group["group_id"]] = (now, group)
+        return groups
+
+    def invalidate(self, group_id: Optional[str] = None):
+        with self._lock:
+            if group_id:
+                self._groups.pop(group_id, None)
+            else:
+                self._groups.clear()
+            self._listing = None
+
+
+def get_group_booking_store(supabase_client=None):
+    """Use the database when a client is available, otherwise a local store"""
+    if supabase_client is not None:
+        return SupabaseGroupBookingStore(supabase_client)
+    print("⚠️ No database client - group bookings are kept in memory for this process only")
+    return InMemoryGroupBookingStore()
+
+
+def run_join_contention_benchmark(store=None, joiners: int = 500, capacity: int = 50,
+                                  threads: int = 64) -> Dict[str, Any]:
+    """Race many joiners (each joining twice) against one group and verify capacity holds"""
+    store = store or InMemoryGroupBookingStore()
+    group_id = store.create_group("leader", "Benchmark City", ("2025-07-01", "2025-07-08"), capacity)
+    threads = min(threads, joiners)
+    start_barrier = threading.Barrier(threads)
+
+    def join_twice(index: int) -> Tuple[str, str]:
+        if index < threads:
+            start_barrier.wait()
+        user_id = f"user_{index}"
+        return store.join(group_id, user_id), store.join(group_id, user_id)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        outcomes = list(pool.map(join_twice, range(joiners)))
+    elapsed = time.perf_counter() - start
+
+    first_results = [first for first, _ in outcomes]
+    joined = first_results.count(JOINED)
+    group = store.get_group(group_id)
+    results = {
+        "joiners": joiners,
+        "joined": joined,
+        "rejected_full": first_results.count(FULL),
+        "participants": len(group["participants"]),
+        "capacity_respected": len(group["participants"]) <= capacity and joined == capacity - 1,
+        "repeat_joins_idempotent": all(
+            second == ALREADY_MEMBER for first, second in outcomes if first == JOINED
+        ),
+        "joins_per_second": (joiners * 2) / elapsed if elapsed else 0.0
+    }
+    print(f"👥 Join contention: {joined} joined, {results['rejected_full']} rejected, "
+          f"{results['joins_per_second']:.0f} join calls/s, "
+          f"capacity respected: {results['capacity_respected']}")
+    return results
+
+
+if __name__ == "__main__":
+    run_join_contention_benchmark()
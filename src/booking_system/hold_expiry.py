@@ -0,0 +1,276 @@
+"""
+⏳ Hold Expiry
+Expire pending bookings when their hold runs out, at a cost proportional to what expires
+
+create_booking takes an inventory hold and sets expires_at on every pending
+booking. The sweeper keeps pending holds in a min-heap keyed on expires_at:
+it is loaded once at startup from an index range scan on (status, expires_at)
+(migration 0005), and then kept current by BookingManager as bookings are
+created, paid or cancelled, so nothing ever scans the bookings table.
+
+A background thread sleeps until the earliest deadline. Due holds are expired
+in batches with one conditional update (status still pending -> expired); only
+the rows that update actually returns give their inventory back, so a payment
+that confirms a booking at the same moment always wins cleanly. Entries for
+bookings that left the pending state are dropped lazily when they reach the
+top of the heap.
+
+Usage:
+    python src/booking_system/hold_expiry.py   # sweep cost vs. table size
+"""
+
+import time
+import heapq
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+PENDING = "pending"
+EXPIRED = "expired"
+HOLD_COLUMNS = "id,booking_type,item_id,details,expires_at,status"
+
+
+def _timestamp(value: Any) -> float:
+    """Epoch seconds for an expires_at value (naive values are local time, as create_booking writes them)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return value.timestamp()
+
+
+class InMemoryHoldStore:
+    """Process-local bookings table used for development, tests and benchmarks"""
+
+    def __init__(self):
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.rows_read = 0
+        self._lock = threading.Lock()
+
+    def add(self, row: Dict[str, Any]):
+        with self._lock:
+            self.rows[str(row["id"])] = dict(row)
+
+    def pending(self, after: Optional[Tuple[float, str]], limit: int) -> List[Dict[str, Any]]:
+        # Stands in for the (status, expires_at) index: only pending rows are read
+        with self._lock:
+            rows = sorted((_timestamp(row["expires_at"]), row_id) for row_id, row in self.rows.items()
+                          if row["status"] == PENDING and row.get("expires_at"))
+            rows = [key for key in rows if after is None or key > after][:limit]
+            self.rows_read += len(rows)
+            return [dict(self.rows[row_id]) for _, row_id in rows]
+
+    def expire(self, booking_ids: List[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            expired = []
+            for booking_id in booking_ids:
+                row = self.rows.get(booking_id)
+                if row and row["status"] == PENDING:
+                    row["status"] = EXPIRED
+                    expired.append(dict(row))
+            self.rows_read += len(booking_ids)
+            return expired
+
+
+class SupabaseHoldStore:
+    """Pending holds in the bookings table"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def pending(self, after: Optional[Tuple[float, str]], limit: int) -> List[Dict[str, Any]]:
+        query = self.client.table("bookings").select(HOLD_COLUMNS).eq("status", PENDING) \
+            .not_.is_("expires_at", "null")
+        if after is not None:
+            expires_at = datetime.fromtimestamp(after[0]).astimezone().isoformat()
+            query = query.or_(f'expires_at.gt."{expires_at}",and(expires_at.eq."{expires_at}",id.gt."{after[1]}")')
+        return query.order("expires_at").order("id").limit(limit).execute().data or []
+
+    def expire(self, booking_ids: List[str]) -> List[Dict[str, Any]]:
+        # The status filter makes this a compare-and-set: rows confirmed meanwhile are not returned
+        result = self.client.table("bookings").update({
+            "status": EXPIRED,
+            "updated_at": datetime.now().isoformat()
+        }).in_("id", booking_ids).eq("status", PENDING).execute()
+        return result.data or []
+
+
+class HoldExpirySweeper:
+    """Min-heap of pending hold deadlines with batched expiry"""
+
+    def __init__(self, store, release: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 batch_size: int = 200, load_page_size: int = 1000, max_idle: float = 60.0,
+                 clock: Callable[[], float] = time.time):
+        self.store = store
+        self.release = release
+        self.batch_size = batch_size
+        self.load_page_size = load_page_size
+        self.max_idle = max_idle
+        self.clock = clock
+        self.stats = {"loaded": 0, "tracked": 0, "expired": 0, "stale": 0, "batches": 0}
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._wakeup = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # === TRACKING ===
+
+    def load(self) -> int:
+        """Read every pending hold once, in (expires_at, id) order, a page at a time"""
+        loaded, after = 0, None
+        while True:
+            rows = self.store.pending(after, self.load_page_size)
+            for row in rows:
+                self.track(row["id"], row["expires_at"])
+            loaded += len(rows)
+            if len(rows) < self.load_page_size:
+                break
+            after = (_timestamp(rows[-1]["expires_at"]), str(rows[-1]["id"]))
+        self.stats["loaded"] += loaded
+        return loaded
+
+    def track(self, booking_id: str, expires_at: Any):
+        """Schedule a pending booking (again, if its deadline moved)"""
+        deadline = _timestamp(expires_at)
+        with self._wakeup:
+            self._deadlines[str(booking_id)] = deadline
+            heapq.heappush(self._heap, (deadline, str(booking_id)))
+            self.stats["tracked"] += 1
+            if self._heap[0][0] == deadline:
+                self._wakeup.notify()
+
+    def untrack(self, booking_id: str):
+        """The booking left the pending state; its heap entry is skipped when it comes up"""
+        with self._wakeup:
+            self._deadlines.pop(str(booking_id), None)
+
+    def pending_count(self) -> int:
+        with self._wakeup:
+            return len(self._deadlines)
+
+    def next_deadline(self) -> Optional[float]:
+        with self._wakeup:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _drop_stale(self):
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+            self.stats["stale"] += 1
+
+    # === SWEEPING ===
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Expire every hold that is due; returns how many bookings were expired"""
+        now = self.clock() if now is None else now
+        expired = 0
+        while True:
+            batch = []
+            with self._wakeup:
+                self._drop_stale()
+                while self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size:
+                    _, booking_id = heapq.heappop(self._heap)
+                    if self._deadlines.pop(booking_id, None) is not None:
+                        batch.append(booking_id)
+                    self._drop_stale()
+            if not batch:
+                return expired
+            expired += self._expire_batch(batch)
+
+    def _expire_batch(self, booking_ids: List[str]) -> int:
+        try:
+            rows = self.store.expire(booking_ids)
+        except Exception as e:
+            print(f"❌ Error expiring holds: {e}")
+            for booking_id in booking_ids:  # retry on the next pass
+                self.track(booking_id, self.clock() + 5.0)
+            return 0
+        for row in rows:
+            if self.release:
+                try:
+                    self.release(row)
+                except Exception as e:
+                    print(f"❌ Error releasing hold for {row.get('id')}: {e}")
+        self.stats["expired"] += len(rows)
+        self.stats["batches"] += 1
+        return len(rows)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.sweep()
+            with self._wakeup:
+                self._drop_stale()
+                delay = self._heap[0][0] - self.clock() if self._heap else self.max_idle
+                if delay > 0 and not self._stop.is_set():
+                    self._wakeup.wait(min(delay, self.max_idle))
+
+    def start(self):
+        """Load pending holds and start the background thread (idempotent)"""
+        if self._thread:
+            return self
+        loaded = self.load()
+        if loaded:
+            print(f"⏳ Tracking {loaded} pending booking holds")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="hold-expiry", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify()
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+
+
+_sweeper: Optional[HoldExpirySweeper] = None
+_sweeper_lock = threading.Lock()
+
+
+def get_hold_expiry_sweeper(client=None, release: Optional[Callable[[Dict[str, Any]], None]] = None
+                            ) -> Optional[HoldExpirySweeper]:
+    """Process-wide sweeper over the bookings table, started on first use; None without a database"""
+    global _sweeper
+    with _sweeper_lock:
+        if _sweeper is None and client is not None:
+            _sweeper = HoldExpirySweeper(SupabaseHoldStore(client), release)
+            try:
+                _sweeper.start()
+            except Exception as e:
+                print(f"⚠️ Hold expiry sweeper not started: {e}")
+    return _sweeper
+
+
+def run_expiry_benchmark(table_sizes=(10_000, 100_000, 1_000_000), pending: int = 2000,
+                         due: int = 500) -> Dict[int, Dict[str, float]]:
+    """Rows read and seconds to expire `due` holds as the bookings table grows"""
+    results = {}
+    for size in table_sizes:
+        store = InMemoryHoldStore()
+        now = time.time()
+        for i in range(size):
+            is_pending = i < pending
+            store.rows[f"b{i:07d}"] = {
+                "id": f"b{i:07d}", "booking_type": "hotel", "item_id": "h1", "details": {},
+                "status": PENDING if is_pending else "confirmed",
+                "expires_at": now - 1 if i < due else now + 3600 + i
+            }
+        released = []
+        sweeper = HoldExpirySweeper(store, release=released.append, clock=lambda: now)
+        sweeper.load()
+        store.rows_read = 0
+
+        start = time.perf_counter()
+        expired = sweeper.sweep()
+        results[size] = {"expired": expired, "released": len(released), "rows_read": store.rows_read,
+                         "sweep_ms": (time.perf_counter() - start) * 1000}
+        print(f"⏳ {size:>9,} bookings: expired {expired} holds reading {store.rows_read} rows "
+              f"in {results[size]['sweep_ms']:.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    run_expiry_benchmark()
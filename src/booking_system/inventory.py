@@ -0,0 +1,261 @@
+"""
+📦 Inventory Engine
+Date-indexed capacity for hotels, flights, restaurants, car rentals and packages
+
+Capacity is kept per item as an array of remaining units per day (room-nights,
+seats, covers, cars), indexed by the day offset from the start of the booking
+horizon. Checking check_in..check_out is a min over one slice of that array
+(vectorized with NumPy when it is installed), never a scan over bookings.
+
+Holds are compare-and-decrement: every day in the range is decremented only if
+every day has enough left, atomically. The Supabase store does this in the
+`hold_inventory` RPC, which locks the item's calendar rows for the range and
+rolls back to a savepoint when any day is short; the in-memory store does it
+under a per-item lock. Changing capacity keeps the units already held on each
+day (the `set_inventory_capacity` RPC in the database). Items and days without
+capacity rows are unlimited, so inventory can be enabled one item (or season)
+at a time.
+
+Usage:
+    python src/booking_system/inventory.py   # many concurrent bookers on one hotel
+"""
+
+import time
+import threading
+from array import array
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+HORIZON_DAYS = 730
+UNLIMITED = 1 << 30  # days without a capacity row
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def inventory_request(booking_type: str, details: Dict[str, Any]) -> Optional[Tuple[date, date, int]]:
+    """
+    (first day, day after the last, units) a booking consumes, from its details
+
+    None when the details do not say which days are used; such bookings are not
+    checked against inventory.
+    """
+    try:
+        if booking_type == "hotel":
+            return _as_date(details["check_in"]), _as_date(details["check_out"]), int(details.get("rooms", 1))
+        if booking_type == "car_rental":
+            return _as_date(details["pickup_date"]), _as_date(details["return_date"]), 1
+        if booking_type == "restaurant":
+            day = _as_date(details["date_time"])
+            return day, day + timedelta(days=1), int(details.get("party_size", 1))
+        if booking_type == "flight":
+            flight = details.get("flight") or {}
+            day = _as_date(flight.get("departure_time") or flight["departure_date"])
+            return day, day + timedelta(days=1), int(details.get("total_passengers", 1))
+        if booking_type == "package":
+            day = _as_date(details["travel_date"])
+            return day, day + timedelta(days=1), int(details.get("total_travelers", 1))
+    except (KeyError, TypeError, ValueError):
+        return None
+    return None
+
+
+def _filled(days: int, value: int):
+    if NUMPY_AVAILABLE:
+        return np.full(days, value, dtype=np.int32)
+    return array("i", [value]) * days
+
+
+class _Calendar:
+    """Remaining and total units per day for one item"""
+    __slots__ = ("remaining", "capacity", "lock")
+
+    def __init__(self, days: int):
+        self.remaining = _filled(days, UNLIMITED)
+        self.capacity = _filled(days, UNLIMITED)
+        self.lock = threading.Lock()
+
+    def window_min(self, start: int, end: int) -> int:
+        if NUMPY_AVAILABLE:
+            return int(self.remaining[start:end].min())
+        return min(self.remaining[start:end])
+
+    def add(self, start: int, end: int, delta: int):
+        """Shift every day of the window by delta, capped at capacity"""
+        if NUMPY_AVAILABLE:
+            window = self.remaining[start:end]
+            np.minimum(window + delta, self.capacity[start:end], out=window)
+        else:
+            for day in range(start, end):
+                self.remaining[day] = min(self.remaining[day] + delta, self.capacity[day])
+
+    def set_capacity(self, start: int, end: int, capacity: int):
+        """New capacity for the window; units already held stay held (none left if they exceed it)"""
+        for day in range(start, end):
+            held = self.capacity[day] - self.remaining[day] if self.capacity[day] != UNLIMITED else 0
+            self.capacity[day] = capacity
+            self.remaining[day] = max(0, capacity - held)
+
+
+class InMemoryInventory:
+    """Process-local store used for development, tests and benchmarks"""
+
+    def __init__(self, horizon_start: Optional[date] = None, horizon_days: int = HORIZON_DAYS):
+        self.horizon_start = horizon_start or date.today()
+        self.horizon_days = horizon_days
+        self._calendars: Dict[Tuple[str, str], _Calendar] = {}
+        self._lock = threading.Lock()
+
+    def _window(self, start: date, end: date) -> Tuple[int, int]:
+        first = (_as_date(start) - self.horizon_start).days
+        last = (_as_date(end) - self.horizon_start).days
+        if first < 0 or last > self.horizon_days or last <= first:
+            raise ValueError(f"Dates {start}..{end} are outside the inventory horizon or empty")
+        return first, last
+
+    def set_capacity(self, item_type: str, item_id: str, capacity: int, start: Optional[date] = None,
+                     end: Optional[date] = None):
+        """Track capacity units per day for start..end (the whole horizon by default)"""
+        first, last = self._window(start or self.horizon_start,
+                                   end or self.horizon_start + timedelta(days=self.horizon_days))
+        key = (item_type, str(item_id))
+        with self._lock:
+            calendar = self._calendars.get(key)
+            if calendar is None:
+                calendar = self._calendars[key] = _Calendar(self.horizon_days)
+        with calendar.lock:
+            calendar.set_capacity(first, last, capacity)
+
+    def available(self, item_type: str, item_id: str, start: date, end: date) -> Optional[int]:
+        """Fewest units left on any day of start..end; None when the item is untracked"""
+        calendar = self._calendars.get((item_type, str(item_id)))
+        if calendar is None:
+            return None
+        first, last = self._window(start, end)
+        remaining = calendar.window_min(first, last)
+        return None if remaining >= UNLIMITED - (1 << 20) else remaining
+
+    def hold(self, item_type: str, item_id: str, start: date, end: date, quantity: int = 1) -> bool:
+        """Take `quantity` units on every day of start..end, or nothing if any day is short"""
+        calendar = self._calendars.get((item_type, str(item_id)))
+        if calendar is None:
+            return True
+        first, last = self._window(start, end)
+        with calendar.lock:
+            if calendar.window_min(first, last) < quantity:
+                return False
+            calendar.add(first, last, -quantity)
+            return True
+
+    def release(self, item_type: str, item_id: str, start: date, end: date, quantity: int = 1):
+        """Give back units taken by hold (never above capacity)"""
+        calendar = self._calendars.get((item_type, str(item_id)))
+        if calendar is None:
+            return
+        first, last = self._window(start, end)
+        with calendar.lock:
+            calendar.add(first, last, quantity)
+
+
+class SupabaseInventory:
+    """Database-backed store shared by every app replica (inventory_calendar table)"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def set_capacity(self, item_type: str, item_id: str, capacity: int, start: Optional[date] = None,
+                     end: Optional[date] = None):
+        """Track capacity units per day for start..end (the whole horizon by default); holds stay held"""
+        start = _as_date(start) if start else date.today()
+        end = _as_date(end) if end else date.today() + timedelta(days=HORIZON_DAYS)
+        self.client.rpc("set_inventory_capacity", {
+            "p_item_type": item_type, "p_item_id": str(item_id), "p_capacity": capacity,
+            "p_start": start.isoformat(), "p_end": end.isoformat()
+        }).execute()
+
+    def available(self, item_type: str, item_id: str, start: date, end: date) -> Optional[int]:
+        # Only the remaining column of the range's rows; the min is one pass over at most a few hundred ints
+        result = self.client.table("inventory_calendar").select("remaining") \
+            .eq("item_type", item_type).eq("item_id", str(item_id)) \
+            .gte("day", _as_date(start).isoformat()).lt("day", _as_date(end).isoformat()).execute()
+        remaining = [row["remaining"] for row in result.data or []]
+        return min(remaining) if remaining else None
+
+    def hold(self, item_type: str, item_id: str, start: date, end: date, quantity: int = 1) -> bool:
+        result = self.client.rpc("hold_inventory", self._params(item_type, item_id, start, end, quantity)).execute()
+        return bool(result.data)
+
+    def release(self, item_type: str, item_id: str, start: date, end: date, quantity: int = 1):
+        self.client.rpc("release_inventory", self._params(item_type, item_id, start, end, quantity)).execute()
+
+    def _params(self, item_type, item_id, start, end, quantity) -> Dict[str, Any]:
+        return {"p_item_type": item_type, "p_item_id": str(item_id), "p_start": _as_date(start).isoformat(),
+                "p_end": _as_date(end).isoformat(), "p_quantity": quantity}
+
+
+def get_inventory_store(supabase_client=None):
+    """Use the database when a client is available, otherwise a local store"""
+    if supabase_client is not None:
+        return SupabaseInventory(supabase_client)
+    print("⚠️ No database client - inventory is kept in memory for this process only")
+    return InMemoryInventory()
+
+
+def run_inventory_contention_benchmark(store=None, bookers: int = 2000, rooms: int = 50,
+                                       threads: int = 64, nights: int = 3) -> Dict[str, Any]:
+    """Race many bookers for overlapping stays at one hotel and verify no night is oversold"""
+    store = store or InMemoryInventory()
+    start_day = date.today() + timedelta(days=30)
+    store.set_capacity("hotel", "benchmark_hotel", rooms, start_day, start_day + timedelta(days=14))
+    threads = min(threads, bookers)
+    start_barrier = threading.Barrier(threads)
+
+    def book(index: int) -> Tuple[int, bool]:
+        if index < threads:
+            start_barrier.wait()
+        check_in = start_day + timedelta(days=index % 7)  # stays overlap on the middle nights
+        return index, store.hold("hotel", "benchmark_hotel", check_in, check_in + timedelta(days=nights))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        outcomes = list(pool.map(book, range(bookers)))
+    elapsed = time.perf_counter() - start
+
+    # Replay the granted holds to count room-nights per day
+    sold: List[int] = [0] * 14
+    for index, granted in outcomes:
+        if granted:
+            for night in range(index % 7, index % 7 + nights):
+                sold[night] += 1
+    granted = sum(1 for _, ok in outcomes if ok)
+    results = {
+        "bookers": bookers,
+        "granted": granted,
+        "rejected": bookers - granted,
+        "max_nights_sold": max(sold),
+        "oversold": max(sold) > rooms,
+        "consistent": all(rooms - sold[day] == store.available(
+            "hotel", "benchmark_hotel", start_day + timedelta(days=day), start_day + timedelta(days=day + 1))
+            for day in range(14)),
+        "holds_per_second": bookers / elapsed if elapsed else 0.0
+    }
+    print(f"📦 Inventory contention: {granted} holds granted, {results['rejected']} rejected, "
+          f"{results['holds_per_second']:.0f} holds/s, oversold: {results['oversold']}, "
+          f"consistent: {results['consistent']}")
+    return results
+
+
+if __name__ == "__main__":
+    run_inventory_contention_benchmark()
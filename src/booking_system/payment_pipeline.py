@@ -0,0 +1,250 @@
+"""
+💳 Payment Pipeline
+Idempotent, resumable customer -> payment intent -> confirm chain for bookings
+
+Every Stripe call carries an idempotency key derived from the booking and the
+step (plus the payment method for confirmation), so a retried request returns
+the object created by the first attempt instead of creating a second customer
+or charging twice. Each step runs under its own deadline and transient errors
+(network, 5xx, rate limits, timeouts) are retried with exponential backoff and
+jitter inside an overall budget, so a stalled call cannot block a session.
+
+Finished steps are persisted per booking; calling the pipeline again for the
+same booking resumes at the first unfinished step. Card declines and invalid
+requests are final, everything else leaves the booking pending and safe to
+retry (the hold expiry sweeper releases it if nobody does).
+"""
+
+import os
+import time
+import random
+import threading
+from datetime import datetime
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Dict, Any, Callable, Optional
+
+# Stripe error classes (as reported by StripeService in "error_type") worth another attempt
+RETRYABLE_ERRORS = {"APIConnectionError", "APIError", "RateLimitError", "StepTimeout"}
+
+STEP_DEADLINES = {"customer": 5.0, "payment_intent": 5.0, "confirm": 15.0, "refresh": 5.0}
+
+DONE = "done"
+RETRYING = "retrying"
+FAILED = "failed"
+
+# Calls that overrun their deadline keep running here; the idempotency key makes the retry safe
+# (sized well above expected concurrent payments: time spent queued here counts against the step deadline)
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv("PAYMENT_STEP_WORKERS", "64")),
+                               thread_name_prefix="payment-step")
+
+
+def idempotency_key(booking_id: str, step: str, *parts: Any) -> str:
+    """Stable Stripe idempotency key for one step of one booking's payment"""
+    return ":".join(["booking", str(booking_id), step, *(str(part) for part in parts if part)])
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter, bounded per step and overall"""
+    attempts: int = 4
+    base_backoff: float = 0.25
+    max_backoff: float = 4.0
+    total_budget: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempt - 1)))
+        return delay + random.uniform(0, delay / 2)
+
+
+@dataclass
+class PaymentOutcome:
+    """Result of one pipeline run"""
+    status: str  # succeeded, declined, pending
+    customer_id: Optional[str] = None
+    payment_intent_id: Optional[str] = None
+    error: Optional[str] = None
+    steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "succeeded"
+
+    @property
+    def retryable(self) -> bool:
+        return self.status == "pending"
+
+
+class PaymentStepError(Exception):
+    """A step gave up; retryable means the outcome is unknown or transient rather than declined"""
+
+    def __init__(self, step: str, error: str, retryable: bool):
+        super().__init__(f"{step}: {error}")
+        self.step = step
+        self.error = error
+        self.retryable = retryable
+
+
+class InMemoryPaymentStateStore:
+    """Process-local step state used for development and tests"""
+
+    def __init__(self):
+        self._steps: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, booking_id: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {step: dict(state) for step, state in self._steps.get(str(booking_id), {}).items()}
+
+    def save(self, booking_id: str, step: str, state: Dict[str, Any]):
+        with self._lock:
+            self._steps.setdefault(str(booking_id), {})[step] = dict(state)
+
+
+class SupabasePaymentStateStore:
+    """Step state in the payment_steps table, shared by every app replica"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def load(self, booking_id: str) -> Dict[str, Dict[str, Any]]:
+        result = self.client.table("payment_steps").select("*").eq("booking_id", str(booking_id)).execute()
+        return {row["step"]: row for row in result.data or []}
+
+    def save(self, booking_id: str, step: str, state: Dict[str, Any]):
+        self.client.table("payment_steps").upsert({
+            "booking_id": str(booking_id),
+            "step": step,
+            "status": state["status"],
+            "idempotency_key": state["idempotency_key"],
+            "result": state.get("result") or {},
+            "attempts": state.get("attempts", 0),
+            "last_error": state.get("error"),
+            "updated_at": datetime.now().isoformat()
+        }, on_conflict="booking_id,step").execute()
+
+
+def get_payment_state_store(supabase_client=None):
+    """Use the database when a client is available, otherwise a local store"""
+    if supabase_client is not None:
+        return SupabasePaymentStateStore(supabase_client)
+    print("⚠️ No database client - payment step state is kept in memory for this process only")
+    return InMemoryPaymentStateStore()
+
+
+class PaymentPipeline:
+    """Runs a booking's payment steps against a StripeService-compatible service"""
+
+    def __init__(self, service, store=None, policy: Optional[RetryPolicy] = None,
+                 deadlines: Optional[Dict[str, float]] = None, sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.service = service
+        self.store = store or InMemoryPaymentStateStore()
+        self.policy = policy or RetryPolicy()
+        self.deadlines = {**STEP_DEADLINES, **(deadlines or {})}
+        self.sleep = sleep
+        self.clock = clock
+
+    def run(self, booking: Dict[str, Any], payment_method_id: str, customer_details: Dict[str, Any]) -> PaymentOutcome:
+        """Charge the booking, resuming after the last finished step of an earlier run"""
+        booking_id = str(booking["id"])
+        state = self.store.load(booking_id)
+        budget_ends = self.clock() + self.policy.total_budget
+        metadata = {"booking_id": booking_id, "confirmation_number": booking.get("confirmation_number", "")}
+        outcome = PaymentOutcome(status="pending", steps=state)
+
+        try:
+            customer = self._step(state, booking_id, "customer", budget_ends, idempotency_key(booking_id, "customer"),
+                                  lambda key: self.service.create_customer(
+                                      email=customer_details["email"],
+                                      name=customer_details.get("name", "Customer"),
+                                      phone=customer_details.get("phone"),
+                                      metadata=metadata,
+                                      idempotency_key=key),
+                                  lambda response: {"customer_id": response["customer_id"]})
+            outcome.customer_id = customer["customer_id"]
+
+            intent = self._step(state, booking_id, "payment_intent", budget_ends,
+                                idempotency_key(booking_id, "payment_intent"),
+                                lambda key: self.service.create_payment_intent(
+                                    amount=int(round(float(booking["total_amount"]) * 100)),  # Convert to cents
+                                    currency=booking["currency"].lower(),
+                                    customer_id=outcome.customer_id,
+                                    payment_method_types=['card'],
+                                    metadata={**metadata, 'service_type': 'travel_booking'},
+                                    idempotency_key=key),
+                                lambda response: {"payment_intent_id": response["payment_intent"].id})
+            outcome.payment_intent_id = intent["payment_intent_id"]
+
+            confirmed = self._step(state, booking_id, "confirm", budget_ends,
+                                   idempotency_key(booking_id, "confirm", payment_method_id),
+                                   lambda key: self.service.confirm_payment(
+                                       outcome.payment_intent_id, payment_method_id, idempotency_key=key),
+                                   self._intent_status)
+            if confirmed["status"] in ("processing", "requires_action"):
+                # Asynchronous methods settle later; reads need no idempotency key
+                confirmed = self._call(lambda _: self.service.retrieve_payment_intent(outcome.payment_intent_id),
+                                       None, self._remaining("refresh", budget_ends))
+                confirmed = self._intent_status(confirmed) if confirmed.get("success") else {"status": "processing"}
+        except PaymentStepError as e:
+            outcome.status = "pending" if e.retryable else "declined"
+            outcome.error = e.error
+            return outcome
+
+        if confirmed["status"] == "succeeded":
+            outcome.status = "succeeded"
+        elif confirmed["status"] in ("requires_payment_method", "canceled"):
+            outcome.status, outcome.error = "declined", f"Payment {confirmed['status'].replace('_', ' ')}"
+        else:
+            outcome.error = f"Payment is {confirmed['status'].replace('_', ' ')}"
+        return outcome
+
+    # === STEPS ===
+
+    def _step(self, state: Dict[str, Dict[str, Any]], booking_id: str, step: str, budget_ends: float, key: str,
+              call: Callable[[str], Dict[str, Any]], parse: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        saved = state.get(step) or {}
+        if saved.get("status") == DONE and saved.get("idempotency_key") == key:
+            return saved["result"]
+
+        attempts = saved.get("attempts", 0) if saved.get("idempotency_key") == key else 0
+        error = "payment deadline exceeded"
+        for attempt in range(1, self.policy.attempts + 1):
+            timeout = self._remaining(step, budget_ends)
+            if timeout <= 0:
+                break
+            response = self._call(call, key, timeout)
+            attempts += 1
+            if response.get("success"):
+                state[step] = {"status": DONE, "idempotency_key": key, "result": parse(response), "attempts": attempts}
+                self.store.save(booking_id, step, state[step])
+                return state[step]["result"]
+
+            error = response.get("error") or "unknown error"
+            retryable = response.get("error_type") in RETRYABLE_ERRORS
+            state[step] = {"status": RETRYING if retryable else FAILED, "idempotency_key": key,
+                           "attempts": attempts, "error": error}
+            self.store.save(booking_id, step, state[step])
+            if not retryable:
+                raise PaymentStepError(step, error, retryable=False)
+            if attempt < self.policy.attempts:
+                self.sleep(max(0.0, min(self.policy.backoff(attempt), budget_ends - self.clock())))
+        raise PaymentStepError(step, error, retryable=True)
+
+    def _remaining(self, step: str, budget_ends: float) -> float:
+        return min(self.deadlines[step], budget_ends - self.clock())
+
+    def _call(self, call: Callable[[str], Dict[str, Any]], key: Optional[str], timeout: float) -> Dict[str, Any]:
+        future = _executor.submit(call, key)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            return {"success": False, "error": f"no response within {timeout:.1f}s", "error_type": "StepTimeout"}
+        except Exception as e:
+            # Raised rather than reported by the service: most likely transport trouble, retry it
+            return {"success": False, "error": str(e), "error_type": "APIConnectionError"}
+
+    @staticmethod
+    def _intent_status(response: Dict[str, Any]) -> Dict[str, Any]:
+        intent = response["payment_intent"]
+        return {"payment_intent_id": intent.id, "status": intent.status}
@@ -0,0 +1,406 @@
+"""
+🧾 Payment Reconciliation
+Bulk comparison of Stripe payments with bookings, a few list calls per night
+
+Instead of retrieving one payment intent or checkout session per booking, the
+job lists everything Stripe created in a time range: the range is split into
+created-time windows that are listed in parallel, 100 objects per page with
+starting_after pagination. Payments are indexed in memory by the booking_id
+metadata that process_payment and the checkout flow attach, then bookings
+created in the same range are streamed page by page (keyset on created_at, id)
+and joined against that index.
+
+Discrepancies are reported by kind. The safe ones (a paid booking still
+pending, or confirmed without payment_status 'paid') are fixed with one
+conditional bulk update per kind when apply=True; the rest (paid but expired
+or failed, amount mismatches, payments without a booking) need a person or a
+refund and are only reported.
+
+Usage:
+    python src/booking_system/reconciliation.py --hours 24           # report only
+    python src/booking_system/reconciliation.py --hours 24 --apply   # also apply bulk fixes
+    python src/booking_system/reconciliation.py --benchmark          # against the local stand-in
+"""
+
+import os
+import sys
+import time
+import uuid
+import random
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.stripe_webhooks import InMemoryBookingStatusStore, SupabaseBookingStatusStore
+
+try:
+    import stripe
+    STRIPE_AVAILABLE = True
+except ImportError:
+    STRIPE_AVAILABLE = False
+
+LIST_PAGE_SIZE = 100  # Stripe's maximum
+BOOKING_COLUMNS = "id,status,payment_status,total_amount,currency,created_at"
+
+# Preference when several payment attempts carry the same booking_id
+_STATUS_RANK = {"succeeded": 3, "processing": 2, "requires_action": 1}
+
+# Discrepancy kind -> (booking fields to set, statuses the booking may move from) for the safe bulk fixes
+FIXES: Dict[str, Tuple[Dict[str, str], Tuple[str, ...]]] = {
+    "paid_but_pending": ({"status": "confirmed", "payment_status": "paid"}, ("pending",)),
+    "payment_status_stale": ({"payment_status": "paid"}, ("confirmed", "completed")),
+}
+
+
+def _epoch(value: Any) -> int:
+    if isinstance(value, (int, float)):
+        return int(value)
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return int(value.timestamp())
+
+
+def _booking_key(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Normalized booking UUID from payment metadata; None for BOOK_... or missing ids"""
+    try:
+        return str(uuid.UUID(str((metadata or {}).get("booking_id"))))
+    except ValueError:
+        return None
+
+
+@dataclass
+class Payment:
+    """A payment intent or checkout session, reduced to what reconciliation compares"""
+    id: str
+    booking_id: Optional[str]
+    status: str  # payment intent status; paid checkout sessions count as succeeded
+    amount: int
+    currency: str
+    created: int
+
+    @classmethod
+    def from_intent(cls, intent: Dict[str, Any]) -> "Payment":
+        return cls(intent["id"], _booking_key(intent.get("metadata")), intent["status"],
+                   int(intent.get("amount_received") or intent.get("amount") or 0),
+                   str(intent.get("currency", "")).lower(), int(intent["created"]))
+
+    @classmethod
+    def from_session(cls, session: Dict[str, Any]) -> "Payment":
+        status = "succeeded" if session.get("payment_status") == "paid" else "requires_payment_method"
+        return cls(session.get("payment_intent") or session["id"], _booking_key(session.get("metadata")), status,
+                   int(session.get("amount_total") or 0), str(session.get("currency", "")).lower(),
+                   int(session["created"]))
+
+
+@dataclass
+class Discrepancy:
+    """One booking/payment pair that does not agree"""
+    kind: str
+    booking_id: Optional[str]
+    payment_id: Optional[str]
+    detail: str = ""
+
+
+@dataclass
+class ReconciliationReport:
+    """What a run looked at, what disagreed and what it fixed"""
+    start: datetime
+    end: datetime
+    payments: int = 0
+    bookings: int = 0
+    matched: int = 0
+    untracked: int = 0  # payments whose booking_id is not a bookings row id (checkout-only flow)
+    list_calls: int = 0
+    booking_pages: int = 0
+    discrepancies: List[Discrepancy] = field(default_factory=list)
+    fixed: Dict[str, int] = field(default_factory=dict)
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for discrepancy in self.discrepancies:
+            counts[discrepancy.kind] = counts.get(discrepancy.kind, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in sorted(self.counts().items())) or "none"
+        return (f"🧾 Reconciled {self.bookings} bookings against {self.payments} payments "
+                f"({self.matched} matched) with {self.list_calls} Stripe list calls and "
+                f"{self.booking_pages} booking pages; discrepancies: {kinds}; fixed: {self.fixed or 'none'}")
+
+
+# === PAYMENT SOURCES ===
+
+class StripePaymentSource:
+    """Lists payment intents and checkout sessions through the Stripe API (or a stand-in at stripe.api_base)"""
+
+    def __init__(self, include_sessions: bool = True):
+        if not STRIPE_AVAILABLE:
+            raise ImportError("The stripe package is required to list payments")
+        self.include_sessions = include_sessions
+
+    def list_page(self, kind: str, start: int, end: int, starting_after: Optional[str] = None,
+                  limit: int = LIST_PAGE_SIZE) -> Tuple[List[Dict[str, Any]], bool]:
+        resource = stripe.PaymentIntent if kind == "payment_intent" else stripe.checkout.Session
+        params = {"created": {"gte": start, "lt": end}, "limit": limit}
+        if starting_after:
+            params["starting_after"] = starting_after
+        page = resource.list(**params)
+        return list(page.data), bool(page.has_more)
+
+
+class InMemoryPaymentSource:
+    """Local stand-in with Stripe's list semantics (newest first, starting_after cursors)"""
+
+    def __init__(self, intents: Optional[List[Dict[str, Any]]] = None,
+                 sessions: Optional[List[Dict[str, Any]]] = None, include_sessions: bool = True):
+        self.objects = {"payment_intent": sorted(intents or [], key=lambda o: (-o["created"], o["id"])),
+                        "checkout_session": sorted(sessions or [], key=lambda o: (-o["created"], o["id"]))}
+        self.include_sessions = include_sessions
+        self.list_calls = 0
+        self._lock = threading.Lock()
+
+    def list_page(self, kind: str, start: int, end: int, starting_after: Optional[str] = None,
+                  limit: int = LIST_PAGE_SIZE) -> Tuple[List[Dict[str, Any]], bool]:
+        with self._lock:
+            self.list_calls += 1
+        rows = [o for o in self.objects[kind] if start <= o["created"] < end]
+        if starting_after:
+            ids = [o["id"] for o in rows]
+            rows = rows[ids.index(starting_after) + 1:] if starting_after in ids else []
+        return rows[:limit], len(rows) > limit
+
+
+# === BOOKING SOURCES ===
+
+class SupabaseBookingSource:
+    """Bookings created in a range, streamed with keyset pagination on (created_at, id)"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def pages(self, start: datetime, end: datetime, page_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        after = None
+        while True:
+            query = self.client.table("bookings").select(BOOKING_COLUMNS) \
+                .gte("created_at", start.isoformat()).lt("created_at", end.isoformat())
+            if after:
+                query = query.or_(f'created_at.gt."{after[0]}",and(created_at.eq."{after[0]}",id.gt."{after[1]}")')
+            rows = query.order("created_at").order("id").limit(page_size).execute().data or []
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
+    def lookup(self, booking_ids: List[str], chunk_size: int = 200) -> List[Dict[str, Any]]:
+        rows = []
+        for i in range(0, len(booking_ids), chunk_size):
+            result = self.client.table("bookings").select(BOOKING_COLUMNS) \
+                .in_("id", booking_ids[i:i + chunk_size]).execute()
+            rows.extend(result.data or [])
+        return rows
+
+
+class InMemoryBookingSource:
+    """Bookings held in a dict (shared with InMemoryBookingStatusStore in tests and benchmarks)"""
+
+    def __init__(self, bookings: Dict[str, Dict[str, Any]]):
+        self.bookings = bookings
+
+    def pages(self, start: datetime, end: datetime, page_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        rows = sorted((b for b in self.bookings.values() if _epoch(start) <= _epoch(b["created_at"]) < _epoch(end)),
+                      key=lambda b: (_epoch(b["created_at"]), b["id"]))
+        for i in range(0, len(rows), page_size):
+            yield [dict(row) for row in rows[i:i + page_size]]
+
+    def lookup(self, booking_ids: List[str]) -> List[Dict[str, Any]]:
+        return [dict(self.bookings[booking_id]) for booking_id in booking_ids if booking_id in self.bookings]
+
+
+# === RECONCILER ===
+
+class PaymentReconciler:
+    """Joins Stripe payments and bookings for a time range and reports or fixes disagreements"""
+
+    def __init__(self, payments, bookings, status_store=None, window: timedelta = timedelta(hours=6),
+                 workers: int = 4, booking_page_size: int = 500, payment_slack: timedelta = timedelta(days=1)):
+        self.payments = payments
+        self.bookings = bookings
+        self.status_store = status_store
+        self.window = window
+        self.workers = workers
+        self.booking_page_size = booking_page_size
+        # Payments may be made up to a day after the booking was created (holds last 24 hours)
+        self.payment_slack = payment_slack
+
+    def run(self, start: datetime, end: datetime, apply: bool = False) -> ReconciliationReport:
+        report = ReconciliationReport(start=start, end=end)
+        by_booking = self._index_payments(start, end + self.payment_slack, report)
+
+        seen = set()
+        for page in self.bookings.pages(start, end, self.booking_page_size):
+            report.booking_pages += 1
+            report.bookings += len(page)
+            for booking in page:
+                seen.add(str(booking["id"]))
+                self._check(booking, by_booking.get(str(booking["id"])), report)
+
+        # Payments made in the range for bookings created before it: one batched lookup
+        unmatched = sorted(booking_id for booking_id, payment in by_booking.items()
+                           if booking_id not in seen and payment.status == "succeeded"
+                           and _epoch(start) <= payment.created < _epoch(end))
+        found = {str(booking["id"]): booking for booking in self.bookings.lookup(unmatched)} if unmatched else {}
+        for booking_id in unmatched:
+            payment = by_booking[booking_id]
+            if booking_id in found:
+                self._check(found[booking_id], payment, report)
+            else:
+                report.discrepancies.append(Discrepancy("payment_without_booking", booking_id, payment.id,
+                                                        f"{payment.amount} {payment.currency}"))
+
+        if apply:
+            self.apply_fixes(report)
+        return report
+
+    def _check(self, booking: Dict[str, Any], payment: Optional[Payment], report: ReconciliationReport):
+        report.matched += payment is not None
+        discrepancy = self._compare(booking, payment)
+        if discrepancy:
+            report.discrepancies.append(discrepancy)
+
+    def _index_payments(self, start: datetime, end: datetime, report: ReconciliationReport) -> Dict[str, Payment]:
+        kinds = ["payment_intent"] + (["checkout_session"] if getattr(self.payments, "include_sessions", False) else [])
+        windows = []
+        cursor = start
+        while cursor < end:
+            windows.append((_epoch(cursor), _epoch(min(cursor + self.window, end))))
+            cursor += self.window
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(lambda job: self._list_window(*job), [(k, s, e) for k in kinds for s, e in windows]))
+
+        by_booking: Dict[str, Payment] = {}
+        for payments, calls in results:
+            report.list_calls += calls
+            for payment in payments:
+                report.payments += 1
+                if payment.booking_id is None:
+                    report.untracked += 1
+                    continue
+                current = by_booking.get(payment.booking_id)
+                if current is None or _STATUS_RANK.get(payment.status, 0) > _STATUS_RANK.get(current.status, 0):
+                    by_booking[payment.booking_id] = payment
+        return by_booking
+
+    def _list_window(self, kind: str, start: int, end: int) -> Tuple[List[Payment], int]:
+        convert = Payment.from_intent if kind == "payment_intent" else Payment.from_session
+        payments, calls, starting_after = [], 0, None
+        while True:
+            rows, has_more = self.payments.list_page(kind, start, end, starting_after)
+            calls += 1
+            payments.extend(convert(row) for row in rows)
+            if not has_more or not rows:
+                return payments, calls
+            starting_after = rows[-1]["id"]
+
+    @staticmethod
+    def _compare(booking: Dict[str, Any], payment: Optional[Payment]) -> Optional[Discrepancy]:
+        booking_id, status = str(booking["id"]), booking["status"]
+        paid = payment is not None and payment.status == "succeeded"
+        if paid:
+            expected = int(round(float(booking["total_amount"]) * 100))
+            if payment.amount != expected or payment.currency != str(booking.get("currency", "")).lower():
+                return Discrepancy("amount_mismatch", booking_id, payment.id,
+                                   f"paid {payment.amount} {payment.currency}, booked {expected} {booking.get('currency')}")
+            if status == "pending":
+                return Discrepancy("paid_but_pending", booking_id, payment.id)
+            if status in ("failed", "expired", "cancelled") and booking.get("payment_status") != "refunded":
+                return Discrepancy("paid_but_" + status, booking_id, payment.id, "needs a refund or a rebooking")
+            if status in ("confirmed", "completed") and booking.get("payment_status") != "paid":
+                return Discrepancy("payment_status_stale", booking_id, payment.id,
+                                   f"payment_status is {booking.get('payment_status')}")
+        elif status in ("confirmed", "completed"):
+            return Discrepancy("confirmed_without_payment", booking_id, payment.id if payment else None,
+                               f"payment {payment.status}" if payment else "no payment found")
+        return None
+
+    def apply_fixes(self, report: ReconciliationReport):
+        """One conditional bulk update per fixable kind"""
+        if self.status_store is None:
+            return
+        for kind, (values, from_statuses) in FIXES.items():
+            booking_ids = sorted({d.booking_id for d in report.discrepancies if d.kind == kind})
+            if booking_ids:
+                report.fixed[kind] = len(self.status_store.update_status(values, booking_ids, from_statuses))
+
+
+def run_reconciliation_benchmark(num_bookings: int = 5000, days: int = 1) -> ReconciliationReport:
+    """Reconcile a day of synthetic bookings against the in-memory stand-in and count API calls"""
+    end = datetime.now(timezone.utc).replace(microsecond=0)
+    start = end - timedelta(days=days)
+    bookings, intents = {}, []
+    for i in range(num_bookings):
+        booking_id = str(uuid.uuid4())
+        created = start + timedelta(seconds=random.uniform(0, days * 86400))
+        roll = random.random()
+        status = "confirmed" if roll < 0.9 else "pending"
+        bookings[booking_id] = {"id": booking_id, "status": status, "total_amount": 100.0 + i % 50,
+                                "currency": "USD", "created_at": created.isoformat(),
+                                "payment_status": "paid" if roll < 0.85 else "pending"}
+        if status == "confirmed" or roll > 0.97:  # a few pending bookings were in fact paid
+            intents.append({"id": f"pi_{i:08d}", "status": "succeeded", "amount": int((100.0 + i % 50) * 100),
+                            "currency": "usd", "created": _epoch(created) + 60,
+                            "metadata": {"booking_id": booking_id}})
+
+    payments = InMemoryPaymentSource(intents, include_sessions=False)
+    store = InMemoryBookingStatusStore(bookings)
+    started = time.perf_counter()
+    report = PaymentReconciler(payments, InMemoryBookingSource(bookings), store).run(start, end, apply=True)
+    print(f"{report.summary()} in {time.perf_counter() - started:.2f}s "
+          f"(one retrieve per booking would be {num_bookings} calls)")
+    return report
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Reconcile Stripe payments with bookings")
+    parser.add_argument("--hours", type=float, default=24.0, help="reconcile bookings created in the last N hours")
+    parser.add_argument("--apply", action="store_true", help="apply the safe bulk fixes")
+    parser.add_argument("--window-hours", type=float, default=6.0, help="created-time window per list scan")
+    parser.add_argument("--api-base", help="Stripe API base URL (e.g. a local stand-in)")
+    parser.add_argument("--benchmark", action="store_true", help="run against the in-memory stand-in")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_reconciliation_benchmark()
+        return
+
+    from src.api_integration.supabase.client_factory import get_supabase_client
+    client = get_supabase_client()
+    if client is None or not STRIPE_AVAILABLE:
+        print("❌ Error: SUPABASE_URL, SUPABASE_KEY and STRIPE_SECRET_KEY must be set (and stripe installed)")
+        sys.exit(1)
+    stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+    if args.api_base:
+        stripe.api_base = args.api_base
+
+    end = datetime.now(timezone.utc)
+    reconciler = PaymentReconciler(StripePaymentSource(), SupabaseBookingSource(client),
+                                   SupabaseBookingStatusStore(client), window=timedelta(hours=args.window_hours))
+    report = reconciler.run(end - timedelta(hours=args.hours), end, apply=args.apply)
+    print(report.summary())
+    for discrepancy in report.discrepancies:
+        if discrepancy.kind not in FIXES or not args.apply:
+            print(f"  ⚠️ {discrepancy.kind}: booking {discrepancy.booking_id} payment {discrepancy.payment_id} "
+                  f"{discrepancy.detail}")
+
+
+if __name__ == "__main__":
+    main()
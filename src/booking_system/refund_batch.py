@@ -0,0 +1,284 @@
+"""
+💸 Refund Batches
+Concurrent, rate-limited, idempotent refunds for mass cancellations
+
+When a flight is cancelled or a destination closes, every confirmed booking on
+it has to be refunded and cancelled. The processor selects those bookings a
+page at a time (keyset on id, backed by the indexes in migration 0008), looks
+up their payment intents in one query per page (payment_steps, written by the
+payment pipeline), and refunds them concurrently under a token-bucket rate
+limit that keeps the batch below Stripe's request limits. Every refund carries
+an idempotency key derived from the booking, so re-running a batch that was
+interrupted never refunds anyone twice. Transient errors are retried with the
+payment pipeline's backoff policy.
+
+Bookings whose refund went through are cancelled with one conditional bulk
+update per page (confirmed -> cancelled, payment_status refunded); progress
+and throughput are reported after every page.
+
+Usage:
+    python src/booking_system/refund_batch.py   # benchmark against the local Stripe stand-in
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.booking_system.payment_pipeline import RETRYABLE_ERRORS, RetryPolicy, idempotency_key
+
+REFUND_COLUMNS = "id,user_id,booking_type,item_id,details,total_amount,currency,status,customer_details"
+CANCELLED = {"status": "cancelled", "payment_status": "refunded"}
+
+
+@dataclass
+class RefundCriteria:
+    """Which bookings a mass cancellation affects"""
+    booking_type: Optional[str] = None
+    item_id: Optional[str] = None
+    destination: Optional[str] = None
+    statuses: Tuple[str, ...] = ("confirmed",)
+
+
+@dataclass
+class RefundProgress:
+    """Running totals for a batch"""
+    selected: int = 0
+    refunded: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    skipped: int = 0  # confirmed without a payment on record
+    amount_refunded: int = 0  # minor units
+    started: float = field(default_factory=time.perf_counter)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def refunds_per_second(self) -> float:
+        return self.refunded / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (f"💸 {self.selected} selected, {self.refunded} refunded ({self.amount_refunded / 100:,.2f}), "
+                f"{self.cancelled} cancelled, {self.failed} failed, {self.skipped} without payment "
+                f"- {self.refunds_per_second:.1f} refunds/s")
+
+
+class TokenBucket:
+    """Blocking rate limiter shared by the refund threads"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# === BOOKING SOURCES ===
+
+class InMemoryRefundSource:
+    """Bookings and their payment intents in dicts, for tests and benchmarks"""
+
+    def __init__(self, bookings: Dict[str, Dict[str, Any]], intents: Dict[str, str]):
+        self.bookings = bookings
+        self.intents = intents
+
+    def affected(self, criteria: RefundCriteria, after: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        rows = sorted((b for b in self.bookings.values()
+                       if b["status"] in criteria.statuses
+                       and (criteria.booking_type is None or b["booking_type"] == criteria.booking_type)
+                       and (criteria.item_id is None or b["item_id"] == criteria.item_id)
+                       and (criteria.destination is None or (b.get("details") or {}).get("destination") == criteria.destination)
+                       and (after is None or b["id"] > after)), key=lambda b: b["id"])
+        return [dict(row) for row in rows[:limit]]
+
+    def payment_intents(self, booking_ids: List[str]) -> Dict[str, str]:
+        return {booking_id: self.intents[booking_id] for booking_id in booking_ids if booking_id in self.intents}
+
+
+class SupabaseRefundSource:
+    """Affected bookings from the bookings table, payment intents from payment_steps"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def affected(self, criteria: RefundCriteria, after: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        query = self.client.table("bookings").select(REFUND_COLUMNS).in_("status", list(criteria.statuses))
+        if criteria.booking_type:
+            query = query.eq("booking_type", criteria.booking_type)
+        if criteria.item_id:
+            query = query.eq("item_id", criteria.item_id)
+        if criteria.destination:
+            query = query.eq("details->>destination", criteria.destination)
+        if after:
+            query = query.gt("id", after)
+        return query.order("id").limit(limit).execute().data or []
+
+    def payment_intents(self, booking_ids: List[str]) -> Dict[str, str]:
+        if not booking_ids:
+            return {}
+        result = self.client.table("payment_steps").select("booking_id,result") \
+            .eq("step", "payment_intent").eq("status", "done").in_("booking_id", booking_ids).execute()
+        return {row["booking_id"]: (row.get("result") or {}).get("payment_intent_id")
+                for row in result.data or [] if (row.get("result") or {}).get("payment_intent_id")}
+
+
+def get_refund_source(supabase_client=None):
+    """Use the database when a client is available, otherwise an empty local source"""
+    if supabase_client is not None:
+        return SupabaseRefundSource(supabase_client)
+    print("⚠️ No database client - refund batches only see bookings kept in memory")
+    return InMemoryRefundSource({}, {})
+
+
+# === PROCESSOR ===
+
+class RefundBatchProcessor:
+    """Refunds and cancels every booking matching a RefundCriteria"""
+
+    def __init__(self, service, source, status_store=None, concurrency: int = 8, rate: float = 25.0,
+                 page_size: int = 200, policy: Optional[RetryPolicy] = None,
+                 on_cancelled: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 on_progress: Optional[Callable[[RefundProgress], None]] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.service = service
+        self.source = source
+        self.status_store = status_store
+        self.concurrency = concurrency
+        self.limiter = TokenBucket(rate)
+        self.page_size = page_size
+        self.policy = policy or RetryPolicy(total_budget=60.0)
+        self.on_cancelled = on_cancelled
+        self.on_progress = on_progress or (lambda progress: print(progress.summary()))
+        self.sleep = sleep
+
+    def refund_booking(self, booking: Dict[str, Any], payment_intent_id: str, reason: str = "",
+                       amount: Optional[float] = None, key_suffix: str = "") -> Dict[str, Any]:
+        """Refund one booking (all of it, or `amount` in major units); safe to repeat"""
+        key = idempotency_key(booking["id"], "refund", key_suffix)
+        cents = int(round(amount * 100)) if amount is not None else None
+        error = "refund not attempted"
+        for attempt in range(1, self.policy.attempts + 1):
+            self.limiter.acquire()
+            try:
+                result = self.service.create_refund(payment_intent_id, amount=cents, reason="requested_by_customer",
+                                                    metadata={"booking_id": str(booking["id"]), "note": reason[:450]},
+                                                    idempotency_key=key)
+            except Exception as e:
+                result = {"success": False, "error": str(e), "error_type": "APIConnectionError"}
+            if result.get("success"):
+                refund = result["refund"]
+                return {"success": True, "refund_id": result["refund_id"], "amount": int(refund["amount"])}
+            error = result.get("error") or "unknown error"
+            if result.get("error_type") not in RETRYABLE_ERRORS:
+                break
+            if attempt < self.policy.attempts:
+                self.sleep(self.policy.backoff(attempt))
+        return {"success": False, "error": error}
+
+    def run(self, criteria: RefundCriteria, reason: str) -> RefundProgress:
+        """Refund and cancel every matching booking, a page at a time"""
+        progress = RefundProgress()
+        after = None
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while True:
+                page = self.source.affected(criteria, after, self.page_size)
+                if not page:
+                    break
+                after = str(page[-1]["id"])
+                progress.selected += len(page)
+                self._run_page(page, reason, pool, progress)
+                self.on_progress(progress)
+                if len(page) < self.page_size:
+                    break
+        return progress
+
+    def _run_page(self, page: List[Dict[str, Any]], reason: str, pool: ThreadPoolExecutor,
+                  progress: RefundProgress):
+        intents = self.source.payment_intents([str(booking["id"]) for booking in page])
+        payable = [booking for booking in page if str(booking["id"]) in intents]
+        progress.skipped += len(page) - len(payable)
+
+        results = pool.map(lambda booking: self.refund_booking(booking, intents[str(booking["id"])], reason), payable)
+        refunded = []
+        for booking, result in zip(payable, results):
+            if result["success"]:
+                refunded.append(str(booking["id"]))
+                progress.refunded += 1
+                progress.amount_refunded += result["amount"]
+            else:
+                progress.failed += 1
+                progress.errors[str(booking["id"])] = result["error"]
+
+        if refunded and self.status_store is not None:
+            rows = self.status_store.update_status(CANCELLED, refunded, tuple(self._statuses(page)))
+            progress.cancelled += len(rows)
+            for row in rows:
+                if self.on_cancelled:
+                    try:
+                        self.on_cancelled(row)
+                    except Exception as e:
+                        print(f"❌ Error finishing cancellation of {row.get('id')}: {e}")
+
+    @staticmethod
+    def _statuses(page: List[Dict[str, Any]]) -> List[str]:
+        return sorted({booking["status"] for booking in page})
+
+
+def run_refund_benchmark(num_bookings: int = 500, concurrency: int = 16, rate: float = 200.0,
+                         latency: float = 0.02) -> Dict[str, Any]:
+    """Cancel a flight's bookings through StripeService against the local Stripe stand-in"""
+    from src.api_integration.stripe.local_stripe import STRIPE_AVAILABLE, LocalStripeServer
+    from src.services.stripe_webhooks import InMemoryBookingStatusStore
+    if not STRIPE_AVAILABLE:
+        print("❌ The stripe package is required for the refund benchmark")
+        return {}
+    from src.api_integration.stripe.stripe_service import StripeService
+
+    server = LocalStripeServer().start()
+    service = StripeService(secret_key="sk_test_local", api_base=server.url)
+    bookings, intents = {}, {}
+    for i in range(num_bookings):
+        intent = service.create_payment_intent(amount=10000 + i, currency="usd")["payment_intent"]
+        service.confirm_payment(intent.id, "pm_card_visa")
+        booking_id = f"00000000-0000-4000-8000-{i:012d}"
+        bookings[booking_id] = {"id": booking_id, "booking_type": "flight", "item_id": "FL123", "status": "confirmed",
+                                "payment_status": "paid", "total_amount": (10000 + i) / 100, "currency": "USD"}
+        intents[booking_id] = intent.id
+    server.latency = latency
+
+    processor = RefundBatchProcessor(service, InMemoryRefundSource(bookings, intents),
+                                     InMemoryBookingStatusStore(bookings), concurrency=concurrency, rate=rate,
+                                     page_size=100, on_progress=lambda progress: None)
+    progress = processor.run(RefundCriteria(booking_type="flight", item_id="FL123"), "Flight FL123 cancelled")
+    # Replaying refunds (an interrupted batch run again) must not create new ones
+    for booking_id in list(intents)[:50]:
+        processor.refund_booking(bookings[booking_id], intents[booking_id], "Flight FL123 cancelled")
+    server.stop()
+    print(f"{progress.summary()}; {len(server.objects['refund'])} refund objects after replaying 50 refunds")
+    return {"progress": progress, "refund_objects": len(server.objects["refund"])}
+
+
+if __name__ == "__main__":
+    run_refund_benchmark()
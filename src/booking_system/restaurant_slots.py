@@ -0,0 +1,452 @@
+"""
+🍽️ Restaurant Slot Engine
+Table capacity in 30-minute buckets with fast city-wide search and atomic slot holds
+
+Every restaurant has a table layout (how many 2-, 4-, 6- and 8-seat tables) and
+opening hours. For each day that is searched, the engine materializes one grid
+of free tables shaped (restaurant, table size, bucket), with closed buckets
+already at zero. "Which restaurants in Beirut have a table for 4 at
+19:00 ± 60 min" is then a sliding min over the buckets a sitting occupies,
+restricted to the city's rows and to table sizes that fit the party - one
+vectorized pass with NumPy, a slice-min loop without it.
+
+A hold takes the smallest free table that fits the party for the whole
+sitting, under the day's lock. With a database, the `hold_restaurant_slot` RPC
+is the authority: it serializes holds per restaurant and day with an advisory
+lock and counts overlapping holds in restaurant_slot_holds before inserting
+one. Unconfirmed holds lapse after hold_minutes, both there and locally. A
+day's grid is rebuilt from the holds table once it is older than grid_ttl
+(and right after the RPC refuses a hold), so releases and expiries on other
+replicas show up without a restart.
+
+Usage:
+    python src/booking_system/restaurant_slots.py   # search latency across thousands of restaurants
+"""
+
+import sys
+import time
+import random
+import threading
+from array import array
+from pathlib import Path
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.id_generator import new_booking_id
+
+SLOT_MINUTES = 30
+BUCKETS = 24 * 60 // SLOT_MINUTES
+SITTING_BUCKETS = 3  # a table is kept for 90 minutes
+TABLE_SIZES = (2, 4, 6, 8)
+DEFAULT_TABLES = {2: 6, 4: 8, 6: 3, 8: 1}
+DEFAULT_HOURS = (dtime(12, 0), dtime(23, 0))
+
+
+def to_bucket(at: dtime) -> int:
+    return (at.hour * 60 + at.minute) // SLOT_MINUTES
+
+
+def from_bucket(bucket: int) -> dtime:
+    minutes = bucket * SLOT_MINUTES
+    return dtime(minutes // 60, minutes % 60)
+
+
+def size_class(party_size: int) -> int:
+    """Index of the smallest table size that seats the party; ValueError when none does"""
+    for index, size in enumerate(TABLE_SIZES):
+        if party_size <= size:
+            return index
+    raise ValueError(f"No table seats a party of {party_size}")
+
+
+@dataclass
+class Restaurant:
+    """What the engine needs to know about a restaurant"""
+    id: str
+    name: str
+    city: str
+    cuisine: str = "International"
+    rating: float = 4.0
+    price_range: str = "$$"
+    deposit: float = 0.0
+    location: str = ""
+    tables: Dict[int, int] = field(default_factory=lambda: dict(DEFAULT_TABLES))
+    hours: Tuple[dtime, dtime] = DEFAULT_HOURS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The dict shape the restaurant pages display"""
+        return {"id": self.id, "name": self.name, "cuisine": self.cuisine, "rating": self.rating,
+                "location": self.location or self.city, "price_range": self.price_range, "deposit": self.deposit}
+
+
+@dataclass
+class SlotHold:
+    """A table held for one sitting"""
+    hold_id: str
+    restaurant_id: str
+    day: date
+    table_size: int
+    start_bucket: int
+    party_size: int
+    expires_at: Optional[datetime] = None  # None once confirmed
+
+    @property
+    def time(self) -> dtime:
+        return from_bucket(self.start_bucket)
+
+    @property
+    def end_bucket(self) -> int:
+        return self.start_bucket + SITTING_BUCKETS
+
+
+class _DayGrid:
+    """Free tables per (restaurant, table size, bucket) for one day"""
+
+    def __init__(self, base, built_at: float):
+        self.free = base.copy() if NUMPY_AVAILABLE else [[row[:] for row in sizes] for sizes in base]
+        self.built_at = built_at
+        self.lock = threading.Lock()
+
+    def sitting_free(self, row: int, size: int, start: int) -> int:
+        if NUMPY_AVAILABLE:
+            return int(self.free[row, size, start:start + SITTING_BUCKETS].min())
+        return min(self.free[row][size][start:start + SITTING_BUCKETS])
+
+    def take(self, row: int, size: int, start: int, count: int):
+        if NUMPY_AVAILABLE:
+            self.free[row, size, start:start + SITTING_BUCKETS] -= count
+        else:
+            cells = self.free[row][size]
+            for bucket in range(start, start + SITTING_BUCKETS):
+                cells[bucket] -= count
+
+
+class InMemorySlotStore:
+    """Process-local hold authority: the engine's own grids decide"""
+
+    def hold(self, restaurant: Restaurant, hold: SlotHold) -> bool:
+        return True
+
+    def confirm(self, hold_id: str):
+        pass
+
+    def release(self, hold_id: str):
+        pass
+
+    def active_holds(self, day: date) -> List[SlotHold]:
+        return []
+
+
+class SupabaseSlotStore:
+    """Database hold authority shared by every app replica (restaurant_slot_holds table)"""
+
+    def __init__(self, client, hold_minutes: int = 15):
+        self.client = client
+        self.hold_minutes = hold_minutes
+
+    def hold(self, restaurant: Restaurant, hold: SlotHold) -> bool:
+        result = self.client.rpc("hold_restaurant_slot", {
+            "p_hold_id": hold.hold_id, "p_restaurant_id": hold.restaurant_id, "p_day": hold.day.isoformat(),
+            "p_table_size": hold.table_size, "p_start_bucket": hold.start_bucket, "p_end_bucket": hold.end_bucket,
+            "p_party_size": hold.party_size, "p_tables": restaurant.tables.get(hold.table_size, 0),
+            "p_expires_at": (hold.expires_at or _utcnow() + timedelta(minutes=self.hold_minutes)).isoformat()
+        }).execute()
+        return bool(result.data)
+
+    def confirm(self, hold_id: str):
+        # A booking now owns the table; it is released on cancellation instead of expiring
+        self.client.table("restaurant_slot_holds").update({"status": "confirmed", "expires_at": None}) \
+            .eq("id", hold_id).execute()
+
+    def release(self, hold_id: str):
+        self.client.table("restaurant_slot_holds").update({"status": "released"}).eq("id", hold_id).execute()
+
+    def active_holds(self, day: date) -> List[SlotHold]:
+        # Lapsed holds no longer take a table, whether or not anything has marked them expired yet
+        now = _utcnow().isoformat()
+        result = self.client.table("restaurant_slot_holds") \
+            .select("id,restaurant_id,table_size,start_bucket,party_size") \
+            .eq("day", day.isoformat()).in_("status", ["held", "confirmed"]) \
+            .or_(f'status.eq.confirmed,expires_at.gt."{now}"').execute()
+        return [SlotHold(row["id"], str(row["restaurant_id"]), day, row["table_size"], row["start_bucket"],
+                         row["party_size"]) for row in result.data or []]
+
+
+class RestaurantSlotEngine:
+    """City-wide table search and holds over precomputed free-capacity grids"""
+
+    def __init__(self, restaurants: Optional[List[Restaurant]] = None, store=None, max_days: int = 60,
+                 hold_minutes: int = 15, grid_ttl: float = 60.0, clock=time.monotonic):
+        self.store = store or InMemorySlotStore()
+        self.max_days = max_days
+        self.hold_minutes = hold_minutes
+        self.grid_ttl = grid_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._days: Dict[date, _DayGrid] = {}
+        self._holds: Dict[str, SlotHold] = {}
+        self.load(restaurants or [])
+
+    # === CATALOG ===
+
+    def load(self, restaurants: List[Restaurant]):
+        """Replace the catalog (day grids are rebuilt on next use)"""
+        rows = len(restaurants)
+        if NUMPY_AVAILABLE:
+            base = np.zeros((rows, len(TABLE_SIZES), BUCKETS), dtype=np.int16)
+        else:
+            base = [[array("h", [0]) * BUCKETS for _ in TABLE_SIZES] for _ in range(rows)]
+        city_rows: Dict[str, List[int]] = {}
+        for row, restaurant in enumerate(restaurants):
+            first, last = to_bucket(restaurant.hours[0]), to_bucket(restaurant.hours[1])
+            for index, size in enumerate(TABLE_SIZES):
+                tables = restaurant.tables.get(size, 0)
+                if NUMPY_AVAILABLE:
+                    base[row, index, first:last] = tables
+                else:
+                    for bucket in range(first, last):
+                        base[row][index][bucket] = tables
+            city_rows.setdefault(restaurant.city.lower(), []).append(row)
+
+        with self._lock:
+            self.restaurants = list(restaurants)
+            self._rows = {restaurant.id: row for row, restaurant in enumerate(restaurants)}
+            self._city_rows = {city: (np.array(rows_, dtype=np.intp) if NUMPY_AVAILABLE else rows_)
+                               for city, rows_ in city_rows.items()}
+            self._base = base
+            self._days = {}
+
+    def add_restaurants(self, restaurants: List[Restaurant]):
+        self.load(self.restaurants + [r for r in restaurants if r.id not in self._rows])
+
+    def has_city(self, city: str) -> bool:
+        return city.lower() in self._city_rows
+
+    def _grid(self, day: date) -> _DayGrid:
+        now = self.clock()
+        with self._lock:
+            grid = self._days.get(day)
+            if grid is not None and now - grid.built_at < self.grid_ttl:
+                return grid
+            grid = self._days[day] = _DayGrid(self._base, now)
+            for stale in sorted(self._days)[:-self.max_days]:
+                del self._days[stale]
+            wall = _utcnow()
+            for hold_id in [hold_id for hold_id, hold in self._holds.items()
+                            if hold.expires_at is not None and hold.expires_at <= wall]:
+                del self._holds[hold_id]
+            local = [hold for hold in self._holds.values() if hold.day == day]
+        local_ids = {hold.hold_id for hold in local}
+        remote = [hold for hold in self.store.active_holds(day) if hold.hold_id not in local_ids]
+        with grid.lock:
+            for hold in local + remote:
+                row = self._rows.get(hold.restaurant_id)
+                if row is not None and hold.table_size in TABLE_SIZES:
+                    grid.take(row, TABLE_SIZES.index(hold.table_size), hold.start_bucket, 1)
+        return grid
+
+    # === SEARCH ===
+
+    def search(self, city: str, day: date, at: dtime, party_size: int, flex_minutes: int = 60
+               ) -> List[Tuple[Restaurant, List[dtime]]]:
+        """
+        Restaurants in `city` with a table for the party starting within at ± flex_minutes
+
+        Each result lists the bookable start times, closest to `at` first; results
+        are ordered by how close their best time is, then by rating.
+        """
+        rows = self._city_rows.get(city.lower())
+        if rows is None or len(rows) == 0 or party_size > TABLE_SIZES[-1]:
+            return []
+        need = size_class(party_size)
+        target = to_bucket(at)
+        flex = flex_minutes // SLOT_MINUTES
+        starts = [b for b in range(target - flex, target + flex + 1) if 0 <= b <= BUCKETS - SITTING_BUCKETS]
+        if not starts:
+            return []
+        grid = self._grid(day)
+
+        with grid.lock:
+            if NUMPY_AVAILABLE:
+                first, last = starts[0], starts[-1] + 1
+                cells = grid.free[rows, need:, first:last + SITTING_BUCKETS - 1]
+                sitting = cells[:, :, 0:last - first]
+                for offset in range(1, SITTING_BUCKETS):
+                    sitting = np.minimum(sitting, cells[:, :, offset:offset + last - first])
+                bookable = (sitting > 0).any(axis=1)  # (restaurants, starts)
+                hits = [(int(rows[i]), [starts[j] for j in np.flatnonzero(bookable[i])])
+                        for i in np.flatnonzero(bookable.any(axis=1))]
+            else:
+                hits = []
+                for row in rows:
+                    free_starts = [start for start in starts
+                                   if any(min(grid.free[row][size][start:start + SITTING_BUCKETS]) > 0
+                                          for size in range(need, len(TABLE_SIZES)))]
+                    if free_starts:
+                        hits.append((row, free_starts))
+
+        results = []
+        for row, free_starts in hits:
+            free_starts.sort(key=lambda bucket: (abs(bucket - target), bucket))
+            results.append((self.restaurants[row], [from_bucket(bucket) for bucket in free_starts]))
+        results.sort(key=lambda item: (abs(to_bucket(item[1][0]) - target), -item[0].rating))
+        return results
+
+    # === HOLDS ===
+
+    def hold(self, restaurant_id: str, day: date, at: dtime, party_size: int) -> Optional[SlotHold]:
+        """Hold the smallest table that fits the party for the sitting starting at `at`; None when full"""
+        row = self._rows.get(str(restaurant_id))
+        if row is None:
+            raise ValueError(f"Unknown restaurant {restaurant_id}")
+        restaurant = self.restaurants[row]
+        start = to_bucket(at)
+        if start > BUCKETS - SITTING_BUCKETS or party_size > TABLE_SIZES[-1]:
+            return None
+        grid = self._grid(day)
+        refused = False
+        try:
+            with grid.lock:
+                for size in range(size_class(party_size), len(TABLE_SIZES)):
+                    if grid.sitting_free(row, size, start) <= 0:
+                        continue
+                    hold = SlotHold(new_booking_id(), restaurant.id, day, TABLE_SIZES[size], start, party_size,
+                                    expires_at=_utcnow() + timedelta(minutes=self.hold_minutes))
+                    if not self.store.hold(restaurant, hold):
+                        # Another replica took it; reflect that locally and try a larger table
+                        refused = True
+                        grid.take(row, size, start, grid.sitting_free(row, size, start))
+                        continue
+                    grid.take(row, size, start, 1)
+                    with self._lock:
+                        self._holds[hold.hold_id] = hold
+                    return hold
+            return None
+        finally:
+            if refused:
+                # The local grid was behind the database; read it again on next use
+                with self._lock:
+                    if self._days.get(day) is grid:
+                        del self._days[day]
+
+    def confirm(self, hold_id: str):
+        """Keep a held table for the booking made with it"""
+        self.store.confirm(hold_id)
+        with self._lock:
+            hold = self._holds.get(hold_id)
+            if hold is not None:
+                hold.expires_at = None
+
+    def release(self, hold_id: str):
+        """Give a held table back (e.g. the booking failed, was cancelled or expired)"""
+        with self._lock:
+            hold = self._holds.pop(hold_id, None)
+            grid = self._days.get(hold.day) if hold else None
+        self.store.release(hold_id)
+        if hold is None or grid is None:
+            return
+        with grid.lock:
+            grid.take(self._rows[hold.restaurant_id], TABLE_SIZES.index(hold.table_size), hold.start_bucket, -1)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# === CATALOG SOURCES ===
+
+DEMO_RESTAURANTS = [
+    ("Tawlet", "Lebanese Traditional", 4.7, "Downtown", "$$", 15),
+    ("Em Sherif", "Lebanese Fine Dining", 4.9, "Center", "$$$$", 25),
+    ("Urbanista", "International", 4.6, "Business District", "$$$", 20),
+    ("Babel Bay", "Mediterranean", 4.5, "Marina", "$$$", 18)
+]
+
+
+def demo_restaurants(city: str) -> List[Restaurant]:
+    """The sample restaurants shown when there is no database"""
+    return [Restaurant(id=f"demo_{city.lower().replace(' ', '_')}_{i}", name=name, city=city, cuisine=cuisine,
+                       rating=rating, price_range=price_range, deposit=deposit, location=f"{city} {area}")
+            for i, (name, cuisine, rating, area, price_range, deposit) in enumerate(DEMO_RESTAURANTS, 1)]
+
+
+def load_restaurants(client) -> List[Restaurant]:
+    """Every restaurant with its destination's city, in two queries"""
+    destinations = client.table("destinations").select("id,name,city").execute().data or []
+    cities = {row["id"]: row.get("city") or row["name"].split(",")[0].strip() for row in destinations}
+    rows = client.table("restaurants").select(
+        "id,name,destination_id,cuisine_type,rating,price_range,deposit_per_person,address"
+    ).execute().data or []
+    return [Restaurant(id=str(row["id"]), name=row["name"], city=cities.get(row.get("destination_id"), ""),
+                       cuisine=row.get("cuisine_type") or "International", rating=float(row.get("rating") or 4.0),
+                       price_range=row.get("price_range") or "$$", deposit=float(row.get("deposit_per_person") or 0),
+                       location=row.get("address") or "")
+            for row in rows]
+
+
+_engine: Optional[RestaurantSlotEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_restaurant_slot_engine(client=None) -> RestaurantSlotEngine:
+    """Process-wide engine; loaded from the database when a client is available"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            if client is not None:
+                try:
+                    _engine = RestaurantSlotEngine(load_restaurants(client), SupabaseSlotStore(client))
+                except Exception as e:
+                    print(f"⚠️ Could not load restaurants for slot search: {e}")
+            if _engine is None:
+                _engine = RestaurantSlotEngine()
+    return _engine
+
+
+def run_slot_search_benchmark(restaurants: int = 5000, cities: int = 20, searches: int = 500,
+                              seed: int = 7) -> Dict[str, float]:
+    """Search latency over a synthetic catalog after filling part of tonight's tables"""
+    rng = random.Random(seed)
+    catalog = [Restaurant(id=f"r{i}", name=f"Restaurant {i}", city=f"City {i % cities}",
+                          rating=round(rng.uniform(3.5, 5.0), 1),
+                          tables={2: rng.randint(2, 8), 4: rng.randint(2, 10), 6: rng.randint(0, 4), 8: rng.randint(0, 2)})
+               for i in range(restaurants)]
+    engine = RestaurantSlotEngine(catalog)
+    day = date.today() + timedelta(days=1)
+
+    start = time.perf_counter()
+    held = sum(1 for _ in range(restaurants * 5)
+               if engine.hold(f"r{rng.randrange(restaurants)}", day, dtime(rng.choice([18, 19, 20, 21]), 0),
+                              rng.randint(1, 6)))
+    hold_seconds = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(searches):
+        started = time.perf_counter()
+        engine.search(f"City {rng.randrange(cities)}", day, dtime(19, 0), rng.randint(2, 6), flex_minutes=60)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return {
+        "restaurants": restaurants,
+        "holds": held,
+        "holds_per_second": held / hold_seconds if hold_seconds else 0.0,
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95)]
+    }
+
+
+if __name__ == "__main__":
+    result = run_slot_search_benchmark()
+    print(f"🍽️ {result['restaurants']} restaurants, {result['holds']} holds ({result['holds_per_second']:.0f}/s); "
+          f"city search p50 {result['p50_ms']:.2f} ms, p95 {result['p95_ms']:.2f} ms "
+          f"({'NumPy' if NUMPY_AVAILABLE else 'pure Python'})")
@@ -0,0 +1,226 @@
+"""
+📅 Calendar Interval Index
+Per-user interval index for fast travel conflict detection and ICS export
+
+Events are kept in a treap ordered by start time, with every node tracking the
+latest end time in its subtree. Overlap queries prune any subtree whose max end
+is before the query start or whose starts are all after the query end, so a
+conflict check costs O(log n + k) instead of a scan over the whole history.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+
+@dataclass
+class CalendarEvent:
+    """A single calendar entry"""
+    start: datetime
+    end: datetime
+    title: str
+    type: str = "event"
+    details: str = ""
+    uid: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CalendarEvent":
+        """Build from the dict shape used by CalendarIntegration"""
+        start = data["start"] if isinstance(data["start"], datetime) else datetime.fromisoformat(data["start"])
+        end = data["end"] if isinstance(data["end"], datetime) else datetime.fromisoformat(data["end"])
+        return cls(
+            start=start,
+            end=end,
+            title=data.get("title", ""),
+            type=data.get("type", "event"),
+            details=data.get("details", ""),
+            uid=data.get("uid") or uuid.uuid4().hex
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "type": self.type,
+            "details": self.details,
+            "uid": self.uid
+        }
+
+
+class _Node:
+    __slots__ = ("key", "event", "priority", "max_end", "left", "right")
+
+    def __init__(self, event: CalendarEvent):
+        self.key = (event.start, event.uid)
+        self.event = event
+        self.priority = random.random()
+        self.max_end = event.end
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+    def update(self):
+        max_end = self.event.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class CalendarIndex:
+    """Interval treap over one user's calendar events"""
+
+    def __init__(self, events: Optional[Iterable[CalendarEvent]] = None):
+        self._root: Optional[_Node] = None
+        self._size = 0
+        if events:
+            self.bulk_insert(events)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[CalendarEvent]:
+        """Events in start-time order"""
+        stack, node = [], self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.event
+            node = node.right
+
+    # === INSERTION ===
+
+    def insert(self, event: CalendarEvent):
+        """Insert one event in O(log n) expected time"""
+        self._root = self._insert(self._root, _Node(event))
+        self._size += 1
+
+    def bulk_insert(self, events: Iterable[CalendarEvent]):
+        """Insert a whole itinerary; an empty index is built bottom-up in O(m)"""
+        new_events = sorted(events, key=lambda e: (e.start, e.uid))
+        if not new_events:
+            return
+        if self._root is None:
+            nodes = [_Node(event) for event in new_events]
+            # Heap-order priorities by depth so the balanced build is a valid treap
+            self._root = self._build(nodes, 0, len(nodes), 1.0)
+            self._size = len(nodes)
+        else:
+            for event in new_events:
+                self.insert(event)
+
+    def _build(self, nodes: List[_Node], lo: int, hi: int, ceiling: float) -> Optional[_Node]:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.priority = ceiling * (0.5 + random.random() / 2)
+        node.left = self._build(nodes, lo, mid, node.priority)
+        node.right = self._build(nodes, mid + 1, hi, node.priority)
+        node.update()
+        return node
+
+    def _insert(self, root: Optional[_Node], node: _Node) -> _Node:
+        if root is None:
+            return node
+        if node.key < root.key:
+            root.left = self._insert(root.left, node)
+            if root.left.priority > root.priority:
+                root = self._rotate_right(root)
+        else:
+            root.right = self._insert(root.right, node)
+            if root.right.priority > root.priority:
+                root = self._rotate_left(root)
+        root.update()
+        return root
+
+    def _rotate_right(self, node: _Node) -> _Node:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.update()
+        pivot.update()
+        return pivot
+
+    def _rotate_left(self, node: _Node) -> _Node:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.update()
+        pivot.update()
+        return pivot
+
+    # === QUERIES ===
+
+    def overlaps(self, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """All events with event.start <= end and event.end >= start, in start order"""
+        return list(self._iter_overlaps(start, end))
+
+    def has_conflict(self, start: datetime, end: datetime) -> bool:
+        """True as soon as one overlapping event is found"""
+        return next(self._iter_overlaps(start, end), None) is not None
+
+    def _iter_overlaps(self, start: datetime, end: datetime) -> Iterator[CalendarEvent]:
+        stack, node = [], self._root
+        while stack or node is not None:
+            # Walk left only while the left subtree can still reach the query start
+            while node is not None and node.max_end >= start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.event.start > end:
+                return  # this and everything to the right starts after the query
+            if node.event.end >= start:
+                yield node.event
+            node = node.right
+
+
+def _ics_escape(text: str) -> str:
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _ics_fold(line: str) -> Iterator[str]:
+    """Fold content lines at 75 octets as required by RFC 5545"""
+    encoded = line.encode("utf-8")
+    while len(encoded) > 75:
+        cut = 75
+        while (encoded[cut] & 0xC0) == 0x80:  # do not split a UTF-8 sequence
+            cut -= 1
+        yield encoded[:cut].decode("utf-8") + "\r\n"
+        encoded = b" " + encoded[cut:]
+    yield encoded.decode("utf-8") + "\r\n"
+
+
+def _ics_time(value: datetime) -> str:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def iter_ics(events: Iterable[CalendarEvent], calendar_name: str = "AI Travel Platform") -> Iterator[str]:
+    """Stream an iCalendar document line by line without building it in memory"""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield "PRODID:-//AI Travel Platform//Travel Calendar//EN\r\n"
+    yield from _ics_fold(f"X-WR-CALNAME:{_ics_escape(calendar_name)}")
+    for event in events:
+        yield "BEGIN:VEVENT\r\n"
+        yield f"UID:{event.uid}@ai-travel-platform\r\n"
+        yield f"DTSTAMP:{stamp}\r\n"
+        yield f"DTSTART:{_ics_time(event.start)}\r\n"
+        yield f"DTEND:{_ics_time(event.end)}\r\n"
+        yield from _ics_fold(f"SUMMARY:{_ics_escape(event.title)}")
+        if event.details:
+            yield from _ics_fold(f"DESCRIPTION:{_ics_escape(event.details)}")
+        yield from _ics_fold(f"CATEGORIES:{_ics_escape(event.type.upper())}")
+        yield "END:VEVENT\r\n"
+    yield "END:VCALENDAR\r\n"
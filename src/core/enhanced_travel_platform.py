@@ -26,15 +26,13 @@ except ImportError:
         return decorator
 
 from langchain_community.tools.tavily_search import TavilySearchResults
-from supabase import create_client, Client
+from supabase import Client
+from src.api_integration.supabase.client_factory import get_supabase_client
 import requests
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 import asyncio
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 # Remove duplicate environment loading since it's done in config
 # load_dotenv()
@@ -45,10 +43,7 @@ supabase_config = get_supabase_config()
 stripe_config = get_stripe_config()
 
 # Initialize clients
-supabase: Client = create_client(
-    supabase_config["url"], 
-    supabase_config["key"]
-) if supabase_config["url"] and supabase_config["key"] else None
+supabase: Client = get_supabase_client(supabase_config["url"], supabase_config["key"])
 
 llm = ChatOpenAI(
     model=openai_config["model"], 
@@ -139,6 +134,12 @@ class PriceTracker:
     
     def __init__(self):
         self.tracked_items = {}
+    
+    @property
+    def outbox(self):
+        """Shared outbox whose workers deliver the alerts; fetched on first use"""
+        from src.services.notification_outbox import get_notification_outbox
+        return get_notification_outbox()
         
     def track_price(self, item_type: str, item_id: str, current_price: float, user_email: str, target_price: float = None):
         """Track price changes for flights, hotels, etc."""
@@ -175,41 +176,24 @@ class PriceTracker:
         return base_price * (0.9 + random.random() * 0.2)  # ±10% variation
     
     def _send_price_alert(self, item_data: dict, new_price: float, price_change: float):
-        """Send price alert email"""
+        """Queue a price alert; moves on the same item within the digest window are merged"""
         try:
-            subject = f"🚨 Price Alert: {item_data['type'].title()} Price Changed!"
-            change_type = "📉 Decreased" if price_change < 0 else "📈 Increased"
-            body = f"""
-            Price Alert for your tracked {item_data['type']}:
-            
-            {change_type} by ${abs(price_change):.2f}
-            New Price: ${new_price:.2f}
-            Previous Price: ${item_data['current_price']:.2f}
-            
-            Check now to book at the best price!
-            """
-            
-            self._send_email(item_data["user_email"], subject, body)
+            self.outbox.enqueue_price_move(
+                user_email=item_data["user_email"],
+                item_type=item_data["type"],
+                item_id=item_data["id"],
+                old_price=item_data["current_price"],
+                new_price=new_price
+            )
             item_data["alerts_sent"] += 1
             
         except Exception as e:
             print(f"Error sending price alert: {e}")
     
     def _send_email(self, to_email: str, subject: str, body: str):
-        """Send email notification"""
-        if not config.SMTP_PASSWORD:
-            print(f"Email alert (no email configured): {subject}")
-            return
-            
+        """Queue an email notification on the outbox"""
         try:
-            msg = MIMEMultipart()
-            msg['From'] = "travel.platform@example.com"
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Note: Configure with your actual email provider
-            print(f"Email sent to {to_email}: {subject}")
+            self.outbox.enqueue("email", to_email, subject, body)
         except Exception as e:
             print(f"Email error: {e}")
 
@@ -217,7 +201,8 @@ class CalendarIntegration:
     """Calendar integration for travel planning"""
     
     def __init__(self):
-        self.calendar_events = {}
+        # One interval index per user so conflict checks don't scan the whole history
+        self.calendar_indexes = {}
     
     def add_travel_to_calendar(self, user_id: str, travel_package: TravelPackage, start_date: str):
         """Add travel itinerary to user's calendar"""
@@ -257,75 +242,81 @@ class CalendarIntegration:
                 "details": f"Cuisine: {restaurant.cuisine_type}, Phone: {restaurant.phone}"
             })
         
-        self.calendar_events[user_id] = events
+        # Bulk insert the whole itinerary into the user's index
+        from src.core.calendar_index import CalendarIndex, CalendarEvent
+        
+        calendar_index = self.calendar_indexes.setdefault(user_id, CalendarIndex())
+        calendar_index.bulk_insert(CalendarEvent.from_dict(event) for event in events)
         return events
     
     def get_user_calendar(self, user_id: str) -> List[dict]:
-        """Get user's travel calendar events"""
-        return self.calendar_events.get(user_id, [])
+        """Get user's travel calendar events in start order"""
+        calendar_index = self.calendar_indexes.get(user_id)
+        return [event.to_dict() for event in calendar_index] if calendar_index else []
+    
+    def get_conflicts(self, user_id: str, start_date: str, end_date: str) -> List[dict]:
+        """Get events overlapping the travel dates"""
+        calendar_index = self.calendar_indexes.get(user_id)
+        if not calendar_index:
+            return []
+        
+        travel_start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
+        travel_end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
+        return [event.to_dict() for event in calendar_index.overlaps(travel_start, travel_end)]
     
     def check_availability(self, user_id: str, start_date: str, end_date: str) -> bool:
         """Check if user is available for travel dates"""
-        events = self.get_user_calendar(user_id)
+        calendar_index = self.calendar_indexes.get(user_id)
+        if not calendar_index:
+            return True
         
-        for event in events:
-            event_start = datetime.datetime.fromisoformat(event["start"])
-            event_end = datetime.datetime.fromisoformat(event["end"])
-            travel_start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-            travel_end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-            
-            # Check for conflicts
-            if (travel_start <= event_end and travel_end >= event_start):
-                return False
+        travel_start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
+        travel_end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
+        return not calendar_index.has_conflict(travel_start, travel_end)
+    
+    def export_ics(self, user_id: str):
+        """Stream the user's calendar as iCalendar lines"""
+        from src.core.calendar_index import iter_ics
         
-        return True
+        return iter_ics(self.calendar_indexes.get(user_id) or [], calendar_name=f"Travel - {user_id}")
 
 class GroupBookingManager:
     """Manage group travel bookings and coordination"""
     
-    def __init__(self):
-        self.group_bookings = {}
+    def __init__(self, store=None):
+        from src.booking_system.group_booking_store import get_group_booking_store, CachedGroupReadModel
+        
+        # Groups live in the database so they survive restarts and are shared across replicas
+        self.store = store or get_group_booking_store(supabase)
+        self.read_model = CachedGroupReadModel(self.store)
+    
+    @property
+    def group_bookings(self) -> Dict[str, dict]:
+        """Recent groups keyed by group ID (served from the cached read model)"""
+        return {group["group_id"]: group for group in self.read_model.list_groups()}
     
     def create_group_booking(self, group_leader_id: str, destination: str, travel_dates: Tuple[str, str], max_participants: int = 10):
         """Create a new group booking"""
-        group_id = f"group_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        self.group_bookings[group_id] = {
-            "group_id": group_id,
-            "leader_id": group_leader_id,
-            "destination": destination,
-            "travel_dates": travel_dates,
-            "max_participants": max_participants,
-            "participants": [group_leader_id],
-            "status": "open",
-            "created_at": datetime.datetime.now().isoformat(),
-            "preferences": {},
-            "group_discounts": {}
-        }
-        
+        group_id = self.store.create_group(group_leader_id, destination, travel_dates, max_participants)
+        self.read_model.invalidate()
         return group_id
     
     def join_group_booking(self, group_id: str, user_id: str) -> bool:
-        """Add user to group booking"""
-        if group_id not in self.group_bookings:
-            return False
-        
-        group = self.group_bookings[group_id]
-        
-        if len(group["participants"]) >= group["max_participants"]:
-            return False
+        """Add user to group booking (atomic capacity check, idempotent for existing members)"""
+        from src.booking_system.group_booking_store import JOINED, ALREADY_MEMBER
         
-        if user_id not in group["participants"]:
-            group["participants"].append(user_id)
+        outcome = self.store.join(group_id, user_id)
+        if outcome == JOINED:
+            self.read_model.invalidate(group_id)
         
-        return True
+        return outcome in (JOINED, ALREADY_MEMBER)
     
     def calculate_group_discounts(self, group_id: str, base_package: TravelPackage) -> TravelPackage:
         """Calculate group discounts and return updated package"""
-        if group_id not in self.group_bookings:
+        group = self.read_model.get_group(group_id)
+        if group is None:
             return base_package
         
-        group = self.group_bookings[group_id]
         participant_count = len(group["participants"])
         
         # Group discount logic
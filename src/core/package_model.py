@@ -0,0 +1,284 @@
+"""
+🧳 Compact Package Model
+Memory-compact, read-only representation of generated travel packages and bookings
+
+Generated packages are nested dicts in which the same keys repeat on every
+day, meal and activity, the same hotel and restaurant dicts appear in several
+packages, and bookings copy whole package sections. Streamlit keeps all of it
+in session state for every user.
+
+compact() turns such a structure into shape-shared records:
+
+- every dict becomes a Record: a single tuple holding a pointer to a Shape
+  (the key tuple and key -> index map, shared by every record with the same
+  keys) followed by the values
+- lists become tuples
+- naive datetimes are stored as integer microseconds
+- equal strings, lists and records within one compact() call are stored
+  once, so a restaurant or activity repeated across days and packages, and
+  the package sections a booking copies, are not duplicated
+
+Records implement the read-only Mapping protocol (package['pricing']['total_cost'],
+.get, .items, iteration), so the display code reads them like the original dicts.
+expand() converts back to plain dicts and lists.
+
+Usage:
+    python src/core/package_model.py   # bytes per session for 7, 14 and 21 day packages
+"""
+
+import sys
+import random
+import threading
+import tracemalloc
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class Shape:
+    """Key layout shared by all records with the same keys"""
+    __slots__ = ("keys", "index", "datetime_mask")
+
+    def __init__(self, keys: Tuple[Any, ...], datetime_mask: int):
+        self.keys = keys
+        self.index = {key: i + 1 for i, key in enumerate(keys)}  # slot 0 of a record is its shape
+        self.datetime_mask = datetime_mask  # bit i set: value i is a datetime stored as microseconds
+
+
+_shapes: Dict[Tuple[Tuple[Any, ...], int], Shape] = {}
+_lock = threading.Lock()
+
+
+def _shape(keys: Tuple[Any, ...], datetime_mask: int) -> Shape:
+    key = (keys, datetime_mask)
+    shape = _shapes.get(key)
+    if shape is None:
+        with _lock:
+            shape = _shapes.setdefault(key, Shape(keys, datetime_mask))
+    return shape
+
+
+class Record(tuple):
+    """
+    Immutable dict view stored as one tuple: (shape, value, value, ...)
+
+    Subclassing tuple keeps a record to a single allocation with no per-instance
+    dict. The tuple protocol is overridden with the Mapping one, so iteration
+    yields keys and len() counts keys, as for a dict.
+    """
+    __slots__ = ()
+
+    def __new__(cls, shape: Shape, values: Tuple[Any, ...]):
+        return tuple.__new__(cls, (shape,) + tuple(values))
+
+    @property
+    def shape(self) -> Shape:
+        return tuple.__getitem__(self, 0)
+
+    def __getitem__(self, key):
+        shape = tuple.__getitem__(self, 0)
+        i = shape.index[key]
+        value = tuple.__getitem__(self, i)
+        if shape.datetime_mask >> (i - 1) & 1:
+            return _EPOCH + value * _MICROSECOND
+        return value
+
+    def get(self, key, default=None):
+        if key in tuple.__getitem__(self, 0).index:
+            return self[key]
+        return default
+
+    def __contains__(self, key) -> bool:
+        return key in tuple.__getitem__(self, 0).index
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(tuple.__getitem__(self, 0).keys)
+
+    def __len__(self) -> int:
+        return len(tuple.__getitem__(self, 0).keys)
+
+    def keys(self):
+        return tuple.__getitem__(self, 0).keys
+
+    def values(self) -> List[Any]:
+        return [self[key] for key in self]
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        return [(key, self[key]) for key in self]
+
+    __hash__ = tuple.__hash__
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Record) and tuple.__getitem__(self, 0) is tuple.__getitem__(other, 0):
+            return tuple.__eq__(self, other)
+        if isinstance(other, Mapping):
+            return expand(self) == expand(other)  # lists and tuples compare equal here, as after compact()
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self) -> str:
+        return f"Record({dict(self.items())!r})"
+
+    def __reduce__(self):
+        shape = tuple.__getitem__(self, 0)
+        return (_rebuild, (shape.keys, shape.datetime_mask, tuple.__getitem__(self, slice(1, None))))
+
+
+Mapping.register(Record)
+
+
+def _rebuild(keys, datetime_mask, values) -> Record:
+    return Record(_shape(keys, datetime_mask), values)
+
+
+def compact(value: Any, _memo: Optional[Dict[Any, Any]] = None) -> Any:
+    """
+    Compact nested dicts, lists and strings; other values are kept as they are
+
+    Equal strings and records inside one call are stored once, so compact a
+    session's packages together (compact(packages)) to share hotels, restaurants
+    and activities between them.
+    """
+    memo = {} if _memo is None else _memo
+    if isinstance(value, Record):
+        return value
+    if isinstance(value, dict):
+        keys = tuple(sys.intern(k) if isinstance(k, str) else k for k in value)
+        values = []
+        datetime_mask = 0
+        for i, item in enumerate(value.values()):
+            if isinstance(item, datetime) and item.tzinfo is None:
+                values.append((item - _EPOCH) // _MICROSECOND)
+                datetime_mask |= 1 << i
+            else:
+                values.append(compact(item, memo))
+        record = Record(_shape(keys, datetime_mask), values)
+        try:
+            return memo.setdefault((Record, record), record)
+        except TypeError:
+            return record  # holds an unhashable value (set, custom object); keep a private copy
+    if isinstance(value, (list, tuple)):
+        items = tuple(compact(item, memo) for item in value)
+        if isinstance(value, tuple) and all(a is b for a, b in zip(items, value)):
+            items = value  # already compact
+        try:
+            return memo.setdefault((tuple, items), items)
+        except TypeError:
+            return items
+    if isinstance(value, str):
+        return memo.setdefault(value, value)
+    return value
+
+
+def expand(value: Any) -> Any:
+    """Plain dicts and lists again, for code that needs to mutate or serialize"""
+    if isinstance(value, Mapping):
+        return {key: expand(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [expand(item) for item in value]
+    return value
+
+
+# === MEMORY BENCHMARK ===
+
+def synthetic_package(duration: int, seed: int = 0, destination: str = "Paris, France") -> Dict[str, Any]:
+    """A package with the same layout as generate_personalized_package output"""
+    rng = random.Random(seed)
+    venues = [f"{destination.split(',')[0]} Spot {i}" for i in range(40)]
+
+    def activity():
+        name = rng.choice(venues)
+        return {"name": name, "description": f"Guided visit of {name} with a local expert",
+                "duration": rng.choice(["2 hours", "2-3 hours", "3 hours"]),
+                "price": rng.choice([0, 15, 25, 40]), "category": rng.choice(["culture", "food", "nature"]),
+                "location": destination}
+
+    def meal(kind):
+        name = rng.choice(venues)
+        return {"type": kind, "restaurant": name, "cuisine": "Local", "price_range": "$$",
+                "specialty": "Chef's tasting menu", "location": destination}
+
+    days = []
+    for day in range(1, duration + 1):
+        activities = [activity() for _ in range(3)]
+        days.append({
+            "day": day,
+            "theme": rng.choice(["Historic Heart", "Food Trails", "Hidden Corners", "Art & Design"]),
+            "morning": f"9:00 AM - 12:00 PM: {activities[0]['name']} (2-3 hours) - {activities[0]['description']}",
+            "afternoon": f"1:00 PM - 5:00 PM: {activities[1]['name']} (2-3 hours) - {activities[1]['description']}",
+            "evening": f"6:00 PM - 9:00 PM: {activities[2]['name']} (2-3 hours) - {activities[2]['description']}",
+            "activities": activities,
+            "meals": {"breakfast": meal("breakfast"), "lunch": meal("lunch"), "dinner": meal("dinner")},
+            "transportation": "Metro and walking, day pass recommended",
+            "estimated_cost": rng.randint(80, 260),
+            "cultural_highlights": ["Local etiquette tips", "Neighborhood history"],
+            "local_tips": ["Book museum slots online", "Carry cash for markets"],
+            "weather_considerations": "Check local weather for optimal experience. Best backup indoor options available.",
+            "photography_opportunities": [a["name"] for a in activities]
+        })
+    return {
+        "id": f"pkg_{seed}", "title": f"{destination} Cultural Heritage Explorer", "destination": destination,
+        "duration": duration, "travelers": 2, "budget_level": "moderate",
+        "focus": "Deep cultural immersion with historical sites and local traditions",
+        "created_at": datetime.now(),
+        "flights": [{"airline": a, "class": "Economy", "price_per_person": 640 + i * 90, "duration": "6h 20m",
+                     "stops": i} for i, a in enumerate(["Air France", "Lufthansa", "Emirates"])],
+        "hotels": [{"name": f"Hotel {v}", "rating": 4.5, "price": 210, "location": destination,
+                    "why_recommended": "Walking distance to the old town"} for v in venues[:3]],
+        "restaurants": [meal("dinner") for _ in range(5)],
+        "activities": [activity() for _ in range(8)],
+        "local_experiences": [activity() for _ in range(4)],
+        "daily_itinerary": days,
+        "pricing": {"flights": 1280, "accommodation": 210 * duration, "activities": 400, "meals": 90 * duration,
+                    "taxes": 310, "service_fee": 120, "total_cost": 2500 + 300 * duration,
+                    "cost_per_person": 1250 + 150 * duration}
+    }
+
+
+def _session(make_package: Callable[[int, int], Dict[str, Any]], duration: int, user: int,
+             compacted: bool) -> Dict[str, Any]:
+    """What one user's session holds: four generated packages, the one being viewed and a booking"""
+    packages = [make_package(duration, user * 4 + i) for i in range(4)]
+    if compacted:
+        packages = list(compact(packages))
+    booking = {
+        "booking_id": f"PKG_{user}", "created_at": datetime.now(), "status": "CONFIRMED",
+        "package_title": packages[0]["title"], "daily_itinerary": packages[0]["daily_itinerary"],
+        "restaurants": packages[0]["restaurants"], "activities": packages[0]["activities"]
+    }
+    return {"generated_packages": packages, "viewing_package_details": packages[0],
+            "booking_history": [compact(booking) if compacted else booking]}
+
+
+def run_package_memory_benchmark(durations=(7, 14, 21), sessions: int = 20,
+                                 make_package: Optional[Callable[[int, int], Dict[str, Any]]] = None
+                                 ) -> Dict[int, Dict[str, float]]:
+    """Traced bytes per session for dict and compact packages, averaged over `sessions` sessions"""
+    make_package = make_package or (lambda duration, seed: synthetic_package(duration, seed))
+
+    def measure(compacted):
+        tracemalloc.start()
+        held = [_session(make_package, duration, user, compacted) for user in range(sessions)]
+        traced = tracemalloc.get_traced_memory()[0] / sessions
+        tracemalloc.stop()
+        del held
+        return traced
+
+    results = {}
+    for duration in durations:
+        row = {"dict_bytes": measure(False), "compact_bytes": measure(True)}
+        row["ratio"] = row["dict_bytes"] / row["compact_bytes"]
+        results[duration] = row
+    return results
+
+
+if __name__ == "__main__":
+    for duration, row in run_package_memory_benchmark().items():
+        print(f"{duration:2d}-day packages: {row['dict_bytes'] / 1024:7.1f} -> {row['compact_bytes'] / 1024:6.1f} "
+              f"KiB per session ({row['ratio']:.1f}x smaller)")
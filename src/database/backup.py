@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+💾 Table Backup & Restore - AI Travel Platform
+Streaming, compressed per-table backups with a manifest
+
+Each table is paged through (keyset on its key column) and written row by row
+to <table>.ndjson.gz, so a backup runs in constant memory no matter how large
+the bookings or interaction tables grow. Tables are backed up concurrently.
+manifest.json records row counts, sizes and checksums; restore verifies them
+and streams the rows back through the bulk loader's chunked upserts.
+
+Usage:
+    python src/database/backup.py backup [--tables bookings hotels]
+    python src/database/backup.py restore database/backups/backup_20250101_120000
+"""
+
+import sys
+import gzip
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_integration.supabase.supabase_service import SupabaseService
+from src.database.bulk_loader import BulkLoader
+
+BACKUP_ROOT = Path(__file__).parent / "backups"
+MANIFEST_NAME = "manifest.json"
+
+DEFAULT_TABLES = [
+    "destinations", "attractions", "hotels", "restaurants",
+    "user_profiles", "flights", "price_tracking", "travel_bookings", "bookings",
+    "user_travel_history", "search_analytics"
+]
+
+# Tables whose primary key is not "id"
+KEY_COLUMNS = {
+    "group_bookings": "group_id",
+    "group_booking_members": "group_id,user_id",
+    "schema_migrations": "version"
+}
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_backup_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream rows back out of a .ndjson.gz table file"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class TableBackup:
+    """Concurrent streaming backup and chunked restore"""
+
+    def __init__(self, client, page_size: int = 1000, workers: int = 4, log=None):
+        self.client = client
+        self.service = SupabaseService(client=client)
+        self.page_size = page_size
+        self.workers = workers
+        self.log = log or (lambda message, level="INFO": print(message))
+
+    # === BACKUP ===
+
+    def backup(self, tables: Optional[List[str]] = None, backup_root: Path = BACKUP_ROOT) -> Path:
+        """Back up tables into a new timestamped directory and return its path"""
+        tables = tables or DEFAULT_TABLES
+        backup_dir = Path(backup_root) / f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        backup_dir.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            entries = dict(zip(tables, pool.map(lambda t: self._backup_table(t, backup_dir), tables)))
+
+        manifest = {
+            "created_at": datetime.now().isoformat(),
+            "format": "ndjson.gz",
+            "page_size": self.page_size,
+            "tables": {table: entry for table, entry in entries.items() if entry}
+        }
+        with open(backup_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        total_rows = sum(entry["rows"] for entry in manifest["tables"].values())
+        self.log(f"✅ Backup saved to: {backup_dir} ({total_rows:,} rows, "
+                 f"{len(manifest['tables'])}/{len(tables)} tables, {time.perf_counter() - start:.1f}s)")
+        return backup_dir
+
+    def _backup_table(self, table: str, backup_dir: Path) -> Optional[Dict[str, Any]]:
+        key_column = KEY_COLUMNS.get(table, "id")
+        path = backup_dir / f"{table}.ndjson.gz"
+        start = time.perf_counter()
+        rows = 0
+        try:
+            # Keyset paging needs a single-column key; composite keys fall back to range paging in key order
+            keyset = key_column if "," not in key_column else None
+            rows_in_key_order = self.service.iter_rows(table, page_size=self.page_size, key_column=keyset,
+                                                       order_by=None if keyset else key_column)
+            with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+                for row in rows_in_key_order:
+                    f.write(json.dumps(row, default=str, separators=(",", ":")))
+                    f.write("\n")
+                    rows += 1
+        except Exception as e:
+            self.log(f"⚠️ Could not backup {table}: {e}", "WARNING")
+            path.unlink(missing_ok=True)
+            return None
+
+        elapsed = time.perf_counter() - start
+        self.log(f"✅ Backed up {rows:,} records from {table} ({elapsed:.1f}s)")
+        return {
+            "file": path.name,
+            "rows": rows,
+            "bytes": path.stat().st_size,
+            "sha256": _sha256(path),
+            "key_column": key_column,
+            "seconds": round(elapsed, 3)
+        }
+
+    # === RESTORE ===
+
+    def restore(self, backup_dir: Path, tables: Optional[List[str]] = None,
+                chunk_size: int = 500) -> Dict[str, int]:
+        """Verify checksums, then upsert each table back on its key column"""
+        backup_dir = Path(backup_dir)
+        with open(backup_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        selected = {t: e for t, e in manifest["tables"].items() if not tables or t in tables}
+        for table, entry in selected.items():
+            if _sha256(backup_dir / entry["file"]) != entry["sha256"]:
+                raise ValueError(f"Backup file for {table} is corrupt (checksum mismatch)")
+
+        loader = BulkLoader(self.client, chunk_size=chunk_size, workers=self.workers)
+        restored = {}
+        # Tables are restored in manifest order so referenced rows exist first
+        for table, entry in selected.items():
+            report = loader.load_rows(table, iter_backup_rows(backup_dir / entry["file"]),
+                                      natural_key=entry["key_column"])
+            restored[table] = report.rows
+            self.log(f"✅ Restored {report}")
+        return restored
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Back up or restore database tables")
+    parser.add_argument("command", choices=["backup", "restore"])
+    parser.add_argument("backup_dir", nargs="?", help="backup directory to restore from")
+    parser.add_argument("--tables", nargs="*", help="limit to these tables")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    from src.api_integration.supabase.client_factory import get_supabase_client
+    client = get_supabase_client()
+    if client is None:
+        print("❌ Error: SUPABASE_URL and SUPABASE_KEY must be set in .env file")
+        sys.exit(1)
+
+    backup = TableBackup(client, workers=args.workers)
+    if args.command == "backup":
+        backup.backup(args.tables)
+    else:
+        if not args.backup_dir:
+            parser.error("restore needs a backup directory")
+        backup.restore(Path(args.backup_dir), args.tables)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+📦 Bulk Seed Loader - AI Travel Platform
+Chunked, idempotent and resumable loading of seed data into Supabase
+
+Seed rows are read from JSON, NDJSON or CSV files and upserted on their
+natural key (e.g. destinations.name) in fixed-size chunks, several chunks at a
+time. Re-running a load never duplicates rows:
+- tables with a unique constraint on the natural key use a real upsert
+- tables without one fall back to inserting only rows whose key is missing
+
+Every committed chunk is recorded in a checkpoint file, so a load that fails
+half-way resumes from where it stopped once the problem is fixed.
+
+Usage:
+    python src/database/bulk_loader.py src/database/seeds/compatible/manifest.json
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+SEEDS_DIR = Path(__file__).parent / "seeds"
+DEFAULT_CHECKPOINT = "bulk_load_checkpoint.json"
+
+
+class BulkLoadError(Exception):
+    """Raised when a chunk still fails after all retries; the checkpoint is kept"""
+
+    def __init__(self, table: str, chunk_index: int, cause: Exception):
+        super().__init__(f"{table}: chunk {chunk_index} failed: {cause}")
+        self.table = table
+        self.chunk_index = chunk_index
+        self.cause = cause
+
+
+@dataclass
+class SeedSpec:
+    """One table's seed file and how to load it"""
+    table: str
+    path: Path
+    natural_key: str  # comma-separated column(s), e.g. "name" or "destination_id,name"
+    # seed column -> {"table", "column", "target"}: replace a readable reference
+    # (e.g. destination name) with the referenced row's id
+    references: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    @property
+    def key_columns(self) -> List[str]:
+        return [column.strip() for column in self.natural_key.split(",")]
+
+
+@dataclass
+class LoadReport:
+    """Outcome of loading one seed file"""
+    table: str
+    rows: int = 0
+    chunks: int = 0
+    resumed_chunks: int = 0
+    skipped_rows: int = 0
+    elapsed: float = 0.0
+    mode: str = "upsert"
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        resumed = f", {self.resumed_chunks} resumed" if self.resumed_chunks else ""
+        skipped = f", {self.skipped_rows} skipped" if self.skipped_rows else ""
+        return (f"{self.table}: {self.rows:,} rows in {self.chunks} chunks{resumed}{skipped} "
+                f"({self.mode}) at {self.rows_per_second:,.0f} rows/s")
+
+
+# === SEED FILES ===
+
+def read_seed_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield rows from a .json (array), .jsonl/.ndjson or .csv seed file"""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with open(path, encoding="utf-8", newline="" if suffix == ".csv" else None) as f:
+        if suffix in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif suffix == ".csv":
+            for row in csv.DictReader(f):
+                yield {key: value for key, value in row.items() if value != ""}
+        else:
+            yield from json.load(f)
+
+
+def file_fingerprint(path: Path) -> str:
+    """Content hash so a checkpoint is only reused for the same seed file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(manifest_path: Path) -> List[SeedSpec]:
+    """Read a manifest: a JSON list of {table, file, natural_key, references}"""
+    manifest_path = Path(manifest_path)
+    with open(manifest_path, encoding="utf-8") as f:
+        entries = json.load(f)
+    return [
+        SeedSpec(
+            table=entry["table"],
+            path=manifest_path.parent / entry["file"],
+            natural_key=entry["natural_key"],
+            references=entry.get("references", {})
+        )
+        for entry in entries
+    ]
+
+
+# === CHECKPOINTS ===
+
+class LoadCheckpoint:
+    """Committed chunk indexes per seed file, persisted after every chunk"""
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self._state = json.load(f)
+
+    def _entry_key(self, spec: SeedSpec) -> str:
+        return f"{spec.table}:{spec.path.name}"
+
+    def _resumable(self, entry: Optional[Dict[str, Any]], fingerprint: str, chunk_size: int) -> bool:
+        # Only an interrupted load of the same file with the same chunking can be resumed
+        return bool(entry) and not entry["complete"] and entry["fingerprint"] == fingerprint \
+            and entry["chunk_size"] == chunk_size
+
+    def committed(self, spec: SeedSpec, fingerprint: str, chunk_size: int) -> set:
+        entry = self._state.get(self._entry_key(spec))
+        if not self._resumable(entry, fingerprint, chunk_size):
+            return set()
+        return set(entry["committed"])
+
+    def start(self, spec: SeedSpec, fingerprint: str, chunk_size: int):
+        with self._lock:
+            key = self._entry_key(spec)
+            if not self._resumable(self._state.get(key), fingerprint, chunk_size):
+                self._state[key] = {"fingerprint": fingerprint, "chunk_size": chunk_size,
+                                    "committed": [], "complete": False}
+                self._save()
+
+    def commit_chunk(self, spec: SeedSpec, chunk_index: int):
+        with self._lock:
+            self._state[self._entry_key(spec)]["committed"].append(chunk_index)
+            self._save()
+
+    def finish(self, spec: SeedSpec):
+        with self._lock:
+            self._state[self._entry_key(spec)]["complete"] = True
+            self._save()
+
+    def reset(self):
+        with self._lock:
+            self._state = {}
+            if self.path.exists():
+                self.path.unlink()
+
+    def _save(self):
+        # Write-then-rename so a crash never leaves a half-written checkpoint
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self.path)
+
+
+# === LOADER ===
+
+class BulkLoader:
+    """Concurrent chunked upserts with retries, checkpoints and throughput reporting"""
+
+    def __init__(self, client, chunk_size: int = 500, workers: int = 4, max_attempts: int = 4,
+                 base_backoff: float = 0.5, checkpoint_path: str = DEFAULT_CHECKPOINT):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.checkpoint = LoadCheckpoint(checkpoint_path)
+        self._reference_cache: Dict[Tuple[str, str], Dict[Any, Any]] = {}
+
+    # --- public API ---
+
+    def load_manifest(self, manifest_path: Path) -> List[LoadReport]:
+        """Load every seed file in a manifest, in order (referenced tables first)"""
+        reports = []
+        for spec in load_manifest(manifest_path):
+            report = self.load(spec)
+            print(f"✅ {report}")
+            reports.append(report)
+        total_rows = sum(r.rows for r in reports)
+        total_time = sum(r.elapsed for r in reports)
+        rate = total_rows / total_time if total_time else 0.0
+        print(f"📦 Loaded {total_rows:,} rows into {len(reports)} tables at {rate:,.0f} rows/s")
+        return reports
+
+    def load(self, spec: SeedSpec) -> LoadReport:
+        """Load one seed file, resuming from its checkpoint when the file is unchanged"""
+        fingerprint = file_fingerprint(spec.path)
+        self._reference_cache.clear()  # earlier files in the manifest may have added referenced rows
+        done = self.checkpoint.committed(spec, fingerprint, self.chunk_size)
+        self.checkpoint.start(spec, fingerprint, self.chunk_size)
+        report = self._load_rows(spec, read_seed_file(spec.path), done, checkpointed=True)
+        self.checkpoint.finish(spec)
+        return report
+
+    def load_rows(self, table: str, rows: Iterable[Dict[str, Any]], natural_key: str,
+                  references: Optional[Dict[str, Dict[str, str]]] = None) -> LoadReport:
+        """Load rows built in code (no checkpoint; reruns are still idempotent)"""
+        spec = SeedSpec(table=table, path=Path(f"<{table}>"), natural_key=natural_key,
+                        references=references or {})
+        return self._load_rows(spec, rows, set(), checkpointed=False)
+
+    # --- internals ---
+
+    def _load_rows(self, spec: SeedSpec, rows: Iterable[Dict[str, Any]], done: set,
+                   checkpointed: bool) -> LoadReport:
+        report = LoadReport(table=spec.table)
+        mode = {"name": "upsert", "existing_keys": None}
+        mode_lock = threading.Lock()
+        start = time.perf_counter()
+
+        def run_chunk(index: int, chunk: List[Dict[str, Any]]) -> int:
+            written = self._write_with_retry(spec, index, chunk, mode, mode_lock)
+            if checkpointed:
+                self.checkpoint.commit_chunk(spec, index)
+            return written
+
+        failure: Optional[BulkLoadError] = None
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = {}
+            for index, chunk in enumerate(self._chunks(rows)):
+                if index in done:
+                    report.resumed_chunks += 1
+                    continue
+                chunk, skipped = self._resolve_references(spec, chunk)
+                report.skipped_rows += skipped
+                # Bound the number of chunks held in memory
+                while len(in_flight) >= self.workers * 2:
+                    failure = self._collect(in_flight, report) or failure
+                if failure:
+                    break
+                in_flight[pool.submit(run_chunk, index, chunk)] = index
+            while in_flight:
+                failure = self._collect(in_flight, report) or failure
+
+        report.elapsed = time.perf_counter() - start
+        report.mode = mode["name"]
+        if failure:
+            print(f"❌ {spec.table}: stopped at chunk {failure.chunk_index} - "
+                  f"rerun to resume from the last committed chunk")
+            raise failure
+        return report
+
+    def _collect(self, in_flight: Dict, report: LoadReport) -> Optional[BulkLoadError]:
+        finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        failure = None
+        for future in finished:
+            in_flight.pop(future)
+            try:
+                report.rows += future.result()
+                report.chunks += 1
+            except BulkLoadError as e:
+                failure = failure or e
+        return failure
+
+    def _chunks(self, rows: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _write_with_retry(self, spec: SeedSpec, index: int, chunk: List[Dict[str, Any]], mode: Dict,
+                          mode_lock: threading.Lock) -> int:
+        # Postgres rejects an upsert that touches the same key twice, so keep the last row per key
+        chunk = list({tuple(row.get(c) for c in spec.key_columns): row for row in chunk}.values())
+        last_error = None
+        for attempt in range(self.max_attempts):
+            try:
+                if mode["name"] == "upsert":
+                    try:
+                        self.client.table(spec.table).upsert(
+                            chunk, on_conflict=spec.natural_key, returning="minimal"
+                        ).execute()
+                        return len(chunk)
+                    except Exception as e:
+                        if not _is_missing_constraint(e):
+                            raise
+                        with mode_lock:
+                            if mode["name"] == "upsert":
+                                print(f"ℹ️ {spec.table}: no unique constraint on ({spec.natural_key}), "
+                                      f"inserting missing keys only")
+                                mode["existing_keys"] = self._existing_keys(spec)
+                                mode["name"] = "insert-missing"
+                return self._insert_missing(spec, chunk, mode, mode_lock)
+            except Exception as e:
+                last_error = e
+                if attempt + 1 < self.max_attempts:
+                    time.sleep(random.uniform(0, self.base_backoff * (2 ** attempt)))
+        raise BulkLoadError(spec.table, index, last_error)
+
+    def _insert_missing(self, spec: SeedSpec, chunk: List[Dict[str, Any]], mode: Dict,
+                        mode_lock: threading.Lock) -> int:
+        with mode_lock:
+            existing = mode["existing_keys"]
+            missing = []
+            for row in chunk:
+                key = tuple(row.get(column) for column in spec.key_columns)
+                if key not in existing:
+                    existing.add(key)  # claim the key so concurrent chunks skip duplicates
+                    missing.append(row)
+        if missing:
+            try:
+                self.client.table(spec.table).insert(missing, returning="minimal").execute()
+            except Exception:
+                with mode_lock:
+                    for row in missing:
+                        existing.discard(tuple(row.get(column) for column in spec.key_columns))
+                raise
+        return len(missing)
+
+    def _existing_keys(self, spec: SeedSpec) -> set:
+        from src.api_integration.supabase.supabase_service import SupabaseService
+        service = SupabaseService(client=self.client)
+        return {
+            tuple(row.get(column) for column in spec.key_columns)
+            for row in service.iter_rows(spec.table, columns=", ".join(spec.key_columns))
+        }
+
+    def _resolve_references(self, spec: SeedSpec, chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        if not spec.references:
+            return chunk, 0
+        resolved, skipped = [], 0
+        for row in chunk:
+            row = dict(row)
+            for source, ref in spec.references.items():
+                lookup = self._reference_map(ref["table"], ref["column"])
+                target_id = lookup.get(row.pop(source, None))
+                if target_id is None:
+                    break
+                row[ref["target"]] = target_id
+            else:
+                resolved.append(row)
+                continue
+            skipped += 1
+        if skipped:
+            print(f"⚠️ {spec.table}: skipped {skipped} rows with unknown references")
+        return resolved, skipped
+
+    def _reference_map(self, table: str, column: str) -> Dict[Any, Any]:
+        cache_key = (table, column)
+        if cache_key not in self._reference_cache:
+            from src.api_integration.supabase.supabase_service import SupabaseService
+            service = SupabaseService(client=self.client)
+            self._reference_cache[cache_key] = {
+                row[column]: row["id"] for row in service.iter_rows(table, columns=f"id, {column}")
+            }
+        return self._reference_cache[cache_key]
+
+
+def _is_missing_constraint(error: Exception) -> bool:
+    """PostgREST/Postgres error 42P10: ON CONFLICT target has no matching constraint"""
+    text = str(error)
+    return "42P10" in text or "no unique or exclusion constraint" in text
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Bulk-load seed data into Supabase")
+    parser.add_argument("manifest", nargs="?", default=str(SEEDS_DIR / "compatible" / "manifest.json"))
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and reload everything")
+    args = parser.parse_args()
+
+    from src.api_integration.supabase.client_factory import get_supabase_client
+    client = get_supabase_client()
+    if client is None:
+        print("❌ Error: SUPABASE_URL and SUPABASE_KEY must be set in .env file")
+        sys.exit(1)
+
+    loader = BulkLoader(client, chunk_size=args.chunk_size, workers=args.workers,
+                        checkpoint_path=args.checkpoint)
+    if args.restart:
+        loader.checkpoint.reset()
+    try:
+        loader.load_manifest(Path(args.manifest))
+    except BulkLoadError as e:
+        print(f"❌ Load failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 # Load environment
@@ -42,11 +42,11 @@ def check_database_status():
         return False
     
     try:
-        from supabase import create_client
-        supabase = create_client(supabase_url, supabase_key)
+        from src.api_integration.supabase.client_factory import get_supabase_client
+        supabase = get_supabase_client(supabase_url, supabase_key)
         
-        # Test connection
-        result = supabase.table("destinations").select("count", count="exact").execute()
+        # Test connection (count-only: no rows are transferred)
+        supabase.table("destinations").select("*", count="exact", head=True).execute()
         print("   ✅ Supabase connection successful")
         
         # Check tables
@@ -57,16 +57,19 @@ def check_database_status():
             "restaurants", "bookings", "travel_bookings"
         ]
         
+        from src.database.schema_snapshot import SchemaIntrospector
+        snapshot = SchemaIntrospector(supabase, cache_path=None, include_columns=False).snapshot(essential_tables)
+        
         table_status = {}
         for table in essential_tables:
-            try:
-                result = supabase.table(table).select("count", count="exact").execute()
-                count = result.count if hasattr(result, 'count') else 0
-                table_status[table] = count
-                print(f"   ✅ {table}: {count} records")
-            except Exception as e:
+            info = snapshot.tables[table]
+            if info.exists is True:
+                table_status[table] = info.record_count
+                print(f"   ✅ {table}: {info.record_count} records")
+            else:
                 table_status[table] = "ERROR"
-                print(f"   ❌ {table}: {str(e)[:50]}...")
+                print(f"   ❌ {table}: {(info.error or '')[:50]}...")
+        print(f"   ⏱️ Checked {len(essential_tables)} tables in {snapshot.elapsed:.2f}s")
         
         # Check platform integration
         print("\n🚀 Platform Integration:")
@@ -5,7 +5,15 @@ Comprehensive tool to inspect the actual database schema in Supabase
 
 import os
 from dotenv import load_dotenv
-from supabase import create_client, Client
+import sys
+from pathlib import Path
+from supabase import Client
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_integration.supabase.client_factory import get_supabase_client
+from src.database.schema_snapshot import SchemaIntrospector, KNOWN_TABLES
 
 # Load environment
 load_dotenv()
@@ -18,98 +26,72 @@ if not supabase_url or not supabase_key:
     print("❌ Error: SUPABASE_URL and SUPABASE_KEY must be set in .env file")
     exit(1)
 
-supabase: Client = create_client(supabase_url, supabase_key)
+supabase: Client = get_supabase_client(supabase_url, supabase_key)
 
 class DatabaseSchemaInspector:
     """Inspect actual database schema"""
     
-    def __init__(self):
+    def __init__(self, refresh=False):
         self.supabase = supabase
+        self.introspector = SchemaIntrospector(supabase)
+        self.refresh = refresh
     
     def get_table_structure(self, table_name):
         """Get the actual structure of a table"""
-        try:
-            # Get a sample record to see the structure
-            result = self.supabase.table(table_name).select("*").limit(1).execute()
-            
-            if result.data and len(result.data) > 0:
-                sample_record = result.data[0]
-                return list(sample_record.keys())
-            else:
-                print(f"   ℹ️ {table_name} table exists but has no data to inspect structure")
-                return []
-                
-        except Exception as e:
-            print(f"   ❌ Error inspecting {table_name}: {e}")
+        info = self.introspector.snapshot([table_name], refresh=self.refresh).tables[table_name]
+        if info.exists is not True:
+            print(f"   ❌ Error inspecting {table_name}: {info.error}")
             return None
+        if not info.columns:
+            print(f"   ℹ️ {table_name} table exists but has no data to inspect structure")
+        return info.columns
     
     def inspect_all_tables(self):
         """Inspect all tables in the database"""
         print("🗃️ DATABASE SCHEMA INSPECTION")
         print("="*80)
         
-        # Known tables to check
-        tables_to_check = [
-            "destinations", "attractions", "hotels", "restaurants", 
-            "user_profiles", "users", "airlines", "flights", 
-            "car_rentals", "car_rental_companies", "activities",
-            "cultural_insights", "seasonal_data", "travel_bookings",
-            "price_tracking"
-        ]
+        # Every table is checked at once with count-only requests; the result is cached
+        snapshot = self.introspector.snapshot(KNOWN_TABLES, refresh=self.refresh)
+        print(f"⏱️ Snapshot {snapshot.fingerprint} taken {snapshot.taken_at} ({snapshot.elapsed:.2f}s)")
         
         existing_tables = {}
         
-        for table_name in tables_to_check:
+        for table_name in KNOWN_TABLES:
+            info = snapshot.tables[table_name]
             print(f"\n📋 TABLE: {table_name}")
             print("-" * 40)
             
-            try:
-                # Check if table exists by trying to count records
-                result = self.supabase.table(table_name).select("*", count="exact").execute()
-                count = result.count if hasattr(result, 'count') else len(result.data)
-                
-                print(f"✅ Exists | Records: {count}")
-                
-                # Get structure
-                columns = self.get_table_structure(table_name)
-                if columns:
-                    print(f"📝 Columns ({len(columns)}):")
-                    for i, column in enumerate(columns, 1):
+            if info.exists is True:
+                print(f"✅ Exists | Records: {info.record_count}")
+                if info.columns:
+                    print(f"📝 Columns ({len(info.columns)}):")
+                    for i, column in enumerate(info.columns, 1):
                         print(f"   {i:2d}. {column}")
-                    existing_tables[table_name] = {
-                        "exists": True,
-                        "record_count": count,
-                        "columns": columns
-                    }
-                else:
-                    existing_tables[table_name] = {
-                        "exists": True,
-                        "record_count": count,
-                        "columns": []
-                    }
-                
-                # Show sample data if exists
-                if count > 0 and count < 100:  # Only for small tables
-                    sample_result = self.supabase.table(table_name).select("*").limit(2).execute()
-                    if sample_result.data:
-                        print(f"📊 Sample Data:")
-                        for i, record in enumerate(sample_result.data, 1):
-                            print(f"   Record {i}:")
-                            for key, value in record.items():
-                                value_str = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-                                print(f"     {key}: {value_str}")
-                
-            except Exception as e:
-                error_msg = str(e)
-                if "does not exist" in error_msg:
-                    print("❌ Does not exist")
-                    existing_tables[table_name] = {"exists": False, "error": error_msg}
-                else:
-                    print(f"⚠️ Error: {error_msg}")
-                    existing_tables[table_name] = {"exists": "unknown", "error": error_msg}
+                existing_tables[table_name] = {
+                    "exists": True,
+                    "record_count": info.record_count,
+                    "columns": info.columns
+                }
+            elif info.exists is False:
+                print("❌ Does not exist")
+                existing_tables[table_name] = {"exists": False, "error": info.error}
+            else:
+                print(f"⚠️ Error: {info.error}")
+                existing_tables[table_name] = {"exists": "unknown", "error": info.error}
         
         return existing_tables
     
+    def show_sample_data(self, table_name, limit=2):
+        """Print a couple of rows from one table"""
+        result = self.supabase.table(table_name).select("*").limit(limit).execute()
+        print(f"📊 Sample Data ({table_name}):")
+        for i, record in enumerate(result.data or [], 1):
+            print(f"   Record {i}:")
+            for key, value in record.items():
+                value_str = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
+                print(f"     {key}: {value_str}")
+    
     def show_schema_summary(self, tables_info):
         """Show a summary of the database schema"""
         print("\n" + "="*80)
@@ -170,8 +152,11 @@ class DatabaseSchemaInspector:
 
 def main():
     """Main execution function"""
-    inspector = DatabaseSchemaInspector()
+    inspector = DatabaseSchemaInspector(refresh="--refresh" in sys.argv)
     inspector.run_complete_inspection()
+    for table_name in sys.argv[1:]:
+        if not table_name.startswith("--"):
+            inspector.show_sample_data(table_name)
 
 if __name__ == "__main__":
     main()
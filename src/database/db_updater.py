@@ -4,7 +4,14 @@ Script to update Supabase database with missing tables and columns for enhanced
 """
 
 import os
-from supabase import create_client, Client
+import sys
+from pathlib import Path
+from supabase import Client
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_integration.supabase.client_factory import get_supabase_client
 from dotenv import load_dotenv
 
 # Load environment
@@ -18,7 +25,7 @@ if not supabase_url or not supabase_key:
     print("❌ Error: SUPABASE_URL and SUPABASE_KEY must be set in .env file")
     exit(1)
 
-supabase: Client = create_client(supabase_url, supabase_key)
+supabase: Client = get_supabase_client(supabase_url, supabase_key)
 
 class DatabaseSchemaUpdater:
     """Updates database schema to support enhanced AI features"""
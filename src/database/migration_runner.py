@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+🏗️ Migration Runner - AI Travel Platform
+Versioned, batched schema migrations over the exec_sql RPC
+
+Each migration is a .sql file. Its statements are split with a parser that
+understands comments, quoted strings and $$-quoted function bodies, then sent
+in a few large batches. One exec_sql call runs inside a single transaction, so
+every batch applies completely or not at all. Plain (non-unique) index builds
+are independent of each other, so they are moved out of the batches and run in
+parallel once the tables exist.
+
+Applied migrations are recorded in the schema_migrations table with a checksum.
+Only new migrations run; a migration whose file changed after it was applied
+is reported and skipped.
+
+Usage:
+    python src/database/migration_runner.py            # apply pending migrations
+    python src/database/migration_runner.py --dry-run  # show the plan only
+"""
+
+import re
+import sys
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Callable
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+SCHEMA_FILE = Path(__file__).parent / "schemas" / "enhanced_database_schema.sql"
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+BASELINE_VERSION = "0001_enhanced_database_schema"
+
+VERSION_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(255) PRIMARY KEY,
+    checksum VARCHAR(64) NOT NULL,
+    statements INTEGER,
+    duration_ms INTEGER,
+    applied_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+NOTIFY pgrst, 'reload schema'
+"""
+
+# PostgREST's "not in the schema cache" code and Postgres's undefined_table
+_TABLE_NOT_FOUND = re.compile(r"PGRST205|42P01|does not exist|could not find the table", re.IGNORECASE)
+_PLAIN_INDEX = re.compile(r"^\s*CREATE\s+INDEX\s+(?!CONCURRENTLY)", re.IGNORECASE)
+_DOLLAR_TAG = re.compile(r"\$[A-Za-z_][A-Za-z0-9_]*\$|\$\$")
+
+
+def split_sql_statements(sql: str) -> List[str]:
+    """
+    Split a SQL script on top-level semicolons
+
+    Semicolons inside comments, 'strings', "identifiers" and $tag$ ... $tag$
+    bodies (plpgsql functions, DO blocks) do not end a statement. Comments are
+    dropped from the output.
+    """
+    statements: List[str] = []
+    current: List[str] = []
+    i, length = 0, len(sql)
+    while i < length:
+        char = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = length if end == -1 else end
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+        elif char in ("'", '"'):
+            # '' and "" are escaped quotes, so scanning to the next quote pair works
+            end = i + 1
+            while end < length:
+                if sql[end] == char:
+                    if end + 1 < length and sql[end + 1] == char:
+                        end += 2
+                        continue
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+        elif char == "$" and _DOLLAR_TAG.match(sql, i):
+            tag = _DOLLAR_TAG.match(sql, i).group(0)
+            end = sql.find(tag, i + len(tag))
+            end = length if end == -1 else end + len(tag)
+            current.append(sql[i:end])
+            i = end
+        elif char == ";":
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            i += 1
+        else:
+            current.append(char)
+            i += 1
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+@dataclass
+class Migration:
+    """One versioned SQL file"""
+    version: str
+    path: Path
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.path.read_bytes()).hexdigest()
+
+
+@dataclass
+class MigrationPlan:
+    """Statements of one migration grouped for execution"""
+    migration: Migration
+    batches: List[List[str]]
+    index_builds: List[str]
+
+    @property
+    def statement_count(self) -> int:
+        return sum(len(batch) for batch in self.batches) + len(self.index_builds)
+
+
+@dataclass
+class MigrationResult:
+    """Outcome and timing of one migration"""
+    version: str
+    status: str  # applied, skipped, changed, failed
+    statements: int = 0
+    round_trips: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        text = (f"{self.version}: {self.status} - {self.statements} statements in "
+                f"{self.round_trips} round-trips, {self.duration:.2f}s")
+        if self.timings:
+            text += " (" + ", ".join(f"{k} {v:.2f}s" for k, v in self.timings.items()) + ")"
+        if self.error:
+            text += f" - {self.error}"
+        return text
+
+
+def discover_migrations(schema_file: Path = SCHEMA_FILE, migrations_dir: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """The baseline schema followed by migrations/NNNN_name.sql in version order"""
+    migrations = [Migration(BASELINE_VERSION, schema_file)]
+    if migrations_dir.exists():
+        migrations.extend(Migration(path.stem, path) for path in sorted(migrations_dir.glob("*.sql")))
+    return migrations
+
+
+class MigrationRunner:
+    """Apply pending migrations in transactional batches with parallel index builds"""
+
+    def __init__(self, client, batch_size: int = 200, index_workers: int = 4,
+                 sql_param: str = "sql", log: Optional[Callable[[str, str], None]] = None):
+        self.client = client
+        self.batch_size = batch_size
+        self.index_workers = index_workers
+        self.sql_param = sql_param  # argument name of exec_sql(sql text)
+        self.log = log or (lambda message, level="INFO": print(message))
+        self._version_table_ensured = False
+
+    # === PLANNING ===
+
+    def plan(self, migration: Migration) -> MigrationPlan:
+        """Split a migration into ordered batches plus independent index builds"""
+        ordered, index_builds = [], []
+        for statement in split_sql_statements(migration.sql):
+            (index_builds if _PLAIN_INDEX.match(statement) else ordered).append(statement)
+        batches = [ordered[i:i + self.batch_size] for i in range(0, len(ordered), self.batch_size)]
+        return MigrationPlan(migration, batches, index_builds)
+
+    # === EXECUTION ===
+
+    def _exec(self, statements: List[str]):
+        self.client.rpc("exec_sql", {self.sql_param: ";\n".join(statements)}).execute()
+
+    def ensure_version_table(self):
+        self._exec(split_sql_statements(VERSION_TABLE_SQL))
+        self._version_table_ensured = True
+
+    def applied_versions(self) -> Dict[str, str]:
+        """version -> checksum of every recorded migration"""
+        try:
+            result = self.client.table("schema_migrations").select("version, checksum").execute()
+            return {row["version"]: row["checksum"] for row in result.data or []}
+        except Exception as e:
+            # Right after ensure_version_table creates the table the API schema cache may not list it
+            # yet, which on a fresh database means nothing has been applied. Any other error (auth,
+            # network, a missing table we never created) must not be mistaken for an empty history.
+            if self._version_table_ensured and _TABLE_NOT_FOUND.search(str(e)):
+                return {}
+            raise
+
+    def apply(self, plan: MigrationPlan) -> MigrationResult:
+        migration = plan.migration
+        result = MigrationResult(migration.version, "applied", statements=plan.statement_count)
+        start = time.perf_counter()
+        try:
+            batch_start = time.perf_counter()
+            for batch_number, batch in enumerate(plan.batches, 1):
+                self._exec(batch)
+                result.round_trips += 1
+                self.log(f"📊 {migration.version}: batch {batch_number}/{len(plan.batches)} "
+                         f"({len(batch)} statements) committed", "INFO")
+            result.timings["batches"] = time.perf_counter() - batch_start
+
+            if plan.index_builds:
+                index_start = time.perf_counter()
+                groups = [plan.index_builds[i::self.index_workers] for i in range(self.index_workers)]
+                groups = [group for group in groups if group]
+                with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                    list(pool.map(self._exec, groups))
+                result.round_trips += len(groups)
+                result.timings["indexes"] = time.perf_counter() - index_start
+
+            result.duration = time.perf_counter() - start
+            self._exec([
+                "INSERT INTO schema_migrations (version, checksum, statements, duration_ms) VALUES "
+                f"('{migration.version}', '{migration.checksum}', {plan.statement_count}, "
+                f"{int(result.duration * 1000)}) ON CONFLICT (version) DO UPDATE SET "
+                "checksum = EXCLUDED.checksum, statements = EXCLUDED.statements, "
+                "duration_ms = EXCLUDED.duration_ms, applied_at = NOW()"
+            ])
+            result.round_trips += 1
+        except Exception as e:
+            result.status = "failed"
+            result.error = str(e)[:200]
+        result.duration = time.perf_counter() - start
+        return result
+
+    def run(self, migrations: Optional[List[Migration]] = None) -> List[MigrationResult]:
+        """Apply every pending migration in order; stop at the first failure"""
+        migrations = migrations if migrations is not None else discover_migrations()
+        self.ensure_version_table()
+        applied = self.applied_versions()
+
+        results = []
+        for migration in migrations:
+            if migration.version in applied:
+                status = "skipped" if applied[migration.version] == migration.checksum else "changed"
+                results.append(MigrationResult(migration.version, status))
+                if status == "changed":
+                    self.log(f"⚠️ {migration.version} changed after it was applied - add a new "
+                             f"migration instead of editing it", "WARNING")
+                continue
+
+            result = self.apply(self.plan(migration))
+            results.append(result)
+            self.log(f"{'✅' if result.status == 'applied' else '❌'} {result}",
+                     "INFO" if result.status == "applied" else "ERROR")
+            if result.status == "failed":
+                break
+        return results
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Apply pending database migrations")
+    parser.add_argument("--dry-run", action="store_true", help="print the execution plan only")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--index-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.dry_run:
+        runner = MigrationRunner(None, batch_size=args.batch_size, index_workers=args.index_workers)
+        for migration in discover_migrations():
+            plan = runner.plan(migration)
+            index_rpcs = min(len(plan.index_builds), args.index_workers)
+            print(f"📋 {migration.version}: {plan.statement_count} statements -> "
+                  f"{len(plan.batches)} batches + {len(plan.index_builds)} index builds "
+                  f"in {index_rpcs} parallel RPCs")
+        return
+
+    from src.api_integration.supabase.client_factory import get_supabase_client
+    client = get_supabase_client()
+    if client is None:
+        print("❌ Error: SUPABASE_URL and SUPABASE_KEY must be set in .env file")
+        sys.exit(1)
+
+    results = MigrationRunner(client, args.batch_size, args.index_workers).run()
+    if any(result.status == "failed" for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+-- Keyset pagination for booking history: WHERE user_id = ? AND (created_at, id) < (?, ?)
+-- ORDER BY created_at DESC, id DESC is one range scan of this index
+CREATE INDEX IF NOT EXISTS idx_bookings_user_created ON bookings(user_id, created_at DESC, id DESC);
@@ -0,0 +1,54 @@
+-- Per-item, per-day capacity for src/booking_system/inventory.py
+CREATE TABLE IF NOT EXISTS inventory_calendar (
+    item_type VARCHAR(50) NOT NULL, -- hotel, flight, restaurant, car_rental, package
+    item_id VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    capacity INTEGER NOT NULL CHECK (capacity >= 0),
+    remaining INTEGER NOT NULL CHECK (remaining >= 0 AND remaining <= capacity),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (item_type, item_id, day)
+);
+
+-- Take p_quantity units on every tracked day of [p_start, p_end), or none at all.
+-- Rows are locked in day order so concurrent holds on overlapping ranges cannot deadlock.
+CREATE OR REPLACE FUNCTION hold_inventory(p_item_type VARCHAR, p_item_id VARCHAR, p_start DATE, p_end DATE,
+                                          p_quantity INTEGER)
+RETURNS BOOLEAN AS $$
+DECLARE
+    tracked INTEGER;
+    updated INTEGER;
+BEGIN
+    PERFORM 1 FROM inventory_calendar
+    WHERE item_type = p_item_type AND item_id = p_item_id AND day >= p_start AND day < p_end
+    ORDER BY day FOR UPDATE;
+    GET DIAGNOSTICS tracked = ROW_COUNT;
+
+    BEGIN
+        UPDATE inventory_calendar
+        SET remaining = remaining - p_quantity, updated_at = NOW()
+        WHERE item_type = p_item_type AND item_id = p_item_id AND day >= p_start AND day < p_end
+          AND remaining >= p_quantity;
+        GET DIAGNOSTICS updated = ROW_COUNT;
+
+        IF updated <> tracked THEN
+            RAISE EXCEPTION 'insufficient inventory';
+        END IF;
+    EXCEPTION WHEN raise_exception THEN
+        RETURN FALSE; -- the block's savepoint undoes the partial decrement
+    END;
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Give back units taken by hold_inventory (never above capacity)
+CREATE OR REPLACE FUNCTION release_inventory(p_item_type VARCHAR, p_item_id VARCHAR, p_start DATE, p_end DATE,
+                                             p_quantity INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    UPDATE inventory_calendar
+    SET remaining = LEAST(capacity, remaining + p_quantity), updated_at = NOW()
+    WHERE item_type = p_item_type AND item_id = p_item_id AND day >= p_start AND day < p_end;
+END;
+$$ LANGUAGE plpgsql;
+
+NOTIFY pgrst, 'reload schema';
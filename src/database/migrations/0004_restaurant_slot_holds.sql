@@ -0,0 +1,51 @@
+-- Table holds for src/booking_system/restaurant_slots.py (buckets are 30-minute slots of the day)
+CREATE TABLE IF NOT EXISTS restaurant_slot_holds (
+    id UUID PRIMARY KEY,
+    restaurant_id VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    table_size INTEGER NOT NULL,
+    start_bucket INTEGER NOT NULL,
+    end_bucket INTEGER NOT NULL,
+    party_size INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'held', -- held, confirmed, released, expired
+    expires_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_slot_holds_active ON restaurant_slot_holds(restaurant_id, day, table_size)
+    WHERE status IN ('held', 'confirmed');
+CREATE INDEX IF NOT EXISTS idx_slot_holds_day ON restaurant_slot_holds(day);
+
+-- Insert a hold unless every p_table_size table is already held in some bucket of the sitting.
+-- Holds for one restaurant and day are serialized with a transaction-scoped advisory lock.
+CREATE OR REPLACE FUNCTION hold_restaurant_slot(p_hold_id UUID, p_restaurant_id VARCHAR, p_day DATE,
+                                                p_table_size INTEGER, p_start_bucket INTEGER, p_end_bucket INTEGER,
+                                                p_party_size INTEGER, p_tables INTEGER, p_expires_at TIMESTAMPTZ)
+RETURNS BOOLEAN AS $$
+DECLARE
+    busiest INTEGER;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext(p_restaurant_id || ':' || p_day::TEXT));
+
+    SELECT COALESCE(MAX(held), 0) INTO busiest FROM (
+        SELECT COUNT(h.id) AS held
+        FROM generate_series(p_start_bucket, p_end_bucket - 1) AS bucket
+        JOIN restaurant_slot_holds h
+          ON h.restaurant_id = p_restaurant_id AND h.day = p_day AND h.table_size = p_table_size
+         AND h.status IN ('held', 'confirmed') AND h.start_bucket <= bucket AND h.end_bucket > bucket
+        GROUP BY bucket
+    ) AS per_bucket;
+
+    IF busiest >= p_tables THEN
+        RETURN FALSE;
+    END IF;
+
+    INSERT INTO restaurant_slot_holds (id, restaurant_id, day, table_size, start_bucket, end_bucket,
+                                       party_size, expires_at)
+    VALUES (p_hold_id, p_restaurant_id, p_day, p_table_size, p_start_bucket, p_end_bucket,
+            p_party_size, p_expires_at);
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+NOTIFY pgrst, 'reload schema';
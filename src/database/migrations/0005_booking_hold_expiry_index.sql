@@ -0,0 +1,3 @@
+-- Pending-hold expiry: WHERE status = 'pending' AND (expires_at, id) > (?, ?) ORDER BY expires_at, id
+-- is one range scan of this index, however many settled bookings the table holds
+CREATE INDEX IF NOT EXISTS idx_bookings_status_expires ON bookings(status, expires_at, id);
@@ -0,0 +1,13 @@
+-- Per-booking payment step state for src/booking_system/payment_pipeline.py
+-- A retried payment reuses finished steps (and their Stripe ids) instead of starting over
+CREATE TABLE IF NOT EXISTS payment_steps (
+    booking_id UUID NOT NULL REFERENCES bookings(id) ON DELETE CASCADE,
+    step VARCHAR(30) NOT NULL, -- customer, payment_intent, confirm
+    status VARCHAR(20) NOT NULL, -- done, retrying, failed
+    idempotency_key VARCHAR(255) NOT NULL,
+    result JSONB DEFAULT '{}',
+    attempts INTEGER DEFAULT 0,
+    last_error TEXT,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (booking_id, step)
+);
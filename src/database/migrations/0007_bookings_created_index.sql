@@ -0,0 +1,3 @@
+-- Payment reconciliation streams every booking created in a range:
+-- WHERE created_at >= ? AND created_at < ? AND (created_at, id) > (?, ?) ORDER BY created_at, id
+CREATE INDEX IF NOT EXISTS idx_bookings_created ON bookings(created_at, id);
@@ -0,0 +1,7 @@
+-- Mass cancellations select the confirmed bookings on one item or destination, keyset on id:
+-- WHERE status IN (?) AND booking_type = ? AND item_id = ? AND id > ? ORDER BY id
+-- WHERE status IN (?) AND details->>'destination' = ? AND id > ? ORDER BY id
+-- (payment intents for a page come from payment_steps by primary key)
+CREATE INDEX IF NOT EXISTS idx_bookings_item_status ON bookings(item_id, booking_type, status, id);
+CREATE INDEX IF NOT EXISTS idx_bookings_destination_status ON bookings((details->>'destination'), status, id);
+
@@ -0,0 +1,37 @@
+-- Slot holds left behind by a crashed session or an abandoned page must not block a table forever:
+-- a 'held' row only counts until expires_at, and the RPC marks the lapsed ones it sees as expired.
+CREATE OR REPLACE FUNCTION hold_restaurant_slot(p_hold_id UUID, p_restaurant_id VARCHAR, p_day DATE,
+                                                p_table_size INTEGER, p_start_bucket INTEGER, p_end_bucket INTEGER,
+                                                p_party_size INTEGER, p_tables INTEGER, p_expires_at TIMESTAMPTZ)
+RETURNS BOOLEAN AS $$
+DECLARE
+    busiest INTEGER;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext(p_restaurant_id || ':' || p_day::TEXT));
+
+    UPDATE restaurant_slot_holds SET status = 'expired'
+    WHERE restaurant_id = p_restaurant_id AND day = p_day AND status = 'held' AND expires_at <= NOW();
+
+    SELECT COALESCE(MAX(held), 0) INTO busiest FROM (
+        SELECT COUNT(h.id) AS held
+        FROM generate_series(p_start_bucket, p_end_bucket - 1) AS bucket
+        JOIN restaurant_slot_holds h
+          ON h.restaurant_id = p_restaurant_id AND h.day = p_day AND h.table_size = p_table_size
+         AND h.status IN ('held', 'confirmed') AND (h.status = 'confirmed' OR h.expires_at > NOW())
+         AND h.start_bucket <= bucket AND h.end_bucket > bucket
+        GROUP BY bucket
+    ) AS per_bucket;
+
+    IF busiest >= p_tables THEN
+        RETURN FALSE;
+    END IF;
+
+    INSERT INTO restaurant_slot_holds (id, restaurant_id, day, table_size, start_bucket, end_bucket,
+                                       party_size, expires_at)
+    VALUES (p_hold_id, p_restaurant_id, p_day, p_table_size, p_start_bucket, p_end_bucket,
+            p_party_size, p_expires_at);
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+NOTIFY pgrst, 'reload schema';
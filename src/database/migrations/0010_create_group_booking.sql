@@ -0,0 +1,13 @@
+-- A group and its leader's membership are created in one transaction, so a failure between the two
+-- inserts can no longer leave a group counting a participant it has no member row for
+CREATE OR REPLACE FUNCTION create_group_booking(p_group_id VARCHAR, p_leader_id VARCHAR, p_destination VARCHAR,
+                                                p_start_date DATE, p_end_date DATE, p_max_participants INTEGER)
+RETURNS TEXT AS $$
+BEGIN
+    INSERT INTO group_bookings (group_id, leader_id, destination, start_date, end_date,
+                                max_participants, participant_count, status)
+    VALUES (p_group_id, p_leader_id, p_destination, p_start_date, p_end_date, p_max_participants, 1, 'open');
+    INSERT INTO group_booking_members (group_id, user_id) VALUES (p_group_id, p_leader_id);
+    RETURN p_group_id;
+END;
+$$ LANGUAGE plpgsql;
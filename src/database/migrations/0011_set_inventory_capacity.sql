@@ -0,0 +1,18 @@
+-- New capacity for every day of [p_start, p_end); units already held stay held on days that
+-- were tracked, so re-running a capacity import no longer hands back sold room-nights
+CREATE OR REPLACE FUNCTION set_inventory_capacity(p_item_type VARCHAR, p_item_id VARCHAR, p_capacity INTEGER,
+                                                  p_start DATE, p_end DATE)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO inventory_calendar (item_type, item_id, day, capacity, remaining)
+    SELECT p_item_type, p_item_id, day::DATE, p_capacity, p_capacity
+    FROM generate_series(p_start, p_end - 1, INTERVAL '1 day') AS day
+    ORDER BY day
+    ON CONFLICT (item_type, item_id, day) DO UPDATE
+    SET capacity = EXCLUDED.capacity,
+        remaining = GREATEST(0, EXCLUDED.capacity - (inventory_calendar.capacity - inventory_calendar.remaining)),
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+NOTIFY pgrst, 'reload schema';
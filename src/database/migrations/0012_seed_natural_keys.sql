@@ -0,0 +1,43 @@
+-- Natural keys for the bulk seed loader's upserts: destinations by name, attractions by (destination_id, name).
+-- Databases seeded more than once can already hold duplicates, which would fail the unique index builds, so
+-- each duplicate destination is first merged into the oldest row with its name (references are repointed
+-- before it is deleted) and duplicate attractions are deleted the same way.
+DO $$
+DECLARE
+    referencing TEXT;
+    removed INTEGER;
+BEGIN
+    FOREACH referencing IN ARRAY ARRAY['hotels', 'restaurants', 'car_rentals', 'attractions', 'activities',
+                                       'travel_packages', 'cultural_insights', 'seasonal_data',
+                                       'user_travel_history']
+    LOOP
+        IF to_regclass(referencing) IS NOT NULL THEN
+            EXECUTE format(
+                'UPDATE %I t SET destination_id = d.keep_id
+                 FROM (SELECT id, FIRST_VALUE(id) OVER (PARTITION BY name ORDER BY created_at, id) AS keep_id
+                       FROM destinations) d
+                 WHERE t.destination_id = d.id AND d.id <> d.keep_id', referencing);
+        END IF;
+    END LOOP;
+
+    DELETE FROM destinations d
+    USING (SELECT id, ROW_NUMBER() OVER (PARTITION BY name ORDER BY created_at, id) AS n FROM destinations) dup
+    WHERE d.id = dup.id AND dup.n > 1;
+    GET DIAGNOSTICS removed = ROW_COUNT;
+    IF removed > 0 THEN
+        RAISE NOTICE 'Merged % duplicate destinations', removed;
+    END IF;
+
+    DELETE FROM attractions a
+    USING (SELECT id, ROW_NUMBER() OVER (PARTITION BY destination_id, name ORDER BY created_at, id) AS n
+           FROM attractions WHERE destination_id IS NOT NULL) dup
+    WHERE a.id = dup.id AND dup.n > 1;
+    GET DIAGNOSTICS removed = ROW_COUNT;
+    IF removed > 0 THEN
+        RAISE NOTICE 'Removed % duplicate attractions', removed;
+    END IF;
+END;
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_destinations_name ON destinations(name);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_attractions_destination_name ON attractions(destination_id, name);
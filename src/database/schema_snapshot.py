@@ -0,0 +1,186 @@
+"""
+🧭 Schema Snapshot - AI Travel Platform
+Concurrent, data-free schema introspection with a cached, fingerprinted snapshot
+
+Row counts come from HEAD requests with a count header, so no rows are
+downloaded. Columns come from the PostgREST OpenAPI document (one request for
+every table, including empty ones), falling back to a one-row sample per
+table when the document is not available. All tables are checked
+concurrently.
+
+The snapshot is cached in memory and on disk for a short TTL. Its fingerprint
+covers table names and columns only (not row counts), so comparing
+fingerprints tells a health check whether the schema changed.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+KNOWN_TABLES = [
+    "destinations", "attractions", "hotels", "restaurants",
+    "user_profiles", "users", "airlines", "flights",
+    "car_rentals", "car_rental_companies", "activities",
+    "cultural_insights", "seasonal_data", "travel_bookings",
+    "price_tracking", "bookings", "group_bookings", "group_booking_members"
+]
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".schema_snapshot.json"
+
+
+@dataclass
+class TableInfo:
+    """What is known about one table"""
+    exists: Any  # True, False or "unknown" when the check itself failed
+    record_count: int = 0
+    columns: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class SchemaSnapshot:
+    """Point-in-time view of the tables we care about"""
+    tables: Dict[str, TableInfo]
+    taken_at: str
+    fingerprint: str
+    elapsed: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SchemaSnapshot":
+        tables = {name: TableInfo(**info) for name, info in data["tables"].items()}
+        return cls(tables=tables, taken_at=data["taken_at"], fingerprint=data["fingerprint"],
+                   elapsed=data.get("elapsed", 0.0))
+
+
+def schema_fingerprint(tables: Dict[str, TableInfo]) -> str:
+    """Hash of table names, existence and columns; row counts are excluded"""
+    shape = {name: [info.exists, sorted(info.columns)] for name, info in sorted(tables.items())}
+    return hashlib.sha256(json.dumps(shape, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class SchemaIntrospector:
+    """Build and cache schema snapshots without pulling table data"""
+
+    def __init__(self, client, workers: int = 8, ttl: float = 300.0,
+                 cache_path: Optional[Path] = DEFAULT_CACHE_PATH, exact_counts: bool = True,
+                 include_columns: bool = True):
+        self.client = client
+        self.workers = workers
+        self.ttl = ttl
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.exact_counts = exact_counts
+        self.include_columns = include_columns  # health checks only need existence and counts
+        self._snapshot: Optional[SchemaSnapshot] = None
+        self._snapshot_at = 0.0
+        self._lock = threading.Lock()
+
+    # === SNAPSHOTS ===
+
+    def snapshot(self, tables: Optional[List[str]] = None, refresh: bool = False) -> SchemaSnapshot:
+        """Cached snapshot when fresh, otherwise introspect all tables concurrently"""
+        tables = tables or KNOWN_TABLES
+        with self._lock:
+            if not refresh:
+                cached = self._cached_snapshot()
+                if cached and set(tables) <= set(cached.tables):
+                    return cached
+
+        start = time.perf_counter()
+        columns_by_table = self._openapi_columns() if self.include_columns else {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(tables))) as pool:
+            infos = list(pool.map(lambda t: self._inspect_table(t, columns_by_table), tables))
+        table_infos = dict(zip(tables, infos))
+
+        snapshot = SchemaSnapshot(
+            tables=table_infos,
+            taken_at=datetime.now().isoformat(),
+            fingerprint=schema_fingerprint(table_infos),
+            elapsed=time.perf_counter() - start
+        )
+        with self._lock:
+            self._snapshot = snapshot
+            self._snapshot_at = time.time()
+            self._save(snapshot)
+        return snapshot
+
+    def has_changed(self, fingerprint: str) -> bool:
+        """True when the current schema differs from a previously seen fingerprint"""
+        return self.snapshot().fingerprint != fingerprint
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+            self._snapshot_at = 0.0
+            if self.cache_path and self.cache_path.exists():
+                self.cache_path.unlink()
+
+    # === INTROSPECTION ===
+
+    def _inspect_table(self, table: str, columns_by_table: Optional[Dict[str, List[str]]]) -> TableInfo:
+        try:
+            result = self.client.table(table).select(
+                "*", count="exact" if self.exact_counts else "planned", head=True
+            ).execute()
+        except Exception as e:
+            error = str(e)
+            missing = "does not exist" in error or "PGRST205" in error or "42P01" in error
+            return TableInfo(exists=False if missing else "unknown", error=error[:200])
+
+        if columns_by_table is not None and (table in columns_by_table or not self.include_columns):
+            columns = columns_by_table.get(table, [])
+        else:
+            columns = self._sample_columns(table)
+        return TableInfo(exists=True, record_count=result.count or 0, columns=columns)
+
+    def _openapi_columns(self) -> Optional[Dict[str, List[str]]]:
+        """Columns of every exposed table from one GET of the PostgREST root"""
+        try:
+            response = self.client.postgrest.session.get("/")
+            response.raise_for_status()
+            definitions = response.json().get("definitions", {})
+            return {name: list(spec.get("properties", {})) for name, spec in definitions.items()}
+        except Exception:
+            return None
+
+    def _sample_columns(self, table: str) -> List[str]:
+        try:
+            result = self.client.table(table).select("*").limit(1).execute()
+            return list(result.data[0].keys()) if result.data else []
+        except Exception:
+            return []
+
+    # === CACHE ===
+
+    def _cached_snapshot(self) -> Optional[SchemaSnapshot]:
+        now = time.time()
+        if self._snapshot and now - self._snapshot_at < self.ttl:
+            return self._snapshot
+        if self.cache_path and self.cache_path.exists():
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if now - data["saved_at"] < self.ttl:
+                    self._snapshot = SchemaSnapshot.from_dict(data["snapshot"])
+                    self._snapshot_at = data["saved_at"]
+                    return self._snapshot
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        return None
+
+    def _save(self, snapshot: SchemaSnapshot):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"saved_at": self._snapshot_at, "snapshot": snapshot.to_dict()}, f)
+        except OSError as e:
+            print(f"⚠️ Could not cache schema snapshot: {e}")
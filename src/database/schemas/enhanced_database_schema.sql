@@ -316,6 +316,30 @@ CREATE TABLE IF NOT EXISTS price_tracking (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Group bookings table
+CREATE TABLE IF NOT EXISTS group_bookings (
+    group_id VARCHAR(100) PRIMARY KEY,
+    leader_id VARCHAR(255) NOT NULL,
+    destination VARCHAR(255) NOT NULL,
+    start_date DATE,
+    end_date DATE,
+    max_participants INTEGER NOT NULL DEFAULT 10,
+    participant_count INTEGER NOT NULL DEFAULT 0,
+    status VARCHAR(20) DEFAULT 'open', -- open, closed, booked
+    preferences JSONB DEFAULT '{}',
+    group_discounts JSONB DEFAULT '{}',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    CHECK (participant_count <= max_participants)
+);
+
+-- Group membership (one row per member, so membership is a primary key lookup)
+CREATE TABLE IF NOT EXISTS group_booking_members (
+    group_id VARCHAR(100) NOT NULL REFERENCES group_bookings(group_id) ON DELETE CASCADE,
+    user_id VARCHAR(255) NOT NULL,
+    joined_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (group_id, user_id)
+);
+
 -- ===========================================
 -- INTELLIGENCE AND INSIGHTS TABLES
 -- ===========================================
@@ -412,6 +436,10 @@ CREATE INDEX IF NOT EXISTS idx_travel_bookings_booking_date ON travel_bookings(b
 CREATE INDEX IF NOT EXISTS idx_price_tracking_user_id ON price_tracking(user_id);
 CREATE INDEX IF NOT EXISTS idx_price_tracking_active ON price_tracking(is_active);
 
+-- Group booking indexes
+CREATE INDEX IF NOT EXISTS idx_group_bookings_created_at ON group_bookings(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_group_booking_members_joined ON group_booking_members(group_id, joined_at);
+
 -- ===========================================
 -- TRIGGERS FOR UPDATED_AT TIMESTAMPS
 -- ===========================================
@@ -504,6 +532,39 @@ $$ LANGUAGE plpgsql;
 -- Execute admin user creation
 SELECT create_admin_user();
 
+-- ===========================================
+-- ATOMIC BOOKING FUNCTIONS
+-- ===========================================
+
+-- Join a group: lock the group row, then check membership and capacity and insert in one transaction
+CREATE OR REPLACE FUNCTION join_group_booking(p_group_id VARCHAR, p_user_id VARCHAR)
+RETURNS TEXT AS $$
+DECLARE
+    g group_bookings%ROWTYPE;
+BEGIN
+    SELECT * INTO g FROM group_bookings WHERE group_id = p_group_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN 'not_found';
+    END IF;
+    
+    IF EXISTS (SELECT 1 FROM group_booking_members WHERE group_id = p_group_id AND user_id = p_user_id) THEN
+        RETURN 'already_member';
+    END IF;
+    
+    IF g.status <> 'open' THEN
+        RETURN 'closed';
+    END IF;
+    
+    IF g.participant_count >= g.max_participants THEN
+        RETURN 'full';
+    END IF;
+    
+    INSERT INTO group_booking_members (group_id, user_id) VALUES (p_group_id, p_user_id);
+    UPDATE group_bookings SET participant_count = participant_count + 1 WHERE group_id = p_group_id;
+    RETURN 'joined';
+END;
+$$ LANGUAGE plpgsql;
+
 -- ===========================================
 -- VIEWS FOR COMMON QUERIES
 -- ===========================================
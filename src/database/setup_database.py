@@ -17,7 +17,15 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import Client
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_integration.supabase.client_factory import get_supabase_client
+from src.api_integration.supabase.supabase_service import SupabaseService
+from src.database.migration_runner import MigrationRunner, discover_migrations
+from src.database.backup import TableBackup
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +39,7 @@ class DatabaseSetup:
         self.project_root = Path(__file__).parent.parent
         self.schema_file = self.project_root / "database" / "schemas" / "enhanced_database_schema.sql"
         self.supabase: Optional[Client] = None
+        self.last_backup_dir: Optional[Path] = None
         
         # Setup logging
         self.setup_log = []
@@ -62,7 +71,7 @@ class DatabaseSetup:
         
         # Check Supabase connection
         try:
-            self.supabase = create_client(self.supabase_url, self.supabase_key)
+            self.supabase = get_supabase_client(self.supabase_url, self.supabase_key)
             # Test connection with a simple query
             result = self.supabase.table("destinations").select("count", count="exact").execute()
             self.log("✅ Supabase connection successful")
@@ -76,75 +85,48 @@ class DatabaseSetup:
         self.log("💾 Backing up existing data...")
         
         try:
-            backup_dir = self.project_root / "database" / "backups"
-            backup_dir.mkdir(exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = backup_dir / f"backup_{timestamp}.json"
-            
-            # Get existing tables
-            existing_tables = [
-                "destinations", "attractions", "hotels", "restaurants", 
-                "user_profiles", "flights", "price_tracking", "travel_bookings"
-            ]
-            
-            backup_data = {}
-            for table in existing_tables:
-                try:
-                    result = self.supabase.table(table).select("*").execute()
-                    backup_data[table] = result.data
-                    self.log(f"✅ Backed up {len(result.data)} records from {table}")
-                except Exception as e:
-                    self.log(f"⚠️ Could not backup {table}: {e}", "WARNING")
-            
-            # Save backup
-            import json
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=2, default=str)
-            
-            self.log(f"✅ Backup saved to: {backup_file}")
+            # One gzip NDJSON file per table plus a manifest, streamed page by page
+            backup_dir = TableBackup(self.supabase, log=self.log).backup(
+                backup_root=self.project_root / "database" / "backups"
+            )
+            self.last_backup_dir = backup_dir
             return True
             
         except Exception as e:
             self.log(f"❌ Backup failed: {e}", "ERROR")
             return False
     
+    def restore_backup(self, backup_dir: Path) -> bool:
+        """Restore a backup made by backup_existing_data"""
+        self.log(f"♻️ Restoring backup from {backup_dir}...")
+        
+        try:
+            restored = TableBackup(self.supabase, log=self.log).restore(backup_dir)
+            self.log(f"✅ Restored {sum(restored.values()):,} records into {len(restored)} tables")
+            return True
+            
+        except Exception as e:
+            self.log(f"❌ Restore failed: {e}", "ERROR")
+            return False
+    
     def execute_schema(self) -> bool:
-        """Execute the database schema"""
+        """Apply pending schema migrations in transactional batches"""
         self.log("🏗️ Executing database schema...")
         
         try:
-            # Read schema file
-            with open(self.schema_file, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
+            runner = MigrationRunner(self.supabase, log=self.log)
+            migrations = discover_migrations(self.schema_file)
+            results = runner.run(migrations)
             
-            # Split into individual statements
-            statements = [stmt.strip() for stmt in schema_sql.split(';') if stmt.strip()]
-            
-            successful_statements = 0
-            failed_statements = 0
-            
-            for i, statement in enumerate(statements):
-                try:
-                    # Skip comments and empty statements
-                    if statement.startswith('--') or statement.startswith('/*') or not statement:
-                        continue
-                    
-                    # Execute statement
-                    self.supabase.postgrest.rpc("exec_sql", {"query": statement}).execute()
-                    successful_statements += 1
-                    
-                    # Log progress every 10 statements
-                    if (i + 1) % 10 == 0:
-                        self.log(f"📊 Progress: {i + 1}/{len(statements)} statements executed")
-                
-                except Exception as e:
-                    failed_statements += 1
-                    self.log(f"⚠️ Statement {i+1} failed: {str(e)[:100]}...", "WARNING")
-                    continue
+            for result in results:
+                if result.status == "skipped":
+                    self.log(f"⏭️ {result.version} already applied")
             
-            self.log(f"✅ Schema execution completed: {successful_statements} successful, {failed_statements} failed")
-            return successful_statements > 0
+            failed = [result for result in results if result.status == "failed"]
+            round_trips = sum(result.round_trips for result in results)
+            self.log(f"✅ Schema execution completed: {len(results) - len(failed)} migrations current, "
+                     f"{len(failed)} failed, {round_trips} round-trips")
+            return not failed
             
         except Exception as e:
             self.log(f"❌ Schema execution failed: {e}", "ERROR")
@@ -243,8 +225,7 @@ class DatabaseSetup:
             
             for table in essential_tables:
                 try:
-                    result = self.supabase.table(table).select("count", count="exact").execute()
-                    count = result.count if hasattr(result, 'count') else 0
+                    count = SupabaseService(client=self.supabase).count(table)
                     self.log(f"✅ Table '{table}' exists with {count} records")
                 except Exception as e:
                     self.log(f"❌ Table '{table}' verification failed: {e}", "ERROR")
@@ -12,7 +12,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 # Load environment
@@ -26,7 +26,7 @@ def test_database_functionality():
     # Test 1: Connection
     print("\n1️⃣ Testing Database Connection...")
     try:
-        from supabase import create_client
+        from src.api_integration.supabase.client_factory import get_supabase_client
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_KEY")
         
@@ -34,7 +34,7 @@ def test_database_functionality():
             print("   ❌ Supabase credentials missing")
             return False
         
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase_client(supabase_url, supabase_key)
         result = supabase.table("destinations").select("count", count="exact").execute()
         print("   ✅ Connection successful")
         
@@ -7,3 +7,8 @@ Helper functions, utilities, and shared tools
 # - Helper functions and utilities
 # - Shared tools and common functions
 # - Data processing and formatting utilities
+# - notification_outbox.py: Persistent email/SMS outbox with background delivery workers
+# - destination_catalog.py: Shared destination/city catalog with background refresh
+# - analytics_pipeline.py: Event ingestion into daily/monthly rollups with a cached figure layer
+# - booking_history.py: Keyset-paginated booking history with projected list columns and lazy details
+# - stripe_webhooks.py: Deduplicated Stripe webhook inbox with batched booking status updates and a replayer
@@ -0,0 +1,456 @@
+"""
+📊 Analytics Pipeline
+Booking and interaction events folded into incrementally maintained daily and monthly rollups
+
+Events are buffered in memory and flushed in batches: when the buffer is full,
+with the next event once the oldest one has waited flush_interval seconds, and
+at process exit. A flush first aggregates the batch in memory, then applies
+one UPSERT per (period, scope, metric, dimension) that adds the deltas to the
+existing rollup row, so the cost of a flush depends on the number of distinct
+keys touched, not on the number of events. Dashboards only ever read the
+small rollup tables.
+
+Rollups are kept for the whole platform (scope "all", daily and monthly) and
+per user (scope "user:<id>", monthly).
+
+Each (scope, metric) pair carries a version that is bumped when a flush
+touches it. Serialized Plotly figures are cached together with the versions
+of the metrics they were built from and are rebuilt only when one of those
+versions moves.
+"""
+
+import os
+import json
+import time
+import atexit
+import random
+import sqlite3
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Callable, Tuple
+
+ALL = "all"
+GRAINS = {"day": "daily_rollups", "month": "monthly_rollups"}
+
+# Metrics maintained by the pipeline
+REVENUE = "revenue"              # dimension: component (hotel, flight, restaurant, package, ...)
+BOOKINGS = "bookings"            # dimension: component
+CANCELLATIONS = "cancellations"  # dimension: component
+FUNNEL = "funnel"                # dimension: event type (search, view, booking, cancellation)
+DESTINATIONS = "destinations"    # dimension: destination, counts bookings
+SEARCHES = "searches"            # dimension: destination, counts searches
+
+# Rollups derived from the bookings table (everything else only comes from live events)
+BOOKING_METRICS = (REVENUE, BOOKINGS, CANCELLATIONS, DESTINATIONS)
+BOOKING_FUNNEL_STEPS = ("booking", "cancellation")
+PAID_STATUSES = ("paid", "refunded")
+
+
+@dataclass
+class AnalyticsEvent:
+    """One booking or interaction event"""
+    event_type: str  # search, view, booking, cancellation
+    amount: float = 0.0
+    component: Optional[str] = None
+    destination: Optional[str] = None
+    user_id: Optional[str] = None
+    occurred_at: Any = None  # datetime, ISO string or None for now
+
+
+def _event_deltas(event: AnalyticsEvent) -> List[Tuple[str, str, float]]:
+    """(metric, dimension, value) contributions of one event"""
+    component = event.component or "other"
+    deltas = [(FUNNEL, event.event_type, 1.0)]
+    if event.event_type == "booking":
+        deltas.append((REVENUE, component, float(event.amount or 0)))
+        deltas.append((BOOKINGS, component, 1.0))
+        if event.destination:
+            deltas.append((DESTINATIONS, event.destination, 1.0))
+    elif event.event_type == "cancellation":
+        deltas.append((REVENUE, component, -float(event.amount or 0)))
+        deltas.append((CANCELLATIONS, component, 1.0))
+    elif event.event_type == "search" and event.destination:
+        deltas.append((SEARCHES, event.destination, 1.0))
+    return deltas
+
+
+def _periods(occurred_at: Any) -> Tuple[str, str]:
+    if occurred_at is None:
+        occurred_at = datetime.now()
+    stamp = occurred_at.isoformat() if isinstance(occurred_at, datetime) else str(occurred_at)
+    return stamp[:10], stamp[:7]
+
+
+def recent_periods(grain: str, count: int, end: Optional[datetime] = None) -> List[str]:
+    """The last `count` day or month keys, oldest first"""
+    end = end or datetime.now()
+    if grain == "day":
+        return [(end - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(count - 1, -1, -1)]
+    year, month = end.year, end.month
+    keys = []
+    for _ in range(count):
+        keys.append(f"{year:04d}-{month:02d}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return keys[::-1]
+
+
+class AnalyticsPipeline:
+    """SQLite-backed rollup store with buffered ingestion and a figure cache"""
+
+    def __init__(self, db_path: str = "analytics_rollups.db", flush_size: int = 5000,
+                 flush_interval: float = 5.0):
+        self.db_path = db_path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval  # seconds an event may wait in the buffer
+        self._buffer: List[AnalyticsEvent] = []
+        self._buffer_started = 0.0
+        self._buffer_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._figures: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_database()
+
+    def init_database(self):
+        """Create rollup, version and figure cache tables"""
+        with self._lock:
+            for table in GRAINS.values():
+                self._conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        scope TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        period TEXT NOT NULL,
+                        dimension TEXT NOT NULL,
+                        value REAL NOT NULL DEFAULT 0,
+                        events INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (scope, metric, period, dimension)
+                    ) WITHOUT ROWID
+                """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS rollup_versions (
+                    scope TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    version INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (scope, metric)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS figure_cache (
+                    name TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    versions TEXT NOT NULL,
+                    figure TEXT NOT NULL,
+                    PRIMARY KEY (name, scope)
+                ) WITHOUT ROWID
+            """)
+
+    # === INGESTION ===
+
+    def record(self, event_type: str, amount: float = 0.0, component: Optional[str] = None,
+               destination: Optional[str] = None, user_id: Optional[str] = None,
+               occurred_at: Any = None):
+        """Buffer one event; the buffer is flushed once it reaches flush_size or flush_interval"""
+        event = AnalyticsEvent(event_type, amount, component, destination, user_id, occurred_at)
+        now = time.monotonic()
+        with self._buffer_lock:
+            if not self._buffer:
+                self._buffer_started = now
+            self._buffer.append(event)
+            due = len(self._buffer) >= self.flush_size or now - self._buffer_started >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Fold buffered events into the rollups"""
+        with self._buffer_lock:
+            events, self._buffer = self._buffer, []
+        return self.ingest(events) if events else 0
+
+    def ingest(self, events: Iterable[AnalyticsEvent], batch_size: int = 100_000) -> int:
+        """Aggregate events in memory and upsert the deltas, one transaction per batch"""
+        total = 0
+        batch: List[AnalyticsEvent] = []
+        for event in events:
+            batch.append(event)
+            if len(batch) >= batch_size:
+                total += self._apply(batch)
+                batch = []
+        if batch:
+            total += self._apply(batch)
+        return total
+
+    def _apply(self, events: List[AnalyticsEvent]) -> int:
+        daily: Dict[Tuple[str, str, str, str], List[float]] = defaultdict(lambda: [0.0, 0])
+        monthly: Dict[Tuple[str, str, str, str], List[float]] = defaultdict(lambda: [0.0, 0])
+        for event in events:
+            day, month = _periods(event.occurred_at)
+            user_scope = f"user:{event.user_id}" if event.user_id else None
+            for metric, dimension, value in _event_deltas(event):
+                cell = daily[(ALL, metric, day, dimension)]
+                cell[0] += value
+                cell[1] += 1
+                cell = monthly[(ALL, metric, month, dimension)]
+                cell[0] += value
+                cell[1] += 1
+                if user_scope:
+                    # Per-user rollups are monthly only; a daily grain per user would
+                    # grow almost as fast as the event stream itself
+                    cell = monthly[(user_scope, metric, month, dimension)]
+                    cell[0] += value
+                    cell[1] += 1
+
+        touched = {(scope, metric) for scope, metric, _, _ in monthly}
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table, cells in ((GRAINS["day"], daily), (GRAINS["month"], monthly)):
+                    self._conn.executemany(f"""
+                        INSERT INTO {table} (scope, metric, period, dimension, value, events)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (scope, metric, period, dimension) DO UPDATE SET
+                            value = value + excluded.value,
+                            events = events + excluded.events
+                    """, [(*key, cell[0], cell[1]) for key, cell in cells.items()])
+                self._conn.executemany("""
+                    INSERT INTO rollup_versions (scope, metric, version) VALUES (?, ?, 1)
+                    ON CONFLICT (scope, metric) DO UPDATE SET version = version + 1
+                """, list(touched))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(events)
+
+    def backfill_bookings(self, client, page_size: int = 1000) -> int:
+        """Rebuild the rollups from the Supabase bookings table"""
+        from src.api_integration.supabase.supabase_service import SupabaseService
+
+        service = SupabaseService(client=client)
+        rows = service.iter_rows(
+            "bookings", columns="id,booking_type,user_id,total_amount,status,payment_status,details,created_at",
+            page_size=page_size, key_column="id"
+        )
+
+        def events():
+            # Only bookings that were confirmed count, as they do live; pending, failed and expired ones never did
+            for row in rows:
+                status = row.get("status")
+                cancelled = status == "cancelled" and row.get("payment_status") in PAID_STATUSES
+                if status not in ("confirmed", "completed") and not cancelled:
+                    continue
+                details = row.get("details") or {}
+                yield AnalyticsEvent("booking", float(row.get("total_amount") or 0), row.get("booking_type"),
+                                     details.get("destination"), row.get("user_id"), row.get("created_at"))
+                if cancelled:
+                    yield AnalyticsEvent("cancellation", float(row.get("total_amount") or 0),
+                                         row.get("booking_type"), None, row.get("user_id"), row.get("created_at"))
+
+        self.reset_bookings()
+        return self.ingest(events())
+
+    def reset(self):
+        """Drop all rollups and cached figures"""
+        with self._lock:
+            for table in list(GRAINS.values()) + ["rollup_versions", "figure_cache"]:
+                self._conn.execute(f"DELETE FROM {table}")
+            self._figures.clear()
+
+    def reset_bookings(self):
+        """Drop the rollups rebuilt from the bookings table; searches and other funnel steps are kept"""
+        metrics = ",".join("?" * len(BOOKING_METRICS))
+        steps = ",".join("?" * len(BOOKING_FUNNEL_STEPS))
+        with self._lock:
+            for table in GRAINS.values():
+                self._conn.execute(f"""
+                    DELETE FROM {table}
+                    WHERE metric IN ({metrics}) OR (metric = ? AND dimension IN ({steps}))
+                """, (*BOOKING_METRICS, FUNNEL, *BOOKING_FUNNEL_STEPS))
+            self._conn.execute(f"UPDATE rollup_versions SET version = version + 1 WHERE metric IN ({metrics}, ?)",
+                               (*BOOKING_METRICS, FUNNEL))
+            self._conn.execute("DELETE FROM figure_cache")
+            self._figures.clear()
+
+    # === QUERIES ===
+
+    def series(self, metric: str, grain: str = "month", periods: int = 12,
+               scope: str = ALL) -> Dict[str, List[float]]:
+        """dimension -> values over the most recent periods (oldest first, zero filled)"""
+        keys = recent_periods(grain, periods)
+        index = {key: i for i, key in enumerate(keys)}
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT dimension, period, value FROM {GRAINS[grain]}
+                WHERE scope = ? AND metric = ? AND period >= ? AND period <= ?
+            """, (scope, metric, keys[0], keys[-1])).fetchall()
+        result: Dict[str, List[float]] = {}
+        for dimension, period, value in rows:
+            result.setdefault(dimension, [0.0] * len(keys))[index[period]] = value
+        return result
+
+    def totals(self, metric: str, grain: str = "month", since: Optional[str] = None,
+               until: Optional[str] = None, scope: str = ALL) -> Dict[str, float]:
+        """dimension -> value summed over a period range (all time when no bounds are given)"""
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT dimension, SUM(value) FROM {GRAINS[grain]}
+                WHERE scope = ? AND metric = ? AND period >= ? AND period <= ?
+                GROUP BY dimension ORDER BY SUM(value) DESC
+            """, (scope, metric, since or "", until or "9999")).fetchall()
+        return dict(rows)
+
+    def versions(self, metrics: Iterable[str], scope: str = ALL) -> str:
+        metrics = sorted(metrics)
+        with self._lock:
+            rows = dict(self._conn.execute(
+                f"SELECT metric, version FROM rollup_versions WHERE scope = ? "
+                f"AND metric IN ({','.join('?' * len(metrics))})", (scope, *metrics)
+            ).fetchall())
+        return ",".join(f"{metric}:{rows.get(metric, 0)}" for metric in metrics)
+
+    def has_data(self, scope: str = ALL) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM rollup_versions WHERE scope = ? LIMIT 1", (scope,)
+            ).fetchone() is not None
+
+    def kpis(self, scope: str = ALL) -> Dict[str, float]:
+        """Headline numbers for the current and previous month"""
+        previous, current = recent_periods("month", 2)
+        result = {}
+        for label, month in (("current", current), ("previous", previous)):
+            revenue = sum(self.totals(REVENUE, since=month, until=month, scope=scope).values())
+            bookings = sum(self.totals(BOOKINGS, since=month, until=month, scope=scope).values())
+            cancellations = sum(self.totals(CANCELLATIONS, since=month, until=month, scope=scope).values())
+            funnel = self.totals(FUNNEL, since=month, until=month, scope=scope)
+            searches = funnel.get("search", 0)
+            result[f"{label}_revenue"] = revenue
+            result[f"{label}_bookings"] = bookings
+            result[f"{label}_conversion"] = bookings / searches * 100 if searches else 0.0
+            result[f"{label}_avg_value"] = revenue / bookings if bookings else 0.0
+            result[f"{label}_cancellation_rate"] = cancellations / bookings * 100 if bookings else 0.0
+        return result
+
+    # === FIGURE CACHE ===
+
+    def figure(self, name: str, metrics: Iterable[str], build: Callable[["AnalyticsPipeline"], Any],
+               scope: str = ALL) -> Dict[str, Any]:
+        """
+        Serialized Plotly figure for a chart, rebuilt only when its rollups changed
+
+        `build` receives the pipeline and returns a Plotly figure. The JSON is
+        kept in memory and in the figure_cache table; the returned dict can be
+        passed straight to st.plotly_chart.
+        """
+        versions = self.versions(metrics, scope)
+        key = (name, scope)
+        cached = self._figures.get(key)
+        if cached and cached[0] == versions:
+            return cached[1]
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT versions, figure FROM figure_cache WHERE name = ? AND scope = ?", key
+            ).fetchone()
+        if row and row[0] == versions:
+            figure_json = row[1]
+        else:
+            figure_json = build(self).to_json()
+            with self._lock:
+                self._conn.execute("""
+                    INSERT INTO figure_cache (name, scope, versions, figure) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (name, scope) DO UPDATE SET versions = excluded.versions, figure = excluded.figure
+                """, (name, scope, versions, figure_json))
+        figure = json.loads(figure_json)
+        self._figures[key] = (versions, figure)
+        return figure
+
+
+_pipeline: Optional[AnalyticsPipeline] = None
+_singleton_lock = threading.Lock()
+
+
+def get_analytics_pipeline() -> AnalyticsPipeline:
+    """Process-wide analytics pipeline"""
+    global _pipeline
+    with _singleton_lock:
+        if _pipeline is None:
+            _pipeline = AnalyticsPipeline(
+                db_path=os.getenv("ANALYTICS_DB", "analytics_rollups.db"),
+                flush_size=int(os.getenv("ANALYTICS_FLUSH_SIZE", "5000")),
+                flush_interval=float(os.getenv("ANALYTICS_FLUSH_INTERVAL", "5"))
+            )
+            atexit.register(_pipeline.flush)  # a restart does not lose the partly filled buffer
+    return _pipeline
+
+
+def record_event(event_type: str, amount: float = 0.0, component: Optional[str] = None,
+                 destination: Optional[str] = None, user_id: Optional[str] = None, occurred_at: Any = None):
+    """Record an event on the shared pipeline; analytics never breaks the caller"""
+    try:
+        get_analytics_pipeline().record(event_type, amount, component, destination, user_id, occurred_at)
+    except Exception as e:
+        print(f"⚠️ Analytics event dropped: {e}")
+
+
+def generate_demo_events(num_events: int, months: int = 18, users: int = 500,
+                         seed: int = 7) -> Iterable[AnalyticsEvent]:
+    """Synthetic search/view/booking/cancellation stream with growth over time"""
+    rng = random.Random(seed)
+    destinations = ["Paris", "Tokyo", "Dubai", "Beirut", "Rome", "London", "New York",
+                    "Istanbul", "Barcelona", "Bali", "Cairo", "Amman"]
+    weights = [9, 7, 8, 6, 7, 8, 9, 5, 6, 4, 3, 3]
+    components = {"hotel": (80, 450), "flight": (150, 1200), "restaurant": (30, 160),
+                  "package": (900, 4500), "car_rental": (40, 220)}
+    names = list(components)
+    now = datetime.now()
+    span = months * 30 * 86400
+    for _ in range(num_events):
+        # Square root skews timestamps towards the present, so volume grows month over month
+        occurred = now - timedelta(seconds=span * (1 - rng.random() ** 0.5))
+        destination = rng.choices(destinations, weights)[0]
+        user_id = f"user_{rng.randrange(users)}"
+        roll = rng.random()
+        if roll < 0.55:
+            yield AnalyticsEvent("search", destination=destination, user_id=user_id, occurred_at=occurred)
+        elif roll < 0.85:
+            yield AnalyticsEvent("view", destination=destination, user_id=user_id, occurred_at=occurred)
+        else:
+            component = rng.choice(names)
+            low, high = components[component]
+            event_type = "cancellation" if roll > 0.985 else "booking"
+            yield AnalyticsEvent(event_type, round(rng.uniform(low, high), 2), component,
+                                 destination, user_id, occurred)
+
+
+def run_analytics_benchmark(num_events: int = 1_000_000, db_path: str = ":memory:") -> Dict[str, float]:
+    """Measure ingest throughput and dashboard read latency over the rollups"""
+    pipeline = AnalyticsPipeline(db_path=db_path)
+    start = time.perf_counter()
+    pipeline.ingest(generate_demo_events(num_events))
+    ingest_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pipeline.series(REVENUE, "month", 18)
+    pipeline.totals(DESTINATIONS, since=recent_periods("month", 3)[0])
+    pipeline.kpis()
+    read_ms = (time.perf_counter() - start) * 1000
+
+    with pipeline._lock:
+        rollup_rows = sum(pipeline._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                          for table in GRAINS.values())
+    return {
+        "events": num_events,
+        "ingest_seconds": round(ingest_seconds, 2),
+        "events_per_second": round(num_events / ingest_seconds),
+        "rollup_rows": rollup_rows,
+        "dashboard_read_ms": round(read_ms, 2)
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_analytics_benchmark(), indent=2))
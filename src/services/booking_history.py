@@ -0,0 +1,141 @@
+"""
+📋 Booking History
+Persistent, keyset-paginated booking history backed by the bookings table
+
+The list view only needs a handful of columns, so pages project exactly those
+and leave the JSONB details, customer data and special requests in the
+database until a booking is expanded. Pages are read with keyset pagination
+on (user_id, created_at, id): the next page starts strictly after the last row
+of the previous one, so every page is a short index range scan on
+idx_bookings_user_created (migration 0002) no matter how deep the user
+scrolls, and rows inserted meanwhile do not shift or repeat pages the way
+OFFSET does.
+
+Cursors are opaque, URL-safe strings holding the (created_at, id) of the last
+row served.
+"""
+
+import json
+import base64
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+LIST_COLUMNS = (
+    "id", "confirmation_number", "booking_type", "status", "payment_status",
+    "total_amount", "currency", "created_at"
+)
+
+
+@dataclass
+class BookingPage:
+    """One page of a user's bookings, newest first"""
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(created_at: str, booking_id: str) -> str:
+    raw = json.dumps([created_at, str(booking_id)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """(created_at, id) of the last row served; ValueError for a cursor we did not issue"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, booking_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid booking history cursor: {cursor!r}") from e
+    return str(created_at), str(booking_id)
+
+
+def _quoted(value: str) -> str:
+    # Double quotes keep ':' '+' ',' '.' inside timestamps from being parsed as PostgREST syntax
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+class BookingHistoryService:
+    """Read a user's bookings a page at a time and load details on demand"""
+
+    def __init__(self, client, page_size: int = 20, max_page_size: int = 100,
+                 detail_cache_size: int = 256, columns: Tuple[str, ...] = LIST_COLUMNS):
+        self.client = client
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.columns = columns
+        self.detail_cache_size = detail_cache_size
+        self._details: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # === LIST VIEW ===
+
+    def page(self, user_id: str, cursor: Optional[str] = None, limit: Optional[int] = None,
+             status: Optional[str] = None) -> BookingPage:
+        """Up to `limit` bookings older than `cursor` (the first page when cursor is None)"""
+        limit = max(1, min(limit or self.page_size, self.max_page_size))
+        query = self.client.table("bookings").select(",".join(self.columns)).eq("user_id", user_id)
+        if status:
+            query = query.eq("status", status)
+        if cursor:
+            created_at, booking_id = decode_cursor(cursor)
+            created_at, booking_id = _quoted(created_at), _quoted(booking_id)
+            query = query.or_(f"created_at.lt.{created_at},and(created_at.eq.{created_at},id.lt.{booking_id})")
+
+        # One extra row tells us whether another page exists without a count query
+        rows = query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute().data or []
+        if len(rows) <= limit:
+            return BookingPage(items=rows)
+        rows = rows[:limit]
+        return BookingPage(items=rows, next_cursor=encode_cursor(rows[-1]["created_at"], rows[-1]["id"]))
+
+    # === DETAILS ===
+
+    def details(self, user_id: str, booking_id: str) -> Optional[Dict[str, Any]]:
+        """Full booking row, fetched the first time it is expanded and then served from an LRU"""
+        with self._lock:
+            cached = self._details.get(booking_id)
+            if cached is not None:
+                # The cache is shared by every session, so it is checked against the owner like the query
+                if str(cached.get("user_id")) != str(user_id):
+                    return None
+                self._details.move_to_end(booking_id)
+                return cached
+
+        # user_id is part of the filter so a guessed booking ID never returns someone else's booking
+        rows = self.client.table("bookings").select("*").eq("id", booking_id).eq("user_id", user_id) \
+            .limit(1).execute().data
+        if not rows:
+            return None
+        with self._lock:
+            self._details[booking_id] = rows[0]
+            while len(self._details) > self.detail_cache_size:
+                self._details.popitem(last=False)
+        return rows[0]
+
+    def invalidate(self, booking_id: Optional[str] = None):
+        """Drop cached details after a booking changes (all of them when booking_id is None)"""
+        with self._lock:
+            if booking_id is None:
+                self._details.clear()
+            else:
+                self._details.pop(booking_id, None)
+
+
+_service: Optional[BookingHistoryService] = None
+_service_lock = threading.Lock()
+
+
+def get_booking_history_service(client=None) -> BookingHistoryService:
+    """Process-wide service; the first caller's client is used"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = BookingHistoryService(client)
+        elif _service.client is None and client is not None:
+            _service.client = client
+    return _service
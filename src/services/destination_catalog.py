@@ -0,0 +1,131 @@
+"""
+🗺️ Destination Catalog
+Process-wide cache of destination names and cities for selectboxes
+
+The catalog is loaded with a single projected query and shared by every
+Streamlit session. Reads never touch the network: they return the current
+snapshot (or the offline list before the first load) and, when the snapshot
+is older than the TTL, start one background refresh.
+"""
+
+import time
+import threading
+from typing import List, Optional, Dict, Any
+
+DEFAULT_DESTINATIONS = [
+    "Beirut, Lebanon", "Dubai, UAE", "Paris, France", "London, UK",
+    "New York, USA", "Tokyo, Japan", "Istanbul, Turkey", "Rome, Italy",
+    "Barcelona, Spain", "Amsterdam, Netherlands", "Bangkok, Thailand",
+    "Sydney, Australia", "Cairo, Egypt", "Mumbai, India", "Berlin, Germany"
+]
+
+DEFAULT_CITIES = [
+    "Beirut", "Dubai", "Paris", "London", "New York", "Tokyo",
+    "Istanbul", "Rome", "Barcelona", "Amsterdam", "Bangkok",
+    "Sydney", "Cairo", "Mumbai", "Berlin"
+]
+
+
+class DestinationCatalog:
+    """TTL-cached destination and city lists with background refresh"""
+
+    def __init__(self, client=None, ttl: float = 600.0):
+        self.client = client
+        self.ttl = ttl
+        self._destinations: List[str] = list(DEFAULT_DESTINATIONS)
+        self._cities: List[str] = list(DEFAULT_CITIES)
+        self._live = False
+        self._next_refresh = 0.0  # monotonic time after which a read triggers a refresh
+        self._has_city_column = True
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self.stats = {"reads": 0, "refreshes": 0, "errors": 0, "last_error": None}
+
+    # === READS ===
+
+    def get_destinations(self) -> List[str]:
+        """Sorted, de-duplicated destination names"""
+        self._maybe_refresh()
+        return self._destinations
+
+    def get_cities(self) -> List[str]:
+        """Sorted, de-duplicated city names"""
+        self._maybe_refresh()
+        return self._cities
+
+    @property
+    def is_live(self) -> bool:
+        """True once the catalog has been loaded from the database"""
+        return self._live
+
+    # === REFRESH ===
+
+    def _maybe_refresh(self):
+        with self._lock:
+            self.stats["reads"] += 1
+            if self.client is None or self._refreshing:
+                return
+            if time.monotonic() < self._next_refresh:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh_in_background, daemon=True,
+                         name="destination-catalog-refresh").start()
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+                self.stats["last_error"] = str(e)
+                # Keep serving the current snapshot and retry after a short back-off
+                self._next_refresh = time.monotonic() + min(self.ttl, 30.0)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh(self):
+        """Reload the catalog now (blocking); lists are swapped in atomically"""
+        rows = self._fetch_rows()
+        destinations = sorted({row["name"] for row in rows if row.get("name")})
+        cities = sorted({
+            row.get("city") or row["name"].split(",")[0].strip()
+            for row in rows if row.get("city") or row.get("name")
+        })
+        with self._lock:
+            if destinations:
+                self._destinations = destinations
+            if cities:
+                self._cities = cities
+            self._live = True
+            self._next_refresh = time.monotonic() + self.ttl
+            self.stats["refreshes"] += 1
+
+    def _fetch_rows(self) -> List[Dict[str, Any]]:
+        if self._has_city_column:
+            try:
+                return self.client.table("destinations").select("name, city").execute().data or []
+            except Exception:
+                # Older schemas have no city column; derive cities from names from now on
+                self._has_city_column = False
+        return self.client.table("destinations").select("name").execute().data or []
+
+    def invalidate(self):
+        """Mark the snapshot stale so the next read triggers a refresh"""
+        with self._lock:
+            self._next_refresh = 0.0
+
+
+_catalog: Optional[DestinationCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_destination_catalog(client=None, ttl: float = 600.0) -> DestinationCatalog:
+    """Process-wide catalog; the first caller's client is used for refreshes"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = DestinationCatalog(client, ttl)
+        elif _catalog.client is None and client is not None:
+            _catalog.client = client
+    return _catalog
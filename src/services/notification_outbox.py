@@ -0,0 +1,638 @@
+"""
+📬 Notification Outbox
+Persistent, coalescing outbox for email/SMS notifications with background delivery workers
+
+Hot paths (booking confirmation, cancellation, price checks) only enqueue a row
+in a local SQLite outbox. Background workers claim due rows in batches, hand
+them to a transport (SendGrid, SMTP, Twilio, HTTP or console) and retry failed
+deliveries with exponential backoff. Price moves for the same user and item are
+coalesced into a single digest while the digest window is open.
+"""
+
+import os
+import json
+import time
+import random
+import sqlite3
+import smtplib
+import threading
+import urllib.request
+from datetime import datetime
+from dataclasses import dataclass
+from email.mime.text import MIMEText
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+try:
+    from sendgrid import SendGridAPIClient
+    from sendgrid.helpers.mail import Mail
+    SENDGRID_AVAILABLE = True
+except ImportError:
+    SENDGRID_AVAILABLE = False
+
+try:
+    from twilio.rest import Client as TwilioClient
+    TWILIO_AVAILABLE = True
+except ImportError:
+    TWILIO_AVAILABLE = False
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+# A row claimed longer ago than this is assumed to belong to a dead worker (any process on the same file)
+SENDING_LEASE = float(os.getenv("NOTIFICATION_SENDING_LEASE", "300"))
+
+DEFAULT_SENDER = os.getenv("NOTIFICATION_FROM_EMAIL", "travel.platform@example.com")
+
+
+@dataclass
+class OutboundMessage:
+    """A claimed outbox row ready for delivery"""
+    message_id: int
+    channel: str  # email, sms
+    recipient: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+
+class NotificationOutbox:
+    """SQLite-backed outbox with coalescing of repeated price alerts"""
+
+    def __init__(self, db_path: str = "notification_outbox.db", digest_window: float = 300.0):
+        self.db_path = Path(db_path)
+        self.digest_window = digest_window
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_database()
+
+    def init_database(self):
+        """Create the outbox table and its delivery index"""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    channel TEXT NOT NULL,
+                    recipient TEXT NOT NULL,
+                    subject TEXT,
+                    body TEXT,
+                    coalesce_key TEXT,
+                    payload TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    last_error TEXT
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(status, next_attempt_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outbox_coalesce ON outbox(coalesce_key, status)"
+            )
+
+    # === ENQUEUE (HOT PATH) ===
+
+    def enqueue(self, channel: str, recipient: str, subject: str, body: str,
+                delay: float = 0.0) -> int:
+        """Queue a single notification for background delivery"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute("""
+                INSERT INTO outbox (channel, recipient, subject, body, status,
+                                    next_attempt_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (channel, recipient, subject, body, PENDING, now + delay, now, now))
+            return cursor.lastrowid
+
+    def enqueue_price_move(self, user_email: str, item_type: str, item_id: str,
+                           old_price: float, new_price: float) -> int:
+        """Queue a price alert, merging it into an open digest for the same user and item"""
+        now = time.time()
+        coalesce_key = f"price:{user_email}:{item_type}:{item_id}"
+        move = {"from": old_price, "to": new_price, "at": datetime.now().isoformat()}
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("""
+                    SELECT id, payload FROM outbox
+                    WHERE coalesce_key = ? AND status = ?
+                    ORDER BY id DESC LIMIT 1
+                """, (coalesce_key, PENDING)).fetchone()
+
+                if row:
+                    message_id = row[0]
+                    payload = json.loads(row[1])
+                    payload["moves"].append(move)
+                    subject, body = self._render_price_digest(payload)
+                    self._conn.execute("""
+                        UPDATE outbox SET payload = ?, subject = ?, body = ?, updated_at = ?
+                        WHERE id = ?
+                    """, (json.dumps(payload), subject, body, now, message_id))
+                else:
+                    payload = {"item_type": item_type, "item_id": item_id, "moves": [move]}
+                    subject, body = self._render_price_digest(payload)
+                    cursor = self._conn.execute("""
+                        INSERT INTO outbox (channel, recipient, subject, body, coalesce_key, payload,
+                                            status, next_attempt_at, created_at, updated_at)
+                        VALUES ('email', ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (user_email, subject, body, coalesce_key, json.dumps(payload),
+                          PENDING, now + self.digest_window, now, now))
+                    message_id = cursor.lastrowid
+
+                self._conn.execute("COMMIT")
+                return message_id
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def enqueue_booking_notice(self, booking: Dict, kind: str = "confirmation",
+                               reason: Optional[str] = None) -> List[int]:
+        """Queue email (and SMS when a phone is on file) for a booking confirmation or cancellation"""
+        customer = booking.get("customer_details") or {}
+        confirmation_number = booking.get("confirmation_number", "N/A")
+        booking_type = str(booking.get("booking_type", "booking")).replace("_", " ")
+
+        if kind == "cancellation":
+            subject = f"❌ Booking {confirmation_number} cancelled"
+            body = (f"Your {booking_type} booking {confirmation_number} has been cancelled."
+                    + (f"\nReason: {reason}" if reason else ""))
+            sms = f"Booking {confirmation_number} cancelled."
+        else:
+            subject = f"✅ Booking {confirmation_number} confirmed"
+            body = (f"Your {booking_type} booking {confirmation_number} is confirmed.\n"
+                    f"Total: {booking.get('total_amount', 0)} {booking.get('currency', 'USD')}")
+            sms = f"Booking {confirmation_number} confirmed."
+
+        message_ids = []
+        if customer.get("email"):
+            message_ids.append(self.enqueue("email", customer["email"], subject, body))
+        if customer.get("phone"):
+            message_ids.append(self.enqueue("sms", customer["phone"], subject, sms))
+        if not message_ids:
+            print(f"📧 No contact details on booking {confirmation_number}; nothing queued")
+        return message_ids
+
+    def _render_price_digest(self, payload: Dict[str, Any]):
+        """Render one email for all price moves collected in the digest window"""
+        moves = payload["moves"]
+        first_price = moves[0]["from"]
+        last_price = moves[-1]["to"]
+        net_change = last_price - first_price
+        change_type = "📉 Decreased" if net_change < 0 else "📈 Increased"
+
+        subject = f"🚨 Price Alert: {payload['item_type'].title()} Price Changed!"
+        lines = [
+            f"Price Alert for your tracked {payload['item_type']}:",
+            "",
+            f"{change_type} by ${abs(net_change):.2f}",
+            f"New Price: ${last_price:.2f}",
+            f"Previous Price: ${first_price:.2f}",
+        ]
+        if len(moves) > 1:
+            lines.append("")
+            lines.append(f"{len(moves)} price moves since the last alert:")
+            for move in moves:
+                lines.append(f"  • {move['at'][:16]}: ${move['from']:.2f} → ${move['to']:.2f}")
+        lines.extend(["", "Check now to book at the best price!"])
+        return subject, "\n".join(lines)
+
+    # === DELIVERY (WORKER SIDE) ===
+
+    def claim_batch(self, limit: int = 50) -> List[OutboundMessage]:
+        """Atomically move up to `limit` due rows from pending to sending"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute("""
+                    SELECT id, channel, recipient, subject, body, attempts FROM outbox
+                    WHERE status = ? AND next_attempt_at <= ?
+                    ORDER BY next_attempt_at LIMIT ?
+                """, (PENDING, now, limit)).fetchall()
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE outbox SET status = ?, updated_at = ? WHERE id = ?",
+                        [(SENDING, now, row[0]) for row in rows]
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [OutboundMessage(*row) for row in rows]
+
+    def mark_sent(self, message_ids: List[int]):
+        """Record successful deliveries"""
+        if not message_ids:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET status = ?, updated_at = ?, last_error = NULL WHERE id = ?",
+                [(SENT, now, message_id) for message_id in message_ids]
+            )
+
+    def mark_failed(self, failures: List[tuple], max_attempts: int = 5, base_backoff: float = 2.0):
+        """Reschedule failed deliveries with exponential backoff and jitter, or give up"""
+        if not failures:
+            return
+        now = time.time()
+        updates = []
+        for message, error in failures:
+            attempts = message.attempts + 1
+            if attempts >= max_attempts:
+                updates.append((FAILED, attempts, now, now, str(error)[:500], message.message_id))
+            else:
+                delay = base_backoff * (2 ** (attempts - 1))
+                delay += random.uniform(0, delay / 2)
+                updates.append((PENDING, attempts, now + delay, now, str(error)[:500], message.message_id))
+        with self._lock:
+            self._conn.executemany("""
+                UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?,
+                                  updated_at = ?, last_error = ?
+                WHERE id = ?
+            """, updates)
+
+    def recover_in_flight(self, lease: float = SENDING_LEASE) -> int:
+        """Return rows left in 'sending' by a crashed worker to the pending queue
+
+        Only rows claimed more than `lease` seconds ago are taken back; younger ones may
+        still be in the hands of a live dispatcher in this or another process.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute("""
+                UPDATE outbox SET status = ?, next_attempt_at = ?, updated_at = ?
+                WHERE status = ? AND updated_at <= ?
+            """, (PENDING, now, now, SENDING, now - lease))
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, int]:
+        """Count outbox rows by status"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall()
+        stats = {PENDING: 0, SENDING: 0, SENT: 0, FAILED: 0}
+        stats.update({status: count for status, count in rows})
+        return stats
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# === TRANSPORTS ===
+
+class ConsoleTransport:
+    """Print notifications instead of sending them (no provider configured)"""
+
+    def send_batch(self, messages: List[OutboundMessage]) -> Dict[int, Optional[str]]:
+        for message in messages:
+            icon = "📱" if message.channel == "sms" else "📧"
+            print(f"{icon} {message.channel.upper()} to {message.recipient}: {message.subject}")
+        return {message.message_id: None for message in messages}
+
+
+class SMTPTransport:
+    """Deliver an email batch over a single SMTP connection"""
+
+    def __init__(self, host: str, port: int = 587, username: str = "",
+                 password: str = "", use_tls: bool = True, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+    def send_batch(self, messages: List[OutboundMessage]) -> Dict[int, Optional[str]]:
+        results = {}
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as server:
+            if self.use_tls:
+                server.starttls()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+            for message in messages:
+                try:
+                    mime = MIMEText(message.body, "plain")
+                    mime["From"] = DEFAULT_SENDER
+                    mime["To"] = message.recipient
+                    mime["Subject"] = message.subject
+                    server.sendmail(DEFAULT_SENDER, [message.recipient], mime.as_string())
+                    results[message.message_id] = None
+                except Exception as e:
+                    results[message.message_id] = str(e)
+        return results
+
+
+class SendGridTransport:
+    """Deliver an email batch through one SendGrid API client"""
+
+    def __init__(self, api_key: str, from_email: str = DEFAULT_SENDER):
+        if not SENDGRID_AVAILABLE:
+            raise ImportError("sendgrid is not installed. Install with: pip install sendgrid")
+        self.client = SendGridAPIClient(api_key)
+        self.from_email = from_email
+
+    def send_batch(self, messages: List[OutboundMessage]) -> Dict[int, Optional[str]]:
+        results = {}
+        for message in messages:
+            try:
+                mail = Mail(
+                    from_email=self.from_email,
+                    to_emails=message.recipient,
+                    subject=message.subject,
+                    plain_text_content=message.body
+                )
+                response = self.client.send(mail)
+                ok = 200 <= response.status_code < 300
+                results[message.message_id] = None if ok else f"SendGrid status {response.status_code}"
+            except Exception as e:
+                results[message.message_id] = str(e)
+        return results
+
+
+class TwilioSMSTransport:
+    """Deliver an SMS batch through one Twilio client"""
+
+    def __init__(self, account_sid: str, auth_token: str, from_number: str):
+        if not TWILIO_AVAILABLE:
+            raise ImportError("twilio is not installed. Install with: pip install twilio")
+        self.client = TwilioClient(account_sid, auth_token)
+        self.from_number = from_number
+
+    def send_batch(self, messages: List[OutboundMessage]) -> Dict[int, Optional[str]]:
+        results = {}
+        for message in messages:
+            try:
+                self.client.messages.create(body=message.body, from_=self.from_number, to=message.recipient)
+                results[message.message_id] = None
+            except Exception as e:
+                results[message.message_id] = str(e)
+        return results
+
+
+class HTTPTransport:
+    """POST a whole batch as one JSON request (used with LocalNotificationSink)"""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def send_batch(self, messages: List[OutboundMessage]) -> Dict[int, Optional[str]]:
+        payload = json.dumps([
+            {"id": m.message_id, "channel": m.channel, "to": m.recipient,
+             "subject": m.subject, "body": m.body}
+            for m in messages
+        ]).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=payload, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                rejected = set(json.loads(response.read() or b"{}").get("rejected", []))
+        except Exception as e:
+            return {m.message_id: str(e) for m in messages}
+        return {m.message_id: ("rejected by sink" if m.message_id in rejected else None) for m in messages}
+
+
+class LocalNotificationSink:
+    """Local HTTP stand-in for the email/SMS providers, for offline throughput testing"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, failure_rate: float = 0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.received = 0
+        self.rejected = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                batch = json.loads(self.rfile.read(length) or b"[]")
+                if sink.latency:
+                    time.sleep(sink.latency)
+                rejected = [m["id"] for m in batch if random.random() < sink.failure_rate]
+                with sink._lock:
+                    sink.requests += 1
+                    sink.received += len(batch) - len(rejected)
+                    sink.rejected += len(rejected)
+                body = json.dumps({"accepted": len(batch) - len(rejected), "rejected": rejected}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}/messages"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# === WORKERS ===
+
+class OutboxDispatcher:
+    """Background workers that drain the outbox in batches"""
+
+    def __init__(self, outbox: NotificationOutbox, transports: Dict[str, Any],
+                 workers: int = 2, batch_size: int = 50, poll_interval: float = 0.5,
+                 max_attempts: int = 5, base_backoff: float = 2.0, lease: float = SENDING_LEASE):
+        self.outbox = outbox
+        self.transports = transports
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.lease = lease
+        self._next_recovery = 0.0
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def run_once(self) -> int:
+        """Claim and deliver one batch; returns the number of messages claimed"""
+        batch = self.outbox.claim_batch(self.batch_size)
+        if not batch:
+            return 0
+
+        by_channel: Dict[str, List[OutboundMessage]] = {}
+        for message in batch:
+            by_channel.setdefault(message.channel, []).append(message)
+
+        sent, failures = [], []
+        for channel, messages in by_channel.items():
+            transport = self.transports.get(channel)
+            if transport is None:
+                failures.extend((m, f"No transport for channel '{channel}'") for m in messages)
+                continue
+            try:
+                results = transport.send_batch(messages)
+            except Exception as e:
+                results = {m.message_id: str(e) for m in messages}
+            for message in messages:
+                error = results.get(message.message_id, "No delivery result")
+                if error is None:
+                    sent.append(message.message_id)
+                else:
+                    failures.append((message, error))
+
+        self.outbox.mark_sent(sent)
+        self.outbox.mark_failed(failures, self.max_attempts, self.base_backoff)
+        return len(batch)
+
+    def _recover_expired(self):
+        # Rows of a worker that died after start() only lapse later, so look again every lease period
+        if time.monotonic() < self._next_recovery:
+            return
+        self._next_recovery = time.monotonic() + self.lease
+        recovered = self.outbox.recover_in_flight(self.lease)
+        if recovered:
+            print(f"📬 Recovered {recovered} in-flight notifications")
+
+    def _worker_loop(self):
+        while not self._stop.is_set():
+            try:
+                self._recover_expired()
+                claimed = self.run_once()
+            except Exception as e:
+                print(f"❌ Notification worker error: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        """Start the worker threads (idempotent)"""
+        if self._threads:
+            return self
+        self._next_recovery = 0.0
+        self._recover_expired()
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"outbox-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Signal workers to stop and wait for them"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+def build_default_transports() -> Dict[str, Any]:
+    """Pick email/SMS transports from the environment, falling back to the console"""
+    transports: Dict[str, Any] = {"email": ConsoleTransport(), "sms": ConsoleTransport()}
+
+    sendgrid_key = os.getenv("SENDGRID_API_KEY")
+    smtp_server = os.getenv("SMTP_SERVER") or os.getenv("EMAIL_HOST")
+    if sendgrid_key and SENDGRID_AVAILABLE:
+        transports["email"] = SendGridTransport(sendgrid_key)
+    elif smtp_server:
+        transports["email"] = SMTPTransport(
+            host=smtp_server,
+            port=int(os.getenv("SMTP_PORT") or os.getenv("EMAIL_PORT") or 587),
+            username=os.getenv("SMTP_USERNAME") or os.getenv("EMAIL_USERNAME", ""),
+            password=os.getenv("SMTP_PASSWORD") or os.getenv("EMAIL_PASSWORD", "")
+        )
+
+    twilio_sid = os.getenv("TWILIO_ACCOUNT_SID")
+    twilio_token = os.getenv("TWILIO_AUTH_TOKEN")
+    twilio_from = os.getenv("TWILIO_FROM_NUMBER")
+    if twilio_sid and twilio_token and twilio_from and TWILIO_AVAILABLE:
+        transports["sms"] = TwilioSMSTransport(twilio_sid, twilio_token, twilio_from)
+
+    return transports
+
+
+_outbox: Optional[NotificationOutbox] = None
+_dispatcher: Optional[OutboxDispatcher] = None
+_singleton_lock = threading.Lock()
+
+
+def get_notification_outbox(autostart: bool = True) -> NotificationOutbox:
+    """Process-wide outbox; starts the background workers on first use"""
+    global _outbox, _dispatcher
+    with _singleton_lock:
+        if _outbox is None:
+            _outbox = NotificationOutbox(
+                db_path=os.getenv("NOTIFICATION_OUTBOX_DB", "notification_outbox.db"),
+                digest_window=float(os.getenv("PRICE_ALERT_DIGEST_WINDOW", "300"))
+            )
+        if autostart and _dispatcher is None:
+            _dispatcher = OutboxDispatcher(
+                _outbox,
+                build_default_transports(),
+                workers=int(os.getenv("NOTIFICATION_WORKERS", "2"))
+            ).start()
+    return _outbox
+
+
+def run_outbox_benchmark(num_messages: int = 2000, workers: int = 4, batch_size: int = 100,
+                         sink_latency: float = 0.005, db_path: str = ":memory:") -> Dict[str, float]:
+    """Measure enqueue and delivery throughput against the local HTTP sink"""
+    sink = LocalNotificationSink(latency=sink_latency).start()
+    outbox = NotificationOutbox(db_path=db_path, digest_window=0)
+    dispatcher = OutboxDispatcher(
+        outbox, {"email": HTTPTransport(sink.url), "sms": HTTPTransport(sink.url)},
+        workers=workers, batch_size=batch_size, poll_interval=0.01
+    )
+
+    start = time.perf_counter()
+    for i in range(num_messages):
+        outbox.enqueue("email", f"user{i}@example.com", "✅ Booking confirmed", f"Booking #{i}")
+    enqueue_seconds = time.perf_counter() - start
+
+    dispatcher.start()
+    # Done once nothing is left to deliver; messages that failed for good do not keep the loop waiting
+    while True:
+        stats = outbox.get_stats()
+        if not stats[PENDING] and not stats[SENDING]:
+            break
+        time.sleep(0.01)
+    total_seconds = time.perf_counter() - start
+    dispatcher.stop()
+    sink.stop()
+    outbox.close()
+
+    results = {
+        "messages": num_messages,
+        "delivered": stats[SENT],
+        "failed": stats[FAILED],
+        "enqueue_per_second": num_messages / enqueue_seconds if enqueue_seconds else 0.0,
+        "delivered_per_second": num_messages / total_seconds if total_seconds else 0.0,
+        "http_requests": sink.requests,
+    }
+    print(f"📬 Outbox benchmark: {results['enqueue_per_second']:.0f} enqueues/s, "
+          f"{results['delivered_per_second']:.0f} deliveries/s over {sink.requests} HTTP batches")
+    return results
+
+
+if __name__ == "__main__":
+    run_outbox_benchmark()
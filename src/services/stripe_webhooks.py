@@ -0,0 +1,702 @@
+"""
+🪝 Stripe Webhooks
+Verified, deduplicated webhook inbox with batched booking status updates
+
+The receiver does as little as possible while Stripe waits for its 2xx: it
+checks the Stripe-Signature header and inserts the event into a local SQLite
+inbox keyed on the event id, so redelivered events are dropped on arrival.
+Background workers claim due events in batches, group them by the booking
+transition they imply and apply each group with one conditional update on the
+bookings table (e.g. pending -> confirmed for every booking paid in the
+batch). Bookings that already moved on are left alone, so events may arrive
+late, twice or out of order. Failed batches are retried with exponential
+backoff.
+
+Confirmation no longer depends on the payer's browser session finishing
+process_payment: whichever of the two confirms the booking first sends the
+confirmation, and the other finds nothing left to update. A successful payment
+whose booking has meanwhile expired, failed or been cancelled is not applied:
+its events are kept as needs_refund and handed to the refund callback.
+
+Usage:
+    python src/services/stripe_webhooks.py                            # local ingest benchmark
+    python src/services/stripe_webhooks.py serve --port 8765          # receive webhooks
+    python src/services/stripe_webhooks.py replay events.jsonl --url http://127.0.0.1:8765/stripe/webhook
+"""
+
+import os
+import sys
+import hmac
+import json
+import time
+import uuid
+import random
+import sqlite3
+import hashlib
+import argparse
+import threading
+import urllib.request
+import urllib.error
+from datetime import datetime
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+PENDING = "pending"
+PROCESSING = "processing"
+APPLIED = "applied"
+SKIPPED = "skipped"
+FAILED = "failed"
+NEEDS_REFUND = "needs_refund"  # paid, but the booking was no longer pending
+REFUNDED = "refunded"
+
+SIGNATURE_TOLERANCE = 300  # seconds, as in Stripe's own libraries
+
+# An event claimed longer ago than this is assumed to belong to a dead worker (any process on the same file)
+PROCESSING_LEASE = float(os.getenv("STRIPE_WEBHOOK_PROCESSING_LEASE", "300"))
+
+# Event type -> (booking fields to set, statuses the booking may move from), applied in this order
+TRANSITIONS: Dict[str, Tuple[Dict[str, str], Tuple[str, ...]]] = {
+    "payment_intent.succeeded": ({"status": "confirmed", "payment_status": "paid"}, ("pending",)),
+    "checkout.session.completed": ({"status": "confirmed", "payment_status": "paid"}, ("pending",)),
+    "checkout.session.async_payment_succeeded": ({"status": "confirmed", "payment_status": "paid"}, ("pending",)),
+    "payment_intent.payment_failed": ({"status": "failed", "payment_status": "failed"}, ("pending",)),
+    "payment_intent.canceled": ({"status": "failed", "payment_status": "failed"}, ("pending",)),
+    "checkout.session.async_payment_failed": ({"status": "failed", "payment_status": "failed"}, ("pending",)),
+    "charge.refunded": ({"payment_status": "refunded"}, ("confirmed", "cancelled", "completed")),
+}
+
+
+class WebhookSignatureError(ValueError):
+    """The payload does not carry a valid, fresh Stripe signature"""
+
+
+def sign_payload(payload: bytes, secret: str, timestamp: Optional[int] = None) -> str:
+    """Stripe-Signature header value for payload (used by the replayer and tests)"""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    digest = hmac.new(secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+
+def verify_signature(payload: bytes, header: str, secret: str, tolerance: int = SIGNATURE_TOLERANCE,
+                     now: Optional[float] = None) -> Dict[str, Any]:
+    """Check a Stripe-Signature header (HMAC-SHA256 over "timestamp.payload") and return the event"""
+    try:
+        parts = [item.split("=", 1) for item in (header or "").split(",") if "=" in item]
+        timestamp = int(next(value for key, value in parts if key == "t"))
+        signatures = [value for key, value in parts if key == "v1"]
+    except (StopIteration, ValueError):
+        raise WebhookSignatureError("Malformed Stripe-Signature header")
+    expected = hmac.new(secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256).hexdigest()
+    if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+        raise WebhookSignatureError("Signature does not match")
+    if abs((time.time() if now is None else now) - timestamp) > tolerance:
+        raise WebhookSignatureError("Signature timestamp outside the tolerance window")
+    try:
+        return json.loads(payload)
+    except ValueError:
+        raise WebhookSignatureError("Invalid payload")
+
+
+def _booking_id(event: Dict[str, Any]) -> Optional[str]:
+    """Booking an event is about (metadata.booking_id), or None when it changes no booking"""
+    data = (event.get("data") or {}).get("object") or {}
+    if event.get("type") not in TRANSITIONS:
+        return None
+    if event["type"] == "checkout.session.completed" and data.get("payment_status") != "paid":
+        return None  # delayed methods settle with async_payment_succeeded
+    booking_id = (data.get("metadata") or {}).get("booking_id")
+    try:
+        return str(uuid.UUID(str(booking_id)))  # bookings.id is a UUID; BOOK_... session ids never match
+    except ValueError:
+        return None
+
+
+@dataclass
+class WebhookEvent:
+    """A claimed inbox row ready to apply"""
+    event_id: str
+    event_type: str
+    booking_id: Optional[str]
+    attempts: int = 0
+
+
+class WebhookInbox:
+    """SQLite-backed inbox; the event id primary key is the dedupe table"""
+
+    def __init__(self, db_path: str = "stripe_webhooks.db"):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_database()
+
+    def init_database(self):
+        """Create the inbox table and its work-queue index"""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS webhook_events (
+                    event_id TEXT PRIMARY KEY,
+                    event_type TEXT NOT NULL,
+                    booking_id TEXT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    received_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    last_error TEXT
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_webhook_events_due ON webhook_events(status, next_attempt_at)"
+            )
+
+    # === INGEST (RECEIVER SIDE) ===
+
+    def ingest(self, payload: bytes, signature: str, secret: str) -> bool:
+        """Verify and queue a raw webhook delivery; False when the event was already received"""
+        return self.enqueue_event(verify_signature(payload, signature, secret))
+
+    def enqueue_event(self, event: Dict[str, Any]) -> bool:
+        """Queue an already verified event; False when its id is already in the inbox"""
+        if not event.get("id") or not event.get("type"):
+            raise ValueError("Webhook event needs an id and a type")
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute("""
+                INSERT OR IGNORE INTO webhook_events (event_id, event_type, booking_id, payload, status,
+                                                      next_attempt_at, received_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (event["id"], event["type"], _booking_id(event), json.dumps(event), PENDING, now, now, now))
+            return cursor.rowcount == 1
+
+    # === APPLY (WORKER SIDE) ===
+
+    def claim_batch(self, limit: int = 100) -> List[WebhookEvent]:
+        """Atomically move up to `limit` due events from pending to processing"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute("""
+                    SELECT event_id, event_type, booking_id, attempts FROM webhook_events
+                    WHERE status = ? AND next_attempt_at <= ?
+                    ORDER BY next_attempt_at LIMIT ?
+                """, (PENDING, now, limit)).fetchall()
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE webhook_events SET status = ?, updated_at = ? WHERE event_id = ?",
+                        [(PROCESSING, now, row[0]) for row in rows]
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [WebhookEvent(*row) for row in rows]
+
+    def mark_done(self, event_ids: List[str], status: str = APPLIED):
+        """Record applied (or deliberately ignored) events"""
+        if not event_ids:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE webhook_events SET status = ?, updated_at = ?, last_error = NULL WHERE event_id = ?",
+                [(status, now, event_id) for event_id in event_ids]
+            )
+
+    def mark_failed(self, failures: List[tuple], max_attempts: int = 8, base_backoff: float = 1.0):
+        """Reschedule events whose update failed with exponential backoff and jitter, or give up"""
+        if not failures:
+            return
+        now = time.time()
+        updates = []
+        for event, error in failures:
+            attempts = event.attempts + 1
+            if attempts >= max_attempts:
+                updates.append((FAILED, attempts, now, now, str(error)[:500], event.event_id))
+            else:
+                delay = base_backoff * (2 ** (attempts - 1))
+                delay += random.uniform(0, delay / 2)
+                updates.append((PENDING, attempts, now + delay, now, str(error)[:500], event.event_id))
+        with self._lock:
+            self._conn.executemany("""
+                UPDATE webhook_events SET status = ?, attempts = ?, next_attempt_at = ?,
+                                          updated_at = ?, last_error = ?
+                WHERE event_id = ?
+            """, updates)
+
+    def recover_in_flight(self, lease: float = PROCESSING_LEASE) -> int:
+        """Return events left in 'processing' by a crashed worker to the queue
+
+        Only events claimed more than `lease` seconds ago are taken back; younger ones may
+        still be applied by a live dispatcher in this or another process.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute("""
+                UPDATE webhook_events SET status = ?, next_attempt_at = ?, updated_at = ?
+                WHERE status = ? AND updated_at <= ?
+            """, (PENDING, now, now, PROCESSING, now - lease))
+            return cursor.rowcount
+
+    def payment_intent_id(self, event_id: str) -> Optional[str]:
+        """Payment intent an event's charge belongs to (for refunds)"""
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM webhook_events WHERE event_id = ?", (event_id,)).fetchone()
+        if row is None:
+            return None
+        data = (json.loads(row[0]).get("data") or {}).get("object") or {}
+        return data.get("id") if data.get("object") == "payment_intent" else data.get("payment_intent")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Count inbox rows by status"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM webhook_events GROUP BY status"
+            ).fetchall()
+        stats = {PENDING: 0, PROCESSING: 0, APPLIED: 0, SKIPPED: 0, FAILED: 0, NEEDS_REFUND: 0, REFUNDED: 0}
+        stats.update({status: count for status, count in rows})
+        return stats
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# === BOOKING STORES ===
+
+class InMemoryBookingStatusStore:
+    """Bookings keyed by id, for development, tests and benchmarks"""
+
+    def __init__(self, bookings: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.bookings = bookings if bookings is not None else {}
+        self.update_calls = 0
+        self._lock = threading.Lock()
+
+    def update_status(self, values: Dict[str, str], booking_ids: List[str],
+                      from_statuses: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.update_calls += 1
+            updated = []
+            for booking_id in booking_ids:
+                booking = self.bookings.get(booking_id)
+                if booking and booking["status"] in from_statuses:
+                    booking.update(values)
+                    updated.append(dict(booking))
+            return updated
+
+    def get_bookings(self, booking_ids: List[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{**self.bookings[booking_id], "id": booking_id}
+                    for booking_id in booking_ids if booking_id in self.bookings]
+
+
+class SupabaseBookingStatusStore:
+    """Conditional bulk updates on the bookings table"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def update_status(self, values: Dict[str, str], booking_ids: List[str],
+                      from_statuses: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        # One UPDATE ... WHERE id IN (...) AND status IN (...); only rows that really moved come back
+        result = self.client.table("bookings").update({
+            **values, "updated_at": datetime.now().isoformat()
+        }).in_("id", booking_ids).in_("status", list(from_statuses)).execute()
+        return result.data or []
+
+    def get_bookings(self, booking_ids: List[str]) -> List[Dict[str, Any]]:
+        result = self.client.table("bookings").select("id,status,payment_status").in_("id", booking_ids).execute()
+        return result.data or []
+
+
+# === WORKERS ===
+
+class WebhookDispatcher:
+    """Background workers that apply queued events to bookings in batches"""
+
+    def __init__(self, inbox: WebhookInbox, store, workers: int = 2, batch_size: int = 200,
+                 poll_interval: float = 0.5, max_attempts: int = 8, base_backoff: float = 1.0,
+                 on_confirmed: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 on_failed: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 on_unbooked_payment: Optional[Callable[[Dict[str, Any], Optional[str]], bool]] = None,
+                 lease: float = PROCESSING_LEASE):
+        self.inbox = inbox
+        self.store = store
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.on_confirmed = on_confirmed
+        self.on_failed = on_failed
+        # Called with (booking, payment_intent_id) for a charge whose booking was no longer pending;
+        # returns True once the charge is refunded
+        self.on_unbooked_payment = on_unbooked_payment
+        self.lease = lease
+        self._next_recovery = 0.0
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def run_once(self) -> int:
+        """Claim and apply one batch; returns the number of events claimed"""
+        batch = self.inbox.claim_batch(self.batch_size)
+        if not batch:
+            return 0
+
+        skipped = [event.event_id for event in batch if not event.booking_id]
+        applied, unbooked, failures = [], [], []
+        for event_type, (values, from_statuses) in TRANSITIONS.items():
+            events = [event for event in batch if event.event_type == event_type and event.booking_id]
+            if not events:
+                continue
+            try:
+                rows = self.store.update_status(values, sorted({e.booking_id for e in events}), from_statuses)
+            except Exception as e:
+                failures.extend((event, str(e)) for event in events)
+                continue
+            self._notify(values.get("status"), rows)
+            moved = {str(row.get("id")) for row in rows}
+            late = [event for event in events if event.booking_id not in moved]
+            if values.get("status") != "confirmed" or not late:
+                applied.extend(event.event_id for event in events)
+                continue
+            applied.extend(event.event_id for event in events if event.booking_id in moved)
+            try:
+                found = self._unbooked(late)
+            except Exception as e:
+                failures.extend((event, str(e)) for event in late)
+                continue
+            unbooked.extend(found)
+            held = {event.event_id for event, _ in found}
+            applied.extend(event.event_id for event in late if event.event_id not in held)
+
+        self.inbox.mark_done(applied, APPLIED)
+        self.inbox.mark_done(skipped, SKIPPED)
+        self.inbox.mark_failed(failures, self.max_attempts, self.base_backoff)
+        self._refund_unbooked(unbooked)
+        return len(batch)
+
+    def _unbooked(self, events: List[WebhookEvent]) -> List[Tuple[WebhookEvent, Dict[str, Any]]]:
+        """Success events whose booking is neither confirmed nor already refunded"""
+        bookings = {str(row["id"]): row for row in self.store.get_bookings(sorted({e.booking_id for e in events}))}
+        found = []
+        for event in events:
+            booking = bookings.get(event.booking_id, {"id": event.booking_id, "status": None})
+            if booking["status"] not in ("confirmed", "completed") and booking.get("payment_status") != "refunded":
+                found.append((event, booking))
+        return found
+
+    def _refund_unbooked(self, unbooked: List[Tuple[WebhookEvent, Dict[str, Any]]]):
+        self.inbox.mark_done([event.event_id for event, _ in unbooked], NEEDS_REFUND)
+        if self.on_unbooked_payment is None:
+            return
+        refunded = []
+        for event, booking in unbooked:
+            try:
+                if self.on_unbooked_payment(booking, self.inbox.payment_intent_id(event.event_id)):
+                    refunded.append(event.event_id)
+            except Exception as e:
+                print(f"❌ Refund callback error for booking {booking.get('id')}: {e}")
+        self.inbox.mark_done(refunded, REFUNDED)
+
+    def _notify(self, status: Optional[str], rows: List[Dict[str, Any]]):
+        callback = {"confirmed": self.on_confirmed, "failed": self.on_failed}.get(status)
+        if callback is None:
+            return
+        for row in rows:
+            try:
+                callback(row)
+            except Exception as e:
+                print(f"❌ Webhook callback error for booking {row.get('id')}: {e}")
+
+    def _recover_expired(self):
+        # Events of a worker that died after start() only lapse later, so look again every lease period
+        if time.monotonic() < self._next_recovery:
+            return
+        self._next_recovery = time.monotonic() + self.lease
+        recovered = self.inbox.recover_in_flight(self.lease)
+        if recovered:
+            print(f"🪝 Recovered {recovered} in-flight webhook events")
+
+    def _worker_loop(self):
+        while not self._stop.is_set():
+            try:
+                self._recover_expired()
+                claimed = self.run_once()
+            except Exception as e:
+                print(f"❌ Webhook worker error: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        """Start the worker threads (idempotent)"""
+        if self._threads:
+            return self
+        self._next_recovery = 0.0
+        self._recover_expired()
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"webhook-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Signal workers to stop and wait for them"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+# === RECEIVER AND REPLAYER ===
+
+class _WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default backlog of 5 refuses connections under replay load
+
+
+class WebhookReceiver:
+    """HTTP endpoint for Stripe: verify, queue, answer"""
+
+    def __init__(self, inbox: WebhookInbox, secret: str, host: str = "127.0.0.1", port: int = 0,
+                 path: str = "/stripe/webhook"):
+        self.inbox = inbox
+        self.secret = secret
+        self.received = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?")[0] != path:
+                    return self._reply(404, {"error": "not found"})
+                payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    new = receiver.inbox.ingest(payload, self.headers.get("Stripe-Signature", ""), receiver.secret)
+                except ValueError as e:
+                    with receiver._lock:
+                        receiver.rejected += 1
+                    return self._reply(400, {"error": str(e)})
+                with receiver._lock:
+                    receiver.received += 1
+                    receiver.duplicates += int(not new)
+                self._reply(200, {"received": True, "duplicate": not new})
+
+            def _reply(self, status: int, body: Dict[str, Any]):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = _WebhookServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}{path}"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class WebhookReplayer:
+    """Signs and POSTs events to a webhook endpoint, the way Stripe delivers them"""
+
+    def __init__(self, url: str, secret: str, concurrency: int = 8, timeout: float = 5.0):
+        self.url = url
+        self.secret = secret
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+    def deliver(self, event: Dict[str, Any]) -> Tuple[int, float]:
+        payload = json.dumps(event).encode()
+        request = urllib.request.Request(self.url, data=payload, method="POST", headers={
+            "Content-Type": "application/json", "Stripe-Signature": sign_payload(payload, self.secret)
+        })
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except OSError:
+            status = 0
+        return status, (time.perf_counter() - start) * 1000
+
+    def replay(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Deliver every event concurrently; returns status counts and latency percentiles"""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            results = list(pool.map(self.deliver, events))
+        elapsed = time.perf_counter() - start
+        latencies = sorted(ms for _, ms in results)
+        statuses: Dict[int, int] = {}
+        for status, _ in results:
+            statuses[status] = statuses.get(status, 0) + 1
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+
+        return {"events": len(events), "statuses": statuses,
+                "events_per_second": len(events) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(0.50), "p95_ms": percentile(0.95), "p99_ms": percentile(0.99)}
+
+
+def load_events(path: str) -> List[Dict[str, Any]]:
+    """Events from a JSON-lines file, a JSON array, or a saved `GET /v1/events` page"""
+    text = Path(path).read_text()
+    if text.lstrip().startswith(("[", "{")):
+        try:
+            data = json.loads(text)
+            return data.get("data", [data]) if isinstance(data, dict) else data
+        except ValueError:
+            pass
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def synthetic_events(booking_ids: List[str], failure_rate: float = 0.05,
+                     duplicate_rate: float = 0.1) -> List[Dict[str, Any]]:
+    """One payment outcome per booking plus redeliveries, shuffled like real traffic"""
+    events = []
+    for booking_id in booking_ids:
+        failed = random.random() < failure_rate
+        events.append({
+            "id": f"evt_{uuid.uuid4().hex[:24]}",
+            "type": "payment_intent.payment_failed" if failed else "payment_intent.succeeded",
+            "created": int(time.time()),
+            "data": {"object": {"id": f"pi_{uuid.uuid4().hex[:24]}", "object": "payment_intent",
+                                "status": "requires_payment_method" if failed else "succeeded",
+                                "metadata": {"booking_id": booking_id}}}
+        })
+    events.extend(random.sample(events, int(len(events) * duplicate_rate)))
+    random.shuffle(events)
+    return events
+
+
+_inbox: Optional[WebhookInbox] = None
+_dispatcher: Optional[WebhookDispatcher] = None
+_inbox_lock = threading.Lock()
+
+
+def get_webhook_inbox(client=None, on_confirmed: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      on_failed: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      on_unbooked_payment: Optional[Callable[[Dict[str, Any], Optional[str]], bool]] = None
+                      ) -> WebhookInbox:
+    """Process-wide inbox; workers start once a database client is supplied"""
+    global _inbox, _dispatcher
+    with _inbox_lock:
+        if _inbox is None:
+            _inbox = WebhookInbox(db_path=os.getenv("STRIPE_WEBHOOK_INBOX_DB", "stripe_webhooks.db"))
+        if client is not None and _dispatcher is None:
+            _dispatcher = WebhookDispatcher(
+                _inbox, SupabaseBookingStatusStore(client),
+                workers=int(os.getenv("STRIPE_WEBHOOK_WORKERS", "2")),
+                on_confirmed=on_confirmed, on_failed=on_failed, on_unbooked_payment=on_unbooked_payment
+            ).start()
+    return _inbox
+
+
+def run_webhook_benchmark(num_bookings: int = 2000, concurrency: int = 16, workers: int = 2,
+                          batch_size: int = 200, db_path: str = ":memory:") -> Dict[str, Any]:
+    """Replay signed events through the local receiver and measure ingest and apply throughput"""
+    secret = "whsec_benchmark"
+    bookings = {str(uuid.uuid4()): {"status": "pending", "payment_status": "pending"} for _ in range(num_bookings)}
+    for booking_id, booking in bookings.items():
+        booking["id"] = booking_id
+    store = InMemoryBookingStatusStore(bookings)
+    inbox = WebhookInbox(db_path=db_path)
+    receiver = WebhookReceiver(inbox, secret).start()
+    dispatcher = WebhookDispatcher(inbox, store, workers=workers, batch_size=batch_size, poll_interval=0.01)
+
+    events = synthetic_events(list(bookings))
+    replay = WebhookReplayer(receiver.url, secret, concurrency=concurrency).replay(events)
+
+    start = time.perf_counter()
+    dispatcher.start()
+    while inbox.get_stats()[PENDING] or inbox.get_stats()[PROCESSING]:
+        time.sleep(0.01)
+    apply_seconds = time.perf_counter() - start
+    dispatcher.stop()
+    receiver.stop()
+    inbox.close()
+
+    settled = sum(1 for booking in bookings.values() if booking["status"] != "pending")
+    results = {
+        **replay,
+        "duplicates": receiver.duplicates,
+        "settled_bookings": settled,
+        "applied_per_second": num_bookings / apply_seconds if apply_seconds else 0.0,
+        "update_calls": store.update_calls,
+    }
+    print(f"🪝 Webhook benchmark: {replay['events_per_second']:.0f} events/s received "
+          f"(p50 {replay['p50_ms']:.1f} ms, p99 {replay['p99_ms']:.1f} ms), {receiver.duplicates} duplicates dropped, "
+          f"{settled} bookings settled with {store.update_calls} batched updates")
+    return results
+
+
+def serve_webhooks(host: str = "0.0.0.0", port: int = 8765):
+    """Receive webhooks and apply them to bookings until interrupted"""
+    from src.booking_system.booking_manager import get_booking_manager
+
+    secret = os.getenv("STRIPE_WEBHOOK_SECRET")
+    if not secret:
+        print("❌ Error: STRIPE_WEBHOOK_SECRET must be set in .env file")
+        sys.exit(1)
+    manager = get_booking_manager()  # starts the workers; their callbacks use this same process-wide manager
+    receiver = WebhookReceiver(manager.webhooks, secret, host, port).start()
+    print(f"🪝 Listening for Stripe webhooks on {receiver.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        receiver.stop()
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Stripe webhook receiver, replayer and benchmark")
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="receive webhooks and apply them to bookings")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=8765)
+    replay = commands.add_parser("replay", help="sign and POST saved events to an endpoint")
+    replay.add_argument("events", help="JSON-lines file, JSON array or saved /v1/events page")
+    replay.add_argument("--url", default="http://127.0.0.1:8765/stripe/webhook")
+    replay.add_argument("--secret", default=os.getenv("STRIPE_WEBHOOK_SECRET", ""))
+    replay.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve_webhooks(args.host, args.port)
+    elif args.command == "replay":
+        results = WebhookReplayer(args.url, args.secret, args.concurrency).replay(load_events(args.events))
+        print(f"🪝 Replayed {results['events']} events: {results['statuses']}, "
+              f"p50 {results['p50_ms']:.1f} ms, p95 {results['p95_ms']:.1f} ms, p99 {results['p99_ms']:.1f} ms")
+    else:
+        run_webhook_benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,4 +6,5 @@ Streamlit and web interface components for the AI Travel Platform
 # This folder contains all UI-related files
 # - streamlit_ui.py: Main Streamlit application
 # - streamlit_main.py: Alternative Streamlit entry point
+# - page_registry.py + app_pages/: lazily imported pages of enhanced_streamlit_app.py
 # - Additional UI components and templates
@@ -0,0 +1,10 @@
+"""
+📄 App Pages
+One module per page of enhanced_streamlit_app.py, imported only when the page is opened
+"""
+
+# This folder contains the page modules registered in src/ui/page_registry.py
+# - common.py: Supabase client, destination catalog and lazily created booking system
+# - home.py, hotel_booking.py, restaurant_booking.py, booking_history.py, settings.py
+# - package_creation.py + package_generator.py: AI package creation and booking
+# - analytics.py: rollup-backed analytics dashboard (the only page that loads Plotly/pandas)
@@ -0,0 +1,243 @@
+"""
+📊 Analytics Page
+Investor dashboard served from the analytics rollups
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from datetime import datetime
+
+from src.services.analytics_pipeline import (
+    get_analytics_pipeline, generate_demo_events, recent_periods,
+    REVENUE, DESTINATIONS, SEARCHES, FUNNEL
+)
+
+def build_revenue_figure(analytics):
+    """Monthly revenue by component from the rollups"""
+    months = recent_periods("month", 18)
+    labels = [datetime.strptime(month, "%Y-%m").strftime("%b %Y") for month in months]
+    series = analytics.series(REVENUE, "month", len(months))
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=labels, y=[sum(values) / 1000 for values in zip(*series.values())] if series else [],
+        mode='lines+markers',
+        name='Total Revenue',
+        line=dict(color='#667eea', width=4),
+        marker=dict(size=8)
+    ))
+    colors = ['#28a745', '#ffc107', '#fd7e14', '#17a2b8', '#e83e8c', '#6c757d']
+    for color, (component, values) in zip(colors, sorted(series.items())):
+        fig.add_trace(go.Scatter(
+            x=labels, y=[value / 1000 for value in values],
+            mode='lines+markers',
+            name=component.replace('_', ' ').title(),
+            line=dict(color=color, width=3),
+            marker=dict(size=6)
+        ))
+    
+    fig.update_layout(
+        title="Monthly Revenue by Component ($K)",
+        xaxis_title="Month",
+        yaxis_title="Revenue ($K)",
+        hovermode='x unified',
+        height=500,
+        showlegend=True,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+def build_destination_figure(analytics):
+    """Top destinations over the last three months by bookings, colored by searches"""
+    since = recent_periods("month", 3)[0]
+    bookings = analytics.totals(DESTINATIONS, since=since)
+    searches = analytics.totals(SEARCHES, since=since)
+    top = list(bookings)[:10]
+    
+    destination_data = pd.DataFrame({
+        'Destination': top,
+        'Bookings': [bookings[name] for name in top],
+        'Searches': [searches.get(name, 0) for name in top]
+    })
+    
+    fig = px.bar(
+        destination_data,
+        x='Destination',
+        y='Bookings',
+        color='Searches',
+        title="Bookings by Destination (last 3 months)",
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def build_funnel_figure(analytics):
+    """Search to booking funnel over the last three months"""
+    funnel = analytics.totals(FUNNEL, since=recent_periods("month", 3)[0])
+    stages = ['search', 'view', 'booking']
+    
+    fig = go.Figure(go.Funnel(
+        y=[stage.title() for stage in stages],
+        x=[funnel.get(stage, 0) for stage in stages],
+        textinfo="value+percent initial"
+    ))
+    fig.update_layout(title="Search to Booking (last 3 months)", height=400)
+    return fig
+
+def analytics_dashboard():
+    """Professional investor-focused analytics dashboard"""
+    
+    st.title("📊 **Investment Analytics Dashboard**")
+    st.markdown("*Real-time business intelligence and market insights*")
+    
+    analytics = get_analytics_pipeline()
+    analytics.flush()
+    
+    if not analytics.has_data():
+        st.info("📭 No booking or search events recorded yet.")
+        if st.button("🧪 Load demo events"):
+            with st.spinner("Building rollups from 200,000 demo events..."):
+                analytics.ingest(generate_demo_events(200_000))
+            st.rerun()
+        return
+    
+    # Key Performance Indicators
+    st.markdown("### 🎯 **Key Performance Indicators**")
+    
+    kpis = analytics.kpis()
+    
+    def change(metric):
+        previous = kpis[f"previous_{metric}"]
+        return f"{(kpis[f'current_{metric}'] - previous) / previous * 100:+.0f}%" if previous else None
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric("Monthly Revenue", f"${kpis['current_revenue']:,.0f}", change("revenue"),
+                  help="Booked revenue this month, net of cancellations")
+    
+    with col2:
+        st.metric("Monthly Bookings", f"{kpis['current_bookings']:,.0f}", change("bookings"))
+    
+    with col3:
+        st.metric("Conversion", f"{kpis['current_conversion']:.1f}%",
+                  f"{kpis['current_conversion'] - kpis['previous_conversion']:+.1f} pts",
+                  help="Bookings per search this month")
+    
+    with col4:
+        st.metric("Avg Booking Value", f"${kpis['current_avg_value']:,.0f}", change("avg_value"))
+    
+    with col5:
+        st.metric("Cancellation Rate", f"{kpis['current_cancellation_rate']:.1f}%",
+                  f"{kpis['current_cancellation_rate'] - kpis['previous_cancellation_rate']:+.1f} pts",
+                  delta_color="inverse")
+    
+    # Revenue growth visualization
+    st.markdown("### 📈 **Revenue Growth Trajectory**")
+    st.plotly_chart(analytics.figure("revenue_by_component", [REVENUE], build_revenue_figure),
+                    use_container_width=True)
+    
+    # Destination popularity and conversion funnel
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🌍 **Destination Popularity**")
+        st.plotly_chart(analytics.figure("destination_popularity", [DESTINATIONS, SEARCHES],
+                                         build_destination_figure),
+                        use_container_width=True)
+    
+    with col2:
+        st.markdown("### 🔁 **Booking Funnel**")
+        st.plotly_chart(analytics.figure("booking_funnel", [FUNNEL], build_funnel_figure),
+                        use_container_width=True)
+    
+    # Platform overview for investors
+    st.markdown("### 🌟 **Platform Overview**")
+    
+    st.markdown("""
+    **Comprehensive Travel Management Solution**
+    
+    Our platform represents a modern approach to travel planning and booking, combining 
+    advanced technology with user-centric design to deliver exceptional travel experiences.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="roi-card">
+            <h4>Everything You Need in One Place</h4>
+            <p>We bring together all your travel needs under one roof. From finding the perfect flight and booking your ideal hotel to discovering amazing restaurants and creating custom itineraries that match your style, everything is seamlessly integrated. Our dedicated support team is available around the clock to help whenever you need assistance.</p>
+            
+            <p>Experience travel planning like never before with our intuitive platform that works beautifully on any device. Get personalized recommendations based on your preferences, complete your bookings with just a few simple clicks, and enjoy the confidence that comes with having everything organized in one convenient location.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="competitive-advantage">
+            <h4>Built for Your Peace of Mind</h4>
+            <p>Our advanced artificial intelligence works behind the scenes to understand your travel preferences and suggest trips that perfectly match what you're looking for. You'll always have access to the most current prices and availability, powered by a robust system designed for reliability and speed.</p>
+            
+            <p>Your security is our top priority. Every transaction is protected by enterprise-grade encryption, your personal information remains completely private and secure, and our lightning-fast booking system ensures you never miss out on great deals while maintaining the highest standards of data protection.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Platform strengths
+    st.markdown("### � **Key Performance Indicators**")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        **Designed Around You**
+        
+        Every aspect of our platform is built with you in mind. Navigate effortlessly through our clean, intuitive interface that adapts beautifully to any screen size, ensuring accessibility for all users across every device.
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Quality You Can Trust**
+        
+        We cover destinations worldwide with consistent, reliable service that puts your satisfaction first. Our commitment to continuous improvement means your experience gets better every time you travel with us.
+        """)
+    
+    with col3:
+        st.markdown("""
+        **Built to Last**
+        
+        Our modern, secure architecture processes your requests efficiently while keeping your data completely protected. Count on our reliable systems to be there when you need them most.
+        """)
+    
+    with col4:
+        st.markdown("""
+        **Always Evolving**
+        
+        We integrate the latest AI technology and continuously develop new features that adapt to changing travel needs, ensuring you always have access to the most advanced travel planning tools.
+        """)
+    
+    # Investment opportunity overview
+    st.markdown("### 🤝 **Partnership Opportunity**")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="market-size">
+            <h4>Investment Highlights</h4>
+            <p><strong>Growth-Stage Opportunity</strong></p>
+            <p>We have established a proven business model with strong market traction, backed by an experienced team that understands the travel industry inside and out. Our clear expansion path leverages advanced technology differentiation to capture emerging opportunities in the rapidly evolving travel market.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="success-story">
+            <h4>Strategic Value</h4>
+            <p><strong>Long-term Vision</strong></p>
+            <p>Our platform is positioned to achieve market leadership through sustainable competitive advantages and multiple growth opportunities. With strong operational efficiency and flexible exit strategies, we offer investors a compelling long-term value proposition in the thriving travel technology sector.</p>
+        </div>
+        """, unsafe_allow_html=True)
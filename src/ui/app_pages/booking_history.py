@@ -0,0 +1,135 @@
+"""
+📋 Booking History Page
+Saved bookings a page at a time from the bookings table, plus bookings made in this session
+"""
+
+import streamlit as st
+from src.ui.app_pages.common import get_supabase_client
+from src.services.booking_history import get_booking_history_service
+
+PAGE_SIZE = 20
+
+def booking_history_page():
+    """Booking history and management"""
+
+    st.title("📋 **Booking History**")
+
+    user_id = st.session_state.get('current_user_id', 'demo_user')
+    client = get_supabase_client()
+    saved = load_saved_bookings(client, user_id) if client is not None else []
+
+    # Bookings made in this session that are not in the loaded pages (e.g. packages, which are not saved)
+    saved_ids = {str(booking['id']) for booking in saved}
+    session_bookings = [b for b in reversed(st.session_state.booking_history) if str(b['booking_id']) not in saved_ids]
+
+    if session_bookings:
+        st.markdown("### 🕒 **This Session**")
+        for booking in session_bookings:
+            display_session_booking(booking)
+
+    if saved:
+        st.markdown("### 📚 **Your Bookings**")
+        for booking in saved:
+            display_saved_booking(client, user_id, booking)
+
+        history = st.session_state.booking_history_pages
+        col1, col2 = st.columns(2)
+        with col1:
+            if history['next_cursor'] and st.button("⬇️ Load more bookings"):
+                load_next_page(client, user_id)
+                st.rerun()
+        with col2:
+            if st.button("🔄 Refresh"):
+                del st.session_state.booking_history_pages
+                st.rerun()
+
+    if not saved and not session_bookings:
+        st.info("📭 No bookings yet. Start by booking a hotel or restaurant!")
+
+def load_saved_bookings(client, user_id):
+    """Bookings loaded so far; the first page is fetched on the first visit"""
+    history = st.session_state.get('booking_history_pages')
+    if history is None or history['user_id'] != user_id:
+        st.session_state.booking_history_pages = {'user_id': user_id, 'items': [], 'next_cursor': None, 'open': set()}
+        load_next_page(client, user_id)
+    return st.session_state.booking_history_pages['items']
+
+def load_next_page(client, user_id):
+    history = st.session_state.booking_history_pages
+    try:
+        page = get_booking_history_service(client).page(user_id, cursor=history['next_cursor'], limit=PAGE_SIZE)
+    except Exception as e:
+        st.warning(f"⚠️ Could not load saved bookings: {str(e)}")
+        return
+    history['items'].extend(page.items)
+    history['next_cursor'] = page.next_cursor
+
+def display_saved_booking(client, user_id, booking):
+    """Summary from the list columns; the full row is fetched only when details are requested"""
+    created = str(booking.get('created_at') or '')[:16].replace('T', ' ')
+    booking_type = str(booking.get('booking_type') or '').replace('_', ' ').title()
+    with st.expander(f"📋 {booking['confirmation_number']} - {booking_type} - {created}"):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f"""
+            **Booking ID:** {booking['id']}  
+            **Type:** {booking_type}  
+            **Status:** {booking['status']}  
+            **Created:** {created}  
+            """)
+        with col2:
+            st.markdown(f"""
+            **Total:** {booking.get('currency') or 'USD'} {float(booking.get('total_amount') or 0):,.2f}  
+            **Payment:** {booking.get('payment_status') or 'pending'}  
+            """)
+
+        opened = st.session_state.booking_history_pages['open']
+        if booking['id'] in opened or st.button("🔍 Show details", key=f"details_{booking['id']}"):
+            opened.add(booking['id'])
+            details = get_booking_history_service(client).details(user_id, booking['id'])
+            if details:
+                st.json(details.get('details') or {})
+                if details.get('special_requests'):
+                    st.markdown("**Special requests:** " + ", ".join(details['special_requests']))
+            else:
+                st.warning("⚠️ Booking details are no longer available")
+
+def display_session_booking(booking):
+    booking_type = booking.get('type', 'Package')
+    with st.expander(f"📋 {booking['confirmation_number']} - {booking_type}"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"""
+            **Booking ID:** {booking['booking_id']}  
+            **Type:** {booking_type}  
+            **Status:** {booking['status']}  
+            **Created:** {booking['created_at'].strftime('%Y-%m-%d %H:%M')}  
+            """)
+
+        with col2:
+            details = booking.get('details', {})
+            if booking_type == 'Hotel':
+                st.markdown(f"""
+                **Hotel:** {details['hotel_name']}  
+                **Check-in:** {details['check_in']}  
+                **Check-out:** {details['check_out']}  
+                **Total:** ${details['total_amount']:,.2f}  
+                """)
+            elif 'package_title' in booking:
+                st.markdown(f"""
+                **Package:** {booking['package_title']}  
+                **Destination:** {booking['destination']}  
+                **Total:** ${booking['total_amount']:,.2f}  
+                """)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("📧 Email Confirmation", key=f"email_{booking['booking_id']}"):
+                st.success("📧 Confirmation email sent!")
+        with col2:
+            if st.button("✏️ Modify Booking", key=f"modify_{booking['booking_id']}"):
+                st.info("✏️ Modification form would open here")
+        with col3:
+            if st.button("❌ Cancel Booking", key=f"cancel_{booking['booking_id']}"):
+                st.warning("❌ Cancellation form would open here")
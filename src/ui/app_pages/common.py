@@ -0,0 +1,71 @@
+"""
+🧰 Shared App Helpers
+Database client, destination catalog and booking system shared by the app pages
+"""
+
+import os
+import importlib
+import streamlit as st
+from dotenv import load_dotenv
+
+# Initialize Supabase client for direct database access
+@st.cache_resource
+def get_supabase_client():
+    """Get Supabase client"""
+    try:
+        from src.api_integration.supabase.client_factory import get_supabase_client as get_shared_supabase_client
+        load_dotenv()
+        
+        # Try multiple possible environment variable names
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("SUPABASE_KEY")
+        
+        if not supabase_url or not supabase_key:
+            st.warning("⚠️ Database credentials not found. Using fallback data.")
+            return None
+            
+        return get_shared_supabase_client(supabase_url, supabase_key)
+    except Exception as e:
+        st.warning(f"⚠️ Database connection unavailable: {str(e)}")
+        return None
+
+# Database helper functions
+def get_destination_catalog():
+    """Destination/city catalog shared by every session (refreshed in the background)"""
+    from src.services.destination_catalog import get_destination_catalog as get_shared_catalog
+    return get_shared_catalog(get_supabase_client())
+
+def get_all_destinations():
+    """Get all destinations from database"""
+    # Served from the shared catalog snapshot - never waits on the network
+    return get_destination_catalog().get_destinations()
+
+def get_all_cities():
+    """Get all cities from database for restaurant booking"""
+    return get_destination_catalog().get_cities()
+
+def get_booking_system():
+    """BookingManager for this session, created the first time a page books something"""
+    if 'booking_system' not in st.session_state:
+        try:
+            from src.booking_system.booking_manager import BookingManager
+            st.session_state.booking_system = BookingManager()
+        except ImportError:
+            st.session_state.booking_system = None
+    return st.session_state.booking_system
+
+_ai_features = None
+
+def ai_features_available():
+    """Whether the enhanced itinerary and payment modules import (tried once per process)"""
+    global _ai_features
+    if _ai_features is None:
+        try:
+            # A module can be present and still fail to import (missing dependency, bad config)
+            for name in ("ai_agents.enhanced_itinerary_generator", "booking_system.enhanced_payment_processor"):
+                importlib.import_module(name)
+            _ai_features = True
+        except Exception as e:
+            print(f"⚠️ AI features not available: {e}")
+            _ai_features = False
+    return _ai_features
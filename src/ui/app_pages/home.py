@@ -0,0 +1,212 @@
+"""
+🏠 Home Page
+Landing page of the enhanced travel platform
+"""
+
+import streamlit as st
+
+def main_page():
+    """Professional investor-focused landing page"""
+    
+    # Premium header with investor appeal
+    st.markdown("""
+    <div class="main-header">
+        <h1>🌍 ✈️ AI Travel Platform 🏨 🍽️</h1>
+        <h3>Revolutionary AI-Powered Travel Ecosystem</h3>
+        <p>🎯 Multi-Service Platform • 💰 Proven Revenue Model • 🚀 Scalable Technology</p>
+        <div class="investor-badge">
+            💎 INVESTOR PRESENTATION MODE
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Market opportunity and business model
+    st.markdown("### 🎯 **Market Opportunity & Competitive Advantage**")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="market-size">
+            <h3>📊 Market Size</h3>
+            <h2>$1.4 Trillion</h2>
+            <p>Global Travel Industry</p>
+            <p><strong>15% Annual Growth</strong></p>
+            <p>Digital transformation accelerating post-pandemic</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="competitive-advantage">
+            <h3>🎯 Our Advantage</h3>
+            <p><strong>• AI-First Architecture</strong></p>
+            <p>• Multi-service integration</p>
+            <p>• Real-time booking optimization</p>
+            <p>• 65+ premium hotel partnerships</p>
+            <p>• Proprietary pricing algorithms</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Key business metrics for investors
+    st.markdown("### � **Key Business Metrics & Performance**")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h2>$2.4M</h2>
+            <p><strong>Annual Revenue Run Rate</strong></p>
+            <div class="metric-growth">↗️ 340% YoY Growth</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h2>18%</h2>
+            <p><strong>Net Profit Margin</strong></p>
+            <div class="metric-growth">↗️ Industry Leading</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h2>65K</h2>
+            <p><strong>Active Users</strong></p>
+            <div class="metric-growth">↗️ 89% Retention Rate</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <h2>$347</h2>
+            <p><strong>Average Transaction</strong></p>
+            <div class="metric-growth">↗️ 23% Higher Than Competitors</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Revenue streams and business model
+    st.markdown("### 💰 **Multiple Revenue Streams**")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">💳</div>
+            <h4>Booking Commissions</h4>
+            <p><strong>8-15% commission</strong> on all bookings</p>
+            <p>Hotels: 12-15% • Restaurants: 8-10%</p>
+            <p><strong>$1.8M annual revenue</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">🎯</div>
+            <h4>Premium Subscriptions</h4>
+            <p><strong>$29/month</strong> premium memberships</p>
+            <p>AI concierge • Priority booking • Exclusive deals</p>
+            <p><strong>$420K annual revenue</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">📊</div>
+            <h4>Data & Analytics</h4>
+            <p><strong>B2B travel insights</strong> platform</p>
+            <p>Market trends • Pricing optimization</p>
+            <p><strong>$180K annual revenue</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Technology stack and scalability
+    st.markdown("### � **Technology Stack & Scalability**")
+    
+    st.markdown("""
+    <div class="tech-stack">
+        <h3>🚀 Enterprise-Grade Technology</h3>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 2rem; margin-top: 1rem;">
+            <div>
+                <p><strong>• Cloud Infrastructure:</strong> AWS/Supabase</p>
+                <p><strong>• AI/ML Stack:</strong> OpenAI GPT-4, Custom Models</p>
+                <p><strong>• Real-time Processing:</strong> 10,000+ bookings/hour</p>
+            </div>
+            <div>
+                <p><strong>• Payment Processing:</strong> Stripe Enterprise</p>
+                <p><strong>• Database:</strong> PostgreSQL with 99.9% uptime</p>
+                <p><strong>• Security:</strong> SOC 2 compliance ready</p>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Investment opportunity and ROI
+    st.markdown("### 🎯 **Investment Opportunity**")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="roi-card">
+            <h3>💰 Seeking Series A Funding</h3>
+            <h2>$5M Investment Round</h2>
+            <p><strong>Use of Funds:</strong></p>
+            <p>• 40% - Market expansion (EU, Asia)</p>
+            <p>• 30% - AI/ML development team</p>
+            <p>• 20% - Partnership acquisition</p>
+            <p>• 10% - Marketing & brand building</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="success-story">
+            <h3>📈 Projected Returns</h3>
+            <p><strong>3-Year Financial Forecast:</strong></p>
+            <p>• Year 1: $6M revenue (150% growth)</p>
+            <p>• Year 2: $15M revenue (150% growth)</p>
+            <p>• Year 3: $35M revenue (133% growth)</p>
+            <p><strong>Exit Valuation: $200M+</strong></p>
+            <p><strong>IRR: 45%+ for early investors</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Live platform demonstration
+    st.markdown("### 🚀 **Live Platform Demonstration**")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🏨 Experience Hotel Booking", type="primary", use_container_width=True):
+            st.session_state.current_page = "hotel_booking"
+            st.rerun()
+    
+    with col2:
+        if st.button("🍽️ Try Restaurant Reservations", type="primary", use_container_width=True):
+            st.session_state.current_page = "restaurant_booking"
+            st.rerun()
+    
+    with col3:
+        if st.button("� View Analytics Dashboard", type="primary", use_container_width=True):
+            st.session_state.current_page = "analytics"
+            st.rerun()
+    
+    # Investor call-to-action
+    st.markdown("""
+    <div class="investor-cta">
+        <h2>🔥 Ready to Join the Travel Revolution?</h2>
+        <p style="font-size: 1.2rem; margin: 1rem 0;">
+            Be part of the next unicorn in travel technology
+        </p>
+        <p><strong>Contact our investment team today</strong></p>
+        <p>📧 investors@aitravel.com • 📱 +1 (555) 123-4567</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,276 @@
+"""
+🏨 Hotel Booking Page
+Hotel search and booking form
+"""
+
+import streamlit as st
+from datetime import datetime, timedelta
+
+from src.ui.app_pages.common import get_all_destinations, get_booking_system
+from src.services.analytics_pipeline import record_event
+from src.core.package_model import compact
+
+def hotel_booking_page():
+    """Enhanced hotel booking interface"""
+    
+    st.title("🏨 **Hotel Booking System**")
+    st.markdown("*Book from our collection of 65+ verified hotels worldwide*")
+    
+    # Booking form
+    with st.container():
+        st.markdown("### 🔍 **Search Hotels**")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            destinations_list = get_all_destinations()
+            destination = st.selectbox("🌍 Destination", destinations_list)
+        
+        with col2:
+            check_in = st.date_input("📅 Check-in", datetime.now() + timedelta(days=7))
+        
+        with col3:
+            check_out = st.date_input("📅 Check-out", datetime.now() + timedelta(days=10))
+        
+        with col4:
+            guests = st.number_input("👥 Guests", 1, 10, 2)
+    
+    # Search and display hotels
+    if st.button("🔍 Search Hotels", type="primary"):
+        with st.spinner("🔍 Searching available hotels..."):
+            hotels = get_available_hotels(destination)
+            st.session_state.selected_hotels = hotels
+            record_event("search", component="hotel", destination=destination, user_id="demo_user")
+    
+    # Display hotels if available
+    if st.session_state.selected_hotels:
+        st.markdown("### 🏨 **Available Hotels**")
+        
+        for i, hotel in enumerate(st.session_state.selected_hotels):
+            with st.expander(f"🏨 {hotel['name']} - ⭐ {hotel['rating']}/5", expanded=(i == 0)):
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.markdown(f"""
+                    <div class="hotel-card">
+                        <h4>{hotel['name']}</h4>
+                        <p><strong>📍 Location:</strong> {hotel['location']}</p>
+                        <p><strong>⭐ Rating:</strong> {hotel['rating']}/5 ({hotel.get('review_count', 'N/A')} reviews)</p>
+                        <p><strong>🏷️ Type:</strong> {hotel.get('type', 'Hotel')}</p>
+                        <p><strong>✨ Amenities:</strong> Wi-Fi, Pool, Spa, Gym, Restaurant</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    nights = (check_out - check_in).days
+                    total_price = float(hotel['price']) * nights
+                    
+                    st.markdown(f"""
+                    <div class="price-tag">
+                        ${hotel['price']}/night
+                    </div>
+                    <br>
+                    <p><strong>Total ({nights} nights):</strong> ${total_price:,.2f}</p>
+                    """, unsafe_allow_html=True)
+                    
+                    if st.button(f"📋 Book {hotel['name']}", key=f"book_hotel_{i}"):
+                        record_event("view", component="hotel", destination=destination, user_id="demo_user")
+                        book_hotel_form(hotel, check_in, check_out, guests)
+
+def book_hotel_form(hotel, check_in, check_out, guests):
+    """Hotel booking form"""
+    
+    st.markdown("---")
+    st.markdown(f"### 📋 **Booking: {hotel['name']}**")
+    
+    with st.form(f"hotel_booking_form_{hotel['id']}"):
+        # Customer details
+        st.markdown("**👤 Guest Information**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            first_name = st.text_input("First Name*")
+            email = st.text_input("Email*")
+            phone = st.text_input("Phone*")
+        
+        with col2:
+            last_name = st.text_input("Last Name*")
+            guest_count = st.number_input("Number of Guests", 1, 10, guests)
+            room_type = st.selectbox("Room Type", ["Standard", "Deluxe", "Suite", "Family Room"])
+        
+        # Special requests
+        special_requests = st.text_area("Special Requests (Optional)", 
+                                      placeholder="e.g., Late check-in, airport pickup, dietary requirements")
+        
+        # Payment simulation
+        st.markdown("**💳 Payment Information**")
+        payment_method = st.selectbox("Payment Method", ["Credit Card", "Debit Card", "PayPal"])
+        
+        # Calculate pricing
+        nights = (check_out - check_in).days
+        base_price = float(hotel['price']) * nights
+        tax = base_price * 0.12  # 12% tax
+        service_fee = base_price * 0.02  # 2% service fee
+        total_amount = base_price + tax + service_fee
+        
+        # Pricing breakdown
+        st.markdown("**💰 Pricing Breakdown**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            - **Base Price:** ${base_price:,.2f}
+            - **Tax (12%):** ${tax:,.2f}
+            - **Service Fee (2%):** ${service_fee:,.2f}
+            """)
+        
+        with col2:
+            st.markdown(f"""
+            <div class="price-tag">
+                **Total: ${total_amount:,.2f}**
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Terms and submit
+        terms_accepted = st.checkbox("I accept the terms and conditions*")
+        
+        submitted = st.form_submit_button("🎉 Confirm Booking", type="primary")
+        
+        if submitted:
+            if all([first_name, last_name, email, phone, terms_accepted]):
+                # Process booking
+                with st.spinner("🔄 Processing your hotel booking..."):
+                    try:
+                        booking_confirmation = get_booking_system().book_hotel(
+                            user_id="demo_user",
+                            hotel_id=str(hotel['id']),
+                            check_in=check_in.strftime("%Y-%m-%d"),
+                            check_out=check_out.strftime("%Y-%m-%d"),
+                            room_type=room_type,
+                            guests=guest_count,
+                            special_requests=[special_requests] if special_requests else []
+                        )
+                        
+                        # Success message
+                        st.markdown(f"""
+                        <div class="booking-success">
+                            <h3>🎉 Booking Confirmed!</h3>
+                            <p><strong>Confirmation Number:</strong> {booking_confirmation.confirmation_number}</p>
+                            <p><strong>Hotel:</strong> {hotel['name']}</p>
+                            <p><strong>Dates:</strong> {check_in} to {check_out}</p>
+                            <p><strong>Total Amount:</strong> ${total_amount:,.2f}</p>
+                            <p><strong>Status:</strong> {booking_confirmation.status.value.title()}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        st.balloons()
+                        
+                        # Add to booking history
+                        booking_record = {
+                            'booking_id': booking_confirmation.booking_id,
+                            'confirmation_number': booking_confirmation.confirmation_number,
+                            'type': 'Hotel',
+                            'details': {
+                                'hotel_name': hotel['name'],
+                                'check_in': check_in.strftime("%Y-%m-%d"),
+                                'check_out': check_out.strftime("%Y-%m-%d"),
+                                'guests': guest_count,
+                                'total_amount': total_amount
+                            },
+                            'status': booking_confirmation.status.value,
+                            'created_at': datetime.now()
+                        }
+                        
+                        st.session_state.booking_history.append(compact(booking_record))
+                        
+                    except Exception as e:
+                        st.error(f"❌ Booking failed: {str(e)}")
+                        st.error("Please try again or contact support.")
+            else:
+                st.error("❌ Please fill in all required fields and accept the terms.")
+
+def get_available_hotels(destination):
+    """Get available hotels for specific destination with accurate naming"""
+    
+    # Destination-specific hotel database
+    hotels_database = {
+        'China': [
+            {'id': 1, 'name': 'The Peninsula Beijing', 'location': 'Beijing, China', 'rating': 4.9, 'price': 320, 'type': 'Luxury', 'amenities': ['Spa', 'Fine Dining', 'Concierge', 'Fitness Center']},
+            {'id': 2, 'name': 'Grand Mercure Beijing Central', 'location': 'Beijing, China', 'rating': 4.5, 'price': 180, 'type': 'Business', 'amenities': ['Business Center', 'Restaurant', 'WiFi', 'Gym']},
+            {'id': 3, 'name': 'Beijing Traditional Courtyard Inn', 'location': 'Beijing, China', 'rating': 4.2, 'price': 85, 'type': 'Boutique', 'amenities': ['Traditional Architecture', 'Cultural Tours', 'WiFi', 'Tea House']},
+            {'id': 4, 'name': 'Shangri-La Hotel Shanghai', 'location': 'Shanghai, China', 'rating': 4.8, 'price': 290, 'type': 'Luxury Resort', 'amenities': ['River Views', 'Multiple Restaurants', 'Spa', 'Shopping Mall Access']}
+        ],
+        'Paris, France': [
+            {'id': 5, 'name': 'Hotel Ritz Paris', 'location': 'Paris, France', 'rating': 4.9, 'price': 450, 'type': 'Palace Hotel', 'amenities': ['Michelin Restaurants', 'Luxury Spa', 'Personal Shopping', 'Historic Elegance']},
+            {'id': 6, 'name': 'Hotel Malte Opera Paris', 'location': 'Paris, France', 'rating': 4.4, 'price': 180, 'type': 'Historic Hotel', 'amenities': ['Near Opera House', 'French Restaurant', 'WiFi', 'Concierge']},
+            {'id': 7, 'name': 'Hotel des Jeunes Paris', 'location': 'Paris, France', 'rating': 4.1, 'price': 75, 'type': 'Budget Boutique', 'amenities': ['Marais District', 'Continental Breakfast', 'Tourist Info', 'Metro Access']},
+            {'id': 8, 'name': 'Hotel Plaza Athénée', 'location': 'Paris, France', 'rating': 4.8, 'price': 380, 'type': 'Luxury', 'amenities': ['Eiffel Tower Views', 'Haute Couture Shopping', 'Michelin Dining', 'Spa']}
+        ],
+        'Tokyo, Japan': [
+            {'id': 9, 'name': 'The Ritz-Carlton Tokyo', 'location': 'Tokyo, Japan', 'rating': 4.9, 'price': 420, 'type': 'Luxury Skyscraper', 'amenities': ['City Views', 'Japanese Hospitality', 'Multiple Restaurants', 'Club Lounge']},
+            {'id': 10, 'name': 'Shibuya Excel Hotel Tokyu', 'location': 'Tokyo, Japan', 'rating': 4.3, 'price': 160, 'type': 'Business Hotel', 'amenities': ['Shibuya Station Access', 'City Views', 'Restaurant', 'Business Center']},
+            {'id': 11, 'name': 'K\'s House Tokyo Oasis', 'location': 'Tokyo, Japan', 'rating': 4.0, 'price': 45, 'type': 'Hostel', 'amenities': ['Budget Friendly', 'Social Atmosphere', 'Kitchen Access', 'Tourist Information']},
+            {'id': 12, 'name': 'Imperial Hotel Tokyo', 'location': 'Tokyo, Japan', 'rating': 4.7, 'price': 280, 'type': 'Historic Luxury', 'amenities': ['Imperial Palace Views', 'Traditional Service', 'Multiple Dining', 'Spa']}
+        ],
+        'Dubai, UAE': [
+            {'id': 13, 'name': 'Burj Al Arab Jumeirah', 'location': 'Dubai, UAE', 'rating': 4.9, 'price': 850, 'type': '7-Star Luxury', 'amenities': ['Iconic Sail Design', 'Private Beach', 'Butler Service', 'Helipad Access']},
+            {'id': 14, 'name': 'Al Seef Heritage Hotel', 'location': 'Dubai, UAE', 'rating': 4.6, 'price': 200, 'type': 'Heritage Boutique', 'amenities': ['Traditional Architecture', 'Dubai Creek Views', 'Cultural Experiences', 'Souk Access']},
+            {'id': 15, 'name': 'Rove Downtown Dubai', 'location': 'Dubai, UAE', 'rating': 4.4, 'price': 120, 'type': 'Modern Budget', 'amenities': ['Downtown Location', 'Burj Khalifa Views', 'Modern Design', 'Fitness Center']},
+            {'id': 16, 'name': 'Atlantis The Palm', 'location': 'Dubai, UAE', 'rating': 4.7, 'price': 380, 'type': 'Resort', 'amenities': ['Aquaventure Waterpark', 'Lost Chambers Aquarium', 'Private Beach', 'Multiple Restaurants']}
+        ],
+        'Beirut, Lebanon': [
+            {'id': 17, 'name': 'Four Seasons Hotel Beirut', 'location': 'Beirut, Lebanon', 'rating': 4.8, 'price': 280, 'type': 'Luxury', 'amenities': ['Mediterranean Views', 'Spa', 'Fine Dining', 'Pool']},
+            {'id': 18, 'name': 'Le Gray Beirut', 'location': 'Beirut, Lebanon', 'rating': 4.6, 'price': 220, 'type': 'Boutique', 'amenities': ['Downtown Location', 'Rooftop Pool', 'Modern Design', 'Gourmet Restaurant']},
+            {'id': 19, 'name': 'Saifi Suites', 'location': 'Beirut, Lebanon', 'rating': 4.2, 'price': 120, 'type': 'Apartment Hotel', 'amenities': ['Extended Stay', 'Kitchen Facilities', 'Historic District', 'WiFi']},
+            {'id': 20, 'name': 'InterContinental Phoenicia Beirut', 'location': 'Beirut, Lebanon', 'rating': 4.5, 'price': 180, 'type': 'Business', 'amenities': ['Business Center', 'Multiple Restaurants', 'Pool', 'Marina Views']}
+        ],
+        'New York, USA': [
+            {'id': 21, 'name': 'The Plaza Hotel', 'location': 'New York, USA', 'rating': 4.8, 'price': 450, 'type': 'Historic Luxury', 'amenities': ['Central Park Views', 'Luxury Shopping', 'Fine Dining', 'Spa']},
+            {'id': 22, 'name': 'Pod Hotels Times Square', 'location': 'New York, USA', 'rating': 4.2, 'price': 140, 'type': 'Modern Budget', 'amenities': ['Times Square Location', 'Compact Design', 'Rooftop Bar', 'Tech Amenities']},
+            {'id': 23, 'name': 'The High Line Hotel', 'location': 'New York, USA', 'rating': 4.5, 'price': 220, 'type': 'Boutique', 'amenities': ['Chelsea Location', 'Historic Building', 'Garden', 'Local Atmosphere']},
+            {'id': 24, 'name': 'St. Regis New York', 'location': 'New York, USA', 'rating': 4.9, 'price': 520, 'type': 'Luxury', 'amenities': ['Butler Service', 'Fifth Avenue', 'King Cole Bar', 'Bespoke Service']}
+        ],
+        'London, England': [
+            {'id': 25, 'name': 'The Savoy London', 'location': 'London, England', 'rating': 4.9, 'price': 420, 'type': 'Historic Luxury', 'amenities': ['Thames Views', 'Art Deco Design', 'Famous Bar', 'Royal Heritage']},
+            {'id': 26, 'name': 'Premier Inn London', 'location': 'London, England', 'rating': 4.3, 'price': 95, 'type': 'Budget Chain', 'amenities': ['Consistent Quality', 'Central Locations', 'Family Friendly', 'Good Value']},
+            {'id': 27, 'name': 'Zetter Townhouse Piccadilly', 'location': 'London, England', 'rating': 4.6, 'price': 180, 'type': 'Boutique', 'amenities': ['Victorian Charm', 'Cocktail Lounge', 'Central Location', 'Unique Design']},
+            {'id': 28, 'name': 'Claridge\'s', 'location': 'London, England', 'rating': 4.8, 'price': 380, 'type': 'Art Deco Luxury', 'amenities': ['Mayfair Location', 'Afternoon Tea', 'Michelin Dining', 'Royal Connections']}
+        ]
+    }
+    
+    # Find hotels for specific destination
+    destination_lower = destination.lower()
+    
+    # Check for exact matches or partial matches
+    for country, hotels in hotels_database.items():
+        if country.lower() in destination_lower or any(city.lower() in destination_lower for city in country.split(', ')):
+            return hotels
+    
+    # Check if destination contains any city names
+    city_mappings = {
+        'beijing': 'China',
+        'shanghai': 'China', 
+        'paris': 'Paris, France',
+        'tokyo': 'Tokyo, Japan',
+        'dubai': 'Dubai, UAE',
+        'beirut': 'Beirut, Lebanon',
+        'new york': 'New York, USA',
+        'london': 'London, England',
+        'sydney': 'Australia',
+        'rome': 'Italy',
+        'barcelona': 'Spain'
+    }
+    
+    for city, country in city_mappings.items():
+        if city in destination_lower:
+            if country in hotels_database:
+                return hotels_database[country]
+    
+    # Default fallback - create generic hotels with destination name
+    destination_name = destination.split(',')[0]  # Get first part of destination
+    return [
+        {'id': 999, 'name': f'{destination_name} Grand Hotel', 'location': destination, 'rating': 4.5, 'price': 180, 'type': 'City Hotel', 'amenities': ['WiFi', 'Restaurant', 'Pool', 'Fitness Center']},
+        {'id': 998, 'name': f'{destination_name} Budget Inn', 'location': destination, 'rating': 4.0, 'price': 85, 'type': 'Budget Hotel', 'amenities': ['WiFi', 'Continental Breakfast', 'Central Location']},
+        {'id': 997, 'name': f'{destination_name} Luxury Resort', 'location': destination, 'rating': 4.7, 'price': 320, 'type': 'Resort', 'amenities': ['Spa', 'Fine Dining', 'Concierge', 'Pool']},
+        {'id': 996, 'name': f'{destination_name} Business Hotel', 'location': destination, 'rating': 4.3, 'price': 140, 'type': 'Business', 'amenities': ['Business Center', 'Meeting Rooms', 'WiFi', 'Restaurant']}
+    ]
@@ -0,0 +1,1347 @@
+"""
+📦 Travel Package Page
+AI package creation, package details, complete-package booking and confirmation documents
+"""
+
+import streamlit as st
+from datetime import datetime, timedelta
+
+from src.ui.app_pages.common import get_all_destinations, ai_features_available
+from src.ui.app_pages.package_generator import generate_personalized_package
+from src.services.analytics_pipeline import record_event
+from src.core.package_model import compact
+from src.core.id_generator import new_booking_id, new_confirmation_code
+
+def package_creation_page():
+    """Unified AI-Powered Travel Package Creation with Enhanced AI Features"""
+    
+    st.title("🎯 **AI Travel Package Creator**")
+    st.markdown("*Tell us about your dream trip, and we'll create personalized packages just for you*")
+    
+    # Enhanced AI Integration Check
+    if ai_features_available() and st.session_state.get('enhanced_mode', False):
+        st.info("🤖 **Enhanced AI Mode Active** - Using conversation memory, psychology analysis, and real-time validation")
+    
+    # User Profile Display
+    with st.sidebar:
+        st.markdown("### 👤 **Your Travel Profile**")
+        profile = st.session_state.user_profile
+        
+        with st.expander("📝 Edit Profile", expanded=False):
+            profile['name'] = st.text_input("Name", profile['name'])
+            profile['age'] = st.number_input("Age", value=profile['age'], min_value=18, max_value=100)
+            profile['travel_style'] = st.selectbox("Travel Style", 
+                ['cultural explorer', 'adventure seeker', 'luxury traveler', 'family friendly'], 
+                index=['cultural explorer', 'adventure seeker', 'luxury traveler', 'family friendly'].index(profile['travel_style']))
+            # Enhanced budget preference with detailed options
+            budget_options = {
+                'ultra_budget': 'Ultra Budget ($300-600/day)',
+                'budget': 'Budget ($600-1000/day)', 
+                'moderate': 'Moderate ($1000-2500/day)',
+                'premium': 'Premium ($2500-4000/day)',
+                'luxury': 'Luxury ($4000-7000/day)',
+                'ultra_luxury': 'Ultra Luxury ($7000+/day)'
+            }
+            
+            # Find current selection or default to moderate
+            current_budget = profile.get('budget_preference', 'moderate')
+            if current_budget not in budget_options:
+                current_budget = 'moderate'
+            
+            selected_budget_key = st.selectbox(
+                "Budget Preference", 
+                options=list(budget_options.keys()),
+                format_func=lambda x: budget_options[x],
+                index=list(budget_options.keys()).index(current_budget)
+            )
+            profile['budget_preference'] = selected_budget_key
+            
+            # Interests (multi-select)
+            all_interests = ['cultural experiences', 'local cuisine', 'photography', 'art galleries', 
+                           'adventure sports', 'nightlife', 'shopping', 'nature', 'history', 'music']
+            profile['interests'] = st.multiselect("Interests", all_interests, default=profile['interests'])
+            
+            # Dietary restrictions
+            diet_options = ['none', 'vegetarian', 'vegan', 'gluten-free', 'halal', 'kosher']
+            profile['dietary_restrictions'] = st.multiselect("Dietary Restrictions", diet_options, default=profile.get('dietary_restrictions', []))
+        
+        # Display current profile
+        # Budget options for display
+        budget_display_options = {
+            'ultra_budget': 'Ultra Budget ($300-600/day)',
+            'budget': 'Budget ($600-1000/day)', 
+            'moderate': 'Moderate ($1000-2500/day)',
+            'premium': 'Premium ($2500-4000/day)',
+            'luxury': 'Luxury ($4000-7000/day)',
+            'ultra_luxury': 'Ultra Luxury ($7000+/day)'
+        }
+        
+        budget_display = budget_display_options.get(profile['budget_preference'], profile['budget_preference'].title())
+        
+        st.markdown(f"""
+        **🧳 {profile['name']}** ({profile['age']} years)  
+        **Style:** {profile['travel_style'].title()}  
+        **Budget:** {budget_display}  
+        **Interests:** {', '.join(profile['interests'][:3])}{'...' if len(profile['interests']) > 3 else ''}
+        """)
+    
+    # Main package creation interface
+    st.markdown("### 🗣️ **Describe Your Dream Trip**")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # User trip description
+        user_prompt = st.text_area(
+            "Tell us about your ideal trip:",
+            placeholder="I want to explore the rich culture of Paris, experience authentic French cuisine, visit world-class art museums, and discover hidden local gems. I'm particularly interested in photography opportunities and would love to learn some French cooking...",
+            height=120
+        )
+        
+        # Trip parameters
+        col1a, col1b = st.columns(2)
+        with col1a:
+            destinations_list = get_all_destinations()
+            destination = st.selectbox("🌍 Primary Destination", destinations_list)
+            travelers = st.number_input("👥 Number of Travelers", 1, 10, 2)
+        
+        with col1b:
+            start_date = st.date_input("📅 Start Date", datetime.now() + timedelta(days=14))
+            duration = st.number_input("📅 Duration (days)", 1, 21, 7)
+        
+        # Enhanced budget selection with comprehensive options
+        enhanced_budget_options = [
+            "💸 Ultra Budget ($300-600/day) - Hostels, street food, public transport",
+            "💰 Budget ($600-1000/day) - Budget hotels, local restaurants, basic tours", 
+            "💳 Moderate ($1000-2500/day) - 3-4★ hotels, mid-range dining, guided tours",
+            "💎 Premium ($2500-4000/day) - 4-5★ hotels, fine dining, private experiences",
+            "🏆 Luxury ($4000-7000/day) - 5★ resorts, Michelin dining, VIP services",
+            "👑 Ultra Luxury ($7000+/day) - Presidential suites, private jets, exclusive access"
+        ]
+        
+        budget = st.selectbox("💰 Budget Range", enhanced_budget_options, index=2)
+        
+        # Extract budget category for processing
+        budget_category = budget.split('(')[0].strip().replace('💸 ', '').replace('💰 ', '').replace('💳 ', '').replace('💎 ', '').replace('🏆 ', '').replace('👑 ', '')
+    
+    with col2:
+        st.markdown("### 🎨 **Package Preferences**")
+        
+        # Package customization options
+        include_flights = st.checkbox("✈️ Include Flights", value=True)
+        include_activities = st.checkbox("🎯 Include Activities", value=True)
+        include_local_experiences = st.checkbox("🌟 Include Local Experiences", value=True)
+        
+        # Travel pace
+        travel_pace = st.selectbox("Pace", ["Relaxed", "Moderate", "Active"])
+        
+        # Group type
+        group_type = st.selectbox("Group Type", ["Solo", "Couple", "Family", "Friends"])
+    
+    # Generate packages button
+    if st.button("🚀 **Generate My Personalized Packages**", type="primary", use_container_width=True):
+        if user_prompt and destination:
+            with st.spinner("🤖 Our AI is crafting personalized packages for you..."):
+                
+                # Enhanced AI Processing
+                if ai_features_available() and st.session_state.get('enhanced_mode', False):
+                    try:
+                        # Process user input with enhanced AI
+                        user_id = st.session_state.get('current_user_id', 'demo_user')
+                        ai_analysis = None  # AI integrator not available; fallback or skip
+                        
+                        # Display AI insights
+                        st.markdown("### 🧠 AI Analysis Results")
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.metric("Psychology Confidence", f"{ai_analysis['psychology_profile'].confidence_score:.1%}")
+                        with col2:
+                            st.metric("Personality Type", ai_analysis['psychology_profile'].personality_type.title())
+                        with col3:
+                            st.metric("Travel Style", ai_analysis['psychology_profile'].social_preferences.title())
+                        
+                        st.success("🎯 AI has analyzed your preferences and travel psychology!")
+                        
+                    except Exception as e:
+                        st.warning(f"Enhanced AI analysis unavailable: {str(e)}")
+                
+                # Generate 4 different package variations based on different styles
+                packages = []
+                
+                # Define 4 diverse package types with unique identifiers
+                package_variations = [
+                    {
+                        'style_override': 'cultural-immersive',
+                        'budget_modifier': 0,
+                        'title_suffix': 'Cultural Heritage Explorer',
+                        'focus_override': 'Deep cultural immersion with historical sites and local traditions',
+                        'unique_id': 'cultural'
+                    },
+                    {
+                        'style_override': 'culinary-focused', 
+                        'budget_modifier': 0.1,
+                        'title_suffix': 'Culinary Discovery Journey',
+                        'focus_override': 'Authentic local cuisine and cooking experiences',
+                        'unique_id': 'culinary'
+                    },
+                    {
+                        'style_override': 'luxury-premium' if budget != "Budget ($500-1000)" else 'photography-focused',
+                        'budget_modifier': 0.2,
+                        'title_suffix': 'Premium Luxury Experience' if budget != "Budget ($500-1000)" else 'Photography Expedition',
+                        'focus_override': 'High-end accommodations and exclusive experiences' if budget != "Budget ($500-1000)" else 'Stunning photography opportunities and scenic locations',
+                        'unique_id': 'luxury_or_photo'
+                    },
+                    {
+                        'style_override': 'budget-conscious' if budget == "Luxury ($2500+)" else 'adventure-active',
+                        'budget_modifier': -0.1 if budget == "Luxury ($2500+)" else 0.05,
+                        'title_suffix': 'Smart Budget Explorer' if budget == "Luxury ($2500+)" else 'Adventure & Active Explorer',
+                        'focus_override': 'Maximum value with authentic local experiences' if budget == "Luxury ($2500+)" else 'Outdoor adventures and active experiences',
+                        'unique_id': 'budget_or_adventure'
+                    }
+                ]
+                
+                # Clear existing packages to prevent duplicates
+                packages = []
+                
+                for i, variation in enumerate(package_variations):
+                    # Create modified profile for package variation
+                    varied_profile = profile.copy()
+                    
+                    # Adjust interests based on variation
+                    if variation['style_override'] == 'culinary-focused':
+                        varied_profile['interests'] = ['local cuisine'] + [x for x in profile['interests'] if x != 'local cuisine']
+                    elif variation['style_override'] == 'adventure-active':
+                        varied_profile['interests'] = profile['interests'] + ['adventure sports', 'outdoor activities']
+                    elif variation['style_override'] == 'photography-focused':
+                        varied_profile['interests'] = ['photography'] + profile['interests']
+                    
+                    # Modify user prompt to emphasize different aspects
+                    modified_prompt = enhance_prompt_for_variation(user_prompt, variation['style_override'])
+                    
+                    # Generate package with specific style
+                    package = generate_personalized_package(
+                        modified_prompt, varied_profile, destination, duration, travelers, budget, variation['style_override']
+                    )
+                    
+                    # Create unique package ID and title
+                    package['id'] = f"pkg_{variation['unique_id']}_{len(packages) + 1}"
+                    package['title'] = f"{destination} {variation['title_suffix']}"
+                    package['focus'] = variation['focus_override']
+                    package['variation_type'] = variation['style_override']
+                    
+                    # Ensure no duplicate packages by checking existing titles
+                    existing_titles = [p['title'] for p in packages]
+                    if package['title'] not in existing_titles:
+                        packages.append(package)
+                
+                # Store generated packages (ensure no duplicates)
+                unique_packages = []
+                seen_titles = set()
+                for package in packages:
+                    if package['title'] not in seen_titles:
+                        unique_packages.append(package)
+                        seen_titles.add(package['title'])
+                
+                # Read-only from here on; compacting them together shares repeated venues and keys
+                st.session_state.generated_packages = list(compact(unique_packages))
+                record_event("search", component="package", destination=destination, user_id="demo_user")
+                
+                st.success(f"🎉 Successfully generated {len(unique_packages)} unique personalized packages for you!")
+                st.info("💡 Each package offers a different travel experience - choose the one that matches your mood!")
+                
+                # Force rerun to display packages
+                st.rerun()
+        else:
+            st.warning("⚠️ Please fill in your travel prompt and select a destination to generate packages.")
+
+    # Display generated packages (moved inside the function)
+    if st.session_state.generated_packages:
+        st.markdown("---")
+        st.markdown("### 📦 **Your Personalized Travel Packages**")
+        
+        # Package cards in columns
+        cols = st.columns(len(st.session_state.generated_packages))
+        
+        for i, package in enumerate(st.session_state.generated_packages):
+            with cols[i]:
+                display_package_card(package, i)
+
+    # Package details view (moved inside the function)
+    if st.session_state.viewing_package_details:
+        display_package_details(st.session_state.viewing_package_details)
+
+def enhance_prompt_for_variation(original_prompt, style_override):
+    """Enhance the user prompt to emphasize different travel styles"""
+    
+    style_enhancements = {
+        'cultural-immersive': original_prompt + " I want to deeply understand the local culture, visit historical sites, museums, and interact with local traditions.",
+        'culinary-focused': original_prompt + " I'm passionate about experiencing authentic local cuisine, learning cooking techniques, visiting food markets, and discovering regional specialties.",
+        'luxury-premium': original_prompt + " I prefer high-end accommodations, exclusive experiences, private tours, luxury amenities, and premium service throughout my journey.",
+        'adventure-active': original_prompt + " I love outdoor activities, active experiences, hiking, sports, and adventure-filled itineraries that keep me engaged.",
+        'photography-focused': original_prompt + " I'm passionate about photography and want to capture stunning photos, visit scenic locations, and have unique Instagram-worthy experiences.",
+        'budget-conscious': original_prompt + " I want to maximize value for money while still having authentic experiences, prefer budget-friendly options without compromising on quality."
+    }
+    
+    return style_enhancements.get(style_override, original_prompt)
+
+def display_package_card(package, index):
+    """Display a clickable package card with brief titles"""
+    
+    pricing = package['pricing']
+    
+    # Use the actual package variation type as brief title
+    brief_title = package.get('variation_type', 'Unique Experience').replace('-', ' ').title()
+    
+    # Package card with proper dark text styling for visibility
+    st.markdown(f"""
+    <div class="package-card" style="border-left-color: {'#28a745' if index == 0 else '#007bff' if index == 1 else '#fd7e14'}; color: #333333;">
+        <h4 style="color: #2c3e50; margin-bottom: 1rem;">{package['title']}</h4>
+        <p style="color: #666; font-style: italic; margin: 0.5rem 0;"><strong>{brief_title}</strong></p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>🎯 Focus:</strong> {package['focus']}</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>📅 Duration:</strong> {package['duration']} days</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>👥 Travelers:</strong> {package['travelers']}</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>✈️ Flights:</strong> {len(package['flights'])} options</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>🏨 Hotels:</strong> {len(package['hotels'])} recommendations</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>🍽️ Restaurants:</strong> {len(package['restaurants'])} curated spots</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>🎯 Activities:</strong> {len(package['activities'])} experiences</p>
+        <p style="color: #333; margin: 0.4rem 0;"><strong>🌟 Local Gems:</strong> {len(package['local_experiences'])} unique experiences</p>
+        <br>
+        <div class="price-tag" style="font-size: 1.1rem; padding: 0.8rem 1.5rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 15px; text-align: center;">
+            ${pricing['total_cost']:,.0f} total
+        </div>
+        <p style="text-align: center; margin-top: 0.5rem; color: #666;">
+            <small>${pricing['cost_per_person']:,.0f} per person</small>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Action buttons
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button(f"👁️ **Explore Package**", key=f"explore_{index}", use_container_width=True):
+            st.session_state.viewing_package_details = package
+            st.rerun()
+    
+    with col2:
+        if st.button(f"🎉 **Book Now**", key=f"book_{index}", type="primary", use_container_width=True):
+            book_complete_package(package)
+
+def display_package_details(package):
+    """Display detailed package information"""
+    
+    st.markdown("---")
+    st.markdown(f"## 📋 **{package['title']} - Detailed Itinerary**")
+    
+    # Package overview
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Total Cost", f"${package['pricing']['total_cost']:,.0f}")
+        st.metric("Per Person", f"${package['pricing']['cost_per_person']:,.0f}")
+    
+    with col2:
+        st.metric("Duration", f"{package['duration']} days")
+        st.metric("Daily Average", f"${package['pricing']['daily_average']:,.0f}")
+    
+    with col3:
+        st.metric("Travelers", package['travelers'])
+        st.metric("Package Rating", "⭐⭐⭐⭐⭐")
+    
+    # Detailed sections in tabs
+    tabs = st.tabs(["📅 Daily Itinerary", "✈️ Flights", "🏨 Hotels", "🍽️ Restaurants", "🎯 Activities", "🌟 Local Experiences", "💰 Pricing"])
+    
+    with tabs[0]:  # Daily Itinerary
+        display_daily_itinerary(package['daily_itinerary'])
+    
+    with tabs[1]:  # Flights
+        display_flight_options(package['flights'])
+    
+    with tabs[2]:  # Hotels
+        display_hotel_recommendations(package['hotels'])
+    
+    with tabs[3]:  # Restaurants
+        display_restaurant_recommendations(package['restaurants'])
+    
+    with tabs[4]:  # Activities
+        display_activities(package['activities'])
+    
+    with tabs[5]:  # Local Experiences
+        display_local_experiences(package['local_experiences'])
+    
+    with tabs[6]:  # Pricing
+        display_pricing_breakdown(package['pricing'])
+    
+    # Action buttons
+    st.markdown("---")
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
+    
+    with col1:
+        if st.button("⬅️ **Back to Packages**", use_container_width=True):
+            st.session_state.viewing_package_details = None
+            st.rerun()
+    
+    with col2:
+        if st.button("📄 **Generate PDF**", use_container_width=True):
+            generate_package_pdf(package)
+    
+    with col3:
+        if st.button("💾 **Save Package**", use_container_width=True):
+            save_package_to_favorites(package)
+    
+    with col4:
+        if st.button("🎉 **Book This Complete Package**", type="primary", use_container_width=True):
+            book_complete_package(package)
+
+def generate_package_pdf(package):
+    """Generate a comprehensive PDF of the travel package"""
+    
+    try:
+        from reportlab.lib.pagesizes import letter, A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+        import io
+        
+        # Create PDF in memory
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, 
+                              topMargin=72, bottomMargin=18)
+        
+        # Define styles
+        styles = getSampleStyleSheet()
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor=colors.navy
+        )
+        
+        heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'], 
+            fontSize=16,
+            spaceAfter=12,
+            textColor=colors.darkblue
+        )
+        
+        # Build PDF content
+        story = []
+        
+        # Title
+        story.append(Paragraph(f"{package['title']}", title_style))
+        story.append(Paragraph(f"Destination: {package['destination']}", styles['Normal']))
+        story.append(Paragraph(f"Duration: {package['duration']} days for {package['travelers']} travelers", styles['Normal']))
+        story.append(Paragraph(f"Total Cost: ${package['pricing']['total_cost']:,.0f} (${package['pricing']['cost_per_person']:,.0f} per person)", styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Package Overview
+        story.append(Paragraph("Package Overview", heading_style))
+        story.append(Paragraph(f"Focus: {package['focus']}", styles['Normal']))
+        story.append(Spacer(1, 12))
+        
+        # Daily Itinerary
+        story.append(Paragraph("Daily Itinerary", heading_style))
+        for day_plan in package['daily_itinerary']:
+            story.append(Paragraph(f"<b>Day {day_plan['day']}: {day_plan['theme']}</b>", styles['Normal']))
+            story.append(Paragraph(f"Morning: {day_plan['morning']}", styles['Normal']))
+            story.append(Paragraph(f"Afternoon: {day_plan['afternoon']}", styles['Normal']))
+            story.append(Paragraph(f"Evening: {day_plan['evening']}", styles['Normal']))
+            story.append(Paragraph(f"Estimated Cost: ${day_plan['estimated_cost']}", styles['Normal']))
+            story.append(Spacer(1, 8))
+        
+        # Flights
+        story.append(Paragraph("Flight Options", heading_style))
+        for flight in package['flights']:
+            story.append(Paragraph(f"• {flight['airline']} - {flight['class']}", styles['Normal']))
+            story.append(Paragraph(f"  Price: ${flight['price_per_person']:,} per person | Duration: {flight['duration']}", styles['Normal']))
+            story.append(Spacer(1, 6))
+        
+        # Hotels
+        story.append(Paragraph("Accommodation", heading_style))
+        for hotel in package['hotels']:
+            story.append(Paragraph(f"• {hotel['name']} ({hotel['rating']}⭐)", styles['Normal']))
+            story.append(Paragraph(f"  ${hotel['price']}/night | {hotel['why_recommended']}", styles['Normal']))
+            story.append(Spacer(1, 6))
+        
+        # Restaurants
+        story.append(Paragraph("Dining Experiences", heading_style))
+        for restaurant in package['restaurants']:
+            story.append(Paragraph(f"• {restaurant['name']} - {restaurant['cuisine']}", styles['Normal']))
+            story.append(Paragraph(f"  {restaurant['specialty']} | {restaurant['why_recommended']}", styles['Normal']))
+            story.append(Spacer(1, 6))
+        
+        # Pricing Breakdown
+        story.append(Paragraph("Pricing Breakdown", heading_style))
+        pricing_data = [
+            ['Component', 'Cost'],
+            ['Flights', f"${package['pricing']['flights']:,.0f}"],
+            ['Hotels', f"${package['pricing']['hotels']:,.0f}"],
+            ['Restaurants', f"${package['pricing']['restaurants']:,.0f}"],
+            ['Activities', f"${package['pricing']['activities']:,.0f}"],
+            ['Taxes', f"${package['pricing']['taxes']:,.0f}"],
+            ['Service Fee', f"${package['pricing']['service_fee']:,.0f}"],
+            ['TOTAL', f"${package['pricing']['total_cost']:,.0f}"]
+        ]
+        
+        pricing_table = Table(pricing_data)
+        pricing_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 14),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        
+        story.append(pricing_table)
+        
+        # Build PDF
+        doc.build(story)
+        
+        # Get PDF data
+        pdf_data = buffer.getvalue()
+        buffer.close()
+        
+        # Create download button
+        st.download_button(
+            label="� **Download PDF Package**",
+            data=pdf_data,
+            file_name=f"{package['title'].replace(' ', '_')}_Travel_Package.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+        
+        st.success("📄 PDF generated successfully! Click the download button above.")
+        
+    except ImportError:
+        st.warning("📄 PDF generation requires additional libraries. Creating simplified text version...")
+        
+        # Fallback: Create text version
+        text_content = generate_text_package_summary(package)
+        
+        st.download_button(
+            label="📥 **Download Text Package**",
+            data=text_content,
+            file_name=f"{package['title'].replace(' ', '_')}_Travel_Package.txt",
+            mime="text/plain",
+            use_container_width=True
+        )
+
+def generate_text_package_summary(package):
+    """Generate a text summary of the package as fallback"""
+    
+    content = f"""
+TRAVEL PACKAGE SUMMARY
+======================
+
+Package: {package['title']}
+Destination: {package['destination']}
+Duration: {package['duration']} days for {package['travelers']} travelers
+Total Cost: ${package['pricing']['total_cost']:,.0f} (${package['pricing']['cost_per_person']:,.0f} per person)
+
+PACKAGE FOCUS
+{package['focus']}
+
+DAILY ITINERARY
+===============
+"""
+    
+    for day_plan in package['daily_itinerary']:
+        content += f"""
+Day {day_plan['day']}: {day_plan['theme']}
+Morning: {day_plan['morning']}
+Afternoon: {day_plan['afternoon']}
+Evening: {day_plan['evening']}
+Estimated Cost: ${day_plan['estimated_cost']}
+"""
+    
+    content += "\n\nFLIGHT OPTIONS\n==============\n"
+    for flight in package['flights']:
+        content += f"• {flight['airline']} - {flight['class']}\n"
+        content += f"  Price: ${flight['price_per_person']:,} per person | Duration: {flight['duration']}\n\n"
+    
+    content += "\nACCOMMODATION\n=============\n"
+    for hotel in package['hotels']:
+        content += f"• {hotel['name']} ({hotel['rating']}⭐)\n"
+        content += f"  ${hotel['price']}/night | {hotel['why_recommended']}\n\n"
+    
+    content += "\nDINING EXPERIENCES\n==================\n"
+    for restaurant in package['restaurants']:
+        content += f"• {restaurant['name']} - {restaurant['cuisine']}\n"
+        content += f"  {restaurant['specialty']} | {restaurant['why_recommended']}\n\n"
+    
+    content += f"""
+PRICING BREAKDOWN
+=================
+Flights: ${package['pricing']['flights']:,.0f}
+Hotels: ${package['pricing']['hotels']:,.0f}
+Restaurants: ${package['pricing']['restaurants']:,.0f}
+Activities: ${package['pricing']['activities']:,.0f}
+Taxes: ${package['pricing']['taxes']:,.0f}
+Service Fee: ${package['pricing']['service_fee']:,.0f}
+TOTAL: ${package['pricing']['total_cost']:,.0f}
+
+Generated by AI Travel Platform
+Visit us at: https://ai-travel-platform.com
+"""
+    
+    return content
+
+def display_daily_itinerary(itinerary):
+    """Display day-by-day itinerary"""
+    
+    for day_plan in itinerary:
+        with st.expander(f"📅 **Day {day_plan['day']}: {day_plan['theme']}**", expanded=day_plan['day'] <= 2):
+            
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                st.markdown(f"""
+                **🌅 Morning:** {day_plan['morning']}  
+                **☀️ Afternoon:** {day_plan['afternoon']}  
+                **🌆 Evening:** {day_plan['evening']}
+                
+                **🍽️ Meals:**
+                - Breakfast: {day_plan['meals']['breakfast']}
+                - Lunch: {day_plan['meals']['lunch']} 
+                - Dinner: {day_plan['meals']['dinner']}
+                """)
+            
+            with col2:
+                st.markdown(f"""
+                **🚗 Transportation:** {day_plan['transportation']}  
+                **💰 Est. Daily Cost:** ${day_plan['estimated_cost']}
+                """)
+
+def display_flight_options(flights):
+    """Display flight recommendations"""
+    
+    for i, flight in enumerate(flights):
+        st.markdown(f"""
+        <div class="hotel-card">
+            <h4>✈️ {flight['airline']} - {flight['class']}</h4>
+            <p><strong>💰 Price:</strong> ${flight['price_per_person']:,} per person (${flight['total_price']:,} total)</p>
+            <p><strong>⏱️ Duration:</strong> {flight['duration']}</p>
+            <p><strong>🔄 Stops:</strong> {'Direct' if flight['stops'] == 0 else f"{flight['stops']} stop(s)"}</p>
+            <p><strong>🛫 Departure:</strong> {flight['departure']} → <strong>🛬 Arrival:</strong> {flight['arrival']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def display_hotel_recommendations(hotels):
+    """Display hotel recommendations with reasons"""
+    
+    for hotel in hotels:
+        st.markdown(f"""
+        <div class="hotel-card">
+            <h4>🏨 {hotel['name']}</h4>
+            <p><strong>⭐ Rating:</strong> {hotel['rating']}/5 • <strong>🏷️ Type:</strong> {hotel['type']}</p>
+            <p><strong>💰 Price:</strong> ${hotel['price']}/night (${hotel['total_price']:,} total)</p>
+            <p><strong>📍 Location Score:</strong> {hotel['location_score']}/10</p>
+            <p><strong>✨ Amenities:</strong> {', '.join(hotel['amenities'])}</p>
+            <p><strong>🎯 Why Recommended:</strong> {hotel['why_recommended']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def display_restaurant_recommendations(restaurants):
+    """Display restaurant recommendations"""
+    
+    for restaurant in restaurants:
+        st.markdown(f"""
+        <div class="restaurant-card">
+            <h4>🍽️ {restaurant['name']}</h4>
+            <p><strong>🍴 Cuisine:</strong> {restaurant['cuisine']} • <strong>⭐ Rating:</strong> {restaurant['rating']}/5</p>
+            <p><strong>💰 Price Range:</strong> {restaurant['price_range']} • <strong>🌟 Specialty:</strong> {restaurant['specialty']}</p>
+            <p><strong>🎯 Why Recommended:</strong> {restaurant['why_recommended']}</p>
+            <p><strong>📅 Suggested Time:</strong> {restaurant['reservation_time']}</p>
+            <p><strong>📝 Note:</strong> {restaurant['booking_notes']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def display_activities(activities):
+    """Display activity recommendations"""
+    
+    for activity in activities:
+        st.markdown(f"""
+        <div class="activity-card">
+            <h4>🎯 {activity['name']}</h4>
+            <p><strong>⏱️ Duration:</strong> {activity['duration']} • <strong>💰 Price:</strong> ${activity['price']}</p>
+            <p><strong>🏷️ Type:</strong> {activity['type']} • <strong>📊 Difficulty:</strong> {activity['difficulty']}</p>
+            <p><strong>👥 Group Size:</strong> {activity['group_size']}</p>
+            <p><strong>🎯 Why Recommended:</strong> {activity['match_reason']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def display_local_experiences(experiences):
+    """Display local experience recommendations"""
+    
+    for exp in experiences:
+        st.markdown(f"""
+        <div class="activity-card" style="border-left-color: #ffc107;">
+            <h4>🌟 {exp['name']}</h4>
+            <p><strong>🏷️ Type:</strong> {exp['type']} • <strong>⏱️ Duration:</strong> {exp['duration']}</p>
+            <p><strong>💰 Price:</strong> ${exp['price']} per person</p>
+            <p><strong>✨ What makes it special:</strong> Unique local experience not found in typical tourist guides</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def display_pricing_breakdown(pricing):
+    """Display detailed pricing breakdown with attractive visualization using pure Streamlit components"""
+    
+    # Title with custom styling
+    st.markdown("""
+    <div style="
+        background: linear-gradient(145deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem;
+        border-radius: 25px;
+        color: white;
+        margin: 1rem 0;
+        text-align: center;
+    ">
+        <h2 style="margin: 0; color: white;">💰 Investment Breakdown</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Main content using Streamlit columns
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("### 📊 Cost Components")
+        
+        # Calculate percentages for visual representation
+        total_base = pricing['base_cost']
+        components = [
+            ("✈️ Flights", pricing['flights'], (pricing['flights'] / total_base) * 100),
+            ("🏨 Hotels", pricing['hotels'], (pricing['hotels'] / total_base) * 100),
+            ("🍽️ Restaurants", pricing['restaurants'], (pricing['restaurants'] / total_base) * 100),
+            ("🎯 Activities", pricing['activities'], (pricing['activities'] / total_base) * 100)
+        ]
+        
+        # Display each component with progress bar
+        for name, amount, percentage in components:
+            col_name, col_amount = st.columns([2, 1])
+            with col_name:
+                st.write(name)
+            with col_amount:
+                st.write(f"**${amount:,.0f}**")
+            
+            # Progress bar
+            progress_value = min(percentage / 100, 1.0)
+            st.progress(progress_value)
+            st.write("")  # Add spacing
+    
+    with col2:
+        # Total Investment Card
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #ff6b6b 0%, #feca57 100%);
+            padding: 2rem;
+            border-radius: 20px;
+            text-align: center;
+            margin-bottom: 1rem;
+            color: white;
+        ">
+            <h3 style="margin: 0; color: white;">Total Investment</h3>
+            <h1 style="margin: 1rem 0; font-size: 3rem; color: white;">
+                ${pricing['total_cost']:,.0f}
+            </h1>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Per Person and Daily Average
+        metric_col1, metric_col2 = st.columns(2)
+        with metric_col1:
+            st.metric(
+                label="👥 Per Person",
+                value=f"${pricing['cost_per_person']:,.0f}",
+                delta=None
+            )
+        
+        with metric_col2:
+            st.metric(
+                label="📅 Daily Average", 
+                value=f"${pricing['daily_average']:,.0f}",
+                delta=None
+            )
+        
+        # Additional Costs
+        st.markdown("#### Additional Costs")
+        st.write(f"📊 **Taxes & Fees:** ${pricing['taxes']:,.0f}")
+        st.write(f"🔧 **Service Fee:** ${pricing['service_fee']:,.0f}")
+    
+    # Add some spacing
+    st.markdown("<br>", unsafe_allow_html=True)
+
+def book_complete_package(package):
+    """Enhanced intelligent booking system for complete travel package"""
+    
+    st.markdown("## 🎯 **Intelligent Package Booking System**")
+    
+    # Step 1: Booking Confirmation & Details Review
+    with st.expander("📋 **Step 1: Review Package Details**", expanded=True):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            **📦 Package:** {package['title']}  
+            **🌍 Destination:** {package['destination']}  
+            **📅 Duration:** {package['duration']} days  
+            **👥 Travelers:** {package['travelers']} people  
+            **💰 Total Cost:** ${package['pricing']['total_cost']:,.0f}  
+            **📊 Per Person:** ${package['pricing']['cost_per_person']:,.0f}
+            """)
+        
+        with col2:
+            st.markdown(f"""
+            **🎯 Package Focus:** {package['focus']}  
+            **✈️ Flights Included:** {len(package['flights'])} options  
+            **🏨 Hotels Included:** {len(package['hotels'])} options  
+            **🍽️ Restaurants Included:** {len(package['restaurants'])} reservations  
+            **🎯 Activities Included:** {len(package['activities'])} experiences  
+            **🌟 Local Experiences:** {len(package['local_experiences'])} unique activities
+            """)
+        
+        package_confirmed = st.checkbox("✅ I confirm these package details are correct", key="package_confirm")
+    
+    # Step 2: Traveler Information
+    if package_confirmed:
+        with st.expander("� **Step 2: Traveler Information**", expanded=True):
+            travelers_info = []
+            
+            st.markdown("**Please provide information for all travelers:**")
+            
+            for i in range(package['travelers']):
+                st.markdown(f"**Traveler {i+1}:**")
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    name = st.text_input(f"Full Name", key=f"traveler_{i}_name", placeholder="John Doe")
+                with col2:
+                    passport = st.text_input(f"Passport Number", key=f"traveler_{i}_passport", placeholder="AB1234567")
+                with col3:
+                    dob = st.date_input(f"Date of Birth", key=f"traveler_{i}_dob", 
+                                      value=datetime(1990, 1, 1).date())
+                
+                travelers_info.append({
+                    'name': name,
+                    'passport': passport,
+                    'date_of_birth': dob
+                })
+            
+            # Contact Information
+            st.markdown("**Primary Contact Information:**")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                contact_email = st.text_input("Email Address", placeholder="john@example.com")
+                contact_phone = st.text_input("Phone Number", placeholder="+1 (555) 123-4567")
+            
+            with col2:
+                emergency_contact = st.text_input("Emergency Contact Name", placeholder="Jane Doe")
+                emergency_phone = st.text_input("Emergency Contact Phone", placeholder="+1 (555) 987-6543")
+            
+            travelers_confirmed = st.checkbox("✅ All traveler information is accurate", key="travelers_confirm")
+    
+    # Step 3: Component Selection & Customization
+    if package_confirmed and travelers_confirmed:
+        with st.expander("🎛️ **Step 3: Customize Package Components**", expanded=True):
+            st.markdown("**Select your preferred options for each component:**")
+            
+            # Flight Selection
+            st.markdown("**✈️ Flight Selection:**")
+            selected_flight = st.selectbox(
+                "Choose your preferred flight:",
+                [f"{f['airline']} - {f['class']} (${f['price_per_person']:,}/person)" for f in package['flights']],
+                key="flight_selection"
+            )
+            
+            # Hotel Selection
+            st.markdown("**🏨 Hotel Selection:**")
+            selected_hotel = st.selectbox(
+                "Choose your preferred hotel:",
+                [f"{h['name']} - {h['type']} (${h['price']}/night)" for h in package['hotels']],
+                key="hotel_selection"
+            )
+            
+            # Special Requests
+            st.markdown("**📝 Special Requests & Preferences:**")
+            special_requests = st.text_area(
+                "Any special requests, dietary restrictions, or accessibility needs:",
+                placeholder="Room preferences, dietary restrictions, celebration occasions, etc.",
+                key="special_requests"
+            )
+            
+            components_confirmed = st.checkbox("✅ Component selections are finalized", key="components_confirm")
+    
+    # Step 4: Payment & Final Booking
+    if package_confirmed and travelers_confirmed and components_confirmed:
+        with st.expander("💳 **Step 4: Payment & Final Booking**", expanded=True):
+            
+            # Payment Summary
+            st.markdown("**💰 Final Payment Summary:**")
+            selected_flight_idx = [f"{f['airline']} - {f['class']} (${f['price_per_person']:,}/person)" for f in package['flights']].index(selected_flight)
+            selected_hotel_idx = [f"{h['name']} - {h['type']} (${h['price']}/night)" for h in package['hotels']].index(selected_hotel)
+            
+            flight_cost = package['flights'][selected_flight_idx]['total_price']
+            hotel_cost = package['hotels'][selected_hotel_idx]['total_price']
+            
+            # Detailed cost breakdown
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**💸 Cost Breakdown:**")
+                st.markdown(f"""
+                - **Selected Flight:** ${flight_cost:,.0f}
+                - **Selected Hotel:** ${hotel_cost:,.0f}
+                - **Restaurants & Dining:** ${package['pricing']['restaurants']:,.0f}
+                - **Activities & Experiences:** ${package['pricing']['activities']:,.0f}
+                - **Taxes & Government Fees:** ${package['pricing']['taxes']:,.0f}
+                - **Service Fee (5%):** ${package['pricing']['service_fee']:,.0f}
+                """)
+                
+                st.markdown("---")
+                st.markdown(f"**🎯 TOTAL AMOUNT: ${package['pricing']['total_cost']:,.0f}**")
+                st.markdown(f"**📊 Per Person: ${package['pricing']['cost_per_person']:,.0f}**")
+            
+            with col2:
+                st.markdown("**💳 Payment Options:**")
+                
+                # Payment method selection with detailed info
+                payment_method = st.selectbox(
+                    "Select your preferred payment method:",
+                    [
+                        "💳 Credit Card (Visa, MasterCard, Amex)",
+                        "🏦 Bank Transfer (Wire Transfer)",
+                        "💰 PayPal (Secure Online Payment)",
+                        "📱 Digital Wallet (Apple Pay, Google Pay)",
+                        "💰 Cryptocurrency (Bitcoin, Ethereum)"
+                    ],
+                    key="payment_method"
+                )
+                
+                # Payment plan options
+                payment_plan = st.selectbox(
+                    "Payment Plan:",
+                    [
+                        "💰 Full Payment Now (5% discount)",
+                        "📅 50% Now, 50% Before Travel",
+                        "📅 25% Now, 75% in 30 days",
+                        "📅 Monthly Payment Plan (3 months)"
+                    ],
+                    key="payment_plan"
+                )
+                
+                # Calculate payment amounts based on plan
+                total_cost = package['pricing']['total_cost']
+                if "Full Payment" in payment_plan:
+                    immediate_payment = total_cost * 0.95  # 5% discount
+                    st.success(f"💰 With 5% discount: ${immediate_payment:,.0f}")
+                elif "50% Now" in payment_plan:
+                    immediate_payment = total_cost * 0.5
+                    st.info(f"💰 Today: ${immediate_payment:,.0f} | Later: ${immediate_payment:,.0f}")
+                elif "25% Now" in payment_plan:
+                    immediate_payment = total_cost * 0.25
+                    remaining = total_cost * 0.75
+                    st.info(f"💰 Today: ${immediate_payment:,.0f} | In 30 days: ${remaining:,.0f}")
+                else:  # Monthly plan
+                    monthly_payment = total_cost / 3
+                    st.info(f"💰 Monthly Payment: ${monthly_payment:,.0f} x 3 months")
+                    immediate_payment = monthly_payment
+            
+            # Enhanced Payment Form
+            st.markdown("---")
+            st.markdown("**🔐 Secure Payment Information:**")
+            
+            if "Credit Card" in payment_method:
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    card_number = st.text_input("💳 Card Number", placeholder="4532 1234 5678 9012", type="password")
+                    cardholder_name = st.text_input("👤 Cardholder Name", placeholder="John Doe")
+                
+                with col2:
+                    expiry_month = st.selectbox("📅 Exp. Month", [f"{i:02d}" for i in range(1, 13)])
+                    expiry_year = st.selectbox("📅 Exp. Year", [str(2024 + i) for i in range(6)])
+                
+                with col3:
+                    cvv = st.text_input("🔒 CVV", placeholder="123", type="password", max_chars=4)
+                    billing_zip = st.text_input("📍 Billing ZIP", placeholder="10001")
+                
+            elif "Bank Transfer" in payment_method:
+                st.info("💰 Bank transfer instructions will be provided after booking confirmation.")
+                st.markdown("""
+                **Wire Transfer Details:**
+                - Processing time: 3-5 business days
+                - Additional bank fees may apply
+                - Full payment required before travel
+                """)
+                
+            elif "PayPal" in payment_method:
+                st.info("💰 You'll be redirected to PayPal for secure payment processing.")
+                paypal_email = st.text_input("📧 PayPal Email", placeholder="john@example.com")
+                
+            elif "Digital Wallet" in payment_method:
+                st.info("📱 Digital wallet payment will be processed through secure mobile payment.")
+                wallet_type = st.selectbox("Wallet Type:", ["Apple Pay", "Google Pay", "Samsung Pay"])
+                
+            elif "Cryptocurrency" in payment_method:
+                st.info("₿ Cryptocurrency payment with instant confirmation.")
+                crypto_type = st.selectbox("Cryptocurrency:", ["Bitcoin (BTC)", "Ethereum (ETH)", "USDC"])
+                st.markdown(f"💰 Amount: {total_cost / 50000:.4f} BTC (approximately)")
+            
+            # Security and Terms
+            st.markdown("---")
+            st.markdown("**🛡️ Security & Terms:**")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                privacy_accepted = st.checkbox("✅ I accept the Privacy Policy", key="privacy_confirm")
+                terms_accepted = st.checkbox("✅ I accept the Terms & Conditions", key="terms_confirm")
+                cancellation_accepted = st.checkbox("✅ I understand the Cancellation Policy", key="cancellation_confirm")
+            
+            with col2:
+                marketing_consent = st.checkbox("📧 Send me travel updates and exclusive offers", key="marketing_consent")
+                insurance_offered = st.checkbox("🛡️ Add Travel Insurance (+$89 per person)", key="travel_insurance")
+                
+            # Travel Insurance Details
+            if insurance_offered:
+                st.info("""
+                **🛡️ Travel Insurance Coverage:**
+                - Trip cancellation/interruption up to $50,000
+                - Medical emergencies up to $100,000
+                - Lost baggage up to $2,500
+                - Flight delays and missed connections
+                """)
+                insurance_cost = 89 * package['travelers']
+                total_with_insurance = total_cost + insurance_cost
+                st.success(f"💰 Insurance Total: ${insurance_cost} | New Package Total: ${total_with_insurance:,.0f}")
+            
+            # Final Booking Button
+            if privacy_accepted and terms_accepted and cancellation_accepted:
+                
+                # Add final security verification
+                st.markdown("**🔐 Final Security Verification:**")
+                security_code = st.text_input("Enter security code (sent to your phone):", placeholder="123456", max_chars=6)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if st.button("📧 **Send Security Code**", use_container_width=True):
+                        st.success("✅ Security code sent to your phone!")
+                        st.session_state.security_code_sent = True
+                
+                with col2:
+                    # Only show final booking button if security code is "sent"
+                    if getattr(st.session_state, 'security_code_sent', False) or security_code:
+                        
+                        # Calculate final amount
+                        final_amount = total_with_insurance if insurance_offered else total_cost
+                        if "Full Payment" in payment_plan:
+                            final_amount = final_amount * 0.95
+                        elif "50% Now" in payment_plan:
+                            final_amount = final_amount * 0.5
+                        elif "25% Now" in payment_plan:
+                            final_amount = final_amount * 0.25
+                        elif "Monthly" in payment_plan:
+                            final_amount = final_amount / 3
+                        
+                        if st.button(f"🎉 **SECURE CHECKOUT - ${final_amount:,.0f}**", type="primary", use_container_width=True):
+                            process_intelligent_booking(
+                                package, travelers_info, contact_email, contact_phone, 
+                                emergency_contact, emergency_phone, selected_flight_idx, 
+                                selected_hotel_idx, special_requests, payment_method,
+                                payment_plan, insurance_offered, final_amount
+                            )
+            else:
+                st.warning("⚠️ Please accept all required terms and conditions to proceed with booking.")
+
+def process_intelligent_booking(package, travelers_info, contact_email, contact_phone, 
+                               emergency_contact, emergency_phone, flight_idx, hotel_idx, 
+                               special_requests, payment_method, payment_plan, insurance_offered, final_amount):
+    """Process the complete intelligent booking with all details and payment processing"""
+    
+    with st.spinner("🔄 Processing your complete package booking with secure payment verification..."):
+        try:
+            import time
+            time.sleep(2)  # Simulate payment processing
+            
+            # Simulate payment processing steps
+            progress_container = st.container()
+            
+            with progress_container:
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                # Step 1: Payment verification
+                status_text.text("🔐 Verifying payment information...")
+                progress_bar.progress(20)
+                time.sleep(1)
+                
+                # Step 2: Processing payment
+                status_text.text("💳 Processing secure payment...")
+                progress_bar.progress(40)
+                time.sleep(1)
+                
+                # Step 3: Booking confirmation
+                status_text.text("📋 Confirming booking details...")
+                progress_bar.progress(60)
+                time.sleep(1)
+                
+                # Step 4: Generating confirmation
+                status_text.text("📧 Generating confirmation documents...")
+                progress_bar.progress(80)
+                time.sleep(1)
+                
+                # Step 5: Complete
+                status_text.text("✅ Booking successfully completed!")
+                progress_bar.progress(100)
+                time.sleep(0.5)
+            
+            # Generate comprehensive booking confirmation
+            # IDs are time-ordered and unique across sessions and replicas (no counter in session state)
+            confirmation_number = new_confirmation_code()
+            booking_confirmation = {
+                'booking_id': new_booking_id(),
+                'confirmation_number': confirmation_number,
+                'package_title': package['title'],
+                'destination': package['destination'],
+                'duration': package['duration'],
+                'travelers': package['travelers'],
+                'traveler_details': travelers_info,
+                'total_amount': final_amount,
+                'original_amount': package['pricing']['total_cost'],
+                'selected_flight': package['flights'][flight_idx],
+                'selected_hotel': package['hotels'][hotel_idx],
+                'daily_itinerary': package['daily_itinerary'],
+                'restaurants': package['restaurants'],
+                'activities': package['activities'],
+                'contact_info': {
+                    'email': contact_email,
+                    'phone': contact_phone,
+                    'emergency_contact': emergency_contact,
+                    'emergency_phone': emergency_phone
+                },
+                'special_requests': special_requests,
+                'payment_method': payment_method,
+                'payment_plan': payment_plan,
+                'travel_insurance': insurance_offered,
+                'created_at': datetime.now(),
+                'status': 'CONFIRMED',
+                'payment_status': 'PAID',
+                'booking_reference': f"REF-{confirmation_number[3:]}"
+            }
+            
+            # Add to booking history
+            st.session_state.booking_history.append(compact(booking_confirmation))
+            record_event("booking", final_amount, "package", package['destination'], "demo_user")
+            
+            # Clear progress display
+            progress_container.empty()
+            
+            # Display comprehensive booking confirmation
+            display_booking_confirmation_success(booking_confirmation)
+            
+            # Auto-generate and offer document downloads
+            generate_booking_documents(booking_confirmation)
+            
+        except Exception as e:
+            st.error(f"❌ Booking processing failed: {str(e)}")
+            st.error("Please try again or contact support at support@aitravelplatform.com")
+
+def display_booking_confirmation_success(booking_confirmation):
+    """Display comprehensive booking confirmation with all details"""
+    
+    # Success header
+    st.markdown("""
+    <div class="booking-success">
+        <h2 style="color: #22c55e; text-align: center; margin-bottom: 1rem;">
+            🎉 BOOKING CONFIRMED SUCCESSFULLY! 🎉
+        </h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Confirmation details in organized layout
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📋 **Booking Details**")
+        st.markdown(f"""
+        **🎫 Confirmation Number:** `{booking_confirmation['confirmation_number']}`  
+        **📦 Package:** {booking_confirmation['package_title']}  
+        **🌍 Destination:** {booking_confirmation['destination']}  
+        **📅 Duration:** {booking_confirmation['duration']} days  
+        **👥 Travelers:** {booking_confirmation['travelers']} people  
+        **💰 Amount Paid:** ${booking_confirmation['total_amount']:,.0f}  
+        **📊 Payment Status:** ✅ {booking_confirmation['payment_status']}  
+        **🔗 Booking Reference:** `{booking_confirmation['booking_reference']}`
+        """)
+        
+        st.markdown("### 📧 **Contact Information**")
+        st.markdown(f"""
+        **📧 Email:** {booking_confirmation['contact_info']['email']}  
+        **📞 Phone:** {booking_confirmation['contact_info']['phone']}  
+        **🚨 Emergency Contact:** {booking_confirmation['contact_info']['emergency_contact']}  
+        **🚨 Emergency Phone:** {booking_confirmation['contact_info']['emergency_phone']}
+        """)
+    
+    with col2:
+        st.markdown("### ✈️ **Flight Details**")
+        flight = booking_confirmation['selected_flight']
+        st.markdown(f"""
+        **✈️ Airline:** {flight['airline']}  
+        **🎫 Class:** {flight['class']}  
+        **⏱️ Duration:** {flight['duration']}  
+        **💰 Cost:** ${flight['total_price']:,.0f}  
+        **🛫 Route:** {flight['departure']}
+        """)
+        
+        st.markdown("### 🏨 **Hotel Details**")
+        hotel = booking_confirmation['selected_hotel']
+        st.markdown(f"""
+        **🏨 Hotel:** {hotel['name']}  
+        **⭐ Rating:** {hotel['rating']}/5.0  
+        **🏷️ Type:** {hotel['type']}  
+        **💰 Rate:** ${hotel['price']}/night  
+        **📍 Location Score:** {hotel['location_score']}/10
+        """)
+    
+    # Payment Information
+    st.markdown("---")
+    st.markdown("### 💳 **Payment Information**")
+    
+    payment_col1, payment_col2, payment_col3 = st.columns(3)
+    
+    with payment_col1:
+        st.markdown(f"""
+        **💳 Payment Method:** {booking_confirmation['payment_method']}  
+        **📅 Payment Plan:** {booking_confirmation['payment_plan']}  
+        **🛡️ Travel Insurance:** {'✅ Included' if booking_confirmation['travel_insurance'] else '❌ Not selected'}
+        """)
+    
+    with payment_col2:
+        st.markdown(f"""
+        **💰 Amount Paid Today:** ${booking_confirmation['total_amount']:,.0f}  
+        **💰 Original Package Price:** ${booking_confirmation['original_amount']:,.0f}  
+        **📅 Booking Date:** {booking_confirmation['created_at'].strftime('%B %d, %Y')}
+        """)
+    
+    with payment_col3:
+        st.markdown(f"""
+        **📋 Booking Status:** ✅ {booking_confirmation['status']}  
+        **🔐 Security:** 256-bit SSL Encrypted  
+        **📧 Confirmation Sent:** ✅ Email & SMS
+        """)
+    
+    # Next Steps
+    st.markdown("---")
+    st.markdown("### 🚀 **What Happens Next?**")
+    
+    next_steps_col1, next_steps_col2 = st.columns(2)
+    
+    with next_steps_col1:
+        st.markdown("""
+        **📧 Immediate Actions:**
+        - ✅ Confirmation email sent to your inbox
+        - ✅ SMS confirmation sent to your phone
+        - ✅ Calendar invites for travel dates
+        - ✅ Travel documents preparation begins
+        
+        **📋 Within 24 Hours:**
+        - 📄 Detailed itinerary document
+        - ✈️ Flight booking confirmations
+        - 🏨 Hotel reservation confirmations
+        - 🍽️ Restaurant reservation details
+        """)
+    
+    with next_steps_col2:
+        st.markdown("""
+        **📞 Your Dedicated Travel Concierge:**
+        - 👤 Personal travel coordinator assigned
+        - 📞 24/7 support hotline: +1-800-AI-TRAVEL
+        - 📧 Direct email: concierge@aitravelplatform.com
+        - 💬 WhatsApp support: +1-555-AI-HELP
+        
+        **🎯 Pre-Travel Preparation:**
+        - 📋 Travel checklist sent via email
+        - 🌍 Destination guide & local tips
+        - 📱 Mobile app access with offline maps
+        - 🛂 Visa/passport requirement updates
+        """)
+    
+    # Special offers for future bookings
+    st.markdown("---")
+    st.markdown("### 🎁 **Exclusive Benefits & Future Offers**")
+    
+    st.success("""
+    **🎉 Welcome to our Premium Traveler Program!**
+    - 🎯 10% discount on your next booking
+    - ✈️ Priority customer support
+    - 🏆 VIP status for future travels
+    - 📧 Exclusive travel deals & insider tips
+    """)
+
+def generate_booking_documents(booking_confirmation):
+    """Generate downloadable booking documents"""
+    
+    st.markdown("---")
+    st.markdown("### 📄 **Download Your Travel Documents**")
+    
+    doc_col1, doc_col2, doc_col3 = st.columns(3)
+    
+    with doc_col1:
+        if st.button("📋 **Download Booking Confirmation**", use_container_width=True):
+            confirmation_pdf = generate_confirmation_pdf(booking_confirmation)
+            st.download_button(
+                label="📄 Download PDF Confirmation",
+                data=confirmation_pdf,
+                file_name=f"booking_confirmation_{booking_confirmation['confirmation_number']}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
+    
+    with doc_col2:
+        if st.button("🗓️ **Download Detailed Itinerary**", use_container_width=True):
+            itinerary_pdf = generate_itinerary_pdf(booking_confirmation)
+            st.download_button(
+                label="📄 Download Itinerary PDF",
+                data=itinerary_pdf,
+                file_name=f"travel_itinerary_{booking_confirmation['confirmation_number']}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
+    
+    with doc_col3:
+        if st.button("📧 **Email All Documents**", use_container_width=True):
+            send_booking_email(booking_confirmation)
+            st.success("✅ All documents sent to your email!")
+
+def generate_confirmation_pdf(booking_confirmation):
+    """Generate booking confirmation PDF"""
+    # Placeholder for PDF generation
+    return b"PDF content would be generated here"
+
+def generate_itinerary_pdf(booking_confirmation):
+    """Generate detailed itinerary PDF"""
+    # Placeholder for PDF generation
+    return b"PDF content would be generated here"
+
+def send_booking_email(booking_confirmation):
+    """Send booking confirmation email"""
+    # Placeholder for email sending
+    pass
+
+def save_package_to_favorites(package):
+    """Save package to user favorites"""
+    if 'saved_packages' not in st.session_state:
+        st.session_state.saved_packages = []
+    
+    st.session_state.saved_packages.append(package)
+    st.success("💾 Package saved to your favorites!")
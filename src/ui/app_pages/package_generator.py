@@ -0,0 +1,2930 @@
+"""
+🧠 Package Generation
+Destination-specific flights, hotels, restaurants, activities and daily itineraries for travel packages
+"""
+
+from datetime import datetime
+
+from src.ui.app_pages.common import get_supabase_client
+
+try:
+    from ai_agents.enhanced_itinerary_generator import EnhancedItineraryGenerator
+    ENHANCED_FEATURES_AVAILABLE = True
+except ImportError as e:
+    ENHANCED_FEATURES_AVAILABLE = False
+    print(f"⚠️ Enhanced itinerary generator not available: {e}")
+
+# AI-Powered Package Generation System
+def generate_personalized_package(user_prompt, profile, destination, duration, travelers, budget, variation_style=None):
+    """Generate a comprehensive, destination-specific travel package based on user's dream trip description"""
+    
+    # Extract destination details for context
+    destination_info = get_destination_intelligence(destination)
+    budget_level = extract_budget_level(budget)
+    
+    # Create package style based on user prompt analysis
+    package_style = analyze_user_prompt_for_style(user_prompt, profile)
+    
+    # Generate truly diverse package components
+    import uuid
+    package = {
+        'id': f"pkg_{uuid.uuid4().hex[:8]}",
+        'title': f"{destination} {package_style['title']}",
+        'destination': destination,
+        'duration': duration,
+        'travelers': travelers,
+        'budget_level': budget_level,
+        'focus': package_style['focus'],
+        'user_prompt_analysis': analyze_trip_desires(user_prompt),
+        'created_at': datetime.now(),
+        
+        # Generate destination-specific components with style variation
+        'flights': generate_destination_specific_flights(destination, travelers, budget_level),
+        'hotels': generate_destination_specific_hotels(destination, duration, travelers, budget_level, profile, user_prompt, variation_style),
+        'restaurants': generate_destination_specific_restaurants(destination, profile, user_prompt, budget_level, variation_style),
+        'activities': generate_destination_specific_activities(destination, profile, user_prompt, budget_level, variation_style),
+        'local_experiences': generate_destination_specific_local_experiences(destination, profile, user_prompt, variation_style),
+        
+        # Generate truly unique daily itinerary based on variation style
+        'daily_itinerary': generate_intelligent_daily_itinerary(destination, duration, profile, user_prompt, package_style, variation_style),
+        
+        # Accurate pricing
+        'pricing': calculate_destination_specific_pricing(destination, duration, travelers, budget_level, package_style)
+    }
+    
+    return package
+
+def get_destination_intelligence(destination):
+    """Enhanced destination intelligence with universal support"""
+    
+    # Try to get specific intelligence first
+    specific_intel = get_specific_destination_intelligence(destination)
+    if specific_intel:
+        return specific_intel
+    
+    # Generate universal destination intelligence
+    return generate_universal_destination_intelligence(destination)
+
+def generate_universal_destination_intelligence(destination):
+    """Generate realistic destination intelligence for any location"""
+    
+    return {
+        'name': destination,
+        'country': f'{destination} Country',
+        'region': f'{destination} Region', 
+        'climate': 'Temperate with seasonal variations',
+        'best_time_to_visit': 'Spring and Fall for pleasant weather',
+        'currency': 'Local Currency',
+        'language': f'{destination} Local Language',
+        'time_zone': f'{destination} Time Zone',
+        'main_attractions': [
+            f'{destination} Historic Center',
+            f'{destination} Main Cathedral/Temple',
+            f'{destination} Central Market',
+            f'{destination} Art Museum',
+            f'{destination} Scenic Viewpoint'
+        ],
+        'cultural_highlights': [
+            f'Traditional {destination} architecture',
+            f'Local {destination} festivals',
+            f'{destination} culinary traditions',
+            f'Traditional {destination} crafts',
+            f'{destination} music and dance'
+        ],
+        'transportation': [
+            'Public transportation available',
+            'Taxi services',
+            'Walking-friendly city center',
+            'Bicycle rentals'
+        ],
+        'safety_tips': [
+            'Generally safe destination',
+            'Keep valuables secure',
+            'Be aware of local customs',
+            'Emergency services available'
+        ]
+    }
+
+def get_specific_destination_intelligence(destination):
+    """Get comprehensive destination intelligence"""
+    destination_data = {
+        'China': {
+            'cities': ['Beijing', 'Shanghai', 'Xi\'an', 'Guilin', 'Chengdu', 'Hong Kong'],
+            'culture': 'Ancient Chinese civilization with modern development',
+            'cuisine': 'Diverse regional cuisines - Peking duck, dim sum, Sichuan hotpot',
+            'landmarks': ['Great Wall', 'Forbidden City', 'Terracotta Army', 'Li River'],
+            'transportation': ['High-speed rail', 'Metro systems', 'Taxi', 'DiDi rideshare'],
+            'currency': 'Chinese Yuan (CNY)',
+            'language': 'Mandarin Chinese',
+            'experiences': ['Calligraphy classes', 'Tea ceremonies', 'Martial arts', 'Traditional markets'],
+            'shopping': ['Silk Street Market', 'Wangfujing', 'Traditional crafts', 'Tea shops'],
+            'nightlife': ['Traditional opera', 'Modern bars', 'Night markets', 'KTV'],
+            'budget_ranges': {
+                'ultra_budget': 35, 'budget': 65, 'moderate': 120, 
+                'premium': 250, 'luxury': 450, 'ultra_luxury': 800
+            },
+            'typical_activities': ['Temple visits', 'Garden walks', 'Cultural shows', 'Food tours'],
+            'airports': ['Beijing Capital (PEK)', 'Shanghai Pudong (PVG)'],
+            'climate': 'Varies by region - temperate to subtropical'
+        },
+        'Paris, France': {
+            'cities': ['Paris', 'Versailles', 'Fontainebleau'],
+            'culture': 'French art, fashion, and culinary excellence',
+            'cuisine': 'French cuisine - croissants, wine, cheese, fine dining',
+            'landmarks': ['Eiffel Tower', 'Louvre', 'Notre-Dame', 'Arc de Triomphe'],
+            'transportation': ['Metro', 'Bus', 'Taxi', 'Walking'],
+            'currency': 'Euro (EUR)',
+            'language': 'French',
+            'experiences': ['Wine tasting', 'Cooking classes', 'Art workshops', 'Fashion tours'],
+            'shopping': ['Champs-Élysées', 'Le Marais', 'Galleries Lafayette', 'Vintage boutiques'],
+            'nightlife': ['Wine bars', 'Cabarets', 'Jazz clubs', 'Seine river cruises'],
+            'budget_ranges': {
+                'ultra_budget': 55, 'budget': 95, 'moderate': 180, 
+                'premium': 350, 'luxury': 650, 'ultra_luxury': 1200
+            },
+            'typical_activities': ['Museum visits', 'Café culture', 'Market exploration', 'Architecture tours'],
+            'airports': ['Charles de Gaulle (CDG)', 'Orly (ORY)'],
+            'climate': 'Temperate oceanic climate'
+        },
+        'Tokyo, Japan': {
+            'cities': ['Tokyo', 'Kyoto', 'Osaka', 'Nikko'],
+            'culture': 'Traditional Japanese culture meets modern innovation',
+            'cuisine': 'Japanese cuisine - sushi, ramen, tempura, kaiseki',
+            'landmarks': ['Tokyo Tower', 'Senso-ji Temple', 'Imperial Palace', 'Mount Fuji'],
+            'transportation': ['JR trains', 'Subway', 'Taxi', 'Shinkansen'],
+            'currency': 'Japanese Yen (JPY)',
+            'language': 'Japanese',
+            'experiences': ['Tea ceremony', 'Sushi making', 'Onsen baths', 'Traditional crafts'],
+            'shopping': ['Shibuya', 'Harajuku', 'Traditional markets', 'Department stores'],
+            'nightlife': ['Izakaya', 'Karaoke', 'Night markets', 'Robot restaurants'],
+            'budget_ranges': {
+                'ultra_budget': 45, 'budget': 85, 'moderate': 160, 
+                'premium': 320, 'luxury': 580, 'ultra_luxury': 1000
+            },
+            'typical_activities': ['Temple visits', 'Garden meditation', 'Tech experiences', 'Food tours'],
+            'airports': ['Narita (NRT)', 'Haneda (HND)'],
+            'climate': 'Humid subtropical climate'
+        }
+    }
+    
+    # Find best match for destination
+    for key, data in destination_data.items():
+        if key.lower() in destination.lower() or any(city.lower() in destination.lower() for city in data['cities']):
+            return data
+    
+    # Default fallback
+    return destination_data.get(destination, {
+        'cities': [destination],
+        'culture': f'{destination} local culture',
+        'cuisine': f'{destination} local cuisine',
+        'landmarks': [f'{destination} landmarks'],
+        'transportation': ['Local transport'],
+        'currency': 'Local currency',
+        'language': 'Local language',
+        'experiences': ['Local experiences'],
+        'shopping': ['Local shopping'],
+        'nightlife': ['Local nightlife'],
+        'budget_ranges': {
+            'ultra_budget': 40, 'budget': 75, 'moderate': 150, 
+            'premium': 280, 'luxury': 500, 'ultra_luxury': 900
+        },
+        'typical_activities': ['Sightseeing', 'Cultural activities'],
+        'airports': [f'{destination} Airport'],
+        'climate': 'Local climate'
+    })
+
+def extract_budget_level(budget_string):
+    """Extract budget level from enhanced budget string with 6-tier system"""
+    budget_lower = budget_string.lower()
+    
+    if 'ultra budget' in budget_lower or '$300-600' in budget_string:
+        return 'ultra_budget'
+    elif 'budget' in budget_lower and '$600-1000' in budget_string:
+        return 'budget'
+    elif 'moderate' in budget_lower or '$1000-2500' in budget_string:
+        return 'moderate'
+    elif 'premium' in budget_lower or '$2500-4000' in budget_string:
+        return 'premium'
+    elif 'ultra luxury' in budget_lower or '$7000+' in budget_string:
+        return 'ultra_luxury'
+    elif 'luxury' in budget_lower or '$4000-7000' in budget_string:
+        return 'luxury'
+    
+    # Fallback to moderate if no match
+    return 'moderate'
+
+def analyze_trip_desires(user_prompt):
+    """Analyze user's trip description for key desires and interests"""
+    prompt_lower = user_prompt.lower()
+    
+    desires = {
+        'cultural_interest': any(word in prompt_lower for word in ['culture', 'history', 'traditional', 'heritage', 'museums', 'art']),
+        'food_focus': any(word in prompt_lower for word in ['food', 'cuisine', 'cooking', 'restaurants', 'street food', 'culinary']),
+        'adventure_seeking': any(word in prompt_lower for word in ['adventure', 'hiking', 'sports', 'active', 'outdoor', 'exciting']),
+        'photography_interest': any(word in prompt_lower for word in ['photography', 'photos', 'instagram', 'scenic', 'capture']),
+        'relaxation_focus': any(word in prompt_lower for word in ['relax', 'peaceful', 'calm', 'spa', 'tranquil', 'unwind']),
+        'local_immersion': any(word in prompt_lower for word in ['local', 'authentic', 'hidden', 'off the beaten', 'real']),
+        'luxury_preference': any(word in prompt_lower for word in ['luxury', 'premium', 'high-end', 'exclusive', 'VIP']),
+        'budget_conscious': any(word in prompt_lower for word in ['budget', 'affordable', 'cheap', 'save money', 'economical'])
+    }
+    
+    return desires
+
+def analyze_user_prompt_for_style(user_prompt, profile):
+    """Analyze user's dream trip description to determine package style"""
+    prompt_lower = user_prompt.lower()
+    
+    # Analyze keywords in user prompt
+    style_indicators = {
+        'cultural-immersive': ['culture', 'history', 'traditional', 'heritage', 'museums', 'art', 'local customs'],
+        'culinary-focused': ['food', 'cuisine', 'cooking', 'restaurants', 'street food', 'markets', 'dining'],
+        'adventure-active': ['adventure', 'hiking', 'sports', 'active', 'outdoor', 'trekking', 'climbing'],
+        'luxury-premium': ['luxury', 'premium', 'high-end', 'exclusive', 'private', 'spa', 'boutique'],
+        'budget-conscious': ['budget', 'affordable', 'cheap', 'economical', 'save money', 'cost-effective'],
+        'photography-focused': ['photography', 'photos', 'instagram', 'scenic', 'landscapes', 'portraits'],
+        'family-friendly': ['family', 'kids', 'children', 'safe', 'child-friendly', 'educational'],
+        'romantic-couples': ['romantic', 'couples', 'honeymoon', 'intimate', 'private', 'sunset']
+    }
+    
+    # Score each style
+    style_scores = {}
+    for style, keywords in style_indicators.items():
+        score = sum(1 for keyword in keywords if keyword in prompt_lower)
+        if score > 0:
+            style_scores[style] = score
+    
+    # Determine primary style
+    if style_scores:
+        primary_style = max(style_scores, key=style_scores.get)
+    else:
+        primary_style = 'cultural-immersive'  # Default
+    
+    # Generate style configuration
+    style_configs = {
+        'cultural-immersive': {
+            'title': 'Cultural Heritage Explorer',
+            'focus': 'Deep cultural immersion with historical sites and local traditions'
+        },
+        'culinary-focused': {
+            'title': 'Culinary Discovery Journey',
+            'focus': 'Authentic local cuisine and cooking experiences'
+        },
+        'adventure-active': {
+            'title': 'Adventure & Active Explorer',
+            'focus': 'Outdoor adventures and active experiences'
+        },
+        'luxury-premium': {
+            'title': 'Premium Luxury Experience',
+            'focus': 'High-end accommodations and exclusive experiences'
+        },
+        'budget-conscious': {
+            'title': 'Smart Budget Explorer',
+            'focus': 'Maximum value with authentic local experiences'
+        },
+        'photography-focused': {
+            'title': 'Photography Expedition',
+            'focus': 'Stunning photography opportunities and scenic locations'
+        },
+        'family-friendly': {
+            'title': 'Family Adventure',
+            'focus': 'Safe, educational, and fun experiences for all ages'
+        },
+        'romantic-couples': {
+            'title': 'Romantic Getaway',
+            'focus': 'Intimate and romantic experiences for couples'
+        }
+    }
+    
+    return style_configs.get(primary_style, style_configs['cultural-immersive'])
+
+def get_style_config_by_type(style_type):
+    """Get style configuration by specific style type"""
+    style_configs = {
+        'cultural-immersive': {
+            'title': 'Cultural Heritage Explorer',
+            'focus': 'Deep cultural immersion with historical sites and local traditions'
+        },
+        'culinary-focused': {
+            'title': 'Culinary Discovery Journey',
+            'focus': 'Authentic local cuisine and cooking experiences'
+        },
+        'adventure-active': {
+            'title': 'Adventure & Active Explorer',
+            'focus': 'Outdoor adventures and active experiences'
+        },
+        'luxury-premium': {
+            'title': 'Premium Luxury Experience',
+            'focus': 'High-end accommodations and exclusive experiences'
+        },
+        'budget-conscious': {
+            'title': 'Smart Budget Explorer',
+            'focus': 'Maximum value with authentic local experiences'
+        },
+        'photography-focused': {
+            'title': 'Photography Expedition',
+            'focus': 'Stunning photography opportunities and scenic locations'
+        },
+        'family-friendly': {
+            'title': 'Family Adventure Package',
+            'focus': 'Safe, educational and fun experiences for the whole family'
+        },
+        'romantic-couples': {
+            'title': 'Romantic Getaway',
+            'focus': 'Intimate and romantic experiences for couples'
+        }
+    }
+    
+    return style_configs.get(style_type, style_configs['cultural-immersive'])
+
+def generate_destination_specific_flights(destination, travelers, budget_level):
+    """Generate accurate, destination-specific flight options"""
+    
+    destination_info = get_destination_intelligence(destination)
+    
+    # Realistic airline partnerships by destination
+    airline_data = {
+        'China': {
+            'budget': [
+                {'airline': 'China Eastern Airlines', 'price_per_person': 450, 'duration': '14h 30m', 'stops': 1},
+                {'airline': 'China Southern Airlines', 'price_per_person': 480, 'duration': '15h 45m', 'stops': 1}
+            ],
+            'moderate': [
+                {'airline': 'Air China', 'price_per_person': 750, 'duration': '13h 20m', 'stops': 1},
+                {'airline': 'Turkish Airlines', 'price_per_person': 820, 'duration': '12h 10m', 'stops': 1}
+            ],
+            'luxury': [
+                {'airline': 'Cathay Pacific (Business)', 'price_per_person': 2200, 'duration': '11h 45m', 'stops': 0},
+                {'airline': 'Singapore Airlines (First)', 'price_per_person': 4500, 'duration': '12h 30m', 'stops': 0}
+            ]
+        },
+        'Paris, France': {
+            'budget': [
+                {'airline': 'Vueling Airlines', 'price_per_person': 220, 'duration': '8h 15m', 'stops': 1},
+                {'airline': 'Ryanair', 'price_per_person': 180, 'duration': '9h 30m', 'stops': 1}
+            ],
+            'moderate': [
+                {'airline': 'Air France', 'price_per_person': 650, 'duration': '7h 20m', 'stops': 0},
+                {'airline': 'Lufthansa', 'price_per_person': 580, 'duration': '8h 45m', 'stops': 1}
+            ],
+            'luxury': [
+                {'airline': 'Air France (Business)', 'price_per_person': 1800, 'duration': '7h 20m', 'stops': 0},
+                {'airline': 'British Airways (First)', 'price_per_person': 3200, 'duration': '7h 45m', 'stops': 0}
+            ]
+        },
+        'Tokyo, Japan': {
+            'budget': [
+                {'airline': 'Jetstar Japan', 'price_per_person': 380, 'duration': '11h 30m', 'stops': 1},
+                {'airline': 'Peach Aviation', 'price_per_person': 420, 'duration': '12h 15m', 'stops': 1}
+            ],
+            'moderate': [
+                {'airline': 'JAL', 'price_per_person': 850, 'duration': '10h 30m', 'stops': 0},
+                {'airline': 'ANA', 'price_per_person': 780, 'duration': '11h 45m', 'stops': 1}
+            ],
+            'luxury': [
+                {'airline': 'JAL (Business)', 'price_per_person': 2500, 'duration': '10h 30m', 'stops': 0},
+                {'airline': 'ANA (First)', 'price_per_person': 4200, 'duration': '10h 45m', 'stops': 0}
+            ]
+        }
+    }
+    
+    # Find matching destination flights
+    for dest_key, flight_data in airline_data.items():
+        if dest_key.lower() in destination.lower():
+            flights = flight_data.get(budget_level, flight_data['moderate'])
+            break
+    else:
+        # Default flights
+        flights = [
+            {'airline': 'International Airlines', 'price_per_person': 600, 'duration': '10h 00m', 'stops': 1},
+            {'airline': 'Global Airways', 'price_per_person': 550, 'duration': '11h 30m', 'stops': 1}
+        ]
+    
+    # Add departure/arrival details and calculate totals
+    for flight in flights:
+        flight.update({
+            'departure': f'New York JFK → {destination_info["airports"][0] if destination_info["airports"] else "International Airport"}',
+            'arrival': f'{destination_info["airports"][0] if destination_info["airports"] else "International Airport"} → New York JFK',
+            'total_price': flight['price_per_person'] * travelers,
+            'class': 'Economy' if budget_level == 'budget' else 'Premium Economy' if budget_level == 'moderate' else 'Business/First'
+        })
+    
+    return flights
+
+def generate_destination_specific_hotels(destination, duration, travelers, budget_level, profile, user_prompt, variation_style=None):
+    """Generate accurate, destination-specific hotel recommendations based on package style"""
+    
+    destination_info = get_destination_intelligence(destination)
+    
+    # Destination-specific hotels
+    hotel_data = {
+        'China': {
+            'budget': [
+                {
+                    'name': 'Beijing Traditional Courtyard Inn',
+                    'type': 'Boutique Traditional Hotel',
+                    'rating': 4.2,
+                    'price': 45,
+                    'location_score': 8.5,
+                    'amenities': ['Free WiFi', 'Traditional Courtyard', 'Chinese Breakfast', 'Tour Desk'],
+                    'why_recommended': 'Authentic hutong experience with traditional Chinese architecture and cultural immersion'
+                },
+                {
+                    'name': 'Shanghai Budget Capsule Hotel',
+                    'type': 'Modern Capsule Hotel',
+                    'rating': 4.0,
+                    'price': 35,
+                    'location_score': 9.0,
+                    'amenities': ['Capsule Pods', 'Shared Lounge', 'Metro Access', 'Modern Design'],
+                    'why_recommended': 'Perfect for budget travelers wanting modern convenience in central Shanghai'
+                }
+            ],
+            'moderate': [
+                {
+                    'name': 'Grand Mercure Beijing Central',
+                    'type': '4-Star Business Hotel',
+                    'rating': 4.5,
+                    'price': 120,
+                    'location_score': 9.2,
+                    'amenities': ['Fitness Center', 'Business Center', 'Chinese Restaurant', 'Concierge'],
+                    'why_recommended': 'Excellent location near Forbidden City with professional service and cultural activities'
+                },
+                {
+                    'name': 'Shanghai French Concession Boutique',
+                    'type': 'Historic Boutique Hotel',
+                    'rating': 4.6,
+                    'price': 140,
+                    'location_score': 8.8,
+                    'amenities': ['Historic Building', 'Art Deco Design', 'Rooftop Bar', 'Cultural Tours'],
+                    'why_recommended': 'Historic charm in French Concession with easy access to cultural sites'
+                }
+            ],
+            'luxury': [
+                {
+                    'name': 'The Peninsula Beijing',
+                    'type': '5-Star Luxury Hotel',
+                    'rating': 4.9,
+                    'price': 300,
+                    'location_score': 9.8,
+                    'amenities': ['Rolls-Royce Fleet', 'Michelin Restaurant', 'Spa', 'Butler Service'],
+                    'why_recommended': 'Ultimate luxury with traditional Chinese hospitality and world-class service'
+                },
+                {
+                    'name': 'Shangri-La Shanghai',
+                    'type': '5-Star Luxury Resort',
+                    'rating': 4.8,
+                    'price': 280,
+                    'location_score': 9.5,
+                    'amenities': ['Multiple Restaurants', 'Luxury Spa', 'River Views', 'VIP Services'],
+                    'why_recommended': 'Stunning views of Shanghai skyline with authentic Chinese luxury experience'
+                }
+            ]
+        },
+        'Paris, France': {
+            'budget': [
+                {
+                    'name': 'Hotel des Jeunes Paris',
+                    'type': 'Budget Boutique Hotel',
+                    'rating': 4.1,
+                    'price': 65,
+                    'location_score': 8.2,
+                    'amenities': ['Free WiFi', 'Continental Breakfast', 'Metro Access', 'Tourist Information'],
+                    'why_recommended': 'Charming budget option in Marais district with authentic Parisian atmosphere'
+                }
+            ],
+            'moderate': [
+                {
+                    'name': 'Hotel Malte Opera Paris',
+                    'type': '4-Star Historic Hotel',
+                    'rating': 4.4,
+                    'price': 180,
+                    'location_score': 9.0,
+                    'amenities': ['Historic Building', 'French Restaurant', 'Near Opera', 'Concierge'],
+                    'why_recommended': 'Perfect location near major attractions with classic Parisian elegance'
+                }
+            ],
+            'luxury': [
+                {
+                    'name': 'Hotel Ritz Paris',
+                    'type': '5-Star Palace Hotel',
+                    'rating': 4.9,
+                    'price': 450,
+                    'location_score': 10.0,
+                    'amenities': ['Michelin Restaurants', 'Luxury Spa', 'Personal Shoppers', 'Palace Service'],
+                    'why_recommended': 'Legendary Parisian luxury in the heart of the city with impeccable service'
+                }
+            ]
+        }
+    }
+    
+    # Find destination-specific hotels
+    for dest_key, hotels_by_budget in hotel_data.items():
+        if dest_key.lower() in destination.lower():
+            hotels = hotels_by_budget.get(budget_level, hotels_by_budget['moderate'])
+            break
+    else:
+        # Default hotels
+        hotels = [
+            {
+                'name': f'{destination} Central Hotel',
+                'type': 'City Hotel',
+                'rating': 4.0,
+                'price': 100,
+                'location_score': 8.0,
+                'amenities': ['WiFi', 'Restaurant', 'Fitness', 'Concierge'],
+                'why_recommended': f'Well-located hotel in {destination} with good amenities'
+            }
+        ]
+    
+    # Store original hotels for fallback
+    original_hotels = hotels.copy()
+    
+    # Filter hotels based on variation style
+    if variation_style:
+        filtered_hotels = []
+        
+        if variation_style == 'luxury-premium':
+            # Prefer luxury hotels
+            filtered_hotels = [h for h in hotels if h.get('rating', 0) >= 4.5 or 'luxury' in h.get('type', '').lower()]
+        elif variation_style == 'budget-conscious':
+            # Prefer budget options
+            filtered_hotels = [h for h in hotels if h.get('price', 999) <= 80]
+        elif variation_style == 'cultural-immersive':
+            # Prefer traditional/cultural hotels
+            filtered_hotels = [h for h in hotels if any(word in h.get('type', '').lower() for word in ['traditional', 'heritage', 'boutique', 'cultural'])]
+        elif variation_style == 'photography-focused':
+            # Prefer hotels with scenic locations
+            filtered_hotels = [h for h in hotels if h.get('location_score', 0) >= 8.0]
+        
+        # Use filtered hotels if available, otherwise use original hotels
+        if filtered_hotels:
+            hotels = filtered_hotels
+        else:
+            # No hotels matched the filter - apply different selection strategy based on style
+            if variation_style == 'luxury-premium':
+                hotels = sorted(original_hotels, key=lambda x: x.get('price', 0), reverse=True)[:3]
+            elif variation_style == 'budget-conscious':
+                hotels = sorted(original_hotels, key=lambda x: x.get('price', 999))[:3]
+            elif variation_style == 'cultural-immersive':
+                hotels = [h for h in original_hotels if any(word in h.get('type', '').lower() for word in ['heritage', 'historic', 'boutique'])] or original_hotels[:3]
+            elif variation_style == 'photography-focused':
+                hotels = [h for h in original_hotels if h.get('location_score', 0) >= 7.0] or original_hotels[:3]
+            else:
+                hotels = original_hotels[:3]  # Default fallback
+    
+    # Calculate totals for each hotel
+    for hotel in hotels:
+        hotel['total_price'] = hotel['price'] * duration
+    
+    return hotels[:3]  # Limit to top 3 hotels
+
+def generate_destination_specific_restaurants(destination, profile, user_prompt, budget_level, variation_style=None):
+    """Generate authentic, destination-specific restaurant recommendations based on package style"""
+    
+    destination_info = get_destination_intelligence(destination)
+    dietary_restrictions = profile.get('dietary_restrictions', [])
+    
+    # Destination-specific restaurants
+    restaurant_data = {
+        'China': [
+            {
+                'name': 'Quanjude Roast Duck Restaurant',
+                'cuisine': 'Traditional Beijing',
+                'rating': 4.7,
+                'price_range': '¥¥¥',
+                'specialty': 'Authentic Peking Duck',
+                'why_recommended': 'Historic restaurant serving Beijing\'s most famous dish since 1864',
+                'reservation_time': 'Dinner reservation recommended',
+                'booking_notes': 'Traditional ceremony included with duck service'
+            },
+            {
+                'name': 'Ding Tai Fung (Shanghai)',
+                'cuisine': 'Shanghainese Dim Sum',
+                'rating': 4.6,
+                'price_range': '¥¥',
+                'specialty': 'Xiao Long Bao (Soup Dumplings)',
+                'why_recommended': 'World-renowned for perfectly crafted soup dumplings and dim sum',
+                'reservation_time': 'Lunch or early dinner',
+                'booking_notes': 'Watch chefs hand-craft dumplings through glass windows'
+            },
+            {
+                'name': 'Spicy Joint Sichuan Hotpot',
+                'cuisine': 'Sichuan Hotpot',
+                'rating': 4.5,
+                'price_range': '¥¥',
+                'specialty': 'Authentic Mala Hotpot',
+                'why_recommended': 'Experience the fiery flavors of authentic Sichuan cuisine',
+                'reservation_time': 'Evening dinner experience',
+                'booking_notes': 'Vegetarian broth available; spice level customizable'
+            },
+            {
+                'name': 'Temple Restaurant Beijing',
+                'cuisine': 'Imperial Chinese',
+                'rating': 4.8,
+                'price_range': '¥¥¥¥',
+                'specialty': 'Royal Court Cuisine',
+                'why_recommended': 'Experience dishes once served to Chinese emperors in Ming Dynasty setting',
+                'reservation_time': 'Special dinner experience',
+                'booking_notes': 'Multi-course tasting menu with cultural storytelling'
+            }
+        ],
+        'Spain': [
+            {
+                'name': 'Casa Botín',
+                'cuisine': 'Traditional Spanish',
+                'rating': 4.8,
+                'price_range': '€€€€',
+                'specialty': 'Cochinillo Asado (Roast Suckling Pig)',
+                'why_recommended': 'World\'s oldest restaurant (1725) serving traditional Castilian cuisine',
+                'reservation_time': 'Dinner reservation essential',
+                'booking_notes': 'Historic atmosphere, traditional wood-fired oven cooking'
+            },
+            {
+                'name': 'Mercado de San Miguel',
+                'cuisine': 'Spanish Tapas Market',
+                'rating': 4.3,
+                'price_range': '€€',
+                'specialty': 'Gourmet Tapas & Spanish Wines',
+                'why_recommended': 'Historic glass market hall with diverse Spanish culinary offerings',
+                'reservation_time': 'No reservation needed',
+                'booking_notes': 'Perfect for sampling multiple Spanish delicacies'
+            },
+            {
+                'name': 'DiverXO',
+                'cuisine': 'Innovative Spanish-Asian Fusion',
+                'rating': 4.9,
+                'price_range': '€€€€€',
+                'specialty': 'Creative Tasting Menu',
+                'why_recommended': '3 Michelin stars, avant-garde culinary artistry by David Muñoz',
+                'reservation_time': 'Advance booking required (months ahead)',
+                'booking_notes': 'Unique dining experience, artistic presentation'
+            },
+            {
+                'name': 'Taberna El Sur',
+                'cuisine': 'Andalusian Tapas',
+                'rating': 4.4,
+                'price_range': '€',
+                'specialty': 'Authentic Tapas & Sherry',
+                'why_recommended': 'Authentic neighborhood tapas bar with local atmosphere',
+                'reservation_time': 'Walk-in friendly',
+                'booking_notes': 'Cash only, stand at bar for authentic experience'
+            },
+            {
+                'name': 'Sobrino de Botín',
+                'cuisine': 'Traditional Madrileño',
+                'rating': 4.6,
+                'price_range': '€€€',
+                'specialty': 'Cordero Asado (Roast Lamb)',
+                'why_recommended': 'Traditional Madrid cuisine in historic setting',
+                'reservation_time': 'Recommended for dinner',
+                'booking_notes': 'Famous for traditional roasted meats'
+            },
+            {
+                'name': 'Paco Roncero Restaurante',
+                'cuisine': 'Modern Spanish Gastronomy',
+                'rating': 4.7,
+                'price_range': '€€€€',
+                'specialty': 'Molecular Gastronomy',
+                'why_recommended': '2 Michelin stars, innovative Spanish cuisine techniques',
+                'reservation_time': 'Advance reservation required',
+                'booking_notes': 'Tasting menu experience, creative presentation'
+            }
+        ],
+        'Paris, France': [
+            {
+                'name': 'L\'Ami Jean',
+                'cuisine': 'Traditional French Bistro',
+                'rating': 4.6,
+                'price_range': '€€€',
+                'specialty': 'Classic French Dishes',
+                'why_recommended': 'Authentic Parisian bistro with passionate chef and local atmosphere',
+                'reservation_time': 'Dinner reservation essential',
+                'booking_notes': 'Small intimate setting, book weeks in advance'
+            },
+            {
+                'name': 'Breizh Café',
+                'cuisine': 'Modern French Crêperie',
+                'rating': 4.4,
+                'price_range': '€€',
+                'specialty': 'Gourmet Crêpes',
+                'why_recommended': 'Innovative take on traditional Breton crêpes with Japanese influences',
+                'reservation_time': 'Lunch or casual dinner',
+                'booking_notes': 'Fusion of French and Japanese culinary techniques'
+            }
+        ]
+    }
+    
+    # Filter by destination with better matching
+    destination_restaurants = []
+    dest_lower = destination.lower()
+    
+    for dest_key, restaurants in restaurant_data.items():
+        key_lower = dest_key.lower()
+        if (key_lower in dest_lower or dest_lower in key_lower or 
+            (key_lower == 'spain' and any(city in dest_lower for city in ['madrid', 'barcelona', 'seville', 'granada', 'valencia'])) or
+            (dest_lower == 'spain' and key_lower in ['madrid', 'barcelona'])):
+            destination_restaurants = restaurants.copy()
+            break
+    
+    if not destination_restaurants:
+        destination_restaurants = generate_universal_restaurants(destination)
+    
+    # Filter by dietary restrictions
+    if 'vegetarian' in dietary_restrictions:
+        for restaurant in destination_restaurants:
+            restaurant['booking_notes'] += ' - Vegetarian options available'
+    
+    # Apply style-specific filtering and selection
+    if variation_style:
+        original_restaurants = destination_restaurants.copy()
+        
+        if variation_style == 'culinary-focused':
+            # Prefer high-rated culinary experiences and unique cuisines
+            filtered = [r for r in destination_restaurants if r.get('rating', 0) >= 4.5 or 'gourmet' in r.get('specialty', '').lower() or 'culinary' in r.get('name', '').lower()]
+            if filtered:
+                destination_restaurants = sorted(filtered, key=lambda x: x.get('rating', 0), reverse=True)
+            else:
+                destination_restaurants = sorted(destination_restaurants, key=lambda x: x.get('rating', 0), reverse=True)
+                
+        elif variation_style == 'luxury-premium':
+            # Prefer upscale restaurants with premium pricing
+            filtered = [r for r in destination_restaurants if ('€€€€' in r.get('price_range', '') or '€€€' in r.get('price_range', '')) and r.get('rating', 0) >= 4.5]
+            if filtered:
+                destination_restaurants = filtered
+            else:
+                # Fallback to highest rated
+                destination_restaurants = sorted(destination_restaurants, key=lambda x: x.get('rating', 0), reverse=True)
+                
+        elif variation_style == 'budget-conscious':
+            # Prefer budget-friendly options
+            filtered = [r for r in destination_restaurants if '€' in r.get('price_range', '') and '€€' not in r.get('price_range', '') or r.get('price', 0) <= 50]
+            if filtered:
+                destination_restaurants = filtered
+            else:
+                # Fallback to lowest priced
+                destination_restaurants = sorted(destination_restaurants, key=lambda x: len(x.get('price_range', '€€€')))
+                
+        elif variation_style == 'cultural-immersive':
+            # Prefer traditional/authentic restaurants
+            filtered = [r for r in destination_restaurants if any(word in r.get('cuisine', '').lower() + ' ' + r.get('specialty', '').lower() for word in ['traditional', 'authentic', 'local', 'heritage', 'historic'])]
+            if filtered:
+                destination_restaurants = filtered
+            else:
+                destination_restaurants = original_restaurants
+                
+        elif variation_style == 'adventure-active':
+            # Prefer casual, accessible restaurants for active travelers
+            filtered = [r for r in destination_restaurants if 'casual' in r.get('booking_notes', '').lower() or 'walk-in' in r.get('reservation_time', '').lower() or '€€' in r.get('price_range', '')]
+            if filtered:
+                destination_restaurants = filtered
+            else:
+                destination_restaurants = original_restaurants
+                
+        elif variation_style == 'photography-focused':
+            # Prefer restaurants with unique atmosphere or views
+            filtered = [r for r in destination_restaurants if any(word in r.get('why_recommended', '').lower() + ' ' + r.get('booking_notes', '').lower() for word in ['atmosphere', 'view', 'historic', 'unique', 'artistic'])]
+            if filtered:
+                destination_restaurants = filtered
+            else:
+                destination_restaurants = original_restaurants
+        
+        # Ensure we have at least 3 restaurants - add back originals if needed
+        if len(destination_restaurants) < 3:
+            remaining = [r for r in original_restaurants if r not in destination_restaurants]
+            needed = 3 - len(destination_restaurants)
+            destination_restaurants.extend(remaining[:needed])
+            
+        # Final fallback - generate unique restaurants if still not enough
+        while len(destination_restaurants) < 3:
+            style_prefix = {
+                'culinary-focused': 'Gourmet',
+                'luxury-premium': 'Luxury',
+                'cultural-immersive': 'Traditional',
+                'adventure-active': 'Casual',
+                'photography-focused': 'Scenic',
+                'budget-conscious': 'Local'
+            }.get(variation_style, 'Local')
+            
+            destination_restaurants.append({
+                'name': f'{style_prefix} {destination} Restaurant {len(destination_restaurants) + 1}',
+                'cuisine': f'{destination} {style_prefix}',
+                'rating': 4.0 + (len(destination_restaurants) * 0.1),
+                'price_range': '€€€€' if variation_style == 'luxury-premium' else '€' if variation_style == 'budget-conscious' else '€€',
+                'specialty': f'{style_prefix} {destination} specialties',
+                'why_recommended': f'{style_prefix} dining experience tailored for {variation_style.replace("-", " ")} travelers',
+                'reservation_time': 'Advance booking recommended' if variation_style == 'luxury-premium' else 'Flexible',
+                'booking_notes': f'Perfect for {variation_style.replace("-", " ")} experience'
+            })
+    
+    return destination_restaurants[:4]  # Return top 4 restaurants
+
+def generate_universal_restaurants(destination):
+    """Generate diverse, realistic restaurants for any destination"""
+    
+    # Common restaurant types that exist globally
+    restaurant_types = [
+        {
+            'name': f'{destination} Heritage Restaurant',
+            'cuisine': f'Traditional {destination}',
+            'rating': 4.6,
+            'price_range': '€€€',
+            'specialty': f'Authentic {destination} classics',
+            'why_recommended': f'Family-owned restaurant serving traditional {destination} recipes for generations',
+            'reservation_time': 'Dinner reservation recommended',
+            'booking_notes': 'Historic recipes, local ingredients, cultural atmosphere'
+        },
+        {
+            'name': f'Modern {destination} Bistro',
+            'cuisine': f'Contemporary {destination}',
+            'rating': 4.4,
+            'price_range': '€€',
+            'specialty': f'Modern interpretations of {destination} cuisine',
+            'why_recommended': f'Innovative chefs putting creative spin on {destination} culinary traditions',
+            'reservation_time': 'Lunch or dinner',
+            'booking_notes': 'Farm-to-table ingredients, artistic presentation'
+        },
+        {
+            'name': f'{destination} Street Food Market',
+            'cuisine': f'{destination} Street Food',
+            'rating': 4.3,
+            'price_range': '€',
+            'specialty': f'Local street food specialties',
+            'why_recommended': f'Authentic {destination} street food experience with local vendors',
+            'reservation_time': 'Walk-in friendly',
+            'booking_notes': 'Cash preferred, try multiple vendors for variety'
+        },
+        {
+            'name': f'The {destination} Gourmet',
+            'cuisine': f'Fine Dining {destination}',
+            'rating': 4.8,
+            'price_range': '€€€€',
+            'specialty': f'Luxury {destination} tasting menu',
+            'why_recommended': f'Award-winning restaurant showcasing {destination} finest culinary artistry',
+            'reservation_time': 'Advanced booking required',
+            'booking_notes': 'Tasting menu experience, wine pairings available'
+        },
+        {
+            'name': f'{destination} Local Tavern',
+            'cuisine': f'Traditional {destination}',
+            'rating': 4.2,
+            'price_range': '€€',
+            'specialty': f'Hearty {destination} comfort food',
+            'why_recommended': f'Neighborhood favorite serving generous portions of {destination} comfort classics',
+            'reservation_time': 'Walk-in welcome',
+            'booking_notes': 'Local atmosphere, generous portions, family-friendly'
+        },
+        {
+            'name': f'Fusion {destination} Kitchen',
+            'cuisine': f'International-{destination} Fusion',
+            'rating': 4.5,
+            'price_range': '€€€',
+            'specialty': f'{destination}-international fusion dishes',
+            'why_recommended': f'Creative fusion of {destination} flavors with international techniques',
+            'reservation_time': 'Dinner recommended',
+            'booking_notes': 'Creative menu, dietary restrictions accommodated'
+        }
+    ]
+    
+    return restaurant_types
+
+def generate_universal_hotels(destination):
+    """Generate diverse, realistic hotels for any destination"""
+    
+    hotel_types = [
+        {
+            'name': f'{destination} Grand Hotel',
+            'type': 'Luxury Heritage Hotel',
+            'rating': 4.7,
+            'price': 320,
+            'location': f'Historic {destination} Center',
+            'amenities': ['Luxury spa', 'Fine dining', 'Concierge', 'Historic architecture'],
+            'why_recommended': f'Iconic {destination} hotel with rich history and elegant accommodations',
+            'booking_notes': 'Historic landmark, premium location, luxury service'
+        },
+        {
+            'name': f'{destination} Boutique Retreat',
+            'type': 'Boutique Hotel',
+            'rating': 4.5,
+            'price': 180,
+            'location': f'{destination} Arts District',
+            'amenities': ['Local art', 'Artisan restaurant', 'Unique design', 'Cultural experiences'],
+            'why_recommended': f'Stylish boutique hotel showcasing {destination} local culture and design',
+            'booking_notes': 'Unique character, local artists, cultural immersion'
+        },
+        {
+            'name': f'{destination} City Lodge',
+            'type': 'Modern Business Hotel',
+            'rating': 4.2,
+            'price': 120,
+            'location': f'Central {destination}',
+            'amenities': ['Business center', 'Fitness center', 'WiFi', 'Conference rooms'],
+            'why_recommended': f'Comfortable modern accommodations with excellent {destination} city access',
+            'booking_notes': 'Business-friendly, central location, reliable amenities'
+        },
+        {
+            'name': f'{destination} Budget Inn',
+            'type': 'Economy Hotel',
+            'rating': 4.0,
+            'price': 65,
+            'location': f'{destination} Transport Hub',
+            'amenities': ['Free breakfast', 'WiFi', 'Luggage storage', '24-hour reception'],
+            'why_recommended': f'Clean, affordable accommodation with good {destination} transport connections',
+            'booking_notes': 'Great value, convenient location, basic amenities'
+        },
+        {
+            'name': f'{destination} Heritage Manor',
+            'type': 'Historic Hotel',
+            'rating': 4.6,
+            'price': 250,
+            'location': f'Historic {destination} Quarter',
+            'amenities': ['Historic gardens', 'Traditional restaurant', 'Antique furnishings', 'Cultural tours'],
+            'why_recommended': f'Stay in beautifully preserved {destination} historic property with authentic charm',
+            'booking_notes': 'Historical significance, authentic period features, cultural value'
+        },
+        {
+            'name': f'{destination} Eco Lodge',
+            'type': 'Sustainable Hotel',
+            'rating': 4.4,
+            'price': 140,
+            'location': f'{destination} Green District',
+            'amenities': ['Eco-friendly practices', 'Organic restaurant', 'Nature access', 'Sustainability tours'],
+            'why_recommended': f'Environmentally conscious hotel promoting sustainable {destination} tourism',
+            'booking_notes': 'Eco-friendly, sustainable practices, nature connection'
+        }
+    ]
+    
+    return hotel_types
+
+def generate_universal_activities(destination):
+    """Generate diverse, realistic activities for any destination"""
+    
+    activity_types = [
+        {
+            'name': f'{destination} Historic Walking Tour',
+            'type': 'Historical Cultural Experience',
+            'duration': '3 hours',
+            'price': 35,
+            'difficulty': 'Easy',
+            'group_size': 'Small group (12-15 people)',
+            'match_reason': f'Perfect introduction to {destination} history and landmarks'
+        },
+        {
+            'name': f'{destination} Cooking Workshop',
+            'type': 'Culinary Experience',
+            'duration': '4 hours',
+            'price': 85,
+            'difficulty': 'Easy',
+            'group_size': 'Small group (8-12 people)',
+            'match_reason': f'Hands-on experience learning traditional {destination} cuisine'
+        },
+        {
+            'name': f'{destination} Art & Culture Tour',
+            'type': 'Cultural Experience',
+            'duration': '2.5 hours',
+            'price': 45,
+            'difficulty': 'Easy',
+            'group_size': 'Medium group (15-20 people)',
+            'match_reason': f'Explore {destination} artistic heritage and cultural sites'
+        },
+        {
+            'name': f'{destination} Adventure Hiking',
+            'type': 'Outdoor Adventure',
+            'duration': '6 hours',
+            'price': 75,
+            'difficulty': 'Moderate',
+            'group_size': 'Small group (8-12 people)',
+            'match_reason': f'Discover {destination} natural beauty and scenic landscapes'
+        },
+        {
+            'name': f'{destination} Photography Walk',
+            'type': 'Photography Experience',
+            'duration': '3 hours',
+            'price': 55,
+            'difficulty': 'Easy',
+            'group_size': 'Small group (6-10 people)',
+            'match_reason': f'Capture {destination} most photogenic spots with professional guidance'
+        },
+        {
+            'name': f'{destination} Local Market Experience',
+            'type': 'Cultural Immersion',
+            'duration': '2 hours',
+            'price': 25,
+            'difficulty': 'Easy',
+            'group_size': 'Small group (10-15 people)',
+            'match_reason': f'Experience authentic {destination} daily life and local commerce'
+        },
+        {
+            'name': f'{destination} Craft Workshop',
+            'type': 'Hands-on Cultural Experience',
+            'duration': '3 hours',
+            'price': 65,
+            'difficulty': 'Easy',
+            'group_size': 'Small group (8-10 people)',
+            'match_reason': f'Learn traditional {destination} crafts from local artisans'
+        },
+        {
+            'name': f'{destination} Evening Entertainment',
+            'type': 'Cultural Performance',
+            'duration': '2 hours',
+            'price': 40,
+            'difficulty': 'Easy',
+            'group_size': 'Medium group (20-30 people)',
+            'match_reason': f'Experience {destination} traditional music, dance, or performance arts'
+        }
+    ]
+    
+    return activity_types
+
+def generate_destination_specific_activities(destination, profile, user_prompt, budget_level, variation_style=None):
+    """Generate destination-specific activities based on interests and package style"""
+    
+    destination_info = get_destination_intelligence(destination)
+    interests = profile.get('interests', ['cultural experiences'])
+    
+    # Destination-specific activities
+    activity_data = {
+        'China': [
+            {
+                'name': 'Great Wall of China Hiking Tour',
+                'type': 'Historical Adventure',
+                'duration': '8 hours',
+                'price': 120,
+                'difficulty': 'Moderate',
+                'group_size': 'Small group (8-12 people)',
+                'match_reason': 'Perfect for cultural history enthusiasts and photography lovers'
+            },
+            {
+                'name': 'Traditional Chinese Calligraphy Workshop',
+                'type': 'Cultural Experience',
+                'duration': '3 hours',
+                'price': 85,
+                'difficulty': 'Easy',
+                'group_size': 'Small group (6-10 people)',
+                'match_reason': 'Hands-on cultural immersion learning ancient Chinese art form'
+            },
+            {
+                'name': 'Forbidden City Private Guided Tour',
+                'type': 'Historical Tour',
+                'duration': '4 hours',
+                'price': 150,
+                'difficulty': 'Easy',
+                'group_size': 'Private guide',
+                'match_reason': 'Deep dive into Chinese imperial history with expert storytelling'
+            },
+            {
+                'name': 'Beijing Hutong Food Tour by Rickshaw',
+                'type': 'Culinary Adventure',
+                'duration': '5 hours',
+                'price': 95,
+                'difficulty': 'Easy',
+                'group_size': 'Small group (6-8 people)',
+                'match_reason': 'Combines local culture, authentic cuisine, and traditional transportation'
+            },
+            {
+                'name': 'Traditional Tea Ceremony Experience',
+                'type': 'Cultural Workshop',
+                'duration': '2 hours',
+                'price': 60,
+                'difficulty': 'Easy',
+                'group_size': 'Small group (4-8 people)',
+                'match_reason': 'Peaceful cultural experience learning the art of Chinese tea culture'
+            }
+        ],
+        'Paris, France': [
+            {
+                'name': 'Louvre Museum Private Art Tour',
+                'type': 'Art & Culture',
+                'duration': '3 hours',
+                'price': 180,
+                'difficulty': 'Easy',
+                'group_size': 'Private guide',
+                'match_reason': 'Perfect for art enthusiasts wanting deep cultural insights'
+            },
+            {
+                'name': 'French Cooking Class with Market Visit',
+                'type': 'Culinary Experience',
+                'duration': '6 hours',
+                'price': 220,
+                'difficulty': 'Easy',
+                'group_size': 'Small group (8-12 people)',
+                'match_reason': 'Hands-on French culinary culture with market exploration'
+            }
+        ]
+    }
+    
+    # Find destination-specific activities
+    for dest_key, activities in activity_data.items():
+        if dest_key.lower() in destination.lower():
+            destination_activities = activities
+            break
+    else:
+        destination_activities = [
+            {
+                'name': f'{destination} City Walking Tour',
+                'type': 'Cultural Tour',
+                'duration': '3 hours',
+                'price': 50,
+                'difficulty': 'Easy',
+                'group_size': 'Group tour',
+                'match_reason': f'Great introduction to {destination} culture and history'
+            }
+        ]
+    
+    # Filter activities based on interests
+    if 'cultural experiences' in interests:
+        prioritized_activities = [act for act in destination_activities if 'Cultural' in act['type']]
+        prioritized_activities.extend([act for act in destination_activities if act not in prioritized_activities])
+        destination_activities = prioritized_activities
+    
+    # Filter activities based on variation style
+    if variation_style:
+        if variation_style == 'cultural-immersive':
+            # Prefer cultural and historical activities
+            destination_activities = [act for act in destination_activities if any(word in act.get('type', '').lower() for word in ['cultural', 'historical', 'heritage', 'museum', 'traditional'])]
+        elif variation_style == 'adventure-active':
+            # Prefer adventure and active activities
+            destination_activities = [act for act in destination_activities if any(word in act.get('type', '').lower() for word in ['adventure', 'active', 'outdoor', 'sports', 'hiking', 'climbing'])]
+        elif variation_style == 'culinary-focused':
+            # Prefer food-related activities
+            destination_activities = [act for act in destination_activities if any(word in act.get('name', '').lower() for word in ['food', 'cooking', 'culinary', 'market', 'cuisine', 'taste'])]
+        elif variation_style == 'photography-focused':
+            # Prefer scenic and photo-worthy activities
+            destination_activities = [act for act in destination_activities if any(word in act.get('name', '').lower() for word in ['photography', 'scenic', 'viewpoint', 'sunset', 'landscape', 'architecture'])]
+        elif variation_style == 'luxury-premium':
+            # Prefer exclusive and premium activities
+            destination_activities = [act for act in destination_activities if act.get('price', 0) >= 100 or 'private' in act.get('group_size', '').lower()]
+        elif variation_style == 'budget-conscious':
+            # Prefer affordable activities
+            destination_activities = [act for act in destination_activities if act.get('price', 999) <= 75]
+        
+        # Ensure we have at least 4 activities  
+        if len(destination_activities) < 4:
+            # Add back activities if filtering was too restrictive
+            for dest_k, all_acts in activity_data.items():
+                if dest_k.lower() in destination.lower():
+                    needed = 4 - len(destination_activities)
+                    destination_activities.extend([act for act in all_acts if act not in destination_activities][:needed])
+                    break
+            
+            # If still not enough, add generic activities
+            while len(destination_activities) < 4:
+                destination_activities.append({
+                    'name': f'{destination} Discovery Tour {len(destination_activities) + 1}',
+                    'type': 'Cultural Tour',
+                    'duration': '3 hours',
+                    'price': 60,
+                    'difficulty': 'Easy',
+                    'group_size': 'Small group',
+                    'match_reason': f'Explore the best of {destination} with local guides'
+                })
+    
+    return destination_activities[:5]  # Return top 5 activities
+
+def generate_destination_specific_local_experiences(destination, profile, user_prompt, variation_style=None):
+    """Generate unique local experiences specific to destination and package style"""
+    
+    destination_info = get_destination_intelligence(destination)
+    
+    # Destination-specific local experiences
+    experience_data = {
+        'China': [
+            {
+                'name': 'Morning Tai Chi with Locals in Temple of Heaven',
+                'type': 'Wellness & Culture',
+                'duration': '2 hours',
+                'price': 25,
+                'description': 'Join Beijing locals for traditional morning exercise in beautiful temple grounds'
+            },
+            {
+                'name': 'Traditional Chinese Medicine Consultation',
+                'type': 'Health & Wellness',
+                'duration': '1.5 hours',
+                'price': 80,
+                'description': 'Learn about ancient healing practices and receive personalized health assessment'
+            },
+            {
+                'name': 'Silk Road Spice Market Exploration',
+                'type': 'Market Experience',
+                'duration': '3 hours',
+                'price': 40,
+                'description': 'Discover exotic spices and ingredients used in regional Chinese cooking'
+            },
+            {
+                'name': 'Mahjong Game Night with Local Family',
+                'type': 'Social Experience',
+                'duration': '3 hours',
+                'price': 55,
+                'description': 'Learn China\'s most popular game while sharing stories with local family'
+            }
+        ],
+        'Paris, France': [
+            {
+                'name': 'Secret Parisian Courtyard Photography Walk',
+                'type': 'Photography & Exploration',
+                'duration': '3 hours',
+                'price': 75,
+                'description': 'Discover hidden courtyards and secret passages unknown to most tourists'
+            }
+        ]
+    }
+    
+    # Find destination experiences
+    for dest_key, experiences in experience_data.items():
+        if dest_key.lower() in destination.lower():
+            destination_experiences = experiences
+            break
+    else:
+        # Default experiences
+        destination_experiences = [
+            {
+                'name': f'{destination} Local Neighborhood Walk',
+                'type': 'Cultural Exploration',
+                'duration': '2 hours',
+                'price': 30,
+                'description': f'Explore authentic local neighborhoods in {destination} with resident guide'
+            }
+        ]
+    
+    # Filter experiences based on variation style
+    if variation_style:
+        if variation_style == 'cultural-immersive':
+            # Prefer cultural and traditional experiences
+            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('type', '').lower() for word in ['cultural', 'traditional', 'heritage', 'historical'])]
+        elif variation_style == 'culinary-focused':
+            # Prefer food-related experiences
+            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('name', '').lower() for word in ['cooking', 'food', 'market', 'culinary', 'tea', 'dining'])]
+        elif variation_style == 'adventure-active':
+            # Prefer active experiences
+            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('type', '').lower() for word in ['adventure', 'active', 'sports', 'physical'])]
+        elif variation_style == 'photography-focused':
+            # Prefer visually appealing experiences
+            destination_experiences = [exp for exp in destination_experiences if any(word in exp.get('name', '').lower() for word in ['photography', 'scenic', 'sunrise', 'sunset', 'view', 'art'])]
+        
+        # Ensure we have at least 3 experiences
+        if len(destination_experiences) < 3:
+            for dest_k, all_exps in experience_data.items():
+                if dest_k.lower() in destination.lower():
+                    needed = 3 - len(destination_experiences)
+                    destination_experiences.extend([exp for exp in all_exps if exp not in destination_experiences][:needed])
+                    break
+            
+            # Generate style-specific experiences if still needed
+            while len(destination_experiences) < 3:
+                exp_count = len(destination_experiences) + 1
+                
+                if variation_style == 'cultural-immersive':
+                    new_exp = {
+                        'name': f'{destination} Cultural Heritage Walk {exp_count}',
+                        'type': 'Cultural Immersion',
+                        'duration': '3 hours',
+                        'price': 45,
+                        'description': f'Deep dive into {destination} history, traditions, and local customs with expert guides'
+                    }
+                elif variation_style == 'culinary-focused':
+                    new_exp = {
+                        'name': f'{destination} Food Market Discovery {exp_count}',
+                        'type': 'Culinary Adventure',
+                        'duration': '2.5 hours',
+                        'price': 55,
+                        'description': f'Explore {destination} local markets, taste regional specialties, and meet local vendors'
+                    }
+                elif variation_style == 'adventure-active':
+                    new_exp = {
+                        'name': f'{destination} Active Adventure Tour {exp_count}',
+                        'type': 'Outdoor Adventure',
+                        'duration': '4 hours',
+                        'price': 75,
+                        'description': f'Active exploration of {destination} through hiking, cycling, or outdoor activities'
+                    }
+                elif variation_style == 'luxury-premium':
+                    new_exp = {
+                        'name': f'{destination} VIP Experience {exp_count}',
+                        'type': 'Luxury Experience',
+                        'duration': '3 hours',
+                        'price': 120,
+                        'description': f'Exclusive {destination} experience with private guide and premium access'
+                    }
+                elif variation_style == 'photography-focused':
+                    new_exp = {
+                        'name': f'{destination} Photography Tour {exp_count}',
+                        'type': 'Photography Experience',
+                        'duration': '4 hours',
+                        'price': 65,
+                        'description': f'Capture {destination} best shots with professional photography guidance'
+                    }
+                elif variation_style == 'budget-conscious':
+                    new_exp = {
+                        'name': f'{destination} Free Walking Discovery {exp_count}',
+                        'type': 'Budget-Friendly Tour',
+                        'duration': '2 hours',
+                        'price': 25,
+                        'description': f'Affordable exploration of {destination} highlights and hidden gems'
+                    }
+                else:
+                    new_exp = {
+                        'name': f'{destination} Local Experience {exp_count}',
+                        'type': 'Cultural Experience',
+                        'duration': '2 hours',
+                        'price': 40,
+                        'description': f'Authentic local experience showcasing {destination} culture and traditions'
+                    }
+                
+                destination_experiences.append(new_exp)
+    
+    return destination_experiences[:4]
+
+def generate_intelligent_daily_itinerary(destination, duration, profile, user_prompt, package_style, variation_style=None):
+    """Generate truly unique, destination-specific daily itinerary with enhanced AI and database integration"""
+    
+    # Use enhanced itinerary generator if available
+    if ENHANCED_FEATURES_AVAILABLE:
+        try:
+            enhanced_generator = EnhancedItineraryGenerator(get_supabase_client())
+            # The EnhancedItineraryGenerator expects 6 parameters, not 7
+            return enhanced_generator.generate_intelligent_daily_itinerary(
+                destination, duration, profile, user_prompt, package_style
+            )
+        except Exception as e:
+            print(f"Enhanced itinerary generation failed: {e}")
+            # Fall back to enhanced implementation
+    
+    # Enhanced database-driven implementation
+    return generate_database_driven_itinerary(destination, duration, profile, user_prompt, package_style, variation_style)
+
+def generate_database_driven_itinerary(destination, duration, profile, user_prompt, package_style, variation_style=None):
+    """Generate highly detailed, database-driven daily itinerary based on package variation style"""
+    
+    destination_info = get_destination_intelligence(destination)
+    activities_from_db = fetch_activities_from_database(destination)
+    user_interests = analyze_user_interests_advanced(profile, user_prompt)
+    
+    itinerary = []
+    used_activities = set()  # Track used activities to avoid repetition
+    
+    # Create day-specific themes with intelligent variation based on package variation style
+    effective_style = variation_style or package_style.get('style_type', 'cultural-immersive')
+    daily_themes = generate_progressive_daily_themes(destination, duration, user_interests, effective_style)
+    
+    # Safety check: ensure we have enough themes
+    if len(daily_themes) < duration:
+        # Extend themes if needed
+        while len(daily_themes) < duration:
+            daily_themes.append(f"Day {len(daily_themes) + 1}: Exploration & Discovery")
+    
+    for day in range(1, duration + 1):
+        # Safety check for theme index
+        theme_index = min(day - 1, len(daily_themes) - 1)
+        current_theme = daily_themes[theme_index] if daily_themes else f"Day {day}: Discovery"
+        
+        day_plan = generate_hyper_personalized_day(
+            day, duration, destination, destination_info, 
+            activities_from_db, current_theme, 
+            profile, user_prompt, used_activities
+        )
+        itinerary.append(day_plan)
+        
+        # Track used activities to ensure variety
+        if 'activities' in day_plan:
+            for activity in day_plan['activities']:
+                used_activities.add(activity.get('name', ''))
+    
+    return itinerary
+
+def fetch_activities_from_database(destination):
+    """Fetch relevant activities from Supabase database"""
+    
+    activities = []
+    try:
+        supabase = get_supabase_client()
+        if supabase:
+            # Extract city from destination for database query
+            city = destination.split(',')[0].strip()
+            
+            # Query activities table with multiple search strategies
+            queries = [
+                supabase.table("activities").select("*").ilike("city", f"%{city}%"),
+                supabase.table("activities").select("*").ilike("destination", f"%{destination}%"),
+                supabase.table("activities").select("*").ilike("location", f"%{city}%")
+            ]
+            
+            for query in queries:
+                try:
+                    result = query.execute()
+                    if result.data:
+                        activities.extend(result.data)
+                except Exception as e:
+                    print(f"Database query failed: {e}")
+                    continue
+            
+            # Remove duplicates based on activity name
+            seen_names = set()
+            unique_activities = []
+            for activity in activities:
+                name = activity.get('name', '') or activity.get('title', '')
+                if name and name not in seen_names:
+                    seen_names.add(name)
+                    unique_activities.append(activity)
+            
+            activities = unique_activities
+            
+    except Exception as e:
+        print(f"Database fetch failed: {e}")
+    
+    # If no database activities found, create intelligent fallback activities
+    if not activities:
+        activities = generate_intelligent_fallback_activities(destination)
+    
+    return activities
+
+def generate_intelligent_fallback_activities(destination):
+    """Generate intelligent fallback activities when database is unavailable - comprehensive real-world data"""
+    
+    destination_lower = destination.lower()
+    
+    # Destination-specific intelligent activities with REAL web-researched data
+    if any(place in destination_lower for place in ['paris', 'france']):
+        return [
+            # Morning Cultural Activities
+            {'name': 'Louvre Museum Private Tour with Skip-the-Line Access', 'type': 'Cultural', 'duration': '3 hours', 'time_preference': 'morning', 'price': 89, 'description': 'Expert-guided tour through world\'s largest art museum including Mona Lisa and Venus de Milo', 'popularity_score': 95},
+            {'name': 'Montmartre Walking Tour with Local Artist', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 45, 'description': 'Explore artistic quarter with bohemian history, Sacré-Cœur, and street artists', 'popularity_score': 88},
+            {'name': 'Notre-Dame Cathedral Area Historical Walk', 'type': 'Historical', 'duration': '2 hours', 'time_preference': 'morning', 'price': 25, 'description': 'Gothic architecture tour around Île de la Cité with Seine river views', 'popularity_score': 82},
+            
+            # Afternoon Activities
+            {'name': 'Eiffel Tower Summit Access with Sunset Views', 'type': 'Landmark', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 75, 'description': 'Elevator access to top floor with panoramic Paris views and photo opportunities', 'popularity_score': 98},
+            {'name': 'Seine River Cruise with Champagne Service', 'type': 'Scenic', 'duration': '1.5 hours', 'time_preference': 'afternoon', 'price': 55, 'description': 'Relaxing boat tour passing major landmarks with optional champagne service', 'popularity_score': 85},
+            {'name': 'Le Marais Food Walking Tour', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 65, 'description': 'Taste authentic French cuisine in historic Jewish quarter with local specialties', 'popularity_score': 90},
+            
+            # Evening Activities
+            {'name': 'Moulin Rouge Cabaret Show with Dinner', 'type': 'Entertainment', 'duration': '3 hours', 'time_preference': 'evening', 'price': 180, 'description': 'Iconic Parisian cabaret with can-can dancers, live music, and French dinner', 'popularity_score': 87},
+            {'name': 'Latin Quarter Jazz Club Experience', 'type': 'Nightlife', 'duration': '2 hours', 'time_preference': 'evening', 'price': 35, 'description': 'Intimate jazz venue with live performances in historic Latin Quarter', 'popularity_score': 75},
+            
+            # Full Day Experiences
+            {'name': 'Palace of Versailles Day Trip with Gardens', 'type': 'Historical', 'duration': '8 hours', 'time_preference': 'full_day', 'price': 95, 'description': 'Royal palace tour with opulent halls, Hall of Mirrors, and stunning gardens', 'popularity_score': 92},
+        ]
+        
+    elif any(place in destination_lower for place in ['tokyo', 'japan']):
+        return [
+            # Morning Cultural Activities
+            {'name': 'Tsukiji Outer Market Food Tour', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'morning', 'price': 65, 'description': 'Early morning tour of famous fish market with fresh sushi, street food tastings', 'popularity_score': 94},
+            {'name': 'Asakusa Sensoji Temple Traditional Experience', 'type': 'Cultural', 'duration': '2 hours', 'time_preference': 'morning', 'price': 30, 'description': 'Tokyo\'s oldest temple with traditional shopping street and cultural rituals', 'popularity_score': 89},
+            {'name': 'Imperial Palace East Gardens Walk', 'type': 'Historical', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 20, 'description': 'Peaceful gardens of former Edo Castle with seasonal flowers and traditional architecture', 'popularity_score': 78},
+            
+            # Afternoon Activities  
+            {'name': 'Shibuya Crossing and Harajuku Culture Tour', 'type': 'Modern Culture', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 45, 'description': 'Experience world\'s busiest crossing and youth fashion culture in Harajuku district', 'popularity_score': 91},
+            {'name': 'Tokyo Skytree Observation Deck with City Views', 'type': 'Landmark', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 85, 'description': 'World\'s second tallest structure with panoramic Tokyo views from 450m height', 'popularity_score': 86},
+            {'name': 'Akihabara Electronics and Anime District Tour', 'type': 'Modern Culture', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 40, 'description': 'Explore tech wonderland with electronics shops, manga stores, and gaming centers', 'popularity_score': 83},
+            
+            # Evening Activities
+            {'name': 'Shinjuku Golden Gai Night Bar Tour', 'type': 'Nightlife', 'duration': '3 hours', 'time_preference': 'evening', 'price': 75, 'description': 'Tiny themed bars in narrow alleys with local drinks and authentic nightlife', 'popularity_score': 88},
+            {'name': 'Traditional Kaiseki Dinner Experience', 'type': 'Culinary', 'duration': '2.5 hours', 'time_preference': 'evening', 'price': 150, 'description': 'Multi-course traditional Japanese haute cuisine with seasonal ingredients', 'popularity_score': 85},
+            
+            # Full Day Experiences  
+            {'name': 'Mt. Fuji and Lake Kawaguchi Day Trip', 'type': 'Nature', 'duration': '10 hours', 'time_preference': 'full_day', 'price': 120, 'description': 'Scenic trip to Japan\'s iconic mountain with lake views and traditional villages', 'popularity_score': 95},
+            {'name': 'Tokyo Sushi Making Class with Sake Tasting', 'type': 'Culinary', 'duration': '4 hours', 'time_preference': 'full_day', 'price': 95, 'description': 'Learn authentic sushi preparation techniques with sake pairing from master chef', 'popularity_score': 87}
+        ]
+        
+    elif any(place in destination_lower for place in ['rome', 'italy']):
+        return [
+            # Morning Cultural Activities
+            {'name': 'Colosseum Underground and Arena Floor Tour', 'type': 'Historical', 'duration': '3 hours', 'time_preference': 'morning', 'price': 85, 'description': 'Exclusive access to gladiator areas and underground chambers of ancient amphitheater', 'popularity_score': 96},
+            {'name': 'Vatican Museums and Sistine Chapel Early Access', 'type': 'Art & Culture', 'duration': '3.5 hours', 'time_preference': 'morning', 'price': 95, 'description': 'Skip-the-line access to papal art collection and Michelangelo\'s masterpiece ceiling', 'popularity_score': 94},
+            {'name': 'Roman Forum and Palatine Hill Guided Walk', 'type': 'Historical', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 55, 'description': 'Ancient Roman political center and imperial palace ruins with expert historian guide', 'popularity_score': 88},
+            
+            # Afternoon Activities
+            {'name': 'Pantheon and Historic Center Walking Tour', 'type': 'Historical', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 35, 'description': 'Best-preserved Roman building and surrounding historic squares and fountains', 'popularity_score': 85},
+            {'name': 'Trastevere Food Tour with Wine Tasting', 'type': 'Culinary', 'duration': '3.5 hours', 'time_preference': 'afternoon', 'price': 75, 'description': 'Authentic Roman cuisine in bohemian neighborhood with local wine pairings', 'popularity_score': 91},
+            {'name': 'Spanish Steps and Trevi Fountain Photo Walk', 'type': 'Sightseeing', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 25, 'description': 'Iconic baroque staircase and famous fountain with coin-throwing tradition', 'popularity_score': 83},
+            
+            # Evening Activities
+            {'name': 'Italian Cooking Class with Roman Recipes', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'evening', 'price': 85, 'description': 'Learn to make fresh pasta, pizza, and tiramisu with local chef', 'popularity_score': 89},
+            {'name': 'Tiber River Evening Cruise with Aperitivo', 'type': 'Scenic', 'duration': '1.5 hours', 'time_preference': 'evening', 'price': 45, 'description': 'Romantic boat ride with Italian cocktails and views of illuminated landmarks', 'popularity_score': 78},
+            
+            # Full Day Experiences
+            {'name': 'Roman Catacombs Underground Exploration', 'type': 'Historical', 'duration': '4 hours', 'time_preference': 'full_day', 'price': 65, 'description': 'Ancient Christian burial tunnels with guided tour through underground passages', 'popularity_score': 82},
+            {'name': 'Wine Tasting in Roman Countryside', 'type': 'Culinary', 'duration': '6 hours', 'time_preference': 'full_day', 'price': 110, 'description': 'Visit local vineyards with wine education, tastings, and traditional lunch', 'popularity_score': 86}
+        ]
+        
+    elif any(place in destination_lower for place in ['london', 'england', 'uk']):
+        return [
+            # Morning Cultural Activities
+            {'name': 'Tower of London Crown Jewels Tour', 'type': 'Historical', 'duration': '3 hours', 'time_preference': 'morning', 'price': 75, 'description': 'Historic fortress with royal crown jewels, Beefeater guards, and Tower Bridge views', 'popularity_score': 92},
+            {'name': 'British Museum Highlights Private Tour', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 65, 'description': 'World-class artifacts including Rosetta Stone, Egyptian mummies, and Greek sculptures', 'popularity_score': 88},
+            {'name': 'Westminster Abbey and Parliament Tour', 'type': 'Historical', 'duration': '2 hours', 'time_preference': 'morning', 'price': 55, 'description': 'Gothic abbey where royals are crowned and buried, plus Houses of Parliament exterior', 'popularity_score': 85},
+            
+            # Afternoon Activities
+            {'name': 'London Eye Giant Ferris Wheel Experience', 'type': 'Landmark', 'duration': '1 hour', 'time_preference': 'afternoon', 'price': 45, 'description': 'Iconic observation wheel with 360-degree panoramic views over London skyline', 'popularity_score': 89},
+            {'name': 'Thames River Cruise with Afternoon Tea', 'type': 'Scenic', 'duration': '2 hours', 'time_preference': 'afternoon', 'price': 65, 'description': 'Traditional British afternoon tea service while cruising past London landmarks', 'popularity_score': 83},
+            {'name': 'Covent Garden and West End Theater District', 'type': 'Entertainment', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 35, 'description': 'Street performers, boutique shopping, and world-famous theater productions', 'popularity_score': 80},
+            
+            # Evening Activities
+            {'name': 'Traditional English Pub Tour with Fish & Chips', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'evening', 'price': 55, 'description': 'Historic pubs with local ales, traditional British cuisine, and social atmosphere', 'popularity_score': 85},
+            {'name': 'West End Musical Show with Pre-Theater Dinner', 'type': 'Entertainment', 'duration': '4 hours', 'time_preference': 'evening', 'price': 125, 'description': 'World-class musical theater production with three-course pre-show dining', 'popularity_score': 91},
+            
+            # Full Day Experiences
+            {'name': 'Windsor Castle and Royal Gardens Day Trip', 'type': 'Historical', 'duration': '8 hours', 'time_preference': 'full_day', 'price': 95, 'description': 'Royal residence with State Apartments, Queen Mary\'s Dolls\' House, and castle grounds', 'popularity_score': 87},
+            {'name': 'Harry Potter Studio Tour Experience', 'type': 'Entertainment', 'duration': '6 hours', 'time_preference': 'full_day', 'price': 85, 'description': 'Behind-the-scenes movie magic with authentic sets, costumes, and special effects', 'popularity_score': 94}
+        ]
+        
+    elif any(place in destination_lower for place in ['bangkok', 'thailand']):
+        return [
+            # Morning Cultural Activities  
+            {'name': 'Grand Palace and Emerald Buddha Temple', 'type': 'Cultural', 'duration': '3 hours', 'time_preference': 'morning', 'price': 45, 'description': 'Ornate royal palace complex with sacred temple housing Thailand\'s most revered Buddha image', 'popularity_score': 94},
+            {'name': 'Wat Pho Temple and Thai Massage Experience', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 35, 'description': 'Temple of Reclining Buddha with traditional Thai massage at birthplace of massage therapy', 'popularity_score': 89},
+            {'name': 'Floating Market Tour by Longtail Boat', 'type': 'Cultural', 'duration': '4 hours', 'time_preference': 'morning', 'price': 55, 'description': 'Traditional water market with fruit vendors in boats, authentic Thai breakfast, local life', 'popularity_score': 87},
+            
+            # Afternoon Activities
+            {'name': 'Chatuchak Weekend Market Shopping Adventure', 'type': 'Shopping', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 25, 'description': 'Massive market with 15,000 stalls selling everything from handicrafts to street food', 'popularity_score': 85},
+            {'name': 'Thai Cooking Class with Market Tour', 'type': 'Culinary', 'duration': '4 hours', 'time_preference': 'afternoon', 'price': 65, 'description': 'Learn authentic Thai recipes starting with fresh market ingredient selection', 'popularity_score': 91},
+            {'name': 'Chao Phraya River Cruise with Temple Stops', 'type': 'Scenic', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 40, 'description': 'River of Kings boat tour visiting waterfront temples and traditional stilt houses', 'popularity_score': 82},
+            
+            # Evening Activities
+            {'name': 'Khao San Road Night Market and Street Food', 'type': 'Nightlife', 'duration': '3 hours', 'time_preference': 'evening', 'price': 30, 'description': 'Backpacker haven with street food stalls, bars, live music, and night shopping', 'popularity_score': 83},
+            {'name': 'Rooftop Sky Bar with Bangkok City Views', 'type': 'Nightlife', 'duration': '2 hours', 'time_preference': 'evening', 'price': 75, 'description': 'High-altitude cocktails with panoramic city skyline and Chao Phraya river views', 'popularity_score': 88},
+            
+            # Full Day Experiences
+            {'name': 'Ayutthaya Ancient Capital Day Trip', 'type': 'Historical', 'duration': '8 hours', 'time_preference': 'full_day', 'price': 85, 'description': 'UNESCO World Heritage ruins of former Siamese capital with temple complexes', 'popularity_score': 86},
+            {'name': 'Muay Thai Boxing Match with Traditional Dinner', 'type': 'Cultural', 'duration': '5 hours', 'time_preference': 'evening', 'price': 95, 'description': 'Traditional Thai boxing at historic stadium with pre-fight ceremonial dinner', 'popularity_score': 84}
+        ]
+        
+    else:
+        # Generic fallback for other destinations
+        city_name = destination.split(',')[0].strip()
+        return [
+            {'name': f'{city_name} Historic Center Walking Tour', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'morning', 'price': 35, 'description': f'Explore the historic heart of {city_name} with local guide and cultural insights', 'popularity_score': 78},
+            {'name': f'{city_name} Food Market and Tasting Tour', 'type': 'Culinary', 'duration': '3 hours', 'time_preference': 'afternoon', 'price': 55, 'description': f'Sample authentic local cuisine and specialties in {city_name}\'s best food markets', 'popularity_score': 82},
+            {'name': f'{city_name} Evening Cultural Performance', 'type': 'Entertainment', 'duration': '2 hours', 'time_preference': 'evening', 'price': 45, 'description': f'Traditional cultural show showcasing {city_name}\'s heritage through music and dance', 'popularity_score': 75},
+            {'name': f'{city_name} Art and Architecture Tour', 'type': 'Cultural', 'duration': '2.5 hours', 'time_preference': 'afternoon', 'price': 40, 'description': f'Discover {city_name}\'s architectural landmarks and artistic heritage with expert guide', 'popularity_score': 80},
+            {'name': f'{city_name} Local Neighborhood Experience', 'type': 'Cultural', 'duration': '3 hours', 'time_preference': 'morning', 'price': 50, 'description': f'Authentic local experience in residential neighborhoods away from tourist crowds', 'popularity_score': 76}
+        ]
+
+def analyze_user_interests_advanced(profile, user_prompt):
+    """Advanced analysis of user interests from profile and prompt"""
+    
+    interests = profile.get('interests', [])
+    prompt_lower = user_prompt.lower()
+    
+    # Enhanced interest categories with weights
+    interest_analysis = {
+        'cultural_immersion': 0,
+        'culinary_experiences': 0,
+        'adventure_activities': 0,
+        'relaxation_wellness': 0,
+        'photography_sightseeing': 0,
+        'shopping_lifestyle': 0,
+        'nightlife_entertainment': 0,
+        'educational_learning': 0,
+        'romantic_experiences': 0,
+        'family_friendly': 0
+    }
+    
+    # Analyze profile interests
+    for interest in interests:
+        interest_lower = interest.lower()
+        if any(word in interest_lower for word in ['culture', 'history', 'museum', 'heritage']):
+            interest_analysis['cultural_immersion'] += 2
+        if any(word in interest_lower for word in ['food', 'cuisine', 'cooking', 'dining']):
+            interest_analysis['culinary_experiences'] += 2
+        if any(word in interest_lower for word in ['photography', 'photo']):
+            interest_analysis['photography_sightseeing'] += 2
+        if any(word in interest_lower for word in ['art', 'gallery']):
+            interest_analysis['cultural_immersion'] += 1
+            interest_analysis['educational_learning'] += 1
+    
+    # Analyze user prompt for additional insights
+    cultural_keywords = ['culture', 'history', 'traditional', 'heritage', 'museums', 'temples', 'monuments']
+    culinary_keywords = ['food', 'cuisine', 'cooking', 'restaurants', 'local dishes', 'street food', 'wine', 'beer']
+    adventure_keywords = ['adventure', 'hiking', 'outdoor', 'sports', 'active', 'climbing', 'biking']
+    relaxation_keywords = ['relax', 'spa', 'peaceful', 'calm', 'beach', 'wellness', 'meditation']
+    photography_keywords = ['photography', 'photos', 'instagram', 'scenic', 'views', 'landscapes']
+    
+    for keyword in cultural_keywords:
+        if keyword in prompt_lower:
+            interest_analysis['cultural_immersion'] += 1
+    
+    for keyword in culinary_keywords:
+        if keyword in prompt_lower:
+            interest_analysis['culinary_experiences'] += 1
+    
+    for keyword in adventure_keywords:
+        if keyword in prompt_lower:
+            interest_analysis['adventure_activities'] += 1
+    
+    for keyword in relaxation_keywords:
+        if keyword in prompt_lower:
+            interest_analysis['relaxation_wellness'] += 1
+    
+    for keyword in photography_keywords:
+        if keyword in prompt_lower:
+            interest_analysis['photography_sightseeing'] += 1
+    
+    # Identify top 3 interests
+    sorted_interests = sorted(interest_analysis.items(), key=lambda x: x[1], reverse=True)
+    return [interest[0] for interest in sorted_interests[:3] if interest[1] > 0]
+
+def generate_style_specific_themes(destination, theme_focus):
+    """Generate destination-specific themes based on package style"""
+    
+    destination_lower = destination.lower()
+    
+    # Style-specific theme templates
+    theme_templates = {
+        'cultural': {
+            'paris': [
+                "Arrival & Classic Paris Discovery - Eiffel Tower & Notre-Dame",
+                "Art & Culture Immersion - Louvre & Musée d'Orsay", 
+                "Historic Paris Exploration - Le Marais & Latin Quarter",
+                "Royal Heritage Experience - Versailles Palace Day Trip",
+                "Literary Paris Walk - Shakespeare & Company, Panthéon",
+                "Sacred Paris - Sainte-Chapelle & Sacré-Cœur",
+                "Cultural Farewell - Opera House & Champs-Élysées"
+            ],
+            'tokyo': [
+                "Tokyo Arrival & Traditional Districts - Asakusa Temples",
+                "Imperial Culture - East Gardens & National Museum",
+                "Traditional Arts Experience - Kabuki & Tea Ceremony",
+                "Spiritual Tokyo - Meiji Shrine & Senso-ji Temple", 
+                "Edo Culture Discovery - Traditional Crafts Workshop",
+                "Cultural Neighborhoods - Yanaka & Traditional Markets"
+            ],
+            'spain': [
+                "Arrival & Madrid Royal Heritage - Royal Palace & Plaza Mayor",
+                "Islamic Spain Discovery - Alhambra Palace in Granada",
+                "Medieval Spanish Culture - Toledo & Historic Centers",
+                "Artistic Spain - Prado Museum & Picasso Masterpieces",
+                "Religious Heritage - Santiago de Compostela & Cathedrals",
+                "Moorish Legacy - Alcázar & Cordoba Mezquita",
+                "Spanish Traditions - Flamenco & Cultural Farewell"
+            ],
+            'generic': [
+                f"Arrival & {destination} Cultural Overview",
+                f"Historical Heart of {destination}",
+                f"Traditional Arts & Crafts Experience", 
+                f"Religious & Spiritual {destination}",
+                f"Museums & Cultural Heritage",
+                f"Local Traditions & Customs",
+                f"Cultural Farewell Experience"
+            ]
+        },
+        'culinary': {
+            'paris': [
+                "Culinary Arrival - Market Tour & French Bistro",
+                "Patisserie & Boulangerie Workshop Experience",
+                "Wine & Cheese Tasting in Montmartre",
+                "Michelin Star Dining & Fine French Cuisine",
+                "Cooking Class - Traditional French Dishes",
+                "Food Market Adventures - Le Marché aux Puces",
+                "Farewell Feast - Seine River Dinner Cruise"
+            ],
+            'tokyo': [
+                "Culinary Tokyo Arrival - Tsukiji Outer Market Tour", 
+                "Sushi Making Class & Sake Tasting",
+                "Ramen & Street Food Discovery Tour",
+                "Kaiseki Fine Dining Experience",
+                "Cooking Workshop - Traditional Japanese Cuisine",
+                "Food Districts Exploration - Shibuya & Harajuku Eats"
+            ],
+            'spain': [
+                "Spanish Culinary Arrival - Mercado San Miguel & Tapas Tour",
+                "Paella Cooking Class & Valencia Rice Fields",
+                "Jamón Ibérico & Wine Tasting in La Rioja",
+                "Pintxos Bar Hopping in Basque Country",
+                "Traditional Spanish Market & Ingredient Tour",
+                "Sherry & Andalusian Cuisine Experience",
+                "Farewell Feast - Casa Botín & Spanish Classics"
+            ],
+            'generic': [
+                f"{destination} Culinary Discovery - Markets & Local Cuisine",
+                f"Cooking Class - Traditional {destination} Dishes",
+                f"Street Food & Local Eateries Adventure",
+                f"Fine Dining & Regional Specialties",
+                f"Food Market & Ingredient Shopping Tour",
+                f"Wine/Local Drinks Tasting Experience",
+                f"Farewell Feast - Best of {destination} Cuisine"
+            ]
+        },
+        'adventure': {
+            'paris': [
+                "Active Paris Arrival - Seine Kayaking & Bike Tour",
+                "Urban Adventure - Rock Climbing & Parkour",
+                "Paris by Foot - Marathon Walking Tour",
+                "Adventure Day Trip - Fontainebleau Rock Climbing", 
+                "Active Seine Experience - Rowing & Water Sports",
+                "High Adventure - Eiffel Tower Climbing Experience"
+            ],
+            'spain': [
+                "Adventure Spain Arrival - Pyrenees Hiking Preview",
+                "Camino de Santiago Walking Experience",
+                "Costa Brava Sea Kayaking & Cliff Climbing",
+                "Sierra Nevada Mountain Adventures", 
+                "Picos de Europa Rock Climbing & Canyoning",
+                "Active Barcelona - Beach Sports & Urban Cycling",
+                "Adventure Farewell - Spanish Peaks Final Challenge"
+            ],
+            'generic': [
+                f"Adventure Arrival - {destination} Outdoor Orientation",
+                f"Urban Adventures - City Exploration on Foot",
+                f"Active {destination} - Hiking & Outdoor Activities",
+                f"Water Adventures - River/Lake Activities", 
+                f"Extreme {destination} - Adventure Sports",
+                f"Mountain/Hill Adventures Near {destination}",
+                f"Active Farewell - Final Adventure Challenge"
+            ]
+        },
+        'luxury': {
+            'paris': [
+                "Luxury Paris Arrival - Private Château Welcome",
+                "VIP Louvre Experience - After Hours Private Tour",
+                "Exclusive Shopping - Personal Stylist on Champs-Élysées",
+                "Private Versailles - Royal Treatment with Guide",
+                "Michelin Star Restaurant Hopping Experience", 
+                "Luxury Seine Experience - Private Yacht Charter",
+                "Farewell Luxury - Private Opera Box & Champagne"
+            ],
+            'spain': [
+                "Luxury Spain Arrival - Private Ritz Madrid Experience",
+                "Exclusive Alhambra - Private After-Hours Palace Tour",
+                "VIP Shopping - Luxury Boutiques in Salamanca District",
+                "Private Prado Museum - Exclusive Art Collection Tour",
+                "Michelin Star Journey - DiverXO & Exclusive Dining",
+                "Luxury Andalusia - Private Helicopter to Seville", 
+                "Royal Farewell - Private Royal Palace & Luxury Send-off"
+            ],
+            'generic': [
+                f"Luxury {destination} Arrival - VIP Welcome Experience",
+                f"Exclusive {destination} - Private Tours & Experiences",
+                f"Luxury Shopping & Personal Services",
+                f"VIP Cultural Experiences - Behind the Scenes",
+                f"Fine Dining & Exclusive Restaurants",
+                f"Luxury Transportation & Scenic Routes", 
+                f"Farewell Luxury Experience - Premium Send-off"
+            ]
+        },
+        'photography': {
+            'paris': [
+                "Golden Hour Paris - Sunrise at Trocadéro & Eiffel Tower",
+                "Architectural Photography - Notre-Dame & Sainte-Chapelle",
+                "Street Photography Workshop - Montmartre Artists",
+                "Seine Reflections - River Photography at Blue Hour",
+                "Paris Rooftops - Aerial Photography Experience",
+                "Night Photography - Illuminated Paris Monuments"
+            ],
+            'spain': [
+                "Golden Hour Madrid - Royal Palace & Retiro Park Sunrise",
+                "Gaudí Architecture Photography - Sagrada Familia & Park Güell",
+                "Flamenco Street Photography - Seville & Granada Dancers",
+                "Alhambra Light & Shadow - Architectural Details Workshop",
+                "Spanish Landscapes - Andalusian Countryside & White Villages",
+                "Night Photography - Barcelona Gothic Quarter Illumination",
+                "Photography Portfolio Review - Spanish Light & Culture"
+            ],
+            'generic': [
+                f"Golden Hour {destination} - Best Sunrise Spots",
+                f"Architecture Photography - Historic Buildings",
+                f"Street Photography Workshop - Local Life Capture",
+                f"Scenic {destination} - Landscape Photography",
+                f"Portrait Photography - Local People & Culture",
+                f"Night Photography - {destination} After Dark",
+                f"Photography Portfolio Review & Best Shots"
+            ]
+        },
+        'budget': {
+            'paris': [
+                "Budget Paris Arrival - Free Walking Tour & Picnic",
+                "Free Museums Day - Permanent Collections",
+                "Budget Eats - Local Markets & Affordable Bistros",
+                "Free Parks & Gardens - Luxembourg & Tuileries",
+                "Budget Shopping - Flea Markets & Vintage Shops",
+                "Free Entertainment - Street Art & Performances"
+            ],
+            'spain': [
+                "Budget Madrid Arrival - Free Walking Tour & El Rastro Market",
+                "Free Museum Day - Prado & Reina Sofia Free Hours",
+                "Budget Tapas - Local Tabernas & Happy Hour Specials",
+                "Free Parks & Plazas - Retiro, Plaza Mayor & Street Performers",
+                "Budget Markets - El Rastro Flea Market & Local Bargains",
+                "Free Flamenco - Street Performances & Cultural Centers",
+                "Budget Farewell - Free Sunset Views & Public Celebrations"
+            ],
+            'generic': [
+                f"Budget {destination} Arrival - Free City Orientation",
+                f"Free Attractions & Museums in {destination}",
+                f"Budget Dining - Local Markets & Street Food",
+                f"Free Activities - Parks, Walks & Public Spaces",
+                f"Budget Shopping - Markets & Local Deals",
+                f"Free Entertainment & Local Events",
+                f"Budget Farewell - Free Activities & Memories"
+            ]
+        }
+    }
+    
+    # Get themes for the specific style and destination
+    style_themes = theme_templates.get(theme_focus, theme_templates['cultural'])
+    
+    # Try to find destination-specific themes with improved matching
+    for dest_key in style_themes:
+        if dest_key != 'generic':
+            if (dest_key in destination_lower or 
+                destination_lower in dest_key or
+                (dest_key == 'spain' and any(city in destination_lower for city in ['madrid', 'barcelona', 'seville', 'granada', 'valencia', 'bilbao'])) or
+                (destination_lower == 'spain' and dest_key in ['madrid', 'barcelona'])):
+                return style_themes[dest_key]
+    
+    # Fall back to generic themes for the style
+    return style_themes.get('generic', style_themes[list(style_themes.keys())[0]])
+
+def generate_progressive_daily_themes(destination, duration, user_interests, variation_style):
+    """Generate progressive themes that build on each other throughout the trip based on package variation style"""
+    
+    destination_lower = destination.lower()
+    
+    # Get style-specific theme templates
+    if variation_style == 'cultural-immersive':
+        theme_focus = 'cultural'
+    elif variation_style == 'culinary-focused':
+        theme_focus = 'culinary' 
+    elif variation_style == 'adventure-active':
+        theme_focus = 'adventure'
+    elif variation_style == 'luxury-premium':
+        theme_focus = 'luxury'
+    elif variation_style == 'photography-focused':
+        theme_focus = 'photography'
+    elif variation_style == 'budget-conscious':
+        theme_focus = 'budget'
+    else:
+        theme_focus = 'cultural'  # default
+    
+    # Debug logging
+    print(f"🎯 Generating themes for {destination} with style: {variation_style} -> {theme_focus}")
+    
+    # Check if destination has specific data
+    has_specific_data = any(place in destination.lower() for place in ['paris', 'tokyo', 'china', 'spain', 'madrid', 'barcelona'])
+    if not has_specific_data:
+        print(f"🌍 Using universal content generation for {destination}")
+    
+    # Base theme progression for different destinations
+    if any(place in destination_lower for place in ['paris', 'france']):
+        base_themes = [
+            "Arrival & Classic Paris Discovery - Eiffel Tower & Seine",
+            "Art & Culture Immersion - Louvre & Montmartre Walking", 
+            "Hidden Paris Exploration - Le Marais & Secret Courtyards",
+            "Culinary Adventure - Markets, Bistros & Wine Tasting",
+            "Royal Paris Experience - Versailles Day Trip",
+            "Modern Paris Innovation - La Défense & Contemporary Art",
+            "Romantic Farewell - Sunset Seine Cruise & Farewell Dinner"
+        ]
+    elif any(place in destination_lower for place in ['tokyo', 'japan']):
+        base_themes = [
+            "Tokyo Arrival & Shibuya Energy - Crossing & Modern Districts",
+            "Traditional Culture - Asakusa Temples & Imperial Palace",
+            "Culinary Journey - Tsukiji Market & Sushi Making Class",
+            "Pop Culture & Technology - Harajuku, Akihabara & Robot Shows",
+            "Nature & Serenity - Meiji Shrine & Traditional Gardens",
+            "Night Life & Entertainment - Shinjuku Golden Gai & Karaoke"
+        ]
+    elif any(place in destination_lower for place in ['china', 'beijing', 'shanghai']):
+        base_themes = [
+            "Imperial Beijing Discovery - Forbidden City & Tiananmen",
+            "Great Wall Adventure & Traditional Villages",
+            "Hutong Culture Deep Dive - Local Life & Tea Ceremony", 
+            "Culinary Exploration - Peking Duck & Street Food Tours",
+            "Art & Philosophy - Temple of Heaven & Calligraphy Workshop",
+            "Modern China Experience - 798 Art District & Tech Centers",
+            "Ancient Wisdom & Farewell - Summer Palace & Reflection"
+        ]
+    elif any(place in destination_lower for place in ['spain', 'madrid', 'barcelona', 'seville', 'granada']):
+        # Default Spain themes (will be overridden by style-specific themes)
+        base_themes = [
+            "Spanish Heritage Arrival - Royal Madrid & Plaza Mayor",
+            "Moorish Legacy Discovery - Alhambra & Islamic Architecture", 
+            "Spanish Art & Culture - Prado Museum & Picasso Trail",
+            "Culinary Spain Experience - Tapas, Paella & Regional Cuisine",
+            "Sacred Spain Journey - Cathedrals & Santiago Pilgrimage",
+            "Modern Spanish Innovation - Guggenheim Bilbao & Contemporary Art",
+            "Spanish Traditions Farewell - Flamenco & Cultural Celebration"
+        ]
+    else:
+        # Use style-specific theme generator
+        base_themes = generate_style_specific_themes(destination, theme_focus)
+        print(f"📋 Generated {len(base_themes)} themes for {destination} ({theme_focus}): {base_themes[:2]}...")
+    
+    # Ensure we have enough themes for the duration
+    # If duration is longer than available themes, cycle through themes
+    extended_themes = []
+    for i in range(duration):
+        theme_index = i % len(base_themes)
+        theme = base_themes[theme_index]
+        
+        # Add day number if cycling through themes
+        if i >= len(base_themes):
+            theme = f"Day {i+1}: {theme}"
+        
+        extended_themes.append(theme)
+    
+    # Customize themes based on user interests
+    customized_themes = []
+    for i, theme in enumerate(extended_themes):
+        if i < len(user_interests) and user_interests:
+            primary_interest = user_interests[i % len(user_interests)]
+            if 'culinary' in primary_interest:
+                theme = theme.replace('Cultural', 'Culinary').replace('Discovery', 'Food Discovery')
+            elif 'adventure' in primary_interest:
+                theme = theme.replace('Cultural', 'Active').replace('Discovery', 'Adventure')
+            elif 'photography' in primary_interest:
+                theme = theme.replace('Cultural', 'Photographic').replace('Discovery', 'Photo Safari')
+        
+        customized_themes.append(theme)
+    
+    return customized_themes
+
+def generate_hyper_personalized_day(day, total_duration, destination, destination_info, 
+                                   activities_from_db, theme, profile, user_prompt, used_activities):
+    """Generate hyper-personalized daily itinerary with specific timing and context"""
+    
+    # Filter activities by theme and user interests
+    relevant_activities = filter_activities_by_theme_and_interests(
+        activities_from_db, theme, profile, used_activities
+    )
+    
+    # Generate time-specific itinerary
+    morning_activity, afternoon_activity, evening_activity = select_optimal_activities_by_time(
+        relevant_activities, day, total_duration
+    )
+    
+    # Generate detailed meals based on location and user preferences
+    meals = generate_contextual_meals(destination, day, profile, morning_activity, afternoon_activity)
+    
+    # Calculate realistic transportation and timing
+    transportation = calculate_intelligent_transportation(
+        destination, morning_activity, afternoon_activity, evening_activity
+    )
+    
+    # Estimate realistic costs
+    estimated_cost = calculate_realistic_daily_cost(
+        destination, morning_activity, afternoon_activity, evening_activity, meals
+    )
+    
+    # Create comprehensive day plan
+    day_plan = {
+        'day': day,
+        'theme': theme,
+        'morning': generate_detailed_time_block(morning_activity, "9:00 AM - 12:00 PM"),
+        'afternoon': generate_detailed_time_block(afternoon_activity, "1:00 PM - 5:00 PM"), 
+        'evening': generate_detailed_time_block(evening_activity, "6:00 PM - 9:00 PM"),
+        'activities': [morning_activity, afternoon_activity, evening_activity],
+        'meals': meals,
+        'transportation': transportation,
+        'estimated_cost': estimated_cost,
+        'cultural_highlights': generate_cultural_insights(destination, theme, [morning_activity, afternoon_activity, evening_activity]),
+        'local_tips': generate_local_insider_tips(destination, day, theme),
+        'weather_considerations': f"Check local weather for optimal experience. Best backup indoor options available.",
+        'photography_opportunities': identify_photography_spots([morning_activity, afternoon_activity, evening_activity])
+    }
+    
+    return day_plan
+
+def filter_activities_by_theme_and_interests(activities, theme, profile, used_activities):
+    """Filter activities based on daily theme and user interests with proper variety"""
+    
+    theme_lower = theme.lower()
+    interests = profile.get('interests', [])
+    
+    relevant_activities = []
+    
+    for activity in activities:
+        # Skip already used activities to ensure variety
+        activity_name = activity.get('name', '')
+        if activity_name in used_activities:
+            continue
+        
+        activity_type = activity.get('type', '').lower()
+        activity_desc = activity.get('description', '').lower()
+        
+        relevance_score = 0
+        
+        # Theme matching with better scoring
+        if 'cultural' in theme_lower and any(keyword in activity_type for keyword in ['cultural', 'historical', 'art']):
+            relevance_score += 20
+        elif 'culinary' in theme_lower and 'culinary' in activity_type:
+            relevance_score += 20
+        elif 'adventure' in theme_lower and any(keyword in activity_type for keyword in ['adventure', 'nature', 'outdoor']):
+            relevance_score += 20
+        elif 'modern' in theme_lower and any(keyword in activity_type for keyword in ['modern', 'landmark', 'entertainment']):
+            relevance_score += 20
+        
+        # Interest matching
+        for interest in interests:
+            if interest.lower() in activity_desc or interest.lower() in activity_type:
+                relevance_score += 10
+        
+        # Add popularity bonus
+        popularity = activity.get('popularity_score', 70)
+        relevance_score += popularity * 0.1
+        
+        if relevance_score > 10:  # Minimum threshold
+            activity['relevance_score'] = relevance_score
+            relevant_activities.append(activity)
+    
+    # Sort by relevance and return diverse selection
+    relevant_activities.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+    return relevant_activities[:15]  # Top 15 most relevant
+
+def select_optimal_activities_by_time(activities, day, total_duration):
+    """Select optimal activities for morning, afternoon, and evening with proper variety"""
+    
+    morning_activities = []
+    afternoon_activities = []
+    evening_activities = []
+    
+    for activity in activities:
+        time_preference = activity.get('time_preference', '').lower()
+        activity_type = activity.get('type', '').lower()
+        
+        # Time-based classification using our new structure
+        if time_preference == 'morning' or any(keyword in activity_type for keyword in ['cultural', 'historical', 'temple']):
+            morning_activities.append(activity)
+        elif time_preference == 'evening' or any(keyword in activity_type for keyword in ['nightlife', 'entertainment', 'dinner']):
+            evening_activities.append(activity)
+        elif time_preference == 'full_day':
+            # Full day activities can be split or used for special days
+            if day % 3 == 0:  # Every third day use full day activity
+                morning_activities.append(activity)
+        else:
+            afternoon_activities.append(activity)
+    
+    # Select best activity for each time period ensuring variety
+    morning_activity = select_best_activity_for_period(morning_activities, "morning", day, total_duration)
+    afternoon_activity = select_best_activity_for_period(afternoon_activities, "afternoon", day, total_duration)
+    evening_activity = select_best_activity_for_period(evening_activities, "evening", day, total_duration)
+    
+    return morning_activity, afternoon_activity, evening_activity
+
+def select_best_activity_for_period(activities, period, day, total_duration):
+    """Select the best activity for a specific time period with intelligent ranking"""
+    
+    if not activities:
+        return generate_fallback_activity_for_period(period, day)
+    
+    # Prioritize activities based on day position in trip
+    if day == 1:  # First day - easier, orientation activities
+        preferred_types = ['cultural', 'historical', 'landmark', 'easy']
+    elif day == total_duration:  # Last day - memorable, farewell activities
+        preferred_types = ['shopping', 'memorable', 'scenic', 'reflection']
+    else:  # Middle days - diverse experiences
+        preferred_types = ['culinary', 'adventure', 'entertainment', 'unique']
+    
+    # Score activities based on period, day preferences, and variety
+    best_activity = None
+    best_score = 0
+    
+    for activity in activities:
+        activity_type = activity.get('type', '').lower()
+        base_score = activity.get('relevance_score', 0) + activity.get('popularity_score', 70)
+        
+        # Add preference bonuses
+        for pref_type in preferred_types:
+            if pref_type in activity_type:
+                base_score += 15
+        
+        # Period-specific bonuses
+        if period == 'morning' and any(keyword in activity_type for keyword in ['cultural', 'historical']):
+            base_score += 10
+        elif period == 'afternoon' and any(keyword in activity_type for keyword in ['scenic', 'landmark']):
+            base_score += 10
+        elif period == 'evening' and any(keyword in activity_type for keyword in ['entertainment', 'culinary']):
+            base_score += 10
+        
+        if base_score > best_score:
+            best_score = base_score
+            best_activity = activity
+    
+    return best_activity or activities[0]  # Return best or first available
+    
+    # Return highest scoring activity
+    best_activity = max(activities, key=lambda x: x.get('period_score', 0))
+    return best_activity
+
+def generate_fallback_activity_for_period(period, day):
+    """Generate diverse, destination-specific activities when database activities are not available"""
+    
+    # Diverse activity pools for each time period with day-specific variety
+    morning_activities = [
+        {'name': 'Historic District Walking Tour', 'type': 'Cultural/Historical', 'duration': '3 hours', 'description': 'Explore centuries-old architecture and learn local history from expert guide', 'best_time': 'Morning (9-12 PM)', 'price_range': '$35-50'},
+        {'name': 'Local Market & Food Discovery', 'type': 'Culinary/Cultural', 'duration': '2.5 hours', 'description': 'Visit authentic local markets and taste traditional breakfast specialties', 'best_time': 'Morning (9-11:30 AM)', 'price_range': '$40-60'},
+        {'name': 'Art Museum & Gallery Tour', 'type': 'Cultural/Art', 'duration': '3 hours', 'description': 'Discover local art collections and contemporary exhibitions with museum guide', 'best_time': 'Morning (9-12 PM)', 'price_range': '$25-45'},
+        {'name': 'Traditional Craft Workshop', 'type': 'Cultural/Interactive', 'duration': '2.5 hours', 'description': 'Learn traditional local crafts from master artisans in authentic workshop setting', 'best_time': 'Morning (9:30-12 PM)', 'price_range': '$55-75'},
+        {'name': 'Religious Sites & Spiritual Heritage', 'type': 'Cultural/Spiritual', 'duration': '3 hours', 'description': 'Visit sacred sites and learn about local spiritual traditions and architecture', 'best_time': 'Morning (9-12 PM)', 'price_range': '$30-50'},
+        {'name': 'Photography Walk with Local Guide', 'type': 'Photography/Cultural', 'duration': '3 hours', 'description': 'Capture authentic moments and hidden gems with professional local photographer', 'best_time': 'Morning (9-12 PM)', 'price_range': '$60-85'},
+        {'name': 'Traditional Architecture & Design Tour', 'type': 'Cultural/Educational', 'duration': '3 hours', 'description': 'Explore unique architectural styles and design principles with architecture expert', 'best_time': 'Morning (9-12 PM)', 'price_range': '$45-65'}
+    ]
+    
+    afternoon_activities = [
+        {'name': 'Scenic Viewpoint & Landscape Tour', 'type': 'Scenic/Nature', 'duration': '4 hours', 'description': 'Visit breathtaking viewpoints and natural landscapes with photo opportunities', 'best_time': 'Afternoon (1-5 PM)', 'price_range': '$50-70'},
+        {'name': 'Cooking Class with Local Family', 'type': 'Culinary/Cultural', 'duration': '4 hours', 'description': 'Learn authentic recipes and cooking techniques in traditional family kitchen', 'best_time': 'Afternoon (1-5 PM)', 'price_range': '$75-95'},
+        {'name': 'Cultural Performance & Arts Center', 'type': 'Cultural/Entertainment', 'duration': '3 hours', 'description': 'Experience traditional performances and visit local arts venues with artist meet & greet', 'best_time': 'Afternoon (2-5 PM)', 'price_range': '$45-65'},
+        {'name': 'Local Transportation Adventure', 'type': 'Adventure/Cultural', 'duration': '4 hours', 'description': 'Explore the city using traditional transport methods with cultural commentary', 'best_time': 'Afternoon (1-5 PM)', 'price_range': '$35-55'},
+        {'name': 'Artisan Workshop & Shopping Quarter', 'type': 'Cultural/Shopping', 'duration': '3.5 hours', 'description': 'Visit local artisan workshops and explore authentic shopping districts', 'best_time': 'Afternoon (1:30-5 PM)', 'price_range': '$40-60'},
+        {'name': 'Nature & Garden Experience', 'type': 'Nature/Relaxation', 'duration': '3 hours', 'description': 'Explore beautiful gardens and natural spaces with horticultural insights', 'best_time': 'Afternoon (2-5 PM)', 'price_range': '$25-45'},
+        {'name': 'Cultural Museum & Interactive Exhibits', 'type': 'Cultural/Educational', 'duration': '3 hours', 'description': 'Deep dive into local culture through interactive museum experiences and demonstrations', 'best_time': 'Afternoon (1-4 PM)', 'price_range': '$35-55'}
+    ]
+    
+    evening_activities = [
+        {'name': 'Traditional Music & Dance Performance', 'type': 'Entertainment/Cultural', 'duration': '3 hours', 'description': 'Authentic cultural show featuring traditional music, dance, and storytelling', 'best_time': 'Evening (6-9 PM)', 'price_range': '$55-80'},
+        {'name': 'Rooftop Dining with City Views', 'type': 'Culinary/Scenic', 'duration': '2.5 hours', 'description': 'Elegant dinner with panoramic views and signature local cuisine', 'best_time': 'Evening (6:30-9 PM)', 'price_range': '$80-120'},
+        {'name': 'Night Market & Street Food Tour', 'type': 'Culinary/Cultural', 'duration': '3 hours', 'description': 'Explore vibrant night markets and sample authentic street food specialties', 'best_time': 'Evening (6-9 PM)', 'price_range': '$45-65'},
+        {'name': 'Cultural Quarter Evening Stroll', 'type': 'Cultural/Relaxed', 'duration': '2.5 hours', 'description': 'Leisurely walk through illuminated cultural districts with local storytelling', 'best_time': 'Evening (6:30-9 PM)', 'price_range': '$30-50'},
+        {'name': 'Local Pub & Social Experience', 'type': 'Social/Cultural', 'duration': '3 hours', 'description': 'Experience local social culture in traditional establishments with live music', 'best_time': 'Evening (7-10 PM)', 'price_range': '$40-70'},
+        {'name': 'Sunset Photography & Reflection', 'type': 'Photography/Scenic', 'duration': '2 hours', 'description': 'Capture golden hour moments at scenic locations with photography guidance', 'best_time': 'Evening (6-8 PM)', 'price_range': '$35-55'},
+        {'name': 'Traditional Tea House & Cultural Conversation', 'type': 'Cultural/Social', 'duration': '2.5 hours', 'description': 'Intimate cultural exchange in traditional setting with local cultural enthusiasts', 'best_time': 'Evening (6:30-9 PM)', 'price_range': '$25-45'}
+    ]
+    
+    # Select activity based on period and day to ensure variety
+    if period == 'morning':
+        activity_index = (day - 1) % len(morning_activities)
+        return morning_activities[activity_index]
+    elif period == 'afternoon':
+        activity_index = (day - 1) % len(afternoon_activities)
+        return afternoon_activities[activity_index]
+    elif period == 'evening':
+        activity_index = (day - 1) % len(evening_activities)
+        return evening_activities[activity_index]
+    else:
+        # Default to afternoon if period not recognized
+        return afternoon_activities[0]
+
+def generate_detailed_time_block(activity, time_slot):
+    """Generate detailed description for a time block"""
+    
+    activity_name = activity.get('name', 'Local Experience')
+    activity_desc = activity.get('description', 'Authentic local experience')
+    duration = activity.get('duration', '2-3 hours')
+    
+    return f"{time_slot}: {activity_name} ({duration}) - {activity_desc}"
+
+def generate_contextual_meals(destination, day, profile, morning_activity, afternoon_activity):
+    """Generate diverse, contextual meal recommendations based on activities and location with day-specific variety"""
+    
+    dietary_restrictions = profile.get('dietary_restrictions', [])
+    destination_lower = destination.lower()
+    
+    # Create diverse meal options based on destination and day
+    if 'paris' in destination_lower or 'france' in destination_lower:
+        meal_options = [
+            {
+                'breakfast': 'Classic French café - buttery croissants, espresso, fresh orange juice',
+                'lunch': 'Bistro lunch - French onion soup and quiche Lorraine with local wine',
+                'dinner': 'Traditional brasserie - coq au vin with burgundy wine and crème brûlée'
+            },
+            {
+                'breakfast': 'Artisan bakery - pain au chocolat, café au lait, seasonal fruit tart',
+                'lunch': 'Crêperie experience - savory galettes and sweet crêpes with cider',
+                'dinner': 'Fine dining - duck confit with wine pairing and cheese course'
+            },
+            {
+                'breakfast': 'Local patisserie - fresh brioche, hot chocolate, French pastries',
+                'lunch': 'Market café - croque monsieur, French salad, local Bordeaux',
+                'dinner': 'Seine-side restaurant - bouillabaisse and champagne with river views'
+            },
+            {
+                'breakfast': 'Neighborhood boulangerie - warm baguette, jam, café noisette',
+                'lunch': 'Wine bar lunch - charcuterie board and regional wines',
+                'dinner': 'Michelin experience - tasting menu with sommelier wine selection'
+            }
+        ]
+    elif 'tokyo' in destination_lower or 'japan' in destination_lower:
+        meal_options = [
+            {
+                'breakfast': 'Traditional ryokan breakfast - miso soup, grilled fish, rice, pickled vegetables',
+                'lunch': 'Authentic ramen shop - tonkotsu ramen with gyoza dumplings',
+                'dinner': 'Sushi omakase - chef\'s selection at traditional sushi counter'
+            },
+            {
+                'breakfast': 'Modern Japanese café - green tea, tamagoyaki, rice bowl',
+                'lunch': 'Tempura restaurant - fresh seasonal tempura with dipping sauces',
+                'dinner': 'Kaiseki dinner - multi-course traditional meal with sake pairing'
+            },
+            {
+                'breakfast': 'Local breakfast set - Japanese curry, miso soup, salad',
+                'lunch': 'Soba noodle house - handmade buckwheat noodles in hot broth',
+                'dinner': 'Izakaya experience - small plates and drinks with locals'
+            },
+            {
+                'breakfast': 'Convenience store gems - onigiri, iced coffee, seasonal snacks',
+                'lunch': 'Yakiniku BBQ - grilled meats and vegetables with beer',
+                'dinner': 'Traditional hot pot - shabu-shabu with premium wagyu beef'
+            }
+        ]
+    elif 'spain' in destination_lower or 'madrid' in destination_lower or 'barcelona' in destination_lower:
+        meal_options = [
+            {
+                'breakfast': 'Traditional Spanish café - churros con chocolate, cortado coffee',
+                'lunch': 'Tapas bar hopping - jamón ibérico, tortilla española, local wines',
+                'dinner': 'Paella restaurant - authentic seafood paella with Rioja wine'
+            },
+            {
+                'breakfast': 'Local bakery - tostada con tomate, café con leche, fresh fruit',
+                'lunch': 'Mercado gastronómico - variety of Spanish specialties and beer',
+                'dinner': 'Traditional taberna - cocido madrileño with Spanish wines'
+            },
+            {
+                'breakfast': 'Pastelería - ensaimada pastry, zumo de naranja, Spanish tortilla',
+                'lunch': 'Marisquería - fresh seafood and albariño wine by the coast',
+                'dinner': 'Flamenco dinner show - Andalusian cuisine with live performance'
+            },
+            {
+                'breakfast': 'Churrería - hot churros, thick hot chocolate, café solo',
+                'lunch': 'Pintxos bar - Basque small plates with txakoli wine',
+                'dinner': 'Asador - grilled meats and vegetables with Tempranillo wine'
+            }
+        ]
+    else:
+        # Generic but varied options for other destinations
+        meal_options = [
+            {
+                'breakfast': f'Local {destination} café - traditional breakfast specialties and coffee',
+                'lunch': f'Authentic {destination} restaurant - regional lunch dishes with local drinks',
+                'dinner': f'Traditional {destination} dining - signature evening meal with cultural atmosphere'
+            },
+            {
+                'breakfast': f'Market breakfast - fresh {destination} pastries and local coffee',
+                'lunch': f'Street food experience - {destination} local favorites and snacks',
+                'dinner': f'Fine dining {destination} cuisine - chef\'s specialties with wine pairing'
+            },
+            {
+                'breakfast': f'Neighborhood bakery - artisan {destination} breads and hot beverages',
+                'lunch': f'Family restaurant - home-style {destination} cooking',
+                'dinner': f'Cultural dining experience - {destination} feast with live entertainment'
+            }
+        ]
+    
+    # Select meals based on day to ensure variety
+    day_index = (day - 1) % len(meal_options)
+    meals = meal_options[day_index]
+    
+    # Contextual meal planning based on activities
+    morning_loc = extract_location_from_activity(morning_activity)
+    afternoon_loc = extract_location_from_activity(afternoon_activity)
+    
+    if morning_loc and 'museum' in morning_loc.lower():
+        meals['breakfast'] = f"Museum café breakfast near {morning_loc} - light continental options"
+    
+    if afternoon_loc and 'market' in afternoon_loc.lower():
+        meals['lunch'] = f"Market fresh lunch at {afternoon_loc} - local specialties and artisan foods"
+    
+    # Adjust for dietary restrictions
+    if 'vegetarian' in dietary_restrictions:
+        for meal_type in meals:
+            meals[meal_type] += ' (vegetarian options available)'
+    
+    if 'vegan' in dietary_restrictions:
+        for meal_type in meals:
+            meals[meal_type] += ' (vegan options confirmed)'
+    
+    return meals
+
+def extract_location_from_activity(activity):
+    """Extract location information from activity"""
+    
+    activity_name = activity.get('name', '')
+    activity_desc = activity.get('description', '')
+    
+    # Simple location extraction
+    location_indicators = ['in ', 'at ', 'near ', 'around ']
+    for text in [activity_name, activity_desc]:
+        for indicator in location_indicators:
+            if indicator in text.lower():
+                parts = text.lower().split(indicator, 1)
+                if len(parts) > 1:
+                    location = parts[1].split()[0].title()
+                    return location
+    
+    return None
+
+def calculate_intelligent_transportation(destination, morning_activity, afternoon_activity, evening_activity):
+    """Calculate realistic transportation between activities"""
+    
+    destination_lower = destination.lower()
+    
+    # Destination-specific transportation
+    if 'paris' in destination_lower:
+        return "Metro + walking (efficient Paris public transport system)"
+    elif 'tokyo' in destination_lower:
+        return "JR trains + subway + walking (Japan Rail Pass recommended)"
+    elif 'china' in destination_lower:
+        return "Metro + taxi + walking (affordable and efficient urban transport)"
+    else:
+        return "Local transport + walking + occasional taxi (cost-effective combination)"
+
+def calculate_realistic_daily_cost(destination, morning_activity, afternoon_activity, evening_activity, meals):
+    """Calculate realistic daily cost based on activities and meals"""
+    
+    # Extract price ranges from activities
+    total_cost = 0
+    
+    for activity in [morning_activity, afternoon_activity, evening_activity]:
+        price_range = activity.get('price_range', '$50')
+        # Extract numeric value from price range
+        import re
+        numbers = re.findall(r'\d+', price_range)
+        if numbers:
+            # Take average of range or single number
+            if len(numbers) >= 2:
+                avg_price = (int(numbers[0]) + int(numbers[1])) / 2
+            else:
+                avg_price = int(numbers[0])
+            total_cost += avg_price
+    
+    # Add estimated meal costs
+    destination_lower = destination.lower()
+    if 'paris' in destination_lower or 'france' in destination_lower:
+        total_cost += 80  # EUR equivalent for French meals
+    elif 'tokyo' in destination_lower or 'japan' in destination_lower:
+        total_cost += 90  # USD equivalent for Japanese meals
+    elif 'china' in destination_lower:
+        total_cost += 45  # USD for Chinese meals
+    else:
+        total_cost += 60  # General meal estimate
+    
+    # Add transportation
+    total_cost += 25
+    
+    return int(total_cost)
+
+def generate_cultural_insights(destination, theme, activities):
+    """Generate cultural insights based on destination and activities"""
+    
+    destination_lower = destination.lower()
+    theme_lower = theme.lower()
+    
+    if 'paris' in destination_lower:
+        if 'cultural' in theme_lower:
+            return "French cultural etiquette: greeting with 'Bonjour', dining leisurely, appreciating art and conversation"
+        elif 'culinary' in theme_lower:
+            return "French dining culture: bread etiquette, wine appreciation, course progression, café culture importance"
+    elif 'tokyo' in destination_lower:
+        return "Japanese cultural practices: bowing respect, silence on trains, shoe removal customs, gift-giving etiquette"
+    elif 'china' in destination_lower:
+        return "Chinese cultural values: family respect, tea ceremony significance, red color importance, harmony principles"
+    
+    return f"Local {destination} cultural practices and customs to enhance your authentic experience"
+
+def generate_local_insider_tips(destination, day, theme):
+    """Generate local insider tips for each day"""
+    
+    tips = [
+        f"Day {day} tip: Download offline maps and translate apps for easier navigation",
+        "Local insight: Ask locals for hidden gem recommendations",
+        "Cultural tip: Observe local customs and dress codes at religious sites",
+        "Budget tip: Look for lunch specials and happy hour deals",
+        "Photography tip: Golden hour is 1 hour before sunset for best lighting"
+    ]
+    
+    return tips[day % len(tips)]
+
+def identify_photography_spots(activities):
+    """Identify best photography opportunities from activities"""
+    
+    photo_spots = []
+    for activity in activities:
+        activity_name = activity.get('name', '')
+        activity_type = activity.get('type', '')
+        
+        if any(word in activity_type.lower() for word in ['sightseeing', 'scenic', 'view', 'landmark']):
+            photo_spots.append(f"📸 {activity_name} - Excellent photo opportunities")
+    
+    if not photo_spots:
+        photo_spots = ["📸 Candid street photography throughout the day", "📸 Local architecture and daily life scenes"]
+    
+    return photo_spots
+
+def generate_china_specific_day(day, total_duration, destination_info, profile, user_prompt):
+    """Generate China-specific daily activities"""
+    
+    china_days = {
+        1: {
+            'theme': 'Beijing Arrival & Imperial Heritage Discovery',
+            'morning': 'Arrive in Beijing, check into traditional courtyard hotel, orientation walk through nearby hutongs',
+            'afternoon': 'Forbidden City comprehensive tour with expert guide, explore imperial palace complex and ancient Chinese architecture',
+            'evening': 'Welcome dinner featuring authentic Peking duck at Quanjude Restaurant, evening stroll around Tiananmen Square',
+            'meals': {
+                'breakfast': 'Hotel continental breakfast',
+                'lunch': 'Traditional Beijing noodles in Forbidden City area',
+                'dinner': 'Peking duck banquet at historic Quanjude Restaurant'
+            },
+            'transportation': 'Airport Express + Beijing Metro + walking',
+            'estimated_cost': 180,
+            'cultural_highlights': 'Imperial Chinese history, traditional architecture, authentic Beijing cuisine'
+        },
+        2: {
+            'theme': 'Great Wall Adventure & Rural Village Life',
+            'morning': 'Early departure to Mutianyu section of Great Wall, cable car ascent, hiking along ancient fortifications',
+            'afternoon': 'Great Wall photography session, visit to nearby traditional village, interaction with local families',
+            'evening': 'Return to Beijing, traditional hotpot dinner, evening Chinese tea ceremony experience',
+            'meals': {
+                'breakfast': 'Traditional Chinese breakfast - congee, steamed buns, pickled vegetables',
+                'lunch': 'Picnic lunch with Great Wall mountain views',
+                'dinner': 'Sichuan hotpot experience with local ingredients'
+            },
+            'transportation': 'Private tour bus + cable car + walking',
+            'estimated_cost': 220,
+            'cultural_highlights': 'Great Wall history, rural Chinese life, traditional tea culture'
+        },
+        3: {
+            'theme': 'Hutong Culture & Culinary Arts Mastery',
+            'morning': 'Rickshaw tour through historic hutongs, visit traditional courtyard homes, meet local artisans',
+            'afternoon': 'Hands-on Chinese cooking class - learn to make dumplings, noodles, and traditional sauces',
+            'evening': 'Beijing opera performance, night market exploration at Wangfujing Street',
+            'meals': {
+                'breakfast': 'Local street breakfast - jianbing (Chinese crepe) and soy milk',
+                'lunch': 'Self-prepared dishes from cooking class',
+                'dinner': 'Night market food adventure - scorpions, lamb skewers, traditional snacks'
+            },
+            'transportation': 'Rickshaw + walking + Metro',
+            'estimated_cost': 160,
+            'cultural_highlights': 'Traditional Beijing lifestyle, Chinese culinary arts, classical opera'
+        },
+        4: {
+            'theme': 'Temple Spirituality & Traditional Medicine',
+            'morning': 'Temple of Heaven peaceful morning meditation and Tai Chi with locals',
+            'afternoon': 'Traditional Chinese Medicine consultation, herbal tea session, acupuncture experience',
+            'evening': 'Summer Palace sunset boat ride, imperial garden exploration',
+            'meals': {
+                'breakfast': 'Healthy Chinese porridge with medicinal herbs',
+                'lunch': 'Vegetarian Buddhist temple cuisine',
+                'dinner': 'Imperial cuisine dinner at Summer Palace restaurant'
+            },
+            'transportation': 'Metro + walking + boat',
+            'estimated_cost': 140,
+            'cultural_highlights': 'Chinese wellness practices, traditional medicine, imperial gardens'
+        },
+        5: {
+            'theme': 'Shanghai Modern Metropolis Journey',
+            'morning': 'High-speed train to Shanghai, check into French Concession boutique hotel',
+            'afternoon': 'Shanghai French Concession walking tour, art galleries, and colonial architecture',
+            'evening': 'The Bund evening skyline photography, luxury Huangpu River cruise',
+            'meals': {
+                'breakfast': 'Beijing hotel departure breakfast',
+                'lunch': 'Shanghai soup dumplings at original Ding Tai Fung',
+                'dinner': 'Fine dining with Shanghai skyline views'
+            },
+            'transportation': 'High-speed rail + Shanghai Metro + river cruise',
+            'estimated_cost': 200,
+            'cultural_highlights': 'Modern China development, colonial history, urban sophistication'
+        }
+    }
+    
+    # Continue pattern for more days
+    if day <= len(china_days):
+        return china_days[day]
+    else:
+        # Generate additional days following the pattern
+        additional_days = {
+            6: {
+                'theme': 'Yu Garden & Traditional Arts Workshop',
+                'morning': 'Yu Garden traditional Chinese garden exploration, tea house experience',
+                'afternoon': 'Chinese silk painting workshop, traditional craft learning',
+                'evening': 'Nanjing Road shopping street, modern Shanghai entertainment',
+                'meals': {
+                    'breakfast': 'Traditional Shanghai breakfast - xiaolongbao and soy milk',
+                    'lunch': 'Garden restaurant with traditional atmosphere',
+                    'dinner': 'Modern Chinese fusion cuisine'
+                },
+                'transportation': 'Metro + walking + taxi',
+                'estimated_cost': 150,
+                'cultural_highlights': 'Traditional gardens, Chinese arts, modern shopping culture'
+            },
+            7: {
+                'theme': 'Departure & Cultural Reflection',
+                'morning': 'Final shopping at Silk Street Market, souvenir hunting',
+                'afternoon': 'Airport departure, cultural reflection session',
+                'evening': 'Flight departure',
+                'meals': {
+                    'breakfast': 'Hotel farewell breakfast',
+                    'lunch': 'Airport traditional Chinese meal',
+                    'dinner': 'In-flight meal'
+                },
+                'transportation': 'Metro + Airport Express',
+                'estimated_cost': 100,
+                'cultural_highlights': 'Cultural souvenirs, final China impressions'
+            }
+        }
+        return additional_days.get(day, china_days[3])  # Return day 3 as template for longer trips
+
+def generate_paris_specific_day(day, total_duration, destination_info, profile, user_prompt):
+    """Generate Paris-specific daily activities"""
+    
+    paris_days = {
+        1: {
+            'theme': 'Arrival & Latin Quarter Walking Discovery',
+            'morning': 'Arrive in Paris, check into boutique hotel, café culture introduction',
+            'afternoon': 'Latin Quarter walking tour, Sorbonne University, bookshop browsing',
+            'evening': 'Seine riverbank evening stroll, traditional bistro dinner',
+            'meals': {
+                'breakfast': 'Hotel continental breakfast',
+                'lunch': 'Café lunch with wine in Latin Quarter',
+                'dinner': 'Classic French bistro - L\'Ami Jean'
+            },
+            'transportation': 'RER train + Metro + walking',
+            'estimated_cost': 160,
+            'cultural_highlights': 'Parisian café culture, Latin Quarter history, French dining'
+        }
+    }
+    
+    return paris_days.get(day, paris_days[1])
+
+def generate_tokyo_specific_day(day, total_duration, destination_info, profile, user_prompt):
+    """Generate Tokyo-specific daily activities"""
+    
+    tokyo_days = {
+        1: {
+            'theme': 'Tokyo Arrival & Shibuya Modern Energy',
+            'morning': 'Arrive in Tokyo, check into modern hotel, neighborhood orientation',
+            'afternoon': 'Shibuya Crossing experience, modern Tokyo exploration',
+            'evening': 'Traditional izakaya dinner, neon-lit district discovery',
+            'meals': {
+                'breakfast': 'Hotel Japanese breakfast',
+                'lunch': 'Conveyor belt sushi experience',
+                'dinner': 'Traditional izakaya with sake'
+            },
+            'transportation': 'Airport Express + JR trains + walking',
+            'estimated_cost': 180,
+            'cultural_highlights': 'Modern Tokyo energy, traditional dining, urban culture'
+        }
+    }
+    
+    return tokyo_days.get(day, tokyo_days[1])
+
+def generate_generic_destination_day(day, total_duration, destination, destination_info, profile, user_prompt):
+    """Generate generic destination day plan"""
+    
+    return {
+        'theme': f'{destination} Discovery Day {day}',
+        'morning': f'Morning exploration of {destination} cultural sites',
+        'afternoon': f'Afternoon {destination} local experiences and activities',
+        'evening': f'Evening {destination} dining and entertainment',
+        'meals': {
+            'breakfast': f'Local {destination} breakfast',
+            'lunch': f'Traditional {destination} lunch',
+            'dinner': f'Authentic {destination} dinner'
+        },
+        'transportation': 'Local transportation + walking',
+        'estimated_cost': 120,
+        'cultural_highlights': f'{destination} culture, local experiences, traditional cuisine'
+    }
+
+def calculate_destination_specific_pricing(destination, duration, travelers, budget_level, package_style):
+    """Calculate accurate pricing based on destination and components"""
+    
+    destination_info = get_destination_intelligence(destination)
+    base_daily_rate = destination_info['budget_ranges'][budget_level]
+    
+    # Pricing structure
+    flights = 600 * travelers if budget_level == 'budget' else 900 * travelers if budget_level == 'moderate' else 2500 * travelers
+    hotels = base_daily_rate * duration
+    restaurants = (base_daily_rate * 0.4) * duration
+    activities = (base_daily_rate * 0.6) * duration
+    
+    base_cost = flights + hotels + restaurants + activities
+    taxes = base_cost * 0.08
+    service_fee = base_cost * 0.05
+    
+    total_cost = base_cost + taxes + service_fee
+    
+    return {
+        'flights': flights,
+        'hotels': hotels,
+        'restaurants': restaurants,
+        'activities': activities,
+        'base_cost': base_cost,
+        'taxes': taxes,
+        'service_fee': service_fee,
+        'total_cost': total_cost,
+        'cost_per_person': total_cost / travelers,
+        'daily_average': total_cost / duration
+    }
+
+def generate_flight_options(destination, duration, travelers, budget):
+    """Generate flight recommendations"""
+    base_prices = {
+        'Budget ($500-1000)': {'economy': 450, 'premium': 650},
+        'Moderate ($1000-2500)': {'economy': 750, 'premium': 1200},
+        'Luxury ($2500+)': {'business': 2200, 'first': 4500}
+    }
+    
+    prices = base_prices.get(budget, base_prices['Moderate ($1000-2500)'])
+    
+    flights = []
+    for class_type, price in prices.items():
+        flights.append({
+            'airline': 'Emirates' if 'Dubai' in destination else 'Air France' if 'Paris' in destination else 'Turkish Airlines',
+            'class': class_type.title(),
+            'price_per_person': price,
+            'total_price': price * travelers,
+            'duration': '8h 30m',
+            'stops': 1 if price < 1000 else 0,
+            'departure': '10:30 AM',
+            'arrival': '6:45 PM'
+        })
+    
+    return flights
+
+def generate_hotel_recommendations(destination, duration, travelers, budget, style):
+    """Generate personalized hotel recommendations"""
+    hotels_db = {
+        'Paris, France': [
+            {'name': 'Hotel des Grands Boulevards', 'type': 'Boutique', 'rating': 4.6, 'price': 280, 'style': 'cultural'},
+            {'name': 'Le Bristol Paris', 'type': 'Luxury', 'rating': 4.9, 'price': 850, 'style': 'luxury'},
+            {'name': 'Hotel Malte Opera', 'type': 'Business', 'rating': 4.3, 'price': 180, 'style': 'budget'}
+        ],
+        'Dubai, UAE': [
+            {'name': 'Al Seef Heritage Hotel', 'type': 'Heritage', 'rating': 4.7, 'price': 320, 'style': 'cultural'},
+            {'name': 'Burj Al Arab', 'type': 'Luxury', 'rating': 4.9, 'price': 1200, 'style': 'luxury'},
+            {'name': 'Rove Downtown', 'type': 'Modern', 'rating': 4.4, 'price': 150, 'style': 'budget'}
+        ]
+    }
+    
+    city_hotels = hotels_db.get(destination, hotels_db['Paris, France'])
+    
+    # Filter based on budget and style
+    recommended = []
+    for hotel in city_hotels:
+        if (budget == 'Luxury ($2500+)' and hotel['style'] == 'luxury') or \
+           (budget == 'Moderate ($1000-2500)' and hotel['style'] in ['cultural', 'business']) or \
+           (budget == 'Budget ($500-1000)' and hotel['style'] == 'budget'):
+            
+            recommended.append({
+                **hotel,
+                'total_price': hotel['price'] * duration,
+                'amenities': ['Wi-Fi', 'Concierge', 'Restaurant', 'Spa'] if hotel['style'] == 'luxury' else ['Wi-Fi', 'Restaurant'],
+                'location_score': 9.2,
+                'why_recommended': f"Perfect for {style['focus']} with excellent access to cultural sites"
+            })
+    
+    return recommended[:2]  # Return top 2 recommendations
+
+def generate_restaurant_recommendations(destination, profile, style):
+    """Generate personalized restaurant recommendations"""
+    restaurants_db = {
+        'Paris, France': [
+            {'name': 'L\'Ami Jean', 'cuisine': 'Traditional French', 'rating': 4.8, 'price_range': '$$$', 'specialty': 'Bistro cuisine'},
+            {'name': 'Le Comptoir du Relais', 'cuisine': 'French Bistro', 'rating': 4.6, 'price_range': '$$', 'specialty': 'Classic dishes'},
+            {'name': 'Breizh Café', 'cuisine': 'Modern Breton', 'rating': 4.7, 'price_range': '$$', 'specialty': 'Creative crêpes'},
+            {'name': 'Gentle Gourmet', 'cuisine': 'Vegetarian', 'rating': 4.5, 'price_range': '$$', 'specialty': 'Plant-based French'}
+        ],
+        'Dubai, UAE': [
+            {'name': 'Al Hadheerah', 'cuisine': 'Emirati', 'rating': 4.8, 'price_range': '$$$', 'specialty': 'Traditional Emirati'},
+            {'name': 'Pierchic', 'cuisine': 'Seafood', 'rating': 4.9, 'price_range': '$$$$', 'specialty': 'Fine dining seafood'},
+            {'name': 'Seva Table', 'cuisine': 'Vegetarian', 'rating': 4.6, 'price_range': '$$', 'specialty': 'Modern vegetarian'},
+            {'name': 'Arabian Tea House', 'cuisine': 'Middle Eastern', 'rating': 4.4, 'price_range': '$', 'specialty': 'Authentic atmosphere'}
+        ]
+    }
+    
+    city_restaurants = restaurants_db.get(destination, restaurants_db['Paris, France'])
+    
+    # Filter based on dietary restrictions and preferences
+    recommended = []
+    dietary_restrictions = profile.get('dietary_restrictions', [])
+    
+    for restaurant in city_restaurants:
+        include = True
+        if 'vegetarian' in dietary_restrictions and restaurant['cuisine'] not in ['Vegetarian', 'Modern vegetarian']:
+            if 'vegetarian' not in restaurant['specialty'].lower():
+                include = False
+        
+        if include:
+            recommended.append({
+                **restaurant,
+                'why_recommended': f"Matches your {profile.get('travel_style')} style and dietary preferences",
+                'reservation_time': '7:30 PM',
+                'booking_notes': 'Advance reservation recommended'
+            })
+    
+    return recommended[:4]  # Return top 4 recommendations
+
+def generate_personalized_activities(destination, profile, style):
+    """Generate activities based on user profile and interests"""
+    activities_db = {
+        'Paris, France': {
+            'cultural experiences': [
+                {'name': 'Louvre Museum Private Tour', 'duration': '3 hours', 'price': 85, 'type': 'Cultural'},
+                {'name': 'Montmartre Art Walking Tour', 'duration': '2.5 hours', 'price': 45, 'type': 'Art & Culture'},
+                {'name': 'Musée d\'Orsay Guided Visit', 'duration': '2 hours', 'price': 35, 'type': 'Art'}
+            ],
+            'local cuisine': [
+                {'name': 'Food Market Tour & Cooking Class', 'duration': '4 hours', 'price': 120, 'type': 'Culinary'},
+                {'name': 'Wine & Cheese Tasting', 'duration': '2 hours', 'price': 65, 'type': 'Culinary'},
+                {'name': 'Pastry Making Workshop', 'duration': '3 hours', 'price': 95, 'type': 'Culinary'}
+            ],
+            'photography': [
+                {'name': 'Paris Photography Tour', 'duration': '3 hours', 'price': 75, 'type': 'Photography'},
+                {'name': 'Golden Hour Seine Walk', 'duration': '2 hours', 'price': 40, 'type': 'Photography'}
+            ]
+        },
+        'Dubai, UAE': {
+            'cultural experiences': [
+                {'name': 'Dubai Museum & Al Fahidi Tour', 'duration': '3 hours', 'price': 60, 'type': 'Cultural'},
+                {'name': 'Traditional Souk Experience', 'duration': '2 hours', 'price': 35, 'type': 'Cultural'},
+                {'name': 'Heritage Village Visit', 'duration': '2.5 hours', 'price': 45, 'type': 'Cultural'}
+            ],
+            'local cuisine': [
+                {'name': 'Emirati Cooking Experience', 'duration': '4 hours', 'price': 110, 'type': 'Culinary'},
+                {'name': 'Street Food Tour', 'duration': '3 hours', 'price': 80, 'type': 'Culinary'},
+                {'name': 'Arabic Coffee & Dates Tasting', 'duration': '1 hour', 'price': 25, 'type': 'Culinary'}
+            ]
+        }
+    }
+    
+    city_activities = activities_db.get(destination, activities_db['Paris, France'])
+    user_interests = profile.get('interests', ['cultural experiences'])
+    
+    recommended_activities = []
+    for interest in user_interests:
+        if interest in city_activities:
+            for activity in city_activities[interest]:
+                recommended_activities.append({
+                    **activity,
+                    'match_reason': f"Matches your interest in {interest}",
+                    'difficulty': 'Easy',
+                    'group_size': 'Small group (8-12 people)'
+                })
+    
+    return recommended_activities[:6]  # Return top 6 activities
+
+def generate_local_experiences(destination, profile):
+    """Generate unique local experiences based on profile"""
+    experiences_db = {
+        'Paris, France': [
+            {'name': 'Artist Studio Visit in Belleville', 'type': 'Unique Local', 'price': 50, 'duration': '2 hours'},
+            {'name': 'Vintage Shopping in Le Marais', 'type': 'Shopping', 'price': 30, 'duration': '3 hours'},
+            {'name': 'Seine Sunset Picnic', 'type': 'Romantic', 'price': 40, 'duration': '2 hours'},
+            {'name': 'Local Pharmacy & Perfume Discovery', 'type': 'Local Secrets', 'price': 25, 'duration': '1.5 hours'}
+        ],
+        'Dubai, UAE': [
+            {'name': 'Falconry Experience', 'type': 'Traditional', 'price': 80, 'duration': '2 hours'},
+            {'name': 'Desert Astronomy Night', 'type': 'Nature', 'price': 95, 'duration': '4 hours'},
+            {'name': 'Traditional Dhow Building Workshop', 'type': 'Craft', 'price': 70, 'duration': '3 hours'},
+            {'name': 'Camel Farm Visit', 'type': 'Cultural', 'price': 55, 'duration': '2.5 hours'}
+        ]
+    }
+    
+    city_experiences = experiences_db.get(destination, experiences_db['Paris, France'])
+    travel_style = profile.get('travel_style', 'cultural explorer')
+    
+    # Filter experiences based on travel style
+    filtered_experiences = []
+    for exp in city_experiences:
+        if travel_style == 'cultural explorer' and exp['type'] in ['Unique Local', 'Traditional', 'Cultural']:
+            filtered_experiences.append(exp)
+        elif travel_style == 'luxury traveler' and exp['price'] > 60:
+            filtered_experiences.append(exp)
+        elif travel_style == 'adventure seeker' and exp['type'] in ['Nature', 'Traditional']:
+            filtered_experiences.append(exp)
+        else:
+            filtered_experiences.append(exp)
+    
+    return filtered_experiences[:3]  # Return top 3 local experiences
+
+def calculate_comprehensive_pricing(duration, travelers, budget, style):
+    """Calculate detailed pricing for the entire package"""
+    base_daily_rates = {
+        'Budget ($500-1000)': 120,
+        'Moderate ($1000-2500)': 280,
+        'Luxury ($2500+)': 650
+    }
+    
+    daily_rate = base_daily_rates.get(budget, 280)
+    base_cost = daily_rate * duration * travelers
+    
+    # Component breakdown
+    flights_cost = base_cost * 0.35
+    hotels_cost = base_cost * 0.40
+    restaurants_cost = base_cost * 0.15
+    activities_cost = base_cost * 0.10
+    
+    # Taxes and fees
+    taxes = base_cost * 0.12
+    service_fee = base_cost * 0.03
+    
+    total_cost = base_cost + taxes + service_fee
+    
+    return {
+        'base_cost': base_cost,
+        'flights': flights_cost,
+        'hotels': hotels_cost,
+        'restaurants': restaurants_cost,
+        'activities': activities_cost,
+        'taxes': taxes,
+        'service_fee': service_fee,
+        'total_cost': total_cost,
+        'cost_per_person': total_cost / travelers,
+        'daily_average': total_cost / duration
+    }
+
+def generate_daily_itinerary(destination, duration, profile, style):
+    """Generate a day-by-day itinerary"""
+    itinerary = []
+    
+    for day in range(1, duration + 1):
+        day_plan = {
+            'day': day,
+            'theme': get_day_theme(day, duration, profile),
+            'morning': get_activity_by_time('morning', day, destination, profile),
+            'afternoon': get_activity_by_time('afternoon', day, destination, profile),
+            'evening': get_activity_by_time('evening', day, destination, profile),
+            'meals': get_daily_meals(day, destination, profile),
+            'transportation': 'Walking + Metro' if 'Paris' in destination else 'Taxi + Metro',
+            'estimated_cost': 150 if day <= 2 else 120  # First days usually more expensive
+        }
+        itinerary.append(day_plan)
+    
+    return itinerary
+
+def get_day_theme(day, duration, profile):
+    """Get theme for each day based on profile"""
+    interests = profile.get('interests', ['cultural experiences'])
+    
+    themes = {
+        1: 'Arrival & City Orientation',
+        2: f'{interests[0].title()} Deep Dive' if interests else 'Cultural Exploration',
+        3: 'Local Experiences & Hidden Gems',
+        4: 'Relaxation & Personal Time',
+        5: 'Adventure & New Discoveries'
+    }
+    
+    if day <= len(themes):
+        return themes[day]
+    else:
+        return f'Exploration Day {day}'
+
+def get_activity_by_time(time_period, day, destination, profile):
+    """Get activity recommendation for specific time of day"""
+    activities = {
+        'morning': {
+            1: 'Check-in & Neighborhood Walk',
+            2: 'Museum Visit' if 'cultural' in profile.get('interests', []) else 'City Tour',
+            3: 'Local Market Exploration',
+        },
+        'afternoon': {
+            1: 'Landmark Visit & Photo Session',
+            2: 'Cooking Class' if 'local cuisine' in profile.get('interests', []) else 'Art Gallery Tour',
+            3: 'Shopping & Local Craft Discovery',
+        },
+        'evening': {
+            1: 'Welcome Dinner at Traditional Restaurant',
+            2: 'Cultural Show or Performance',
+            3: 'Sunset Views & Casual Dining',
+        }
+    }
+    
+    return activities.get(time_period, {}).get(day, f'{time_period.title()} Free Time')
+
+def get_daily_meals(day, destination, profile):
+    """Get meal recommendations for the day"""
+    return {
+        'breakfast': 'Hotel breakfast' if day == 1 else 'Local café',
+        'lunch': 'Traditional restaurant',
+        'dinner': 'Recommended restaurant from package'
+    }
+
+# Helper functions for data calculation
+def calculate_package_price(duration, travelers, budget):
+    """Calculate package price based on parameters"""
+    base_price_per_day = {
+        "Budget ($500-1000)": 150,
+        "Moderate ($1000-2500)": 350,
+        "Luxury ($2500+)": 800
+    }
+    
+    daily_rate = base_price_per_day.get(budget, 350)
+    return daily_rate * duration * travelers
+
+def get_activities_for_destination(destination):
+    """Get activities for destination"""
+    activities_map = {
+        "Beirut, Lebanon": [
+            "Visit National Museum of Beirut",
+            "Explore Pigeon Rocks (Raouche)",
+            "Walk through Beirut Souks",
+            "Tour Mohammad Al-Amin Mosque",
+            "Stroll along Corniche Beirut",
+            "Day trip to Jeita Grotto",
+            "Visit Byblos Castle",
+            "Explore Baalbek Temples"
+        ],
+        "Dubai, UAE": [
+            "Visit Burj Khalifa",
+            "Explore Dubai Mall",
+            "Desert Safari Adventure",
+            "Visit Dubai Marina",
+            "Tour Gold and Spice Souks",
+            "Palm Jumeirah Excursion"
+        ]
+    }
+    return activities_map.get(destination, ["City Tour", "Cultural Experience", "Local Cuisine Tasting"])
+    """Get available hotels for destination"""
+    # This would query the actual database
+    # For demo, returning mock data
+    return [
+        {'id': 1, 'name': 'Four Seasons Hotel', 'location': destination, 'rating': 4.8, 'price': 350, 'type': 'Luxury'},
+        {'id': 2, 'name': 'Grand Beirut Hotel', 'location': destination, 'rating': 4.5, 'price': 220, 'type': 'Business'},
+        {'id': 3, 'name': 'City Center Inn', 'location': destination, 'rating': 4.2, 'price': 120, 'type': 'Budget'},
+        {'id': 4, 'name': 'Seaside Resort', 'location': destination, 'rating': 4.6, 'price': 280, 'type': 'Resort'}
+    ]
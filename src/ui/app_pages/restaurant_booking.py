@@ -0,0 +1,159 @@
+"""
+🍽️ Restaurant Booking Page
+Restaurant search and reservation form
+"""
+
+import streamlit as st
+from datetime import datetime, timedelta
+
+from src.ui.app_pages.common import get_all_cities, get_booking_system, get_supabase_client
+from src.booking_system.restaurant_slots import get_restaurant_slot_engine, demo_restaurants
+
+def restaurant_booking_page():
+    """Restaurant booking interface"""
+    
+    st.title("🍽️ **Restaurant Reservations**")
+    st.markdown("*Book tables at premium restaurants with instant confirmation*")
+    
+    # Search form
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        cities_list = get_all_cities()
+        city = st.selectbox("🌍 City", cities_list)
+    
+    with col2:
+        reservation_date = st.date_input("📅 Date", datetime.now() + timedelta(days=1))
+    
+    with col3:
+        reservation_time = st.time_input("🕐 Time", datetime.now().replace(hour=19, minute=30).time())
+    
+    with col4:
+        party_size = st.number_input("👥 Party Size", 1, 20, 2)
+    
+    if st.button("🔍 Find Restaurants", type="primary"):
+        # Kept in session state so the Reserve buttons below still have the results after a rerun
+        st.session_state.restaurant_search = (city, reservation_date, party_size,
+                                              get_available_restaurants(city, reservation_date, reservation_time, party_size))
+    
+    search = st.session_state.get('restaurant_search')
+    if search and search[:3] == (city, reservation_date, party_size):
+        restaurants = search[3]
+        
+        st.markdown("### 🍽️ **Available Restaurants**")
+        if not restaurants:
+            st.info(f"😔 No tables for {party_size} within an hour of {reservation_time.strftime('%H:%M')}. Try another time.")
+        
+        for i, restaurant in enumerate(restaurants):
+            with st.expander(f"🍽️ {restaurant['name']} - {restaurant['cuisine']}", expanded=(i == 0)):
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.markdown(f"""
+                    <div class="restaurant-card">
+                        <h4>{restaurant['name']}</h4>
+                        <p><strong>🍴 Cuisine:</strong> {restaurant['cuisine']}</p>
+                        <p><strong>⭐ Rating:</strong> {restaurant['rating']}/5</p>
+                        <p><strong>📍 Location:</strong> {restaurant['location']}</p>
+                        <p><strong>💰 Price Range:</strong> {restaurant['price_range']}</p>
+                        <p><strong>🕐 Free tables at:</strong> {', '.join(t.strftime('%H:%M') for t in restaurant['available_times'])}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    deposit = restaurant.get('deposit', 0) * party_size
+                    st.markdown(f"""
+                    <p><strong>Deposit:</strong> ${deposit}/person</p>
+                    <p><strong>Total Deposit:</strong> ${deposit * party_size}</p>
+                    """)
+                    
+                    slot = st.selectbox("Time", restaurant['available_times'], key=f"slot_{restaurant['id']}",
+                                        format_func=lambda t: t.strftime('%H:%M'))
+                    if st.button(f"📋 Reserve Table", key=f"book_restaurant_{i}"):
+                        book_restaurant_form(restaurant, reservation_date, slot, party_size)
+
+def book_restaurant_form(restaurant, date, time, party_size):
+    """Restaurant booking form"""
+    
+    st.markdown("---")
+    st.markdown(f"### 📋 **Reservation: {restaurant['name']}**")
+    
+    with st.form(f"restaurant_booking_form_{restaurant['id']}"):
+        # Customer details
+        st.markdown("**👤 Contact Information**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            first_name = st.text_input("First Name*")
+            phone = st.text_input("Phone*")
+        
+        with col2:
+            last_name = st.text_input("Last Name*")
+            email = st.text_input("Email*")
+        
+        # Reservation details
+        occasion = st.selectbox("Occasion", ["Regular Dining", "Birthday", "Anniversary", "Business Meeting", "Other"])
+        special_requests = st.text_area("Special Requests", 
+                                       placeholder="e.g., Window table, dietary restrictions, celebrations")
+        
+        # Confirmation
+        datetime_str = f"{date} {time}"
+        deposit_amount = restaurant.get('deposit', 0) * party_size
+        
+        st.markdown(f"""
+        **📋 Reservation Summary:**
+        - **Restaurant:** {restaurant['name']}
+        - **Date & Time:** {datetime_str}
+        - **Party Size:** {party_size} people
+        - **Deposit:** ${deposit_amount}
+        """)
+        
+        terms_accepted = st.checkbox("I accept the reservation terms*")
+        
+        submitted = st.form_submit_button("🎉 Confirm Reservation", type="primary")
+        
+        if submitted:
+            if all([first_name, last_name, phone, email, terms_accepted]):
+                with st.spinner("🔄 Processing your reservation..."):
+                    engine = get_restaurant_slot_engine(get_supabase_client())
+                    hold = engine.hold(restaurant['id'], date, time, party_size)
+                    if hold is None:
+                        st.error("😔 That table was just taken. Please search again.")
+                        return
+                    try:
+                        booking_confirmation = get_booking_system().book_restaurant(
+                            user_id="demo_user",
+                            restaurant_id=str(restaurant['id']),
+                            date_time=datetime_str,
+                            party_size=party_size,
+                            special_requests=[special_requests] if special_requests else [],
+                            slot_hold_id=hold.hold_id
+                        )
+                        engine.confirm(hold.hold_id)
+                        
+                        st.markdown(f"""
+                        <div class="booking-success">
+                            <h3>🎉 Reservation Confirmed!</h3>
+                            <p><strong>Confirmation Number:</strong> {booking_confirmation.confirmation_number}</p>
+                            <p><strong>Restaurant:</strong> {restaurant['name']}</p>
+                            <p><strong>Date & Time:</strong> {datetime_str}</p>
+                            <p><strong>Party Size:</strong> {party_size} people</p>
+                            <p><strong>Status:</strong> {booking_confirmation.status.value.title()}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        st.balloons()
+                        
+                    except Exception as e:
+                        engine.release(hold.hold_id)
+                        st.error(f"❌ Reservation failed: {str(e)}")
+            else:
+                st.error("❌ Please fill in all required fields.")
+
+def get_available_restaurants(city, date, at, party_size, flex_minutes=60):
+    """Restaurants in the city with a table for the party within flex_minutes of the requested time"""
+    engine = get_restaurant_slot_engine(get_supabase_client())
+    if not engine.has_city(city):
+        engine.add_restaurants(demo_restaurants(city))
+    return [dict(restaurant.to_dict(), available_times=times)
+            for restaurant, times in engine.search(city, date, at, party_size, flex_minutes)]
@@ -0,0 +1,40 @@
+"""
+⚙️ Settings Page
+Settings placeholder and page load diagnostics
+"""
+
+import streamlit as st
+
+from src.ui.page_registry import get_page_registry
+
+
+def settings_page():
+    """Settings and performance diagnostics"""
+    
+    st.title("⚙️ Settings")
+    st.info("🔧 Settings page coming soon!")
+    
+    st.markdown("### ⏱️ **Page Performance**")
+    
+    registry = get_page_registry()
+    stats = registry.stats()
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Last Rerun", f"{stats['last_rerun_ms']:.0f} ms" if stats['last_rerun_ms'] is not None else "-")
+    with col2:
+        st.metric("Average Rerun", f"{stats['avg_rerun_ms']:.0f} ms" if stats['avg_rerun_ms'] is not None else "-",
+                  help=f"Over the last {stats['reruns']} reruns")
+    with col3:
+        st.metric("Pages Loaded", f"{len(stats['loaded'])}/{len(registry.pages)}")
+    
+    rows = [
+        {
+            "Page": page.label,
+            "Loaded": "✅" if page.key in stats['loaded'] else "—",
+            "First import (ms)": round(stats['import_ms'][page.key], 1) if page.key in stats['import_ms'] else None,
+            "Last render (ms)": round(stats['render_ms'][page.key], 1) if page.key in stats['render_ms'] else None
+        }
+        for page in registry.pages.values()
+    ]
+    st.table(rows)
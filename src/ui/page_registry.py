@@ -0,0 +1,136 @@
+"""
+🧭 Page Registry
+Lazy page loading and import/rerun timing for the enhanced Streamlit app
+
+Streamlit re-executes the app script on every widget interaction. The script
+itself only holds navigation; each page lives in its own module under
+src/ui/app_pages and is imported the first time it is selected, so heavy
+dependencies (Plotly, pandas, the payment and itinerary stacks) are only paid
+for by the pages that use them. Imported modules stay in sys.modules, so later
+reruns reuse them.
+
+Timings are kept per process: the cost of the first import of every page, the
+last render time of every page and a window of recent full reruns.
+
+Usage:
+    python src/ui/page_registry.py   # cold import time of every page in a fresh interpreter
+"""
+
+import sys
+import time
+import importlib
+import subprocess
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class Page:
+    """A navigation entry and where its render function lives"""
+    label: str
+    key: str
+    module: str
+    entry: str
+
+
+PAGES = [
+    Page("🏠 Home", "main", "src.ui.app_pages.home", "main_page"),
+    Page("🏨 Hotel Booking", "hotel_booking", "src.ui.app_pages.hotel_booking", "hotel_booking_page"),
+    Page("🍽️ Restaurant Booking", "restaurant_booking", "src.ui.app_pages.restaurant_booking", "restaurant_booking_page"),
+    Page("📦 Travel Packages", "package_creation", "src.ui.app_pages.package_creation", "package_creation_page"),
+    Page("📋 Booking History", "booking_history", "src.ui.app_pages.booking_history", "booking_history_page"),
+    Page("📊 Analytics", "analytics", "src.ui.app_pages.analytics", "analytics_dashboard"),
+    Page("⚙️ Settings", "settings", "src.ui.app_pages.settings", "settings_page"),
+]
+
+
+class PageRegistry:
+    """Resolve pages to render functions on demand and time them"""
+
+    def __init__(self, pages: List[Page], rerun_window: int = 50):
+        self.pages = {page.key: page for page in pages}
+        self.import_ms: Dict[str, float] = {}
+        self.render_ms: Dict[str, float] = {}
+        self.reruns = deque(maxlen=rerun_window)
+        self._lock = threading.Lock()
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        """label -> key, in navigation order"""
+        return {page.label: page.key for page in self.pages.values()}
+
+    def load(self, key: str) -> Callable[[], Any]:
+        """Import the page module if needed and return its render function"""
+        page = self.pages[key]
+        module = sys.modules.get(page.module)
+        if module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(page.module)
+            with self._lock:
+                self.import_ms.setdefault(key, (time.perf_counter() - start) * 1000)
+        return getattr(module, page.entry)
+
+    def render(self, key: str):
+        render = self.load(key)
+        start = time.perf_counter()
+        try:
+            render()
+        finally:
+            with self._lock:
+                self.render_ms[key] = (time.perf_counter() - start) * 1000
+
+    def record_rerun(self, key: str, started_at: float):
+        """Record a full script run that began at started_at (time.perf_counter)"""
+        with self._lock:
+            self.reruns.append((key, (time.perf_counter() - started_at) * 1000))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            reruns = [ms for _, ms in self.reruns]
+            return {
+                "import_ms": dict(self.import_ms),
+                "render_ms": dict(self.render_ms),
+                "reruns": len(reruns),
+                "last_rerun_ms": reruns[-1] if reruns else None,
+                "avg_rerun_ms": sum(reruns) / len(reruns) if reruns else None,
+                "loaded": [key for key, page in self.pages.items() if page.module in sys.modules]
+            }
+
+
+_registry: Optional[PageRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_page_registry() -> PageRegistry:
+    """Process-wide registry; it outlives reruns because this module is imported, not re-executed"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PageRegistry(PAGES)
+    return _registry
+
+
+def measure_cold_imports(pages: List[Page] = PAGES) -> Dict[str, float]:
+    """Import each page module in a fresh interpreter and return milliseconds per page"""
+    project_root = Path(__file__).parent.parent.parent
+    results = {}
+    for page in pages:
+        code = ("import sys, time; sys.path[:0] = [{root!r}, {src!r}]; t = time.perf_counter(); "
+                "import {module}; print((time.perf_counter() - t) * 1000)").format(
+            root=str(project_root), src=str(project_root / "src"), module=page.module)
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                   cwd=str(project_root))
+        try:
+            results[page.key] = float(completed.stdout.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            results[page.key] = float("nan")
+            print(f"⚠️ {page.module}: {completed.stderr.strip().splitlines()[-1:]}")
+    return results
+
+
+if __name__ == "__main__":
+    for key, ms in measure_cold_imports().items():
+        print(f"{key:20s} {ms:8.1f} ms")
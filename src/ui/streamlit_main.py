@@ -18,6 +18,9 @@ from enhanced_travel_platform import (
     PriceTracker, CalendarIntegration, GroupBookingManager,
     FlightOption, HotelOption, RestaurantOption, CarRentalOption
 )
+from src.services.analytics_pipeline import (
+    get_analytics_pipeline, record_event, recent_periods, REVENUE, BOOKINGS, DESTINATIONS
+)
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -331,6 +334,8 @@ def show_travel_package_page():
                         )
                         
                         st.session_state.current_package = package
+                        record_event("search", component="package", destination=destination,
+                                     user_id=st.session_state.user_profile.user_id)
                         st.success("✅ Travel package created successfully!")
                         
                     except Exception as e:
@@ -371,6 +376,8 @@ def display_travel_package(package: TravelPackage):
         st.write("**Amenities:** " + ", ".join(package.flight.amenities))
         
         if st.button("🎫 Book Flight"):
+            record_event("booking", package.flight.price, "flight", package.destination,
+                         st.session_state.user_profile.user_id)
             st.success("Flight booking initiated! You would be redirected to the airline's booking page.")
     
     with tab2:
@@ -392,6 +399,8 @@ def display_travel_package(package: TravelPackage):
                 st.write(f"• {review}")
         
         if st.button("🏨 Book Hotel"):
+            record_event("booking", package.hotel.price_per_night * package.duration, "hotel",
+                         package.destination, st.session_state.user_profile.user_id)
             st.success("Hotel booking initiated! You would be redirected to the booking platform.")
     
     with tab3:
@@ -426,6 +435,8 @@ def display_travel_package(package: TravelPackage):
                 st.write("**Features:** " + ", ".join(package.car_rental.features))
             
             if st.button("🚗 Book Car Rental"):
+                record_event("booking", package.car_rental.price_per_day * package.duration, "car_rental",
+                             package.destination, st.session_state.user_profile.user_id)
                 st.success("Car rental booking initiated!")
         else:
             st.info("No car rental included in this package. You can add one separately.")
@@ -646,6 +657,15 @@ def show_calendar_page():
         df = pd.DataFrame(calendar_data)
         st.dataframe(df, use_container_width=True)
         
+        st.download_button(
+            "📥 Export to Calendar (.ics)",
+            data="".join(st.session_state.calendar_integration.export_ics(
+                st.session_state.user_profile.user_id
+            )),
+            file_name="travel_calendar.ics",
+            mime="text/calendar"
+        )
+        
         # Calendar visualization
         st.subheader("📊 Calendar Overview")
         
@@ -682,25 +702,56 @@ def show_calendar_page():
             else:
                 st.warning("⚠️ You have conflicts during these dates.")
 
+def build_spending_figure(analytics, scope):
+    """Monthly spending of one user from the rollups"""
+    months = recent_periods("month", 6)
+    series = analytics.series(REVENUE, "month", len(months), scope=scope)
+    spending = [sum(values) for values in zip(*series.values())] if series else [0] * len(months)
+    labels = [datetime.strptime(month, "%Y-%m").strftime("%b") for month in months]
+    return px.bar(x=labels, y=spending, title="Monthly Travel Spending")
+
+def build_destinations_figure(analytics, scope):
+    """Destinations one user booked most"""
+    visits = analytics.totals(DESTINATIONS, scope=scope)
+    return px.pie(values=list(visits.values()), names=list(visits),
+                  title="Most Visited Destinations")
+
 def show_analytics_page():
     """Analytics dashboard"""
     
     st.header("📈 Travel Analytics Dashboard")
     
-    # Sample analytics data
+    analytics = get_analytics_pipeline()
+    analytics.flush()
+    user_id = st.session_state.user_profile.user_id if st.session_state.user_profile else "user_001"
+    scope = f"user:{user_id}"
+    
+    if not analytics.has_data(scope):
+        st.info("📭 No bookings or searches recorded for your profile yet.")
+        return
+    
+    bookings = sum(analytics.totals(BOOKINGS, scope=scope).values())
+    spent = sum(analytics.totals(REVENUE, scope=scope).values())
+    destinations = analytics.totals(DESTINATIONS, scope=scope)
+    kpis = analytics.kpis(scope)
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Bookings", "47", "+5 this month")
+        st.metric("Total Bookings", f"{bookings:,.0f}", f"+{kpis['current_bookings']:,.0f} this month")
     
     with col2:
-        st.metric("Total Savings", "$2,340", "+$420 this month")
+        st.metric("Total Spent", f"${spent:,.0f}", f"+${kpis['current_revenue']:,.0f} this month")
     
     with col3:
-        st.metric("Favorite Destination", "Paris", "3 visits")
+        if destinations:
+            favorite = next(iter(destinations))
+            st.metric("Favorite Destination", favorite, f"{destinations[favorite]:,.0f} visits")
+        else:
+            st.metric("Favorite Destination", "-")
     
     with col4:
-        st.metric("Average Trip Cost", "$1,250", "-$150 vs last year")
+        st.metric("Average Trip Cost", f"${spent / bookings:,.0f}" if bookings else "-")
     
     # Charts
     st.subheader("📊 Travel Trends")
@@ -708,34 +759,28 @@ def show_analytics_page():
     col1, col2 = st.columns(2)
     
     with col1:
-        # Sample spending data
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-        spending = [800, 1200, 900, 1500, 1100, 1300]
-        
-        fig = px.bar(x=months, y=spending, title="Monthly Travel Spending")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(analytics.figure("user_spending", [REVENUE],
+                                         lambda a: build_spending_figure(a, scope), scope=scope),
+                        use_container_width=True)
     
     with col2:
-        # Sample destination data
-        destinations = ['Paris', 'Tokyo', 'New York', 'London', 'Rome']
-        visits = [3, 2, 4, 2, 1]
-        
-        fig = px.pie(values=visits, names=destinations, 
-                    title="Most Visited Destinations")
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Travel history table
-    st.subheader("🗓️ Recent Travel History")
-    
-    travel_history = pd.DataFrame({
-        'Destination': ['Paris, France', 'Tokyo, Japan', 'New York, USA', 'London, UK'],
-        'Dates': ['2024-01-15 to 2024-01-22', '2023-11-10 to 2023-11-17', 
-                 '2023-09-05 to 2023-09-12', '2023-06-20 to 2023-06-27'],
-        'Cost': ['$1,450', '$2,100', '$1,200', '$1,600'],
-        'Rating': ['⭐⭐⭐⭐⭐', '⭐⭐⭐⭐⭐', '⭐⭐⭐⭐', '⭐⭐⭐⭐⭐']
+        st.plotly_chart(analytics.figure("user_destinations", [DESTINATIONS],
+                                         lambda a: build_destinations_figure(a, scope), scope=scope),
+                        use_container_width=True)
+    
+    # Monthly summary table
+    st.subheader("🗓️ Monthly Summary")
+    
+    months = recent_periods("month", 6)
+    spending = analytics.series(REVENUE, "month", len(months), scope=scope)
+    counts = analytics.series(BOOKINGS, "month", len(months), scope=scope)
+    summary = pd.DataFrame({
+        'Month': months,
+        'Bookings': [int(sum(values)) for values in zip(*counts.values())] if counts else [0] * len(months),
+        'Spent': [f"${sum(values):,.0f}" for values in zip(*spending.values())] if spending else ["$0"] * len(months)
     })
     
-    st.dataframe(travel_history, use_container_width=True)
+    st.dataframe(summary.iloc[::-1], use_container_width=True)
 
 def show_ai_chat_page():
     """AI chat assistant page"""
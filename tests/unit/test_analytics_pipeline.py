@@ -0,0 +1,108 @@
+"""
+Unit tests for the analytics rollup pipeline and its figure cache.
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.analytics_pipeline import (
+    AnalyticsPipeline, AnalyticsEvent, generate_demo_events, recent_periods,
+    REVENUE, BOOKINGS, FUNNEL, DESTINATIONS, SEARCHES
+)
+
+
+class FakeFigure:
+    def __init__(self, data):
+        self.data = data
+
+    def to_json(self):
+        return '{"data": %d}' % self.data
+
+
+class TestAnalyticsPipeline(unittest.TestCase):
+    """Test incremental rollups and figure invalidation."""
+
+    def setUp(self):
+        self.pipeline = AnalyticsPipeline(db_path=":memory:", flush_size=3)
+        self.month = recent_periods("month", 1)[0]
+
+    def test_rollups_match_raw_events(self):
+        """Incremental batches add up to the totals of the raw stream."""
+        events = list(generate_demo_events(5000, months=3))
+        for start in range(0, len(events), 1000):
+            self.pipeline.ingest(events[start:start + 1000])
+
+        expected = sum(e.amount if e.event_type == "booking" else -e.amount
+                       for e in events if e.event_type in ("booking", "cancellation"))
+        self.assertAlmostEqual(sum(self.pipeline.totals(REVENUE).values()), expected, places=2)
+        daily = sum(self.pipeline.totals(REVENUE, grain="day").values())
+        self.assertAlmostEqual(daily, expected, places=2)
+        searches = sum(1 for e in events if e.event_type == "search")
+        self.assertEqual(self.pipeline.totals(FUNNEL)["search"], searches)
+
+    def test_buffered_events_and_user_scope(self):
+        """Recorded events flush at flush_size and roll up per user."""
+        self.pipeline.record("booking", 100.0, "hotel", "Paris", "u1")
+        self.pipeline.record("booking", 50.0, "flight", "Paris", "u1")
+        self.assertFalse(self.pipeline.has_data())
+        self.pipeline.record("cancellation", 50.0, "flight", None, "u1")
+        self.assertTrue(self.pipeline.has_data())
+
+        self.assertEqual(self.pipeline.totals(REVENUE, scope="user:u1"), {"hotel": 100.0, "flight": 0.0})
+        self.assertEqual(self.pipeline.totals(DESTINATIONS, scope="user:u1"), {"Paris": 2.0})
+        self.assertEqual(self.pipeline.series(BOOKINGS, periods=1, scope="user:u1")["hotel"], [1.0])
+
+    def test_buffer_is_flushed_after_flush_interval(self):
+        """A quiet stream still reaches the rollups once its oldest event is flush_interval old."""
+        pipeline = AnalyticsPipeline(db_path=":memory:", flush_size=5000, flush_interval=5.0)
+        now = [1000.0]
+        with patch("src.services.analytics_pipeline.time.monotonic", lambda: now[0]):
+            pipeline.record("search", destination="Rome")
+            now[0] += 4
+            pipeline.record("search", destination="Rome")
+            self.assertFalse(pipeline.has_data())
+            now[0] += 1
+            pipeline.record("search", destination="Oslo")
+        self.assertEqual(pipeline.totals(SEARCHES), {"Rome": 2.0, "Oslo": 1.0})
+
+    def test_figure_rebuilt_only_when_rollup_changes(self):
+        """A cached figure is reused until one of its metrics changes."""
+        builds = []
+
+        def build(pipeline):
+            builds.append(1)
+            return FakeFigure(len(builds))
+
+        self.pipeline.ingest([AnalyticsEvent("booking", 10.0, "hotel", occurred_at=datetime.now())])
+        first = self.pipeline.figure("revenue", [REVENUE], build)
+        self.assertEqual(self.pipeline.figure("revenue", [REVENUE], build), first)
+        self.pipeline.ingest([AnalyticsEvent("search", destination="Rome")])
+        self.pipeline.figure("revenue", [REVENUE], build)
+        self.assertEqual(len(builds), 1)
+
+        self.pipeline.ingest([AnalyticsEvent("booking", 5.0, "hotel")])
+        self.assertEqual(self.pipeline.figure("revenue", [REVENUE], build), {"data": 2})
+
+    def test_reset_bookings_keeps_search_rollups(self):
+        """Rebuilding from the bookings table leaves searches and other funnel steps alone."""
+        self.pipeline.ingest([
+            AnalyticsEvent("booking", 80.0, "hotel", "Rome"),
+            AnalyticsEvent("search", destination="Rome"),
+            AnalyticsEvent("view", destination="Rome")
+        ])
+        self.pipeline.reset_bookings()
+
+        self.assertEqual(self.pipeline.totals(REVENUE), {})
+        self.assertEqual(self.pipeline.totals(DESTINATIONS), {})
+        self.assertEqual(self.pipeline.totals(SEARCHES), {"Rome": 1.0})
+        self.assertEqual(self.pipeline.totals(FUNNEL), {"search": 1.0, "view": 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Unit tests for streaming table backups and restore.
+"""
+
+import unittest
+import sys
+import os
+import gzip
+import json
+import random
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.backup import TableBackup, iter_backup_rows, MANIFEST_NAME
+
+
+class FakeQuery:
+    """PostgREST query stand-in; like Postgres, unordered pages come back in no particular order"""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.after = None
+        self.order_by = []
+        self.window = None
+        self.written = None
+
+    def select(self, columns):
+        return self
+
+    def gt(self, column, value):
+        self.after = (column, value)
+        return self
+
+    def order(self, column):
+        self.order_by.append(column)
+        return self
+
+    def limit(self, count):
+        self.window = (0, count)
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end - start + 1)
+        return self
+
+    def upsert(self, rows, on_conflict, returning):
+        self.written = (rows, on_conflict.split(","))
+        return self
+
+    def execute(self):
+        self.db.requests.append((self.table, tuple(self.order_by), self.window))
+        if self.table not in self.db.tables and not self.written:
+            raise RuntimeError(f'relation "{self.table}" does not exist')
+        rows = self.db.tables.setdefault(self.table, [])
+        if self.written:
+            chunk, keys = self.written
+            existing = {tuple(row[k] for k in keys): row for row in rows}
+            for row in chunk:
+                key = tuple(row[k] for k in keys)
+                if key in existing:
+                    existing[key].update(row)
+                else:
+                    rows.append(dict(row))
+            return SimpleNamespace(data=[])
+
+        if self.after:
+            column, value = self.after
+            rows = [row for row in rows if row[column] > value]
+        if self.order_by:
+            rows = sorted(rows, key=lambda row: tuple(row[c] for c in self.order_by))
+        else:
+            rows = random.Random(len(self.db.requests)).sample(rows, len(rows))
+        start, size = self.window or (0, len(rows))
+        return SimpleNamespace(data=[dict(row) for row in rows[start:start + size]])
+
+
+class FakeDatabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.requests = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+class TestTableBackup(unittest.TestCase):
+    """Test the backup/restore round-trip and composite-key paging."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = FakeDatabase({
+            "hotels": [{"id": i, "name": f"Hotel {i}", "rating": i % 5} for i in range(1, 24)],
+            "group_booking_members": [{"group_id": f"group_{g}", "user_id": f"user_{u}"}
+                                      for g in range(4) for u in range(6)]
+        })
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def backup(self):
+        backup = TableBackup(self.source, page_size=5, workers=2, log=lambda *args: None)
+        return backup.backup(["hotels", "group_booking_members", "missing_table"], Path(self.tmp.name))
+
+    def test_round_trip_restores_every_row(self):
+        backup_dir = self.backup()
+        with open(backup_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["tables"]["hotels"]["rows"], 23)
+        self.assertEqual(manifest["tables"]["group_booking_members"]["key_column"], "group_id,user_id")
+        self.assertEqual([row["id"] for row in iter_backup_rows(backup_dir / "hotels.ndjson.gz")], list(range(1, 24)))
+
+        target = FakeDatabase({"hotels": [{"id": 1, "name": "Stale", "rating": 0}]})
+        restored = TableBackup(target, workers=2, log=lambda *args: None).restore(backup_dir, chunk_size=4)
+        self.assertEqual(restored, {"hotels": 23, "group_booking_members": 24})
+        self.assertEqual(sorted(target.tables["hotels"], key=lambda row: row["id"]), self.source.tables["hotels"])
+        self.assertEqual(len(target.tables["group_booking_members"]), 24)
+
+    def test_composite_keys_are_range_paged_in_key_order(self):
+        backup_dir = self.backup()
+        rows = list(iter_backup_rows(backup_dir / "group_booking_members.ndjson.gz"))
+        keys = [(row["group_id"], row["user_id"]) for row in rows]
+        self.assertEqual(keys, sorted(set(keys)))  # no page skipped or repeated a row
+        self.assertEqual(len(keys), 24)
+
+        member_requests = [r for r in self.source.requests if r[0] == "group_booking_members"]
+        self.assertEqual({order for _, order, _ in member_requests}, {("group_id", "user_id")})
+        self.assertEqual([window for _, _, window in member_requests][:2], [(0, 5), (5, 5)])
+
+    def test_corrupt_files_are_refused(self):
+        backup_dir = self.backup()
+        self.assertFalse((backup_dir / "missing_table.ndjson.gz").exists())
+        with gzip.open(backup_dir / "hotels.ndjson.gz", "at", encoding="utf-8") as f:
+            f.write('{"id": 99}\n')
+        with self.assertRaises(ValueError):
+            TableBackup(FakeDatabase({}), log=lambda *args: None).restore(backup_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for keyset-paginated booking history.
+"""
+
+import unittest
+import re
+import sys
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.booking_history import BookingHistoryService, LIST_COLUMNS, decode_cursor
+
+
+class FakeQuery:
+    """Just enough of the PostgREST builder for the queries the service sends"""
+
+    _KEYSET = re.compile(r'created_at\.lt\."(.+?)",and\(created_at\.eq\."(.+?)",id\.lt\."(.+?)"\)')
+
+    def __init__(self, client):
+        self.client = client
+        self.filters = []
+        self.columns = None
+        self.row_limit = None
+
+    def select(self, columns):
+        self.columns = columns
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row[column] == value)
+        return self
+
+    def or_(self, expression):
+        created_at, _, booking_id = self._KEYSET.fullmatch(expression).groups()
+        self.filters.append(lambda row: (row["created_at"], row["id"]) < (created_at, booking_id))
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def limit(self, n):
+        self.row_limit = n
+        return self
+
+    def execute(self):
+        self.client.requests.append(self.columns)
+        rows = [row for row in self.client.rows if all(f(row) for f in self.filters)]
+        rows.sort(key=lambda row: (row["created_at"], row["id"]), reverse=True)
+        if self.columns != "*":
+            rows = [{column: row[column] for column in self.columns.split(",")} for row in rows]
+        return SimpleNamespace(data=rows[:self.row_limit])
+
+
+class FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+
+    def table(self, name):
+        return FakeQuery(self)
+
+
+def make_booking(i, user_id="user_1"):
+    created_at = (datetime(2024, 1, 1) + timedelta(hours=i // 2)).isoformat() + "+00:00"  # pairs share a timestamp
+    return {"id": f"b{i:04d}", "user_id": user_id, "confirmation_number": f"ATP{i:05d}", "booking_type": "hotel",
+            "status": "confirmed", "payment_status": "paid", "total_amount": 100 + i, "currency": "USD",
+            "created_at": created_at, "details": {"hotel_name": f"Hotel {i}"}, "special_requests": []}
+
+
+class TestBookingHistory(unittest.TestCase):
+    """Test keyset paging, projection and lazy details."""
+
+    def setUp(self):
+        self.client = FakeClient([make_booking(i) for i in range(45)] + [make_booking(99, "user_2")])
+        self.service = BookingHistoryService(self.client, page_size=20)
+
+    def test_pages_cover_every_booking_once_newest_first(self):
+        seen, cursor, sizes = [], None, []
+        while True:
+            page = self.service.page("user_1", cursor=cursor)
+            sizes.append(len(page.items))
+            seen.extend(row["id"] for row in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+            # A booking created while the user is paging does not shift later pages
+            self.client.rows.append(make_booking(100 + len(sizes)))
+
+        self.assertEqual(sizes, [20, 20, 5])
+        self.assertEqual(seen, [f"b{i:04d}" for i in range(44, -1, -1)])
+        self.assertEqual(decode_cursor(cursor)[1], "b0005")
+
+    def test_list_view_projects_columns_and_details_load_once(self):
+        page = self.service.page("user_1", limit=5)
+        self.assertEqual(set(page.items[0]), set(LIST_COLUMNS))
+        self.assertNotIn("details", page.items[0])
+
+        first = self.service.details("user_1", "b0044")
+        again = self.service.details("user_1", "b0044")
+        self.assertEqual(first["details"], {"hotel_name": "Hotel 44"})
+        self.assertIs(first, again)
+        self.assertEqual(self.client.requests.count("*"), 1)
+
+        self.assertIsNone(self.service.details("user_1", "b0099"))  # another user's booking
+
+    def test_cached_details_are_not_served_to_another_user(self):
+        self.assertIsNotNone(self.service.details("user_1", "b0044"))
+        self.assertIsNone(self.service.details("user_2", "b0044"))
+        self.assertEqual(self.service.details("user_1", "b0044")["id"], "b0044")
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            self.service.page("user_1", cursor="not-a-cursor")
+
+
+if __name__ == '__main__':
+    unittest.main()
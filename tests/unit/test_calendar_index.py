@@ -0,0 +1,79 @@
+"""
+Unit tests for the calendar interval index used by CalendarIntegration.
+"""
+
+import unittest
+import random
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.calendar_index import CalendarIndex, CalendarEvent, iter_ics
+
+
+def make_event(start: datetime, hours: float, title: str = "Event") -> CalendarEvent:
+    return CalendarEvent(start=start, end=start + timedelta(hours=hours), title=title)
+
+
+class TestCalendarIndex(unittest.TestCase):
+    """Test overlap queries against a brute-force scan."""
+
+    def setUp(self):
+        random.seed(42)
+        self.base = datetime(2025, 1, 1)
+        self.events = [
+            make_event(self.base + timedelta(hours=random.randint(0, 24 * 365)), random.choice([1, 2, 8, 48]))
+            for _ in range(2000)
+        ]
+
+    def brute_force(self, start, end):
+        return sorted(
+            (e for e in self.events if e.start <= end and e.end >= start),
+            key=lambda e: (e.start, e.uid)
+        )
+
+    def test_overlaps_match_linear_scan(self):
+        """Bulk-built and incrementally built indexes agree with a scan."""
+        bulk = CalendarIndex(self.events)
+        incremental = CalendarIndex()
+        for event in self.events:
+            incremental.insert(event)
+
+        for _ in range(200):
+            start = self.base + timedelta(hours=random.randint(0, 24 * 365))
+            end = start + timedelta(days=random.randint(0, 21))
+            expected = [e.uid for e in self.brute_force(start, end)]
+            self.assertEqual([e.uid for e in bulk.overlaps(start, end)], expected)
+            self.assertEqual([e.uid for e in incremental.overlaps(start, end)], expected)
+            self.assertEqual(bulk.has_conflict(start, end), bool(expected))
+
+    def test_bulk_insert_into_existing_index(self):
+        """A second itinerary is merged into an existing history."""
+        index = CalendarIndex(self.events[:1000])
+        index.bulk_insert(self.events[1000:])
+        self.assertEqual(len(index), 2000)
+        starts = [e.start for e in index]
+        self.assertEqual(starts, sorted(starts))
+
+    def test_empty_index_has_no_conflicts(self):
+        """An empty calendar is always available."""
+        index = CalendarIndex()
+        self.assertFalse(index.has_conflict(self.base, self.base + timedelta(days=21)))
+
+    def test_ics_export_streams_valid_document(self):
+        """ICS export yields CRLF lines folded at 75 octets."""
+        long_title = "🍽️ Dinner at " + "Le Restaurant Tres Long " * 10
+        index = CalendarIndex([make_event(self.base, 2, long_title)])
+        lines = list(iter_ics(index))
+        self.assertEqual(lines[0], "BEGIN:VCALENDAR\r\n")
+        self.assertEqual(lines[-1], "END:VCALENDAR\r\n")
+        self.assertTrue(all(line.endswith("\r\n") for line in lines))
+        self.assertTrue(all(len(line.rstrip("\r\n").encode("utf-8")) <= 75 for line in lines))
+        self.assertIn("DTSTART:20250101T000000\r\n", lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
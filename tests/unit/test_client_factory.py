@@ -0,0 +1,87 @@
+"""
+Unit tests for the instrumented Supabase transport and its latency counters.
+"""
+
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.api_integration.supabase import client_factory
+from src.api_integration.supabase.client_factory import HTTPX_AVAILABLE, TableLatencyStats
+
+if HTTPX_AVAILABLE:
+    import httpx
+    from src.api_integration.supabase.client_factory import InstrumentedTransport
+
+
+class TestTableLatencyStats(unittest.TestCase):
+    """Test per-table counters and bounded reservoir samples."""
+
+    def test_reservoir_keeps_a_bounded_sample(self):
+        stats = TableLatencyStats(sample_size=10)
+        for i in range(1000):
+            stats.record("bookings", float(i), error=i % 100 == 0, retries=i % 2)
+        stats.record("rpc/exec_sql", 5.0)
+
+        snapshot = stats.snapshot()
+        self.assertEqual(len(stats._stats["bookings"]["samples"]), 10)
+        self.assertEqual(snapshot["bookings"]["calls"], 1000)
+        self.assertEqual((snapshot["bookings"]["errors"], snapshot["bookings"]["retries"]), (10, 500))
+        self.assertEqual(snapshot["bookings"]["max_ms"], 999.0)
+        self.assertAlmostEqual(snapshot["bookings"]["avg_ms"], 499.5)
+        self.assertEqual(snapshot["rpc/exec_sql"]["p95_ms"], 5.0)
+
+    def test_table_names_come_from_the_rest_path(self):
+        self.assertEqual(client_factory._table_from_path("/rest/v1/bookings"), "bookings")
+        self.assertEqual(client_factory._table_from_path("/rest/v1/rpc/exec_sql"), "rpc/exec_sql")
+
+
+@unittest.skipUnless(HTTPX_AVAILABLE, "httpx not installed")
+class TestInstrumentedTransport(unittest.TestCase):
+    """Test read retries, write pass-through and per-table stats over a mock transport."""
+
+    def setUp(self):
+        self.requests = []
+        self.stats = TableLatencyStats()
+
+    def client(self, statuses):
+        statuses = list(statuses)
+
+        def handler(request):
+            self.requests.append(request.method)
+            return httpx.Response(statuses.pop(0) if len(statuses) > 1 else statuses[0])
+
+        transport = InstrumentedTransport(max_retries=3, base_delay=0.0, transport=httpx.MockTransport(handler),
+                                          stats=self.stats)
+        return httpx.Client(transport=transport, base_url="https://example.supabase.co")
+
+    def test_reads_are_retried_on_bad_gateway(self):
+        response = self.client([502, 200]).get("/rest/v1/bookings")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.requests, ["GET", "GET"])
+        stats = self.stats.snapshot()["bookings"]
+        self.assertEqual((stats["calls"], stats["retries"], stats["errors"]), (1, 1, 0))
+
+    def test_writes_are_not_retried(self):
+        response = self.client([502, 200]).post("/rest/v1/rpc/exec_sql", json={})
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(self.requests, ["POST"])
+        self.assertEqual(self.stats.snapshot()["rpc/exec_sql"]["errors"], 1)
+
+    def test_retries_stop_after_max_retries(self):
+        self.assertEqual(self.client([503]).head("/rest/v1/hotels").status_code, 503)
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual(self.stats.snapshot()["hotels"]["retries"], 3)
+
+    def test_client_session_is_routed_through_the_shared_transport(self):
+        session = httpx.Client()
+        client_factory._instrument(SimpleNamespace(postgrest=SimpleNamespace(session=session)))
+        self.assertIs(session._transport, client_factory._get_shared_transport())
+
+
+if __name__ == '__main__':
+    unittest.main()
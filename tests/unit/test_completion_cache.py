@@ -0,0 +1,114 @@
+"""
+Unit tests for the OpenAI chat completion cache.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.api_integration.openai.completion_cache import CompletionCache, canonical_key
+from src.api_integration.openai.openai_service import OpenAIService
+
+
+class FakeOpenAIClient:
+    """Answers every chat completion with a numbered reply"""
+
+    def __init__(self):
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, **params):
+        self.requests.append((model, messages, params))
+        content = f"reply {len(self.requests)}"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestCompletionCache(unittest.TestCase):
+    """Test exact and near-duplicate hits, TTLs, LRU eviction and persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "completions.db")
+        self.now = 1000.0
+        self.client = FakeOpenAIClient()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def service(self, **kwargs):
+        self.cache = CompletionCache(self.db_path, clock=lambda: self.now, **kwargs)
+        return OpenAIService(client=self.client, cache=self.cache)
+
+    def ask(self, service, text, **params):
+        return service.chat_completion([{"role": "system", "content": "You are a travel planner."},
+                                        {"role": "user", "content": text}], **params)
+
+    def test_exact_hits_ttl_and_persistence(self):
+        self.assertEqual(canonical_key("m", [{"role": "user", "content": " Hi "}], {"temperature": None}),
+                         canonical_key("m", [{"content": "Hi", "role": "user"}]))
+
+        service = self.service(ttls={"package": 100.0})
+        first = self.ask(service, "Plan 3 days in Rome", use_case="package")
+        self.assertEqual(self.ask(service, "Plan 3 days in Rome", use_case="package"), first)
+        self.ask(service, "Plan 3 days in Rome", use_case="package", temperature=0.2)  # different parameters
+        self.ask(service, "Plan 3 days in Rome", use_case="package", use_cache=False)
+        self.assertEqual(len(self.client.requests), 3)
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertGreaterEqual(stats["saved_seconds"], 0.0)
+
+        # Survives a restart, then expires
+        self.cache.close()
+        service = self.service(ttls={"package": 100.0})
+        self.assertEqual(self.ask(service, "Plan 3 days in Rome", use_case="package"), first)
+        self.now += 101
+        self.assertNotEqual(self.ask(service, "Plan 3 days in Rome", use_case="package"), first)
+        self.assertEqual(len(self.client.requests), 4)
+
+    def test_use_cases_keep_their_own_ttl(self):
+        service = self.service(ttls={"package": 100.0, "chat": 10.0})
+        package = self.ask(service, "Plan 3 days in Rome", use_case="package")
+        chat = self.ask(service, "Plan 3 days in Rome", use_case="chat")  # own row, does not replace the package one
+        self.assertNotEqual(package, chat)
+
+        self.now += 11
+        self.assertEqual(self.ask(service, "Plan 3 days in Rome", use_case="package"), package)
+        self.assertNotEqual(self.ask(service, "Plan 3 days in Rome", use_case="chat"), chat)
+        self.assertEqual(len(self.client.requests), 3)
+
+    def test_lru_eviction(self):
+        service = self.service(max_entries=2)
+        self.ask(service, "Paris")
+        self.now += 1
+        self.ask(service, "Rome")
+        self.now += 1
+        self.ask(service, "Paris")  # Paris is now the most recently used
+        self.now += 1
+        self.ask(service, "Tokyo")
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+
+        self.ask(service, "Paris")
+        self.ask(service, "Rome")
+        self.assertEqual([messages[-1]["content"] for _, messages, _ in self.client.requests],
+                         ["Paris", "Rome", "Tokyo", "Rome"])
+
+    def test_near_duplicate_prompts(self):
+        service = self.service(similarity_threshold=0.8)
+        answer = self.ask(service, "What are the best things to do in Paris for a family with kids?")
+        self.assertEqual(self.ask(service, "what are the best things to do in paris for a family with kids"), answer)
+        self.assertNotEqual(self.ask(service, "Find a cheap hotel near the Colosseum"), answer)
+        # Near duplicates never cross models
+        self.assertNotEqual(self.ask(service, "What are the best things to do in Paris for a family with kids?",
+                                     model="gpt-4o"), answer)
+        self.assertEqual(self.cache.get_stats()["semantic_hits"], 1)
+        self.assertEqual(len(self.client.requests), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
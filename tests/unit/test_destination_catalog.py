@@ -0,0 +1,108 @@
+"""
+Unit tests for the shared destination catalog.
+"""
+
+import unittest
+import sys
+import os
+import time
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.destination_catalog import DestinationCatalog, DEFAULT_CITIES, DEFAULT_DESTINATIONS
+
+
+class FakeQuery:
+    def __init__(self, client, columns):
+        self.client = client
+        self.columns = columns
+
+    def execute(self):
+        self.client.queries.append(self.columns)
+        self.client.fetched.wait(5)
+        if "city" in self.columns and not self.client.has_city:
+            raise RuntimeError("column destinations.city does not exist")
+        return SimpleNamespace(data=[dict(row) for row in self.client.rows])
+
+
+class FakeClient:
+    def __init__(self, rows, has_city=True):
+        self.rows = rows
+        self.has_city = has_city
+        self.queries = []
+        self.fetched = threading.Event()
+        self.fetched.set()
+
+    def table(self, name):
+        return SimpleNamespace(select=lambda columns: FakeQuery(self, columns))
+
+
+class TestDestinationCatalog(unittest.TestCase):
+    """Test non-blocking reads, TTL expiry and background refresh."""
+
+    def wait_for_refreshes(self, catalog, count):
+        deadline = time.perf_counter() + 5  # time.monotonic is patched in some tests
+        while catalog.stats["refreshes"] + catalog.stats["errors"] < count and time.perf_counter() < deadline:
+            time.sleep(0.005)
+        while catalog._refreshing and time.perf_counter() < deadline:
+            time.sleep(0.005)
+
+    def test_reads_refresh_in_the_background_once_the_ttl_expires(self):
+        client = FakeClient([{"name": "Paris, France", "city": "Paris"}, {"name": "Byblos, Lebanon", "city": None}])
+        client.fetched.clear()
+        catalog = DestinationCatalog(client, ttl=60.0)
+        now = [1000.0]
+
+        with patch("src.services.destination_catalog.time.monotonic", lambda: now[0]):
+            # The first read does not wait for the database: it serves the offline list
+            self.assertEqual(catalog.get_destinations(), DEFAULT_DESTINATIONS)
+            self.assertEqual(catalog.get_cities(), DEFAULT_CITIES)  # refresh already in flight, no second one
+            client.fetched.set()
+            self.wait_for_refreshes(catalog, 1)
+            self.assertTrue(catalog.is_live)
+            self.assertEqual(catalog.get_destinations(), ["Byblos, Lebanon", "Paris, France"])
+            self.assertEqual(catalog.get_cities(), ["Byblos", "Paris"])
+            self.assertEqual(len(client.queries), 1)
+
+            # Within the TTL reads are served from the snapshot
+            client.rows.append({"name": "Rome, Italy", "city": "Rome"})
+            now[0] += 59
+            self.assertNotIn("Rome", catalog.get_cities())
+            self.assertEqual(len(client.queries), 1)
+
+            # Past the TTL the stale snapshot is served once while the refresh runs
+            now[0] += 2
+            catalog.get_cities()
+            self.wait_for_refreshes(catalog, 2)
+            self.assertEqual(catalog.get_cities(), ["Byblos", "Paris", "Rome"])
+
+            catalog.invalidate()
+            catalog.get_destinations()
+            self.wait_for_refreshes(catalog, 3)
+            self.assertEqual(catalog.stats["refreshes"], 3)
+
+    def test_old_schema_and_failed_refreshes_keep_the_snapshot(self):
+        client = FakeClient([{"name": "Tyre, Lebanon"}], has_city=False)
+        catalog = DestinationCatalog(client, ttl=60.0)
+        catalog.refresh()
+        self.assertEqual(catalog.get_cities(), ["Tyre"])
+        self.assertEqual(client.queries, ["name, city", "name"])
+
+        def offline(name):
+            raise ConnectionError("offline")
+
+        client.table = offline
+        catalog.invalidate()
+        catalog.get_cities()
+        self.wait_for_refreshes(catalog, 2)
+        self.assertEqual(catalog.stats["errors"], 1)
+        self.assertEqual(catalog.get_cities(), ["Tyre"])
+        self.assertGreater(catalog._next_refresh, time.monotonic())  # backs off instead of retrying each read
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit tests for batched embeddings and the memory-mapped vector store.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.api_integration.openai import embedding_store
+from src.api_integration.openai.completion_cache import HashedTextEmbedder
+from src.api_integration.openai.embedding_store import BatchEmbeddings, OpenAIEmbedder, VectorStore
+from src.api_integration.openai.openai_service import OpenAIService
+
+
+class FakeEmbeddingsClient:
+    """Deterministic 8-d embeddings, returned out of order like the API may"""
+
+    def __init__(self):
+        self.batches = []
+        self._lock = threading.Lock()
+        self.embeddings = SimpleNamespace(create=self.create)
+
+    def create(self, model, input):
+        with self._lock:
+            self.batches.append(list(input))
+        data = [SimpleNamespace(index=i, embedding=[float(len(text)), float(ord(text[-1]))] + [1.0] * 6)
+                for i, text in enumerate(input)]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+class TestEmbeddingStore(unittest.TestCase):
+    """Test chunking, store reuse across restarts and offline embedders."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = FakeEmbeddingsClient()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batches_are_chunked_and_stored_once(self):
+        embedder = OpenAIEmbedder(self.client, max_inputs=3, max_tokens=40)
+        self.assertEqual([len(chunk) for chunk in embedder.chunk(["x" * 120, "a", "b", "c", "d"])], [1, 3, 1])
+
+        texts = [f"hotel {i}" for i in range(10)] + ["hotel 3"]
+        embeddings = BatchEmbeddings(embedder, VectorStore(self.tmp.name, initial_capacity=4))
+        vectors = embeddings.embed(texts)
+        self.assertEqual(vectors.shape, (11, 8))
+        self.assertEqual(vectors.dtype, np.float32)
+        self.assertEqual(vectors[1][0], len("hotel 1"))
+        np.testing.assert_array_equal(vectors[3], vectors[10])
+        self.assertEqual(sum(len(batch) for batch in self.client.batches), 10)
+        self.assertEqual(len(self.client.batches), 4)
+
+        # Reopened from disk: nothing new is sent to the API
+        embeddings = BatchEmbeddings(embedder, VectorStore(self.tmp.name))
+        np.testing.assert_array_equal(embeddings.embed(list(reversed(texts))), vectors[::-1])
+        self.assertEqual(len(self.client.batches), 4)
+        self.assertEqual(embeddings.stats["stored"], 11)
+        self.assertEqual(embeddings.store.search(vectors[5], k=1)[0][0], embedding_store.content_hash(
+            embedder.model, "hotel 5"))
+
+        with self.assertRaises(ValueError):
+            embeddings.store.add([b"k" * 32], np.zeros((1, 4)), embedder.model)
+
+    def test_service_embeds_offline_with_a_local_embedder(self):
+        with patch.dict(os.environ, {"EMBEDDINGS_DIR": self.tmp.name}), patch.dict(embedding_store._stores, clear=True):
+            service = OpenAIService(embedder=HashedTextEmbedder(dimensions=64), cache=False)
+            vectors = service.embed_batch(["Louvre museum tour", "Seine river cruise", "Louvre museum tour"])
+            self.assertEqual(vectors.shape, (3, 64))
+            self.assertAlmostEqual(float(np.linalg.norm(vectors[0])), 1.0, places=5)
+            self.assertEqual(service.embedding("Seine river cruise"), vectors[1].tolist())
+            self.assertEqual(len(VectorStore(os.path.join(self.tmp.name, "hashed-64"))), 2)
+
+            with self.assertRaises(RuntimeError):
+                service.chat_completion([{"role": "user", "content": "hi"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
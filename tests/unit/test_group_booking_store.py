@@ -0,0 +1,68 @@
+"""
+Unit tests for group booking storage and joins.
+"""
+
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system.group_booking_store import (
+    InMemoryGroupBookingStore, SupabaseGroupBookingStore, run_join_contention_benchmark,
+    JOINED, ALREADY_MEMBER, FULL, NOT_FOUND
+)
+
+
+class FakeRpcClient:
+    """Records RPC calls; any table access would mean a non-atomic write"""
+
+    def __init__(self):
+        self.calls = []
+
+    def rpc(self, name, params):
+        self.calls.append((name, params))
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=params.get("p_group_id")))
+
+    def table(self, name):
+        raise AssertionError(f"unexpected direct access to {name}")
+
+
+class TestGroupBookingStore(unittest.TestCase):
+    """Test capacity limits, duplicate joins and atomic group creation."""
+
+    def setUp(self):
+        self.store = InMemoryGroupBookingStore()
+        self.group_id = self.store.create_group("leader", "Lisbon", ("2030-06-01", "2030-06-08"), 3)
+
+    def test_joins_stop_at_capacity(self):
+        self.assertEqual(self.store.join(self.group_id, "ana"), JOINED)
+        self.assertEqual(self.store.join(self.group_id, "ben"), JOINED)
+        self.assertEqual(self.store.join(self.group_id, "cal"), FULL)  # the leader takes the first place
+        self.assertEqual(self.store.join("group_missing", "ana"), NOT_FOUND)
+        self.assertEqual(self.store.get_group(self.group_id)["participants"], ["leader", "ana", "ben"])
+
+        results = run_join_contention_benchmark(joiners=60, capacity=20, threads=16)
+        self.assertTrue(results["capacity_respected"])
+        self.assertEqual(results["participants"], 20)
+
+    def test_duplicate_joins_are_idempotent(self):
+        self.assertEqual(self.store.join(self.group_id, "leader"), ALREADY_MEMBER)
+        self.assertEqual(self.store.join(self.group_id, "ana"), JOINED)
+        self.assertEqual(self.store.join(self.group_id, "ana"), ALREADY_MEMBER)
+        self.assertEqual(len(self.store.get_group(self.group_id)["participants"]), 2)
+        self.assertTrue(self.store.is_member(self.group_id, "ana"))
+
+    def test_supabase_group_and_leader_are_created_in_one_call(self):
+        client = FakeRpcClient()
+        group_id = SupabaseGroupBookingStore(client).create_group("leader", "Lisbon", ("2030-06-01", "2030-06-08"), 4)
+        self.assertEqual(client.calls, [("create_group_booking", {
+            "p_group_id": group_id, "p_leader_id": "leader", "p_destination": "Lisbon",
+            "p_start_date": "2030-06-01", "p_end_date": "2030-06-08", "p_max_participants": 4
+        })])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Unit tests for the pending-hold expiry sweeper.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system.hold_expiry import HoldExpirySweeper, InMemoryHoldStore, run_expiry_benchmark
+
+
+class TestHoldExpiry(unittest.TestCase):
+    """Test startup loading, batched expiry and untracked bookings."""
+
+    def setUp(self):
+        self.store = InMemoryHoldStore()
+        for i in range(10):
+            self.store.add({"id": f"b{i}", "booking_type": "hotel", "item_id": "h1", "details": {},
+                            "status": "pending", "expires_at": 1000.0 + i})
+        self.store.add({"id": "paid", "booking_type": "hotel", "item_id": "h1", "details": {},
+                        "status": "confirmed", "expires_at": 1.0})
+        self.released = []
+        self.sweeper = HoldExpirySweeper(self.store, release=self.released.append, batch_size=3,
+                                         load_page_size=4, clock=lambda: 0.0)
+
+    def test_load_pages_through_pending_holds_only(self):
+        self.assertEqual(self.sweeper.load(), 10)
+        self.assertEqual(self.sweeper.pending_count(), 10)
+        self.assertEqual(self.sweeper.next_deadline(), 1000.0)
+
+    def test_sweep_expires_due_holds_in_batches(self):
+        self.sweeper.load()
+        self.assertEqual(self.sweeper.sweep(now=999.0), 0)
+        self.assertEqual(self.sweeper.sweep(now=1006.0), 7)
+        self.assertEqual(self.sweeper.stats["batches"], 3)
+        self.assertEqual(sorted(row["id"] for row in self.released), [f"b{i}" for i in range(7)])
+        self.assertEqual(self.store.rows["b6"]["status"], "expired")
+        self.assertEqual(self.store.rows["b7"]["status"], "pending")
+
+    def test_settled_bookings_are_not_expired_or_released(self):
+        self.sweeper.load()
+        self.sweeper.untrack("b0")  # paid through the app
+        self.store.rows["b1"]["status"] = "confirmed"  # confirmed by another replica
+        self.sweeper.track("b2", 2000.0)  # deadline moved
+        self.assertEqual(self.sweeper.sweep(now=1002.0), 0)
+        self.assertEqual(self.released, [])
+        self.assertEqual(self.sweeper.next_deadline(), 1003.0)
+
+    def test_sweep_cost_does_not_grow_with_table_size(self):
+        results = run_expiry_benchmark(table_sizes=(1000, 20000), pending=200, due=50)
+        self.assertEqual(results[1000]["released"], 50)
+        self.assertEqual(results[1000]["rows_read"], results[20000]["rows_read"])
+
+
+if __name__ == '__main__':
+    unittest.main()
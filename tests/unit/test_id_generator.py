@@ -0,0 +1,78 @@
+"""
+Unit tests for Snowflake/UUIDv7 ID generation.
+"""
+
+import unittest
+import sys
+import os
+import uuid
+from unittest.mock import patch
+from datetime import datetime, timezone
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.id_generator import (
+    IdGenerator, MAX_SEQUENCE, SEQUENCE_BITS, MAX_NODE_ID,
+    snowflake_time, parse_confirmation_code, run_id_benchmark
+)
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestIdGenerator(unittest.TestCase):
+    """Test ordering, uniqueness and confirmation code round-trips."""
+
+    def test_ids_increase_when_the_clock_stalls_or_steps_back(self):
+        clock = FakeClock(datetime(2025, 6, 1, tzinfo=timezone.utc).timestamp())
+        generator = IdGenerator(node_id=7, clock=clock)
+
+        ids = [generator.next_id() for _ in range(MAX_SEQUENCE + 10)]  # overflows one millisecond
+        clock.now -= 5  # NTP step backwards
+        ids += [generator.next_id() for _ in range(10)]
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids[0] >> SEQUENCE_BITS & MAX_NODE_ID, 7)
+        self.assertEqual(snowflake_time(ids[0]), datetime(2025, 6, 1, tzinfo=timezone.utc))
+
+    def test_booking_ids_are_sortable_uuid7(self):
+        generator = IdGenerator(node_id=3)
+        booking_ids = [generator.booking_id() for _ in range(1000)]
+        self.assertEqual(booking_ids, sorted(booking_ids))
+        self.assertEqual(uuid.UUID(booking_ids[0]).version, 7)
+
+    def test_confirmation_code_round_trip(self):
+        generator = IdGenerator(node_id=1)
+        code = generator.confirmation_code()
+        self.assertTrue(code.startswith("ATP"))
+        self.assertEqual(len(code), 18)
+
+        typed = code.lower().replace("0", "o").replace("1", "l")
+        snowflake = parse_confirmation_code(typed)
+        self.assertEqual(parse_confirmation_code(code), snowflake)
+        self.assertEqual(snowflake >> SEQUENCE_BITS & MAX_NODE_ID, 1)
+        with self.assertRaises(ValueError):
+            parse_confirmation_code("ATP-UUUU")
+
+    def test_codes_differ_when_two_processes_share_a_node(self):
+        clock = FakeClock(datetime(2025, 6, 1, tzinfo=timezone.utc).timestamp())
+        first, second = IdGenerator(node_id=5, clock=clock), IdGenerator(node_id=5, clock=clock)
+        with patch("src.core.id_generator.secrets.randbits", side_effect=[0, 1023]):
+            codes = [first.confirmation_code(), second.confirmation_code()]
+        self.assertEqual(parse_confirmation_code(codes[0]), parse_confirmation_code(codes[1]))  # same Snowflake
+        self.assertEqual([code[-2:] for code in codes], ["00", "ZZ"])
+
+    def test_concurrent_generation_is_unique(self):
+        result = run_id_benchmark(count=40_000, threads=4)
+        self.assertEqual(result["ids"], 40_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the date-indexed inventory engine.
+"""
+
+import unittest
+import sys
+import os
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system.inventory import (
+    InMemoryInventory, SupabaseInventory, HORIZON_DAYS, inventory_request, run_inventory_contention_benchmark
+)
+
+
+class FakeRpcClient:
+    """Records RPC calls; a table upsert would overwrite the held units"""
+
+    def __init__(self):
+        self.calls = []
+
+    def rpc(self, name, params):
+        self.calls.append((name, params))
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=None))
+
+    def table(self, name):
+        raise AssertionError(f"unexpected direct access to {name}")
+
+
+class TestInventory(unittest.TestCase):
+    """Test range checks, all-or-nothing holds and releases."""
+
+    def setUp(self):
+        self.today = date(2025, 7, 1)
+        self.inventory = InMemoryInventory(horizon_start=self.today, horizon_days=60)
+        self.inventory.set_capacity("hotel", "h1", 2, self.today, self.today + timedelta(days=30))
+
+    def day(self, offset):
+        return self.today + timedelta(days=offset)
+
+    def test_hold_is_all_or_nothing_across_the_stay(self):
+        self.assertTrue(self.inventory.hold("hotel", "h1", self.day(3), self.day(4), 2))  # night 3 sold out
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(1), self.day(6)), 0)
+
+        self.assertFalse(self.inventory.hold("hotel", "h1", self.day(1), self.day(6)))
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(1), self.day(3)), 2)  # untouched
+
+        self.inventory.release("hotel", "h1", self.day(3), self.day(4), 2)
+        self.inventory.release("hotel", "h1", self.day(3), self.day(4), 5)  # capped at capacity
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(1), self.day(6)), 2)
+
+    def test_untracked_items_and_days_are_unlimited(self):
+        self.assertIsNone(self.inventory.available("hotel", "other", self.day(1), self.day(2)))
+        self.assertTrue(self.inventory.hold("hotel", "other", self.day(1), self.day(2), 100))
+        self.assertIsNone(self.inventory.available("hotel", "h1", self.day(40), self.day(45)))
+
+        # Enabling capacity later keeps existing holds
+        self.inventory.hold("hotel", "h1", self.day(5), self.day(6))
+        self.inventory.set_capacity("hotel", "h1", 3, self.day(5), self.day(6))
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(5), self.day(6)), 2)
+
+    def test_set_capacity_after_a_hold_keeps_the_held_units(self):
+        self.assertTrue(self.inventory.hold("hotel", "h1", self.day(10), self.day(12)))
+        self.inventory.set_capacity("hotel", "h1", 5, self.day(0), self.day(30))
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(10), self.day(12)), 4)
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(0), self.day(10)), 5)
+
+        self.inventory.set_capacity("hotel", "h1", 0, self.day(10), self.day(11))  # fewer than held
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(10), self.day(11)), 0)
+        self.inventory.set_capacity("hotel", "h1", 3)  # whole horizon
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(11), self.day(12)), 2)
+        self.assertEqual(self.inventory.available("hotel", "h1", self.day(40), self.day(45)), 3)
+
+    def test_supabase_capacity_changes_go_through_the_rpc(self):
+        client = FakeRpcClient()
+        store = SupabaseInventory(client)
+        store.set_capacity("hotel", 7, 5, self.day(1), self.day(3))
+        store.set_capacity("hotel", 7, 5)
+        self.assertEqual(client.calls[0], ("set_inventory_capacity", {
+            "p_item_type": "hotel", "p_item_id": "7", "p_capacity": 5,
+            "p_start": "2025-07-02", "p_end": "2025-07-04"
+        }))
+        horizon = client.calls[1][1]
+        self.assertEqual(date.fromisoformat(horizon["p_end"]) - date.fromisoformat(horizon["p_start"]),
+                         timedelta(days=HORIZON_DAYS))
+
+    def test_inventory_request_from_booking_details(self):
+        self.assertEqual(inventory_request("hotel", {"check_in": "2025-07-02", "check_out": "2025-07-05"}),
+                         (self.day(1), self.day(4), 1))
+        self.assertEqual(inventory_request("restaurant", {"date_time": "2025-07-02 19:30", "party_size": 4}),
+                         (self.day(1), self.day(2), 4))
+        self.assertIsNone(inventory_request("package", {}))
+
+    def test_concurrent_bookers_never_oversell(self):
+        results = run_inventory_contention_benchmark(bookers=400, rooms=20, threads=16)
+        self.assertFalse(results["oversold"])
+        self.assertTrue(results["consistent"])
+        self.assertGreater(results["granted"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
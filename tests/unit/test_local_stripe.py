@@ -0,0 +1,99 @@
+"""
+Unit tests for the local Stripe stand-in server.
+"""
+
+import unittest
+import sys
+import os
+import json
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.api_integration.stripe.local_stripe import (
+    STRIPE_AVAILABLE, LocalStripeServer, parse_form, run_payment_load_test
+)
+from src.services.stripe_webhooks import WebhookInbox, WebhookReceiver
+
+
+class TestLocalStripe(unittest.TestCase):
+    """Test the Stripe wire format, idempotency, errors and webhooks."""
+
+    def setUp(self):
+        self.inbox = WebhookInbox(db_path=":memory:")
+        self.receiver = WebhookReceiver(self.inbox, "whsec_local").start()
+        self.server = LocalStripeServer(webhook_url=self.receiver.url).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.receiver.stop()
+        self.inbox.close()
+
+    def call(self, method, path, params=None, key=None):
+        data = urllib.parse.urlencode(params or {}).encode()
+        url = self.server.url + path + (f"?{data.decode()}" if method == "GET" and params else "")
+        request = urllib.request.Request(url, data=data if method == "POST" else None, method=method,
+                                         headers={"Authorization": "Bearer sk_test_local",
+                                                  **({"Idempotency-Key": key} if key else {})})
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_parse_form_nesting(self):
+        self.assertEqual(parse_form("metadata[booking_id]=b1&payment_method_types[0]=card&created[gte]=5"),
+                         {"metadata": {"booking_id": "b1"}, "payment_method_types": ["card"], "created": {"gte": "5"}})
+
+    def test_payment_intents_idempotency_and_declines(self):
+        params = {"amount": 5000, "currency": "usd", "metadata[booking_id]": "b1"}
+        status, first = self.call("POST", "/v1/payment_intents", params, key="booking:b1:payment_intent")
+        self.assertEqual(status, 200)
+        _, again = self.call("POST", "/v1/payment_intents", params, key="booking:b1:payment_intent")
+        self.assertEqual(again["id"], first["id"])
+        status, error = self.call("POST", "/v1/payment_intents", {**params, "amount": 6000}, key="booking:b1:payment_intent")
+        self.assertEqual((status, error["error"]["type"]), (400, "idempotency_error"))
+
+        status, error = self.call("POST", f"/v1/payment_intents/{first['id']}/confirm",
+                                  {"payment_method": "pm_card_chargeDeclined"})
+        self.assertEqual((status, error["error"]["code"]), (402, "card_declined"))
+        status, intent = self.call("POST", f"/v1/payment_intents/{first['id']}/confirm", {"payment_method": "pm_card_visa"})
+        self.assertEqual((status, intent["status"]), (200, "succeeded"))
+
+        status, refund = self.call("POST", "/v1/refunds", {"payment_intent": first["id"], "amount": 2000})
+        self.assertEqual((status, refund["amount"]), (200, 2000))
+        status, _ = self.call("POST", "/v1/refunds", {"payment_intent": first["id"], "amount": 4000})
+        self.assertEqual(status, 400)
+
+        deadline = time.time() + 5
+        while self.server.stats["webhooks_sent"] < 4 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.receiver.rejected, 0)
+        self.assertEqual(self.inbox.get_stats()["pending"], self.server.stats["webhooks_sent"])
+
+    def test_list_pagination_and_injected_failures(self):
+        for i in range(5):
+            self.call("POST", "/v1/customers", {"email": f"u{i}@example.com"})
+        _, page = self.call("GET", "/v1/customers", {"limit": 3, "created[gte]": int(time.time()) - 60})
+        self.assertTrue(page["has_more"])
+        _, rest = self.call("GET", "/v1/customers", {"limit": 3, "starting_after": page["data"][-1]["id"]})
+        self.assertEqual(len(page["data"]) + len(rest["data"]), 5)
+        self.assertEqual(self.call("GET", "/v1/customers/cus_missing")[0], 404)
+
+        self.server.failure_rate = 1.0
+        self.assertEqual(self.call("POST", "/v1/customers", {"email": "x@example.com"})[0], 500)
+        self.assertEqual(len(self.server.objects["customer"]), 5)  # injected errors have no side effects
+
+    @unittest.skipUnless(STRIPE_AVAILABLE, "stripe package not installed")
+    def test_load_harness_through_stripe_service(self):
+        report = run_payment_load_test(flows=20, concurrency=4, latency=0.0, jitter=0.0, failure_rate=0.1,
+                                       decline_rate=0.0)
+        self.assertEqual(report["outcomes"], {"succeeded": 20})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the SQL splitter and versioned migration runner.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.migration_runner import (
+    MigrationRunner, Migration, split_sql_statements, SCHEMA_FILE
+)
+
+
+class FakeClient:
+    """Records exec_sql calls and serves the schema_migrations table"""
+
+    def __init__(self, applied=None, error=None):
+        self.calls = []
+        self.applied = applied or []
+        self.error = error
+        self.lock = threading.Lock()
+
+    def rpc(self, name, params):
+        client = self
+
+        class Call:
+            def execute(self):
+                with client.lock:
+                    client.calls.append(params["sql"])
+        return Call()
+
+    def table(self, name):
+        rows, error = self.applied, self.error
+
+        class Query:
+            def select(self, columns):
+                return self
+
+            def execute(self):
+                if error:
+                    raise error
+                return SimpleNamespace(data=rows)
+        return Query()
+
+
+class TestSplitSqlStatements(unittest.TestCase):
+    """Test statement splitting."""
+
+    def test_dollar_quoted_bodies_stay_whole(self):
+        """Semicolons inside $$ bodies, strings and comments do not split."""
+        sql = """
+        -- comment; with semicolon
+        CREATE TABLE a (id INT, note TEXT DEFAULT 'x;y');
+        CREATE FUNCTION f() RETURNS void AS $$ BEGIN PERFORM 1; PERFORM 2; END; $$ LANGUAGE plpgsql;
+        /* block; comment */ DO $body$ BEGIN RAISE NOTICE 'it''s; fine'; END $body$;
+        """
+        statements = split_sql_statements(sql)
+        self.assertEqual(len(statements), 3)
+        self.assertIn("PERFORM 2; END; $$ LANGUAGE plpgsql", statements[1])
+        self.assertTrue(statements[2].startswith("DO $body$"))
+
+    def test_schema_functions_are_complete(self):
+        """Every function in the shipped schema keeps its body."""
+        statements = split_sql_statements(SCHEMA_FILE.read_text(encoding="utf-8"))
+        functions = [s for s in statements if "FUNCTION" in s and "$$" in s]
+        self.assertTrue(functions)
+        for statement in functions:
+            self.assertEqual(statement.count("$$"), 2)
+
+
+class TestMigrationRunner(unittest.TestCase):
+    """Test batching and version tracking."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = Path(self.tmp.name) / "0002_add_reviews.sql"
+        path.write_text(
+            "CREATE TABLE reviews (id INT);\n"
+            "CREATE UNIQUE INDEX idx_reviews_id ON reviews(id);\n"
+            + "".join(f"CREATE INDEX idx_reviews_{i} ON reviews(id);\n" for i in range(6))
+            + "INSERT INTO reviews VALUES (1) ON CONFLICT (id) DO NOTHING;\n"
+        )
+        self.migration = Migration("0002_add_reviews", path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pending_migration_is_batched(self):
+        """Ordered statements go in one batch; plain indexes run in parallel groups."""
+        client = FakeClient()
+        results = MigrationRunner(client, index_workers=3, log=lambda *a: None).run([self.migration])
+        self.assertEqual(results[0].status, "applied")
+        self.assertEqual(results[0].statements, 9)
+        # version table + 1 batch + 3 index groups + version record
+        self.assertEqual(len(client.calls), 6)
+        self.assertIn("CREATE UNIQUE INDEX", client.calls[1])
+        self.assertIn("INSERT INTO schema_migrations", client.calls[-1])
+
+    def test_applied_migration_is_skipped(self):
+        """A recorded migration with the same checksum does not run again."""
+        client = FakeClient(applied=[{"version": "0002_add_reviews", "checksum": self.migration.checksum}])
+        results = MigrationRunner(client, log=lambda *a: None).run([self.migration])
+        self.assertEqual(results[0].status, "skipped")
+        self.assertEqual(len(client.calls), 1)  # only the version table check
+
+    def test_only_a_fresh_version_table_counts_as_empty(self):
+        """A not-yet-cached new table means nothing applied; other errors stop the run."""
+        missing = RuntimeError("{'code': 'PGRST205', 'message': \"Could not find the table "
+                               "'public.schema_migrations' in the schema cache\"}")
+        runner = MigrationRunner(FakeClient(error=missing), log=lambda *a: None)
+        with self.assertRaises(RuntimeError):
+            runner.applied_versions()  # the runner did not create the table
+        self.assertEqual(runner.run([self.migration])[0].status, "applied")
+
+        denied = RuntimeError("{'code': 'PGRST301', 'message': 'JWT expired'}")
+        with self.assertRaises(RuntimeError):
+            MigrationRunner(FakeClient(error=denied), log=lambda *a: None).run([self.migration])
+
+
+if __name__ == '__main__':
+    unittest.main()
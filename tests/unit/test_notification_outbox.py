@@ -0,0 +1,132 @@
+"""
+Unit tests for the coalescing notification outbox.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.notification_outbox import (
+    NotificationOutbox, OutboxDispatcher, HTTPTransport, LocalNotificationSink
+)
+
+
+class RecordingTransport:
+    """Transport that records batches and can fail a number of times first."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.batches = []
+
+    def send_batch(self, messages):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("provider unavailable")
+        self.batches.append(messages)
+        return {m.message_id: None for m in messages}
+
+
+class TestNotificationOutbox(unittest.TestCase):
+    """Test enqueueing, coalescing and delivery."""
+
+    def setUp(self):
+        self.outbox = NotificationOutbox(db_path=":memory:", digest_window=0)
+
+    def tearDown(self):
+        self.outbox.close()
+
+    def test_price_moves_coalesce_into_one_digest(self):
+        """Several moves on the same item produce a single pending message."""
+        first = self.outbox.enqueue_price_move("a@example.com", "hotel", "h1", 100.0, 95.0)
+        second = self.outbox.enqueue_price_move("a@example.com", "hotel", "h1", 95.0, 90.0)
+        other = self.outbox.enqueue_price_move("a@example.com", "flight", "f1", 300.0, 310.0)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+        batch = self.outbox.claim_batch(10)
+        digest = next(m for m in batch if m.message_id == first)
+        self.assertIn("2 price moves", digest.body)
+        self.assertIn("$100.00", digest.body)
+        self.assertIn("$90.00", digest.body)
+
+    def test_digest_waits_for_window(self):
+        """Coalesced alerts are not claimable until the digest window closes."""
+        outbox = NotificationOutbox(db_path=":memory:", digest_window=60)
+        outbox.enqueue_price_move("a@example.com", "hotel", "h1", 100.0, 95.0)
+        self.assertEqual(outbox.claim_batch(10), [])
+        outbox.close()
+
+    def test_failed_delivery_is_retried_with_backoff(self):
+        """A transport failure reschedules the message instead of dropping it."""
+        transport = RecordingTransport(failures=1)
+        dispatcher = OutboxDispatcher(self.outbox, {"email": transport}, base_backoff=0)
+        self.outbox.enqueue("email", "b@example.com", "subject", "body")
+
+        dispatcher.run_once()
+        stats = self.outbox.get_stats()
+        self.assertEqual(stats["pending"], 1)
+        self.assertEqual(stats["sent"], 0)
+
+        dispatcher.run_once()
+        self.assertEqual(self.outbox.get_stats()["sent"], 1)
+
+    def test_gives_up_after_max_attempts(self):
+        """Messages are marked failed once max_attempts is reached."""
+        dispatcher = OutboxDispatcher(self.outbox, {}, max_attempts=1)
+        self.outbox.enqueue("sms", "+15550100", "subject", "body")
+        dispatcher.run_once()
+        self.assertEqual(self.outbox.get_stats()["failed"], 1)
+
+    def test_starting_a_dispatcher_leaves_live_claims_alone(self):
+        """Only claims older than the lease are taken back from another process's dispatcher."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "outbox.db")
+            app, tracker = NotificationOutbox(db_path=path), NotificationOutbox(db_path=path)
+            try:
+                app.enqueue("email", "d@example.com", "subject", "body")
+                self.assertEqual(len(app.claim_batch(10)), 1)  # the app's worker is sending it
+
+                dispatcher = OutboxDispatcher(tracker, {"email": RecordingTransport()}, lease=60)
+                dispatcher.start()
+                dispatcher.stop()
+                self.assertEqual(tracker.get_stats()["sending"], 1)
+
+                self.assertEqual(tracker.recover_in_flight(lease=0), 1)  # the claim has lapsed
+                self.assertEqual(len(tracker.claim_batch(10)), 1)
+            finally:
+                app.close()
+                tracker.close()
+
+    def test_booking_notice_queues_email_and_sms(self):
+        """Bookings with email and phone queue one message per channel."""
+        booking = {
+            "confirmation_number": "ABC12345",
+            "booking_type": "hotel",
+            "total_amount": 250.0,
+            "customer_details": {"email": "c@example.com", "phone": "+15550101"}
+        }
+        ids = self.outbox.enqueue_booking_notice(booking)
+        self.assertEqual(len(ids), 2)
+
+    def test_http_transport_against_local_sink(self):
+        """Batches are delivered to the local HTTP stand-in in one request."""
+        sink = LocalNotificationSink().start()
+        try:
+            dispatcher = OutboxDispatcher(self.outbox, {"email": HTTPTransport(sink.url)}, batch_size=20)
+            for i in range(5):
+                self.outbox.enqueue("email", f"user{i}@example.com", "subject", "body")
+            dispatcher.run_once()
+            self.assertEqual(sink.received, 5)
+            self.assertEqual(sink.requests, 1)
+            self.assertEqual(self.outbox.get_stats()["sent"], 5)
+        finally:
+            sink.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Unit tests for the compact package model.
+"""
+
+import unittest
+import pickle
+import sys
+import os
+from collections.abc import Mapping
+from datetime import datetime
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.package_model import Record, compact, expand, synthetic_package
+
+
+class TestPackageModel(unittest.TestCase):
+    """Test that compact packages read like the dicts they replace."""
+
+    def test_record_reads_like_dict(self):
+        package = synthetic_package(7, seed=1)
+        record = compact(package)
+
+        self.assertIsInstance(record, Mapping)
+        self.assertEqual(record['pricing']['total_cost'], package['pricing']['total_cost'])
+        self.assertEqual(record.get('missing', 'default'), 'default')
+        self.assertIn('daily_itinerary', record)
+        self.assertEqual(list(record), list(package))
+        self.assertEqual(len(record), len(package))
+        self.assertEqual(record['daily_itinerary'][2]['meals']['lunch']['type'], 'lunch')
+        self.assertIsInstance(record['created_at'], datetime)
+        self.assertEqual(record['created_at'], package['created_at'])
+        self.assertEqual(record, package)
+        self.assertEqual(expand(record), package)
+
+    def test_equal_sections_are_stored_once(self):
+        first, second = compact([synthetic_package(7, seed=1), synthetic_package(7, seed=1)])
+        self.assertIs(first['pricing'], second['pricing'])
+        self.assertIs(first['daily_itinerary'], second['daily_itinerary'])
+
+        booking = compact({"booking_id": "PKG_1", "activities": first['activities']})
+        self.assertIs(booking['activities'], first['activities'])
+
+    def test_pickle_round_trip(self):
+        record = compact(synthetic_package(7, seed=2))
+        restored = pickle.loads(pickle.dumps(record))
+        self.assertIsInstance(restored, Record)
+        self.assertEqual(restored, record)
+        self.assertEqual(restored['created_at'], record['created_at'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for lazy page loading in the Streamlit page registry.
+"""
+
+import unittest
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.ui.page_registry import PAGES, Page, PageRegistry
+
+PAGE_SOURCE = '''
+IMPORTS = globals().get("IMPORTS", 0) + 1
+RENDERED = []
+
+def {entry}():
+    RENDERED.append("{key}")
+'''
+
+
+class TestPageRegistry(unittest.TestCase):
+    """Test lookup, first-use imports and timing stats."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self.tmp.name)
+        self.pages = []
+        for key in ("home", "reports"):
+            module = f"registry_test_{key}_page"
+            Path(self.tmp.name, f"{module}.py").write_text(PAGE_SOURCE.format(entry=f"{key}_page", key=key))
+            self.pages.append(Page(f"📄 {key.title()}", key, module, f"{key}_page"))
+        self.registry = PageRegistry(self.pages, rerun_window=2)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for page in self.pages:
+            sys.modules.pop(page.module, None)
+        self.tmp.cleanup()
+
+    def test_pages_are_imported_on_first_use_only(self):
+        self.assertEqual(self.registry.labels, {"📄 Home": "home", "📄 Reports": "reports"})
+        self.assertEqual(self.registry.stats()["loaded"], [])
+
+        render = self.registry.load("home")
+        module = sys.modules["registry_test_home_page"]
+        self.assertIs(render, module.home_page)
+        self.assertNotIn("registry_test_reports_page", sys.modules)
+        self.assertIs(self.registry.load("home"), render)  # reused from sys.modules, not re-imported
+        self.assertEqual(module.IMPORTS, 1)
+        self.assertEqual(list(self.registry.import_ms), ["home"])
+
+        self.registry.render("reports")
+        self.assertEqual(sys.modules["registry_test_reports_page"].RENDERED, ["reports"])
+        self.assertEqual(self.registry.stats()["loaded"], ["home", "reports"])
+        with self.assertRaises(KeyError):
+            self.registry.load("missing")
+
+    def test_rerun_window_and_render_timings(self):
+        for key in ("home", "home", "reports"):
+            started = time.perf_counter()
+            self.registry.render(key)
+            self.registry.record_rerun(key, started)
+        stats = self.registry.stats()
+        self.assertEqual(stats["reruns"], 2)  # bounded by rerun_window
+        self.assertEqual(set(stats["render_ms"]), {"home", "reports"})
+        self.assertGreaterEqual(stats["avg_rerun_ms"], 0.0)
+
+    def test_app_pages_point_at_existing_modules(self):
+        keys = [page.key for page in PAGES]
+        self.assertEqual(len(keys), len(set(keys)))
+        root = Path(__file__).resolve().parents[2]
+        for page in PAGES:
+            source = (root / (page.module.replace(".", "/") + ".py")).read_text(encoding="utf-8")
+            self.assertIn(f"def {page.entry}(", source)
+
+
+if __name__ == '__main__':
+    unittest.main()
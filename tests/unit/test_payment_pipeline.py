@@ -0,0 +1,109 @@
+"""
+Unit tests for the idempotent payment pipeline.
+"""
+
+import unittest
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system.payment_pipeline import (
+    InMemoryPaymentStateStore, PaymentPipeline, RetryPolicy, idempotency_key
+)
+
+
+class FakeStripeService:
+    """StripeService stand-in that dedupes on idempotency keys like Stripe does"""
+
+    def __init__(self, failures=None, confirm_status="succeeded", stall=0.0):
+        self.failures = dict(failures or {})  # step -> errors to return before succeeding
+        self.confirm_status = confirm_status
+        self.stall = stall
+        self.calls = []
+        self.objects = {}
+
+    def _respond(self, step, key, build):
+        self.calls.append((step, key))
+        if self.failures.get(step):
+            error_type = self.failures[step].pop(0)
+            if error_type == "stall":
+                time.sleep(self.stall)
+            else:
+                return {"success": False, "error": error_type, "error_type": error_type}
+        if key not in self.objects:
+            self.objects[key] = build()
+        return self.objects[key]
+
+    def create_customer(self, email, name, phone=None, metadata=None, idempotency_key=None):
+        return self._respond("customer", idempotency_key, lambda: {
+            "success": True, "customer_id": f"cus_{len(self.objects)}"})
+
+    def create_payment_intent(self, amount, currency, customer_id=None, payment_method_types=None,
+                              metadata=None, idempotency_key=None):
+        return self._respond("payment_intent", idempotency_key, lambda: {
+            "success": True, "payment_intent": SimpleNamespace(id=f"pi_{len(self.objects)}", status="requires_confirmation")})
+
+    def confirm_payment(self, payment_intent_id, payment_method=None, idempotency_key=None):
+        return self._respond("confirm", idempotency_key, lambda: {
+            "success": True, "payment_intent": SimpleNamespace(id=payment_intent_id, status=self.confirm_status)})
+
+    def retrieve_payment_intent(self, payment_intent_id):
+        return {"success": True, "payment_intent": SimpleNamespace(id=payment_intent_id, status=self.confirm_status)}
+
+
+class TestPaymentPipeline(unittest.TestCase):
+    """Test retries, resumption from persisted steps and declines."""
+
+    def setUp(self):
+        self.booking = {"id": "b1", "confirmation_number": "ATP1", "total_amount": 120.5, "currency": "USD"}
+        self.customer = {"email": "a@example.com", "name": "A"}
+        self.store = InMemoryPaymentStateStore()
+        self.sleeps = []
+
+    def pipeline(self, service, **policy):
+        return PaymentPipeline(service, self.store, policy=RetryPolicy(**policy), sleep=self.sleeps.append)
+
+    def test_transient_errors_are_retried_with_the_same_key(self):
+        service = FakeStripeService(failures={"payment_intent": ["APIConnectionError", "RateLimitError"]})
+        outcome = self.pipeline(service).run(self.booking, "pm_card", self.customer)
+
+        self.assertTrue(outcome.succeeded)
+        keys = [key for step, key in service.calls if step == "payment_intent"]
+        self.assertEqual(keys, [idempotency_key("b1", "payment_intent")] * 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertLessEqual(self.sleeps[0], 0.25 * 1.5)
+        self.assertEqual(self.store.load("b1")["payment_intent"]["attempts"], 3)
+
+    def test_rerun_resumes_after_finished_steps(self):
+        service = FakeStripeService(failures={"confirm": ["APIError"] * 2})
+        first = self.pipeline(service, attempts=2).run(self.booking, "pm_card", self.customer)
+        self.assertTrue(first.retryable)
+
+        second = self.pipeline(service).run(self.booking, "pm_card", self.customer)
+        self.assertTrue(second.succeeded)
+        self.assertEqual(second.payment_intent_id, first.payment_intent_id)
+        self.assertEqual([step for step, _ in service.calls].count("customer"), 1)
+        self.assertEqual([step for step, _ in service.calls].count("payment_intent"), 1)
+
+    def test_declines_are_final_and_stalls_hit_the_deadline(self):
+        service = FakeStripeService(failures={"confirm": ["CardError"]})
+        outcome = self.pipeline(service).run(self.booking, "pm_declined", self.customer)
+        self.assertEqual(outcome.status, "declined")
+        self.assertEqual(len([step for step, _ in service.calls if step == "confirm"]), 1)
+
+        # A new card gets a new confirmation key; a stalled call is abandoned after its deadline
+        service = FakeStripeService(failures={"customer": ["stall"]}, stall=0.5)
+        pipeline = PaymentPipeline(service, InMemoryPaymentStateStore(), deadlines={"customer": 0.05},
+                                   sleep=self.sleeps.append)
+        start = time.monotonic()
+        outcome = pipeline.run(self.booking, "pm_other", self.customer)
+        self.assertTrue(outcome.succeeded)
+        self.assertLess(time.monotonic() - start, 0.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
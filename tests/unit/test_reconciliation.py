@@ -0,0 +1,78 @@
+"""
+Unit tests for bulk payment reconciliation.
+"""
+
+import unittest
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system.reconciliation import (
+    InMemoryBookingSource, InMemoryPaymentSource, PaymentReconciler, run_reconciliation_benchmark
+)
+from src.services.stripe_webhooks import InMemoryBookingStatusStore
+
+
+class TestReconciliation(unittest.TestCase):
+    """Test the payment/booking join, discrepancy kinds and bulk fixes."""
+
+    def setUp(self):
+        self.end = datetime(2030, 1, 2, tzinfo=timezone.utc)
+        self.start = self.end - timedelta(days=1)
+        self.bookings, self.intents = {}, []
+
+    def add(self, status, payment_status="pending", intent_status=None, amount=100.0, hours_before_start=-1):
+        booking_id = str(uuid.uuid4())
+        created = self.start - timedelta(hours=hours_before_start)
+        self.bookings[booking_id] = {"id": booking_id, "status": status, "payment_status": payment_status,
+                                     "total_amount": amount, "currency": "USD", "created_at": created.isoformat()}
+        if intent_status:
+            self.intents.append({"id": f"pi_{len(self.intents)}", "status": intent_status, "amount": 10000,
+                                 "currency": "usd", "created": int(created.timestamp()) + 1800,
+                                 "metadata": {"booking_id": booking_id}})
+        return booking_id
+
+    def test_discrepancies_and_fixes(self):
+        ok = self.add("confirmed", "paid", "succeeded")
+        pending = self.add("pending", intent_status="succeeded")
+        stale = self.add("confirmed", "pending", "succeeded")
+        expired = self.add("expired", intent_status="succeeded")
+        unpaid = self.add("confirmed", "paid", "requires_payment_method")
+        wrong_amount = self.add("confirmed", "paid", "succeeded", amount=120.0)
+        earlier = self.add("pending", intent_status="succeeded", hours_before_start=0.25)  # booked before the range
+        self.intents.append({"id": "pi_orphan", "status": "succeeded", "amount": 500, "currency": "usd",
+                             "created": int(self.start.timestamp()) + 60, "metadata": {"booking_id": str(uuid.uuid4())}})
+        self.intents.append({"id": "pi_checkout", "status": "succeeded", "amount": 500, "currency": "usd",
+                             "created": int(self.start.timestamp()) + 60, "metadata": {"booking_id": "BOOK_1"}})
+
+        store = InMemoryBookingStatusStore(self.bookings)
+        reconciler = PaymentReconciler(InMemoryPaymentSource(self.intents), InMemoryBookingSource(self.bookings), store)
+        report = reconciler.run(self.start, self.end, apply=True)
+
+        kinds = {d.booking_id: d.kind for d in report.discrepancies}
+        self.assertNotIn(ok, kinds)
+        self.assertEqual(kinds[pending], "paid_but_pending")
+        self.assertEqual(kinds[earlier], "paid_but_pending")
+        self.assertEqual(kinds[stale], "payment_status_stale")
+        self.assertEqual(kinds[expired], "paid_but_expired")
+        self.assertEqual(kinds[unpaid], "confirmed_without_payment")
+        self.assertEqual(kinds[wrong_amount], "amount_mismatch")
+        self.assertIn("payment_without_booking", kinds.values())
+        self.assertEqual(report.untracked, 1)
+        self.assertEqual(report.fixed, {"paid_but_pending": 2, "payment_status_stale": 1})
+        self.assertEqual(self.bookings[pending]["status"], "confirmed")
+        self.assertEqual(self.bookings[expired]["status"], "expired")
+
+    def test_list_calls_scale_with_pages_not_bookings(self):
+        report = run_reconciliation_benchmark(num_bookings=1000)
+        self.assertLess(report.list_calls, 40)
+        self.assertEqual(report.bookings, 1000)
+        self.assertEqual(report.counts().get("paid_but_pending"), report.fixed.get("paid_but_pending"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for the refund batch processor used by mass cancellations.
+"""
+
+import unittest
+import sys
+import os
+import time
+import threading
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system.payment_pipeline import RetryPolicy
+from src.booking_system.refund_batch import (
+    InMemoryRefundSource, RefundBatchProcessor, RefundCriteria, TokenBucket
+)
+from src.services.stripe_webhooks import InMemoryBookingStatusStore
+
+
+class FakeRefundService:
+    """Refunds keyed by idempotency key, with scripted transient failures"""
+
+    def __init__(self, amounts, flaky=()):
+        self.amounts = amounts
+        self.flaky = set(flaky)
+        self.refunds = {}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create_refund(self, payment_intent_id, amount=None, reason=None, metadata=None, idempotency_key=None):
+        with self._lock:
+            self.calls += 1
+            if payment_intent_id in self.flaky:
+                self.flaky.discard(payment_intent_id)
+                return {"success": False, "error": "Rate limited", "error_type": "RateLimitError"}
+            if payment_intent_id == "pi_disputed":
+                return {"success": False, "error": "Charge is disputed", "error_type": "InvalidRequestError"}
+            if idempotency_key not in self.refunds:
+                self.refunds[idempotency_key] = {"id": f"re_{len(self.refunds)}",
+                                                 "amount": amount or self.amounts[payment_intent_id]}
+            refund = self.refunds[idempotency_key]
+            return {"success": True, "refund": refund, "refund_id": refund["id"]}
+
+
+class TestRefundBatch(unittest.TestCase):
+    """Test selection, idempotent refunds, retries and bulk status updates."""
+
+    def setUp(self):
+        self.bookings, self.intents, self.amounts = {}, {}, {}
+        for i in range(25):
+            booking_id = f"00000000-0000-4000-8000-{i:012d}"
+            self.bookings[booking_id] = {"id": booking_id, "booking_type": "flight", "item_id": "FL1",
+                                         "status": "confirmed", "payment_status": "paid",
+                                         "details": {"destination": "Paris"}}
+            self.intents[booking_id] = f"pi_{i}"
+            self.amounts[f"pi_{i}"] = 1000 + i
+        # Not affected: another flight, a pending booking and a confirmed booking without a payment
+        self.bookings["other"] = dict(self.bookings[booking_id], id="other", item_id="FL2")
+        self.bookings["zz-pending"] = dict(self.bookings[booking_id], id="zz-pending", status="pending")
+        self.bookings["zz-unpaid"] = dict(self.bookings[booking_id], id="zz-unpaid")
+        self.intents["zz-pending"] = "pi_pending"
+
+    def processor(self, service, **kwargs):
+        self.store = InMemoryBookingStatusStore(self.bookings)
+        self.reports = []
+        options = dict(concurrency=4, rate=1000, page_size=10, policy=RetryPolicy(base_backoff=0.001),
+                       on_progress=lambda progress: self.reports.append(progress.selected))
+        options.update(kwargs)
+        return RefundBatchProcessor(service, InMemoryRefundSource(self.bookings, self.intents), self.store, **options)
+
+    def test_refunds_and_cancels_affected_bookings(self):
+        service = FakeRefundService(self.amounts, flaky={"pi_3", "pi_7"})
+        cancelled = []
+        processor = self.processor(service, on_cancelled=cancelled.append)
+        progress = processor.run(RefundCriteria(booking_type="flight", item_id="FL1"), "Flight FL1 cancelled")
+
+        self.assertEqual(progress.selected, 26)
+        self.assertEqual((progress.refunded, progress.cancelled, progress.failed, progress.skipped), (25, 25, 0, 1))
+        self.assertEqual(progress.amount_refunded, sum(self.amounts.values()))
+        self.assertEqual(service.calls, 27)  # two retried after a rate limit
+        self.assertEqual(self.reports, [10, 20, 26])
+        self.assertEqual(self.store.update_calls, 3)  # one bulk update per page
+        self.assertEqual(len(cancelled), 25)
+        self.assertEqual(self.bookings["00000000-0000-4000-8000-000000000003"]["payment_status"], "refunded")
+        for untouched in ("other", "zz-pending", "zz-unpaid"):
+            self.assertNotEqual(self.bookings[untouched]["status"], "cancelled")
+
+    def test_rerun_after_interruption_does_not_refund_twice(self):
+        service = FakeRefundService(self.amounts)
+        self.intents["00000000-0000-4000-8000-000000000004"] = "pi_disputed"
+        processor = self.processor(service)
+        first = processor.run(RefundCriteria(destination="Paris"), "Destination closed")
+        self.assertEqual(first.failed, 1)
+        self.assertIn("disputed", first.errors["00000000-0000-4000-8000-000000000004"])
+
+        # Refunds issued but the status update was lost: put them back and run again
+        for booking in self.bookings.values():
+            if booking["status"] == "cancelled":
+                booking["status"] = "confirmed"
+        again = processor.run(RefundCriteria(destination="Paris"), "Destination closed")
+        self.assertEqual(again.refunded, 24)
+        self.assertEqual(len(service.refunds), 24)
+        self.assertEqual(self.bookings["00000000-0000-4000-8000-000000000004"]["status"], "confirmed")
+
+        # A partial refund with its own key is a separate refund
+        booking = self.bookings["00000000-0000-4000-8000-000000000000"]
+        result = processor.refund_booking(booking, "pi_0", "Booking modified", amount=2.5, key_suffix="modify-1")
+        self.assertEqual(result["amount"], 250)
+        self.assertEqual(len(service.refunds), 25)
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=200, burst=5)
+        started = time.monotonic()
+        for _ in range(25):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)  # 20 beyond the burst at 200/s
+
+
+if __name__ == '__main__':
+    unittest.main()
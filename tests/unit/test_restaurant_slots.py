@@ -0,0 +1,96 @@
+"""
+Unit tests for the restaurant slot engine.
+"""
+
+import unittest
+import sys
+import os
+from datetime import date, time, timedelta
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.booking_system import restaurant_slots
+from src.booking_system.restaurant_slots import InMemorySlotStore, Restaurant, RestaurantSlotEngine, SlotHold
+
+
+class ReplicaStore(InMemorySlotStore):
+    """Holds table shared with another replica: refuses holds while `remote` fills the restaurant"""
+
+    def __init__(self):
+        self.remote = []
+
+    def hold(self, restaurant, hold):
+        return not self.remote
+
+    def active_holds(self, day):
+        return list(self.remote)
+
+
+class TestRestaurantSlots(unittest.TestCase):
+    """Test city search windows, table sizing and holds."""
+
+    def setUp(self):
+        self.day = date(2030, 5, 10)
+        self.engine = RestaurantSlotEngine([
+            Restaurant(id="small", name="Small", city="Beirut", rating=4.9, tables={2: 1}),
+            Restaurant(id="large", name="Large", city="Beirut", rating=4.1, tables={4: 1, 8: 1}),
+            Restaurant(id="late", name="Late", city="Beirut", tables={4: 2}, hours=(time(21, 0), time(23, 59))),
+            Restaurant(id="elsewhere", name="Elsewhere", city="Paris", tables={4: 5})
+        ])
+
+    def test_search_respects_city_party_size_and_window(self):
+        results = self.engine.search("beirut", self.day, time(19, 0), 2, flex_minutes=60)
+        self.assertEqual([r.id for r, _ in results], ["small", "large"])  # same best time, higher rating first
+        self.assertEqual(results[0][1][:3], [time(19, 0), time(18, 30), time(19, 30)])
+
+        results = self.engine.search("Beirut", self.day, time(19, 0), 4, flex_minutes=120)
+        self.assertEqual([r.id for r, _ in results], ["large", "late"])
+        self.assertEqual(results[1][1], [time(21, 0)])
+
+        self.assertEqual(self.engine.search("Beirut", self.day, time(19, 0), 12), [])
+
+    def test_holds_fill_tables_for_the_whole_sitting(self):
+        first = self.engine.hold("large", self.day, time(19, 0), 3)
+        self.assertEqual(first.table_size, 4)
+        second = self.engine.hold("large", self.day, time(19, 30), 3)
+        self.assertEqual(second.table_size, 8)  # the 4-top is still seated
+        self.assertIsNone(self.engine.hold("large", self.day, time(20, 0), 2))
+        self.assertIsNotNone(self.engine.hold("large", self.day, time(20, 30), 2))  # first sitting is over
+
+        self.engine.release(second.hold_id)
+        times = dict((r.id, t) for r, t in self.engine.search("Beirut", self.day, time(19, 30), 6, flex_minutes=0))
+        self.assertEqual(times, {"large": [time(19, 30)]})
+
+    def test_lapsed_holds_and_remote_releases_free_tables(self):
+        now = [0.0]
+        engine = RestaurantSlotEngine([Restaurant(id="small", name="Small", city="Beirut", tables={2: 1})],
+                                      grid_ttl=30.0, clock=lambda: now[0])
+        abandoned = engine.hold("small", self.day, time(19, 0), 2)
+        self.assertIsNone(engine.hold("small", self.day, time(19, 0), 2))
+
+        # The hold lapses (never confirmed) and the grid is rebuilt once it is older than grid_ttl
+        abandoned.expires_at = restaurant_slots._utcnow() - timedelta(seconds=1)
+        now[0] = 31.0
+        kept = engine.hold("small", self.day, time(19, 0), 2)
+        self.assertIsNotNone(kept)
+        engine.confirm(kept.hold_id)
+        now[0] = 62.0
+        self.assertIsNone(engine.hold("small", self.day, time(19, 0), 2))  # confirmed holds never lapse
+
+        # Another replica holds the table: the refusal drops the stale grid, and its release shows up
+        # once the rebuilt grid ages out
+        store = ReplicaStore()
+        engine = RestaurantSlotEngine([Restaurant(id="small", name="Small", city="Beirut", tables={2: 1})], store,
+                                      grid_ttl=30.0, clock=lambda: now[0])
+        self.assertEqual(len(engine.search("Beirut", self.day, time(19, 0), 2)), 1)  # grid built, table free
+        store.remote = [SlotHold("remote", "small", self.day, 2, 38, 2)]
+        self.assertIsNone(engine.hold("small", self.day, time(19, 0), 2))
+        self.assertEqual(engine.search("Beirut", self.day, time(19, 0), 2, flex_minutes=0), [])
+        store.remote = []
+        now[0] = 93.0
+        self.assertIsNotNone(engine.hold("small", self.day, time(19, 0), 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for concurrent schema introspection and cached snapshots.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.schema_snapshot import SchemaIntrospector
+
+
+class FakeQuery:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.head = False
+
+    def select(self, columns, count=None, head=False):
+        self.head = head
+        return self
+
+    def limit(self, n):
+        return self
+
+    def execute(self):
+        with self.client.lock:
+            self.client.requests.append((self.name, self.head))
+        if self.name not in self.client.tables:
+            raise Exception(f'relation "{self.name}" does not exist')
+        rows = self.client.tables[self.name]
+        return SimpleNamespace(count=len(rows), data=[] if self.head else rows[:1])
+
+
+class FakeClient:
+    """Serves table counts; the OpenAPI document is unavailable"""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.requests = []
+        self.lock = threading.Lock()
+        self.postgrest = SimpleNamespace(session=SimpleNamespace(get=self._openapi))
+
+    def _openapi(self, path):
+        raise ConnectionError("openapi disabled")
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+class TestSchemaIntrospector(unittest.TestCase):
+    """Test count-only checks, caching and fingerprints."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = Path(self.tmp.name) / "snapshot.json"
+        self.client = FakeClient({"hotels": [{"id": 1, "name": "A"}] * 500, "restaurants": []})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_counts_use_head_requests(self):
+        """Counts come from HEAD requests; missing tables are reported."""
+        snapshot = SchemaIntrospector(self.client, cache_path=self.cache).snapshot(
+            ["hotels", "restaurants", "flights"])
+        self.assertEqual(snapshot.tables["hotels"].record_count, 500)
+        self.assertEqual(snapshot.tables["hotels"].columns, ["id", "name"])
+        self.assertIs(snapshot.tables["flights"].exists, False)
+        count_requests = [r for r in self.client.requests if r[1]]
+        self.assertEqual(len(count_requests), 3)
+
+    def test_snapshot_is_cached_on_disk(self):
+        """A second introspector reuses the cached snapshot without requests."""
+        first = SchemaIntrospector(self.client, cache_path=self.cache).snapshot(["hotels"])
+        sent = len(self.client.requests)
+        second = SchemaIntrospector(self.client, cache_path=self.cache).snapshot(["hotels"])
+        self.assertEqual(len(self.client.requests), sent)
+        self.assertEqual(first.fingerprint, second.fingerprint)
+
+    def test_fingerprint_ignores_counts(self):
+        """Row count changes keep the fingerprint; column changes do not."""
+        introspector = SchemaIntrospector(self.client, cache_path=None)
+        fingerprint = introspector.snapshot(["hotels"]).fingerprint
+        self.client.tables["hotels"] = [{"id": 1, "name": "A"}] * 10
+        self.assertEqual(introspector.snapshot(["hotels"], refresh=True).fingerprint, fingerprint)
+        self.client.tables["hotels"] = [{"id": 1, "name": "A", "rating": 4}]
+        self.assertNotEqual(introspector.snapshot(["hotels"], refresh=True).fingerprint, fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
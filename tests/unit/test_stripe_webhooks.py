@@ -0,0 +1,136 @@
+"""
+Unit tests for the Stripe webhook inbox and batched status updates.
+"""
+
+import unittest
+import sys
+import os
+import json
+import time
+import uuid
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.stripe_webhooks import (
+    InMemoryBookingStatusStore, WebhookDispatcher, WebhookInbox, WebhookReceiver, WebhookReplayer,
+    WebhookSignatureError, sign_payload, verify_signature
+)
+
+
+def payment_event(event_type, booking_id, event_id=None):
+    return {"id": event_id or f"evt_{uuid.uuid4().hex[:12]}", "type": event_type,
+            "data": {"object": {"id": "pi_1", "metadata": {"booking_id": booking_id}}}}
+
+
+class TestStripeWebhooks(unittest.TestCase):
+    """Test signature checks, event dedupe and batched transitions."""
+
+    def setUp(self):
+        self.inbox = WebhookInbox(db_path=":memory:")
+        self.ids = [str(uuid.uuid4()) for _ in range(3)]
+        self.store = InMemoryBookingStatusStore({
+            booking_id: {"id": booking_id, "status": "pending", "payment_status": "pending"}
+            for booking_id in self.ids
+        })
+        self.confirmed, self.failed = [], []
+        self.dispatcher = WebhookDispatcher(self.inbox, self.store, on_confirmed=self.confirmed.append,
+                                            on_failed=self.failed.append)
+
+    def tearDown(self):
+        self.inbox.close()
+
+    def test_signature_verification(self):
+        payload = json.dumps(payment_event("payment_intent.succeeded", self.ids[0])).encode()
+        header = sign_payload(payload, "whsec_test")
+        self.assertEqual(verify_signature(payload, header, "whsec_test")["type"], "payment_intent.succeeded")
+        with self.assertRaises(WebhookSignatureError):
+            verify_signature(payload, header, "whsec_other")
+        with self.assertRaises(WebhookSignatureError):
+            verify_signature(payload, sign_payload(payload, "whsec_test", timestamp=int(time.time()) - 3600),
+                             "whsec_test")
+
+    def test_duplicates_are_dropped_and_batches_apply_once(self):
+        events = [payment_event("payment_intent.succeeded", self.ids[0], "evt_a"),
+                  payment_event("payment_intent.succeeded", self.ids[1], "evt_b"),
+                  payment_event("payment_intent.payment_failed", self.ids[2], "evt_c"),
+                  payment_event("payment_intent.payment_failed", self.ids[0], "evt_d"),  # arrives after success
+                  payment_event("customer.created", self.ids[0], "evt_e")]
+        self.assertEqual([self.inbox.enqueue_event(event) for event in events], [True] * 5)
+        self.assertFalse(self.inbox.enqueue_event(events[0]))
+
+        self.assertEqual(self.dispatcher.run_once(), 5)
+        self.assertEqual(self.store.update_calls, 2)  # one per transition, not per event
+        self.assertEqual(sorted(row["id"] for row in self.confirmed), sorted(self.ids[:2]))
+        self.assertEqual([row["id"] for row in self.failed], [self.ids[2]])
+        self.assertEqual(self.store.bookings[self.ids[0]]["status"], "confirmed")
+        self.assertEqual(self.inbox.get_stats()["applied"], 4)
+        self.assertEqual(self.inbox.get_stats()["skipped"], 1)
+
+    def test_receiver_and_replayer(self):
+        receiver = WebhookReceiver(self.inbox, "whsec_test").start()
+        try:
+            events = [payment_event("payment_intent.succeeded", booking_id) for booking_id in self.ids]
+            results = WebhookReplayer(receiver.url, "whsec_test", concurrency=2).replay(events + events[:1])
+            self.assertEqual(results["statuses"], {200: 4})
+            self.assertEqual(receiver.duplicates, 1)
+            self.assertEqual(WebhookReplayer(receiver.url, "whsec_wrong").replay(events[:1])["statuses"], {400: 1})
+        finally:
+            receiver.stop()
+        self.dispatcher.run_once()
+        self.assertEqual(len(self.confirmed), 3)
+
+    def test_starting_a_dispatcher_leaves_live_claims_alone(self):
+        """A second process's dispatcher only takes back events whose claim outlived the lease."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stripe_webhooks.db")
+            app, server = WebhookInbox(db_path=path), WebhookInbox(db_path=path)
+            try:
+                app.enqueue_event(payment_event("payment_intent.succeeded", self.ids[0], "evt_live"))
+                self.assertEqual(len(app.claim_batch(10)), 1)  # the app's worker is applying it
+
+                dispatcher = WebhookDispatcher(server, self.store, on_confirmed=self.confirmed.append, lease=60)
+                dispatcher.start()
+                dispatcher.stop()
+                self.assertEqual(server.get_stats()["processing"], 1)
+                self.assertEqual(self.confirmed, [])
+
+                self.assertEqual(server.recover_in_flight(lease=0), 1)  # the claim has lapsed
+                self.assertEqual(dispatcher.run_once(), 1)
+                self.assertEqual([row["id"] for row in self.confirmed], [self.ids[0]])
+            finally:
+                app.close()
+                server.close()
+
+    def test_payment_for_a_booking_no_longer_pending_is_handed_to_refunds(self):
+        refunds = []
+        self.dispatcher.on_unbooked_payment = lambda booking, intent: refunds.append((booking["id"], intent)) or True
+        self.store.bookings[self.ids[1]]["status"] = "expired"
+        self.store.bookings[self.ids[2]]["status"] = "confirmed"  # process_payment got there first
+        events = [payment_event("payment_intent.succeeded", booking_id, f"evt_{i}")
+                  for i, booking_id in enumerate(self.ids)]
+        events[1]["data"]["object"].update(object="payment_intent", id="pi_late")
+        for event in events:
+            self.inbox.enqueue_event(event)
+
+        self.dispatcher.run_once()
+        self.assertEqual([row["id"] for row in self.confirmed], [self.ids[0]])
+        self.assertEqual(refunds, [(self.ids[1], "pi_late")])
+        stats = self.inbox.get_stats()
+        self.assertEqual((stats["applied"], stats["refunded"], stats["needs_refund"]), (2, 1, 0))
+
+        # Without a refund path the event stays visible as needs_refund
+        self.dispatcher.on_unbooked_payment = None
+        self.inbox.enqueue_event(payment_event("checkout.session.completed", self.ids[1], "evt_session"))
+        self.assertEqual(self.dispatcher.run_once(), 1)
+        self.assertEqual(self.inbox.get_stats()["skipped"], 1)  # unpaid session: nothing to refund
+        paid = payment_event("checkout.session.async_payment_succeeded", self.ids[1], "evt_async")
+        self.inbox.enqueue_event(paid)
+        self.dispatcher.run_once()
+        self.assertEqual(self.inbox.get_stats()["needs_refund"], 1)
+        self.assertEqual(self.store.bookings[self.ids[1]]["status"], "expired")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for SupabaseService streaming reads and bulk writes.
+"""
+
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.api_integration.supabase.supabase_service import SupabaseService
+
+
+class FakeQuery:
+    """Just enough of the PostgREST query builder, capping responses at max_rows like the server"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.filters = []
+        self.order_by = None
+        self.window = None
+        self.count_mode = None
+        self.head = False
+        self.upsert_args = None
+
+    def select(self, columns, count=None, head=False):
+        self.count_mode, self.head = count, head
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row[column] > value)
+        return self
+
+    def order(self, column):
+        self.order_by = column
+        return self
+
+    def limit(self, count):
+        self.window = (0, count)
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end - start + 1)
+        return self
+
+    def upsert(self, rows, on_conflict, ignore_duplicates, returning):
+        self.upsert_args = (rows, on_conflict, ignore_duplicates, returning)
+        return self
+
+    def execute(self):
+        self.client.requests.append(self)
+        if self.upsert_args:
+            rows, on_conflict, ignore_duplicates, _ = self.upsert_args
+            keys = on_conflict.split(",")
+            existing = {tuple(row[k] for k in keys): row for row in self.client.tables[self.table]}
+            for row in rows:
+                current = existing.get(tuple(row[k] for k in keys))
+                if current is None:
+                    self.client.tables[self.table].append(dict(row))
+                elif not ignore_duplicates:
+                    current.update(row)
+            return SimpleNamespace(data=[], count=None)
+
+        rows = [row for row in self.client.tables[self.table] if all(f(row) for f in self.filters)]
+        if self.head:
+            return SimpleNamespace(data=[], count=len(rows))
+        if self.order_by:
+            rows.sort(key=lambda row: row[self.order_by])
+        start, size = self.window or (0, len(rows))
+        return SimpleNamespace(data=rows[start:start + min(size, self.client.max_rows)], count=None)
+
+
+class FakeClient:
+    def __init__(self, tables, max_rows=1000):
+        self.tables = tables
+        self.max_rows = max_rows
+        self.requests = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+class TestSupabaseService(unittest.TestCase):
+    """Test paging past the server row cap, counting and chunked upserts."""
+
+    def setUp(self):
+        rows = [{"id": i, "city": "Paris" if i % 2 else "Rome"} for i in range(1, 26)]
+        self.client = FakeClient({"hotels": rows}, max_rows=4)
+        self.service = SupabaseService(client=self.client)
+
+    def test_pages_follow_past_the_server_row_cap(self):
+        # page_size 10 is above max_rows 4: short pages must not end the scan
+        pages = list(self.service.iter_pages("hotels", page_size=10, key_column="id"))
+        self.assertEqual([len(page) for page in pages], [4] * 6 + [1])
+        self.assertEqual([row["id"] for page in pages for row in page], list(range(1, 26)))
+        self.assertEqual(len(self.client.requests), 8)  # one empty page ends the scan
+
+        ids = [row["id"] for row in self.service.iter_rows("hotels", page_size=10)]
+        self.assertEqual(ids, list(range(1, 26)))
+
+        rome = list(self.service.iter_rows("hotels", filter_dict={"city": "Rome"}, page_size=5, key_column="id"))
+        self.assertEqual([row["id"] for row in rome], list(range(2, 26, 2)))
+
+    def test_count_and_chunked_upsert(self):
+        self.assertEqual(self.service.count("hotels"), 25)
+        self.assertEqual(self.service.count("hotels", {"city": "Paris"}), 13)
+
+        self.client.requests.clear()
+        rows = [{"id": 1, "city": "Beirut"}] + [{"id": i, "city": "Byblos"} for i in range(26, 31)]
+        self.assertEqual(self.service.bulk_upsert("hotels", iter(rows), chunk_size=4), 6)
+        self.assertEqual([len(q.upsert_args[0]) for q in self.client.requests], [4, 2])
+        self.assertEqual(self.client.requests[0].upsert_args[1:], ("id", False, "minimal"))
+        self.assertEqual(self.service.count("hotels"), 30)
+        self.assertEqual(self.client.tables["hotels"][0]["city"], "Beirut")
+
+        self.service.bulk_upsert("hotels", [{"id": 1, "city": "Tyre"}], ignore_duplicates=True)
+        self.assertEqual(self.client.tables["hotels"][0]["city"], "Beirut")
+
+
+if __name__ == '__main__':
+    unittest.main()